@@ -4,6 +4,11 @@ from subprocess import call
 import fileinput
 
 def gen():
+    """
+    Regenerate the python modules of ui and qrc files, which are newer than their generated module
+
+    :return: number of regenerated modules
+    """
     if sys.platform == "win32":
         bindir = "c:\Python34\Lib\site-packages\PyQt5"
     else:
@@ -24,6 +29,8 @@ def gen():
     ui_files = [f for f in os.listdir(ui_path) if f.endswith(".ui")]
     rc_files = [f for f in os.listdir(rc_path) if f.endswith(".qrc")]
 
+    num_generated = 0
+
     for f in ui_files:
         file_path = os.path.join(ui_path, f)
         outfile = "ui_" + f.replace(".ui", ".py")
@@ -40,6 +47,7 @@ def gen():
 
 
         call([uic_path, "--from-imports", file_path, "-o", out_file_path])
+        num_generated += 1
 
         # Remove Line: # Form implementation generated from reading ui file '/home/joe/GIT/urh/ui/fuzzing.ui'
         # to avoid useless git updates when working on another computer
@@ -63,6 +71,9 @@ def gen():
         if time_generated_file < time_rc_file:
             # Only create, when generated file is old than rc file to prevent unneeded git pushes
             call([rcc_path, file_path, "-o", out_file_path])
+            num_generated += 1
+
+    return num_generated
 
 if __name__ == "__main__":
     gen()
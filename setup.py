@@ -169,6 +169,7 @@ setup(
     entry_points={
         'console_scripts': [
             'urh = urh.main:main',
+            'urh-cli = urh.cli:main',
         ]}
 )
 
@@ -37,8 +37,17 @@ class SceneManager(QObject):
         :type color: list of QColor
         :return:
         """
-        paths = path_creator.create_path(self.plot_data, start=self.__limit_value(x1), end=self.__limit_value(x2),
-                                         subpath_ranges=subpath_ranges)
+        start, end = self.__limit_value(x1), self.__limit_value(x2)
+        if isinstance(self.plot_data, np.ndarray):
+            paths = path_creator.create_path(self.plot_data, start=start, end=end, subpath_ranges=subpath_ranges)
+        else:
+            # Lazy loaded data (e.g. memory mapped signal): Only load the visible window and move it into place
+            subpath_ranges = [(start, end)] if subpath_ranges is None else subpath_ranges
+            paths = path_creator.create_path(self.plot_data[start:end], start=0, end=end - start,
+                                             subpath_ranges=[(s - start, e - start) for s, e in subpath_ranges])
+            for path in paths:
+                path.translate(start, 0)
+
         self.set_path(paths, colors=colors)
 
     def set_path(self, paths: list, colors=None):
@@ -61,7 +70,10 @@ class SceneManager(QObject):
             return
 
         if math.isnan(self.minimum) or math.isnan(self.maximum):
-            minimum, maximum = util.minmax(self.plot_data)
+            if isinstance(self.plot_data, np.ndarray):
+                minimum, maximum = util.minmax(self.plot_data)
+            else:
+                minimum, maximum = self.plot_data.minmax()
         else:
             minimum, maximum = self.minimum, self.maximum
 
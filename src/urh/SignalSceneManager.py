@@ -16,8 +16,13 @@ class SignalSceneManager(SceneManager):
         self.text_item = self.scene.addText("Loading...", QFont("Helvetica", 72))
         self.scene_type = 0  # 0 = Analog Signal, 1 = QuadDemodView
 
+    @property
+    def demodulated_plot_data(self):
+        # Edited and memory mapped signals are only read for the section in view
+        return self.signal.qad_view
+
     def show_scene_section(self, x1: float, x2: float, subpath_ranges=None, colors=None):
-        self.plot_data = self.signal.real_plot_data if self.scene_type == 0 else self.signal.qad
+        self.plot_data = self.signal.real_plot_data if self.scene_type == 0 else self.demodulated_plot_data
         super().show_scene_section(x1, x2, subpath_ranges=subpath_ranges, colors=colors)
 
     def init_scene(self):
@@ -29,12 +34,16 @@ class SignalSceneManager(SceneManager):
         else:
             noise_val = signalFunctions.get_noise_for_mod_type(self.scene_type - 1)
             # Bypass Min/Max calculation
+            self.plot_data = self.demodulated_plot_data
             if noise_val == 0:
                 # ASK
-                self.minimum, self.maximum = 0, self.padding * np.max(self.signal.qad)
+                if isinstance(self.plot_data, np.ndarray):
+                    maximum = np.max(self.plot_data)
+                else:
+                    maximum = self.plot_data.minmax()[1]
+                self.minimum, self.maximum = 0, self.padding * maximum
             else:
                 self.minimum, self.maximum = 0, self.padding * noise_val
-            self.plot_data = self.signal.qad
 
         super().init_scene()
         self.minimum, self.maximum = stored_minimum, stored_maximum
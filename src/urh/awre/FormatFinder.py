@@ -4,6 +4,7 @@ import time
 from urh.signalprocessing.FieldType import FieldType
 from urh.util.Logger import logger
 
+from urh.awre.XorMatrix import XorMatrix
 from urh.awre.components.Address import Address
 from urh.awre.components.Component import Component
 from urh.awre.components.Flags import Flags
@@ -11,7 +12,6 @@ from urh.awre.components.Length import Length
 from urh.awre.components.Preamble import Preamble
 from urh.awre.components.SequenceNumber import SequenceNumber
 from urh.awre.components.Type import Type
-from urh.cythonext import util
 
 class FormatFinder(object):
     MIN_MESSAGES_PER_CLUSTER = 2 # If there is only one message per cluster it is not very significant
@@ -107,6 +107,6 @@ class FormatFinder(object):
 
     def build_xor_matrix(self):
         t = time.time()
-        xor_matrix = util.build_xor_matrix(self.bitvectors)
+        xor_matrix = XorMatrix(self.bitvectors)
         logger.debug("XOR matrix: {}s".format(time.time()-t))
         return xor_matrix
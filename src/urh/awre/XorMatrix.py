@@ -0,0 +1,99 @@
+import numpy as np
+
+
+class XorMatrix(object):
+    """
+    XOR of all message pairs without storing it.
+
+    The bits of all messages are packed into 64 bit words, so XORing two messages takes one operation per
+    64 bits and memory grows linear with the number of messages instead of quadratic.
+    The XOR is computed on demand for one message against a block of other messages, e.g. the messages
+    of the same participant.
+    """
+
+    def __init__(self, bitvectors):
+        """
+
+        :param bitvectors: bits of the messages as arrays of 0 and 1
+        :type bitvectors: list of np.ndarray
+        """
+        self.lengths = np.fromiter(map(len, bitvectors), dtype=np.int64, count=len(bitvectors))
+        num_words = (int(self.lengths.max(initial=0)) + 63) // 64
+        packed = np.zeros((len(bitvectors), 8 * num_words), dtype=np.uint8)
+        for row, bits in zip(packed, bitvectors):
+            packed_bits = np.packbits(np.asarray(bits, dtype=np.uint8))
+            row[:len(packed_bits)] = packed_bits
+        self.words = packed.view(np.uint64)
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __getitem__(self, item) -> np.ndarray:
+        """
+        XOR vector of two messages up to the length of the shorter one
+
+        :param item: (message index, other message index)
+        """
+        i, j = item
+        return self.xor_block(i, [j])[0]
+
+    def xor_block(self, index: int, others) -> list:
+        """
+        XOR one message with a block of other messages at once
+
+        :param others: indices of the other messages
+        :return: int8 XOR vector for each other message, as long as the shorter message of the pair
+        """
+        others = np.asarray(others, dtype=np.int64)
+        lengths = np.minimum(self.lengths[others], self.lengths[index])
+        xor_bits = np.unpackbits((self.words[others] ^ self.words[index]).view(np.uint8), axis=1).view(np.int8)
+        return [xor_bits[k, :length] for k, length in enumerate(lengths.tolist())]
+
+    def differences(self, index: int, others) -> list:
+        """
+        Positions of differing bits of one message and each of a block of other messages
+
+        :rtype: list of (np.ndarray, int)
+        :return: differing positions and compared length for each other message
+        """
+        others = np.asarray(others, dtype=np.int64)
+        lengths = np.minimum(self.lengths[others], self.lengths[index])
+        xor_words = self.words[others] ^ self.words[index]
+
+        # Only unpack the words containing differences
+        rows, word_positions = np.divmod(np.flatnonzero(xor_words), xor_words.shape[1])
+        word_bits = np.unpackbits(xor_words[rows, word_positions].view(np.uint8).reshape(-1, 8), axis=1)
+        word_indices, bit_positions = np.divmod(np.flatnonzero(word_bits), 64)
+        rows = rows[word_indices]
+        positions = 64 * word_positions[word_indices] + bit_positions
+
+        # Bits behind the shorter message of a pair do not count as difference
+        in_message = positions < lengths[rows]
+        rows, positions = rows[in_message], positions[in_message]
+
+        bounds = np.searchsorted(rows, np.arange(len(lengths) + 1)).tolist()
+        return [(positions[bounds[k]:bounds[k + 1]], length) for k, length in enumerate(lengths.tolist())]
+
+    @staticmethod
+    def equal_ranges(differences: np.ndarray, length: int, start: int, end, min_length: int, gap: int) -> list:
+        """
+        Ranges of equal bits inside start to end, which are at least min_length long.
+        After a range ends at a difference, the next range starts gap bits behind this difference.
+
+        :param differences: sorted positions of differing bits
+        :param length: length of the compared bits
+        :param end: end of the range to search or None for the end of the bits
+        :return: list of (start, end) of the equal ranges
+        """
+        end = length if end is None else min(end, length)
+        start = min(start, length)
+        inner = differences[np.searchsorted(differences, start):np.searchsorted(differences, end)]
+
+        result = []
+        range_start = start
+        # The end of the range marks the end of the last equal range
+        for diff in inner.tolist() + [max(end, start)]:
+            if diff - range_start >= min_length:
+                result.append((range_start, diff))
+            range_start = diff + gap
+        return result
@@ -1,8 +1,8 @@
 from collections import defaultdict
 
-import numpy as np
 from urh import constants
 from urh.awre.CommonRange import CommonRange
+from urh.awre.XorMatrix import XorMatrix
 from urh.cythonext import util
 from urh.awre.components.Component import Component
 from urh.signalprocessing.MessageType import MessageType
@@ -42,41 +42,38 @@ class Address(Component):
 
         # Step 1: Find equal ranges for participants by evaluating the XOR matrix participant wise
         for participant, participant_msg_indices in msg_indices_per_participant.items():
+            # Lookup of already found ranges by (start, end, bits)
+            common_ranges = dict()
             for i, msg_index in enumerate(participant_msg_indices):
                 msg = messages[msg_index]
                 bitvector_str = msg.decoded_bits_str
 
-                for other_index in participant_msg_indices[i+1:]:
+                # XOR the message with all later messages of the participant at once
+                other_indices = participant_msg_indices[i+1:]
+                differences = self.xor_matrix.differences(msg_index, other_indices)
+
+                for other_index, (diff_positions, length) in zip(other_indices, differences):
                     other_msg = messages[other_index]
-                    xor_vec = self.xor_matrix[msg_index, other_index][self.xor_matrix[msg_index, other_index] != -1] # -1 = End of Vector
 
                     # addresses are searched across message types, as we assume them to be in almost every message
                     # therefore we need to consider message types of both messages we compare and ignore already labeled areas
                     unlabeled_ranges = msg.message_type.unlabeled_ranges_with_other_mt(other_msg.message_type)
                     for rng_start, rng_end in unlabeled_ranges:
-                        start = 0
-                        # The last 1 marks end of sequence, and prevents swallowing long zero sequences at the end
-                        cmp_vector = np.append(xor_vec[rng_start:rng_end], 1)
-                        for end in np.where(cmp_vector == 1)[0]:
-                            if end - start >= self.MIN_ADDRESS_LENGTH:
-                                equal_range_start = alignment * ((rng_start + start) // alignment)
-                                equal_range_end = alignment * ((rng_start + end) // alignment)
-                                bits = bitvector_str[equal_range_start:equal_range_end]
-
-                                # Did we already found this range?
-                                cr = next((cr for cr in equal_ranges_per_participant[participant] if
-                                          cr.start == equal_range_start and cr.end == equal_range_end
-                                          and cr.bits == bits), None)
-
-                                # If not: Create it
-                                if cr is None:
-                                    cr = CommonRange(equal_range_start, equal_range_end, bits)
-                                    equal_ranges_per_participant[participant].append(cr)
-
-                                cr.messages.add(msg_index)
-                                cr.messages.add(other_index)
-
-                            start = end + alignment
+                        for start, end in XorMatrix.equal_ranges(diff_positions, length, rng_start, rng_end,
+                                                                 self.MIN_ADDRESS_LENGTH, alignment):
+                            equal_range_start = alignment * (start // alignment)
+                            equal_range_end = alignment * (end // alignment)
+                            bits = bitvector_str[equal_range_start:equal_range_end]
+
+                            # Did we already found this range? If not: Create it
+                            cr = common_ranges.get((equal_range_start, equal_range_end, bits))
+                            if cr is None:
+                                cr = CommonRange(equal_range_start, equal_range_end, bits)
+                                common_ranges[(equal_range_start, equal_range_end, bits)] = cr
+                                equal_ranges_per_participant[participant].append(cr)
+
+                            cr.messages.add(msg_index)
+                            cr.messages.add(other_index)
 
         if verbose:
             print(constants.color.BOLD + "Result after Step 1" +constants.color.END)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+from urh import constants
+from urh.signalprocessing.BinaryProtocolFile import BinaryProtocolFile
+from urh.signalprocessing.Demodulator import Demodulator
+from urh.signalprocessing.MessageType import MessageType
+from urh.signalprocessing.Participant import Participant
+from urh.signalprocessing.Ruleset import Ruleset
+from urh.signalprocessing.SampleFile import SampleFile
+from urh.signalprocessing.encoder import Encoder
+from urh.util.Logger import logger
+
+VIEWS = ["bits", "hex", "ascii"]
+OUTPUT_FORMATS = {"jsonl": ".jsonl", "txt": ".txt", "bproto": ".bproto"}
+
+# Signal parameters in the project file and their types
+PROJECT_PARAMETERS = {"modulation_type": ("modulation_type", int), "bit_len": ("bit_length", int),
+                      "qad_center": ("qad_center", float), "tolerance": ("tolerance", int),
+                      "noise_threshold": ("noise_threshold", float)}
+
+
+def parse_args(args=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="urh-cli",
+                                     description="Demodulate, decode and export capture files without a GUI. "
+                                                 "Parameters which are not given are detected automatically, "
+                                                 "like when a signal is opened in urh.")
+    parser.add_argument("files", nargs="*", help="capture files (.complex, .complex16u, .complex16s, .coco, .wav)")
+    parser.add_argument("-p", "--project", help="project directory or project file, its signals and their "
+                                                "parameters, decodings and message types are used")
+    parser.add_argument("-m", "--modulation", choices=Demodulator.MODULATION_TYPES, help="modulation type (FSK)")
+    parser.add_argument("-b", "--bit-length", type=int, help="samples per bit")
+    parser.add_argument("-c", "--center", type=float, help="center of the demodulated samples")
+    parser.add_argument("-t", "--tolerance", type=int, help="tolerance for pulse lengths in samples (5)")
+    parser.add_argument("-n", "--noise", type=float, help="noise threshold")
+    parser.add_argument("--wav-is-demodulated", action="store_true", help="WAV files contain demodulated samples")
+    parser.add_argument("-d", "--decoding",
+                        help="name of a decoding, e.g. 'Manchester I', or a chain like in decodings.txt")
+    parser.add_argument("-l", "--label", action="append", default=[], metavar="NAME:START-END",
+                        help="label to extract from the decoded bits, start and end are bit indices")
+    parser.add_argument("-v", "--view", choices=VIEWS, default="hex", help="view of data and labels (hex)")
+    parser.add_argument("-f", "--format", choices=sorted(OUTPUT_FORMATS), default="jsonl",
+                        help="output format, jsonl writes one JSON object per message (jsonl)")
+    parser.add_argument("-o", "--output-dir", help="write one file per capture here instead of to stdout")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of processes (number of CPUs)")
+
+    args = parser.parse_args(args)
+    if not args.files and not args.project:
+        parser.error("no capture files or project given")
+    if args.format == "bproto" and not args.output_dir:
+        parser.error("format bproto needs an output directory")
+    if args.jobs < 1:
+        parser.error("number of jobs must be at least 1")
+    return args
+
+
+def read_decodings(directory: str) -> list:
+    """
+    Decodings from the decodings file in a directory, the default decodings if there is none
+
+    :rtype: list of Encoder
+    """
+    try:
+        with open(os.path.join(directory, constants.DECODINGS_FILE), "r") as f:
+            chains = [parse_chain(line) for line in f]
+        decodings = [Encoder(chain) for chain in chains if chain]
+    except FileNotFoundError:
+        decodings = []
+
+    return decodings if decodings else Encoder.default_decodings()
+
+
+def parse_chain(text: str) -> list:
+    return [name.strip().replace("'", "") for name in text.split(",") if name.strip().replace("'", "")]
+
+
+def get_decoder(name_or_chain: str, decodings: list) -> Encoder:
+    if name_or_chain is None:
+        return Encoder(["Non Return To Zero (NRZ)"])
+
+    for decoding in decodings:
+        if decoding.name == name_or_chain:
+            return decoding
+
+    chain = parse_chain(name_or_chain)
+    if len(chain) == 1:
+        raise ValueError("Unknown decoding {0}, known decodings are: {1}".format(
+            name_or_chain, ", ".join(decoding.name for decoding in decodings)))
+    return Encoder(chain)
+
+
+def parse_label(text: str) -> tuple:
+    """
+    Parse NAME:START-END
+
+    :return: name, start and end (inclusive) of the label
+    """
+    try:
+        name, bit_range = text.rsplit(":", 1)
+        start, end = map(int, bit_range.split("-"))
+    except ValueError:
+        raise ValueError("Invalid label {0}, expected NAME:START-END".format(text))
+    return name, start, end
+
+
+def read_project(path: str) -> tuple:
+    """
+    Read signals, decodings, message types and participants of a project without Qt
+
+    :return: (list of (filename, parameters, message tags)), decodings, message types, participants
+    """
+    project_file = os.path.join(path, constants.PROJECT_FILE) if os.path.isdir(path) else path
+    project_dir = os.path.dirname(os.path.realpath(project_file))
+    root = ET.parse(project_file).getroot()
+
+    signals = []
+    for signal_tag in root.iter("signal"):
+        parameters = {name: value_type(signal_tag.get(attribute))
+                      for name, (attribute, value_type) in PROJECT_PARAMETERS.items()
+                      if signal_tag.get(attribute) is not None}
+        messages_tag = signal_tag.find("messages")
+        message_tags = messages_tag.findall("message") if messages_tag is not None else []
+        signals.append((os.path.join(project_dir, signal_tag.get("filename")), parameters, message_tags))
+
+    decodings, message_types, participants = [], [], []
+    protocol_tag = root.find("protocol")
+    if protocol_tag is not None:
+        decodings_tag = protocol_tag.find("decodings")
+        if decodings_tag is not None:
+            decodings = [Encoder(parse_chain(tag.text or "")) for tag in decodings_tag.findall("decoding")]
+        message_types_tag = protocol_tag.find("message_types")
+        if message_types_tag is not None:
+            message_types = [MessageType.from_xml(tag) for tag in message_types_tag.findall("message_type")]
+        participants_tag = protocol_tag.find("participants")
+        if participants_tag is not None:
+            participants = [Participant.from_xml(tag) for tag in participants_tag.findall("participant")]
+
+    if not decodings:
+        decodings = read_decodings(project_dir)
+
+    return signals, decodings, message_types, participants
+
+
+def create_jobs(args: argparse.Namespace) -> list:
+    """
+    One job per capture file with everything needed to process it in a worker process
+
+    :rtype: list of dict
+    """
+    parameters = {"modulation_type": Demodulator.MODULATION_TYPES.index(args.modulation) if args.modulation else None,
+                  "bit_len": args.bit_length, "qad_center": args.center, "tolerance": args.tolerance,
+                  "noise_threshold": args.noise}
+    parameters = {name: value for name, value in parameters.items() if value is not None}
+
+    if args.project:
+        signals, decodings, message_types, participants = read_project(args.project)
+    else:
+        signals, message_types, participants = [], [], []
+        decodings = read_decodings(os.path.realpath(os.path.join(constants.SETTINGS.fileName(), "..")))
+
+    signals.extend((filename, dict(), []) for filename in args.files)
+
+    message_types = message_types if message_types else [MessageType("default")]
+    for name, start, end in map(parse_label, args.label):
+        message_types[0].add_protocol_label(start, end, name=name)
+
+    decoder = get_decoder(args.decoding, decodings)
+    jobs = []
+    for filename, signal_parameters, message_tags in signals:
+        # Parameters given on the command line override those of the project
+        signal_parameters.update(parameters)
+        jobs.append({"filename": filename, "parameters": signal_parameters, "message_tags": message_tags,
+                     "wav_is_qad_demod": args.wav_is_demodulated, "rel_symbol_len": Demodulator.read_rel_symbol_len(),
+                     "decoder": decoder, "decodings": decodings, "message_types": message_types,
+                     "participants": participants, "view": VIEWS.index(args.view), "format": args.format,
+                     "output_dir": args.output_dir})
+    return jobs
+
+
+def demodulate(job: dict) -> list:
+    """
+    Read a capture file and demodulate it to messages with the parameters of the job
+
+    :rtype: list of Message
+    """
+    filename = job["filename"]
+    parameters = job["parameters"]
+    samples = SampleFile.read(filename, job["wav_is_qad_demod"],
+                              memory_mapped=os.path.getsize(filename) > constants.MEMORY_MAP_THRESHOLD)
+    num_samples = len(samples)
+    if num_samples == 0:
+        return []
+
+    demodulator = Demodulator(modulation_type=parameters.get("modulation_type", 1),
+                              tolerance=parameters.get("tolerance", 5), rel_symbol_len=job["rel_symbol_len"])
+    if job["wav_is_qad_demod"] and filename.endswith(".wav"):
+        qad = samples
+    else:
+        if "noise_threshold" in parameters:
+            demodulator.noise_threshold = parameters["noise_threshold"]
+        else:
+            demodulator.noise_threshold = Demodulator.calc_noise_threshold(samples[int(0.99 * num_samples):])
+        qad = demodulator.demodulate(samples)
+
+    demodulator.qad_center = parameters.get("qad_center", 0)
+    demodulator.bit_len = parameters.get("bit_len", 100)
+    demodulator.auto_detect(qad, detect_center="qad_center" not in parameters,
+                            detect_bit_len="bit_len" not in parameters)
+
+    message_types = job["message_types"]
+    messages = demodulator.create_messages(samples, demodulator.grab_pulse_lens(qad), message_types[0], job["decoder"])
+
+    # Messages saved for the signal in a project keep their participants, decodings and message types
+    for message, message_tag in zip(messages, job["message_tags"]):
+        message.from_xml(message_tag, job["participants"], decoders=job["decodings"], message_types=message_types)
+
+    auto_message_types = [message_type for message_type in message_types if message_type.assigned_by_ruleset]
+    if auto_message_types:
+        assignments = Ruleset.classify(messages, [message_type.ruleset for message_type in auto_message_types])
+        for message, i in zip(messages, assignments.tolist()):
+            if i != -1:
+                message.message_type = auto_message_types[i]
+
+    return messages
+
+
+def to_json(filename: str, index: int, message, view: int) -> str:
+    data = message.view_to_string(view, decoded=True, show_pauses=False)
+    labels = dict()
+    for label in message.message_type:
+        start, end = message.get_label_range(label, view, decode=True)
+        labels[label.name] = data[start:end]
+
+    return json.dumps({"file": filename, "message": index, "position": int(message.bit_sample_pos[0]),
+                       "pause": int(message.pause), "rssi": round(float(message.rssi), 6),
+                       "decoding": message.decoder.name, "message_type": message.message_type.name,
+                       "participant": message.participant.shortname if message.participant else None,
+                       "data": data, "labels": labels})
+
+
+def process(job: dict) -> tuple:
+    """
+    Process one capture file, this runs in a worker process
+
+    :return: filename, number of messages (None on errors) and the output for stdout
+    """
+    filename = job["filename"]
+    try:
+        messages = demodulate(job)
+    except (OSError, ValueError, EOFError) as e:
+        logger.error("Could not process {0}: {1}".format(filename, e))
+        return filename, None, ""
+
+    if job["format"] == "jsonl":
+        lines = [to_json(filename, i, message, job["view"]) for i, message in enumerate(messages)]
+    elif job["format"] == "txt":
+        lines = [message.view_to_string(job["view"], decoded=True, show_pauses=False) for message in messages]
+    else:
+        lines = []
+
+    output_dir = job["output_dir"]
+    if output_dir is None:
+        if job["format"] == "txt":
+            lines.insert(0, "# " + filename)
+        return filename, len(messages), "".join(line + "\n" for line in lines)
+
+    name = os.path.splitext(os.path.basename(filename))[0] + OUTPUT_FORMATS[job["format"]]
+    if job["format"] == "bproto":
+        BinaryProtocolFile(os.path.join(output_dir, name)).write(messages)
+    else:
+        with open(os.path.join(output_dir, name), "w") as f:
+            f.writelines(line + "\n" for line in lines)
+    return filename, len(messages), ""
+
+
+def main(args=None) -> int:
+    args = parse_args(args)
+    try:
+        jobs = create_jobs(args)
+    except (OSError, ValueError, ET.ParseError) as e:
+        logger.error(str(e))
+        return 1
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    num_errors = 0
+    executor = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 and len(jobs) > 1 else None
+    try:
+        # Results are streamed in the order of the files as soon as they are available
+        results = executor.map(process, jobs) if executor is not None else map(process, jobs)
+        for filename, num_messages, output in results:
+            if num_messages is None:
+                num_errors += 1
+            elif args.output_dir:
+                print("{0}: {1} messages".format(filename, num_messages), file=sys.stderr)
+            sys.stdout.write(output)
+            sys.stdout.flush()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return 1 if num_errors > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,23 @@
 #QT5 = True
 import os
 
-from PyQt5.QtCore import Qt, QSettings
-from PyQt5.QtGui import QColor
+try:
+    from PyQt5.QtCore import Qt, QSettings
+    from PyQt5.QtGui import QColor
+except ImportError:
+    # Headless, e.g. batch processing with urh-cli, colors stay RGBA tuples and settings are read only
+    Qt = QSettings = QColor = None
+
+from urh.util.IniSettings import IniSettings
+
+
+def _color(*args):
+    """
+    QColor from RGB(A) values or a color name, without Qt the arguments are returned as they are
+
+    """
+    return args if QColor is None else QColor(*args)
+
 
 class color:
    PURPLE = '\033[95m'
@@ -22,41 +37,45 @@ ZOOM_TICKS = 10
 
 PIXELS_PER_PATH = 5000
 
+# Signal files bigger than this (in bytes) are memory mapped instead of being loaded into RAM
+MEMORY_MAP_THRESHOLD = 1024 ** 3
+
 PAUSE_TRESHOLD = 10
 RECT_BIT_WIDTH = 10
 BIT_SCENE_HEIGHT = 100
 
-TRANSPARENT_COLOR = QColor(Qt.transparent)
+TRANSPARENT_COLOR = _color(0, 0, 0, 0)
 
-LINECOLOR = QColor.fromRgb(225, 225, 225)
-BGCOLOR = QColor.fromRgb(55, 53, 53)
-AXISCOLOR = QColor.fromRgb(200, 200, 200, 100)
-ARROWCOLOR = QColor.fromRgb(204, 120, 50)
+LINECOLOR = _color(225, 225, 225)
+BGCOLOR = _color(55, 53, 53)
+AXISCOLOR = _color(200, 200, 200, 100)
+ARROWCOLOR = _color(204, 120, 50)
 
-SEND_INDICATOR_COLOR = QColor("darkblue")   # overwritten by system color (bin/urh)
+SEND_INDICATOR_COLOR = _color("darkblue")   # overwritten by system color (bin/urh)
 
 # ROI-SELECTION COLORS
-SELECTION_COLOR = QColor("darkblue") # overwritten by system color (bin/urh)
-NOISE_COLOR = QColor("red")
+SELECTION_COLOR = _color("darkblue") # overwritten by system color (bin/urh)
+NOISE_COLOR = _color("red")
 SELECTION_OPACITY = 0.8
 NOISE_OPACITY = 0.4
 
 # SEPARATION COLORS
-ONES_AREA_COLOR = QColor.fromRgb(0, 128, 128)
-ZEROS_AREA_COLOR = QColor.fromRgb(90, 9, 148)
+ONES_AREA_COLOR = _color(0, 128, 128)
+ZEROS_AREA_COLOR = _color(90, 9, 148)
 SEPARATION_OPACITY = 0.2
 SEPARATION_PADDING = .05  # Prozent
 
 # PROTOCOL TABLE COLORS
-SELECTED_ROW_COLOR = QColor.fromRgb(0, 0, 255)
-DIFFERENCE_CELL_COLOR = QColor.fromRgb(255, 0, 0)
+SELECTED_ROW_COLOR = _color(0, 0, 255)
+DIFFERENCE_CELL_COLOR = _color(255, 0, 0)
 
-PROPERTY_FOUND_COLOR = QColor.fromRgb(0, 124, 0, 100)
-PROPERTY_NOT_FOUND_COLOR = QColor.fromRgb(124, 0, 0, 100)
+PROPERTY_FOUND_COLOR = _color(0, 124, 0, 100)
+PROPERTY_NOT_FOUND_COLOR = _color(124, 0, 0, 100)
 
 SEPARATION_ROW_HEIGHT = 30
 
-SETTINGS = QSettings(QSettings.IniFormat, QSettings.UserScope, 'urh', 'urh')
+SETTINGS = IniSettings('urh', 'urh') if QSettings is None else \
+    QSettings(QSettings.IniFormat, QSettings.UserScope, 'urh', 'urh')
 PROJECT_FILE = "URHProject.xml"
 DECODINGS_FILE = "decodings.txt"
 FIELD_TYPE_SETTINGS = os.path.realpath(os.path.join(SETTINGS.fileName(), "..", "fieldtypes.xml"))
@@ -76,40 +95,45 @@ DECODING_ENOCEAN = "Wireless Short Packet (WSP)"
 DECODING_CUT = "Cut before/after"
 DECODING_DISABLED_PREFIX = "[Disabled] "
 
-LABEL_COLORS = [QColor.fromRgb(245,12,12,125),      # red
-                QColor.fromRgb(146,49,49,125),      # dark red
-                QColor.fromRgb(106,10,10,125),      # darker red
-                QColor.fromRgb(154,37,111,125),     # pink
-                QColor.fromRgb(231,136,242,125),    # light pink
-                QColor.fromRgb(155,170,224,125),    # lighter blue
-                QColor.fromRgb(12,142,242,125),     # light blue
-                QColor.fromRgb(12,12,242,125),      # blue
-                QColor.fromRgb(9,9,54,125),         # dark blue
-                QColor.fromRgb(58,60,100,125),      # halfdark blue
-                QColor.fromRgb(12,242,201,125),     # blue green
-                QColor.fromRgb(153,207,206,125),    # light blue green
-                QColor.fromRgb(17,49,27,125),       # dark green
-                QColor.fromRgb(41,172,81,125),      # green
-                QColor.fromRgb(7,237,78,125),       # light green
-                QColor.fromRgb(159,237,7,125),      # yellow green
-                QColor.fromRgb(244,246,36,125),     # strong yellow
-                QColor.fromRgb(217,240,27,125),     # yellow
-                QColor.fromRgb(213,212,134,125),    # light yellow
-                QColor.fromRgb(201,121,18,125),     # orange
-                QColor.fromRgb(67,44,14,125),       # brown
-                QColor.fromRgb(61,67,67,125),       # gray 3
-                QColor.fromRgb(139,148,148,125),    # gray 2
-                QColor.fromRgb(207,223,223,125),    # gray 1
-                QColor.fromRgb(240,238,244,125)     # gray 0
+LABEL_COLORS = [_color(245,12,12,125),      # red
+                _color(146,49,49,125),      # dark red
+                _color(106,10,10,125),      # darker red
+                _color(154,37,111,125),     # pink
+                _color(231,136,242,125),    # light pink
+                _color(155,170,224,125),    # lighter blue
+                _color(12,142,242,125),     # light blue
+                _color(12,12,242,125),      # blue
+                _color(9,9,54,125),         # dark blue
+                _color(58,60,100,125),      # halfdark blue
+                _color(12,242,201,125),     # blue green
+                _color(153,207,206,125),    # light blue green
+                _color(17,49,27,125),       # dark green
+                _color(41,172,81,125),      # green
+                _color(7,237,78,125),       # light green
+                _color(159,237,7,125),      # yellow green
+                _color(244,246,36,125),     # strong yellow
+                _color(217,240,27,125),     # yellow
+                _color(213,212,134,125),    # light yellow
+                _color(201,121,18,125),     # orange
+                _color(67,44,14,125),       # brown
+                _color(61,67,67,125),       # gray 3
+                _color(139,148,148,125),    # gray 2
+                _color(207,223,223,125),    # gray 1
+                _color(240,238,244,125)     # gray 0
                 ]
 
 # full alpha for participant colors, since its used in text html view (signal frame)
-PARTICIPANT_COLORS = [QColor.fromRgb(lc.red(), lc.green(), lc.blue()) for lc in LABEL_COLORS]
+PARTICIPANT_COLORS = [_color(*lc[:3]) if QColor is None else _color(lc.red(), lc.green(), lc.blue())
+                      for lc in LABEL_COLORS]
+
+HIGHLIGHT_TEXT_BACKGROUND_COLOR = _color("orange")
+HIGHLIGHT_TEXT_FOREGROUND_COLOR = _color("white")
 
-HIGHLIGHT_TEXT_BACKGROUND_COLOR = QColor("orange")
-HIGHLIGHT_TEXT_FOREGROUND_COLOR = QColor("white")
+PEAK_COLOR = _color("darkRed")
 
-PEAK_COLOR = QColor("darkRed")
+# Check states of labels, same values as Qt.Checked and Qt.Unchecked
+CHECKED = 2 if Qt is None else Qt.Checked
+UNCHECKED = 0 if Qt is None else Qt.Unchecked
 
 # SYMBOL PARAMETERS
 SYMBOL_NAMES = ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M",
@@ -8,7 +8,6 @@ from PyQt5.QtGui import QContextMenuEvent
 from PyQt5.QtWidgets import QMessageBox, QFrame, QAbstractItemView, QUndoStack, QApplication, QMenu
 
 from urh import constants
-from urh.controller.MessageTypeDialogController import MessageTypeDialogController
 from urh.controller.ProtocolLabelController import ProtocolLabelController
 from urh.models.LabelValueTableModel import LabelValueTableModel
 from urh.models.ParticipantListModel import ParticipantListModel
@@ -16,6 +15,7 @@ from urh.models.ProtocolLabelListModel import ProtocolLabelListModel
 from urh.models.ProtocolTableModel import ProtocolTableModel
 from urh.models.ProtocolTreeModel import ProtocolTreeModel
 from urh.plugins.PluginManager import PluginManager
+from urh.signalprocessing.BinaryProtocolFile import BinaryProtocolFile
 from urh.signalprocessing.FieldType import FieldType
 from urh.signalprocessing.MessageType import MessageType
 from urh.signalprocessing.ProtocoLabel import ProtocolLabel
@@ -363,22 +363,7 @@ class CompareFrameController(QFrame):
         else:
             prefix = os.path.realpath(os.path.join(constants.SETTINGS.fileName(), ".."))
 
-        fallback = [Encoder(["Non Return To Zero (NRZ)"]),
-
-                    Encoder(["Non Return To Zero Inverted (NRZ-I)",
-                             constants.DECODING_INVERT]),
-
-                    Encoder(["Manchester I",
-                             constants.DECODING_EDGE]),
-
-                    Encoder(["Manchester II",
-                             constants.DECODING_EDGE,
-                             constants.DECODING_INVERT]),
-
-                    Encoder(["Differential Manchester",
-                             constants.DECODING_EDGE,
-                             constants.DECODING_DIFFERENTIAL])
-                    ]
+        fallback = Encoder.default_decodings()
 
         try:
             f = open(os.path.join(prefix, constants.DECODINGS_FILE), "r")
@@ -469,7 +454,10 @@ class CompareFrameController(QFrame):
         pa = ProtocolAnalyzer(signal=None)
         pa.name = "Loaded Protocol"
         pa.filename = filename
-        pa.from_xml_file(filename=filename, read_bits=True)
+        if BinaryProtocolFile.is_binary_file(filename):
+            pa.from_binary_file(filename)
+        else:
+            pa.from_xml_file(filename=filename, read_bits=True)
         for messsagetype in pa.message_types:
             if messsagetype not in self.proto_analyzer.message_types:
                 self.proto_analyzer.message_types.append(messsagetype)
@@ -841,8 +829,11 @@ class CompareFrameController(QFrame):
         if not filename:
             return
 
-        self.proto_analyzer.to_xml_file(filename=filename, decoders=self.decodings,
-                                        participants=self.project_manager.participants, write_bits=True)
+        if filename.endswith(".bproto"):
+            self.proto_analyzer.to_binary_file(filename)
+        else:
+            self.proto_analyzer.to_xml_file(filename=filename, decoders=self.decodings,
+                                            participants=self.project_manager.participants, write_bits=True)
 
     def show_differences(self, show_differences: bool):
         if show_differences:
@@ -1081,6 +1072,8 @@ class CompareFrameController(QFrame):
 
     @pyqtSlot()
     def on_btn_message_type_settings_clicked(self):
+        from urh.controller.MessageTypeDialogController import MessageTypeDialogController
+
         dialog = MessageTypeDialogController(self.active_message_type, parent=self)
         dialog.show()
         dialog.finished.connect(self.on_message_type_dialog_finished)
@@ -1,15 +1,13 @@
+import itertools
 import locale
 import traceback
 
 import numpy
 from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtGui import QFontMetrics, QFont
-from PyQt5.QtWidgets import QInputDialog, QApplication, QWidget, QUndoStack
+from PyQt5.QtWidgets import QInputDialog, QApplication, QWidget, QUndoStack, QMessageBox
 
 from urh.controller.CompareFrameController import CompareFrameController
-from urh.controller.FuzzingDialogController import FuzzingDialogController
-from urh.controller.ModulatorDialogController import ModulatorDialogController
-from urh.controller.SendDialogController import SendDialogController
 from urh.models.GeneratorListModel import GeneratorListModel
 from urh.models.GeneratorTableModel import GeneratorTableModel
 from urh.models.GeneratorTreeModel import GeneratorTreeModel
@@ -17,9 +15,10 @@ from urh.plugins.NetworkSDRInterface.NetworkSDRInterfacePlugin import NetworkSDR
 from urh.plugins.PluginManager import PluginManager
 from urh.signalprocessing.Message import Message
 from urh.signalprocessing.MessageType import MessageType
+from urh.signalprocessing.ModulatedStream import ModulatedStream
 from urh.signalprocessing.Modulator import Modulator
 from urh.signalprocessing.ProtocoLabel import ProtocolLabel
-from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer
+from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer, FuzzMode
 from urh.ui.actions.Fuzz import Fuzz
 from urh.ui.ui_generator import Ui_GeneratorTab
 from urh.util import FileOperator
@@ -30,6 +29,9 @@ from urh.util.ProjectManager import ProjectManager
 
 
 class GeneratorTabController(QWidget):
+    MAX_FUZZED_MESSAGES_WITHOUT_CONFIRMATION = 10 ** 5  # sending them takes long
+    MAX_LISTED_PAUSES = 1000  # fuzzing may create millions of messages, which are created on demand
+
     def __init__(self, compare_frame_controller: CompareFrameController, project_manager: ProjectManager, parent=None):
         super().__init__(parent)
         self.ui = Ui_GeneratorTab()
@@ -166,6 +168,8 @@ class GeneratorTabController(QWidget):
         self.show_modulation_info()
 
     def refresh_modulators(self):
+        from urh.controller.ModulatorDialogController import ModulatorDialogController
+
         current_index = 0
         if type(self.sender()) == ModulatorDialogController:
             current_index = self.sender().ui.comboBoxCustomModulations.currentIndex()
@@ -210,7 +214,14 @@ class GeneratorTabController(QWidget):
         self.ui.lParamForOne.setText(prefix + " for 1:")
         self.ui.lParamForOneValue.setText(cur_mod.param_for_one_str)
 
-    def prepare_modulation_dialog(self) -> (ModulatorDialogController, Message):
+    def prepare_modulation_dialog(self):
+        """
+
+        :rtype: (ModulatorDialogController, Message)
+        """
+        # Dialogs are imported on first use to keep the startup fast
+        from urh.controller.ModulatorDialogController import ModulatorDialogController
+
         preselected_index = self.ui.cBoxModulations.currentIndex()
 
         min_row, max_row, start, end = self.ui.tableMessages.selection_range()
@@ -238,7 +249,11 @@ class GeneratorTabController(QWidget):
 
         return modulator_dialog, selected_message
 
-    def initialize_modulation_dialog(self, bits: str, dialog: ModulatorDialogController):
+    def initialize_modulation_dialog(self, bits: str, dialog):
+        """
+
+        :type dialog: ModulatorDialogController
+        """
         dialog.original_bits = bits
         dialog.ui.linEdDataBits.setText(bits)
         dialog.ui.gVOriginalSignal.signal_tree_root = self.tree_model.rootItem
@@ -300,8 +315,10 @@ class GeneratorTabController(QWidget):
     def refresh_pause_list(self):
         self.ui.lWPauses.clear()
         fmt_str = "Pause ({1:d}-{2:d}) <{0:d} samples ({3})>"
-        for i, pause in enumerate(self.table_model.protocol.pauses):
-            sr = self.modulators[self.table_model.protocol.messages[i].modulator_indx].sample_rate
+        messages = itertools.islice(self.table_model.protocol.messages, self.MAX_LISTED_PAUSES)
+        for i, msg in enumerate(messages):
+            pause = msg.pause
+            sr = self.modulators[msg.modulator_indx].sample_rate
             item = fmt_str.format(pause, i + 1, i + 2, Formatter.science_time(pause / sr))
             self.ui.lWPauses.addItem(item)
 
@@ -330,26 +347,27 @@ class GeneratorTabController(QWidget):
             self.unsetCursor()
 
     def modulate_data(self):
-        pos = 0
-        modulated_samples = []
         container = self.table_model.protocol
+        num_messages = self.table_model.row_count
         self.ui.prBarGeneration.show()
         self.ui.prBarGeneration.setValue(0)
-        self.ui.prBarGeneration.setMaximum(self.table_model.row_count)
-        for i in range(0, self.table_model.row_count):
-            message = container.messages[i]
-            modulator = self.modulators[message.modulator_indx]
-            modulator.modulate(start=pos, data=message.encoded_bits, pause=message.pause)
-            modulated_samples.append(modulator.modulated_samples)
-            pos += len(modulator.modulated_samples)
-            self.ui.prBarGeneration.setValue(i + 1)
-            QApplication.processEvents()
+        self.ui.prBarGeneration.setMaximum(num_messages)
 
+        def on_progress(num_modulated: int):
+            # Processing events for every message would dominate the time for large fuzzing runs
+            if num_modulated % 100 == 0 or num_modulated == num_messages:
+                self.ui.prBarGeneration.setValue(num_modulated)
+                QApplication.processEvents()
+
+        modulated_samples = Modulator.modulate_messages(self.modulators, container.messages,
+                                                        progress_callback=on_progress)
         self.ui.prBarGeneration.hide()
-        return numpy.concatenate(modulated_samples).astype(numpy.complex64)
+        return modulated_samples
 
     @pyqtSlot(int)
     def show_fuzzing_dialog(self, label_index: int):
+        from urh.controller.FuzzingDialogController import FuzzingDialogController
+
         view = self.ui.cbViewType.currentIndex()
         if self.selected_message is not None:
             fdc = FuzzingDialogController(protocol=self.table_model.protocol, label_index=label_index,
@@ -378,6 +396,15 @@ class GeneratorTabController(QWidget):
         elif self.ui.rBExhaustive.isChecked():
             fuz_mode = "Exhaustive"
 
+        num_messages = self.table_model.protocol.num_fuzzed_messages(FuzzMode[fuz_mode.lower()])
+        if num_messages > self.MAX_FUZZED_MESSAGES_WITHOUT_CONFIRMATION:
+            reply = QMessageBox.question(self, self.tr("Fuzzing"),
+                                         self.tr("{0} fuzzing creates {1:n} messages, "
+                                                 "which take long to send. Continue?").format(fuz_mode, num_messages),
+                                         QMessageBox.Yes | QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+
         fuzz_action = Fuzz(self.table_model.protocol, fuz_mode)
         self.table_model.undo_stack.push(fuzz_action)
 
@@ -386,7 +413,7 @@ class GeneratorTabController(QWidget):
         btn_was_enabled = self.ui.btnFuzz.isEnabled()
         pac = self.table_model.protocol
         assert isinstance(pac, ProtocolAnalyzerContainer)
-        fuzz_active = any(lbl.active_fuzzing for msg in pac.messages for lbl in msg.message_type)
+        fuzz_active = any(lbl.active_fuzzing for message_type in pac.used_message_types for lbl in message_type)
         self.ui.btnFuzz.setEnabled(fuzz_active)
         if self.ui.btnFuzz.isEnabled() and not btn_was_enabled:
             font = self.ui.btnFuzz.font()
@@ -411,7 +438,8 @@ class GeneratorTabController(QWidget):
         """
         update = False
 
-        for msg in self.table_model.protocol.messages:
+        # Messages created on demand take the decoder of their template
+        for msg in self.table_model.protocol.stored_messages:
             i = next((i for i, d in enumerate(encodings_from_file) if d.name == msg.decoder.name), 0)
             if msg.decoder != encodings_from_file[i]:
                 update = True
@@ -430,11 +458,12 @@ class GeneratorTabController(QWidget):
             self.ui.lEstimatedTime.setText("Estimated Time: ")
             return
 
-        avg_msg_len = numpy.mean([len(msg.encoded_bits) for msg in c.messages])
+        representatives = c.representative_messages()
+        num_bits = sum(n * len(msg.encoded_bits) for msg, n in representatives)
         avg_bit_len = numpy.mean([m.samples_per_bit for m in self.modulators])
         avg_sample_rate = numpy.mean([m.sample_rate for m in self.modulators])
-        pause_samples = sum(c.pauses)
-        nsamples = c.num_messages * avg_msg_len * avg_bit_len + pause_samples
+        pause_samples = sum(n * msg.pause for msg, n in representatives)
+        nsamples = num_bits * avg_bit_len + pause_samples
 
         self.ui.lEstimatedTime.setText(
             locale.format_string("Estimated Time: %.04f seconds", nsamples / avg_sample_rate))
@@ -481,8 +510,12 @@ class GeneratorTabController(QWidget):
 
     @pyqtSlot()
     def on_btn_send_clicked(self):
+        from urh.controller.SendDialogController import SendDialogController
+
         try:
-            modulated_data = self.modulate_data()
+            # Long sends, e.g. of fuzzed messages, are modulated while sending, so they start without delay.
+            # Fuzzed messages are also created while sending.
+            modulated_data = ModulatedStream(self.modulators, self.table_model.protocol.messages)
             dialog = SendDialogController(self.project_manager.frequency,
                                           self.project_manager.sample_rate,
                                           self.project_manager.bandwidth,
@@ -1,25 +1,22 @@
 import copy
 import os
+import threading
 import traceback
 
-from PyQt5.QtCore import QDir, Qt, pyqtSlot, QFileInfo, QTimer
-from PyQt5.QtGui import QIcon, QCloseEvent
+from PyQt5.QtCore import QDir, Qt, pyqtSlot, QFileInfo, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon, QCloseEvent, QPaintEvent
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import QMainWindow, QUndoGroup, QActionGroup, QHeaderView, QAction, QFileDialog, \
-    QMessageBox, QApplication
+    QMessageBox, QApplication, QProgressDialog
 
 from urh import constants
 from urh import version
 from urh.controller.CompareFrameController import CompareFrameController
-from urh.controller.DecoderWidgetController import DecoderWidgetController
 from urh.controller.GeneratorTabController import GeneratorTabController
 from urh.controller.OptionsController import OptionsController
-from urh.controller.ProjectDialogController import ProjectDialogController
-from urh.controller.ProtocolSniffDialogController import ProtocolSniffDialogController
-from urh.controller.ReceiveDialogController import ReceiveDialogController
 from urh.controller.SignalFrameController import SignalFrameController
 from urh.controller.SignalTabController import SignalTabController
-from urh.controller.SpectrumDialogController import SpectrumDialogController
+from urh.dev.BackendHandler import BackendHandler
 from urh.models.FileFilterProxyModel import FileFilterProxyModel
 from urh.models.FileIconProvider import FileIconProvider
 from urh.models.FileSystemModel import FileSystemModel
@@ -33,15 +30,27 @@ from urh.util import FileOperator
 from urh.util.Errors import Errors
 from urh.util.Logger import logger
 from urh.util.ProjectManager import ProjectManager
+from urh.util.SignalLoader import SignalLoader
 
 
 class MainController(QMainWindow):
+    first_painted = pyqtSignal()
+    gnuradio_probed = pyqtSignal(bool)
+
     def __init__(self, *args):
         super().__init__(*args)
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        self.__painted = False
 
         OptionsController.write_default_options()
+        # The GNU Radio probe waits for a subprocess, so it runs on a worker thread.
+        # The settings are not thread safe, so the result is written back in the GUI thread.
+        self.gnuradio_probed.connect(self.on_gnuradio_probed, Qt.QueuedConnection)
+        python2_exe = BackendHandler.read_python2_exe()
+        self.gnuradio_probe_thread = threading.Thread(
+            target=lambda: self.gnuradio_probed.emit(BackendHandler.probe_gnuradio(python2_exe)))
+        self.gnuradio_probe_thread.start()
 
         self.project_save_timer = QTimer()
         self.project_manager = ProjectManager(self)
@@ -215,7 +224,26 @@ class MainController(QMainWindow):
         self.ui.tabWidget.setCurrentIndex(2)
         self.generator_tab_controller.load_from_file(filename)
 
-    def add_signalfile(self, filename: str, group_id=0):
+    def add_signalfile(self, filename: str, group_id=0, loader: SignalLoader = None):
+        if loader is not None and filename in loader:
+            try:
+                result = loader.result(filename)
+            except Exception as e:
+                # Each failed worker gets its own dialog, the other signals are still added
+                Errors.generic_error(self.tr("Failed to open"), "{0}: {1}".format(filename, e), traceback.format_exc())
+                return
+
+            if result is None:
+                return
+
+            signal, pa = result
+            if self.project_manager.project_file is None:
+                self.adjust_for_current_file(signal.filename)
+
+            self.file_proxy_model.open_files.add(filename)
+            self.add_signal(signal, group_id, proto_analyzer=pa)
+            return
+
         if not os.path.exists(filename):
             QMessageBox.critical(self, self.tr("File not Found"),
                                  self.tr("The file {0} could not be found. Was it moved or renamed?").format(
@@ -233,7 +261,8 @@ class MainController(QMainWindow):
         # Use default sample rate for signal
         # Sample rate will be overriden in case of a project later
         signal = Signal(filename, sig_name, wav_is_qad_demod=alrdy_qad_demod,
-                        sample_rate=self.project_manager.sample_rate)
+                        sample_rate=self.project_manager.sample_rate,
+                        memory_mapped=os.path.getsize(filename) > constants.MEMORY_MAP_THRESHOLD)
 
         if self.project_manager.project_file is None:
             self.adjust_for_current_file(signal.filename)
@@ -241,11 +270,15 @@ class MainController(QMainWindow):
         self.file_proxy_model.open_files.add(filename)
         self.add_signal(signal, group_id)
 
-    def add_signal(self, signal, group_id=0):
+    def add_signal(self, signal, group_id=0, proto_analyzer: ProtocolAnalyzer = None):
+        """
+
+        :param proto_analyzer: protocol of a signal, which was already prepared by a :class:`SignalLoader`
+        """
         self.ui.progressBar.setMaximum(100)
         self.ui.progressBar.show()
 
-        pa = ProtocolAnalyzer(signal)
+        pa = ProtocolAnalyzer(signal) if proto_analyzer is None else proto_analyzer
         sframe = self.signal_tab_controller.add_signal_frame(pa)
         self.ui.progressBar.setValue(10)
         QApplication.processEvents()
@@ -254,11 +287,12 @@ class MainController(QMainWindow):
         self.ui.progressBar.setValue(20)
         QApplication.processEvents()
 
-        signal.blockSignals(True)
-        has_entry = self.project_manager.read_project_file_for_signal(signal)
-        if not has_entry:
-            signal.auto_detect()
-        signal.blockSignals(False)
+        if proto_analyzer is None:
+            signal.blockSignals(True)
+            has_entry = self.project_manager.read_project_file_for_signal(signal)
+            if not has_entry:
+                signal.auto_detect()
+            signal.blockSignals(False)
         self.ui.progressBar.setValue(50)
         QApplication.processEvents()
 
@@ -349,7 +383,30 @@ class MainController(QMainWindow):
         if num_files == 0:
             return
 
+        loader = None
+        signal_files = [f for f in filepaths if SignalLoader.supports(f)]
+        if len(signal_files) > 1:
+            # Load and demodulate signals in background, frames are added as soon as signals are ready
+            loader = SignalLoader(signal_files, self.project_manager)
+            progress_dialog = QProgressDialog(self.tr("Loading signals..."), self.tr("Cancel"),
+                                              0, len(signal_files), self)
+            progress_dialog.setWindowTitle(self.tr("Loading"))
+            progress_dialog.canceled.connect(loader.cancel)
+            loader.progress_changed.connect(progress_dialog.setValue)
+
+        try:
+            self.__add_files(filepaths, group_id, loader)
+        finally:
+            if loader is not None:
+                loader.cancel()
+                progress_dialog.close()
+
+    def __add_files(self, filepaths, group_id: int, loader):
+        num_files = len(filepaths)
         for i, file in enumerate(filepaths):
+            if loader is not None and loader.canceled:
+                break
+
             if not os.path.exists(file):
                 continue
 
@@ -371,17 +428,17 @@ class MainController(QMainWindow):
             QApplication.setOverrideCursor(Qt.WaitCursor)
 
             if file_extension == ".complex":
-                self.add_signalfile(file, group_id)
+                self.add_signalfile(file, group_id, loader)
             elif file_extension == ".coco":
                 self.add_signalfile(file, group_id)
-            elif file_extension == ".proto":
+            elif file_extension in (".proto", ".bproto"):
                 self.add_protocol_file(file)
             elif file_extension == ".wav":
                 self.add_signalfile(file, group_id)
             elif file_extension == ".fuzz":
                 self.add_fuzz_profile(file)
             else:
-                self.add_signalfile(file, group_id)
+                self.add_signalfile(file, group_id, loader)
 
             QApplication.restoreOverrideCursor()
         self.signal_tab_controller.ui.lLoadingFile.setText("")
@@ -389,10 +446,21 @@ class MainController(QMainWindow):
     def set_frame_numbers(self):
         self.signal_tab_controller.set_frame_numbers()
 
+    def paintEvent(self, event: QPaintEvent):
+        super().paintEvent(event)
+        if not self.__painted:
+            self.__painted = True
+            self.first_painted.emit()
+
     def closeEvent(self, event: QCloseEvent):
+        self.gnuradio_probe_thread.join()
         self.project_manager.saveProject()
         event.accept()
 
+    @pyqtSlot(bool)
+    def on_gnuradio_probed(self, gnuradio_installed: bool):
+        OptionsController.write_default_backend_options(gnuradio_probed=gnuradio_installed)
+
     def close_all(self):
         self.filemodel.setRootPath(QDir.homePath())
         self.ui.fileTree.setRootIndex(self.file_proxy_model.mapFromSource(self.filemodel.index(QDir.homePath())))
@@ -427,6 +495,8 @@ class MainController(QMainWindow):
             sig_frame.ui.cbProtoView.setCurrentIndex(view_index)
 
     def show_project_settings(self):
+        # Dialogs are imported on first use to keep the startup fast
+        from urh.controller.ProjectDialogController import ProjectDialogController
         pdc = ProjectDialogController(new_project=False, project_manager=self.project_manager, parent=self)
         pdc.finished.connect(self.on_project_dialog_finished)
         pdc.show()
@@ -546,6 +616,7 @@ class MainController(QMainWindow):
 
     @pyqtSlot()
     def on_show_decoding_dialog_triggered(self):
+        from urh.controller.DecoderWidgetController import DecoderWidgetController
         signals = [sf.signal for sf in self.signal_tab_controller.signal_frames]
         decoding_controller = DecoderWidgetController(
             self.compare_frame_controller.decodings, signals,
@@ -575,6 +646,7 @@ class MainController(QMainWindow):
 
     @pyqtSlot()
     def on_show_record_dialog_action_triggered(self):
+        from urh.controller.ReceiveDialogController import ReceiveDialogController
         pm = self.project_manager
         r = ReceiveDialogController(pm.frequency, pm.sample_rate,
                                     pm.bandwidth, pm.gain,
@@ -610,6 +682,7 @@ class MainController(QMainWindow):
             noise = 0.001
             center = 0.02
 
+        from urh.controller.ProtocolSniffDialogController import ProtocolSniffDialogController
         psd = ProtocolSniffDialogController(pm.frequency, pm.sample_rate,
                                             pm.bandwidth, pm.gain,
                                             pm.device, noise, center,
@@ -624,6 +697,7 @@ class MainController(QMainWindow):
 
     @pyqtSlot()
     def on_show_spectrum_dialog_action_triggered(self):
+        from urh.controller.SpectrumDialogController import SpectrumDialogController
         pm = self.project_manager
         r = SpectrumDialogController(pm.frequency, pm.sample_rate,
                                      pm.bandwidth, pm.gain, pm.device,
@@ -649,6 +723,7 @@ class MainController(QMainWindow):
 
     @pyqtSlot()
     def on_new_project_action_triggered(self):
+        from urh.controller.ProjectDialogController import ProjectDialogController
         pdc = ProjectDialogController(parent=self)
         pdc.finished.connect(self.on_project_dialog_finished)
         pdc.show()
@@ -685,7 +760,7 @@ class MainController(QMainWindow):
         else:
             self.dialog.setFileMode(QFileDialog.ExistingFiles)
             self.dialog.setNameFilter(
-                "All files (*);;Complex (*.complex);;Complex16 unsigned (*.complex16u);;Complex16 signed (*.complex16s);;Wave (*.wav);;Protocols (*.proto);;"
+                "All files (*);;Complex (*.complex);;Complex16 unsigned (*.complex16u);;Complex16 signed (*.complex16s);;Wave (*.wav);;Protocols (*.proto *.bproto);;"
                 "Fuzzprofiles (*.fuzz);;Tar Archives (*.tar *.tar.gz *.tar.bz2);;Zip Archives (*.zip)")
 
         self.dialog.setOptions(QFileDialog.DontResolveSymlinks)
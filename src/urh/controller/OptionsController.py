@@ -369,6 +369,8 @@ class OptionsController(QDialog):
         if not os.path.isfile(constants.FIELD_TYPE_SETTINGS):
             FieldType.save_to_xml(FieldType.default_field_types())
 
-        bh = BackendHandler()
+    @staticmethod
+    def write_default_backend_options(gnuradio_probed=None):
+        bh = BackendHandler(gnuradio_probed=gnuradio_probed)
         for be in bh.device_backends.values():
             be.write_settings()
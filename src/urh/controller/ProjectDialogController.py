@@ -9,7 +9,6 @@ from PyQt5.QtGui import QRegExpValidator
 from PyQt5.QtWidgets import QDialog, QCompleter, QDirModel
 
 from urh import constants
-from urh.controller.SpectrumDialogController import SpectrumDialogController
 from urh.signalprocessing.Participant import Participant
 from urh.ui.delegates.ComboBoxDelegate import ComboBoxDelegate
 from urh.ui.ui_project import Ui_ProjectDialog
@@ -274,6 +273,8 @@ class ProjectDialogController(QDialog):
     @pyqtSlot(str)
     def on_spectrum_analyzer_link_activated(self, link: str):
         if link == "open_spectrum_analyzer":
+            from urh.controller.SpectrumDialogController import SpectrumDialogController
+
             r = SpectrumDialogController(freq=self.freq, bw=self.bandwidth, samp_rate=self.sample_rate,
                                          gain=self.gain, device="", parent=self)
             if r.has_empty_device_list:
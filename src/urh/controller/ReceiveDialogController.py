@@ -98,7 +98,8 @@ class ReceiveDialogController(SendRecvDialogController):
 
     @pyqtSlot()
     def on_save_clicked(self):
-        data = self.device.data[:self.device.current_index]
+        # The ring buffer writes itself from its spill file, so long recordings are not loaded into RAM
+        data = self.device.data
 
         dev = self.device
         big_val = Formatter.big_value_with_suffix
@@ -9,12 +9,20 @@ from urh import constants
 from urh.SignalSceneManager import SignalSceneManager
 from urh.controller.SendRecvDialogController import SendRecvDialogController
 from urh.dev.VirtualDevice import VirtualDevice, Mode
+from urh.signalprocessing.ModulatedStream import ModulatedStream
 from urh.signalprocessing.Signal import Signal
 from urh.util import FileOperator
 
 
 class SendDialogController(SendRecvDialogController):
+    MAX_PREVIEW_SAMPLES = 2 ** 22
+
     def __init__(self, freq, samp_rate, bw, gain, device: str, modulated_data, parent=None, testing_mode=False):
+        """
+
+        :param modulated_data: samples to send, streams longer than MAX_PREVIEW_SAMPLES are modulated while sending
+        :type modulated_data: np.ndarray | ModulatedStream
+        """
         self.is_tx = True
         super().__init__(freq, samp_rate, bw, gain, device, parent=parent, testing_mode=testing_mode)
 
@@ -31,7 +39,14 @@ class SendDialogController(SendRecvDialogController):
 
         self.device_is_sending = False
 
-        signal = Signal.from_samples(modulated_data, "Modulated Preview", samp_rate)
+        if isinstance(modulated_data, ModulatedStream) and len(modulated_data) > self.MAX_PREVIEW_SAMPLES:
+            self.stream = modulated_data
+            preview = self.stream.modulate(self.MAX_PREVIEW_SAMPLES)
+        else:
+            self.stream = None
+            preview = modulated_data.modulate() if isinstance(modulated_data, ModulatedStream) else modulated_data
+
+        signal = Signal.from_samples(preview, "Modulated Preview", samp_rate)
         self.scene_manager = SignalSceneManager(signal, parent=self)
         self.send_indicator = self.scene_manager.scene.addRect(0, -2, 0, 4,
                                                                QPen(QColor(Qt.transparent), Qt.FlatCap),
@@ -46,6 +61,13 @@ class SendDialogController(SendRecvDialogController):
         self.graphics_view.setScene(self.scene_manager.scene)
         self.graphics_view.scene_manager = self.scene_manager
 
+        if self.stream is not None:
+            # The preview only shows the beginning of the stream, so editing it would not change what is sent
+            for action in self.graphics_view.actions():
+                action.setEnabled(False)
+            self.graphics_view.setContextMenuPolicy(Qt.NoContextMenu)
+            self.graphics_view.setToolTip(self.tr("Preview of the first {0:d} samples".format(len(preview))))
+
         self.create_connects()
 
     def create_connects(self):
@@ -61,7 +83,7 @@ class SendDialogController(SendRecvDialogController):
 
     def update_view(self):
         if super().update_view():
-            self.__update_send_indicator(self.device.current_index)
+            self.__update_send_indicator(min(self.device.current_index, self.scene_manager.signal.num_samples))
             if not self.device.sending_finished:
                 self.ui.lblCurrentRepeatValue.setText(str(self.device.current_iteration + 1))
             else:
@@ -70,7 +92,7 @@ class SendDialogController(SendRecvDialogController):
     def init_device(self):
         device_name = self.ui.cbDevice.currentText()
         num_repeats = self.ui.spinBoxNRepeat.value()
-        sts = self.scene_manager.signal._fulldata
+        sts = self.scene_manager.signal._fulldata if self.stream is None else self.stream
         if self.device:
             self.device.free_data()
         # Can't perform gc.collect() here, because the dialog itself would be deleted
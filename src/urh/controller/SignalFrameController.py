@@ -8,8 +8,6 @@ from PyQt5.QtWidgets import QFrame, QMessageBox, QHBoxLayout, QVBoxLayout, QGrid
 
 from urh import constants
 from urh.SignalSceneManager import SignalSceneManager
-from urh.controller.SendDialogController import SendDialogController
-from urh.controller.SignalDetailsController import SignalDetailsController
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
 from urh.ui.CustomDialog import CustomDialog
@@ -585,6 +583,8 @@ class SignalFrameController(QFrame):
 
     @pyqtSlot()
     def on_btn_replay_clicked(self):
+        from urh.controller.SendDialogController import SendDialogController
+
         project_manager = self.project_manager
         dialog = SendDialogController(project_manager.frequency, project_manager.sample_rate,
                                       project_manager.bandwidth, project_manager.gain, project_manager.device,
@@ -929,6 +929,8 @@ class SignalFrameController(QFrame):
 
     @pyqtSlot()
     def on_info_btn_clicked(self):
+        from urh.controller.SignalDetailsController import SignalDetailsController
+
         sdc = SignalDetailsController(self.signal, self)
         sdc.show()
 
@@ -1042,6 +1042,7 @@ typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
 typedef npy_cdouble __pyx_t_5numpy_complex_t;
 struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_calc_costa_alpha;
 struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_calc_costa_beta;
+struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_afp_demod_block;
 struct __pyx_t_3src_3urh_9cythonext_15signalFunctions_Cluster;
 
 /* "src/urh/cythonext/signalFunctions.pyx":19
@@ -1068,7 +1069,20 @@ struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_calc_costa_beta {
   float damp;
 };
 
-/* "src/urh/cythonext/signalFunctions.pyx":335
+/* "src/urh/cythonext/signalFunctions.pyx":138
+ *     return np.asarray(result)
+ * 
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,             # <<<<<<<<<<<<<<
+ *                                                         float[::1] costa_state, bool has_predecessor=False,
+ *                                                         float complex predecessor=0):
+ */
+struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_afp_demod_block {
+  int __pyx_n;
+  bool has_predecessor;
+  __pyx_t_float_complex predecessor;
+};
+
+/* "src/urh/cythonext/signalFunctions.pyx":587
  * 
  * cdef:
  *     struct Cluster:             # <<<<<<<<<<<<<<
@@ -1080,8 +1094,8 @@ struct __pyx_t_3src_3urh_9cythonext_15signalFunctions_Cluster {
   unsigned PY_LONG_LONG nitems;
 };
 
-/* "src/urh/cythonext/signalFunctions.pyx":276
- *     return result[:cur_index]
+/* "src/urh/cythonext/signalFunctions.pyx":528
+ *             np.asarray(pauses[:num_messages]), np.asarray(symbols[:num_symbols]))
  * 
  * cdef class Symbol:             # <<<<<<<<<<<<<<
  *     cdef public str name
@@ -1317,32 +1331,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 /* ExtTypeTest.proto */
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
 
-/* PyCFunctionFastCall.proto */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
-#else
-#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
-#endif
-
-/* PyFunctionFastCall.proto */
-#if CYTHON_FAST_PYCALL
-#define __Pyx_PyFunction_FastCall(func, args, nargs)\
-    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
-#else
-#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
-#endif
-#endif
-
-/* PyObjectCallMethO.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
-#endif
-
-/* PyObjectCallOneArg.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
-
 /* BufferFormatCheck.proto */
 static CYTHON_INLINE int  __Pyx_GetBufferAndValidate(Py_buffer* buf, PyObject* obj,
     __Pyx_TypeInfo* dtype, int flags, int nd, int cast, __Pyx_BufFmt_StackElem* stack);
@@ -1378,6 +1366,32 @@ static CYTHON_INLINE int __pyx_sub_acquisition_count_locked(
 static CYTHON_INLINE void __Pyx_INC_MEMVIEW(__Pyx_memviewslice *, int, int);
 static CYTHON_INLINE void __Pyx_XDEC_MEMVIEW(__Pyx_memviewslice *, int, int);
 
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
 /* RaiseArgTupleInvalid.proto */
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
@@ -1419,6 +1433,9 @@ static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
                                   int full_traceback, int nogil);
 
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
 /* ArgTypeTest.proto */
 static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
     const char *name, int exact);
@@ -1441,9 +1458,6 @@ static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
 #endif
 
 #define __Pyx_BufPtrStrided1d(type, buf, i0, s0) (type)((char*)buf + i0 * s0)
-/* RaiseException.proto */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
-
 /* DictGetItem.proto */
 #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
@@ -1794,6 +1808,15 @@ static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc___p
 /* ObjectToMemviewSlice.proto */
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_float(PyObject *);
 
+/* FromPy.proto */
+static __pyx_t_float_complex __Pyx_PyComplex_As___pyx_t_float_complex(PyObject*);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_PY_LONG_LONG(PyObject *);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_PY_LONG_LONG(PyObject *);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value);
 
@@ -1802,9 +1825,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value)
         PyComplex_FromDoubles((double)__Pyx_CREAL(z),\
                               (double)__Pyx_CIMAG(z))
 
-/* FromPy.proto */
-static __pyx_t_float_complex __Pyx_PyComplex_As___pyx_t_float_complex(PyObject*);
-
 /* MemviewDtypeToObject.proto */
 static CYTHON_INLINE PyObject *__pyx_memview_get___pyx_t_float_complex(const char *itemp);
 static CYTHON_INLINE int __pyx_memview_set___pyx_t_float_complex(const char *itemp, PyObject *obj);
@@ -1823,6 +1843,17 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 static CYTHON_INLINE PyObject *__pyx_memview_get_unsigned_PY_LONG_LONG(const char *itemp);
 static CYTHON_INLINE int __pyx_memview_set_unsigned_PY_LONG_LONG(const char *itemp, PyObject *obj);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_npy_int8(npy_int8 value);
+
+/* MemviewDtypeToObject.proto */
+static CYTHON_INLINE PyObject *__pyx_memview_get_nn___pyx_t_5numpy_int8_t(const char *itemp);
+static CYTHON_INLINE int __pyx_memview_set_nn___pyx_t_5numpy_int8_t(const char *itemp, PyObject *obj);
+
+/* MemviewDtypeToObject.proto */
+static CYTHON_INLINE PyObject *__pyx_memview_get_PY_LONG_LONG(const char *itemp);
+static CYTHON_INLINE int __pyx_memview_set_PY_LONG_LONG(const char *itemp, PyObject *obj);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_int(unsigned int value);
 
@@ -1851,6 +1882,9 @@ static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_As_unsigned_PY_LONG_LONG(
 /* CIntFromPy.proto */
 static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_As_PY_LONG_LONG(PyObject *);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE npy_int8 __Pyx_PyInt_As_npy_int8(PyObject *);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE char __Pyx_PyInt_As_char(PyObject *);
 
@@ -1858,10 +1892,13 @@ static CYTHON_INLINE char __Pyx_PyInt_As_char(PyObject *);
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_PY_LONG_LONG(PyObject *);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_5numpy_int8_t(PyObject *);
 
 /* ObjectToMemviewSlice.proto */
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_PY_LONG_LONG(PyObject *);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_PY_LONG_LONG(PyObject *);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_PY_LONG_LONG(PyObject *);
 
 /* CheckBinaryVersion.proto */
 static int __Pyx_check_binary_version(void);
@@ -1947,11 +1984,14 @@ static PyThread_type_lock __pyx_memoryview_thread_locks[8];
 static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_calc_costa_alpha(float, struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_calc_costa_alpha *__pyx_optional_args); /*proto*/
 static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_calc_costa_beta(float, struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_calc_costa_beta *__pyx_optional_args); /*proto*/
 static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(int, int __pyx_skip_dispatch); /*proto*/
-static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_memviewslice, __Pyx_memviewslice, float, float, float, bool, PY_LONG_LONG); /*proto*/
+static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_memviewslice, __Pyx_memviewslice, float, float, float, bool, PY_LONG_LONG, __Pyx_memviewslice); /*proto*/
 static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(__Pyx_memviewslice, float, int, int __pyx_skip_dispatch); /*proto*/
+static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod_block(__Pyx_memviewslice, float, int, __Pyx_memviewslice, int __pyx_skip_dispatch, struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_afp_demod_block *__pyx_optional_args); /*proto*/
 static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_start(__Pyx_memviewslice, int, int __pyx_skip_dispatch); /*proto*/
 static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_end(__Pyx_memviewslice, int, int __pyx_skip_dispatch); /*proto*/
 static __Pyx_memviewslice __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__Pyx_memviewslice, float, unsigned int, int, int __pyx_skip_dispatch); /*proto*/
+static __Pyx_memviewslice __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens_stream(__Pyx_memviewslice, float, unsigned int, int, __Pyx_memviewslice, int __pyx_skip_dispatch); /*proto*/
+static PyObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_pulses_to_bits(__Pyx_memviewslice, unsigned PY_LONG_LONG, double, int __pyx_skip_dispatch); /*proto*/
 static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_bit_len(__Pyx_memviewslice, float, int, int, int __pyx_skip_dispatch); /*proto*/
 static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(float, __Pyx_memviewslice, int, int __pyx_skip_dispatch); /*proto*/
 static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(__Pyx_memviewslice, unsigned int, int __pyx_skip_dispatch); /*proto*/
@@ -1991,13 +2031,15 @@ static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int64_t = { "int64_t", NU
 static __Pyx_TypeInfo __Pyx_TypeInfo___pyx_t_float_complex = { "float complex", NULL, sizeof(__pyx_t_float_complex), { 0 }, 0, 'C', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_float = { "float", NULL, sizeof(float), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_PY_LONG_LONG = { "unsigned long long", NULL, sizeof(unsigned PY_LONG_LONG), { 0 }, 0, IS_UNSIGNED(unsigned PY_LONG_LONG) ? 'U' : 'I', IS_UNSIGNED(unsigned PY_LONG_LONG), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_int8_t = { "int8_t", NULL, sizeof(__pyx_t_5numpy_int8_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_int8_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_int8_t), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_PY_LONG_LONG = { "long long", NULL, sizeof(PY_LONG_LONG), { 0 }, 0, IS_UNSIGNED(PY_LONG_LONG) ? 'U' : 'I', IS_UNSIGNED(PY_LONG_LONG), 0 };
 #define __Pyx_MODULE_NAME "src.urh.cythonext.signalFunctions"
 int __pyx_module_is_main_src__urh__cythonext__signalFunctions = 0;
 
 /* Implementation of 'src.urh.cythonext.signalFunctions' */
 static PyObject *__pyx_builtin_range;
-static PyObject *__pyx_builtin_id;
 static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_id;
 static PyObject *__pyx_builtin_RuntimeError;
 static PyObject *__pyx_builtin_ImportError;
 static PyObject *__pyx_builtin_MemoryError;
@@ -2012,6 +2054,7 @@ static const char __pyx_k_id[] = "id";
 static const char __pyx_k_np[] = "np";
 static const char __pyx_k_obj[] = "obj";
 static const char __pyx_k_base[] = "base";
+static const char __pyx_k_int8[] = "int8";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_mode[] = "mode";
 static const char __pyx_k_name[] = "name";
@@ -2030,12 +2073,16 @@ static const char __pyx_k_dtype[] = "dtype";
 static const char __pyx_k_empty[] = "empty";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_flags[] = "flags";
+static const char __pyx_k_int64[] = "int64";
 static const char __pyx_k_nbits[] = "nbits";
 static const char __pyx_k_numpy[] = "numpy";
 static const char __pyx_k_order[] = "order";
+static const char __pyx_k_ppseq[] = "ppseq";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_shape[] = "shape";
 static const char __pyx_k_start[] = "start";
+static const char __pyx_k_state[] = "state";
+static const char __pyx_k_zeros[] = "zeros";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_format[] = "format";
 static const char __pyx_k_import[] = "__import__";
@@ -2047,6 +2094,7 @@ static const char __pyx_k_uint64[] = "uint64";
 static const char __pyx_k_unpack[] = "unpack";
 static const char __pyx_k_argsort[] = "argsort";
 static const char __pyx_k_asarray[] = "asarray";
+static const char __pyx_k_bit_len[] = "bit_len";
 static const char __pyx_k_centers[] = "centers";
 static const char __pyx_k_float32[] = "float32";
 static const char __pyx_k_fortran[] = "fortran";
@@ -2068,14 +2116,18 @@ static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_qad_center[] = "qad_center";
 static const char __pyx_k_ImportError[] = "ImportError";
 static const char __pyx_k_MemoryError[] = "MemoryError";
+static const char __pyx_k_costa_state[] = "costa_state";
 static const char __pyx_k_num_centers[] = "num_centers";
+static const char __pyx_k_predecessor[] = "predecessor";
 static const char __pyx_k_qad_samples[] = "qad_samples";
 static const char __pyx_k_RuntimeError[] = "RuntimeError";
 static const char __pyx_k_demod_samples[] = "demod_samples";
 static const char __pyx_k_pyx_getbuffer[] = "__pyx_getbuffer";
 static const char __pyx_k_urh_cythonext[] = "urh.cythonext";
+static const char __pyx_k_rel_symbol_len[] = "rel_symbol_len";
 static const char __pyx_k_allocate_buffer[] = "allocate_buffer";
 static const char __pyx_k_dtype_is_object[] = "dtype_is_object";
+static const char __pyx_k_has_predecessor[] = "has_predecessor";
 static const char __pyx_k_strided_and_direct[] = "<strided and direct>";
 static const char __pyx_k_strided_and_indirect[] = "<strided and indirect>";
 static const char __pyx_k_contiguous_and_direct[] = "<contiguous and direct>";
@@ -2088,6 +2140,7 @@ static const char __pyx_k_itemsize_0_for_cython_array[] = "itemsize <= 0 for cyt
 static const char __pyx_k_ndarray_is_not_C_contiguous[] = "ndarray is not C contiguous";
 static const char __pyx_k_unable_to_allocate_array_data[] = "unable to allocate array data.";
 static const char __pyx_k_strided_and_direct_or_indirect[] = "<strided and direct or indirect>";
+static const char __pyx_k_Bit_length_must_be_greater_than[] = "Bit length must be greater than zero";
 static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
 static const char __pyx_k_unknown_dtype_code_in_numpy_pxd[] = "unknown dtype code in numpy.pxd (%d)";
 static const char __pyx_k_Buffer_view_does_not_expose_stri[] = "Buffer view does not expose strides";
@@ -2106,6 +2159,7 @@ static const char __pyx_k_unable_to_allocate_shape_and_str[] = "unable to alloca
 static const char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
 static PyObject *__pyx_kp_u_0_1_2;
 static PyObject *__pyx_n_s_ASCII;
+static PyObject *__pyx_kp_u_Bit_length_must_be_greater_than;
 static PyObject *__pyx_kp_s_Buffer_view_does_not_expose_stri;
 static PyObject *__pyx_n_u_C;
 static PyObject *__pyx_kp_s_Can_only_create_a_buffer_that_is;
@@ -2134,12 +2188,14 @@ static PyObject *__pyx_n_s_argsort;
 static PyObject *__pyx_n_s_array;
 static PyObject *__pyx_n_s_asarray;
 static PyObject *__pyx_n_s_base;
+static PyObject *__pyx_n_s_bit_len;
 static PyObject *__pyx_n_s_c;
 static PyObject *__pyx_n_u_c;
 static PyObject *__pyx_n_s_centers;
 static PyObject *__pyx_n_s_class;
 static PyObject *__pyx_kp_s_contiguous_and_direct;
 static PyObject *__pyx_kp_s_contiguous_and_indirect;
+static PyObject *__pyx_n_s_costa_state;
 static PyObject *__pyx_n_s_demod_samples;
 static PyObject *__pyx_n_s_dtype;
 static PyObject *__pyx_n_s_dtype_is_object;
@@ -2153,8 +2209,11 @@ static PyObject *__pyx_n_s_format;
 static PyObject *__pyx_n_s_fortran;
 static PyObject *__pyx_n_u_fortran;
 static PyObject *__pyx_kp_s_got_differing_extents_in_dimensi;
+static PyObject *__pyx_n_s_has_predecessor;
 static PyObject *__pyx_n_s_id;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_int64;
+static PyObject *__pyx_n_s_int8;
 static PyObject *__pyx_n_s_itemsize;
 static PyObject *__pyx_kp_s_itemsize_0_for_cython_array;
 static PyObject *__pyx_n_s_main;
@@ -2178,17 +2237,21 @@ static PyObject *__pyx_kp_u_numpy_core_umath_failed_to_impor;
 static PyObject *__pyx_n_s_obj;
 static PyObject *__pyx_n_s_order;
 static PyObject *__pyx_n_s_pack;
+static PyObject *__pyx_n_s_ppseq;
+static PyObject *__pyx_n_s_predecessor;
 static PyObject *__pyx_n_s_pulsetype;
 static PyObject *__pyx_n_s_pyx_getbuffer;
 static PyObject *__pyx_n_s_pyx_vtable;
 static PyObject *__pyx_n_s_qad_center;
 static PyObject *__pyx_n_s_qad_samples;
 static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_rel_symbol_len;
 static PyObject *__pyx_n_s_sample;
 static PyObject *__pyx_n_s_samples;
 static PyObject *__pyx_n_s_shape;
 static PyObject *__pyx_n_s_size;
 static PyObject *__pyx_n_s_start;
+static PyObject *__pyx_n_s_state;
 static PyObject *__pyx_n_s_step;
 static PyObject *__pyx_n_s_stop;
 static PyObject *__pyx_kp_s_strided_and_direct;
@@ -2205,11 +2268,15 @@ static PyObject *__pyx_kp_u_unknown_dtype_code_in_numpy_pxd;
 static PyObject *__pyx_n_s_unpack;
 static PyObject *__pyx_n_s_urh_cythonext;
 static PyObject *__pyx_n_s_util;
+static PyObject *__pyx_n_s_zeros;
 static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_mod_type); /* proto */
 static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_2afp_demod(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, float __pyx_v_noise_mag, int __pyx_v_mod_type); /* proto */
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_4find_signal_start(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type); /* proto */
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6find_signal_end(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type); /* proto */
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_8grab_pulse_lens(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, float __pyx_v_treshold, unsigned int __pyx_v_tolerance, int __pyx_v_mod_type); /* proto */
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_4afp_demod_block(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, float __pyx_v_noise_mag, int __pyx_v_mod_type, __Pyx_memviewslice __pyx_v_costa_state, bool __pyx_v_has_predecessor, __pyx_t_float_complex __pyx_v_predecessor); /* proto */
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6find_signal_start(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type); /* proto */
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_8find_signal_end(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type); /* proto */
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_10grab_pulse_lens(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, float __pyx_v_treshold, unsigned int __pyx_v_tolerance, int __pyx_v_mod_type); /* proto */
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_12grab_pulse_lens_stream(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, float __pyx_v_treshold, unsigned int __pyx_v_tolerance, int __pyx_v_mod_type, __Pyx_memviewslice __pyx_v_state); /* proto */
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_14pulses_to_bits(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_ppseq, unsigned PY_LONG_LONG __pyx_v_bit_len, double __pyx_v_rel_symbol_len); /* proto */
 static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__(struct __pyx_obj_3src_3urh_9cythonext_15signalFunctions_Symbol *__pyx_v_self, PyObject *__pyx_v_name, int __pyx_v_nbits, int __pyx_v_pulsetype, unsigned PY_LONG_LONG __pyx_v_nsamples); /* proto */
 static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_2__repr__(struct __pyx_obj_3src_3urh_9cythonext_15signalFunctions_Symbol *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_4__deepcopy__(struct __pyx_obj_3src_3urh_9cythonext_15signalFunctions_Symbol *__pyx_v_self, PyObject *__pyx_v_memo); /* proto */
@@ -2222,9 +2289,9 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_9pulset
 static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_9pulsetype_2__set__(struct __pyx_obj_3src_3urh_9cythonext_15signalFunctions_Symbol *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_8nsamples___get__(struct __pyx_obj_3src_3urh_9cythonext_15signalFunctions_Symbol *__pyx_v_self); /* proto */
 static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_8nsamples_2__set__(struct __pyx_obj_3src_3urh_9cythonext_15signalFunctions_Symbol *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_10estimate_bit_len(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_qad_samples, float __pyx_v_qad_center, int __pyx_v_tolerance, int __pyx_v_mod_type); /* proto */
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_12find_nearest_center(CYTHON_UNUSED PyObject *__pyx_self, float __pyx_v_sample, __Pyx_memviewslice __pyx_v_centers, int __pyx_v_num_centers); /* proto */
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_14estimate_qad_center(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, unsigned int __pyx_v_num_centers); /* proto */
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_16estimate_bit_len(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_qad_samples, float __pyx_v_qad_center, int __pyx_v_tolerance, int __pyx_v_mod_type); /* proto */
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_18find_nearest_center(CYTHON_UNUSED PyObject *__pyx_self, float __pyx_v_sample, __Pyx_memviewslice __pyx_v_centers, int __pyx_v_num_centers); /* proto */
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_20estimate_qad_center(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, unsigned int __pyx_v_num_centers); /* proto */
 static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __pyx_array_obj *__pyx_v_self, PyObject *__pyx_v_shape, Py_ssize_t __pyx_v_itemsize, PyObject *__pyx_v_format, PyObject *__pyx_v_mode, int __pyx_v_allocate_buffer); /* proto */
@@ -2267,19 +2334,20 @@ static PyObject *__pyx_tp_new__memoryviewslice(PyTypeObject *t, PyObject *a, PyO
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_4;
 static PyObject *__pyx_int_neg_1;
 static float __pyx_k_;
 static float __pyx_k__2;
+static __pyx_t_float_complex __pyx_k__4;
 static PyObject *__pyx_tuple__3;
-static PyObject *__pyx_tuple__4;
 static PyObject *__pyx_tuple__5;
 static PyObject *__pyx_tuple__6;
 static PyObject *__pyx_tuple__7;
 static PyObject *__pyx_tuple__8;
 static PyObject *__pyx_tuple__9;
-static PyObject *__pyx_slice__21;
-static PyObject *__pyx_slice__22;
-static PyObject *__pyx_slice__23;
+static PyObject *__pyx_slice__24;
+static PyObject *__pyx_slice__25;
+static PyObject *__pyx_slice__26;
 static PyObject *__pyx_tuple__10;
 static PyObject *__pyx_tuple__11;
 static PyObject *__pyx_tuple__12;
@@ -2291,12 +2359,15 @@ static PyObject *__pyx_tuple__17;
 static PyObject *__pyx_tuple__18;
 static PyObject *__pyx_tuple__19;
 static PyObject *__pyx_tuple__20;
-static PyObject *__pyx_tuple__24;
-static PyObject *__pyx_tuple__25;
-static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_tuple__22;
+static PyObject *__pyx_tuple__23;
 static PyObject *__pyx_tuple__27;
 static PyObject *__pyx_tuple__28;
 static PyObject *__pyx_tuple__29;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__31;
+static PyObject *__pyx_tuple__32;
 
 /* "src/urh/cythonext/signalFunctions.pyx":19
  * 
@@ -2602,11 +2673,11 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_get_noise_for_m
  * 
  * 
  * cdef void costa_demod(float complex[::1] samples, float[::1] result, float noise_sqrd,             # <<<<<<<<<<<<<<
- *                           float costa_alpha, float costa_beta, bool qam, long long num_samples):
- *     cdef float phase_error
+ *                           float costa_alpha, float costa_beta, bool qam, long long num_samples,
+ *                           float[::1] costa_state):
  */
 
-static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_memviewslice __pyx_v_samples, __Pyx_memviewslice __pyx_v_result, float __pyx_v_noise_sqrd, float __pyx_v_costa_alpha, float __pyx_v_costa_beta, bool __pyx_v_qam, PY_LONG_LONG __pyx_v_num_samples) {
+static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_memviewslice __pyx_v_samples, __Pyx_memviewslice __pyx_v_result, float __pyx_v_noise_sqrd, float __pyx_v_costa_alpha, float __pyx_v_costa_beta, bool __pyx_v_qam, PY_LONG_LONG __pyx_v_num_samples, __Pyx_memviewslice __pyx_v_costa_state) {
   float __pyx_v_phase_error;
   PY_LONG_LONG __pyx_v_i;
   float __pyx_v_costa_freq;
@@ -2618,70 +2689,76 @@ static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_mem
   float __pyx_v_imag;
   float __pyx_v_magnitude;
   __Pyx_RefNannyDeclarations
-  PY_LONG_LONG __pyx_t_1;
-  PY_LONG_LONG __pyx_t_2;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
   PY_LONG_LONG __pyx_t_3;
-  float __pyx_t_4;
-  float __pyx_t_5;
-  int __pyx_t_6;
-  PY_LONG_LONG __pyx_t_7;
-  __pyx_t_double_complex __pyx_t_8;
+  PY_LONG_LONG __pyx_t_4;
+  PY_LONG_LONG __pyx_t_5;
+  float __pyx_t_6;
+  float __pyx_t_7;
+  int __pyx_t_8;
   PY_LONG_LONG __pyx_t_9;
-  PY_LONG_LONG __pyx_t_10;
+  __pyx_t_double_complex __pyx_t_10;
+  PY_LONG_LONG __pyx_t_11;
+  PY_LONG_LONG __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
   __Pyx_RefNannySetupContext("costa_demod", 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":48
+  /* "src/urh/cythonext/signalFunctions.pyx":53
  *     cdef float phase_error
  *     cdef long long i
- *     cdef float costa_freq = 0             # <<<<<<<<<<<<<<
- *     cdef float costa_phase = 0
+ *     cdef float costa_freq = costa_state[0]             # <<<<<<<<<<<<<<
+ *     cdef float costa_phase = costa_state[1]
  *     cdef float complex nco_out
  */
-  __pyx_v_costa_freq = 0.0;
+  __pyx_t_1 = 0;
+  __pyx_v_costa_freq = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_costa_state.data) + __pyx_t_1)) )));
 
-  /* "src/urh/cythonext/signalFunctions.pyx":49
+  /* "src/urh/cythonext/signalFunctions.pyx":54
  *     cdef long long i
- *     cdef float costa_freq = 0
- *     cdef float costa_phase = 0             # <<<<<<<<<<<<<<
+ *     cdef float costa_freq = costa_state[0]
+ *     cdef float costa_phase = costa_state[1]             # <<<<<<<<<<<<<<
  *     cdef float complex nco_out
  *     cdef float complex nco_times_sample, c
  */
-  __pyx_v_costa_phase = 0.0;
+  __pyx_t_2 = 1;
+  __pyx_v_costa_phase = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_costa_state.data) + __pyx_t_2)) )));
 
-  /* "src/urh/cythonext/signalFunctions.pyx":55
+  /* "src/urh/cythonext/signalFunctions.pyx":60
  *     cdef float magnitude
  * 
  *     for i in range(0, num_samples):             # <<<<<<<<<<<<<<
  *         c = samples[i]
  *         real, imag = c.real, c.imag
  */
-  __pyx_t_1 = __pyx_v_num_samples;
-  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
-    __pyx_v_i = __pyx_t_2;
+  __pyx_t_3 = __pyx_v_num_samples;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":56
+    /* "src/urh/cythonext/signalFunctions.pyx":61
  * 
  *     for i in range(0, num_samples):
  *         c = samples[i]             # <<<<<<<<<<<<<<
  *         real, imag = c.real, c.imag
  *         magnitude = real * real + imag * imag
  */
-    __pyx_t_3 = __pyx_v_i;
-    __pyx_v_c = (*((__pyx_t_float_complex *) ( /* dim=0 */ ((char *) (((__pyx_t_float_complex *) __pyx_v_samples.data) + __pyx_t_3)) )));
+    __pyx_t_5 = __pyx_v_i;
+    __pyx_v_c = (*((__pyx_t_float_complex *) ( /* dim=0 */ ((char *) (((__pyx_t_float_complex *) __pyx_v_samples.data) + __pyx_t_5)) )));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":57
+    /* "src/urh/cythonext/signalFunctions.pyx":62
  *     for i in range(0, num_samples):
  *         c = samples[i]
  *         real, imag = c.real, c.imag             # <<<<<<<<<<<<<<
  *         magnitude = real * real + imag * imag
  *         if magnitude <= noise_sqrd:  # |c| <= mag_treshold
  */
-    __pyx_t_4 = __Pyx_CREAL(__pyx_v_c);
-    __pyx_t_5 = __Pyx_CIMAG(__pyx_v_c);
-    __pyx_v_real = __pyx_t_4;
-    __pyx_v_imag = __pyx_t_5;
+    __pyx_t_6 = __Pyx_CREAL(__pyx_v_c);
+    __pyx_t_7 = __Pyx_CIMAG(__pyx_v_c);
+    __pyx_v_real = __pyx_t_6;
+    __pyx_v_imag = __pyx_t_7;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":58
+    /* "src/urh/cythonext/signalFunctions.pyx":63
  *         c = samples[i]
  *         real, imag = c.real, c.imag
  *         magnitude = real * real + imag * imag             # <<<<<<<<<<<<<<
@@ -2690,27 +2767,27 @@ static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_mem
  */
     __pyx_v_magnitude = ((__pyx_v_real * __pyx_v_real) + (__pyx_v_imag * __pyx_v_imag));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":59
+    /* "src/urh/cythonext/signalFunctions.pyx":64
  *         real, imag = c.real, c.imag
  *         magnitude = real * real + imag * imag
  *         if magnitude <= noise_sqrd:  # |c| <= mag_treshold             # <<<<<<<<<<<<<<
  *             result[i] = NOISE_FSK_PSK
  *             continue
  */
-    __pyx_t_6 = ((__pyx_v_magnitude <= __pyx_v_noise_sqrd) != 0);
-    if (__pyx_t_6) {
+    __pyx_t_8 = ((__pyx_v_magnitude <= __pyx_v_noise_sqrd) != 0);
+    if (__pyx_t_8) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":60
+      /* "src/urh/cythonext/signalFunctions.pyx":65
  *         magnitude = real * real + imag * imag
  *         if magnitude <= noise_sqrd:  # |c| <= mag_treshold
  *             result[i] = NOISE_FSK_PSK             # <<<<<<<<<<<<<<
  *             continue
  * 
  */
-      __pyx_t_7 = __pyx_v_i;
-      *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_7)) )) = __pyx_v_3src_3urh_9cythonext_15signalFunctions_NOISE_FSK_PSK;
+      __pyx_t_9 = __pyx_v_i;
+      *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_9)) )) = __pyx_v_3src_3urh_9cythonext_15signalFunctions_NOISE_FSK_PSK;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":61
+      /* "src/urh/cythonext/signalFunctions.pyx":66
  *         if magnitude <= noise_sqrd:  # |c| <= mag_treshold
  *             result[i] = NOISE_FSK_PSK
  *             continue             # <<<<<<<<<<<<<<
@@ -2719,7 +2796,7 @@ static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_mem
  */
       goto __pyx_L3_continue;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":59
+      /* "src/urh/cythonext/signalFunctions.pyx":64
  *         real, imag = c.real, c.imag
  *         magnitude = real * real + imag * imag
  *         if magnitude <= noise_sqrd:  # |c| <= mag_treshold             # <<<<<<<<<<<<<<
@@ -2728,17 +2805,17 @@ static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_mem
  */
     }
 
-    /* "src/urh/cythonext/signalFunctions.pyx":65
+    /* "src/urh/cythonext/signalFunctions.pyx":70
  *         # # NCO Output
  *         #nco_out = np.exp(-costa_phase * 1j)
  *         nco_out = cos(-costa_phase) + imag_unit * sin(-costa_phase)             # <<<<<<<<<<<<<<
  * 
  *         nco_times_sample = nco_out * c
  */
-    __pyx_t_8 = __Pyx_c_sum_double(__pyx_t_double_complex_from_parts(cos((-__pyx_v_costa_phase)), 0), __Pyx_c_prod_double(__pyx_t_double_complex_from_parts(__Pyx_CREAL(__pyx_v_3src_3urh_9cythonext_15signalFunctions_imag_unit), __Pyx_CIMAG(__pyx_v_3src_3urh_9cythonext_15signalFunctions_imag_unit)), __pyx_t_double_complex_from_parts(sin((-__pyx_v_costa_phase)), 0)));
-    __pyx_v_nco_out = __pyx_t_float_complex_from_parts(__Pyx_CREAL(__pyx_t_8), __Pyx_CIMAG(__pyx_t_8));
+    __pyx_t_10 = __Pyx_c_sum_double(__pyx_t_double_complex_from_parts(cos((-__pyx_v_costa_phase)), 0), __Pyx_c_prod_double(__pyx_t_double_complex_from_parts(__Pyx_CREAL(__pyx_v_3src_3urh_9cythonext_15signalFunctions_imag_unit), __Pyx_CIMAG(__pyx_v_3src_3urh_9cythonext_15signalFunctions_imag_unit)), __pyx_t_double_complex_from_parts(sin((-__pyx_v_costa_phase)), 0)));
+    __pyx_v_nco_out = __pyx_t_float_complex_from_parts(__Pyx_CREAL(__pyx_t_10), __Pyx_CIMAG(__pyx_t_10));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":67
+    /* "src/urh/cythonext/signalFunctions.pyx":72
  *         nco_out = cos(-costa_phase) + imag_unit * sin(-costa_phase)
  * 
  *         nco_times_sample = nco_out * c             # <<<<<<<<<<<<<<
@@ -2747,7 +2824,7 @@ static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_mem
  */
     __pyx_v_nco_times_sample = __Pyx_c_prod_float(__pyx_v_nco_out, __pyx_v_c);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":68
+    /* "src/urh/cythonext/signalFunctions.pyx":73
  * 
  *         nco_times_sample = nco_out * c
  *         phase_error = nco_times_sample.imag * nco_times_sample.real             # <<<<<<<<<<<<<<
@@ -2756,7 +2833,7 @@ static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_mem
  */
     __pyx_v_phase_error = (__Pyx_CIMAG(__pyx_v_nco_times_sample) * __Pyx_CREAL(__pyx_v_nco_times_sample));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":69
+    /* "src/urh/cythonext/signalFunctions.pyx":74
  *         nco_times_sample = nco_out * c
  *         phase_error = nco_times_sample.imag * nco_times_sample.real
  *         costa_freq += costa_beta * phase_error             # <<<<<<<<<<<<<<
@@ -2765,7 +2842,7 @@ static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_mem
  */
     __pyx_v_costa_freq = (__pyx_v_costa_freq + (__pyx_v_costa_beta * __pyx_v_phase_error));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":70
+    /* "src/urh/cythonext/signalFunctions.pyx":75
  *         phase_error = nco_times_sample.imag * nco_times_sample.real
  *         costa_freq += costa_beta * phase_error
  *         costa_phase += costa_freq + costa_alpha * phase_error             # <<<<<<<<<<<<<<
@@ -2774,27 +2851,27 @@ static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_mem
  */
     __pyx_v_costa_phase = (__pyx_v_costa_phase + (__pyx_v_costa_freq + (__pyx_v_costa_alpha * __pyx_v_phase_error)));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":71
+    /* "src/urh/cythonext/signalFunctions.pyx":76
  *         costa_freq += costa_beta * phase_error
  *         costa_phase += costa_freq + costa_alpha * phase_error
  *         if qam:             # <<<<<<<<<<<<<<
  *             result[i] = magnitude * nco_times_sample.real
  *         else:
  */
-    __pyx_t_6 = (__pyx_v_qam != 0);
-    if (__pyx_t_6) {
+    __pyx_t_8 = (__pyx_v_qam != 0);
+    if (__pyx_t_8) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":72
+      /* "src/urh/cythonext/signalFunctions.pyx":77
  *         costa_phase += costa_freq + costa_alpha * phase_error
  *         if qam:
  *             result[i] = magnitude * nco_times_sample.real             # <<<<<<<<<<<<<<
  *         else:
  *             result[i] = nco_times_sample.real
  */
-      __pyx_t_9 = __pyx_v_i;
-      *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_9)) )) = (__pyx_v_magnitude * __Pyx_CREAL(__pyx_v_nco_times_sample));
+      __pyx_t_11 = __pyx_v_i;
+      *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_11)) )) = (__pyx_v_magnitude * __Pyx_CREAL(__pyx_v_nco_times_sample));
 
-      /* "src/urh/cythonext/signalFunctions.pyx":71
+      /* "src/urh/cythonext/signalFunctions.pyx":76
  *         costa_freq += costa_beta * phase_error
  *         costa_phase += costa_freq + costa_alpha * phase_error
  *         if qam:             # <<<<<<<<<<<<<<
@@ -2804,36 +2881,56 @@ static void __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__Pyx_mem
       goto __pyx_L6;
     }
 
-    /* "src/urh/cythonext/signalFunctions.pyx":74
+    /* "src/urh/cythonext/signalFunctions.pyx":79
  *             result[i] = magnitude * nco_times_sample.real
  *         else:
  *             result[i] = nco_times_sample.real             # <<<<<<<<<<<<<<
  * 
- * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type):
+ *     costa_state[0] = costa_freq
  */
     /*else*/ {
-      __pyx_t_5 = __Pyx_CREAL(__pyx_v_nco_times_sample);
-      __pyx_t_10 = __pyx_v_i;
-      *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_10)) )) = __pyx_t_5;
+      __pyx_t_7 = __Pyx_CREAL(__pyx_v_nco_times_sample);
+      __pyx_t_12 = __pyx_v_i;
+      *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_12)) )) = __pyx_t_7;
     }
     __pyx_L6:;
     __pyx_L3_continue:;
   }
 
+  /* "src/urh/cythonext/signalFunctions.pyx":81
+ *             result[i] = nco_times_sample.real
+ * 
+ *     costa_state[0] = costa_freq             # <<<<<<<<<<<<<<
+ *     costa_state[1] = costa_phase
+ * 
+ */
+  __pyx_t_13 = 0;
+  *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_costa_state.data) + __pyx_t_13)) )) = __pyx_v_costa_freq;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":82
+ * 
+ *     costa_state[0] = costa_freq
+ *     costa_state[1] = costa_phase             # <<<<<<<<<<<<<<
+ * 
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type):
+ */
+  __pyx_t_14 = 1;
+  *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_costa_state.data) + __pyx_t_14)) )) = __pyx_v_costa_phase;
+
   /* "src/urh/cythonext/signalFunctions.pyx":44
  * 
  * 
  * cdef void costa_demod(float complex[::1] samples, float[::1] result, float noise_sqrd,             # <<<<<<<<<<<<<<
- *                           float costa_alpha, float costa_beta, bool qam, long long num_samples):
- *     cdef float phase_error
+ *                           float costa_alpha, float costa_beta, bool qam, long long num_samples,
+ *                           float[::1] costa_state):
  */
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":76
- *             result[i] = nco_times_sample.real
+/* "src/urh/cythonext/signalFunctions.pyx":84
+ *     costa_state[1] = costa_phase
  * 
  * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type):             # <<<<<<<<<<<<<<
  *     if len(samples) <= 2:
@@ -2881,21 +2978,21 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
   PY_LONG_LONG __pyx_t_19;
   __Pyx_RefNannySetupContext("afp_demod", 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":77
+  /* "src/urh/cythonext/signalFunctions.pyx":85
  * 
  * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type):
  *     if len(samples) <= 2:             # <<<<<<<<<<<<<<
  *         return np.empty(len(samples), dtype=np.float32)
  * 
  */
-  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get___pyx_t_float_complex, (int (*)(char *, PyObject *)) __pyx_memview_set___pyx_t_float_complex, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get___pyx_t_float_complex, (int (*)(char *, PyObject *)) __pyx_memview_set___pyx_t_float_complex, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_3 = ((__pyx_t_2 <= 2) != 0);
   if (__pyx_t_3) {
 
-    /* "src/urh/cythonext/signalFunctions.pyx":78
+    /* "src/urh/cythonext/signalFunctions.pyx":86
  * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type):
  *     if len(samples) <= 2:
  *         return np.empty(len(samples), dtype=np.float32)             # <<<<<<<<<<<<<<
@@ -2903,42 +3000,42 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  *     cdef long long i, ns
  */
     __Pyx_XDECREF(((PyObject *)__pyx_r));
-    __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get___pyx_t_float_complex, (int (*)(char *, PyObject *)) __pyx_memview_set___pyx_t_float_complex, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get___pyx_t_float_complex, (int (*)(char *, PyObject *)) __pyx_memview_set___pyx_t_float_complex, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_GIVEREF(__pyx_t_1);
     PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_1);
     __pyx_t_1 = 0;
-    __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float32); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float32); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 78, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 86, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 78, __pyx_L1_error)
+    if (!(likely(((__pyx_t_7) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_7, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 86, __pyx_L1_error)
     __pyx_r = ((PyArrayObject *)__pyx_t_7);
     __pyx_t_7 = 0;
     goto __pyx_L0;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":77
+    /* "src/urh/cythonext/signalFunctions.pyx":85
  * 
  * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type):
  *     if len(samples) <= 2:             # <<<<<<<<<<<<<<
@@ -2947,7 +3044,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":81
+  /* "src/urh/cythonext/signalFunctions.pyx":89
  * 
  *     cdef long long i, ns
  *     cdef float complex tmp = 0             # <<<<<<<<<<<<<<
@@ -2956,7 +3053,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_tmp = __pyx_t_float_complex_from_parts(0, 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":82
+  /* "src/urh/cythonext/signalFunctions.pyx":90
  *     cdef long long i, ns
  *     cdef float complex tmp = 0
  *     cdef float complex c = 0             # <<<<<<<<<<<<<<
@@ -2965,7 +3062,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_c = __pyx_t_float_complex_from_parts(0, 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":84
+  /* "src/urh/cythonext/signalFunctions.pyx":92
  *     cdef float complex c = 0
  *     cdef float arg, noise_sqrd, complex_phase, prev_phase, NOISE
  *     cdef float real = 0             # <<<<<<<<<<<<<<
@@ -2974,7 +3071,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_real = 0.0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":85
+  /* "src/urh/cythonext/signalFunctions.pyx":93
  *     cdef float arg, noise_sqrd, complex_phase, prev_phase, NOISE
  *     cdef float real = 0
  *     cdef float imag = 0             # <<<<<<<<<<<<<<
@@ -2983,61 +3080,61 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_imag = 0.0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":86
+  /* "src/urh/cythonext/signalFunctions.pyx":94
  *     cdef float real = 0
  *     cdef float imag = 0
  *     ns = len(samples)             # <<<<<<<<<<<<<<
  * 
  *     cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")
  */
-  __pyx_t_7 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get___pyx_t_float_complex, (int (*)(char *, PyObject *)) __pyx_memview_set___pyx_t_float_complex, 0);; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_7 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get___pyx_t_float_complex, (int (*)(char *, PyObject *)) __pyx_memview_set___pyx_t_float_complex, 0);; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 94, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_2 = PyObject_Length(__pyx_t_7); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(__pyx_t_7); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 94, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   __pyx_v_ns = __pyx_t_2;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":88
+  /* "src/urh/cythonext/signalFunctions.pyx":96
  *     ns = len(samples)
  * 
  *     cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")             # <<<<<<<<<<<<<<
  *     cdef float costa_freq = 0
  *     cdef float costa_phase = 0
  */
-  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_ns); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_ns); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_7);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_7);
   __pyx_t_7 = 0;
-  __pyx_t_7 = PyDict_New(); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_7 = PyDict_New(); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 88, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_order, __pyx_n_u_C) < 0) __PYX_ERR(0, 88, __pyx_L1_error)
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, __pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 88, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_order, __pyx_n_u_C) < 0) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, __pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_dc_float(__pyx_t_6);
-  if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 88, __pyx_L1_error)
+  if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_v_result = __pyx_t_8;
   __pyx_t_8.memview = NULL;
   __pyx_t_8.data = NULL;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":89
+  /* "src/urh/cythonext/signalFunctions.pyx":97
  * 
  *     cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")
  *     cdef float costa_freq = 0             # <<<<<<<<<<<<<<
@@ -3046,7 +3143,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_costa_freq = 0.0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":90
+  /* "src/urh/cythonext/signalFunctions.pyx":98
  *     cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")
  *     cdef float costa_freq = 0
  *     cdef float costa_phase = 0             # <<<<<<<<<<<<<<
@@ -3055,7 +3152,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_costa_phase = 0.0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":91
+  /* "src/urh/cythonext/signalFunctions.pyx":99
  *     cdef float costa_freq = 0
  *     cdef float costa_phase = 0
  *     cdef complex nco_out = 0             # <<<<<<<<<<<<<<
@@ -3064,7 +3161,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_nco_out = __pyx_t_double_complex_from_parts(0, 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":95
+  /* "src/urh/cythonext/signalFunctions.pyx":103
  *     cdef float costa_alpha, costa_beta
  *     cdef complex nco_times_sample
  *     cdef float magnitude = 0             # <<<<<<<<<<<<<<
@@ -3073,7 +3170,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_magnitude = 0.0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":99
+  /* "src/urh/cythonext/signalFunctions.pyx":107
  *     # Atan2 liefert Werte im Bereich von -Pi bis Pi
  *     # Wir nutzen die Magic Constant NOISE_FSK_PSK um Rauschen abzuschneiden
  *     noise_sqrd = noise_mag * noise_mag             # <<<<<<<<<<<<<<
@@ -3082,7 +3179,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_noise_sqrd = (__pyx_v_noise_mag * __pyx_v_noise_mag);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":100
+  /* "src/urh/cythonext/signalFunctions.pyx":108
  *     # Wir nutzen die Magic Constant NOISE_FSK_PSK um Rauschen abzuschneiden
  *     noise_sqrd = noise_mag * noise_mag
  *     NOISE = get_noise_for_mod_type(mod_type)             # <<<<<<<<<<<<<<
@@ -3091,7 +3188,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_NOISE = __pyx_f_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(__pyx_v_mod_type, 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":101
+  /* "src/urh/cythonext/signalFunctions.pyx":109
  *     noise_sqrd = noise_mag * noise_mag
  *     NOISE = get_noise_for_mod_type(mod_type)
  *     result[0] = NOISE             # <<<<<<<<<<<<<<
@@ -3101,7 +3198,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
   __pyx_t_9 = 0;
   *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_9)) )) = __pyx_v_NOISE;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":103
+  /* "src/urh/cythonext/signalFunctions.pyx":111
  *     result[0] = NOISE
  * 
  *     cdef bool qam = False             # <<<<<<<<<<<<<<
@@ -3110,7 +3207,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
   __pyx_v_qam = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":105
+  /* "src/urh/cythonext/signalFunctions.pyx":113
  *     cdef bool qam = False
  * 
  *     if mod_type == 2 or mod_type == 3: # PSK or QAM             # <<<<<<<<<<<<<<
@@ -3121,7 +3218,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
     case 2:
     case 3:
 
-    /* "src/urh/cythonext/signalFunctions.pyx":106
+    /* "src/urh/cythonext/signalFunctions.pyx":114
  * 
  *     if mod_type == 2 or mod_type == 3: # PSK or QAM
  *         if mod_type == 3:             # <<<<<<<<<<<<<<
@@ -3131,7 +3228,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
     __pyx_t_3 = ((__pyx_v_mod_type == 3) != 0);
     if (__pyx_t_3) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":107
+      /* "src/urh/cythonext/signalFunctions.pyx":115
  *     if mod_type == 2 or mod_type == 3: # PSK or QAM
  *         if mod_type == 3:
  *             qam = True             # <<<<<<<<<<<<<<
@@ -3140,7 +3237,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
       __pyx_v_qam = 1;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":106
+      /* "src/urh/cythonext/signalFunctions.pyx":114
  * 
  *     if mod_type == 2 or mod_type == 3: # PSK or QAM
  *         if mod_type == 3:             # <<<<<<<<<<<<<<
@@ -3149,34 +3246,58 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
     }
 
-    /* "src/urh/cythonext/signalFunctions.pyx":109
+    /* "src/urh/cythonext/signalFunctions.pyx":117
  *             qam = True
  * 
  *         costa_alpha = calc_costa_alpha(<float>(2 * M_PI / 100))             # <<<<<<<<<<<<<<
  *         costa_beta = calc_costa_beta(<float>(2 * M_PI / 100))
- *         costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns)
+ *         costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns, np.zeros(2, dtype=np.float32))
  */
     __pyx_v_costa_alpha = __pyx_f_3src_3urh_9cythonext_15signalFunctions_calc_costa_alpha(((float)((2.0 * M_PI) / 100.0)), NULL);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":110
+    /* "src/urh/cythonext/signalFunctions.pyx":118
  * 
  *         costa_alpha = calc_costa_alpha(<float>(2 * M_PI / 100))
  *         costa_beta = calc_costa_beta(<float>(2 * M_PI / 100))             # <<<<<<<<<<<<<<
- *         costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns)
+ *         costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns, np.zeros(2, dtype=np.float32))
  * 
  */
     __pyx_v_costa_beta = __pyx_f_3src_3urh_9cythonext_15signalFunctions_calc_costa_beta(((float)((2.0 * M_PI) / 100.0)), NULL);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":111
+    /* "src/urh/cythonext/signalFunctions.pyx":119
  *         costa_alpha = calc_costa_alpha(<float>(2 * M_PI / 100))
  *         costa_beta = calc_costa_beta(<float>(2 * M_PI / 100))
- *         costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns)             # <<<<<<<<<<<<<<
+ *         costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns, np.zeros(2, dtype=np.float32))             # <<<<<<<<<<<<<<
  * 
  *     else:
  */
-    __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__pyx_v_samples, __pyx_v_result, __pyx_v_noise_sqrd, __pyx_v_costa_alpha, __pyx_v_costa_beta, __pyx_v_qam, __pyx_v_ns);
+    __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_zeros); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_float32); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_1) < 0) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_tuple__3, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_dc_float(__pyx_t_1);
+    if (unlikely(!__pyx_t_8.memview)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__pyx_v_samples, __pyx_v_result, __pyx_v_noise_sqrd, __pyx_v_costa_alpha, __pyx_v_costa_beta, __pyx_v_qam, __pyx_v_ns, __pyx_t_8);
+    __PYX_XDEC_MEMVIEW(&__pyx_t_8, 1);
+    __pyx_t_8.memview = NULL;
+    __pyx_t_8.data = NULL;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":105
+    /* "src/urh/cythonext/signalFunctions.pyx":113
  *     cdef bool qam = False
  * 
  *     if mod_type == 2 or mod_type == 3: # PSK or QAM             # <<<<<<<<<<<<<<
@@ -3186,7 +3307,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
     break;
     default:
 
-    /* "src/urh/cythonext/signalFunctions.pyx":114
+    /* "src/urh/cythonext/signalFunctions.pyx":122
  * 
  *     else:
  *         for i in prange(1, ns, nogil=True, schedule='static'):             # <<<<<<<<<<<<<<
@@ -3226,7 +3347,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                               __pyx_v_magnitude = ((float)__PYX_NAN());
                               __pyx_v_real = ((float)__PYX_NAN());
 
-                              /* "src/urh/cythonext/signalFunctions.pyx":115
+                              /* "src/urh/cythonext/signalFunctions.pyx":123
  *     else:
  *         for i in prange(1, ns, nogil=True, schedule='static'):
  *             c = samples[i]             # <<<<<<<<<<<<<<
@@ -3236,7 +3357,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                               __pyx_t_13 = __pyx_v_i;
                               __pyx_v_c = (*((__pyx_t_float_complex *) ( /* dim=0 */ ((char *) (((__pyx_t_float_complex *) __pyx_v_samples.data) + __pyx_t_13)) )));
 
-                              /* "src/urh/cythonext/signalFunctions.pyx":116
+                              /* "src/urh/cythonext/signalFunctions.pyx":124
  *         for i in prange(1, ns, nogil=True, schedule='static'):
  *             c = samples[i]
  *             real, imag = c.real, c.imag             # <<<<<<<<<<<<<<
@@ -3248,7 +3369,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                               __pyx_v_real = __pyx_t_14;
                               __pyx_v_imag = __pyx_t_15;
 
-                              /* "src/urh/cythonext/signalFunctions.pyx":117
+                              /* "src/urh/cythonext/signalFunctions.pyx":125
  *             c = samples[i]
  *             real, imag = c.real, c.imag
  *             magnitude = real * real + imag * imag             # <<<<<<<<<<<<<<
@@ -3257,7 +3378,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
                               __pyx_v_magnitude = ((__pyx_v_real * __pyx_v_real) + (__pyx_v_imag * __pyx_v_imag));
 
-                              /* "src/urh/cythonext/signalFunctions.pyx":118
+                              /* "src/urh/cythonext/signalFunctions.pyx":126
  *             real, imag = c.real, c.imag
  *             magnitude = real * real + imag * imag
  *             if magnitude <= noise_sqrd:  # |c| <= mag_treshold             # <<<<<<<<<<<<<<
@@ -3267,7 +3388,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                               __pyx_t_3 = ((__pyx_v_magnitude <= __pyx_v_noise_sqrd) != 0);
                               if (__pyx_t_3) {
 
-                                /* "src/urh/cythonext/signalFunctions.pyx":119
+                                /* "src/urh/cythonext/signalFunctions.pyx":127
  *             magnitude = real * real + imag * imag
  *             if magnitude <= noise_sqrd:  # |c| <= mag_treshold
  *                 result[i] = NOISE             # <<<<<<<<<<<<<<
@@ -3277,7 +3398,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                                 __pyx_t_16 = __pyx_v_i;
                                 *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_16)) )) = __pyx_v_NOISE;
 
-                                /* "src/urh/cythonext/signalFunctions.pyx":120
+                                /* "src/urh/cythonext/signalFunctions.pyx":128
  *             if magnitude <= noise_sqrd:  # |c| <= mag_treshold
  *                 result[i] = NOISE
  *                 continue             # <<<<<<<<<<<<<<
@@ -3286,7 +3407,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
                                 goto __pyx_L8_continue;
 
-                                /* "src/urh/cythonext/signalFunctions.pyx":118
+                                /* "src/urh/cythonext/signalFunctions.pyx":126
  *             real, imag = c.real, c.imag
  *             magnitude = real * real + imag * imag
  *             if magnitude <= noise_sqrd:  # |c| <= mag_treshold             # <<<<<<<<<<<<<<
@@ -3295,7 +3416,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
  */
                               }
 
-                              /* "src/urh/cythonext/signalFunctions.pyx":122
+                              /* "src/urh/cythonext/signalFunctions.pyx":130
  *                 continue
  * 
  *             if mod_type == 0:  # ASK             # <<<<<<<<<<<<<<
@@ -3305,7 +3426,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                               __pyx_t_3 = ((__pyx_v_mod_type == 0) != 0);
                               if (__pyx_t_3) {
 
-                                /* "src/urh/cythonext/signalFunctions.pyx":123
+                                /* "src/urh/cythonext/signalFunctions.pyx":131
  * 
  *             if mod_type == 0:  # ASK
  *                 result[i] = magnitude             # <<<<<<<<<<<<<<
@@ -3315,7 +3436,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                                 __pyx_t_17 = __pyx_v_i;
                                 *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_17)) )) = __pyx_v_magnitude;
 
-                                /* "src/urh/cythonext/signalFunctions.pyx":122
+                                /* "src/urh/cythonext/signalFunctions.pyx":130
  *                 continue
  * 
  *             if mod_type == 0:  # ASK             # <<<<<<<<<<<<<<
@@ -3325,7 +3446,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                                 goto __pyx_L13;
                               }
 
-                              /* "src/urh/cythonext/signalFunctions.pyx":124
+                              /* "src/urh/cythonext/signalFunctions.pyx":132
  *             if mod_type == 0:  # ASK
  *                 result[i] = magnitude
  *             elif mod_type == 1:  # FSK             # <<<<<<<<<<<<<<
@@ -3335,7 +3456,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                               __pyx_t_3 = ((__pyx_v_mod_type == 1) != 0);
                               if (__pyx_t_3) {
 
-                                /* "src/urh/cythonext/signalFunctions.pyx":125
+                                /* "src/urh/cythonext/signalFunctions.pyx":133
  *                 result[i] = magnitude
  *             elif mod_type == 1:  # FSK
  *                 tmp = samples[i - 1].conjugate() * c             # <<<<<<<<<<<<<<
@@ -3345,7 +3466,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                                 __pyx_t_18 = (__pyx_v_i - 1);
                                 __pyx_v_tmp = __Pyx_c_prod_float(__Pyx_c_conj_float((*((__pyx_t_float_complex *) ( /* dim=0 */ ((char *) (((__pyx_t_float_complex *) __pyx_v_samples.data) + __pyx_t_18)) )))), __pyx_v_c);
 
-                                /* "src/urh/cythonext/signalFunctions.pyx":126
+                                /* "src/urh/cythonext/signalFunctions.pyx":134
  *             elif mod_type == 1:  # FSK
  *                 tmp = samples[i - 1].conjugate() * c
  *                 result[i] = atan2(tmp.imag, tmp.real)  # Freq             # <<<<<<<<<<<<<<
@@ -3355,7 +3476,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
                                 __pyx_t_19 = __pyx_v_i;
                                 *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_19)) )) = atan2(__Pyx_CIMAG(__pyx_v_tmp), __Pyx_CREAL(__pyx_v_tmp));
 
-                                /* "src/urh/cythonext/signalFunctions.pyx":124
+                                /* "src/urh/cythonext/signalFunctions.pyx":132
  *             if mod_type == 0:  # ASK
  *                 result[i] = magnitude
  *             elif mod_type == 1:  # FSK             # <<<<<<<<<<<<<<
@@ -3381,7 +3502,7 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
           #endif
         }
 
-        /* "src/urh/cythonext/signalFunctions.pyx":114
+        /* "src/urh/cythonext/signalFunctions.pyx":122
  * 
  *     else:
  *         for i in prange(1, ns, nogil=True, schedule='static'):             # <<<<<<<<<<<<<<
@@ -3401,74 +3522,74 @@ static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(_
     break;
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":128
+  /* "src/urh/cythonext/signalFunctions.pyx":136
  *                 result[i] = atan2(tmp.imag, tmp.real)  # Freq
  * 
  *     return np.asarray(result)             # <<<<<<<<<<<<<<
  * 
- * cpdef unsigned long long find_signal_start(float[::1] demod_samples, int mod_type):
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,
  */
   __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 128, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_asarray); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 128, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __pyx_memoryview_fromslice(__pyx_v_result, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_asarray); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 136, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_1 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_1)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_v_result, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
     }
   }
-  if (!__pyx_t_1) {
-    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 128, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_GOTREF(__pyx_t_6);
+  if (!__pyx_t_5) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
   } else {
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_7};
-      __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 128, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (PyFunction_Check(__pyx_t_7)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_6};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_7};
-      __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 128, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_6};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     } else
     #endif
     {
-      __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 128, __pyx_L1_error)
+      __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 136, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1); __pyx_t_1 = NULL;
-      __Pyx_GIVEREF(__pyx_t_7);
-      PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_t_7);
-      __pyx_t_7 = 0;
-      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 128, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
   }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 128, __pyx_L1_error)
-  __pyx_r = ((PyArrayObject *)__pyx_t_6);
-  __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 136, __pyx_L1_error)
+  __pyx_r = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":76
- *             result[i] = nco_times_sample.real
+  /* "src/urh/cythonext/signalFunctions.pyx":84
+ *     costa_state[1] = costa_phase
  * 
  * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type):             # <<<<<<<<<<<<<<
  *     if len(samples) <= 2:
@@ -3522,16 +3643,16 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_3afp_demod(PyOb
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_noise_mag)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("afp_demod", 1, 3, 3, 1); __PYX_ERR(0, 76, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("afp_demod", 1, 3, 3, 1); __PYX_ERR(0, 84, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("afp_demod", 1, 3, 3, 2); __PYX_ERR(0, 76, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("afp_demod", 1, 3, 3, 2); __PYX_ERR(0, 84, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "afp_demod") < 0)) __PYX_ERR(0, 76, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "afp_demod") < 0)) __PYX_ERR(0, 84, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -3540,13 +3661,13 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_3afp_demod(PyOb
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
     }
-    __pyx_v_samples = __Pyx_PyObject_to_MemoryviewSlice_dc___pyx_t_float_complex(values[0]); if (unlikely(!__pyx_v_samples.memview)) __PYX_ERR(0, 76, __pyx_L3_error)
-    __pyx_v_noise_mag = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_noise_mag == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 76, __pyx_L3_error)
-    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 76, __pyx_L3_error)
+    __pyx_v_samples = __Pyx_PyObject_to_MemoryviewSlice_dc___pyx_t_float_complex(values[0]); if (unlikely(!__pyx_v_samples.memview)) __PYX_ERR(0, 84, __pyx_L3_error)
+    __pyx_v_noise_mag = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_noise_mag == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L3_error)
+    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("afp_demod", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 76, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("afp_demod", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 84, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.afp_demod", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3565,7 +3686,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_2afp_demod(CYTH
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("afp_demod", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(__pyx_v_samples, __pyx_v_noise_mag, __pyx_v_mod_type, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_t_1 = ((PyObject *)__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod(__pyx_v_samples, __pyx_v_noise_mag, __pyx_v_mod_type, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3583,439 +3704,2550 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_2afp_demod(CYTH
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":130
+/* "src/urh/cythonext/signalFunctions.pyx":138
  *     return np.asarray(result)
  * 
- * cpdef unsigned long long find_signal_start(float[::1] demod_samples, int mod_type):             # <<<<<<<<<<<<<<
- * 
- *     cdef unsigned long long i, ns, l
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,             # <<<<<<<<<<<<<<
+ *                                                         float[::1] costa_state, bool has_predecessor=False,
+ *                                                         float complex predecessor=0):
  */
 
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_5find_signal_start(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_start(__Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type, CYTHON_UNUSED int __pyx_skip_dispatch) {
-  unsigned PY_LONG_LONG __pyx_v_i;
-  unsigned PY_LONG_LONG __pyx_v_ns;
-  unsigned PY_LONG_LONG __pyx_v_l;
-  float __pyx_v_dsample;
-  int __pyx_v_has_oversteuern;
-  int __pyx_v_conseq_noise;
-  int __pyx_v_conseq_not_noise;
-  int __pyx_v_behind_oversteuern;
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_5afp_demod_block(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyArrayObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod_block(__Pyx_memviewslice __pyx_v_samples, float __pyx_v_noise_mag, int __pyx_v_mod_type, __Pyx_memviewslice __pyx_v_costa_state, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_afp_demod_block *__pyx_optional_args) {
+
+  /* "src/urh/cythonext/signalFunctions.pyx":139
+ * 
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,
+ *                                                         float[::1] costa_state, bool has_predecessor=False,             # <<<<<<<<<<<<<<
+ *                                                         float complex predecessor=0):
+ *     """
+ */
+  bool __pyx_v_has_predecessor = ((bool)0);
+  __pyx_t_float_complex __pyx_v_predecessor = __pyx_k__4;
+  PY_LONG_LONG __pyx_v_i;
+  PY_LONG_LONG __pyx_v_ns;
+  __pyx_t_float_complex __pyx_v_tmp;
+  __pyx_t_float_complex __pyx_v_c;
+  float __pyx_v_noise_sqrd;
   float __pyx_v_NOISE;
-  unsigned PY_LONG_LONG __pyx_r;
+  float __pyx_v_real;
+  float __pyx_v_imag;
+  float __pyx_v_magnitude;
+  bool __pyx_v_qam;
+  __Pyx_memviewslice __pyx_v_result = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyArrayObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   Py_ssize_t __pyx_t_2;
-  int __pyx_t_3;
-  unsigned PY_LONG_LONG __pyx_t_4;
-  unsigned PY_LONG_LONG __pyx_t_5;
-  unsigned PY_LONG_LONG __pyx_t_6;
-  unsigned PY_LONG_LONG __pyx_t_7;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
   int __pyx_t_8;
-  __Pyx_RefNannySetupContext("find_signal_start", 0);
-
-  /* "src/urh/cythonext/signalFunctions.pyx":135
- *     cdef float dsample
- *     cdef int has_oversteuern, conseq_noise, conseq_not_noise, behind_oversteuern
- *     cdef float NOISE = get_noise_for_mod_type(mod_type)             # <<<<<<<<<<<<<<
- * 
+  Py_ssize_t __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  PY_LONG_LONG __pyx_t_15;
+  PY_LONG_LONG __pyx_t_16;
+  PY_LONG_LONG __pyx_t_17;
+  PY_LONG_LONG __pyx_t_18;
+  float __pyx_t_19;
+  float __pyx_t_20;
+  PY_LONG_LONG __pyx_t_21;
+  PY_LONG_LONG __pyx_t_22;
+  PY_LONG_LONG __pyx_t_23;
+  PY_LONG_LONG __pyx_t_24;
+  PY_LONG_LONG __pyx_t_25;
+  __Pyx_RefNannySetupContext("afp_demod_block", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_has_predecessor = __pyx_optional_args->has_predecessor;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_predecessor = __pyx_optional_args->predecessor;
+      }
+    }
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":150
+ *     :param predecessor: last sample of the previous block, needed for FSK
+ *     """
+ *     cdef long long i, ns = len(samples)             # <<<<<<<<<<<<<<
+ *     cdef float complex tmp, c
+ *     cdef float noise_sqrd = noise_mag * noise_mag
+ */
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get___pyx_t_float_complex, (int (*)(char *, PyObject *)) __pyx_memview_set___pyx_t_float_complex, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 150, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ns = __pyx_t_2;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":152
+ *     cdef long long i, ns = len(samples)
+ *     cdef float complex tmp, c
+ *     cdef float noise_sqrd = noise_mag * noise_mag             # <<<<<<<<<<<<<<
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)
+ *     cdef float real, imag, magnitude
+ */
+  __pyx_v_noise_sqrd = (__pyx_v_noise_mag * __pyx_v_noise_mag);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":153
+ *     cdef float complex tmp, c
+ *     cdef float noise_sqrd = noise_mag * noise_mag
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)             # <<<<<<<<<<<<<<
+ *     cdef float real, imag, magnitude
+ *     cdef bool qam = mod_type == 3
+ */
+  __pyx_v_NOISE = __pyx_f_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(__pyx_v_mod_type, 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":155
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)
+ *     cdef float real, imag, magnitude
+ *     cdef bool qam = mod_type == 3             # <<<<<<<<<<<<<<
+ * 
+ *     cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")
+ */
+  __pyx_v_qam = (__pyx_v_mod_type == 3);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":157
+ *     cdef bool qam = mod_type == 3
+ * 
+ *     cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")             # <<<<<<<<<<<<<<
+ *     if ns == 0:
+ *         return np.asarray(result)
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_ns); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_float32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_order, __pyx_n_u_C) < 0) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_dc_float(__pyx_t_6);
+  if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_result = __pyx_t_7;
+  __pyx_t_7.memview = NULL;
+  __pyx_t_7.data = NULL;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":158
+ * 
+ *     cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")
+ *     if ns == 0:             # <<<<<<<<<<<<<<
+ *         return np.asarray(result)
+ * 
+ */
+  __pyx_t_8 = ((__pyx_v_ns == 0) != 0);
+  if (__pyx_t_8) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":159
+ *     cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")
+ *     if ns == 0:
+ *         return np.asarray(result)             # <<<<<<<<<<<<<<
+ * 
+ *     if mod_type == 2 or mod_type == 3: # PSK or QAM
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_asarray); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 159, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_result, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    if (!__pyx_t_3) {
+      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_1};
+        __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_1};
+        __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      } else
+      #endif
+      {
+        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 159, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
+        __Pyx_GIVEREF(__pyx_t_1);
+        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_1);
+        __pyx_t_1 = 0;
+        __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 159, __pyx_L1_error)
+    __pyx_r = ((PyArrayObject *)__pyx_t_6);
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":158
+ * 
+ *     cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")
+ *     if ns == 0:             # <<<<<<<<<<<<<<
+ *         return np.asarray(result)
+ * 
+ */
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":161
+ *         return np.asarray(result)
+ * 
+ *     if mod_type == 2 or mod_type == 3: # PSK or QAM             # <<<<<<<<<<<<<<
+ *         costa_demod(samples, result, noise_sqrd, calc_costa_alpha(<float>(2 * M_PI / 100)),
+ *                     calc_costa_beta(<float>(2 * M_PI / 100)), qam, ns, costa_state)
+ */
+  switch (__pyx_v_mod_type) {
+    case 2:
+    case 3:
+
+    /* "src/urh/cythonext/signalFunctions.pyx":162
+ * 
+ *     if mod_type == 2 or mod_type == 3: # PSK or QAM
+ *         costa_demod(samples, result, noise_sqrd, calc_costa_alpha(<float>(2 * M_PI / 100)),             # <<<<<<<<<<<<<<
+ *                     calc_costa_beta(<float>(2 * M_PI / 100)), qam, ns, costa_state)
+ *         return np.asarray(result)
+ */
+    __pyx_f_3src_3urh_9cythonext_15signalFunctions_costa_demod(__pyx_v_samples, __pyx_v_result, __pyx_v_noise_sqrd, __pyx_f_3src_3urh_9cythonext_15signalFunctions_calc_costa_alpha(((float)((2.0 * M_PI) / 100.0)), NULL), __pyx_f_3src_3urh_9cythonext_15signalFunctions_calc_costa_beta(((float)((2.0 * M_PI) / 100.0)), NULL), __pyx_v_qam, __pyx_v_ns, __pyx_v_costa_state);
+
+    /* "src/urh/cythonext/signalFunctions.pyx":164
+ *         costa_demod(samples, result, noise_sqrd, calc_costa_alpha(<float>(2 * M_PI / 100)),
+ *                     calc_costa_beta(<float>(2 * M_PI / 100)), qam, ns, costa_state)
+ *         return np.asarray(result)             # <<<<<<<<<<<<<<
+ * 
+ *     c = samples[0]
+ */
+    __Pyx_XDECREF(((PyObject *)__pyx_r));
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_asarray); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 164, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __pyx_memoryview_fromslice(__pyx_v_result, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_1)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_1);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    if (!__pyx_t_1) {
+      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+    } else {
+      #if CYTHON_FAST_PYCALL
+      if (PyFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_4};
+        __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      } else
+      #endif
+      #if CYTHON_FAST_PYCCALL
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_4};
+        __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      } else
+      #endif
+      {
+        __pyx_t_3 = PyTuple_New(1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1); __pyx_t_1 = NULL;
+        __Pyx_GIVEREF(__pyx_t_4);
+        PyTuple_SET_ITEM(__pyx_t_3, 0+1, __pyx_t_4);
+        __pyx_t_4 = 0;
+        __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_3, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 164, __pyx_L1_error)
+    __pyx_r = ((PyArrayObject *)__pyx_t_6);
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":161
+ *         return np.asarray(result)
+ * 
+ *     if mod_type == 2 or mod_type == 3: # PSK or QAM             # <<<<<<<<<<<<<<
+ *         costa_demod(samples, result, noise_sqrd, calc_costa_alpha(<float>(2 * M_PI / 100)),
+ *                     calc_costa_beta(<float>(2 * M_PI / 100)), qam, ns, costa_state)
+ */
+    break;
+    default: break;
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":166
+ *         return np.asarray(result)
+ * 
+ *     c = samples[0]             # <<<<<<<<<<<<<<
+ *     magnitude = c.real * c.real + c.imag * c.imag
+ *     if not has_predecessor or magnitude <= noise_sqrd:
+ */
+  __pyx_t_9 = 0;
+  __pyx_v_c = (*((__pyx_t_float_complex *) ( /* dim=0 */ ((char *) (((__pyx_t_float_complex *) __pyx_v_samples.data) + __pyx_t_9)) )));
+
+  /* "src/urh/cythonext/signalFunctions.pyx":167
+ * 
+ *     c = samples[0]
+ *     magnitude = c.real * c.real + c.imag * c.imag             # <<<<<<<<<<<<<<
+ *     if not has_predecessor or magnitude <= noise_sqrd:
+ *         result[0] = NOISE
+ */
+  __pyx_v_magnitude = ((__Pyx_CREAL(__pyx_v_c) * __Pyx_CREAL(__pyx_v_c)) + (__Pyx_CIMAG(__pyx_v_c) * __Pyx_CIMAG(__pyx_v_c)));
+
+  /* "src/urh/cythonext/signalFunctions.pyx":168
+ *     c = samples[0]
+ *     magnitude = c.real * c.real + c.imag * c.imag
+ *     if not has_predecessor or magnitude <= noise_sqrd:             # <<<<<<<<<<<<<<
+ *         result[0] = NOISE
+ *     elif mod_type == 0:
+ */
+  __pyx_t_10 = ((!(__pyx_v_has_predecessor != 0)) != 0);
+  if (!__pyx_t_10) {
+  } else {
+    __pyx_t_8 = __pyx_t_10;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_10 = ((__pyx_v_magnitude <= __pyx_v_noise_sqrd) != 0);
+  __pyx_t_8 = __pyx_t_10;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_8) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":169
+ *     magnitude = c.real * c.real + c.imag * c.imag
+ *     if not has_predecessor or magnitude <= noise_sqrd:
+ *         result[0] = NOISE             # <<<<<<<<<<<<<<
+ *     elif mod_type == 0:
+ *         result[0] = magnitude
+ */
+    __pyx_t_11 = 0;
+    *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_11)) )) = __pyx_v_NOISE;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":168
+ *     c = samples[0]
+ *     magnitude = c.real * c.real + c.imag * c.imag
+ *     if not has_predecessor or magnitude <= noise_sqrd:             # <<<<<<<<<<<<<<
+ *         result[0] = NOISE
+ *     elif mod_type == 0:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":170
+ *     if not has_predecessor or magnitude <= noise_sqrd:
+ *         result[0] = NOISE
+ *     elif mod_type == 0:             # <<<<<<<<<<<<<<
+ *         result[0] = magnitude
+ *     elif mod_type == 1:
+ */
+  __pyx_t_8 = ((__pyx_v_mod_type == 0) != 0);
+  if (__pyx_t_8) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":171
+ *         result[0] = NOISE
+ *     elif mod_type == 0:
+ *         result[0] = magnitude             # <<<<<<<<<<<<<<
+ *     elif mod_type == 1:
+ *         tmp = predecessor.conjugate() * c
+ */
+    __pyx_t_12 = 0;
+    *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_12)) )) = __pyx_v_magnitude;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":170
+ *     if not has_predecessor or magnitude <= noise_sqrd:
+ *         result[0] = NOISE
+ *     elif mod_type == 0:             # <<<<<<<<<<<<<<
+ *         result[0] = magnitude
+ *     elif mod_type == 1:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":172
+ *     elif mod_type == 0:
+ *         result[0] = magnitude
+ *     elif mod_type == 1:             # <<<<<<<<<<<<<<
+ *         tmp = predecessor.conjugate() * c
+ *         result[0] = atan2(tmp.imag, tmp.real)
+ */
+  __pyx_t_8 = ((__pyx_v_mod_type == 1) != 0);
+  if (__pyx_t_8) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":173
+ *         result[0] = magnitude
+ *     elif mod_type == 1:
+ *         tmp = predecessor.conjugate() * c             # <<<<<<<<<<<<<<
+ *         result[0] = atan2(tmp.imag, tmp.real)
+ *     else:
+ */
+    __pyx_v_tmp = __Pyx_c_prod_float(__Pyx_c_conj_float(__pyx_v_predecessor), __pyx_v_c);
+
+    /* "src/urh/cythonext/signalFunctions.pyx":174
+ *     elif mod_type == 1:
+ *         tmp = predecessor.conjugate() * c
+ *         result[0] = atan2(tmp.imag, tmp.real)             # <<<<<<<<<<<<<<
+ *     else:
+ *         result[0] = NOISE
+ */
+    __pyx_t_13 = 0;
+    *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_13)) )) = atan2(__Pyx_CIMAG(__pyx_v_tmp), __Pyx_CREAL(__pyx_v_tmp));
+
+    /* "src/urh/cythonext/signalFunctions.pyx":172
+ *     elif mod_type == 0:
+ *         result[0] = magnitude
+ *     elif mod_type == 1:             # <<<<<<<<<<<<<<
+ *         tmp = predecessor.conjugate() * c
+ *         result[0] = atan2(tmp.imag, tmp.real)
+ */
+    goto __pyx_L4;
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":176
+ *         result[0] = atan2(tmp.imag, tmp.real)
+ *     else:
+ *         result[0] = NOISE             # <<<<<<<<<<<<<<
+ * 
+ *     for i in prange(1, ns, nogil=True, schedule='static'):
+ */
+  /*else*/ {
+    __pyx_t_14 = 0;
+    *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_14)) )) = __pyx_v_NOISE;
+  }
+  __pyx_L4:;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":178
+ *         result[0] = NOISE
+ * 
+ *     for i in prange(1, ns, nogil=True, schedule='static'):             # <<<<<<<<<<<<<<
+ *         c = samples[i]
+ *         real, imag = c.real, c.imag
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+        __pyx_t_15 = __pyx_v_ns;
+        if (1 == 0) abort();
+        {
+            #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                #undef likely
+                #undef unlikely
+                #define likely(x)   (x)
+                #define unlikely(x) (x)
+            #endif
+            __pyx_t_17 = (__pyx_t_15 - 1 + 1 - 1/abs(1)) / 1;
+            if (__pyx_t_17 > 0)
+            {
+                #ifdef _OPENMP
+                #pragma omp parallel private(__pyx_t_18, __pyx_t_19, __pyx_t_20, __pyx_t_21, __pyx_t_22, __pyx_t_23, __pyx_t_24, __pyx_t_25, __pyx_t_8)
+                #endif /* _OPENMP */
+                {
+                    #ifdef _OPENMP
+                    #pragma omp for lastprivate(__pyx_v_c) firstprivate(__pyx_v_i) lastprivate(__pyx_v_i) lastprivate(__pyx_v_imag) lastprivate(__pyx_v_magnitude) lastprivate(__pyx_v_real) lastprivate(__pyx_v_tmp) schedule(static)
+                    #endif /* _OPENMP */
+                    for (__pyx_t_16 = 0; __pyx_t_16 < __pyx_t_17; __pyx_t_16++){
+                        {
+                            __pyx_v_i = (PY_LONG_LONG)(1 + 1 * __pyx_t_16);
+                            /* Initialize private variables to invalid values */
+                            __pyx_v_imag = ((float)__PYX_NAN());
+                            __pyx_v_magnitude = ((float)__PYX_NAN());
+                            __pyx_v_real = ((float)__PYX_NAN());
+
+                            /* "src/urh/cythonext/signalFunctions.pyx":179
+ * 
+ *     for i in prange(1, ns, nogil=True, schedule='static'):
+ *         c = samples[i]             # <<<<<<<<<<<<<<
+ *         real, imag = c.real, c.imag
+ *         magnitude = real * real + imag * imag
+ */
+                            __pyx_t_18 = __pyx_v_i;
+                            __pyx_v_c = (*((__pyx_t_float_complex *) ( /* dim=0 */ ((char *) (((__pyx_t_float_complex *) __pyx_v_samples.data) + __pyx_t_18)) )));
+
+                            /* "src/urh/cythonext/signalFunctions.pyx":180
+ *     for i in prange(1, ns, nogil=True, schedule='static'):
+ *         c = samples[i]
+ *         real, imag = c.real, c.imag             # <<<<<<<<<<<<<<
+ *         magnitude = real * real + imag * imag
+ *         if magnitude <= noise_sqrd:
+ */
+                            __pyx_t_19 = __Pyx_CREAL(__pyx_v_c);
+                            __pyx_t_20 = __Pyx_CIMAG(__pyx_v_c);
+                            __pyx_v_real = __pyx_t_19;
+                            __pyx_v_imag = __pyx_t_20;
+
+                            /* "src/urh/cythonext/signalFunctions.pyx":181
+ *         c = samples[i]
+ *         real, imag = c.real, c.imag
+ *         magnitude = real * real + imag * imag             # <<<<<<<<<<<<<<
+ *         if magnitude <= noise_sqrd:
+ *             result[i] = NOISE
+ */
+                            __pyx_v_magnitude = ((__pyx_v_real * __pyx_v_real) + (__pyx_v_imag * __pyx_v_imag));
+
+                            /* "src/urh/cythonext/signalFunctions.pyx":182
+ *         real, imag = c.real, c.imag
+ *         magnitude = real * real + imag * imag
+ *         if magnitude <= noise_sqrd:             # <<<<<<<<<<<<<<
+ *             result[i] = NOISE
+ *             continue
+ */
+                            __pyx_t_8 = ((__pyx_v_magnitude <= __pyx_v_noise_sqrd) != 0);
+                            if (__pyx_t_8) {
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":183
+ *         magnitude = real * real + imag * imag
+ *         if magnitude <= noise_sqrd:
+ *             result[i] = NOISE             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+                              __pyx_t_21 = __pyx_v_i;
+                              *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_21)) )) = __pyx_v_NOISE;
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":184
+ *         if magnitude <= noise_sqrd:
+ *             result[i] = NOISE
+ *             continue             # <<<<<<<<<<<<<<
+ * 
+ *         if mod_type == 0:  # ASK
+ */
+                              goto __pyx_L10_continue;
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":182
+ *         real, imag = c.real, c.imag
+ *         magnitude = real * real + imag * imag
+ *         if magnitude <= noise_sqrd:             # <<<<<<<<<<<<<<
+ *             result[i] = NOISE
+ *             continue
+ */
+                            }
+
+                            /* "src/urh/cythonext/signalFunctions.pyx":186
+ *             continue
+ * 
+ *         if mod_type == 0:  # ASK             # <<<<<<<<<<<<<<
+ *             result[i] = magnitude
+ *         elif mod_type == 1:  # FSK
+ */
+                            switch (__pyx_v_mod_type) {
+                              case 0:
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":187
+ * 
+ *         if mod_type == 0:  # ASK
+ *             result[i] = magnitude             # <<<<<<<<<<<<<<
+ *         elif mod_type == 1:  # FSK
+ *             tmp = samples[i - 1].conjugate() * c
+ */
+                              __pyx_t_22 = __pyx_v_i;
+                              *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_22)) )) = __pyx_v_magnitude;
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":186
+ *             continue
+ * 
+ *         if mod_type == 0:  # ASK             # <<<<<<<<<<<<<<
+ *             result[i] = magnitude
+ *         elif mod_type == 1:  # FSK
+ */
+                              break;
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":188
+ *         if mod_type == 0:  # ASK
+ *             result[i] = magnitude
+ *         elif mod_type == 1:  # FSK             # <<<<<<<<<<<<<<
+ *             tmp = samples[i - 1].conjugate() * c
+ *             result[i] = atan2(tmp.imag, tmp.real)
+ */
+                              case 1:
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":189
+ *             result[i] = magnitude
+ *         elif mod_type == 1:  # FSK
+ *             tmp = samples[i - 1].conjugate() * c             # <<<<<<<<<<<<<<
+ *             result[i] = atan2(tmp.imag, tmp.real)
+ *         else:
+ */
+                              __pyx_t_23 = (__pyx_v_i - 1);
+                              __pyx_v_tmp = __Pyx_c_prod_float(__Pyx_c_conj_float((*((__pyx_t_float_complex *) ( /* dim=0 */ ((char *) (((__pyx_t_float_complex *) __pyx_v_samples.data) + __pyx_t_23)) )))), __pyx_v_c);
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":190
+ *         elif mod_type == 1:  # FSK
+ *             tmp = samples[i - 1].conjugate() * c
+ *             result[i] = atan2(tmp.imag, tmp.real)             # <<<<<<<<<<<<<<
+ *         else:
+ *             result[i] = NOISE
+ */
+                              __pyx_t_24 = __pyx_v_i;
+                              *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_24)) )) = atan2(__Pyx_CIMAG(__pyx_v_tmp), __Pyx_CREAL(__pyx_v_tmp));
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":188
+ *         if mod_type == 0:  # ASK
+ *             result[i] = magnitude
+ *         elif mod_type == 1:  # FSK             # <<<<<<<<<<<<<<
+ *             tmp = samples[i - 1].conjugate() * c
+ *             result[i] = atan2(tmp.imag, tmp.real)
+ */
+                              break;
+                              default:
+
+                              /* "src/urh/cythonext/signalFunctions.pyx":192
+ *             result[i] = atan2(tmp.imag, tmp.real)
+ *         else:
+ *             result[i] = NOISE             # <<<<<<<<<<<<<<
+ * 
+ *     return np.asarray(result)
+ */
+                              __pyx_t_25 = __pyx_v_i;
+                              *((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_result.data) + __pyx_t_25)) )) = __pyx_v_NOISE;
+                              break;
+                            }
+                            goto __pyx_L16;
+                            __pyx_L10_continue:;
+                            goto __pyx_L16;
+                            __pyx_L16:;
+                        }
+                    }
+                }
+            }
+        }
+        #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+            #undef likely
+            #undef unlikely
+            #define likely(x)   __builtin_expect(!!(x), 1)
+            #define unlikely(x) __builtin_expect(!!(x), 0)
+        #endif
+      }
+
+      /* "src/urh/cythonext/signalFunctions.pyx":178
+ *         result[0] = NOISE
+ * 
+ *     for i in prange(1, ns, nogil=True, schedule='static'):             # <<<<<<<<<<<<<<
+ *         c = samples[i]
+ *         real, imag = c.real, c.imag
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L9;
+        }
+        __pyx_L9:;
+      }
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":194
+ *             result[i] = NOISE
+ * 
+ *     return np.asarray(result)             # <<<<<<<<<<<<<<
+ * 
+ * cpdef unsigned long long find_signal_start(float[::1] demod_samples, int mod_type):
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 194, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_asarray); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 194, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __pyx_memoryview_fromslice(__pyx_v_result, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 194, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  if (!__pyx_t_4) {
+    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 194, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_6);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_5};
+      __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 194, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_5};
+      __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 194, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_1 = PyTuple_New(1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 194, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_1, 0+1, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 194, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 194, __pyx_L1_error)
+  __pyx_r = ((PyArrayObject *)__pyx_t_6);
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":138
+ *     return np.asarray(result)
+ * 
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,             # <<<<<<<<<<<<<<
+ *                                                         float[::1] costa_state, bool has_predecessor=False,
+ *                                                         float complex predecessor=0):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_7, 1);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.afp_demod_block", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_result, 1);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_5afp_demod_block(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3src_3urh_9cythonext_15signalFunctions_4afp_demod_block[] = "\n    Demodulate one block of a longer signal, so the signal can be demodulated block by block\n    with the same result as demodulating it at once with afp_demod.\n\n    :param costa_state: frequency and phase of the costas loop (PSK/QAM) at the start of this block,\n                        it is updated in place to the state at the end of this block\n    :param has_predecessor: False for the first block of a signal\n    :param predecessor: last sample of the previous block, needed for FSK\n    ";
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_5afp_demod_block(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
+  float __pyx_v_noise_mag;
+  int __pyx_v_mod_type;
+  __Pyx_memviewslice __pyx_v_costa_state = { 0, 0, { 0 }, { 0 }, { 0 } };
+  bool __pyx_v_has_predecessor;
+  __pyx_t_float_complex __pyx_v_predecessor;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("afp_demod_block (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_samples,&__pyx_n_s_noise_mag,&__pyx_n_s_mod_type,&__pyx_n_s_costa_state,&__pyx_n_s_has_predecessor,&__pyx_n_s_predecessor,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_samples)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_noise_mag)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("afp_demod_block", 0, 4, 6, 1); __PYX_ERR(0, 138, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("afp_demod_block", 0, 4, 6, 2); __PYX_ERR(0, 138, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_costa_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("afp_demod_block", 0, 4, 6, 3); __PYX_ERR(0, 138, __pyx_L3_error)
+        }
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_has_predecessor);
+          if (value) { values[4] = value; kw_args--; }
+        }
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_predecessor);
+          if (value) { values[5] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "afp_demod_block") < 0)) __PYX_ERR(0, 138, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_samples = __Pyx_PyObject_to_MemoryviewSlice_dc___pyx_t_float_complex(values[0]); if (unlikely(!__pyx_v_samples.memview)) __PYX_ERR(0, 138, __pyx_L3_error)
+    __pyx_v_noise_mag = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_noise_mag == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 138, __pyx_L3_error)
+    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 138, __pyx_L3_error)
+    __pyx_v_costa_state = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[3]); if (unlikely(!__pyx_v_costa_state.memview)) __PYX_ERR(0, 139, __pyx_L3_error)
+    if (values[4]) {
+      __pyx_v_has_predecessor = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_has_predecessor == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 139, __pyx_L3_error)
+    } else {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":139
+ * 
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,
+ *                                                         float[::1] costa_state, bool has_predecessor=False,             # <<<<<<<<<<<<<<
+ *                                                         float complex predecessor=0):
+ *     """
+ */
+      __pyx_v_has_predecessor = ((bool)0);
+    }
+    if (values[5]) {
+      __pyx_v_predecessor = __Pyx_PyComplex_As___pyx_t_float_complex(values[5]); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+    } else {
+      __pyx_v_predecessor = __pyx_k__4;
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("afp_demod_block", 0, 4, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 138, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.afp_demod_block", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_4afp_demod_block(__pyx_self, __pyx_v_samples, __pyx_v_noise_mag, __pyx_v_mod_type, __pyx_v_costa_state, __pyx_v_has_predecessor, __pyx_v_predecessor);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":138
+ *     return np.asarray(result)
+ * 
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,             # <<<<<<<<<<<<<<
+ *                                                         float[::1] costa_state, bool has_predecessor=False,
+ *                                                         float complex predecessor=0):
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_4afp_demod_block(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, float __pyx_v_noise_mag, int __pyx_v_mod_type, __Pyx_memviewslice __pyx_v_costa_state, bool __pyx_v_has_predecessor, __pyx_t_float_complex __pyx_v_predecessor) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_3src_3urh_9cythonext_15signalFunctions_afp_demod_block __pyx_t_2;
+  __Pyx_RefNannySetupContext("afp_demod_block", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 2;
+  __pyx_t_2.has_predecessor = __pyx_v_has_predecessor;
+  __pyx_t_2.predecessor = __pyx_v_predecessor;
+  __pyx_t_1 = ((PyObject *)__pyx_f_3src_3urh_9cythonext_15signalFunctions_afp_demod_block(__pyx_v_samples, __pyx_v_noise_mag, __pyx_v_mod_type, __pyx_v_costa_state, 0, &__pyx_t_2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.afp_demod_block", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_samples, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_costa_state, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "src/urh/cythonext/signalFunctions.pyx":196
+ *     return np.asarray(result)
+ * 
+ * cpdef unsigned long long find_signal_start(float[::1] demod_samples, int mod_type):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef unsigned long long i, ns, l
+ */
+
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_7find_signal_start(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_start(__Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  unsigned PY_LONG_LONG __pyx_v_i;
+  unsigned PY_LONG_LONG __pyx_v_ns;
+  unsigned PY_LONG_LONG __pyx_v_l;
+  float __pyx_v_dsample;
+  int __pyx_v_has_oversteuern;
+  int __pyx_v_conseq_noise;
+  int __pyx_v_conseq_not_noise;
+  int __pyx_v_behind_oversteuern;
+  float __pyx_v_NOISE;
+  unsigned PY_LONG_LONG __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  unsigned PY_LONG_LONG __pyx_t_4;
+  unsigned PY_LONG_LONG __pyx_t_5;
+  unsigned PY_LONG_LONG __pyx_t_6;
+  unsigned PY_LONG_LONG __pyx_t_7;
+  int __pyx_t_8;
+  __Pyx_RefNannySetupContext("find_signal_start", 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":201
+ *     cdef float dsample
+ *     cdef int has_oversteuern, conseq_noise, conseq_not_noise, behind_oversteuern
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)             # <<<<<<<<<<<<<<
+ * 
  *     has_oversteuern = 0
  */
   __pyx_v_NOISE = __pyx_f_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(__pyx_v_mod_type, 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":137
+  /* "src/urh/cythonext/signalFunctions.pyx":203
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)
+ * 
+ *     has_oversteuern = 0             # <<<<<<<<<<<<<<
+ *     behind_oversteuern = 0
+ *     conseq_noise = 0
+ */
+  __pyx_v_has_oversteuern = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":204
+ * 
+ *     has_oversteuern = 0
+ *     behind_oversteuern = 0             # <<<<<<<<<<<<<<
+ *     conseq_noise = 0
+ *     conseq_not_noise = 0
+ */
+  __pyx_v_behind_oversteuern = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":205
+ *     has_oversteuern = 0
+ *     behind_oversteuern = 0
+ *     conseq_noise = 0             # <<<<<<<<<<<<<<
+ *     conseq_not_noise = 0
+ * 
+ */
+  __pyx_v_conseq_noise = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":206
+ *     behind_oversteuern = 0
+ *     conseq_noise = 0
+ *     conseq_not_noise = 0             # <<<<<<<<<<<<<<
+ * 
+ *     ns = len(demod_samples)
+ */
+  __pyx_v_conseq_not_noise = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":208
+ *     conseq_not_noise = 0
+ * 
+ *     ns = len(demod_samples)             # <<<<<<<<<<<<<<
+ *     l = 100
+ *     if ns < 100:
+ */
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_demod_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ns = __pyx_t_2;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":209
+ * 
+ *     ns = len(demod_samples)
+ *     l = 100             # <<<<<<<<<<<<<<
+ *     if ns < 100:
+ *         l = ns
+ */
+  __pyx_v_l = 0x64;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":210
+ *     ns = len(demod_samples)
+ *     l = 100
+ *     if ns < 100:             # <<<<<<<<<<<<<<
+ *         l = ns
+ * 
+ */
+  __pyx_t_3 = ((__pyx_v_ns < 0x64) != 0);
+  if (__pyx_t_3) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":211
+ *     l = 100
+ *     if ns < 100:
+ *         l = ns             # <<<<<<<<<<<<<<
+ * 
+ *     for i in range(0, l):
+ */
+    __pyx_v_l = __pyx_v_ns;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":210
+ *     ns = len(demod_samples)
+ *     l = 100
+ *     if ns < 100:             # <<<<<<<<<<<<<<
+ *         l = ns
+ * 
+ */
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":213
+ *         l = ns
+ * 
+ *     for i in range(0, l):             # <<<<<<<<<<<<<<
+ *         dsample = demod_samples[i]
+ *         if dsample > NOISE:
+ */
+  __pyx_t_4 = __pyx_v_l;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":214
+ * 
+ *     for i in range(0, l):
+ *         dsample = demod_samples[i]             # <<<<<<<<<<<<<<
+ *         if dsample > NOISE:
+ *             has_oversteuern = 1
+ */
+    __pyx_t_6 = __pyx_v_i;
+    __pyx_v_dsample = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_demod_samples.data) + __pyx_t_6)) )));
+
+    /* "src/urh/cythonext/signalFunctions.pyx":215
+ *     for i in range(0, l):
+ *         dsample = demod_samples[i]
+ *         if dsample > NOISE:             # <<<<<<<<<<<<<<
+ *             has_oversteuern = 1
+ *             break
+ */
+    __pyx_t_3 = ((__pyx_v_dsample > __pyx_v_NOISE) != 0);
+    if (__pyx_t_3) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":216
+ *         dsample = demod_samples[i]
+ *         if dsample > NOISE:
+ *             has_oversteuern = 1             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+      __pyx_v_has_oversteuern = 1;
+
+      /* "src/urh/cythonext/signalFunctions.pyx":217
+ *         if dsample > NOISE:
+ *             has_oversteuern = 1
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *     for i in range(0, ns):
+ */
+      goto __pyx_L5_break;
+
+      /* "src/urh/cythonext/signalFunctions.pyx":215
+ *     for i in range(0, l):
+ *         dsample = demod_samples[i]
+ *         if dsample > NOISE:             # <<<<<<<<<<<<<<
+ *             has_oversteuern = 1
+ *             break
+ */
+    }
+  }
+  __pyx_L5_break:;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":219
+ *             break
+ * 
+ *     for i in range(0, ns):             # <<<<<<<<<<<<<<
+ *         dsample = demod_samples[i]
+ * 
+ */
+  __pyx_t_4 = __pyx_v_ns;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":220
+ * 
+ *     for i in range(0, ns):
+ *         dsample = demod_samples[i]             # <<<<<<<<<<<<<<
+ * 
+ *         if dsample == NOISE:
+ */
+    __pyx_t_7 = __pyx_v_i;
+    __pyx_v_dsample = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_demod_samples.data) + __pyx_t_7)) )));
+
+    /* "src/urh/cythonext/signalFunctions.pyx":222
+ *         dsample = demod_samples[i]
+ * 
+ *         if dsample == NOISE:             # <<<<<<<<<<<<<<
+ *             conseq_noise += 1
+ *             conseq_not_noise = 0
+ */
+    __pyx_t_3 = ((__pyx_v_dsample == __pyx_v_NOISE) != 0);
+    if (__pyx_t_3) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":223
+ * 
+ *         if dsample == NOISE:
+ *             conseq_noise += 1             # <<<<<<<<<<<<<<
+ *             conseq_not_noise = 0
+ *         else:
+ */
+      __pyx_v_conseq_noise = (__pyx_v_conseq_noise + 1);
+
+      /* "src/urh/cythonext/signalFunctions.pyx":224
+ *         if dsample == NOISE:
+ *             conseq_noise += 1
+ *             conseq_not_noise = 0             # <<<<<<<<<<<<<<
+ *         else:
+ *             conseq_noise = 0
+ */
+      __pyx_v_conseq_not_noise = 0;
+
+      /* "src/urh/cythonext/signalFunctions.pyx":222
+ *         dsample = demod_samples[i]
+ * 
+ *         if dsample == NOISE:             # <<<<<<<<<<<<<<
+ *             conseq_noise += 1
+ *             conseq_not_noise = 0
+ */
+      goto __pyx_L9;
+    }
+
+    /* "src/urh/cythonext/signalFunctions.pyx":226
+ *             conseq_not_noise = 0
+ *         else:
+ *             conseq_noise = 0             # <<<<<<<<<<<<<<
+ *             conseq_not_noise += 1
+ * 
+ */
+    /*else*/ {
+      __pyx_v_conseq_noise = 0;
+
+      /* "src/urh/cythonext/signalFunctions.pyx":227
+ *         else:
+ *             conseq_noise = 0
+ *             conseq_not_noise += 1             # <<<<<<<<<<<<<<
+ * 
+ *         if has_oversteuern == 1:
+ */
+      __pyx_v_conseq_not_noise = (__pyx_v_conseq_not_noise + 1);
+    }
+    __pyx_L9:;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":229
+ *             conseq_not_noise += 1
+ * 
+ *         if has_oversteuern == 1:             # <<<<<<<<<<<<<<
+ *             if has_oversteuern and conseq_noise > 100:
+ *                 behind_oversteuern = 1
+ */
+    __pyx_t_3 = ((__pyx_v_has_oversteuern == 1) != 0);
+    if (__pyx_t_3) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":230
+ * 
+ *         if has_oversteuern == 1:
+ *             if has_oversteuern and conseq_noise > 100:             # <<<<<<<<<<<<<<
+ *                 behind_oversteuern = 1
+ * 
+ */
+      __pyx_t_8 = (__pyx_v_has_oversteuern != 0);
+      if (__pyx_t_8) {
+      } else {
+        __pyx_t_3 = __pyx_t_8;
+        goto __pyx_L12_bool_binop_done;
+      }
+      __pyx_t_8 = ((__pyx_v_conseq_noise > 0x64) != 0);
+      __pyx_t_3 = __pyx_t_8;
+      __pyx_L12_bool_binop_done:;
+      if (__pyx_t_3) {
+
+        /* "src/urh/cythonext/signalFunctions.pyx":231
+ *         if has_oversteuern == 1:
+ *             if has_oversteuern and conseq_noise > 100:
+ *                 behind_oversteuern = 1             # <<<<<<<<<<<<<<
+ * 
+ *             if behind_oversteuern and conseq_not_noise == 3:
+ */
+        __pyx_v_behind_oversteuern = 1;
+
+        /* "src/urh/cythonext/signalFunctions.pyx":230
+ * 
+ *         if has_oversteuern == 1:
+ *             if has_oversteuern and conseq_noise > 100:             # <<<<<<<<<<<<<<
+ *                 behind_oversteuern = 1
+ * 
+ */
+      }
+
+      /* "src/urh/cythonext/signalFunctions.pyx":233
+ *                 behind_oversteuern = 1
+ * 
+ *             if behind_oversteuern and conseq_not_noise == 3:             # <<<<<<<<<<<<<<
+ *                 return i - 3
+ * 
+ */
+      __pyx_t_8 = (__pyx_v_behind_oversteuern != 0);
+      if (__pyx_t_8) {
+      } else {
+        __pyx_t_3 = __pyx_t_8;
+        goto __pyx_L15_bool_binop_done;
+      }
+      __pyx_t_8 = ((__pyx_v_conseq_not_noise == 3) != 0);
+      __pyx_t_3 = __pyx_t_8;
+      __pyx_L15_bool_binop_done:;
+      if (__pyx_t_3) {
+
+        /* "src/urh/cythonext/signalFunctions.pyx":234
+ * 
+ *             if behind_oversteuern and conseq_not_noise == 3:
+ *                 return i - 3             # <<<<<<<<<<<<<<
+ * 
+ *         elif conseq_not_noise == 3:
+ */
+        __pyx_r = (__pyx_v_i - 3);
+        goto __pyx_L0;
+
+        /* "src/urh/cythonext/signalFunctions.pyx":233
+ *                 behind_oversteuern = 1
+ * 
+ *             if behind_oversteuern and conseq_not_noise == 3:             # <<<<<<<<<<<<<<
+ *                 return i - 3
+ * 
+ */
+      }
+
+      /* "src/urh/cythonext/signalFunctions.pyx":229
+ *             conseq_not_noise += 1
+ * 
+ *         if has_oversteuern == 1:             # <<<<<<<<<<<<<<
+ *             if has_oversteuern and conseq_noise > 100:
+ *                 behind_oversteuern = 1
+ */
+      goto __pyx_L10;
+    }
+
+    /* "src/urh/cythonext/signalFunctions.pyx":236
+ *                 return i - 3
+ * 
+ *         elif conseq_not_noise == 3:             # <<<<<<<<<<<<<<
+ *             return i -3
+ * 
+ */
+    __pyx_t_3 = ((__pyx_v_conseq_not_noise == 3) != 0);
+    if (__pyx_t_3) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":237
+ * 
+ *         elif conseq_not_noise == 3:
+ *             return i -3             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+      __pyx_r = (__pyx_v_i - 3);
+      goto __pyx_L0;
+
+      /* "src/urh/cythonext/signalFunctions.pyx":236
+ *                 return i - 3
+ * 
+ *         elif conseq_not_noise == 3:             # <<<<<<<<<<<<<<
+ *             return i -3
+ * 
+ */
+    }
+    __pyx_L10:;
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":239
+ *             return i -3
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cpdef unsigned long long find_signal_end(float[::1] demod_samples, int mod_type):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":196
+ *     return np.asarray(result)
+ * 
+ * cpdef unsigned long long find_signal_start(float[::1] demod_samples, int mod_type):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef unsigned long long i, ns, l
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_WriteUnraisable("src.urh.cythonext.signalFunctions.find_signal_start", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_7find_signal_start(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_7find_signal_start(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_demod_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_mod_type;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("find_signal_start (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_demod_samples,&__pyx_n_s_mod_type,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_demod_samples)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_signal_start", 1, 2, 2, 1); __PYX_ERR(0, 196, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_signal_start") < 0)) __PYX_ERR(0, 196, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_demod_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_demod_samples.memview)) __PYX_ERR(0, 196, __pyx_L3_error)
+    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 196, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("find_signal_start", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 196, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.find_signal_start", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6find_signal_start(__pyx_self, __pyx_v_demod_samples, __pyx_v_mod_type);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6find_signal_start(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("find_signal_start", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_start(__pyx_v_demod_samples, __pyx_v_mod_type, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.find_signal_start", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_demod_samples, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "src/urh/cythonext/signalFunctions.pyx":241
+ *     return 0
+ * 
+ * cpdef unsigned long long find_signal_end(float[::1] demod_samples, int mod_type):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef unsigned long long i
+ */
+
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_9find_signal_end(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_end(__Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  unsigned PY_LONG_LONG __pyx_v_i;
+  float __pyx_v_dsample;
+  int __pyx_v_conseq_not_noise;
+  float __pyx_v_NOISE;
+  unsigned PY_LONG_LONG __pyx_v_ns;
+  unsigned PY_LONG_LONG __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  unsigned PY_LONG_LONG __pyx_t_3;
+  unsigned PY_LONG_LONG __pyx_t_4;
+  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("find_signal_end", 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":245
+ *     cdef unsigned long long i
+ *     cdef float dsample
+ *     cdef int conseq_not_noise = 0             # <<<<<<<<<<<<<<
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)
+ *     cdef unsigned long long ns = len(demod_samples)
+ */
+  __pyx_v_conseq_not_noise = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":246
+ *     cdef float dsample
+ *     cdef int conseq_not_noise = 0
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)             # <<<<<<<<<<<<<<
+ *     cdef unsigned long long ns = len(demod_samples)
+ * 
+ */
+  __pyx_v_NOISE = __pyx_f_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(__pyx_v_mod_type, 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":247
+ *     cdef int conseq_not_noise = 0
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)
+ *     cdef unsigned long long ns = len(demod_samples)             # <<<<<<<<<<<<<<
+ * 
+ *     for i in range(ns, 0, -1):
+ */
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_demod_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ns = __pyx_t_2;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":249
+ *     cdef unsigned long long ns = len(demod_samples)
+ * 
+ *     for i in range(ns, 0, -1):             # <<<<<<<<<<<<<<
+ *         dsample = demod_samples[i]
+ * 
+ */
+  for (__pyx_t_3 = __pyx_v_ns + 1; __pyx_t_3 > 0 + 1; ) { __pyx_t_3-=1;
+    __pyx_v_i = __pyx_t_3;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":250
+ * 
+ *     for i in range(ns, 0, -1):
+ *         dsample = demod_samples[i]             # <<<<<<<<<<<<<<
+ * 
+ *         if dsample > NOISE:
+ */
+    __pyx_t_4 = __pyx_v_i;
+    __pyx_v_dsample = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_demod_samples.data) + __pyx_t_4)) )));
+
+    /* "src/urh/cythonext/signalFunctions.pyx":252
+ *         dsample = demod_samples[i]
+ * 
+ *         if dsample > NOISE:             # <<<<<<<<<<<<<<
+ *             conseq_not_noise += 1
+ * 
+ */
+    __pyx_t_5 = ((__pyx_v_dsample > __pyx_v_NOISE) != 0);
+    if (__pyx_t_5) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":253
+ * 
+ *         if dsample > NOISE:
+ *             conseq_not_noise += 1             # <<<<<<<<<<<<<<
+ * 
+ *         if conseq_not_noise == 3:
+ */
+      __pyx_v_conseq_not_noise = (__pyx_v_conseq_not_noise + 1);
+
+      /* "src/urh/cythonext/signalFunctions.pyx":252
+ *         dsample = demod_samples[i]
+ * 
+ *         if dsample > NOISE:             # <<<<<<<<<<<<<<
+ *             conseq_not_noise += 1
+ * 
+ */
+    }
+
+    /* "src/urh/cythonext/signalFunctions.pyx":255
+ *             conseq_not_noise += 1
+ * 
+ *         if conseq_not_noise == 3:             # <<<<<<<<<<<<<<
+ *             return i + 3
+ * 
+ */
+    __pyx_t_5 = ((__pyx_v_conseq_not_noise == 3) != 0);
+    if (__pyx_t_5) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":256
+ * 
+ *         if conseq_not_noise == 3:
+ *             return i + 3             # <<<<<<<<<<<<<<
+ * 
+ *     return ns
+ */
+      __pyx_r = (__pyx_v_i + 3);
+      goto __pyx_L0;
+
+      /* "src/urh/cythonext/signalFunctions.pyx":255
+ *             conseq_not_noise += 1
+ * 
+ *         if conseq_not_noise == 3:             # <<<<<<<<<<<<<<
+ *             return i + 3
+ * 
+ */
+    }
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":258
+ *             return i + 3
+ * 
+ *     return ns             # <<<<<<<<<<<<<<
+ * 
+ * cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples,
+ */
+  __pyx_r = __pyx_v_ns;
+  goto __pyx_L0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":241
+ *     return 0
+ * 
+ * cpdef unsigned long long find_signal_end(float[::1] demod_samples, int mod_type):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef unsigned long long i
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_WriteUnraisable("src.urh.cythonext.signalFunctions.find_signal_end", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_9find_signal_end(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_9find_signal_end(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_demod_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_mod_type;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("find_signal_end (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_demod_samples,&__pyx_n_s_mod_type,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_demod_samples)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_signal_end", 1, 2, 2, 1); __PYX_ERR(0, 241, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_signal_end") < 0)) __PYX_ERR(0, 241, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_demod_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_demod_samples.memview)) __PYX_ERR(0, 241, __pyx_L3_error)
+    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 241, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("find_signal_end", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 241, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.find_signal_end", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_8find_signal_end(__pyx_self, __pyx_v_demod_samples, __pyx_v_mod_type);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_8find_signal_end(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("find_signal_end", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_end(__pyx_v_demod_samples, __pyx_v_mod_type, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.find_signal_end", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_demod_samples, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "src/urh/cythonext/signalFunctions.pyx":260
+ *     return ns
+ * 
+ * cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples,             # <<<<<<<<<<<<<<
+ *                                                  float treshold, unsigned int tolerance, int mod_type):
+ *     """
+ */
+
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11grab_pulse_lens(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static __Pyx_memviewslice __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__Pyx_memviewslice __pyx_v_samples, float __pyx_v_treshold, unsigned int __pyx_v_tolerance, int __pyx_v_mod_type, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  unsigned PY_LONG_LONG __pyx_v_i;
+  unsigned PY_LONG_LONG __pyx_v_ns;
+  unsigned PY_LONG_LONG __pyx_v_pulselen;
+  unsigned PY_LONG_LONG __pyx_v_cur_index;
+  unsigned PY_LONG_LONG __pyx_v_conseq_ones;
+  unsigned PY_LONG_LONG __pyx_v_conseq_zeros;
+  unsigned PY_LONG_LONG __pyx_v_conseq_pause;
+  float __pyx_v_s;
+  float __pyx_v_s_prev;
+  int __pyx_v_cur_state;
+  float __pyx_v_NOISE;
+  __Pyx_memviewslice __pyx_v_result = { 0, 0, { 0 }, { 0 }, { 0 } };
+  unsigned PY_LONG_LONG __pyx_v_len_result;
+  __Pyx_memviewslice __pyx_r = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  unsigned PY_LONG_LONG __pyx_t_10;
+  unsigned PY_LONG_LONG __pyx_t_11;
+  unsigned PY_LONG_LONG __pyx_t_12;
+  unsigned PY_LONG_LONG __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  unsigned PY_LONG_LONG __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  unsigned PY_LONG_LONG __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  unsigned PY_LONG_LONG __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  unsigned PY_LONG_LONG __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  unsigned PY_LONG_LONG __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  int __pyx_t_27;
+  __Pyx_RefNannySetupContext("grab_pulse_lens", 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":271
+ *     arr[i][1] gibt die Lnge des Pulses bzw. der Pause an.
+ *     """
+ *     cdef unsigned long long i, ns, pulselen = 0             # <<<<<<<<<<<<<<
+ *     cdef unsigned long long cur_index = 0, conseq_ones = 0, conseq_zeros = 0, conseq_pause = 0
+ *     cdef float s, s_prev
+ */
+  __pyx_v_pulselen = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":272
+ *     """
+ *     cdef unsigned long long i, ns, pulselen = 0
+ *     cdef unsigned long long cur_index = 0, conseq_ones = 0, conseq_zeros = 0, conseq_pause = 0             # <<<<<<<<<<<<<<
+ *     cdef float s, s_prev
+ *     cdef int cur_state
+ */
+  __pyx_v_cur_index = 0;
+  __pyx_v_conseq_ones = 0;
+  __pyx_v_conseq_zeros = 0;
+  __pyx_v_conseq_pause = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":275
+ *     cdef float s, s_prev
+ *     cdef int cur_state
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)             # <<<<<<<<<<<<<<
+ *     ns = len(samples)
+ * 
+ */
+  __pyx_v_NOISE = __pyx_f_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(__pyx_v_mod_type, 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":276
+ *     cdef int cur_state
  *     cdef float NOISE = get_noise_for_mod_type(mod_type)
+ *     ns = len(samples)             # <<<<<<<<<<<<<<
  * 
- *     has_oversteuern = 0             # <<<<<<<<<<<<<<
- *     behind_oversteuern = 0
- *     conseq_noise = 0
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
  */
-  __pyx_v_has_oversteuern = 0;
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ns = __pyx_t_2;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":138
+  /* "src/urh/cythonext/signalFunctions.pyx":278
+ *     ns = len(samples)
  * 
- *     has_oversteuern = 0
- *     behind_oversteuern = 0             # <<<<<<<<<<<<<<
- *     conseq_noise = 0
- *     conseq_not_noise = 0
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")             # <<<<<<<<<<<<<<
+ *     if ns == 0:
+ *         return result
  */
-  __pyx_v_behind_oversteuern = 0;
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_ns); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_INCREF(__pyx_int_2);
+  __Pyx_GIVEREF(__pyx_int_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_2);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_uint64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_order, __pyx_n_u_C) < 0) __PYX_ERR(0, 278, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_PY_LONG_LONG(__pyx_t_6);
+  if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_result = __pyx_t_7;
+  __pyx_t_7.memview = NULL;
+  __pyx_t_7.data = NULL;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":139
- *     has_oversteuern = 0
- *     behind_oversteuern = 0
- *     conseq_noise = 0             # <<<<<<<<<<<<<<
- *     conseq_not_noise = 0
+  /* "src/urh/cythonext/signalFunctions.pyx":279
+ * 
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
+ *     if ns == 0:             # <<<<<<<<<<<<<<
+ *         return result
  * 
  */
-  __pyx_v_conseq_noise = 0;
+  __pyx_t_8 = ((__pyx_v_ns == 0) != 0);
+  if (__pyx_t_8) {
 
-  /* "src/urh/cythonext/signalFunctions.pyx":140
- *     behind_oversteuern = 0
- *     conseq_noise = 0
- *     conseq_not_noise = 0             # <<<<<<<<<<<<<<
+    /* "src/urh/cythonext/signalFunctions.pyx":280
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
+ *     if ns == 0:
+ *         return result             # <<<<<<<<<<<<<<
  * 
- *     ns = len(demod_samples)
+ *     s_prev = samples[0]
  */
-  __pyx_v_conseq_not_noise = 0;
+    __PYX_INC_MEMVIEW(&__pyx_v_result, 0);
+    __pyx_r = __pyx_v_result;
+    goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":142
- *     conseq_not_noise = 0
+    /* "src/urh/cythonext/signalFunctions.pyx":279
+ * 
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
+ *     if ns == 0:             # <<<<<<<<<<<<<<
+ *         return result
  * 
- *     ns = len(demod_samples)             # <<<<<<<<<<<<<<
- *     l = 100
- *     if ns < 100:
  */
-  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_demod_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ns = __pyx_t_2;
+  }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":143
+  /* "src/urh/cythonext/signalFunctions.pyx":282
+ *         return result
  * 
- *     ns = len(demod_samples)
- *     l = 100             # <<<<<<<<<<<<<<
- *     if ns < 100:
- *         l = ns
+ *     s_prev = samples[0]             # <<<<<<<<<<<<<<
+ *     if s_prev == NOISE:
+ *         cur_state = 42
  */
-  __pyx_v_l = 0x64;
+  __pyx_t_9 = 0;
+  __pyx_v_s_prev = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_samples.data) + __pyx_t_9)) )));
 
-  /* "src/urh/cythonext/signalFunctions.pyx":144
- *     ns = len(demod_samples)
- *     l = 100
- *     if ns < 100:             # <<<<<<<<<<<<<<
- *         l = ns
+  /* "src/urh/cythonext/signalFunctions.pyx":283
  * 
+ *     s_prev = samples[0]
+ *     if s_prev == NOISE:             # <<<<<<<<<<<<<<
+ *         cur_state = 42
+ *     elif s_prev > treshold:
  */
-  __pyx_t_3 = ((__pyx_v_ns < 0x64) != 0);
-  if (__pyx_t_3) {
+  __pyx_t_8 = ((__pyx_v_s_prev == __pyx_v_NOISE) != 0);
+  if (__pyx_t_8) {
 
-    /* "src/urh/cythonext/signalFunctions.pyx":145
- *     l = 100
- *     if ns < 100:
- *         l = ns             # <<<<<<<<<<<<<<
+    /* "src/urh/cythonext/signalFunctions.pyx":284
+ *     s_prev = samples[0]
+ *     if s_prev == NOISE:
+ *         cur_state = 42             # <<<<<<<<<<<<<<
+ *     elif s_prev > treshold:
+ *         cur_state = 1
+ */
+    __pyx_v_cur_state = 42;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":283
  * 
- *     for i in range(0, l):
+ *     s_prev = samples[0]
+ *     if s_prev == NOISE:             # <<<<<<<<<<<<<<
+ *         cur_state = 42
+ *     elif s_prev > treshold:
  */
-    __pyx_v_l = __pyx_v_ns;
+    goto __pyx_L4;
+  }
 
-    /* "src/urh/cythonext/signalFunctions.pyx":144
- *     ns = len(demod_samples)
- *     l = 100
- *     if ns < 100:             # <<<<<<<<<<<<<<
- *         l = ns
+  /* "src/urh/cythonext/signalFunctions.pyx":285
+ *     if s_prev == NOISE:
+ *         cur_state = 42
+ *     elif s_prev > treshold:             # <<<<<<<<<<<<<<
+ *         cur_state = 1
+ *     else:
+ */
+  __pyx_t_8 = ((__pyx_v_s_prev > __pyx_v_treshold) != 0);
+  if (__pyx_t_8) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":286
+ *         cur_state = 42
+ *     elif s_prev > treshold:
+ *         cur_state = 1             # <<<<<<<<<<<<<<
+ *     else:
+ *         cur_state = 0
+ */
+    __pyx_v_cur_state = 1;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":285
+ *     if s_prev == NOISE:
+ *         cur_state = 42
+ *     elif s_prev > treshold:             # <<<<<<<<<<<<<<
+ *         cur_state = 1
+ *     else:
+ */
+    goto __pyx_L4;
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":288
+ *         cur_state = 1
+ *     else:
+ *         cur_state = 0             # <<<<<<<<<<<<<<
  * 
+ *     with nogil:
  */
+  /*else*/ {
+    __pyx_v_cur_state = 0;
   }
+  __pyx_L4:;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":147
- *         l = ns
+  /* "src/urh/cythonext/signalFunctions.pyx":290
+ *         cur_state = 0
  * 
- *     for i in range(0, l):             # <<<<<<<<<<<<<<
- *         dsample = demod_samples[i]
- *         if dsample > NOISE:
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(ns-1):
+ *             pulselen += 1
  */
-  __pyx_t_4 = __pyx_v_l;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "src/urh/cythonext/signalFunctions.pyx":291
+ * 
+ *     with nogil:
+ *         for i in range(ns-1):             # <<<<<<<<<<<<<<
+ *             pulselen += 1
+ *             s = samples[i]
+ */
+        __pyx_t_10 = (__pyx_v_ns - 1);
+        for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+          __pyx_v_i = __pyx_t_11;
+
+          /* "src/urh/cythonext/signalFunctions.pyx":292
+ *     with nogil:
+ *         for i in range(ns-1):
+ *             pulselen += 1             # <<<<<<<<<<<<<<
+ *             s = samples[i]
+ *             if s == NOISE:
+ */
+          __pyx_v_pulselen = (__pyx_v_pulselen + 1);
+
+          /* "src/urh/cythonext/signalFunctions.pyx":293
+ *         for i in range(ns-1):
+ *             pulselen += 1
+ *             s = samples[i]             # <<<<<<<<<<<<<<
+ *             if s == NOISE:
+ *                 conseq_pause += 1
+ */
+          __pyx_t_12 = __pyx_v_i;
+          __pyx_v_s = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_samples.data) + __pyx_t_12)) )));
+
+          /* "src/urh/cythonext/signalFunctions.pyx":294
+ *             pulselen += 1
+ *             s = samples[i]
+ *             if s == NOISE:             # <<<<<<<<<<<<<<
+ *                 conseq_pause += 1
+ *                 conseq_ones = 0
+ */
+          __pyx_t_8 = ((__pyx_v_s == __pyx_v_NOISE) != 0);
+          if (__pyx_t_8) {
+
+            /* "src/urh/cythonext/signalFunctions.pyx":295
+ *             s = samples[i]
+ *             if s == NOISE:
+ *                 conseq_pause += 1             # <<<<<<<<<<<<<<
+ *                 conseq_ones = 0
+ *                 conseq_zeros = 0
+ */
+            __pyx_v_conseq_pause = (__pyx_v_conseq_pause + 1);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":296
+ *             if s == NOISE:
+ *                 conseq_pause += 1
+ *                 conseq_ones = 0             # <<<<<<<<<<<<<<
+ *                 conseq_zeros = 0
+ *                 if cur_state == 42: continue
+ */
+            __pyx_v_conseq_ones = 0;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":297
+ *                 conseq_pause += 1
+ *                 conseq_ones = 0
+ *                 conseq_zeros = 0             # <<<<<<<<<<<<<<
+ *                 if cur_state == 42: continue
+ *             elif s > treshold:
+ */
+            __pyx_v_conseq_zeros = 0;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":298
+ *                 conseq_ones = 0
+ *                 conseq_zeros = 0
+ *                 if cur_state == 42: continue             # <<<<<<<<<<<<<<
+ *             elif s > treshold:
+ *                 conseq_ones += 1
+ */
+            __pyx_t_8 = ((__pyx_v_cur_state == 42) != 0);
+            if (__pyx_t_8) {
+              goto __pyx_L8_continue;
+            }
+
+            /* "src/urh/cythonext/signalFunctions.pyx":294
+ *             pulselen += 1
+ *             s = samples[i]
+ *             if s == NOISE:             # <<<<<<<<<<<<<<
+ *                 conseq_pause += 1
+ *                 conseq_ones = 0
+ */
+            goto __pyx_L10;
+          }
+
+          /* "src/urh/cythonext/signalFunctions.pyx":299
+ *                 conseq_zeros = 0
+ *                 if cur_state == 42: continue
+ *             elif s > treshold:             # <<<<<<<<<<<<<<
+ *                 conseq_ones += 1
+ *                 conseq_zeros = 0
+ */
+          __pyx_t_8 = ((__pyx_v_s > __pyx_v_treshold) != 0);
+          if (__pyx_t_8) {
+
+            /* "src/urh/cythonext/signalFunctions.pyx":300
+ *                 if cur_state == 42: continue
+ *             elif s > treshold:
+ *                 conseq_ones += 1             # <<<<<<<<<<<<<<
+ *                 conseq_zeros = 0
+ *                 conseq_pause = 0
+ */
+            __pyx_v_conseq_ones = (__pyx_v_conseq_ones + 1);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":301
+ *             elif s > treshold:
+ *                 conseq_ones += 1
+ *                 conseq_zeros = 0             # <<<<<<<<<<<<<<
+ *                 conseq_pause = 0
+ *                 if cur_state == 1: continue
+ */
+            __pyx_v_conseq_zeros = 0;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":302
+ *                 conseq_ones += 1
+ *                 conseq_zeros = 0
+ *                 conseq_pause = 0             # <<<<<<<<<<<<<<
+ *                 if cur_state == 1: continue
+ *             else:
+ */
+            __pyx_v_conseq_pause = 0;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":303
+ *                 conseq_zeros = 0
+ *                 conseq_pause = 0
+ *                 if cur_state == 1: continue             # <<<<<<<<<<<<<<
+ *             else:
+ *                 conseq_zeros += 1
+ */
+            __pyx_t_8 = ((__pyx_v_cur_state == 1) != 0);
+            if (__pyx_t_8) {
+              goto __pyx_L8_continue;
+            }
+
+            /* "src/urh/cythonext/signalFunctions.pyx":299
+ *                 conseq_zeros = 0
+ *                 if cur_state == 42: continue
+ *             elif s > treshold:             # <<<<<<<<<<<<<<
+ *                 conseq_ones += 1
+ *                 conseq_zeros = 0
+ */
+            goto __pyx_L10;
+          }
+
+          /* "src/urh/cythonext/signalFunctions.pyx":305
+ *                 if cur_state == 1: continue
+ *             else:
+ *                 conseq_zeros += 1             # <<<<<<<<<<<<<<
+ *                 conseq_ones = 0
+ *                 conseq_pause = 0
+ */
+          /*else*/ {
+            __pyx_v_conseq_zeros = (__pyx_v_conseq_zeros + 1);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":306
+ *             else:
+ *                 conseq_zeros += 1
+ *                 conseq_ones = 0             # <<<<<<<<<<<<<<
+ *                 conseq_pause = 0
+ *                 if cur_state == 0: continue
+ */
+            __pyx_v_conseq_ones = 0;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":148
+            /* "src/urh/cythonext/signalFunctions.pyx":307
+ *                 conseq_zeros += 1
+ *                 conseq_ones = 0
+ *                 conseq_pause = 0             # <<<<<<<<<<<<<<
+ *                 if cur_state == 0: continue
  * 
- *     for i in range(0, l):
- *         dsample = demod_samples[i]             # <<<<<<<<<<<<<<
- *         if dsample > NOISE:
- *             has_oversteuern = 1
  */
-    __pyx_t_6 = __pyx_v_i;
-    __pyx_v_dsample = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_demod_samples.data) + __pyx_t_6)) )));
+            __pyx_v_conseq_pause = 0;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":149
- *     for i in range(0, l):
- *         dsample = demod_samples[i]
- *         if dsample > NOISE:             # <<<<<<<<<<<<<<
- *             has_oversteuern = 1
- *             break
+            /* "src/urh/cythonext/signalFunctions.pyx":308
+ *                 conseq_ones = 0
+ *                 conseq_pause = 0
+ *                 if cur_state == 0: continue             # <<<<<<<<<<<<<<
+ * 
+ *             if conseq_ones > tolerance:
  */
-    __pyx_t_3 = ((__pyx_v_dsample > __pyx_v_NOISE) != 0);
-    if (__pyx_t_3) {
+            __pyx_t_8 = ((__pyx_v_cur_state == 0) != 0);
+            if (__pyx_t_8) {
+              goto __pyx_L8_continue;
+            }
+          }
+          __pyx_L10:;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":150
- *         dsample = demod_samples[i]
- *         if dsample > NOISE:
- *             has_oversteuern = 1             # <<<<<<<<<<<<<<
- *             break
+          /* "src/urh/cythonext/signalFunctions.pyx":310
+ *                 if cur_state == 0: continue
  * 
+ *             if conseq_ones > tolerance:             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
  */
-      __pyx_v_has_oversteuern = 1;
+          __pyx_t_8 = ((__pyx_v_conseq_ones > __pyx_v_tolerance) != 0);
+          if (__pyx_t_8) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":151
- *         if dsample > NOISE:
- *             has_oversteuern = 1
- *             break             # <<<<<<<<<<<<<<
+            /* "src/urh/cythonext/signalFunctions.pyx":311
  * 
- *     for i in range(0, ns):
+ *             if conseq_ones > tolerance:
+ *                 result[cur_index, 0] = cur_state             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1
  */
-      goto __pyx_L5_break;
+            __pyx_t_13 = __pyx_v_cur_index;
+            __pyx_t_14 = 0;
+            *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_13 * __pyx_v_result.strides[0]) )) + __pyx_t_14)) )) = __pyx_v_cur_state;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":149
- *     for i in range(0, l):
- *         dsample = demod_samples[i]
- *         if dsample > NOISE:             # <<<<<<<<<<<<<<
- *             has_oversteuern = 1
- *             break
+            /* "src/urh/cythonext/signalFunctions.pyx":312
+ *             if conseq_ones > tolerance:
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance             # <<<<<<<<<<<<<<
+ *                 cur_index += 1
+ *                 pulselen = tolerance
  */
-    }
-  }
-  __pyx_L5_break:;
+            __pyx_t_15 = __pyx_v_cur_index;
+            __pyx_t_16 = 1;
+            *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_15 * __pyx_v_result.strides[0]) )) + __pyx_t_16)) )) = (__pyx_v_pulselen - __pyx_v_tolerance);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":153
- *             break
- * 
- *     for i in range(0, ns):             # <<<<<<<<<<<<<<
- *         dsample = demod_samples[i]
+            /* "src/urh/cythonext/signalFunctions.pyx":313
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1             # <<<<<<<<<<<<<<
+ *                 pulselen = tolerance
+ *                 cur_state = 1
+ */
+            __pyx_v_cur_index = (__pyx_v_cur_index + 1);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":314
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1
+ *                 pulselen = tolerance             # <<<<<<<<<<<<<<
+ *                 cur_state = 1
  * 
  */
-  __pyx_t_4 = __pyx_v_ns;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
+            __pyx_v_pulselen = __pyx_v_tolerance;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":154
+            /* "src/urh/cythonext/signalFunctions.pyx":315
+ *                 cur_index += 1
+ *                 pulselen = tolerance
+ *                 cur_state = 1             # <<<<<<<<<<<<<<
  * 
- *     for i in range(0, ns):
- *         dsample = demod_samples[i]             # <<<<<<<<<<<<<<
+ *             elif conseq_zeros > tolerance:
+ */
+            __pyx_v_cur_state = 1;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":310
+ *                 if cur_state == 0: continue
  * 
- *         if dsample == NOISE:
+ *             if conseq_ones > tolerance:             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
  */
-    __pyx_t_7 = __pyx_v_i;
-    __pyx_v_dsample = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_demod_samples.data) + __pyx_t_7)) )));
+            goto __pyx_L14;
+          }
 
-    /* "src/urh/cythonext/signalFunctions.pyx":156
- *         dsample = demod_samples[i]
+          /* "src/urh/cythonext/signalFunctions.pyx":317
+ *                 cur_state = 1
  * 
- *         if dsample == NOISE:             # <<<<<<<<<<<<<<
- *             conseq_noise += 1
- *             conseq_not_noise = 0
+ *             elif conseq_zeros > tolerance:             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
  */
-    __pyx_t_3 = ((__pyx_v_dsample == __pyx_v_NOISE) != 0);
-    if (__pyx_t_3) {
+          __pyx_t_8 = ((__pyx_v_conseq_zeros > __pyx_v_tolerance) != 0);
+          if (__pyx_t_8) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":157
+            /* "src/urh/cythonext/signalFunctions.pyx":318
  * 
- *         if dsample == NOISE:
- *             conseq_noise += 1             # <<<<<<<<<<<<<<
- *             conseq_not_noise = 0
- *         else:
+ *             elif conseq_zeros > tolerance:
+ *                 result[cur_index, 0] = cur_state             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1
  */
-      __pyx_v_conseq_noise = (__pyx_v_conseq_noise + 1);
+            __pyx_t_17 = __pyx_v_cur_index;
+            __pyx_t_18 = 0;
+            *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_17 * __pyx_v_result.strides[0]) )) + __pyx_t_18)) )) = __pyx_v_cur_state;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":158
- *         if dsample == NOISE:
- *             conseq_noise += 1
- *             conseq_not_noise = 0             # <<<<<<<<<<<<<<
- *         else:
- *             conseq_noise = 0
+            /* "src/urh/cythonext/signalFunctions.pyx":319
+ *             elif conseq_zeros > tolerance:
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance             # <<<<<<<<<<<<<<
+ *                 cur_index += 1
+ *                 pulselen = tolerance
  */
-      __pyx_v_conseq_not_noise = 0;
+            __pyx_t_19 = __pyx_v_cur_index;
+            __pyx_t_20 = 1;
+            *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_19 * __pyx_v_result.strides[0]) )) + __pyx_t_20)) )) = (__pyx_v_pulselen - __pyx_v_tolerance);
 
-      /* "src/urh/cythonext/signalFunctions.pyx":156
- *         dsample = demod_samples[i]
- * 
- *         if dsample == NOISE:             # <<<<<<<<<<<<<<
- *             conseq_noise += 1
- *             conseq_not_noise = 0
+            /* "src/urh/cythonext/signalFunctions.pyx":320
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1             # <<<<<<<<<<<<<<
+ *                 pulselen = tolerance
+ *                 cur_state = 0
  */
-      goto __pyx_L9;
-    }
+            __pyx_v_cur_index = (__pyx_v_cur_index + 1);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":160
- *             conseq_not_noise = 0
- *         else:
- *             conseq_noise = 0             # <<<<<<<<<<<<<<
- *             conseq_not_noise += 1
+            /* "src/urh/cythonext/signalFunctions.pyx":321
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1
+ *                 pulselen = tolerance             # <<<<<<<<<<<<<<
+ *                 cur_state = 0
  * 
  */
-    /*else*/ {
-      __pyx_v_conseq_noise = 0;
+            __pyx_v_pulselen = __pyx_v_tolerance;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":161
- *         else:
- *             conseq_noise = 0
- *             conseq_not_noise += 1             # <<<<<<<<<<<<<<
+            /* "src/urh/cythonext/signalFunctions.pyx":322
+ *                 cur_index += 1
+ *                 pulselen = tolerance
+ *                 cur_state = 0             # <<<<<<<<<<<<<<
  * 
- *         if has_oversteuern == 1:
+ *             elif conseq_pause > tolerance:
  */
-      __pyx_v_conseq_not_noise = (__pyx_v_conseq_not_noise + 1);
-    }
-    __pyx_L9:;
+            __pyx_v_cur_state = 0;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":163
- *             conseq_not_noise += 1
+            /* "src/urh/cythonext/signalFunctions.pyx":317
+ *                 cur_state = 1
  * 
- *         if has_oversteuern == 1:             # <<<<<<<<<<<<<<
- *             if has_oversteuern and conseq_noise > 100:
- *                 behind_oversteuern = 1
+ *             elif conseq_zeros > tolerance:             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
  */
-    __pyx_t_3 = ((__pyx_v_has_oversteuern == 1) != 0);
-    if (__pyx_t_3) {
+            goto __pyx_L14;
+          }
 
-      /* "src/urh/cythonext/signalFunctions.pyx":164
+          /* "src/urh/cythonext/signalFunctions.pyx":324
+ *                 cur_state = 0
  * 
- *         if has_oversteuern == 1:
- *             if has_oversteuern and conseq_noise > 100:             # <<<<<<<<<<<<<<
- *                 behind_oversteuern = 1
+ *             elif conseq_pause > tolerance:             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
+ */
+          __pyx_t_8 = ((__pyx_v_conseq_pause > __pyx_v_tolerance) != 0);
+          if (__pyx_t_8) {
+
+            /* "src/urh/cythonext/signalFunctions.pyx":325
  * 
+ *             elif conseq_pause > tolerance:
+ *                 result[cur_index, 0] = cur_state             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1
  */
-      __pyx_t_8 = (__pyx_v_has_oversteuern != 0);
-      if (__pyx_t_8) {
-      } else {
-        __pyx_t_3 = __pyx_t_8;
-        goto __pyx_L12_bool_binop_done;
-      }
-      __pyx_t_8 = ((__pyx_v_conseq_noise > 0x64) != 0);
-      __pyx_t_3 = __pyx_t_8;
-      __pyx_L12_bool_binop_done:;
-      if (__pyx_t_3) {
+            __pyx_t_21 = __pyx_v_cur_index;
+            __pyx_t_22 = 0;
+            *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_21 * __pyx_v_result.strides[0]) )) + __pyx_t_22)) )) = __pyx_v_cur_state;
 
-        /* "src/urh/cythonext/signalFunctions.pyx":165
- *         if has_oversteuern == 1:
- *             if has_oversteuern and conseq_noise > 100:
- *                 behind_oversteuern = 1             # <<<<<<<<<<<<<<
+            /* "src/urh/cythonext/signalFunctions.pyx":326
+ *             elif conseq_pause > tolerance:
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance             # <<<<<<<<<<<<<<
+ *                 cur_index += 1
+ *                 pulselen = tolerance
+ */
+            __pyx_t_23 = __pyx_v_cur_index;
+            __pyx_t_24 = 1;
+            *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_23 * __pyx_v_result.strides[0]) )) + __pyx_t_24)) )) = (__pyx_v_pulselen - __pyx_v_tolerance);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":327
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1             # <<<<<<<<<<<<<<
+ *                 pulselen = tolerance
+ *                 cur_state = 42
+ */
+            __pyx_v_cur_index = (__pyx_v_cur_index + 1);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":328
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1
+ *                 pulselen = tolerance             # <<<<<<<<<<<<<<
+ *                 cur_state = 42
  * 
- *             if behind_oversteuern and conseq_not_noise == 3:
  */
-        __pyx_v_behind_oversteuern = 1;
+            __pyx_v_pulselen = __pyx_v_tolerance;
 
-        /* "src/urh/cythonext/signalFunctions.pyx":164
+            /* "src/urh/cythonext/signalFunctions.pyx":329
+ *                 cur_index += 1
+ *                 pulselen = tolerance
+ *                 cur_state = 42             # <<<<<<<<<<<<<<
  * 
- *         if has_oversteuern == 1:
- *             if has_oversteuern and conseq_noise > 100:             # <<<<<<<<<<<<<<
- *                 behind_oversteuern = 1
+ *     # Letzen anfgen
+ */
+            __pyx_v_cur_state = 42;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":324
+ *                 cur_state = 0
  * 
+ *             elif conseq_pause > tolerance:             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
  */
+          }
+          __pyx_L14:;
+          __pyx_L8_continue:;
+        }
       }
 
-      /* "src/urh/cythonext/signalFunctions.pyx":167
- *                 behind_oversteuern = 1
- * 
- *             if behind_oversteuern and conseq_not_noise == 3:             # <<<<<<<<<<<<<<
- *                 return i - 3
+      /* "src/urh/cythonext/signalFunctions.pyx":290
+ *         cur_state = 0
  * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(ns-1):
+ *             pulselen += 1
  */
-      __pyx_t_8 = (__pyx_v_behind_oversteuern != 0);
-      if (__pyx_t_8) {
-      } else {
-        __pyx_t_3 = __pyx_t_8;
-        goto __pyx_L15_bool_binop_done;
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L7;
+        }
+        __pyx_L7:;
       }
-      __pyx_t_8 = ((__pyx_v_conseq_not_noise == 3) != 0);
-      __pyx_t_3 = __pyx_t_8;
-      __pyx_L15_bool_binop_done:;
-      if (__pyx_t_3) {
+  }
 
-        /* "src/urh/cythonext/signalFunctions.pyx":168
- * 
- *             if behind_oversteuern and conseq_not_noise == 3:
- *                 return i - 3             # <<<<<<<<<<<<<<
+  /* "src/urh/cythonext/signalFunctions.pyx":332
  * 
- *         elif conseq_not_noise == 3:
+ *     # Letzen anfgen
+ *     cdef unsigned long long len_result = len(result)             # <<<<<<<<<<<<<<
+ *     if cur_index < len_result:
+ *         result[cur_index, 0] = cur_state
  */
-        __pyx_r = (__pyx_v_i - 3);
-        goto __pyx_L0;
+  __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_v_result, 2, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 332, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_2 = PyObject_Length(__pyx_t_6); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 332, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_len_result = __pyx_t_2;
 
-        /* "src/urh/cythonext/signalFunctions.pyx":167
- *                 behind_oversteuern = 1
- * 
- *             if behind_oversteuern and conseq_not_noise == 3:             # <<<<<<<<<<<<<<
- *                 return i - 3
+  /* "src/urh/cythonext/signalFunctions.pyx":333
+ *     # Letzen anfgen
+ *     cdef unsigned long long len_result = len(result)
+ *     if cur_index < len_result:             # <<<<<<<<<<<<<<
+ *         result[cur_index, 0] = cur_state
+ *         result[cur_index, 1] = pulselen
+ */
+  __pyx_t_8 = ((__pyx_v_cur_index < __pyx_v_len_result) != 0);
+  if (__pyx_t_8) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":334
+ *     cdef unsigned long long len_result = len(result)
+ *     if cur_index < len_result:
+ *         result[cur_index, 0] = cur_state             # <<<<<<<<<<<<<<
+ *         result[cur_index, 1] = pulselen
+ *         cur_index += 1
+ */
+    __pyx_t_10 = __pyx_v_cur_index;
+    __pyx_t_25 = 0;
+    *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_10 * __pyx_v_result.strides[0]) )) + __pyx_t_25)) )) = __pyx_v_cur_state;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":335
+ *     if cur_index < len_result:
+ *         result[cur_index, 0] = cur_state
+ *         result[cur_index, 1] = pulselen             # <<<<<<<<<<<<<<
+ *         cur_index += 1
  * 
  */
-      }
+    __pyx_t_11 = __pyx_v_cur_index;
+    __pyx_t_26 = 1;
+    *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_11 * __pyx_v_result.strides[0]) )) + __pyx_t_26)) )) = __pyx_v_pulselen;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":163
- *             conseq_not_noise += 1
+    /* "src/urh/cythonext/signalFunctions.pyx":336
+ *         result[cur_index, 0] = cur_state
+ *         result[cur_index, 1] = pulselen
+ *         cur_index += 1             # <<<<<<<<<<<<<<
  * 
- *         if has_oversteuern == 1:             # <<<<<<<<<<<<<<
- *             if has_oversteuern and conseq_noise > 100:
- *                 behind_oversteuern = 1
+ *     if cur_index > len_result:
  */
-      goto __pyx_L10;
-    }
+    __pyx_v_cur_index = (__pyx_v_cur_index + 1);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":170
- *                 return i - 3
+    /* "src/urh/cythonext/signalFunctions.pyx":333
+ *     # Letzen anfgen
+ *     cdef unsigned long long len_result = len(result)
+ *     if cur_index < len_result:             # <<<<<<<<<<<<<<
+ *         result[cur_index, 0] = cur_state
+ *         result[cur_index, 1] = pulselen
+ */
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":338
+ *         cur_index += 1
  * 
- *         elif conseq_not_noise == 3:             # <<<<<<<<<<<<<<
- *             return i -3
+ *     if cur_index > len_result:             # <<<<<<<<<<<<<<
+ *         cur_index = len_result
  * 
  */
-    __pyx_t_3 = ((__pyx_v_conseq_not_noise == 3) != 0);
-    if (__pyx_t_3) {
+  __pyx_t_8 = ((__pyx_v_cur_index > __pyx_v_len_result) != 0);
+  if (__pyx_t_8) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":171
+    /* "src/urh/cythonext/signalFunctions.pyx":339
  * 
- *         elif conseq_not_noise == 3:
- *             return i -3             # <<<<<<<<<<<<<<
+ *     if cur_index > len_result:
+ *         cur_index = len_result             # <<<<<<<<<<<<<<
  * 
- *     return 0
+ *     return result[:cur_index]
  */
-      __pyx_r = (__pyx_v_i - 3);
-      goto __pyx_L0;
+    __pyx_v_cur_index = __pyx_v_len_result;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":170
- *                 return i - 3
+    /* "src/urh/cythonext/signalFunctions.pyx":338
+ *         cur_index += 1
  * 
- *         elif conseq_not_noise == 3:             # <<<<<<<<<<<<<<
- *             return i -3
+ *     if cur_index > len_result:             # <<<<<<<<<<<<<<
+ *         cur_index = len_result
  * 
  */
-    }
-    __pyx_L10:;
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":173
- *             return i -3
- * 
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cpdef unsigned long long find_signal_end(float[::1] demod_samples, int mod_type):
- */
-  __pyx_r = 0;
+  /* "src/urh/cythonext/signalFunctions.pyx":341
+ *         cur_index = len_result
+ * 
+ *     return result[:cur_index]             # <<<<<<<<<<<<<<
+ * 
+ * cpdef unsigned long long[:, ::1] grab_pulse_lens_stream(float[::1] samples, float treshold, unsigned int tolerance,
+ */
+  __pyx_t_7.data = __pyx_v_result.data;
+  __pyx_t_7.memview = __pyx_v_result.memview;
+  __PYX_INC_MEMVIEW(&__pyx_t_7, 0);
+  __pyx_t_27 = -1;
+  if (unlikely(__pyx_memoryview_slice_memviewslice(
+    &__pyx_t_7,
+    __pyx_v_result.shape[0], __pyx_v_result.strides[0], __pyx_v_result.suboffsets[0],
+    0,
+    0,
+    &__pyx_t_27,
+    0,
+    __pyx_v_cur_index,
+    0,
+    0,
+    1,
+    0,
+    1) < 0))
+{
+    __PYX_ERR(0, 341, __pyx_L1_error)
+}
+
+__pyx_t_7.shape[1] = __pyx_v_result.shape[1];
+__pyx_t_7.strides[1] = __pyx_v_result.strides[1];
+    __pyx_t_7.suboffsets[1] = -1;
+
+__pyx_r = __pyx_t_7;
+  __pyx_t_7.memview = NULL;
+  __pyx_t_7.data = NULL;
   goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":130
- *     return np.asarray(result)
- * 
- * cpdef unsigned long long find_signal_start(float[::1] demod_samples, int mod_type):             # <<<<<<<<<<<<<<
+  /* "src/urh/cythonext/signalFunctions.pyx":260
+ *     return ns
  * 
- *     cdef unsigned long long i, ns, l
+ * cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples,             # <<<<<<<<<<<<<<
+ *                                                  float treshold, unsigned int tolerance, int mod_type):
+ *     """
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_WriteUnraisable("src.urh.cythonext.signalFunctions.find_signal_start", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
-  __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_7, 1);
+  __pyx_r.data = NULL;
+  __pyx_r.memview = NULL;
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.grab_pulse_lens", __pyx_clineno, __pyx_lineno, __pyx_filename);
+
+  goto __pyx_L2;
   __pyx_L0:;
+  if (unlikely(!__pyx_r.memview)) {
+    PyErr_SetString(PyExc_TypeError, "Memoryview return value is not initialized");
+  }
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_result, 1);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_5find_signal_start(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_5find_signal_start(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  __Pyx_memviewslice __pyx_v_demod_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11grab_pulse_lens(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3src_3urh_9cythonext_15signalFunctions_10grab_pulse_lens[] = "\n    Holt sich die Pulsl\303\244ngen aus den quadraturdemodulierten Samples\n    @param samples: Samples nach der QAD\n    @param treshold: Alles \303\274ber der Treshold ist ein Einserpuls, alles darunter 0er Puls\n    @return: Ein 2D Array arr.\n    arr[i] gibt Position an.\n    arr[i][0] gibt an ob Einspuls (arr[i][0] = 1) Nullpuls (arr[i][0] = 0) Pause (arr[i][0] = 42)\n    arr[i][1] gibt die L\303\244nge des Pulses bzw. der Pause an.\n    ";
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11grab_pulse_lens(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
+  float __pyx_v_treshold;
+  unsigned int __pyx_v_tolerance;
   int __pyx_v_mod_type;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("find_signal_start (wrapper)", 0);
+  __Pyx_RefNannySetupContext("grab_pulse_lens (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_demod_samples,&__pyx_n_s_mod_type,0};
-    PyObject* values[2] = {0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_samples,&__pyx_n_s_treshold,&__pyx_n_s_tolerance,&__pyx_n_s_mod_type,0};
+    PyObject* values[4] = {0,0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
         case  0: break;
@@ -4024,241 +6256,894 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_5find_signal_st
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_demod_samples)) != 0)) kw_args--;
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_samples)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_treshold)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens", 1, 4, 4, 1); __PYX_ERR(0, 260, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_tolerance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens", 1, 4, 4, 2); __PYX_ERR(0, 260, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("find_signal_start", 1, 2, 2, 1); __PYX_ERR(0, 130, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens", 1, 4, 4, 3); __PYX_ERR(0, 260, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_signal_start") < 0)) __PYX_ERR(0, 130, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "grab_pulse_lens") < 0)) __PYX_ERR(0, 260, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_demod_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_demod_samples.memview)) __PYX_ERR(0, 130, __pyx_L3_error)
-    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 130, __pyx_L3_error)
+    __pyx_v_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_samples.memview)) __PYX_ERR(0, 260, __pyx_L3_error)
+    __pyx_v_treshold = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_treshold == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L3_error)
+    __pyx_v_tolerance = __Pyx_PyInt_As_unsigned_int(values[2]); if (unlikely((__pyx_v_tolerance == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L3_error)
+    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("find_signal_start", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 130, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("grab_pulse_lens", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 260, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.find_signal_start", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.grab_pulse_lens", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_4find_signal_start(__pyx_self, __pyx_v_demod_samples, __pyx_v_mod_type);
+  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_10grab_pulse_lens(__pyx_self, __pyx_v_samples, __pyx_v_treshold, __pyx_v_tolerance, __pyx_v_mod_type);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_4find_signal_start(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type) {
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_10grab_pulse_lens(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, float __pyx_v_treshold, unsigned int __pyx_v_tolerance, int __pyx_v_mod_type) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("find_signal_start", 0);
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("grab_pulse_lens", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_start(__pyx_v_demod_samples, __pyx_v_mod_type, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 130, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_1 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx_v_samples, __pyx_v_treshold, __pyx_v_tolerance, __pyx_v_mod_type, 0); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __pyx_t_2 = __pyx_memoryview_fromslice(__pyx_t_1, 2, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.find_signal_start", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.grab_pulse_lens", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __PYX_XDEC_MEMVIEW(&__pyx_v_demod_samples, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_samples, 1);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":175
- *     return 0
+/* "src/urh/cythonext/signalFunctions.pyx":343
+ *     return result[:cur_index]
+ * 
+ * cpdef unsigned long long[:, ::1] grab_pulse_lens_stream(float[::1] samples, float treshold, unsigned int tolerance,             # <<<<<<<<<<<<<<
+ *                                                         int mod_type, unsigned long long[::1] state):
+ *     """
+ */
+
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13grab_pulse_lens_stream(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static __Pyx_memviewslice __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens_stream(__Pyx_memviewslice __pyx_v_samples, float __pyx_v_treshold, unsigned int __pyx_v_tolerance, int __pyx_v_mod_type, __Pyx_memviewslice __pyx_v_state, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  unsigned PY_LONG_LONG __pyx_v_i;
+  unsigned PY_LONG_LONG __pyx_v_ns;
+  unsigned PY_LONG_LONG __pyx_v_cur_index;
+  float __pyx_v_s;
+  float __pyx_v_NOISE;
+  unsigned PY_LONG_LONG __pyx_v_pulselen;
+  unsigned PY_LONG_LONG __pyx_v_conseq_ones;
+  unsigned PY_LONG_LONG __pyx_v_conseq_zeros;
+  unsigned PY_LONG_LONG __pyx_v_conseq_pause;
+  unsigned PY_LONG_LONG __pyx_v_cur_state;
+  __Pyx_memviewslice __pyx_v_result = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_r = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  __Pyx_memviewslice __pyx_t_12 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_13;
+  Py_ssize_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  unsigned PY_LONG_LONG __pyx_t_16;
+  unsigned PY_LONG_LONG __pyx_t_17;
+  unsigned PY_LONG_LONG __pyx_t_18;
+  int __pyx_t_19;
+  unsigned PY_LONG_LONG __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  unsigned PY_LONG_LONG __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  Py_ssize_t __pyx_t_27;
+  Py_ssize_t __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  int __pyx_t_30;
+  __Pyx_RefNannySetupContext("grab_pulse_lens_stream", 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":353
+ *     @return: Array of completed pulses (pulse type, length) like grab_pulse_lens
+ *     """
+ *     cdef unsigned long long i, ns = len(samples), cur_index = 0             # <<<<<<<<<<<<<<
+ *     cdef float s
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)
+ */
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ns = __pyx_t_2;
+  __pyx_v_cur_index = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":355
+ *     cdef unsigned long long i, ns = len(samples), cur_index = 0
+ *     cdef float s
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)             # <<<<<<<<<<<<<<
+ *     cdef unsigned long long pulselen = state[2], conseq_ones = state[3], conseq_zeros = state[4]
+ *     cdef unsigned long long conseq_pause = state[5]
+ */
+  __pyx_v_NOISE = __pyx_f_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(__pyx_v_mod_type, 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":356
+ *     cdef float s
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)
+ *     cdef unsigned long long pulselen = state[2], conseq_ones = state[3], conseq_zeros = state[4]             # <<<<<<<<<<<<<<
+ *     cdef unsigned long long conseq_pause = state[5]
+ *     cdef unsigned long long cur_state = state[1]
+ */
+  __pyx_t_3 = 2;
+  __pyx_v_pulselen = (*((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_3)) )));
+  __pyx_t_4 = 3;
+  __pyx_v_conseq_ones = (*((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_4)) )));
+  __pyx_t_5 = 4;
+  __pyx_v_conseq_zeros = (*((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_5)) )));
+
+  /* "src/urh/cythonext/signalFunctions.pyx":357
+ *     cdef float NOISE = get_noise_for_mod_type(mod_type)
+ *     cdef unsigned long long pulselen = state[2], conseq_ones = state[3], conseq_zeros = state[4]
+ *     cdef unsigned long long conseq_pause = state[5]             # <<<<<<<<<<<<<<
+ *     cdef unsigned long long cur_state = state[1]
+ * 
+ */
+  __pyx_t_6 = 5;
+  __pyx_v_conseq_pause = (*((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_6)) )));
+
+  /* "src/urh/cythonext/signalFunctions.pyx":358
+ *     cdef unsigned long long pulselen = state[2], conseq_ones = state[3], conseq_zeros = state[4]
+ *     cdef unsigned long long conseq_pause = state[5]
+ *     cdef unsigned long long cur_state = state[1]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
+ */
+  __pyx_t_7 = 1;
+  __pyx_v_cur_state = (*((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_7)) )));
+
+  /* "src/urh/cythonext/signalFunctions.pyx":360
+ *     cdef unsigned long long cur_state = state[1]
+ * 
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")             # <<<<<<<<<<<<<<
+ *     if ns == 0:
+ *         return result
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_ns); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_1);
+  __Pyx_INCREF(__pyx_int_2);
+  __Pyx_GIVEREF(__pyx_int_2);
+  PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_int_2);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_9);
+  __pyx_t_9 = 0;
+  __pyx_t_9 = PyDict_New(); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_n_s_uint64); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  if (PyDict_SetItem(__pyx_t_9, __pyx_n_s_dtype, __pyx_t_11) < 0) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (PyDict_SetItem(__pyx_t_9, __pyx_n_s_order, __pyx_n_u_C) < 0) __PYX_ERR(0, 360, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_1, __pyx_t_9); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_12 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_PY_LONG_LONG(__pyx_t_11);
+  if (unlikely(!__pyx_t_12.memview)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_v_result = __pyx_t_12;
+  __pyx_t_12.memview = NULL;
+  __pyx_t_12.data = NULL;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":361
+ * 
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
+ *     if ns == 0:             # <<<<<<<<<<<<<<
+ *         return result
+ * 
+ */
+  __pyx_t_13 = ((__pyx_v_ns == 0) != 0);
+  if (__pyx_t_13) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":362
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
+ *     if ns == 0:
+ *         return result             # <<<<<<<<<<<<<<
+ * 
+ *     if state[0] == 0:
+ */
+    __PYX_INC_MEMVIEW(&__pyx_v_result, 0);
+    __pyx_r = __pyx_v_result;
+    goto __pyx_L0;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":361
+ * 
+ *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
+ *     if ns == 0:             # <<<<<<<<<<<<<<
+ *         return result
+ * 
+ */
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":364
+ *         return result
+ * 
+ *     if state[0] == 0:             # <<<<<<<<<<<<<<
+ *         s = samples[0]
+ *         if s == NOISE:
+ */
+  __pyx_t_14 = 0;
+  __pyx_t_13 = (((*((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_14)) ))) == 0) != 0);
+  if (__pyx_t_13) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":365
+ * 
+ *     if state[0] == 0:
+ *         s = samples[0]             # <<<<<<<<<<<<<<
+ *         if s == NOISE:
+ *             cur_state = 42
+ */
+    __pyx_t_15 = 0;
+    __pyx_v_s = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_samples.data) + __pyx_t_15)) )));
+
+    /* "src/urh/cythonext/signalFunctions.pyx":366
+ *     if state[0] == 0:
+ *         s = samples[0]
+ *         if s == NOISE:             # <<<<<<<<<<<<<<
+ *             cur_state = 42
+ *         elif s > treshold:
+ */
+    __pyx_t_13 = ((__pyx_v_s == __pyx_v_NOISE) != 0);
+    if (__pyx_t_13) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":367
+ *         s = samples[0]
+ *         if s == NOISE:
+ *             cur_state = 42             # <<<<<<<<<<<<<<
+ *         elif s > treshold:
+ *             cur_state = 1
+ */
+      __pyx_v_cur_state = 42;
+
+      /* "src/urh/cythonext/signalFunctions.pyx":366
+ *     if state[0] == 0:
+ *         s = samples[0]
+ *         if s == NOISE:             # <<<<<<<<<<<<<<
+ *             cur_state = 42
+ *         elif s > treshold:
+ */
+      goto __pyx_L5;
+    }
+
+    /* "src/urh/cythonext/signalFunctions.pyx":368
+ *         if s == NOISE:
+ *             cur_state = 42
+ *         elif s > treshold:             # <<<<<<<<<<<<<<
+ *             cur_state = 1
+ *         else:
+ */
+    __pyx_t_13 = ((__pyx_v_s > __pyx_v_treshold) != 0);
+    if (__pyx_t_13) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":369
+ *             cur_state = 42
+ *         elif s > treshold:
+ *             cur_state = 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             cur_state = 0
+ */
+      __pyx_v_cur_state = 1;
+
+      /* "src/urh/cythonext/signalFunctions.pyx":368
+ *         if s == NOISE:
+ *             cur_state = 42
+ *         elif s > treshold:             # <<<<<<<<<<<<<<
+ *             cur_state = 1
+ *         else:
+ */
+      goto __pyx_L5;
+    }
+
+    /* "src/urh/cythonext/signalFunctions.pyx":371
+ *             cur_state = 1
+ *         else:
+ *             cur_state = 0             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+    /*else*/ {
+      __pyx_v_cur_state = 0;
+    }
+    __pyx_L5:;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":364
+ *         return result
  * 
- * cpdef unsigned long long find_signal_end(float[::1] demod_samples, int mod_type):             # <<<<<<<<<<<<<<
+ *     if state[0] == 0:             # <<<<<<<<<<<<<<
+ *         s = samples[0]
+ *         if s == NOISE:
+ */
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":373
+ *             cur_state = 0
  * 
- *     cdef unsigned long long i
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(ns):
+ *             pulselen += 1
  */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
 
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_7find_signal_end(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_end(__Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type, CYTHON_UNUSED int __pyx_skip_dispatch) {
-  unsigned PY_LONG_LONG __pyx_v_i;
-  float __pyx_v_dsample;
-  int __pyx_v_conseq_not_noise;
-  float __pyx_v_NOISE;
-  unsigned PY_LONG_LONG __pyx_v_ns;
-  unsigned PY_LONG_LONG __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  unsigned PY_LONG_LONG __pyx_t_3;
-  unsigned PY_LONG_LONG __pyx_t_4;
-  int __pyx_t_5;
-  __Pyx_RefNannySetupContext("find_signal_end", 0);
+        /* "src/urh/cythonext/signalFunctions.pyx":374
+ * 
+ *     with nogil:
+ *         for i in range(ns):             # <<<<<<<<<<<<<<
+ *             pulselen += 1
+ *             s = samples[i]
+ */
+        __pyx_t_16 = __pyx_v_ns;
+        for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+          __pyx_v_i = __pyx_t_17;
+
+          /* "src/urh/cythonext/signalFunctions.pyx":375
+ *     with nogil:
+ *         for i in range(ns):
+ *             pulselen += 1             # <<<<<<<<<<<<<<
+ *             s = samples[i]
+ *             if s == NOISE:
+ */
+          __pyx_v_pulselen = (__pyx_v_pulselen + 1);
+
+          /* "src/urh/cythonext/signalFunctions.pyx":376
+ *         for i in range(ns):
+ *             pulselen += 1
+ *             s = samples[i]             # <<<<<<<<<<<<<<
+ *             if s == NOISE:
+ *                 conseq_pause += 1
+ */
+          __pyx_t_18 = __pyx_v_i;
+          __pyx_v_s = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_samples.data) + __pyx_t_18)) )));
+
+          /* "src/urh/cythonext/signalFunctions.pyx":377
+ *             pulselen += 1
+ *             s = samples[i]
+ *             if s == NOISE:             # <<<<<<<<<<<<<<
+ *                 conseq_pause += 1
+ *                 conseq_ones = 0
+ */
+          __pyx_t_13 = ((__pyx_v_s == __pyx_v_NOISE) != 0);
+          if (__pyx_t_13) {
+
+            /* "src/urh/cythonext/signalFunctions.pyx":378
+ *             s = samples[i]
+ *             if s == NOISE:
+ *                 conseq_pause += 1             # <<<<<<<<<<<<<<
+ *                 conseq_ones = 0
+ *                 conseq_zeros = 0
+ */
+            __pyx_v_conseq_pause = (__pyx_v_conseq_pause + 1);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":379
+ *             if s == NOISE:
+ *                 conseq_pause += 1
+ *                 conseq_ones = 0             # <<<<<<<<<<<<<<
+ *                 conseq_zeros = 0
+ *                 if cur_state == 42: continue
+ */
+            __pyx_v_conseq_ones = 0;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":380
+ *                 conseq_pause += 1
+ *                 conseq_ones = 0
+ *                 conseq_zeros = 0             # <<<<<<<<<<<<<<
+ *                 if cur_state == 42: continue
+ *             elif s > treshold:
+ */
+            __pyx_v_conseq_zeros = 0;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":381
+ *                 conseq_ones = 0
+ *                 conseq_zeros = 0
+ *                 if cur_state == 42: continue             # <<<<<<<<<<<<<<
+ *             elif s > treshold:
+ *                 conseq_ones += 1
+ */
+            __pyx_t_13 = ((__pyx_v_cur_state == 42) != 0);
+            if (__pyx_t_13) {
+              goto __pyx_L9_continue;
+            }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":179
- *     cdef unsigned long long i
- *     cdef float dsample
- *     cdef int conseq_not_noise = 0             # <<<<<<<<<<<<<<
- *     cdef float NOISE = get_noise_for_mod_type(mod_type)
- *     cdef unsigned long long ns = len(demod_samples)
+            /* "src/urh/cythonext/signalFunctions.pyx":377
+ *             pulselen += 1
+ *             s = samples[i]
+ *             if s == NOISE:             # <<<<<<<<<<<<<<
+ *                 conseq_pause += 1
+ *                 conseq_ones = 0
  */
-  __pyx_v_conseq_not_noise = 0;
+            goto __pyx_L11;
+          }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":180
- *     cdef float dsample
- *     cdef int conseq_not_noise = 0
- *     cdef float NOISE = get_noise_for_mod_type(mod_type)             # <<<<<<<<<<<<<<
- *     cdef unsigned long long ns = len(demod_samples)
- * 
+          /* "src/urh/cythonext/signalFunctions.pyx":382
+ *                 conseq_zeros = 0
+ *                 if cur_state == 42: continue
+ *             elif s > treshold:             # <<<<<<<<<<<<<<
+ *                 conseq_ones += 1
+ *                 conseq_zeros = 0
+ */
+          __pyx_t_13 = ((__pyx_v_s > __pyx_v_treshold) != 0);
+          if (__pyx_t_13) {
+
+            /* "src/urh/cythonext/signalFunctions.pyx":383
+ *                 if cur_state == 42: continue
+ *             elif s > treshold:
+ *                 conseq_ones += 1             # <<<<<<<<<<<<<<
+ *                 conseq_zeros = 0
+ *                 conseq_pause = 0
+ */
+            __pyx_v_conseq_ones = (__pyx_v_conseq_ones + 1);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":384
+ *             elif s > treshold:
+ *                 conseq_ones += 1
+ *                 conseq_zeros = 0             # <<<<<<<<<<<<<<
+ *                 conseq_pause = 0
+ *                 if cur_state == 1: continue
+ */
+            __pyx_v_conseq_zeros = 0;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":385
+ *                 conseq_ones += 1
+ *                 conseq_zeros = 0
+ *                 conseq_pause = 0             # <<<<<<<<<<<<<<
+ *                 if cur_state == 1: continue
+ *             else:
  */
-  __pyx_v_NOISE = __pyx_f_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(__pyx_v_mod_type, 0);
+            __pyx_v_conseq_pause = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":181
- *     cdef int conseq_not_noise = 0
- *     cdef float NOISE = get_noise_for_mod_type(mod_type)
- *     cdef unsigned long long ns = len(demod_samples)             # <<<<<<<<<<<<<<
- * 
- *     for i in range(ns, 0, -1):
+            /* "src/urh/cythonext/signalFunctions.pyx":386
+ *                 conseq_zeros = 0
+ *                 conseq_pause = 0
+ *                 if cur_state == 1: continue             # <<<<<<<<<<<<<<
+ *             else:
+ *                 conseq_zeros += 1
  */
-  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_demod_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 181, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ns = __pyx_t_2;
+            __pyx_t_13 = ((__pyx_v_cur_state == 1) != 0);
+            if (__pyx_t_13) {
+              goto __pyx_L9_continue;
+            }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":183
- *     cdef unsigned long long ns = len(demod_samples)
- * 
- *     for i in range(ns, 0, -1):             # <<<<<<<<<<<<<<
- *         dsample = demod_samples[i]
- * 
+            /* "src/urh/cythonext/signalFunctions.pyx":382
+ *                 conseq_zeros = 0
+ *                 if cur_state == 42: continue
+ *             elif s > treshold:             # <<<<<<<<<<<<<<
+ *                 conseq_ones += 1
+ *                 conseq_zeros = 0
  */
-  for (__pyx_t_3 = __pyx_v_ns + 1; __pyx_t_3 > 0 + 1; ) { __pyx_t_3-=1;
-    __pyx_v_i = __pyx_t_3;
+            goto __pyx_L11;
+          }
 
-    /* "src/urh/cythonext/signalFunctions.pyx":184
- * 
- *     for i in range(ns, 0, -1):
- *         dsample = demod_samples[i]             # <<<<<<<<<<<<<<
- * 
- *         if dsample > NOISE:
+          /* "src/urh/cythonext/signalFunctions.pyx":388
+ *                 if cur_state == 1: continue
+ *             else:
+ *                 conseq_zeros += 1             # <<<<<<<<<<<<<<
+ *                 conseq_ones = 0
+ *                 conseq_pause = 0
  */
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_v_dsample = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_demod_samples.data) + __pyx_t_4)) )));
+          /*else*/ {
+            __pyx_v_conseq_zeros = (__pyx_v_conseq_zeros + 1);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":186
- *         dsample = demod_samples[i]
- * 
- *         if dsample > NOISE:             # <<<<<<<<<<<<<<
- *             conseq_not_noise += 1
- * 
+            /* "src/urh/cythonext/signalFunctions.pyx":389
+ *             else:
+ *                 conseq_zeros += 1
+ *                 conseq_ones = 0             # <<<<<<<<<<<<<<
+ *                 conseq_pause = 0
+ *                 if cur_state == 0: continue
  */
-    __pyx_t_5 = ((__pyx_v_dsample > __pyx_v_NOISE) != 0);
-    if (__pyx_t_5) {
+            __pyx_v_conseq_ones = 0;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":187
- * 
- *         if dsample > NOISE:
- *             conseq_not_noise += 1             # <<<<<<<<<<<<<<
+            /* "src/urh/cythonext/signalFunctions.pyx":390
+ *                 conseq_zeros += 1
+ *                 conseq_ones = 0
+ *                 conseq_pause = 0             # <<<<<<<<<<<<<<
+ *                 if cur_state == 0: continue
  * 
- *         if conseq_not_noise == 3:
  */
-      __pyx_v_conseq_not_noise = (__pyx_v_conseq_not_noise + 1);
+            __pyx_v_conseq_pause = 0;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":186
- *         dsample = demod_samples[i]
- * 
- *         if dsample > NOISE:             # <<<<<<<<<<<<<<
- *             conseq_not_noise += 1
+            /* "src/urh/cythonext/signalFunctions.pyx":391
+ *                 conseq_ones = 0
+ *                 conseq_pause = 0
+ *                 if cur_state == 0: continue             # <<<<<<<<<<<<<<
  * 
+ *             if conseq_ones > tolerance or conseq_zeros > tolerance or conseq_pause > tolerance:
  */
-    }
+            __pyx_t_13 = ((__pyx_v_cur_state == 0) != 0);
+            if (__pyx_t_13) {
+              goto __pyx_L9_continue;
+            }
+          }
+          __pyx_L11:;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":189
- *             conseq_not_noise += 1
+          /* "src/urh/cythonext/signalFunctions.pyx":393
+ *                 if cur_state == 0: continue
  * 
- *         if conseq_not_noise == 3:             # <<<<<<<<<<<<<<
- *             return i + 3
+ *             if conseq_ones > tolerance or conseq_zeros > tolerance or conseq_pause > tolerance:             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
+ */
+          __pyx_t_19 = ((__pyx_v_conseq_ones > __pyx_v_tolerance) != 0);
+          if (!__pyx_t_19) {
+          } else {
+            __pyx_t_13 = __pyx_t_19;
+            goto __pyx_L16_bool_binop_done;
+          }
+          __pyx_t_19 = ((__pyx_v_conseq_zeros > __pyx_v_tolerance) != 0);
+          if (!__pyx_t_19) {
+          } else {
+            __pyx_t_13 = __pyx_t_19;
+            goto __pyx_L16_bool_binop_done;
+          }
+          __pyx_t_19 = ((__pyx_v_conseq_pause > __pyx_v_tolerance) != 0);
+          __pyx_t_13 = __pyx_t_19;
+          __pyx_L16_bool_binop_done:;
+          if (__pyx_t_13) {
+
+            /* "src/urh/cythonext/signalFunctions.pyx":394
+ * 
+ *             if conseq_ones > tolerance or conseq_zeros > tolerance or conseq_pause > tolerance:
+ *                 result[cur_index, 0] = cur_state             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1
+ */
+            __pyx_t_20 = __pyx_v_cur_index;
+            __pyx_t_21 = 0;
+            *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_20 * __pyx_v_result.strides[0]) )) + __pyx_t_21)) )) = __pyx_v_cur_state;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":395
+ *             if conseq_ones > tolerance or conseq_zeros > tolerance or conseq_pause > tolerance:
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance             # <<<<<<<<<<<<<<
+ *                 cur_index += 1
+ *                 pulselen = tolerance
+ */
+            __pyx_t_22 = __pyx_v_cur_index;
+            __pyx_t_23 = 1;
+            *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_22 * __pyx_v_result.strides[0]) )) + __pyx_t_23)) )) = (__pyx_v_pulselen - __pyx_v_tolerance);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":396
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1             # <<<<<<<<<<<<<<
+ *                 pulselen = tolerance
+ *                 if conseq_ones > tolerance:
+ */
+            __pyx_v_cur_index = (__pyx_v_cur_index + 1);
+
+            /* "src/urh/cythonext/signalFunctions.pyx":397
+ *                 result[cur_index, 1] = pulselen - tolerance
+ *                 cur_index += 1
+ *                 pulselen = tolerance             # <<<<<<<<<<<<<<
+ *                 if conseq_ones > tolerance:
+ *                     cur_state = 1
+ */
+            __pyx_v_pulselen = __pyx_v_tolerance;
+
+            /* "src/urh/cythonext/signalFunctions.pyx":398
+ *                 cur_index += 1
+ *                 pulselen = tolerance
+ *                 if conseq_ones > tolerance:             # <<<<<<<<<<<<<<
+ *                     cur_state = 1
+ *                 elif conseq_zeros > tolerance:
+ */
+            __pyx_t_13 = ((__pyx_v_conseq_ones > __pyx_v_tolerance) != 0);
+            if (__pyx_t_13) {
+
+              /* "src/urh/cythonext/signalFunctions.pyx":399
+ *                 pulselen = tolerance
+ *                 if conseq_ones > tolerance:
+ *                     cur_state = 1             # <<<<<<<<<<<<<<
+ *                 elif conseq_zeros > tolerance:
+ *                     cur_state = 0
+ */
+              __pyx_v_cur_state = 1;
+
+              /* "src/urh/cythonext/signalFunctions.pyx":398
+ *                 cur_index += 1
+ *                 pulselen = tolerance
+ *                 if conseq_ones > tolerance:             # <<<<<<<<<<<<<<
+ *                     cur_state = 1
+ *                 elif conseq_zeros > tolerance:
+ */
+              goto __pyx_L19;
+            }
+
+            /* "src/urh/cythonext/signalFunctions.pyx":400
+ *                 if conseq_ones > tolerance:
+ *                     cur_state = 1
+ *                 elif conseq_zeros > tolerance:             # <<<<<<<<<<<<<<
+ *                     cur_state = 0
+ *                 else:
+ */
+            __pyx_t_13 = ((__pyx_v_conseq_zeros > __pyx_v_tolerance) != 0);
+            if (__pyx_t_13) {
+
+              /* "src/urh/cythonext/signalFunctions.pyx":401
+ *                     cur_state = 1
+ *                 elif conseq_zeros > tolerance:
+ *                     cur_state = 0             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     cur_state = 42
+ */
+              __pyx_v_cur_state = 0;
+
+              /* "src/urh/cythonext/signalFunctions.pyx":400
+ *                 if conseq_ones > tolerance:
+ *                     cur_state = 1
+ *                 elif conseq_zeros > tolerance:             # <<<<<<<<<<<<<<
+ *                     cur_state = 0
+ *                 else:
+ */
+              goto __pyx_L19;
+            }
+
+            /* "src/urh/cythonext/signalFunctions.pyx":403
+ *                     cur_state = 0
+ *                 else:
+ *                     cur_state = 42             # <<<<<<<<<<<<<<
  * 
+ *     state[0] = 1
  */
-    __pyx_t_5 = ((__pyx_v_conseq_not_noise == 3) != 0);
-    if (__pyx_t_5) {
+            /*else*/ {
+              __pyx_v_cur_state = 42;
+            }
+            __pyx_L19:;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":190
+            /* "src/urh/cythonext/signalFunctions.pyx":393
+ *                 if cur_state == 0: continue
  * 
- *         if conseq_not_noise == 3:
- *             return i + 3             # <<<<<<<<<<<<<<
+ *             if conseq_ones > tolerance or conseq_zeros > tolerance or conseq_pause > tolerance:             # <<<<<<<<<<<<<<
+ *                 result[cur_index, 0] = cur_state
+ *                 result[cur_index, 1] = pulselen - tolerance
+ */
+          }
+          __pyx_L9_continue:;
+        }
+      }
+
+      /* "src/urh/cythonext/signalFunctions.pyx":373
+ *             cur_state = 0
  * 
- *     return ns
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(ns):
+ *             pulselen += 1
  */
-      __pyx_r = (__pyx_v_i + 3);
-      goto __pyx_L0;
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L8;
+        }
+        __pyx_L8:;
+      }
+  }
 
-      /* "src/urh/cythonext/signalFunctions.pyx":189
- *             conseq_not_noise += 1
+  /* "src/urh/cythonext/signalFunctions.pyx":405
+ *                     cur_state = 42
  * 
- *         if conseq_not_noise == 3:             # <<<<<<<<<<<<<<
- *             return i + 3
+ *     state[0] = 1             # <<<<<<<<<<<<<<
+ *     state[1] = cur_state
+ *     state[2] = pulselen
+ */
+  __pyx_t_24 = 0;
+  *((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_24)) )) = 1;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":406
  * 
+ *     state[0] = 1
+ *     state[1] = cur_state             # <<<<<<<<<<<<<<
+ *     state[2] = pulselen
+ *     state[3] = conseq_ones
  */
-    }
-  }
+  __pyx_t_25 = 1;
+  *((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_25)) )) = __pyx_v_cur_state;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":192
- *             return i + 3
+  /* "src/urh/cythonext/signalFunctions.pyx":407
+ *     state[0] = 1
+ *     state[1] = cur_state
+ *     state[2] = pulselen             # <<<<<<<<<<<<<<
+ *     state[3] = conseq_ones
+ *     state[4] = conseq_zeros
+ */
+  __pyx_t_26 = 2;
+  *((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_26)) )) = __pyx_v_pulselen;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":408
+ *     state[1] = cur_state
+ *     state[2] = pulselen
+ *     state[3] = conseq_ones             # <<<<<<<<<<<<<<
+ *     state[4] = conseq_zeros
+ *     state[5] = conseq_pause
+ */
+  __pyx_t_27 = 3;
+  *((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_27)) )) = __pyx_v_conseq_ones;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":409
+ *     state[2] = pulselen
+ *     state[3] = conseq_ones
+ *     state[4] = conseq_zeros             # <<<<<<<<<<<<<<
+ *     state[5] = conseq_pause
+ *     return result[:cur_index]
+ */
+  __pyx_t_28 = 4;
+  *((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_28)) )) = __pyx_v_conseq_zeros;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":410
+ *     state[3] = conseq_ones
+ *     state[4] = conseq_zeros
+ *     state[5] = conseq_pause             # <<<<<<<<<<<<<<
+ *     return result[:cur_index]
  * 
- *     return ns             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_29 = 5;
+  *((unsigned PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((unsigned PY_LONG_LONG *) __pyx_v_state.data) + __pyx_t_29)) )) = __pyx_v_conseq_pause;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":411
+ *     state[4] = conseq_zeros
+ *     state[5] = conseq_pause
+ *     return result[:cur_index]             # <<<<<<<<<<<<<<
  * 
- * cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples,
+ * cpdef tuple pulses_to_bits(unsigned long long[:, ::1] ppseq, unsigned long long bit_len, double rel_symbol_len):
  */
-  __pyx_r = __pyx_v_ns;
+  __pyx_t_12.data = __pyx_v_result.data;
+  __pyx_t_12.memview = __pyx_v_result.memview;
+  __PYX_INC_MEMVIEW(&__pyx_t_12, 0);
+  __pyx_t_30 = -1;
+  if (unlikely(__pyx_memoryview_slice_memviewslice(
+    &__pyx_t_12,
+    __pyx_v_result.shape[0], __pyx_v_result.strides[0], __pyx_v_result.suboffsets[0],
+    0,
+    0,
+    &__pyx_t_30,
+    0,
+    __pyx_v_cur_index,
+    0,
+    0,
+    1,
+    0,
+    1) < 0))
+{
+    __PYX_ERR(0, 411, __pyx_L1_error)
+}
+
+__pyx_t_12.shape[1] = __pyx_v_result.shape[1];
+__pyx_t_12.strides[1] = __pyx_v_result.strides[1];
+    __pyx_t_12.suboffsets[1] = -1;
+
+__pyx_r = __pyx_t_12;
+  __pyx_t_12.memview = NULL;
+  __pyx_t_12.data = NULL;
   goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":175
- *     return 0
- * 
- * cpdef unsigned long long find_signal_end(float[::1] demod_samples, int mod_type):             # <<<<<<<<<<<<<<
+  /* "src/urh/cythonext/signalFunctions.pyx":343
+ *     return result[:cur_index]
  * 
- *     cdef unsigned long long i
+ * cpdef unsigned long long[:, ::1] grab_pulse_lens_stream(float[::1] samples, float treshold, unsigned int tolerance,             # <<<<<<<<<<<<<<
+ *                                                         int mod_type, unsigned long long[::1] state):
+ *     """
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_WriteUnraisable("src.urh.cythonext.signalFunctions.find_signal_end", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
-  __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_12, 1);
+  __pyx_r.data = NULL;
+  __pyx_r.memview = NULL;
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.grab_pulse_lens_stream", __pyx_clineno, __pyx_lineno, __pyx_filename);
+
+  goto __pyx_L2;
   __pyx_L0:;
+  if (unlikely(!__pyx_r.memview)) {
+    PyErr_SetString(PyExc_TypeError, "Memoryview return value is not initialized");
+  }
+  __pyx_L2:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_result, 1);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_7find_signal_end(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_7find_signal_end(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  __Pyx_memviewslice __pyx_v_demod_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13grab_pulse_lens_stream(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3src_3urh_9cythonext_15signalFunctions_12grab_pulse_lens_stream[] = "\n    Grab the pulse lengths of a stream block by block with the same state machine as grab_pulse_lens.\n    Only completed pulses are returned, the pulse at the end of the block is continued in the next block.\n\n    @param state: (initialized, current pulse type, pulse length, consecutive ones, consecutive zeros,\n                   consecutive pause samples), updated in place. Use zeros for the start of a stream.\n    @return: Array of completed pulses (pulse type, length) like grab_pulse_lens\n    ";
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13grab_pulse_lens_stream(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
+  float __pyx_v_treshold;
+  unsigned int __pyx_v_tolerance;
   int __pyx_v_mod_type;
+  __Pyx_memviewslice __pyx_v_state = { 0, 0, { 0 }, { 0 }, { 0 } };
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("find_signal_end (wrapper)", 0);
+  __Pyx_RefNannySetupContext("grab_pulse_lens_stream (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_demod_samples,&__pyx_n_s_mod_type,0};
-    PyObject* values[2] = {0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_samples,&__pyx_n_s_treshold,&__pyx_n_s_tolerance,&__pyx_n_s_mod_type,&__pyx_n_s_state,0};
+    PyObject* values[5] = {0,0,0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
         case  0: break;
@@ -4267,898 +7152,1931 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_7find_signal_en
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_demod_samples)) != 0)) kw_args--;
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_samples)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_treshold)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens_stream", 1, 5, 5, 1); __PYX_ERR(0, 343, __pyx_L3_error)
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_tolerance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens_stream", 1, 5, 5, 2); __PYX_ERR(0, 343, __pyx_L3_error)
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens_stream", 1, 5, 5, 3); __PYX_ERR(0, 343, __pyx_L3_error)
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_state)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("find_signal_end", 1, 2, 2, 1); __PYX_ERR(0, 175, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens_stream", 1, 5, 5, 4); __PYX_ERR(0, 343, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_signal_end") < 0)) __PYX_ERR(0, 175, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "grab_pulse_lens_stream") < 0)) __PYX_ERR(0, 343, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
     }
-    __pyx_v_demod_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_demod_samples.memview)) __PYX_ERR(0, 175, __pyx_L3_error)
-    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 175, __pyx_L3_error)
+    __pyx_v_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_samples.memview)) __PYX_ERR(0, 343, __pyx_L3_error)
+    __pyx_v_treshold = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_treshold == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 343, __pyx_L3_error)
+    __pyx_v_tolerance = __Pyx_PyInt_As_unsigned_int(values[2]); if (unlikely((__pyx_v_tolerance == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 343, __pyx_L3_error)
+    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 344, __pyx_L3_error)
+    __pyx_v_state = __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_PY_LONG_LONG(values[4]); if (unlikely(!__pyx_v_state.memview)) __PYX_ERR(0, 344, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("find_signal_end", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 175, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("grab_pulse_lens_stream", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 343, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.find_signal_end", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.grab_pulse_lens_stream", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6find_signal_end(__pyx_self, __pyx_v_demod_samples, __pyx_v_mod_type);
+  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_12grab_pulse_lens_stream(__pyx_self, __pyx_v_samples, __pyx_v_treshold, __pyx_v_tolerance, __pyx_v_mod_type, __pyx_v_state);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6find_signal_end(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_demod_samples, int __pyx_v_mod_type) {
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_12grab_pulse_lens_stream(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, float __pyx_v_treshold, unsigned int __pyx_v_tolerance, int __pyx_v_mod_type, __Pyx_memviewslice __pyx_v_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("find_signal_end", 0);
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_2 = NULL;
+  __Pyx_RefNannySetupContext("grab_pulse_lens_stream", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_end(__pyx_v_demod_samples, __pyx_v_mod_type, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_1 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens_stream(__pyx_v_samples, __pyx_v_treshold, __pyx_v_tolerance, __pyx_v_mod_type, __pyx_v_state, 0); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __pyx_t_2 = __pyx_memoryview_fromslice(__pyx_t_1, 2, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.find_signal_end", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.grab_pulse_lens_stream", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __PYX_XDEC_MEMVIEW(&__pyx_v_demod_samples, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_samples, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_state, 1);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-
-/* "src/urh/cythonext/signalFunctions.pyx":194
- *     return ns
- * 
- * cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples,             # <<<<<<<<<<<<<<
- *                                                  float treshold, unsigned int tolerance, int mod_type):
- *     """
- */
-
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_9grab_pulse_lens(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static __Pyx_memviewslice __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__Pyx_memviewslice __pyx_v_samples, float __pyx_v_treshold, unsigned int __pyx_v_tolerance, int __pyx_v_mod_type, CYTHON_UNUSED int __pyx_skip_dispatch) {
-  unsigned PY_LONG_LONG __pyx_v_i;
-  unsigned PY_LONG_LONG __pyx_v_ns;
-  unsigned PY_LONG_LONG __pyx_v_pulselen;
-  unsigned PY_LONG_LONG __pyx_v_cur_index;
-  unsigned PY_LONG_LONG __pyx_v_conseq_ones;
-  unsigned PY_LONG_LONG __pyx_v_conseq_zeros;
-  unsigned PY_LONG_LONG __pyx_v_conseq_pause;
-  float __pyx_v_s;
-  float __pyx_v_s_prev;
-  int __pyx_v_cur_state;
-  float __pyx_v_NOISE;
-  __Pyx_memviewslice __pyx_v_result = { 0, 0, { 0 }, { 0 }, { 0 } };
-  unsigned PY_LONG_LONG __pyx_v_len_result;
-  __Pyx_memviewslice __pyx_r = { 0, 0, { 0 }, { 0 }, { 0 } };
+
+/* "src/urh/cythonext/signalFunctions.pyx":413
+ *     return result[:cur_index]
+ * 
+ * cpdef tuple pulses_to_bits(unsigned long long[:, ::1] ppseq, unsigned long long bit_len, double rel_symbol_len):             # <<<<<<<<<<<<<<
+ *     """
+ *     Wandelt die Pulslngen aus grab_pulse_lens in Bits um.
+ */
+
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15pulses_to_bits(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_3src_3urh_9cythonext_15signalFunctions_pulses_to_bits(__Pyx_memviewslice __pyx_v_ppseq, unsigned PY_LONG_LONG __pyx_v_bit_len, double __pyx_v_rel_symbol_len, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PY_LONG_LONG __pyx_v_n;
+  PY_LONG_LONG __pyx_v_i;
+  PY_LONG_LONG __pyx_v_k;
+  PY_LONG_LONG __pyx_v_num_bits;
+  PY_LONG_LONG __pyx_v_capacity;
+  PY_LONG_LONG __pyx_v_start;
+  PY_LONG_LONG __pyx_v_total_samples;
+  PY_LONG_LONG __pyx_v_num_samples;
+  PY_LONG_LONG __pyx_v_n_bits;
+  PY_LONG_LONG __pyx_v_n_pos;
+  PY_LONG_LONG __pyx_v_num_messages;
+  PY_LONG_LONG __pyx_v_num_symbols;
+  PY_LONG_LONG __pyx_v_msg_symbols;
+  unsigned PY_LONG_LONG __pyx_v_pulse_type;
+  int __pyx_v_ptype;
+  double __pyx_v_num_bits_floated;
+  double __pyx_v_decimal_place;
+  double __pyx_v_lower_bit_bound;
+  double __pyx_v_upper_bit_bound;
+  bool __pyx_v_there_was_data;
+  __Pyx_memviewslice __pyx_v_bits = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_positions = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_bit_offsets = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_pos_offsets = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_pauses = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_symbols = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  int __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
-  unsigned PY_LONG_LONG __pyx_t_10;
-  unsigned PY_LONG_LONG __pyx_t_11;
-  unsigned PY_LONG_LONG __pyx_t_12;
-  unsigned PY_LONG_LONG __pyx_t_13;
-  Py_ssize_t __pyx_t_14;
-  unsigned PY_LONG_LONG __pyx_t_15;
-  Py_ssize_t __pyx_t_16;
-  unsigned PY_LONG_LONG __pyx_t_17;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PY_LONG_LONG __pyx_t_5;
+  PY_LONG_LONG __pyx_t_6;
+  PY_LONG_LONG __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  PY_LONG_LONG __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  __Pyx_memviewslice __pyx_t_15 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_16 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_17 = { 0, 0, { 0 }, { 0 }, { 0 } };
   Py_ssize_t __pyx_t_18;
-  unsigned PY_LONG_LONG __pyx_t_19;
+  Py_ssize_t __pyx_t_19;
   Py_ssize_t __pyx_t_20;
-  unsigned PY_LONG_LONG __pyx_t_21;
-  Py_ssize_t __pyx_t_22;
-  unsigned PY_LONG_LONG __pyx_t_23;
-  Py_ssize_t __pyx_t_24;
+  Py_ssize_t __pyx_t_21;
+  PY_LONG_LONG __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  PY_LONG_LONG __pyx_t_24;
   Py_ssize_t __pyx_t_25;
-  Py_ssize_t __pyx_t_26;
+  int __pyx_t_26;
   int __pyx_t_27;
-  __Pyx_RefNannySetupContext("grab_pulse_lens", 0);
-
-  /* "src/urh/cythonext/signalFunctions.pyx":205
- *     arr[i][1] gibt die Lnge des Pulses bzw. der Pause an.
+  PY_LONG_LONG __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  PY_LONG_LONG __pyx_t_30;
+  Py_ssize_t __pyx_t_31;
+  PY_LONG_LONG __pyx_t_32;
+  Py_ssize_t __pyx_t_33;
+  PY_LONG_LONG __pyx_t_34;
+  Py_ssize_t __pyx_t_35;
+  PY_LONG_LONG __pyx_t_36;
+  PY_LONG_LONG __pyx_t_37;
+  PY_LONG_LONG __pyx_t_38;
+  PY_LONG_LONG __pyx_t_39;
+  PY_LONG_LONG __pyx_t_40;
+  PY_LONG_LONG __pyx_t_41;
+  PY_LONG_LONG __pyx_t_42;
+  Py_ssize_t __pyx_t_43;
+  PY_LONG_LONG __pyx_t_44;
+  PY_LONG_LONG __pyx_t_45;
+  PY_LONG_LONG __pyx_t_46;
+  PY_LONG_LONG __pyx_t_47;
+  PY_LONG_LONG __pyx_t_48;
+  __pyx_t_5numpy_int8_t __pyx_t_49;
+  PY_LONG_LONG __pyx_t_50;
+  PY_LONG_LONG __pyx_t_51;
+  unsigned PY_LONG_LONG __pyx_t_52;
+  Py_ssize_t __pyx_t_53;
+  Py_ssize_t __pyx_t_54;
+  PY_LONG_LONG __pyx_t_55;
+  PY_LONG_LONG __pyx_t_56;
+  PY_LONG_LONG __pyx_t_57;
+  PY_LONG_LONG __pyx_t_58;
+  PY_LONG_LONG __pyx_t_59;
+  Py_ssize_t __pyx_t_60;
+  PyObject *__pyx_t_61 = NULL;
+  PyObject *__pyx_t_62 = NULL;
+  PyObject *__pyx_t_63 = NULL;
+  PyObject *__pyx_t_64 = NULL;
+  PyObject *__pyx_t_65 = NULL;
+  __Pyx_RefNannySetupContext("pulses_to_bits", 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":425
+ *     in der Reihenfolge ihres Auftretens. Der Index ist -1 fr Symbole in verworfenen Daten.
  *     """
- *     cdef unsigned long long i, ns, pulselen = 0             # <<<<<<<<<<<<<<
- *     cdef unsigned long long cur_index = 0, conseq_ones = 0, conseq_zeros = 0, conseq_pause = 0
- *     cdef float s, s_prev
+ *     cdef long long n = len(ppseq)             # <<<<<<<<<<<<<<
+ *     cdef long long i, k, num_bits, capacity = 0
+ *     cdef long long start = 0, total_samples = 0, num_samples
  */
-  __pyx_v_pulselen = 0;
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_ppseq, 2, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 425, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 425, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_n = __pyx_t_2;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":206
+  /* "src/urh/cythonext/signalFunctions.pyx":426
  *     """
- *     cdef unsigned long long i, ns, pulselen = 0
- *     cdef unsigned long long cur_index = 0, conseq_ones = 0, conseq_zeros = 0, conseq_pause = 0             # <<<<<<<<<<<<<<
- *     cdef float s, s_prev
- *     cdef int cur_state
+ *     cdef long long n = len(ppseq)
+ *     cdef long long i, k, num_bits, capacity = 0             # <<<<<<<<<<<<<<
+ *     cdef long long start = 0, total_samples = 0, num_samples
+ *     cdef long long n_bits = 0, n_pos = 0, num_messages = 0, num_symbols = 0, msg_symbols = 0
  */
-  __pyx_v_cur_index = 0;
-  __pyx_v_conseq_ones = 0;
-  __pyx_v_conseq_zeros = 0;
-  __pyx_v_conseq_pause = 0;
+  __pyx_v_capacity = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":209
- *     cdef float s, s_prev
- *     cdef int cur_state
- *     cdef float NOISE = get_noise_for_mod_type(mod_type)             # <<<<<<<<<<<<<<
- *     ns = len(samples)
+  /* "src/urh/cythonext/signalFunctions.pyx":427
+ *     cdef long long n = len(ppseq)
+ *     cdef long long i, k, num_bits, capacity = 0
+ *     cdef long long start = 0, total_samples = 0, num_samples             # <<<<<<<<<<<<<<
+ *     cdef long long n_bits = 0, n_pos = 0, num_messages = 0, num_symbols = 0, msg_symbols = 0
+ *     cdef unsigned long long pulse_type
+ */
+  __pyx_v_start = 0;
+  __pyx_v_total_samples = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":428
+ *     cdef long long i, k, num_bits, capacity = 0
+ *     cdef long long start = 0, total_samples = 0, num_samples
+ *     cdef long long n_bits = 0, n_pos = 0, num_messages = 0, num_symbols = 0, msg_symbols = 0             # <<<<<<<<<<<<<<
+ *     cdef unsigned long long pulse_type
+ *     cdef int ptype
+ */
+  __pyx_v_n_bits = 0;
+  __pyx_v_n_pos = 0;
+  __pyx_v_num_messages = 0;
+  __pyx_v_num_symbols = 0;
+  __pyx_v_msg_symbols = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":432
+ *     cdef int ptype
+ *     cdef double num_bits_floated, decimal_place
+ *     cdef double lower_bit_bound = 0.5 - rel_symbol_len             # <<<<<<<<<<<<<<
+ *     cdef double upper_bit_bound = 0.5 + rel_symbol_len
+ *     cdef bool there_was_data = False
+ */
+  __pyx_v_lower_bit_bound = (0.5 - __pyx_v_rel_symbol_len);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":433
+ *     cdef double num_bits_floated, decimal_place
+ *     cdef double lower_bit_bound = 0.5 - rel_symbol_len
+ *     cdef double upper_bit_bound = 0.5 + rel_symbol_len             # <<<<<<<<<<<<<<
+ *     cdef bool there_was_data = False
  * 
  */
-  __pyx_v_NOISE = __pyx_f_3src_3urh_9cythonext_15signalFunctions_get_noise_for_mod_type(__pyx_v_mod_type, 0);
+  __pyx_v_upper_bit_bound = (0.5 + __pyx_v_rel_symbol_len);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":210
- *     cdef int cur_state
- *     cdef float NOISE = get_noise_for_mod_type(mod_type)
- *     ns = len(samples)             # <<<<<<<<<<<<<<
+  /* "src/urh/cythonext/signalFunctions.pyx":434
+ *     cdef double lower_bit_bound = 0.5 - rel_symbol_len
+ *     cdef double upper_bit_bound = 0.5 + rel_symbol_len
+ *     cdef bool there_was_data = False             # <<<<<<<<<<<<<<
  * 
- *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
+ *     if n > 0 and bit_len == 0:
+ */
+  __pyx_v_there_was_data = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":436
+ *     cdef bool there_was_data = False
+ * 
+ *     if n > 0 and bit_len == 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("Bit length must be greater than zero")
+ * 
+ */
+  __pyx_t_4 = ((__pyx_v_n > 0) != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_bit_len == 0) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "src/urh/cythonext/signalFunctions.pyx":437
+ * 
+ *     if n > 0 and bit_len == 0:
+ *         raise ValueError("Bit length must be greater than zero")             # <<<<<<<<<<<<<<
+ * 
+ *     # Obere Schranke fr die Anzahl Bits, lange Pausen erzeugen keine Bits
+ */
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 437, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 437, __pyx_L1_error)
+
+    /* "src/urh/cythonext/signalFunctions.pyx":436
+ *     cdef bool there_was_data = False
+ * 
+ *     if n > 0 and bit_len == 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("Bit length must be greater than zero")
+ * 
+ */
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":440
+ * 
+ *     # Obere Schranke fr die Anzahl Bits, lange Pausen erzeugen keine Bits
+ *     for i in range(n):             # <<<<<<<<<<<<<<
+ *         num_bits = ppseq[i, 1] // bit_len + 1
+ *         if ppseq[i, 0] != 42 or num_bits <= 10:
+ */
+  __pyx_t_5 = __pyx_v_n;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_i = __pyx_t_6;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":441
+ *     # Obere Schranke fr die Anzahl Bits, lange Pausen erzeugen keine Bits
+ *     for i in range(n):
+ *         num_bits = ppseq[i, 1] // bit_len + 1             # <<<<<<<<<<<<<<
+ *         if ppseq[i, 0] != 42 or num_bits <= 10:
+ *             capacity += num_bits
+ */
+    __pyx_t_7 = __pyx_v_i;
+    __pyx_t_8 = 1;
+    __pyx_v_num_bits = (((*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_7 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_8)) ))) / __pyx_v_bit_len) + 1);
+
+    /* "src/urh/cythonext/signalFunctions.pyx":442
+ *     for i in range(n):
+ *         num_bits = ppseq[i, 1] // bit_len + 1
+ *         if ppseq[i, 0] != 42 or num_bits <= 10:             # <<<<<<<<<<<<<<
+ *             capacity += num_bits
+ * 
+ */
+    __pyx_t_9 = __pyx_v_i;
+    __pyx_t_10 = 0;
+    __pyx_t_4 = (((*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_9 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_10)) ))) != 42) != 0);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_4 = ((__pyx_v_num_bits <= 10) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L9_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":443
+ *         num_bits = ppseq[i, 1] // bit_len + 1
+ *         if ppseq[i, 0] != 42 or num_bits <= 10:
+ *             capacity += num_bits             # <<<<<<<<<<<<<<
+ * 
+ *     cdef np.int8_t[::1] bits = np.empty(capacity, dtype=np.int8)
+ */
+      __pyx_v_capacity = (__pyx_v_capacity + __pyx_v_num_bits);
+
+      /* "src/urh/cythonext/signalFunctions.pyx":442
+ *     for i in range(n):
+ *         num_bits = ppseq[i, 1] // bit_len + 1
+ *         if ppseq[i, 0] != 42 or num_bits <= 10:             # <<<<<<<<<<<<<<
+ *             capacity += num_bits
+ * 
+ */
+    }
+  }
+
+  /* "src/urh/cythonext/signalFunctions.pyx":445
+ *             capacity += num_bits
+ * 
+ *     cdef np.int8_t[::1] bits = np.empty(capacity, dtype=np.int8)             # <<<<<<<<<<<<<<
+ *     cdef long long[::1] positions = np.empty(capacity + 2 * n + 1, dtype=np.int64)
+ *     cdef long long[::1] bit_offsets = np.zeros(n + 2, dtype=np.int64)
  */
-  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 445, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ns = __pyx_t_2;
+  __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_capacity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_12 = PyTuple_New(1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_int8); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_14) < 0) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_14 = __Pyx_PyObject_Call(__pyx_t_11, __pyx_t_12, __pyx_t_1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_15 = __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_5numpy_int8_t(__pyx_t_14);
+  if (unlikely(!__pyx_t_15.memview)) __PYX_ERR(0, 445, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_v_bits = __pyx_t_15;
+  __pyx_t_15.memview = NULL;
+  __pyx_t_15.data = NULL;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":212
- *     ns = len(samples)
+  /* "src/urh/cythonext/signalFunctions.pyx":446
  * 
- *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")             # <<<<<<<<<<<<<<
- *     if ns == 0:
- *         return result
+ *     cdef np.int8_t[::1] bits = np.empty(capacity, dtype=np.int8)
+ *     cdef long long[::1] positions = np.empty(capacity + 2 * n + 1, dtype=np.int64)             # <<<<<<<<<<<<<<
+ *     cdef long long[::1] bit_offsets = np.zeros(n + 2, dtype=np.int64)
+ *     cdef long long[::1] pos_offsets = np.zeros(n + 2, dtype=np.int64)
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __pyx_t_14 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 446, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 212, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_14 = __Pyx_PyInt_From_PY_LONG_LONG(((__pyx_v_capacity + (2 * __pyx_v_n)) + 1)); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_12 = PyTuple_New(1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_14);
+  PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_14);
+  __pyx_t_14 = 0;
+  __pyx_t_14 = PyDict_New(); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_int64); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (PyDict_SetItem(__pyx_t_14, __pyx_n_s_dtype, __pyx_t_13) < 0) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_12, __pyx_t_14); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_ns); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_dc_PY_LONG_LONG(__pyx_t_13);
+  if (unlikely(!__pyx_t_16.memview)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_v_positions = __pyx_t_16;
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":447
+ *     cdef np.int8_t[::1] bits = np.empty(capacity, dtype=np.int8)
+ *     cdef long long[::1] positions = np.empty(capacity + 2 * n + 1, dtype=np.int64)
+ *     cdef long long[::1] bit_offsets = np.zeros(n + 2, dtype=np.int64)             # <<<<<<<<<<<<<<
+ *     cdef long long[::1] pos_offsets = np.zeros(n + 2, dtype=np.int64)
+ *     cdef long long[::1] pauses = np.empty(n + 1, dtype=np.int64)
+ */
+  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_zeros); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyInt_From_PY_LONG_LONG((__pyx_v_n + 2)); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_12 = PyTuple_New(1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_13);
+  PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_13);
+  __pyx_t_13 = 0;
+  __pyx_t_13 = PyDict_New(); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 447, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 212, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_int64); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_13, __pyx_n_s_dtype, __pyx_t_11) < 0) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_14, __pyx_t_12, __pyx_t_13); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_dc_PY_LONG_LONG(__pyx_t_11);
+  if (unlikely(!__pyx_t_16.memview)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_v_bit_offsets = __pyx_t_16;
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":448
+ *     cdef long long[::1] positions = np.empty(capacity + 2 * n + 1, dtype=np.int64)
+ *     cdef long long[::1] bit_offsets = np.zeros(n + 2, dtype=np.int64)
+ *     cdef long long[::1] pos_offsets = np.zeros(n + 2, dtype=np.int64)             # <<<<<<<<<<<<<<
+ *     cdef long long[::1] pauses = np.empty(n + 1, dtype=np.int64)
+ *     cdef long long[:, ::1] symbols = np.empty((n, 4), dtype=np.int64)
+ */
+  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_zeros); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_11 = __Pyx_PyInt_From_PY_LONG_LONG((__pyx_v_n + 2)); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_12 = PyTuple_New(1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_11);
+  PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_11);
+  __pyx_t_11 = 0;
+  __pyx_t_11 = PyDict_New(); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_14 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_int64); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  if (PyDict_SetItem(__pyx_t_11, __pyx_n_s_dtype, __pyx_t_1) < 0) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_13, __pyx_t_12, __pyx_t_11); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_dc_PY_LONG_LONG(__pyx_t_1);
+  if (unlikely(!__pyx_t_16.memview)) __PYX_ERR(0, 448, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_pos_offsets = __pyx_t_16;
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":449
+ *     cdef long long[::1] bit_offsets = np.zeros(n + 2, dtype=np.int64)
+ *     cdef long long[::1] pos_offsets = np.zeros(n + 2, dtype=np.int64)
+ *     cdef long long[::1] pauses = np.empty(n + 1, dtype=np.int64)             # <<<<<<<<<<<<<<
+ *     cdef long long[:, ::1] symbols = np.empty((n, 4), dtype=np.int64)
+ * 
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG((__pyx_v_n + 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_12 = PyTuple_New(1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
   __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
-  __Pyx_INCREF(__pyx_int_2);
-  __Pyx_GIVEREF(__pyx_int_2);
-  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_int_2);
+  PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 449, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4);
-  __pyx_t_4 = 0;
-  __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 212, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 212, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_uint64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 212, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 212, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_order, __pyx_n_u_C) < 0) __PYX_ERR(0, 212, __pyx_L1_error)
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 212, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_13 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_int64); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_14) < 0) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_14 = __Pyx_PyObject_Call(__pyx_t_11, __pyx_t_12, __pyx_t_1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_PY_LONG_LONG(__pyx_t_6);
-  if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 212, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_v_result = __pyx_t_7;
-  __pyx_t_7.memview = NULL;
-  __pyx_t_7.data = NULL;
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_dc_PY_LONG_LONG(__pyx_t_14);
+  if (unlikely(!__pyx_t_16.memview)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_v_pauses = __pyx_t_16;
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":450
+ *     cdef long long[::1] pos_offsets = np.zeros(n + 2, dtype=np.int64)
+ *     cdef long long[::1] pauses = np.empty(n + 1, dtype=np.int64)
+ *     cdef long long[:, ::1] symbols = np.empty((n, 4), dtype=np.int64)             # <<<<<<<<<<<<<<
+ * 
+ *     if n > 0 and ppseq[0, 0] == 42:
+ */
+  __pyx_t_14 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_14, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_14 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_n); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_12 = PyTuple_New(2); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_14);
+  PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_14);
+  __Pyx_INCREF(__pyx_int_4);
+  __Pyx_GIVEREF(__pyx_int_4);
+  PyTuple_SET_ITEM(__pyx_t_12, 1, __pyx_int_4);
+  __pyx_t_14 = 0;
+  __pyx_t_14 = PyTuple_New(1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_GIVEREF(__pyx_t_12);
+  PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_12);
+  __pyx_t_12 = 0;
+  __pyx_t_12 = PyDict_New(); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_int64); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (PyDict_SetItem(__pyx_t_12, __pyx_n_s_dtype, __pyx_t_13) < 0) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_14, __pyx_t_12); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_17 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_PY_LONG_LONG(__pyx_t_13);
+  if (unlikely(!__pyx_t_17.memview)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_v_symbols = __pyx_t_17;
+  __pyx_t_17.memview = NULL;
+  __pyx_t_17.data = NULL;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":452
+ *     cdef long long[:, ::1] symbols = np.empty((n, 4), dtype=np.int64)
+ * 
+ *     if n > 0 and ppseq[0, 0] == 42:             # <<<<<<<<<<<<<<
+ *         start = 1  # Beginnt mit Pause
+ *         total_samples = ppseq[0, 1]
+ */
+  __pyx_t_4 = ((__pyx_v_n > 0) != 0);
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L12_bool_binop_done;
+  }
+  __pyx_t_18 = 0;
+  __pyx_t_19 = 0;
+  __pyx_t_4 = (((*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_18 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_19)) ))) == 42) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L12_bool_binop_done:;
+  if (__pyx_t_3) {
 
-  /* "src/urh/cythonext/signalFunctions.pyx":213
+    /* "src/urh/cythonext/signalFunctions.pyx":453
  * 
- *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
- *     if ns == 0:             # <<<<<<<<<<<<<<
- *         return result
+ *     if n > 0 and ppseq[0, 0] == 42:
+ *         start = 1  # Beginnt mit Pause             # <<<<<<<<<<<<<<
+ *         total_samples = ppseq[0, 1]
  * 
  */
-  __pyx_t_8 = ((__pyx_v_ns == 0) != 0);
-  if (__pyx_t_8) {
+    __pyx_v_start = 1;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":214
- *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
- *     if ns == 0:
- *         return result             # <<<<<<<<<<<<<<
+    /* "src/urh/cythonext/signalFunctions.pyx":454
+ *     if n > 0 and ppseq[0, 0] == 42:
+ *         start = 1  # Beginnt mit Pause
+ *         total_samples = ppseq[0, 1]             # <<<<<<<<<<<<<<
  * 
- *     s_prev = samples[0]
+ *     for i in range(start, n):
  */
-    __PYX_INC_MEMVIEW(&__pyx_v_result, 0);
-    __pyx_r = __pyx_v_result;
-    goto __pyx_L0;
+    __pyx_t_20 = 0;
+    __pyx_t_21 = 1;
+    __pyx_v_total_samples = (*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_20 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_21)) )));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":213
- * 
- *     cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
- *     if ns == 0:             # <<<<<<<<<<<<<<
- *         return result
+    /* "src/urh/cythonext/signalFunctions.pyx":452
+ *     cdef long long[:, ::1] symbols = np.empty((n, 4), dtype=np.int64)
  * 
+ *     if n > 0 and ppseq[0, 0] == 42:             # <<<<<<<<<<<<<<
+ *         start = 1  # Beginnt mit Pause
+ *         total_samples = ppseq[0, 1]
  */
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":216
- *         return result
+  /* "src/urh/cythonext/signalFunctions.pyx":456
+ *         total_samples = ppseq[0, 1]
  * 
- *     s_prev = samples[0]             # <<<<<<<<<<<<<<
- *     if s_prev == NOISE:
- *         cur_state = 42
+ *     for i in range(start, n):             # <<<<<<<<<<<<<<
+ *         pulse_type = ppseq[i, 0]
+ *         num_samples = ppseq[i, 1]
  */
-  __pyx_t_9 = 0;
-  __pyx_v_s_prev = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_samples.data) + __pyx_t_9)) )));
+  __pyx_t_5 = __pyx_v_n;
+  for (__pyx_t_6 = __pyx_v_start; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_i = __pyx_t_6;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":217
+    /* "src/urh/cythonext/signalFunctions.pyx":457
  * 
- *     s_prev = samples[0]
- *     if s_prev == NOISE:             # <<<<<<<<<<<<<<
- *         cur_state = 42
- *     elif s_prev > treshold:
+ *     for i in range(start, n):
+ *         pulse_type = ppseq[i, 0]             # <<<<<<<<<<<<<<
+ *         num_samples = ppseq[i, 1]
+ *         num_bits_floated = <double>num_samples / bit_len
  */
-  __pyx_t_8 = ((__pyx_v_s_prev == __pyx_v_NOISE) != 0);
-  if (__pyx_t_8) {
+    __pyx_t_22 = __pyx_v_i;
+    __pyx_t_23 = 0;
+    __pyx_v_pulse_type = (*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_22 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_23)) )));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":218
- *     s_prev = samples[0]
- *     if s_prev == NOISE:
- *         cur_state = 42             # <<<<<<<<<<<<<<
- *     elif s_prev > treshold:
- *         cur_state = 1
+    /* "src/urh/cythonext/signalFunctions.pyx":458
+ *     for i in range(start, n):
+ *         pulse_type = ppseq[i, 0]
+ *         num_samples = ppseq[i, 1]             # <<<<<<<<<<<<<<
+ *         num_bits_floated = <double>num_samples / bit_len
+ *         num_bits = <long long>num_bits_floated
  */
-    __pyx_v_cur_state = 42;
+    __pyx_t_24 = __pyx_v_i;
+    __pyx_t_25 = 1;
+    __pyx_v_num_samples = (*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_24 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_25)) )));
+
+    /* "src/urh/cythonext/signalFunctions.pyx":459
+ *         pulse_type = ppseq[i, 0]
+ *         num_samples = ppseq[i, 1]
+ *         num_bits_floated = <double>num_samples / bit_len             # <<<<<<<<<<<<<<
+ *         num_bits = <long long>num_bits_floated
+ *         decimal_place = num_bits_floated - num_bits
+ */
+    __pyx_v_num_bits_floated = (((double)__pyx_v_num_samples) / ((double)__pyx_v_bit_len));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":217
+    /* "src/urh/cythonext/signalFunctions.pyx":460
+ *         num_samples = ppseq[i, 1]
+ *         num_bits_floated = <double>num_samples / bit_len
+ *         num_bits = <long long>num_bits_floated             # <<<<<<<<<<<<<<
+ *         decimal_place = num_bits_floated - num_bits
  * 
- *     s_prev = samples[0]
- *     if s_prev == NOISE:             # <<<<<<<<<<<<<<
- *         cur_state = 42
- *     elif s_prev > treshold:
  */
-    goto __pyx_L4;
-  }
+    __pyx_v_num_bits = ((PY_LONG_LONG)__pyx_v_num_bits_floated);
+
+    /* "src/urh/cythonext/signalFunctions.pyx":461
+ *         num_bits_floated = <double>num_samples / bit_len
+ *         num_bits = <long long>num_bits_floated
+ *         decimal_place = num_bits_floated - num_bits             # <<<<<<<<<<<<<<
+ * 
+ *         if decimal_place > upper_bit_bound:
+ */
+    __pyx_v_decimal_place = (__pyx_v_num_bits_floated - __pyx_v_num_bits);
+
+    /* "src/urh/cythonext/signalFunctions.pyx":463
+ *         decimal_place = num_bits_floated - num_bits
+ * 
+ *         if decimal_place > upper_bit_bound:             # <<<<<<<<<<<<<<
+ *             num_bits += 1
+ *         elif lower_bit_bound < decimal_place < upper_bit_bound and (pulse_type != 42 or num_bits < 9):
+ */
+    __pyx_t_3 = ((__pyx_v_decimal_place > __pyx_v_upper_bit_bound) != 0);
+    if (__pyx_t_3) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":464
+ * 
+ *         if decimal_place > upper_bit_bound:
+ *             num_bits += 1             # <<<<<<<<<<<<<<
+ *         elif lower_bit_bound < decimal_place < upper_bit_bound and (pulse_type != 42 or num_bits < 9):
+ *             ptype = 1 if pulse_type == 1 else 0
+ */
+      __pyx_v_num_bits = (__pyx_v_num_bits + 1);
+
+      /* "src/urh/cythonext/signalFunctions.pyx":463
+ *         decimal_place = num_bits_floated - num_bits
+ * 
+ *         if decimal_place > upper_bit_bound:             # <<<<<<<<<<<<<<
+ *             num_bits += 1
+ *         elif lower_bit_bound < decimal_place < upper_bit_bound and (pulse_type != 42 or num_bits < 9):
+ */
+      goto __pyx_L16;
+    }
+
+    /* "src/urh/cythonext/signalFunctions.pyx":465
+ *         if decimal_place > upper_bit_bound:
+ *             num_bits += 1
+ *         elif lower_bit_bound < decimal_place < upper_bit_bound and (pulse_type != 42 or num_bits < 9):             # <<<<<<<<<<<<<<
+ *             ptype = 1 if pulse_type == 1 else 0
+ *             if not there_was_data:
+ */
+    __pyx_t_4 = (__pyx_v_lower_bit_bound < __pyx_v_decimal_place);
+    if (__pyx_t_4) {
+      __pyx_t_4 = (__pyx_v_decimal_place < __pyx_v_upper_bit_bound);
+    }
+    __pyx_t_26 = (__pyx_t_4 != 0);
+    if (__pyx_t_26) {
+    } else {
+      __pyx_t_3 = __pyx_t_26;
+      goto __pyx_L17_bool_binop_done;
+    }
+    __pyx_t_26 = ((__pyx_v_pulse_type != 42) != 0);
+    if (!__pyx_t_26) {
+    } else {
+      __pyx_t_3 = __pyx_t_26;
+      goto __pyx_L17_bool_binop_done;
+    }
+    __pyx_t_26 = ((__pyx_v_num_bits < 9) != 0);
+    __pyx_t_3 = __pyx_t_26;
+    __pyx_L17_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "src/urh/cythonext/signalFunctions.pyx":466
+ *             num_bits += 1
+ *         elif lower_bit_bound < decimal_place < upper_bit_bound and (pulse_type != 42 or num_bits < 9):
+ *             ptype = 1 if pulse_type == 1 else 0             # <<<<<<<<<<<<<<
+ *             if not there_was_data:
+ *                 there_was_data = ptype == 1
+ */
+      if (((__pyx_v_pulse_type == 1) != 0)) {
+        __pyx_t_27 = 1;
+      } else {
+        __pyx_t_27 = 0;
+      }
+      __pyx_v_ptype = __pyx_t_27;
+
+      /* "src/urh/cythonext/signalFunctions.pyx":467
+ *         elif lower_bit_bound < decimal_place < upper_bit_bound and (pulse_type != 42 or num_bits < 9):
+ *             ptype = 1 if pulse_type == 1 else 0
+ *             if not there_was_data:             # <<<<<<<<<<<<<<
+ *                 there_was_data = ptype == 1
+ * 
+ */
+      __pyx_t_3 = ((!(__pyx_v_there_was_data != 0)) != 0);
+      if (__pyx_t_3) {
+
+        /* "src/urh/cythonext/signalFunctions.pyx":468
+ *             ptype = 1 if pulse_type == 1 else 0
+ *             if not there_was_data:
+ *                 there_was_data = ptype == 1             # <<<<<<<<<<<<<<
+ * 
+ *             symbols[num_symbols, 0] = num_bits
+ */
+        __pyx_v_there_was_data = (__pyx_v_ptype == 1);
+
+        /* "src/urh/cythonext/signalFunctions.pyx":467
+ *         elif lower_bit_bound < decimal_place < upper_bit_bound and (pulse_type != 42 or num_bits < 9):
+ *             ptype = 1 if pulse_type == 1 else 0
+ *             if not there_was_data:             # <<<<<<<<<<<<<<
+ *                 there_was_data = ptype == 1
+ * 
+ */
+      }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":219
- *     if s_prev == NOISE:
- *         cur_state = 42
- *     elif s_prev > treshold:             # <<<<<<<<<<<<<<
- *         cur_state = 1
- *     else:
+      /* "src/urh/cythonext/signalFunctions.pyx":470
+ *                 there_was_data = ptype == 1
+ * 
+ *             symbols[num_symbols, 0] = num_bits             # <<<<<<<<<<<<<<
+ *             symbols[num_symbols, 1] = ptype
+ *             symbols[num_symbols, 2] = num_samples
  */
-  __pyx_t_8 = ((__pyx_v_s_prev > __pyx_v_treshold) != 0);
-  if (__pyx_t_8) {
+      __pyx_t_28 = __pyx_v_num_symbols;
+      __pyx_t_29 = 0;
+      *((PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_symbols.data + __pyx_t_28 * __pyx_v_symbols.strides[0]) )) + __pyx_t_29)) )) = __pyx_v_num_bits;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":220
- *         cur_state = 42
- *     elif s_prev > treshold:
- *         cur_state = 1             # <<<<<<<<<<<<<<
- *     else:
- *         cur_state = 0
+      /* "src/urh/cythonext/signalFunctions.pyx":471
+ * 
+ *             symbols[num_symbols, 0] = num_bits
+ *             symbols[num_symbols, 1] = ptype             # <<<<<<<<<<<<<<
+ *             symbols[num_symbols, 2] = num_samples
+ *             symbols[num_symbols, 3] = n_bits
  */
-    __pyx_v_cur_state = 1;
+      __pyx_t_30 = __pyx_v_num_symbols;
+      __pyx_t_31 = 1;
+      *((PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_symbols.data + __pyx_t_30 * __pyx_v_symbols.strides[0]) )) + __pyx_t_31)) )) = __pyx_v_ptype;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":219
- *     if s_prev == NOISE:
- *         cur_state = 42
- *     elif s_prev > treshold:             # <<<<<<<<<<<<<<
- *         cur_state = 1
- *     else:
+      /* "src/urh/cythonext/signalFunctions.pyx":472
+ *             symbols[num_symbols, 0] = num_bits
+ *             symbols[num_symbols, 1] = ptype
+ *             symbols[num_symbols, 2] = num_samples             # <<<<<<<<<<<<<<
+ *             symbols[num_symbols, 3] = n_bits
+ *             num_symbols += 1
  */
-    goto __pyx_L4;
-  }
+      __pyx_t_32 = __pyx_v_num_symbols;
+      __pyx_t_33 = 2;
+      *((PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_symbols.data + __pyx_t_32 * __pyx_v_symbols.strides[0]) )) + __pyx_t_33)) )) = __pyx_v_num_samples;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":222
- *         cur_state = 1
- *     else:
- *         cur_state = 0             # <<<<<<<<<<<<<<
+      /* "src/urh/cythonext/signalFunctions.pyx":473
+ *             symbols[num_symbols, 1] = ptype
+ *             symbols[num_symbols, 2] = num_samples
+ *             symbols[num_symbols, 3] = n_bits             # <<<<<<<<<<<<<<
+ *             num_symbols += 1
  * 
- *     for i in range(ns-1):
  */
-  /*else*/ {
-    __pyx_v_cur_state = 0;
-  }
-  __pyx_L4:;
+      __pyx_t_34 = __pyx_v_num_symbols;
+      __pyx_t_35 = 3;
+      *((PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_symbols.data + __pyx_t_34 * __pyx_v_symbols.strides[0]) )) + __pyx_t_35)) )) = __pyx_v_n_bits;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":224
- *         cur_state = 0
+      /* "src/urh/cythonext/signalFunctions.pyx":474
+ *             symbols[num_symbols, 2] = num_samples
+ *             symbols[num_symbols, 3] = n_bits
+ *             num_symbols += 1             # <<<<<<<<<<<<<<
  * 
- *     for i in range(ns-1):             # <<<<<<<<<<<<<<
- *         pulselen += 1
- *         s = samples[i]
+ *             bits[n_bits] = 2
  */
-  __pyx_t_10 = (__pyx_v_ns - 1);
-  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
-    __pyx_v_i = __pyx_t_11;
+      __pyx_v_num_symbols = (__pyx_v_num_symbols + 1);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":225
+      /* "src/urh/cythonext/signalFunctions.pyx":476
+ *             num_symbols += 1
  * 
- *     for i in range(ns-1):
- *         pulselen += 1             # <<<<<<<<<<<<<<
- *         s = samples[i]
- *         if s == NOISE:
+ *             bits[n_bits] = 2             # <<<<<<<<<<<<<<
+ *             positions[n_pos] = total_samples
+ *             n_bits += 1
  */
-    __pyx_v_pulselen = (__pyx_v_pulselen + 1);
+      __pyx_t_36 = __pyx_v_n_bits;
+      *((__pyx_t_5numpy_int8_t *) ( /* dim=0 */ ((char *) (((__pyx_t_5numpy_int8_t *) __pyx_v_bits.data) + __pyx_t_36)) )) = 2;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":226
- *     for i in range(ns-1):
- *         pulselen += 1
- *         s = samples[i]             # <<<<<<<<<<<<<<
- *         if s == NOISE:
- *             conseq_pause += 1
+      /* "src/urh/cythonext/signalFunctions.pyx":477
+ * 
+ *             bits[n_bits] = 2
+ *             positions[n_pos] = total_samples             # <<<<<<<<<<<<<<
+ *             n_bits += 1
+ *             n_pos += 1
  */
-    __pyx_t_12 = __pyx_v_i;
-    __pyx_v_s = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_samples.data) + __pyx_t_12)) )));
+      __pyx_t_37 = __pyx_v_n_pos;
+      *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_positions.data) + __pyx_t_37)) )) = __pyx_v_total_samples;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":227
- *         pulselen += 1
- *         s = samples[i]
- *         if s == NOISE:             # <<<<<<<<<<<<<<
- *             conseq_pause += 1
- *             conseq_ones = 0
+      /* "src/urh/cythonext/signalFunctions.pyx":478
+ *             bits[n_bits] = 2
+ *             positions[n_pos] = total_samples
+ *             n_bits += 1             # <<<<<<<<<<<<<<
+ *             n_pos += 1
+ *             total_samples += num_samples
  */
-    __pyx_t_8 = ((__pyx_v_s == __pyx_v_NOISE) != 0);
-    if (__pyx_t_8) {
+      __pyx_v_n_bits = (__pyx_v_n_bits + 1);
 
-      /* "src/urh/cythonext/signalFunctions.pyx":228
- *         s = samples[i]
- *         if s == NOISE:
- *             conseq_pause += 1             # <<<<<<<<<<<<<<
- *             conseq_ones = 0
- *             conseq_zeros = 0
+      /* "src/urh/cythonext/signalFunctions.pyx":479
+ *             positions[n_pos] = total_samples
+ *             n_bits += 1
+ *             n_pos += 1             # <<<<<<<<<<<<<<
+ *             total_samples += num_samples
+ *             continue
  */
-      __pyx_v_conseq_pause = (__pyx_v_conseq_pause + 1);
+      __pyx_v_n_pos = (__pyx_v_n_pos + 1);
 
-      /* "src/urh/cythonext/signalFunctions.pyx":229
- *         if s == NOISE:
- *             conseq_pause += 1
- *             conseq_ones = 0             # <<<<<<<<<<<<<<
- *             conseq_zeros = 0
- *             if cur_state == 42: continue
+      /* "src/urh/cythonext/signalFunctions.pyx":480
+ *             n_bits += 1
+ *             n_pos += 1
+ *             total_samples += num_samples             # <<<<<<<<<<<<<<
+ *             continue
+ * 
  */
-      __pyx_v_conseq_ones = 0;
+      __pyx_v_total_samples = (__pyx_v_total_samples + __pyx_v_num_samples);
 
-      /* "src/urh/cythonext/signalFunctions.pyx":230
- *             conseq_pause += 1
- *             conseq_ones = 0
- *             conseq_zeros = 0             # <<<<<<<<<<<<<<
- *             if cur_state == 42: continue
- *         elif s > treshold:
+      /* "src/urh/cythonext/signalFunctions.pyx":481
+ *             n_pos += 1
+ *             total_samples += num_samples
+ *             continue             # <<<<<<<<<<<<<<
+ * 
+ *         if pulse_type == 42 and num_bits >= 9:
  */
-      __pyx_v_conseq_zeros = 0;
+      goto __pyx_L14_continue;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":231
- *             conseq_ones = 0
- *             conseq_zeros = 0
- *             if cur_state == 42: continue             # <<<<<<<<<<<<<<
- *         elif s > treshold:
- *             conseq_ones += 1
+      /* "src/urh/cythonext/signalFunctions.pyx":465
+ *         if decimal_place > upper_bit_bound:
+ *             num_bits += 1
+ *         elif lower_bit_bound < decimal_place < upper_bit_bound and (pulse_type != 42 or num_bits < 9):             # <<<<<<<<<<<<<<
+ *             ptype = 1 if pulse_type == 1 else 0
+ *             if not there_was_data:
  */
-      __pyx_t_8 = ((__pyx_v_cur_state == 42) != 0);
-      if (__pyx_t_8) {
-        goto __pyx_L5_continue;
-      }
+    }
+    __pyx_L16:;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":227
- *         pulselen += 1
- *         s = samples[i]
- *         if s == NOISE:             # <<<<<<<<<<<<<<
- *             conseq_pause += 1
- *             conseq_ones = 0
+    /* "src/urh/cythonext/signalFunctions.pyx":483
+ *             continue
+ * 
+ *         if pulse_type == 42 and num_bits >= 9:             # <<<<<<<<<<<<<<
+ *             if not there_was_data:
+ *                 # Pause ignorieren, wenn vorher keine Informationen bertragen wurden
  */
-      goto __pyx_L7;
+    __pyx_t_26 = ((__pyx_v_pulse_type == 42) != 0);
+    if (__pyx_t_26) {
+    } else {
+      __pyx_t_3 = __pyx_t_26;
+      goto __pyx_L22_bool_binop_done;
     }
+    __pyx_t_26 = ((__pyx_v_num_bits >= 9) != 0);
+    __pyx_t_3 = __pyx_t_26;
+    __pyx_L22_bool_binop_done:;
+    if (__pyx_t_3) {
 
-    /* "src/urh/cythonext/signalFunctions.pyx":232
- *             conseq_zeros = 0
- *             if cur_state == 42: continue
- *         elif s > treshold:             # <<<<<<<<<<<<<<
- *             conseq_ones += 1
- *             conseq_zeros = 0
+      /* "src/urh/cythonext/signalFunctions.pyx":484
+ * 
+ *         if pulse_type == 42 and num_bits >= 9:
+ *             if not there_was_data:             # <<<<<<<<<<<<<<
+ *                 # Pause ignorieren, wenn vorher keine Informationen bertragen wurden
+ *                 n_bits = bit_offsets[num_messages]
  */
-    __pyx_t_8 = ((__pyx_v_s > __pyx_v_treshold) != 0);
-    if (__pyx_t_8) {
+      __pyx_t_3 = ((!(__pyx_v_there_was_data != 0)) != 0);
+      if (__pyx_t_3) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":233
- *             if cur_state == 42: continue
- *         elif s > treshold:
- *             conseq_ones += 1             # <<<<<<<<<<<<<<
- *             conseq_zeros = 0
- *             conseq_pause = 0
+        /* "src/urh/cythonext/signalFunctions.pyx":486
+ *             if not there_was_data:
+ *                 # Pause ignorieren, wenn vorher keine Informationen bertragen wurden
+ *                 n_bits = bit_offsets[num_messages]             # <<<<<<<<<<<<<<
+ *                 n_pos = pos_offsets[num_messages]
+ *                 for k in range(msg_symbols, num_symbols):
+ */
+        __pyx_t_38 = __pyx_v_num_messages;
+        __pyx_v_n_bits = (*((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_bit_offsets.data) + __pyx_t_38)) )));
+
+        /* "src/urh/cythonext/signalFunctions.pyx":487
+ *                 # Pause ignorieren, wenn vorher keine Informationen bertragen wurden
+ *                 n_bits = bit_offsets[num_messages]
+ *                 n_pos = pos_offsets[num_messages]             # <<<<<<<<<<<<<<
+ *                 for k in range(msg_symbols, num_symbols):
+ *                     symbols[k, 3] = -1
+ */
+        __pyx_t_39 = __pyx_v_num_messages;
+        __pyx_v_n_pos = (*((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_pos_offsets.data) + __pyx_t_39)) )));
+
+        /* "src/urh/cythonext/signalFunctions.pyx":488
+ *                 n_bits = bit_offsets[num_messages]
+ *                 n_pos = pos_offsets[num_messages]
+ *                 for k in range(msg_symbols, num_symbols):             # <<<<<<<<<<<<<<
+ *                     symbols[k, 3] = -1
+ *                 msg_symbols = num_symbols
+ */
+        __pyx_t_40 = __pyx_v_num_symbols;
+        for (__pyx_t_41 = __pyx_v_msg_symbols; __pyx_t_41 < __pyx_t_40; __pyx_t_41+=1) {
+          __pyx_v_k = __pyx_t_41;
+
+          /* "src/urh/cythonext/signalFunctions.pyx":489
+ *                 n_pos = pos_offsets[num_messages]
+ *                 for k in range(msg_symbols, num_symbols):
+ *                     symbols[k, 3] = -1             # <<<<<<<<<<<<<<
+ *                 msg_symbols = num_symbols
+ *             else:
  */
-      __pyx_v_conseq_ones = (__pyx_v_conseq_ones + 1);
+          __pyx_t_42 = __pyx_v_k;
+          __pyx_t_43 = 3;
+          *((PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_symbols.data + __pyx_t_42 * __pyx_v_symbols.strides[0]) )) + __pyx_t_43)) )) = -1LL;
+        }
 
-      /* "src/urh/cythonext/signalFunctions.pyx":234
- *         elif s > treshold:
- *             conseq_ones += 1
- *             conseq_zeros = 0             # <<<<<<<<<<<<<<
- *             conseq_pause = 0
- *             if cur_state == 1: continue
- */
-      __pyx_v_conseq_zeros = 0;
-
-      /* "src/urh/cythonext/signalFunctions.pyx":235
- *             conseq_ones += 1
- *             conseq_zeros = 0
- *             conseq_pause = 0             # <<<<<<<<<<<<<<
- *             if cur_state == 1: continue
+        /* "src/urh/cythonext/signalFunctions.pyx":490
+ *                 for k in range(msg_symbols, num_symbols):
+ *                     symbols[k, 3] = -1
+ *                 msg_symbols = num_symbols             # <<<<<<<<<<<<<<
+ *             else:
+ *                 positions[n_pos] = total_samples
+ */
+        __pyx_v_msg_symbols = __pyx_v_num_symbols;
+
+        /* "src/urh/cythonext/signalFunctions.pyx":484
+ * 
+ *         if pulse_type == 42 and num_bits >= 9:
+ *             if not there_was_data:             # <<<<<<<<<<<<<<
+ *                 # Pause ignorieren, wenn vorher keine Informationen bertragen wurden
+ *                 n_bits = bit_offsets[num_messages]
+ */
+        goto __pyx_L24;
+      }
+
+      /* "src/urh/cythonext/signalFunctions.pyx":492
+ *                 msg_symbols = num_symbols
+ *             else:
+ *                 positions[n_pos] = total_samples             # <<<<<<<<<<<<<<
+ *                 positions[n_pos + 1] = total_samples + num_samples
+ *                 n_pos += 2
+ */
+      /*else*/ {
+        __pyx_t_40 = __pyx_v_n_pos;
+        *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_positions.data) + __pyx_t_40)) )) = __pyx_v_total_samples;
+
+        /* "src/urh/cythonext/signalFunctions.pyx":493
+ *             else:
+ *                 positions[n_pos] = total_samples
+ *                 positions[n_pos + 1] = total_samples + num_samples             # <<<<<<<<<<<<<<
+ *                 n_pos += 2
+ *                 pauses[num_messages] = num_samples
+ */
+        __pyx_t_41 = (__pyx_v_n_pos + 1);
+        *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_positions.data) + __pyx_t_41)) )) = (__pyx_v_total_samples + __pyx_v_num_samples);
+
+        /* "src/urh/cythonext/signalFunctions.pyx":494
+ *                 positions[n_pos] = total_samples
+ *                 positions[n_pos + 1] = total_samples + num_samples
+ *                 n_pos += 2             # <<<<<<<<<<<<<<
+ *                 pauses[num_messages] = num_samples
+ *                 num_messages += 1
+ */
+        __pyx_v_n_pos = (__pyx_v_n_pos + 2);
+
+        /* "src/urh/cythonext/signalFunctions.pyx":495
+ *                 positions[n_pos + 1] = total_samples + num_samples
+ *                 n_pos += 2
+ *                 pauses[num_messages] = num_samples             # <<<<<<<<<<<<<<
+ *                 num_messages += 1
+ *                 bit_offsets[num_messages] = n_bits
+ */
+        __pyx_t_44 = __pyx_v_num_messages;
+        *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_pauses.data) + __pyx_t_44)) )) = __pyx_v_num_samples;
+
+        /* "src/urh/cythonext/signalFunctions.pyx":496
+ *                 n_pos += 2
+ *                 pauses[num_messages] = num_samples
+ *                 num_messages += 1             # <<<<<<<<<<<<<<
+ *                 bit_offsets[num_messages] = n_bits
+ *                 pos_offsets[num_messages] = n_pos
+ */
+        __pyx_v_num_messages = (__pyx_v_num_messages + 1);
+
+        /* "src/urh/cythonext/signalFunctions.pyx":497
+ *                 pauses[num_messages] = num_samples
+ *                 num_messages += 1
+ *                 bit_offsets[num_messages] = n_bits             # <<<<<<<<<<<<<<
+ *                 pos_offsets[num_messages] = n_pos
+ *                 msg_symbols = num_symbols
+ */
+        __pyx_t_45 = __pyx_v_num_messages;
+        *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_bit_offsets.data) + __pyx_t_45)) )) = __pyx_v_n_bits;
+
+        /* "src/urh/cythonext/signalFunctions.pyx":498
+ *                 num_messages += 1
+ *                 bit_offsets[num_messages] = n_bits
+ *                 pos_offsets[num_messages] = n_pos             # <<<<<<<<<<<<<<
+ *                 msg_symbols = num_symbols
+ *                 there_was_data = False
+ */
+        __pyx_t_46 = __pyx_v_num_messages;
+        *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_pos_offsets.data) + __pyx_t_46)) )) = __pyx_v_n_pos;
+
+        /* "src/urh/cythonext/signalFunctions.pyx":499
+ *                 bit_offsets[num_messages] = n_bits
+ *                 pos_offsets[num_messages] = n_pos
+ *                 msg_symbols = num_symbols             # <<<<<<<<<<<<<<
+ *                 there_was_data = False
  *         else:
  */
-      __pyx_v_conseq_pause = 0;
+        __pyx_v_msg_symbols = __pyx_v_num_symbols;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":236
- *             conseq_zeros = 0
- *             conseq_pause = 0
- *             if cur_state == 1: continue             # <<<<<<<<<<<<<<
+        /* "src/urh/cythonext/signalFunctions.pyx":500
+ *                 pos_offsets[num_messages] = n_pos
+ *                 msg_symbols = num_symbols
+ *                 there_was_data = False             # <<<<<<<<<<<<<<
  *         else:
- *             conseq_zeros += 1
+ *             if pulse_type == 1 and not there_was_data:
  */
-      __pyx_t_8 = ((__pyx_v_cur_state == 1) != 0);
-      if (__pyx_t_8) {
-        goto __pyx_L5_continue;
+        __pyx_v_there_was_data = 0;
       }
+      __pyx_L24:;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":232
- *             conseq_zeros = 0
- *             if cur_state == 42: continue
- *         elif s > treshold:             # <<<<<<<<<<<<<<
- *             conseq_ones += 1
- *             conseq_zeros = 0
+      /* "src/urh/cythonext/signalFunctions.pyx":483
+ *             continue
+ * 
+ *         if pulse_type == 42 and num_bits >= 9:             # <<<<<<<<<<<<<<
+ *             if not there_was_data:
+ *                 # Pause ignorieren, wenn vorher keine Informationen bertragen wurden
  */
-      goto __pyx_L7;
+      goto __pyx_L21;
     }
 
-    /* "src/urh/cythonext/signalFunctions.pyx":238
- *             if cur_state == 1: continue
+    /* "src/urh/cythonext/signalFunctions.pyx":502
+ *                 there_was_data = False
  *         else:
- *             conseq_zeros += 1             # <<<<<<<<<<<<<<
- *             conseq_ones = 0
- *             conseq_pause = 0
+ *             if pulse_type == 1 and not there_was_data:             # <<<<<<<<<<<<<<
+ *                 there_was_data = num_bits > 0
+ * 
  */
     /*else*/ {
-      __pyx_v_conseq_zeros = (__pyx_v_conseq_zeros + 1);
+      __pyx_t_26 = ((__pyx_v_pulse_type == 1) != 0);
+      if (__pyx_t_26) {
+      } else {
+        __pyx_t_3 = __pyx_t_26;
+        goto __pyx_L28_bool_binop_done;
+      }
+      __pyx_t_26 = ((!(__pyx_v_there_was_data != 0)) != 0);
+      __pyx_t_3 = __pyx_t_26;
+      __pyx_L28_bool_binop_done:;
+      if (__pyx_t_3) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":239
+        /* "src/urh/cythonext/signalFunctions.pyx":503
  *         else:
- *             conseq_zeros += 1
- *             conseq_ones = 0             # <<<<<<<<<<<<<<
- *             conseq_pause = 0
- *             if cur_state == 0: continue
- */
-      __pyx_v_conseq_ones = 0;
-
-      /* "src/urh/cythonext/signalFunctions.pyx":240
- *             conseq_zeros += 1
- *             conseq_ones = 0
- *             conseq_pause = 0             # <<<<<<<<<<<<<<
- *             if cur_state == 0: continue
+ *             if pulse_type == 1 and not there_was_data:
+ *                 there_was_data = num_bits > 0             # <<<<<<<<<<<<<<
  * 
+ *             for k in range(num_bits):
  */
-      __pyx_v_conseq_pause = 0;
+        __pyx_v_there_was_data = (__pyx_v_num_bits > 0);
 
-      /* "src/urh/cythonext/signalFunctions.pyx":241
- *             conseq_ones = 0
- *             conseq_pause = 0
- *             if cur_state == 0: continue             # <<<<<<<<<<<<<<
+        /* "src/urh/cythonext/signalFunctions.pyx":502
+ *                 there_was_data = False
+ *         else:
+ *             if pulse_type == 1 and not there_was_data:             # <<<<<<<<<<<<<<
+ *                 there_was_data = num_bits > 0
  * 
- *         if conseq_ones > tolerance:
  */
-      __pyx_t_8 = ((__pyx_v_cur_state == 0) != 0);
-      if (__pyx_t_8) {
-        goto __pyx_L5_continue;
       }
-    }
-    __pyx_L7:;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":243
- *             if cur_state == 0: continue
+      /* "src/urh/cythonext/signalFunctions.pyx":505
+ *                 there_was_data = num_bits > 0
  * 
- *         if conseq_ones > tolerance:             # <<<<<<<<<<<<<<
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance
+ *             for k in range(num_bits):             # <<<<<<<<<<<<<<
+ *                 bits[n_bits] = 1 if pulse_type == 1 else 0
+ *                 positions[n_pos] = total_samples + k * bit_len
  */
-    __pyx_t_8 = ((__pyx_v_conseq_ones > __pyx_v_tolerance) != 0);
-    if (__pyx_t_8) {
+      __pyx_t_47 = __pyx_v_num_bits;
+      for (__pyx_t_48 = 0; __pyx_t_48 < __pyx_t_47; __pyx_t_48+=1) {
+        __pyx_v_k = __pyx_t_48;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":244
- * 
- *         if conseq_ones > tolerance:
- *             result[cur_index, 0] = cur_state             # <<<<<<<<<<<<<<
- *             result[cur_index, 1] = pulselen - tolerance
- *             cur_index += 1
- */
-      __pyx_t_13 = __pyx_v_cur_index;
-      __pyx_t_14 = 0;
-      *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_13 * __pyx_v_result.strides[0]) )) + __pyx_t_14)) )) = __pyx_v_cur_state;
-
-      /* "src/urh/cythonext/signalFunctions.pyx":245
- *         if conseq_ones > tolerance:
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance             # <<<<<<<<<<<<<<
- *             cur_index += 1
- *             pulselen = tolerance
- */
-      __pyx_t_15 = __pyx_v_cur_index;
-      __pyx_t_16 = 1;
-      *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_15 * __pyx_v_result.strides[0]) )) + __pyx_t_16)) )) = (__pyx_v_pulselen - __pyx_v_tolerance);
-
-      /* "src/urh/cythonext/signalFunctions.pyx":246
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance
- *             cur_index += 1             # <<<<<<<<<<<<<<
- *             pulselen = tolerance
- *             cur_state = 1
+        /* "src/urh/cythonext/signalFunctions.pyx":506
+ * 
+ *             for k in range(num_bits):
+ *                 bits[n_bits] = 1 if pulse_type == 1 else 0             # <<<<<<<<<<<<<<
+ *                 positions[n_pos] = total_samples + k * bit_len
+ *                 n_bits += 1
  */
-      __pyx_v_cur_index = (__pyx_v_cur_index + 1);
+        if (((__pyx_v_pulse_type == 1) != 0)) {
+          __pyx_t_49 = 1;
+        } else {
+          __pyx_t_49 = 0;
+        }
+        __pyx_t_50 = __pyx_v_n_bits;
+        *((__pyx_t_5numpy_int8_t *) ( /* dim=0 */ ((char *) (((__pyx_t_5numpy_int8_t *) __pyx_v_bits.data) + __pyx_t_50)) )) = __pyx_t_49;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":247
- *             result[cur_index, 1] = pulselen - tolerance
- *             cur_index += 1
- *             pulselen = tolerance             # <<<<<<<<<<<<<<
- *             cur_state = 1
- * 
+        /* "src/urh/cythonext/signalFunctions.pyx":507
+ *             for k in range(num_bits):
+ *                 bits[n_bits] = 1 if pulse_type == 1 else 0
+ *                 positions[n_pos] = total_samples + k * bit_len             # <<<<<<<<<<<<<<
+ *                 n_bits += 1
+ *                 n_pos += 1
  */
-      __pyx_v_pulselen = __pyx_v_tolerance;
+        __pyx_t_51 = __pyx_v_n_pos;
+        *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_positions.data) + __pyx_t_51)) )) = (__pyx_v_total_samples + (__pyx_v_k * __pyx_v_bit_len));
 
-      /* "src/urh/cythonext/signalFunctions.pyx":248
- *             cur_index += 1
- *             pulselen = tolerance
- *             cur_state = 1             # <<<<<<<<<<<<<<
+        /* "src/urh/cythonext/signalFunctions.pyx":508
+ *                 bits[n_bits] = 1 if pulse_type == 1 else 0
+ *                 positions[n_pos] = total_samples + k * bit_len
+ *                 n_bits += 1             # <<<<<<<<<<<<<<
+ *                 n_pos += 1
  * 
- *         elif conseq_zeros > tolerance:
  */
-      __pyx_v_cur_state = 1;
+        __pyx_v_n_bits = (__pyx_v_n_bits + 1);
 
-      /* "src/urh/cythonext/signalFunctions.pyx":243
- *             if cur_state == 0: continue
+        /* "src/urh/cythonext/signalFunctions.pyx":509
+ *                 positions[n_pos] = total_samples + k * bit_len
+ *                 n_bits += 1
+ *                 n_pos += 1             # <<<<<<<<<<<<<<
  * 
- *         if conseq_ones > tolerance:             # <<<<<<<<<<<<<<
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance
+ *         total_samples += num_samples
  */
-      goto __pyx_L11;
+        __pyx_v_n_pos = (__pyx_v_n_pos + 1);
+      }
     }
+    __pyx_L21:;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":250
- *             cur_state = 1
+    /* "src/urh/cythonext/signalFunctions.pyx":511
+ *                 n_pos += 1
  * 
- *         elif conseq_zeros > tolerance:             # <<<<<<<<<<<<<<
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance
+ *         total_samples += num_samples             # <<<<<<<<<<<<<<
+ * 
+ *     if there_was_data:
  */
-    __pyx_t_8 = ((__pyx_v_conseq_zeros > __pyx_v_tolerance) != 0);
-    if (__pyx_t_8) {
+    __pyx_v_total_samples = (__pyx_v_total_samples + __pyx_v_num_samples);
+    __pyx_L14_continue:;
+  }
 
-      /* "src/urh/cythonext/signalFunctions.pyx":251
+  /* "src/urh/cythonext/signalFunctions.pyx":513
+ *         total_samples += num_samples
  * 
- *         elif conseq_zeros > tolerance:
- *             result[cur_index, 0] = cur_state             # <<<<<<<<<<<<<<
- *             result[cur_index, 1] = pulselen - tolerance
- *             cur_index += 1
+ *     if there_was_data:             # <<<<<<<<<<<<<<
+ *         positions[n_pos] = total_samples
+ *         n_pos += 1
  */
-      __pyx_t_17 = __pyx_v_cur_index;
-      __pyx_t_18 = 0;
-      *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_17 * __pyx_v_result.strides[0]) )) + __pyx_t_18)) )) = __pyx_v_cur_state;
+  __pyx_t_3 = (__pyx_v_there_was_data != 0);
+  if (__pyx_t_3) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":252
- *         elif conseq_zeros > tolerance:
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance             # <<<<<<<<<<<<<<
- *             cur_index += 1
- *             pulselen = tolerance
+    /* "src/urh/cythonext/signalFunctions.pyx":514
+ * 
+ *     if there_was_data:
+ *         positions[n_pos] = total_samples             # <<<<<<<<<<<<<<
+ *         n_pos += 1
+ *         pauses[num_messages] = ppseq[n - 1, 1] if ppseq[n - 1, 0] == 42 else 0
+ */
+    __pyx_t_5 = __pyx_v_n_pos;
+    *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_positions.data) + __pyx_t_5)) )) = __pyx_v_total_samples;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":515
+ *     if there_was_data:
+ *         positions[n_pos] = total_samples
+ *         n_pos += 1             # <<<<<<<<<<<<<<
+ *         pauses[num_messages] = ppseq[n - 1, 1] if ppseq[n - 1, 0] == 42 else 0
+ *         num_messages += 1
+ */
+    __pyx_v_n_pos = (__pyx_v_n_pos + 1);
+
+    /* "src/urh/cythonext/signalFunctions.pyx":516
+ *         positions[n_pos] = total_samples
+ *         n_pos += 1
+ *         pauses[num_messages] = ppseq[n - 1, 1] if ppseq[n - 1, 0] == 42 else 0             # <<<<<<<<<<<<<<
+ *         num_messages += 1
+ *         bit_offsets[num_messages] = n_bits
+ */
+    __pyx_t_6 = (__pyx_v_n - 1);
+    __pyx_t_53 = 0;
+    if ((((*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_6 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_53)) ))) == 42) != 0)) {
+      __pyx_t_47 = (__pyx_v_n - 1);
+      __pyx_t_54 = 1;
+      __pyx_t_52 = (*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_47 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_54)) )));
+    } else {
+      __pyx_t_52 = 0;
+    }
+    __pyx_t_48 = __pyx_v_num_messages;
+    *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_pauses.data) + __pyx_t_48)) )) = __pyx_t_52;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":517
+ *         n_pos += 1
+ *         pauses[num_messages] = ppseq[n - 1, 1] if ppseq[n - 1, 0] == 42 else 0
+ *         num_messages += 1             # <<<<<<<<<<<<<<
+ *         bit_offsets[num_messages] = n_bits
+ *         pos_offsets[num_messages] = n_pos
  */
-      __pyx_t_19 = __pyx_v_cur_index;
-      __pyx_t_20 = 1;
-      *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_19 * __pyx_v_result.strides[0]) )) + __pyx_t_20)) )) = (__pyx_v_pulselen - __pyx_v_tolerance);
+    __pyx_v_num_messages = (__pyx_v_num_messages + 1);
 
-      /* "src/urh/cythonext/signalFunctions.pyx":253
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance
- *             cur_index += 1             # <<<<<<<<<<<<<<
- *             pulselen = tolerance
- *             cur_state = 0
+    /* "src/urh/cythonext/signalFunctions.pyx":518
+ *         pauses[num_messages] = ppseq[n - 1, 1] if ppseq[n - 1, 0] == 42 else 0
+ *         num_messages += 1
+ *         bit_offsets[num_messages] = n_bits             # <<<<<<<<<<<<<<
+ *         pos_offsets[num_messages] = n_pos
+ *     else:
  */
-      __pyx_v_cur_index = (__pyx_v_cur_index + 1);
+    __pyx_t_55 = __pyx_v_num_messages;
+    *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_bit_offsets.data) + __pyx_t_55)) )) = __pyx_v_n_bits;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":254
- *             result[cur_index, 1] = pulselen - tolerance
- *             cur_index += 1
- *             pulselen = tolerance             # <<<<<<<<<<<<<<
- *             cur_state = 0
+    /* "src/urh/cythonext/signalFunctions.pyx":519
+ *         num_messages += 1
+ *         bit_offsets[num_messages] = n_bits
+ *         pos_offsets[num_messages] = n_pos             # <<<<<<<<<<<<<<
+ *     else:
+ *         for k in range(msg_symbols, num_symbols):
+ */
+    __pyx_t_56 = __pyx_v_num_messages;
+    *((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_pos_offsets.data) + __pyx_t_56)) )) = __pyx_v_n_pos;
+
+    /* "src/urh/cythonext/signalFunctions.pyx":513
+ *         total_samples += num_samples
  * 
+ *     if there_was_data:             # <<<<<<<<<<<<<<
+ *         positions[n_pos] = total_samples
+ *         n_pos += 1
  */
-      __pyx_v_pulselen = __pyx_v_tolerance;
+    goto __pyx_L32;
+  }
 
-      /* "src/urh/cythonext/signalFunctions.pyx":255
- *             cur_index += 1
- *             pulselen = tolerance
- *             cur_state = 0             # <<<<<<<<<<<<<<
+  /* "src/urh/cythonext/signalFunctions.pyx":521
+ *         pos_offsets[num_messages] = n_pos
+ *     else:
+ *         for k in range(msg_symbols, num_symbols):             # <<<<<<<<<<<<<<
+ *             symbols[k, 3] = -1
  * 
- *         elif conseq_pause > tolerance:
  */
-      __pyx_v_cur_state = 0;
+  /*else*/ {
+    __pyx_t_57 = __pyx_v_num_symbols;
+    for (__pyx_t_58 = __pyx_v_msg_symbols; __pyx_t_58 < __pyx_t_57; __pyx_t_58+=1) {
+      __pyx_v_k = __pyx_t_58;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":250
- *             cur_state = 1
+      /* "src/urh/cythonext/signalFunctions.pyx":522
+ *     else:
+ *         for k in range(msg_symbols, num_symbols):
+ *             symbols[k, 3] = -1             # <<<<<<<<<<<<<<
  * 
- *         elif conseq_zeros > tolerance:             # <<<<<<<<<<<<<<
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance
+ *     return (np.asarray(bits[:bit_offsets[num_messages]]), np.asarray(bit_offsets[:num_messages + 1]),
  */
-      goto __pyx_L11;
+      __pyx_t_59 = __pyx_v_k;
+      __pyx_t_60 = 3;
+      *((PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_symbols.data + __pyx_t_59 * __pyx_v_symbols.strides[0]) )) + __pyx_t_60)) )) = -1LL;
     }
+  }
+  __pyx_L32:;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":257
- *             cur_state = 0
+  /* "src/urh/cythonext/signalFunctions.pyx":524
+ *             symbols[k, 3] = -1
  * 
- *         elif conseq_pause > tolerance:             # <<<<<<<<<<<<<<
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance
+ *     return (np.asarray(bits[:bit_offsets[num_messages]]), np.asarray(bit_offsets[:num_messages + 1]),             # <<<<<<<<<<<<<<
+ *             np.asarray(positions[:pos_offsets[num_messages]]), np.asarray(pos_offsets[:num_messages + 1]),
+ *             np.asarray(pauses[:num_messages]), np.asarray(symbols[:num_symbols]))
  */
-    __pyx_t_8 = ((__pyx_v_conseq_pause > __pyx_v_tolerance) != 0);
-    if (__pyx_t_8) {
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_12 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 524, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_asarray); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 524, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_57 = __pyx_v_num_messages;
+  __pyx_t_15.data = __pyx_v_bits.data;
+  __pyx_t_15.memview = __pyx_v_bits.memview;
+  __PYX_INC_MEMVIEW(&__pyx_t_15, 0);
+  __pyx_t_27 = -1;
+  if (unlikely(__pyx_memoryview_slice_memviewslice(
+    &__pyx_t_15,
+    __pyx_v_bits.shape[0], __pyx_v_bits.strides[0], __pyx_v_bits.suboffsets[0],
+    0,
+    0,
+    &__pyx_t_27,
+    0,
+    (*((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_bit_offsets.data) + __pyx_t_57)) ))),
+    0,
+    0,
+    1,
+    0,
+    1) < 0))
+{
+    __PYX_ERR(0, 524, __pyx_L1_error)
+}
 
-      /* "src/urh/cythonext/signalFunctions.pyx":258
- * 
- *         elif conseq_pause > tolerance:
- *             result[cur_index, 0] = cur_state             # <<<<<<<<<<<<<<
- *             result[cur_index, 1] = pulselen - tolerance
- *             cur_index += 1
- */
-      __pyx_t_21 = __pyx_v_cur_index;
-      __pyx_t_22 = 0;
-      *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_21 * __pyx_v_result.strides[0]) )) + __pyx_t_22)) )) = __pyx_v_cur_state;
-
-      /* "src/urh/cythonext/signalFunctions.pyx":259
- *         elif conseq_pause > tolerance:
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance             # <<<<<<<<<<<<<<
- *             cur_index += 1
- *             pulselen = tolerance
- */
-      __pyx_t_23 = __pyx_v_cur_index;
-      __pyx_t_24 = 1;
-      *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_23 * __pyx_v_result.strides[0]) )) + __pyx_t_24)) )) = (__pyx_v_pulselen - __pyx_v_tolerance);
-
-      /* "src/urh/cythonext/signalFunctions.pyx":260
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance
- *             cur_index += 1             # <<<<<<<<<<<<<<
- *             pulselen = tolerance
- *             cur_state = 42
- */
-      __pyx_v_cur_index = (__pyx_v_cur_index + 1);
+__pyx_t_12 = __pyx_memoryview_fromslice(__pyx_t_15, 1, (PyObject *(*)(char *)) __pyx_memview_get_nn___pyx_t_5numpy_int8_t, (int (*)(char *, PyObject *)) __pyx_memview_set_nn___pyx_t_5numpy_int8_t, 0);; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 524, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_15, 1);
+  __pyx_t_15.memview = NULL;
+  __pyx_t_15.data = NULL;
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_14))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_14);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_14);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_14, function);
+    }
+  }
+  if (!__pyx_t_1) {
+    __pyx_t_13 = __Pyx_PyObject_CallOneArg(__pyx_t_14, __pyx_t_12); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 524, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __Pyx_GOTREF(__pyx_t_13);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_14)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_12};
+      __pyx_t_13 = __Pyx_PyFunction_FastCall(__pyx_t_14, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 524, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_14)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_12};
+      __pyx_t_13 = __Pyx_PyCFunction_FastCall(__pyx_t_14, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 524, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_11 = PyTuple_New(1+1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 524, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_1); __pyx_t_1 = NULL;
+      __Pyx_GIVEREF(__pyx_t_12);
+      PyTuple_SET_ITEM(__pyx_t_11, 0+1, __pyx_t_12);
+      __pyx_t_12 = 0;
+      __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_14, __pyx_t_11, NULL); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 524, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_11 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 524, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_n_s_asarray); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 524, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_16.data = __pyx_v_bit_offsets.data;
+  __pyx_t_16.memview = __pyx_v_bit_offsets.memview;
+  __PYX_INC_MEMVIEW(&__pyx_t_16, 0);
+  __pyx_t_27 = -1;
+  if (unlikely(__pyx_memoryview_slice_memviewslice(
+    &__pyx_t_16,
+    __pyx_v_bit_offsets.shape[0], __pyx_v_bit_offsets.strides[0], __pyx_v_bit_offsets.suboffsets[0],
+    0,
+    0,
+    &__pyx_t_27,
+    0,
+    (__pyx_v_num_messages + 1),
+    0,
+    0,
+    1,
+    0,
+    1) < 0))
+{
+    __PYX_ERR(0, 524, __pyx_L1_error)
+}
 
-      /* "src/urh/cythonext/signalFunctions.pyx":261
- *             result[cur_index, 1] = pulselen - tolerance
- *             cur_index += 1
- *             pulselen = tolerance             # <<<<<<<<<<<<<<
- *             cur_state = 42
- * 
- */
-      __pyx_v_pulselen = __pyx_v_tolerance;
+__pyx_t_11 = __pyx_memoryview_fromslice(__pyx_t_16, 1, (PyObject *(*)(char *)) __pyx_memview_get_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 524, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_16, 1);
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_12))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_12);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_12);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_12, function);
+    }
+  }
+  if (!__pyx_t_1) {
+    __pyx_t_14 = __Pyx_PyObject_CallOneArg(__pyx_t_12, __pyx_t_11); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 524, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_GOTREF(__pyx_t_14);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_12)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_11};
+      __pyx_t_14 = __Pyx_PyFunction_FastCall(__pyx_t_12, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 524, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_12)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_11};
+      __pyx_t_14 = __Pyx_PyCFunction_FastCall(__pyx_t_12, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 524, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_61 = PyTuple_New(1+1); if (unlikely(!__pyx_t_61)) __PYX_ERR(0, 524, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_61);
+      __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_61, 0, __pyx_t_1); __pyx_t_1 = NULL;
+      __Pyx_GIVEREF(__pyx_t_11);
+      PyTuple_SET_ITEM(__pyx_t_61, 0+1, __pyx_t_11);
+      __pyx_t_11 = 0;
+      __pyx_t_14 = __Pyx_PyObject_Call(__pyx_t_12, __pyx_t_61, NULL); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 524, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_61); __pyx_t_61 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":525
+ * 
+ *     return (np.asarray(bits[:bit_offsets[num_messages]]), np.asarray(bit_offsets[:num_messages + 1]),
+ *             np.asarray(positions[:pos_offsets[num_messages]]), np.asarray(pos_offsets[:num_messages + 1]),             # <<<<<<<<<<<<<<
+ *             np.asarray(pauses[:num_messages]), np.asarray(symbols[:num_symbols]))
+ * 
+ */
+  __pyx_t_61 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_61)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_61);
+  __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_61, __pyx_n_s_asarray); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_61); __pyx_t_61 = 0;
+  __pyx_t_58 = __pyx_v_num_messages;
+  __pyx_t_16.data = __pyx_v_positions.data;
+  __pyx_t_16.memview = __pyx_v_positions.memview;
+  __PYX_INC_MEMVIEW(&__pyx_t_16, 0);
+  __pyx_t_27 = -1;
+  if (unlikely(__pyx_memoryview_slice_memviewslice(
+    &__pyx_t_16,
+    __pyx_v_positions.shape[0], __pyx_v_positions.strides[0], __pyx_v_positions.suboffsets[0],
+    0,
+    0,
+    &__pyx_t_27,
+    0,
+    (*((PY_LONG_LONG *) ( /* dim=0 */ ((char *) (((PY_LONG_LONG *) __pyx_v_pos_offsets.data) + __pyx_t_58)) ))),
+    0,
+    0,
+    1,
+    0,
+    1) < 0))
+{
+    __PYX_ERR(0, 525, __pyx_L1_error)
+}
 
-      /* "src/urh/cythonext/signalFunctions.pyx":262
- *             cur_index += 1
- *             pulselen = tolerance
- *             cur_state = 42             # <<<<<<<<<<<<<<
- * 
- *     # Letzen anfgen
- */
-      __pyx_v_cur_state = 42;
+__pyx_t_61 = __pyx_memoryview_fromslice(__pyx_t_16, 1, (PyObject *(*)(char *)) __pyx_memview_get_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_61)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_61);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_16, 1);
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_11))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_11);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_11);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_11, function);
+    }
+  }
+  if (!__pyx_t_1) {
+    __pyx_t_12 = __Pyx_PyObject_CallOneArg(__pyx_t_11, __pyx_t_61); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 525, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_61); __pyx_t_61 = 0;
+    __Pyx_GOTREF(__pyx_t_12);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_11)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_61};
+      __pyx_t_12 = __Pyx_PyFunction_FastCall(__pyx_t_11, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 525, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_12);
+      __Pyx_DECREF(__pyx_t_61); __pyx_t_61 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_11)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_61};
+      __pyx_t_12 = __Pyx_PyCFunction_FastCall(__pyx_t_11, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 525, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_12);
+      __Pyx_DECREF(__pyx_t_61); __pyx_t_61 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_62 = PyTuple_New(1+1); if (unlikely(!__pyx_t_62)) __PYX_ERR(0, 525, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_62);
+      __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_62, 0, __pyx_t_1); __pyx_t_1 = NULL;
+      __Pyx_GIVEREF(__pyx_t_61);
+      PyTuple_SET_ITEM(__pyx_t_62, 0+1, __pyx_t_61);
+      __pyx_t_61 = 0;
+      __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_11, __pyx_t_62, NULL); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 525, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __Pyx_DECREF(__pyx_t_62); __pyx_t_62 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_62 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_62)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_62);
+  __pyx_t_61 = __Pyx_PyObject_GetAttrStr(__pyx_t_62, __pyx_n_s_asarray); if (unlikely(!__pyx_t_61)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_61);
+  __Pyx_DECREF(__pyx_t_62); __pyx_t_62 = 0;
+  __pyx_t_16.data = __pyx_v_pos_offsets.data;
+  __pyx_t_16.memview = __pyx_v_pos_offsets.memview;
+  __PYX_INC_MEMVIEW(&__pyx_t_16, 0);
+  __pyx_t_27 = -1;
+  if (unlikely(__pyx_memoryview_slice_memviewslice(
+    &__pyx_t_16,
+    __pyx_v_pos_offsets.shape[0], __pyx_v_pos_offsets.strides[0], __pyx_v_pos_offsets.suboffsets[0],
+    0,
+    0,
+    &__pyx_t_27,
+    0,
+    (__pyx_v_num_messages + 1),
+    0,
+    0,
+    1,
+    0,
+    1) < 0))
+{
+    __PYX_ERR(0, 525, __pyx_L1_error)
+}
 
-      /* "src/urh/cythonext/signalFunctions.pyx":257
- *             cur_state = 0
- * 
- *         elif conseq_pause > tolerance:             # <<<<<<<<<<<<<<
- *             result[cur_index, 0] = cur_state
- *             result[cur_index, 1] = pulselen - tolerance
- */
+__pyx_t_62 = __pyx_memoryview_fromslice(__pyx_t_16, 1, (PyObject *(*)(char *)) __pyx_memview_get_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_62)) __PYX_ERR(0, 525, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_62);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_16, 1);
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_61))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_61);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_61);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_61, function);
     }
-    __pyx_L11:;
-    __pyx_L5_continue:;
   }
-
-  /* "src/urh/cythonext/signalFunctions.pyx":265
- * 
- *     # Letzen anfgen
- *     cdef unsigned long long len_result = len(result)             # <<<<<<<<<<<<<<
- *     if cur_index < len_result:
- *         result[cur_index, 0] = cur_state
- */
-  __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_v_result, 2, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 265, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_2 = PyObject_Length(__pyx_t_6); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 265, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_v_len_result = __pyx_t_2;
-
-  /* "src/urh/cythonext/signalFunctions.pyx":266
- *     # Letzen anfgen
- *     cdef unsigned long long len_result = len(result)
- *     if cur_index < len_result:             # <<<<<<<<<<<<<<
- *         result[cur_index, 0] = cur_state
- *         result[cur_index, 1] = pulselen
- */
-  __pyx_t_8 = ((__pyx_v_cur_index < __pyx_v_len_result) != 0);
-  if (__pyx_t_8) {
-
-    /* "src/urh/cythonext/signalFunctions.pyx":267
- *     cdef unsigned long long len_result = len(result)
- *     if cur_index < len_result:
- *         result[cur_index, 0] = cur_state             # <<<<<<<<<<<<<<
- *         result[cur_index, 1] = pulselen
- *         cur_index += 1
- */
-    __pyx_t_10 = __pyx_v_cur_index;
-    __pyx_t_25 = 0;
-    *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_10 * __pyx_v_result.strides[0]) )) + __pyx_t_25)) )) = __pyx_v_cur_state;
-
-    /* "src/urh/cythonext/signalFunctions.pyx":268
- *     if cur_index < len_result:
- *         result[cur_index, 0] = cur_state
- *         result[cur_index, 1] = pulselen             # <<<<<<<<<<<<<<
- *         cur_index += 1
- * 
- */
-    __pyx_t_11 = __pyx_v_cur_index;
-    __pyx_t_26 = 1;
-    *((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_result.data + __pyx_t_11 * __pyx_v_result.strides[0]) )) + __pyx_t_26)) )) = __pyx_v_pulselen;
-
-    /* "src/urh/cythonext/signalFunctions.pyx":269
- *         result[cur_index, 0] = cur_state
- *         result[cur_index, 1] = pulselen
- *         cur_index += 1             # <<<<<<<<<<<<<<
- * 
- *     if cur_index > len_result:
- */
-    __pyx_v_cur_index = (__pyx_v_cur_index + 1);
-
-    /* "src/urh/cythonext/signalFunctions.pyx":266
- *     # Letzen anfgen
- *     cdef unsigned long long len_result = len(result)
- *     if cur_index < len_result:             # <<<<<<<<<<<<<<
- *         result[cur_index, 0] = cur_state
- *         result[cur_index, 1] = pulselen
- */
+  if (!__pyx_t_1) {
+    __pyx_t_11 = __Pyx_PyObject_CallOneArg(__pyx_t_61, __pyx_t_62); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 525, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_62); __pyx_t_62 = 0;
+    __Pyx_GOTREF(__pyx_t_11);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_61)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_62};
+      __pyx_t_11 = __Pyx_PyFunction_FastCall(__pyx_t_61, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 525, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_62); __pyx_t_62 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_61)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_62};
+      __pyx_t_11 = __Pyx_PyCFunction_FastCall(__pyx_t_61, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 525, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_62); __pyx_t_62 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_63 = PyTuple_New(1+1); if (unlikely(!__pyx_t_63)) __PYX_ERR(0, 525, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_63);
+      __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_63, 0, __pyx_t_1); __pyx_t_1 = NULL;
+      __Pyx_GIVEREF(__pyx_t_62);
+      PyTuple_SET_ITEM(__pyx_t_63, 0+1, __pyx_t_62);
+      __pyx_t_62 = 0;
+      __pyx_t_11 = __Pyx_PyObject_Call(__pyx_t_61, __pyx_t_63, NULL); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 525, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_63); __pyx_t_63 = 0;
+    }
   }
+  __Pyx_DECREF(__pyx_t_61); __pyx_t_61 = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":271
- *         cur_index += 1
- * 
- *     if cur_index > len_result:             # <<<<<<<<<<<<<<
- *         cur_index = len_result
- * 
- */
-  __pyx_t_8 = ((__pyx_v_cur_index > __pyx_v_len_result) != 0);
-  if (__pyx_t_8) {
-
-    /* "src/urh/cythonext/signalFunctions.pyx":272
+  /* "src/urh/cythonext/signalFunctions.pyx":526
+ *     return (np.asarray(bits[:bit_offsets[num_messages]]), np.asarray(bit_offsets[:num_messages + 1]),
+ *             np.asarray(positions[:pos_offsets[num_messages]]), np.asarray(pos_offsets[:num_messages + 1]),
+ *             np.asarray(pauses[:num_messages]), np.asarray(symbols[:num_symbols]))             # <<<<<<<<<<<<<<
  * 
- *     if cur_index > len_result:
- *         cur_index = len_result             # <<<<<<<<<<<<<<
- * 
- *     return result[:cur_index]
+ * cdef class Symbol:
  */
-    __pyx_v_cur_index = __pyx_v_len_result;
+  __pyx_t_63 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_63)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_63);
+  __pyx_t_62 = __Pyx_PyObject_GetAttrStr(__pyx_t_63, __pyx_n_s_asarray); if (unlikely(!__pyx_t_62)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_62);
+  __Pyx_DECREF(__pyx_t_63); __pyx_t_63 = 0;
+  __pyx_t_16.data = __pyx_v_pauses.data;
+  __pyx_t_16.memview = __pyx_v_pauses.memview;
+  __PYX_INC_MEMVIEW(&__pyx_t_16, 0);
+  __pyx_t_27 = -1;
+  if (unlikely(__pyx_memoryview_slice_memviewslice(
+    &__pyx_t_16,
+    __pyx_v_pauses.shape[0], __pyx_v_pauses.strides[0], __pyx_v_pauses.suboffsets[0],
+    0,
+    0,
+    &__pyx_t_27,
+    0,
+    __pyx_v_num_messages,
+    0,
+    0,
+    1,
+    0,
+    1) < 0))
+{
+    __PYX_ERR(0, 526, __pyx_L1_error)
+}
 
-    /* "src/urh/cythonext/signalFunctions.pyx":271
- *         cur_index += 1
- * 
- *     if cur_index > len_result:             # <<<<<<<<<<<<<<
- *         cur_index = len_result
- * 
- */
+__pyx_t_63 = __pyx_memoryview_fromslice(__pyx_t_16, 1, (PyObject *(*)(char *)) __pyx_memview_get_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_63)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_63);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_16, 1);
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_62))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_62);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_62);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_62, function);
+    }
   }
-
-  /* "src/urh/cythonext/signalFunctions.pyx":274
- *         cur_index = len_result
- * 
- *     return result[:cur_index]             # <<<<<<<<<<<<<<
- * 
- * cdef class Symbol:
- */
-  __pyx_t_7.data = __pyx_v_result.data;
-  __pyx_t_7.memview = __pyx_v_result.memview;
-  __PYX_INC_MEMVIEW(&__pyx_t_7, 0);
+  if (!__pyx_t_1) {
+    __pyx_t_61 = __Pyx_PyObject_CallOneArg(__pyx_t_62, __pyx_t_63); if (unlikely(!__pyx_t_61)) __PYX_ERR(0, 526, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_63); __pyx_t_63 = 0;
+    __Pyx_GOTREF(__pyx_t_61);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_62)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_63};
+      __pyx_t_61 = __Pyx_PyFunction_FastCall(__pyx_t_62, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_61)) __PYX_ERR(0, 526, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_61);
+      __Pyx_DECREF(__pyx_t_63); __pyx_t_63 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_62)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_63};
+      __pyx_t_61 = __Pyx_PyCFunction_FastCall(__pyx_t_62, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_61)) __PYX_ERR(0, 526, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_61);
+      __Pyx_DECREF(__pyx_t_63); __pyx_t_63 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_64 = PyTuple_New(1+1); if (unlikely(!__pyx_t_64)) __PYX_ERR(0, 526, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_64);
+      __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_64, 0, __pyx_t_1); __pyx_t_1 = NULL;
+      __Pyx_GIVEREF(__pyx_t_63);
+      PyTuple_SET_ITEM(__pyx_t_64, 0+1, __pyx_t_63);
+      __pyx_t_63 = 0;
+      __pyx_t_61 = __Pyx_PyObject_Call(__pyx_t_62, __pyx_t_64, NULL); if (unlikely(!__pyx_t_61)) __PYX_ERR(0, 526, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_61);
+      __Pyx_DECREF(__pyx_t_64); __pyx_t_64 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_62); __pyx_t_62 = 0;
+  __pyx_t_64 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_64)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_64);
+  __pyx_t_63 = __Pyx_PyObject_GetAttrStr(__pyx_t_64, __pyx_n_s_asarray); if (unlikely(!__pyx_t_63)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_63);
+  __Pyx_DECREF(__pyx_t_64); __pyx_t_64 = 0;
+  __pyx_t_17.data = __pyx_v_symbols.data;
+  __pyx_t_17.memview = __pyx_v_symbols.memview;
+  __PYX_INC_MEMVIEW(&__pyx_t_17, 0);
   __pyx_t_27 = -1;
   if (unlikely(__pyx_memoryview_slice_memviewslice(
-    &__pyx_t_7,
-    __pyx_v_result.shape[0], __pyx_v_result.strides[0], __pyx_v_result.suboffsets[0],
+    &__pyx_t_17,
+    __pyx_v_symbols.shape[0], __pyx_v_symbols.strides[0], __pyx_v_symbols.suboffsets[0],
     0,
     0,
     &__pyx_t_27,
     0,
-    __pyx_v_cur_index,
+    __pyx_v_num_symbols,
     0,
     0,
     1,
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 274, __pyx_L1_error)
+    __PYX_ERR(0, 526, __pyx_L1_error)
 }
 
-__pyx_t_7.shape[1] = __pyx_v_result.shape[1];
-__pyx_t_7.strides[1] = __pyx_v_result.strides[1];
-    __pyx_t_7.suboffsets[1] = -1;
+__pyx_t_17.shape[1] = __pyx_v_symbols.shape[1];
+__pyx_t_17.strides[1] = __pyx_v_symbols.strides[1];
+    __pyx_t_17.suboffsets[1] = -1;
 
-__pyx_r = __pyx_t_7;
-  __pyx_t_7.memview = NULL;
-  __pyx_t_7.data = NULL;
+__pyx_t_64 = __pyx_memoryview_fromslice(__pyx_t_17, 2, (PyObject *(*)(char *)) __pyx_memview_get_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_64)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_64);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_17, 1);
+  __pyx_t_17.memview = NULL;
+  __pyx_t_17.data = NULL;
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_63))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_63);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_63);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_63, function);
+    }
+  }
+  if (!__pyx_t_1) {
+    __pyx_t_62 = __Pyx_PyObject_CallOneArg(__pyx_t_63, __pyx_t_64); if (unlikely(!__pyx_t_62)) __PYX_ERR(0, 526, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_64); __pyx_t_64 = 0;
+    __Pyx_GOTREF(__pyx_t_62);
+  } else {
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_63)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_64};
+      __pyx_t_62 = __Pyx_PyFunction_FastCall(__pyx_t_63, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_62)) __PYX_ERR(0, 526, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_62);
+      __Pyx_DECREF(__pyx_t_64); __pyx_t_64 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_63)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_64};
+      __pyx_t_62 = __Pyx_PyCFunction_FastCall(__pyx_t_63, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_62)) __PYX_ERR(0, 526, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GOTREF(__pyx_t_62);
+      __Pyx_DECREF(__pyx_t_64); __pyx_t_64 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_65 = PyTuple_New(1+1); if (unlikely(!__pyx_t_65)) __PYX_ERR(0, 526, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_65);
+      __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_65, 0, __pyx_t_1); __pyx_t_1 = NULL;
+      __Pyx_GIVEREF(__pyx_t_64);
+      PyTuple_SET_ITEM(__pyx_t_65, 0+1, __pyx_t_64);
+      __pyx_t_64 = 0;
+      __pyx_t_62 = __Pyx_PyObject_Call(__pyx_t_63, __pyx_t_65, NULL); if (unlikely(!__pyx_t_62)) __PYX_ERR(0, 526, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_62);
+      __Pyx_DECREF(__pyx_t_65); __pyx_t_65 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_63); __pyx_t_63 = 0;
+
+  /* "src/urh/cythonext/signalFunctions.pyx":524
+ *             symbols[k, 3] = -1
+ * 
+ *     return (np.asarray(bits[:bit_offsets[num_messages]]), np.asarray(bit_offsets[:num_messages + 1]),             # <<<<<<<<<<<<<<
+ *             np.asarray(positions[:pos_offsets[num_messages]]), np.asarray(pos_offsets[:num_messages + 1]),
+ *             np.asarray(pauses[:num_messages]), np.asarray(symbols[:num_symbols]))
+ */
+  __pyx_t_63 = PyTuple_New(6); if (unlikely(!__pyx_t_63)) __PYX_ERR(0, 524, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_63);
+  __Pyx_GIVEREF(__pyx_t_13);
+  PyTuple_SET_ITEM(__pyx_t_63, 0, __pyx_t_13);
+  __Pyx_GIVEREF(__pyx_t_14);
+  PyTuple_SET_ITEM(__pyx_t_63, 1, __pyx_t_14);
+  __Pyx_GIVEREF(__pyx_t_12);
+  PyTuple_SET_ITEM(__pyx_t_63, 2, __pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_11);
+  PyTuple_SET_ITEM(__pyx_t_63, 3, __pyx_t_11);
+  __Pyx_GIVEREF(__pyx_t_61);
+  PyTuple_SET_ITEM(__pyx_t_63, 4, __pyx_t_61);
+  __Pyx_GIVEREF(__pyx_t_62);
+  PyTuple_SET_ITEM(__pyx_t_63, 5, __pyx_t_62);
+  __pyx_t_13 = 0;
+  __pyx_t_14 = 0;
+  __pyx_t_12 = 0;
+  __pyx_t_11 = 0;
+  __pyx_t_61 = 0;
+  __pyx_t_62 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_63);
+  __pyx_t_63 = 0;
   goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":194
- *     return ns
+  /* "src/urh/cythonext/signalFunctions.pyx":413
+ *     return result[:cur_index]
  * 
- * cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples,             # <<<<<<<<<<<<<<
- *                                                  float treshold, unsigned int tolerance, int mod_type):
+ * cpdef tuple pulses_to_bits(unsigned long long[:, ::1] ppseq, unsigned long long bit_len, double rel_symbol_len):             # <<<<<<<<<<<<<<
  *     """
+ *     Wandelt die Pulslngen aus grab_pulse_lens in Bits um.
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_7, 1);
-  __pyx_r.data = NULL;
-  __pyx_r.memview = NULL;
-  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.grab_pulse_lens", __pyx_clineno, __pyx_lineno, __pyx_filename);
-
-  goto __pyx_L2;
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_15, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_16, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_17, 1);
+  __Pyx_XDECREF(__pyx_t_61);
+  __Pyx_XDECREF(__pyx_t_62);
+  __Pyx_XDECREF(__pyx_t_63);
+  __Pyx_XDECREF(__pyx_t_64);
+  __Pyx_XDECREF(__pyx_t_65);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.pulses_to_bits", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
-  if (unlikely(!__pyx_r.memview)) {
-    PyErr_SetString(PyExc_TypeError, "Memoryview return value is not initialized");
-  }
-  __pyx_L2:;
-  __PYX_XDEC_MEMVIEW(&__pyx_v_result, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_bits, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_positions, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_bit_offsets, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_pos_offsets, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_pauses, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_symbols, 1);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_9grab_pulse_lens(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3src_3urh_9cythonext_15signalFunctions_8grab_pulse_lens[] = "\n    Holt sich die Pulsl\303\244ngen aus den quadraturdemodulierten Samples\n    @param samples: Samples nach der QAD\n    @param treshold: Alles \303\274ber der Treshold ist ein Einserpuls, alles darunter 0er Puls\n    @return: Ein 2D Array arr.\n    arr[i] gibt Position an.\n    arr[i][0] gibt an ob Einspuls (arr[i][0] = 1) Nullpuls (arr[i][0] = 0) Pause (arr[i][0] = 42)\n    arr[i][1] gibt die L\303\244nge des Pulses bzw. der Pause an.\n    ";
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_9grab_pulse_lens(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  __Pyx_memviewslice __pyx_v_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
-  float __pyx_v_treshold;
-  unsigned int __pyx_v_tolerance;
-  int __pyx_v_mod_type;
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15pulses_to_bits(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3src_3urh_9cythonext_15signalFunctions_14pulses_to_bits[] = "\n    Wandelt die Pulsl\303\244ngen aus grab_pulse_lens in Bits um.\n    Die Nachrichten werden hintereinander in flache Arrays geschrieben, Nachricht i liegt in\n    bits[bit_offsets[i]:bit_offsets[i+1]] und positions[pos_offsets[i]:pos_offsets[i+1]].\n\n    @return: Tupel (bits, bit_offsets, positions, pos_offsets, pauses, symbols).\n    bits: int8 Array mit 0, 1 oder 2 f\303\274r ein Symbol.\n    positions: Sampleposition jedes Bits, gefolgt von den Positionen der Pause.\n    symbols: int64 Array mit einer Zeile (nbits, pulsetype, nsamples, index in bits) je Symbol\n    in der Reihenfolge ihres Auftretens. Der Index ist -1 f\303\274r Symbole in verworfenen Daten.\n    ";
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15pulses_to_bits(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_ppseq = { 0, 0, { 0 }, { 0 }, { 0 } };
+  unsigned PY_LONG_LONG __pyx_v_bit_len;
+  double __pyx_v_rel_symbol_len;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("grab_pulse_lens (wrapper)", 0);
+  __Pyx_RefNannySetupContext("pulses_to_bits (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_samples,&__pyx_n_s_treshold,&__pyx_n_s_tolerance,&__pyx_n_s_mod_type,0};
-    PyObject* values[4] = {0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_ppseq,&__pyx_n_s_bit_len,&__pyx_n_s_rel_symbol_len,0};
+    PyObject* values[3] = {0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -5168,86 +9086,73 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_9grab_pulse_len
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_samples)) != 0)) kw_args--;
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ppseq)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_treshold)) != 0)) kw_args--;
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bit_len)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens", 1, 4, 4, 1); __PYX_ERR(0, 194, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pulses_to_bits", 1, 3, 3, 1); __PYX_ERR(0, 413, __pyx_L3_error)
         }
         case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_tolerance)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens", 1, 4, 4, 2); __PYX_ERR(0, 194, __pyx_L3_error)
-        }
-        case  3:
-        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_rel_symbol_len)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("grab_pulse_lens", 1, 4, 4, 3); __PYX_ERR(0, 194, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pulses_to_bits", 1, 3, 3, 2); __PYX_ERR(0, 413, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "grab_pulse_lens") < 0)) __PYX_ERR(0, 194, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pulses_to_bits") < 0)) __PYX_ERR(0, 413, __pyx_L3_error)
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_samples.memview)) __PYX_ERR(0, 194, __pyx_L3_error)
-    __pyx_v_treshold = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_treshold == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 195, __pyx_L3_error)
-    __pyx_v_tolerance = __Pyx_PyInt_As_unsigned_int(values[2]); if (unlikely((__pyx_v_tolerance == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 195, __pyx_L3_error)
-    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 195, __pyx_L3_error)
+    __pyx_v_ppseq = __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_PY_LONG_LONG(values[0]); if (unlikely(!__pyx_v_ppseq.memview)) __PYX_ERR(0, 413, __pyx_L3_error)
+    __pyx_v_bit_len = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[1]); if (unlikely((__pyx_v_bit_len == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 413, __pyx_L3_error)
+    __pyx_v_rel_symbol_len = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_rel_symbol_len == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 413, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("grab_pulse_lens", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 194, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pulses_to_bits", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 413, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.grab_pulse_lens", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.pulses_to_bits", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_8grab_pulse_lens(__pyx_self, __pyx_v_samples, __pyx_v_treshold, __pyx_v_tolerance, __pyx_v_mod_type);
+  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_14pulses_to_bits(__pyx_self, __pyx_v_ppseq, __pyx_v_bit_len, __pyx_v_rel_symbol_len);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_8grab_pulse_lens(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, float __pyx_v_treshold, unsigned int __pyx_v_tolerance, int __pyx_v_mod_type) {
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_14pulses_to_bits(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_ppseq, unsigned PY_LONG_LONG __pyx_v_bit_len, double __pyx_v_rel_symbol_len) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("grab_pulse_lens", 0);
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("pulses_to_bits", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx_v_samples, __pyx_v_treshold, __pyx_v_tolerance, __pyx_v_mod_type, 0); if (unlikely(!__pyx_t_1.memview)) __PYX_ERR(0, 194, __pyx_L1_error)
-  __pyx_t_2 = __pyx_memoryview_fromslice(__pyx_t_1, 2, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 194, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
-  __pyx_t_1.memview = NULL;
-  __pyx_t_1.data = NULL;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __pyx_t_1 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_pulses_to_bits(__pyx_v_ppseq, __pyx_v_bit_len, __pyx_v_rel_symbol_len, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
-  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.grab_pulse_lens", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.pulses_to_bits", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __PYX_XDEC_MEMVIEW(&__pyx_v_samples, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ppseq, 1);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":281
+/* "src/urh/cythonext/signalFunctions.pyx":533
  *     cdef public int pulsetype
  *     cdef public unsigned long long nsamples # Num Samples for this Symbol. Needed in Modulator.
  *     def __init__(self, str name, int nbits, int pulsetype, unsigned long long nsamples):             # <<<<<<<<<<<<<<
@@ -5291,21 +9196,21 @@ static int __pyx_pw_3src_3urh_9cythonext_15signalFunctions_6Symbol_1__init__(PyO
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_nbits)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 1); __PYX_ERR(0, 281, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 1); __PYX_ERR(0, 533, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_pulsetype)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 2); __PYX_ERR(0, 281, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 2); __PYX_ERR(0, 533, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_nsamples)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 3); __PYX_ERR(0, 281, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 3); __PYX_ERR(0, 533, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 281, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 533, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -5316,19 +9221,19 @@ static int __pyx_pw_3src_3urh_9cythonext_15signalFunctions_6Symbol_1__init__(PyO
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
     __pyx_v_name = ((PyObject*)values[0]);
-    __pyx_v_nbits = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_nbits == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 281, __pyx_L3_error)
-    __pyx_v_pulsetype = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_pulsetype == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 281, __pyx_L3_error)
-    __pyx_v_nsamples = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[3]); if (unlikely((__pyx_v_nsamples == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 281, __pyx_L3_error)
+    __pyx_v_nbits = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_nbits == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 533, __pyx_L3_error)
+    __pyx_v_pulsetype = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_pulsetype == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 533, __pyx_L3_error)
+    __pyx_v_nsamples = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(values[3]); if (unlikely((__pyx_v_nsamples == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 533, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 281, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 533, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.Symbol.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 281, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 533, __pyx_L1_error)
   __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__(((struct __pyx_obj_3src_3urh_9cythonext_15signalFunctions_Symbol *)__pyx_v_self), __pyx_v_name, __pyx_v_nbits, __pyx_v_pulsetype, __pyx_v_nsamples);
 
   /* function exit code */
@@ -5345,7 +9250,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__(stru
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":288
+  /* "src/urh/cythonext/signalFunctions.pyx":540
  *         :return:
  *         """
  *         self.name = name             # <<<<<<<<<<<<<<
@@ -5358,7 +9263,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__(stru
   __Pyx_DECREF(__pyx_v_self->name);
   __pyx_v_self->name = __pyx_v_name;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":289
+  /* "src/urh/cythonext/signalFunctions.pyx":541
  *         """
  *         self.name = name
  *         self.pulsetype = pulsetype             # <<<<<<<<<<<<<<
@@ -5367,7 +9272,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__(stru
  */
   __pyx_v_self->pulsetype = __pyx_v_pulsetype;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":290
+  /* "src/urh/cythonext/signalFunctions.pyx":542
  *         self.name = name
  *         self.pulsetype = pulsetype
  *         self.nbits = nbits             # <<<<<<<<<<<<<<
@@ -5376,7 +9281,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__(stru
  */
   __pyx_v_self->nbits = __pyx_v_nbits;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":291
+  /* "src/urh/cythonext/signalFunctions.pyx":543
  *         self.pulsetype = pulsetype
  *         self.nbits = nbits
  *         self.nsamples = nsamples             # <<<<<<<<<<<<<<
@@ -5385,7 +9290,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__(stru
  */
   __pyx_v_self->nsamples = __pyx_v_nsamples;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":281
+  /* "src/urh/cythonext/signalFunctions.pyx":533
  *     cdef public int pulsetype
  *     cdef public unsigned long long nsamples # Num Samples for this Symbol. Needed in Modulator.
  *     def __init__(self, str name, int nbits, int pulsetype, unsigned long long nsamples):             # <<<<<<<<<<<<<<
@@ -5399,7 +9304,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__(stru
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":293
+/* "src/urh/cythonext/signalFunctions.pyx":545
  *         self.nsamples = nsamples
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -5431,7 +9336,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_2__repr
   PyObject *__pyx_t_6 = NULL;
   __Pyx_RefNannySetupContext("__repr__", 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":294
+  /* "src/urh/cythonext/signalFunctions.pyx":546
  * 
  *     def __repr__(self):
  *         return "{0} ({1}:{2})".format(self.name, self.pulsetype, self.name)             # <<<<<<<<<<<<<<
@@ -5439,9 +9344,9 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_2__repr
  *     def __deepcopy__(self, memo):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_0_1_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 294, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_kp_u_0_1_2, __pyx_n_s_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 546, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->pulsetype); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 294, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->pulsetype); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 546, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -5458,7 +9363,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_2__repr
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_v_self->name, __pyx_t_3, __pyx_v_self->name};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 294, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 546, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5467,14 +9372,14 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_2__repr
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_v_self->name, __pyx_t_3, __pyx_v_self->name};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 294, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 546, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(3+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 294, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(3+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 546, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
@@ -5488,7 +9393,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_2__repr
     __Pyx_GIVEREF(__pyx_v_self->name);
     PyTuple_SET_ITEM(__pyx_t_6, 2+__pyx_t_5, __pyx_v_self->name);
     __pyx_t_3 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 294, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 546, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
@@ -5497,7 +9402,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_2__repr
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":293
+  /* "src/urh/cythonext/signalFunctions.pyx":545
  *         self.nsamples = nsamples
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -5520,7 +9425,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_2__repr
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":296
+/* "src/urh/cythonext/signalFunctions.pyx":548
  *         return "{0} ({1}:{2})".format(self.name, self.pulsetype, self.name)
  * 
  *     def __deepcopy__(self, memo):             # <<<<<<<<<<<<<<
@@ -5551,20 +9456,20 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_4__deep
   PyObject *__pyx_t_4 = NULL;
   __Pyx_RefNannySetupContext("__deepcopy__", 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":297
+  /* "src/urh/cythonext/signalFunctions.pyx":549
  * 
  *     def __deepcopy__(self, memo):
  *         result = Symbol(self.name, self.nbits, self.pulsetype, self.nsamples)             # <<<<<<<<<<<<<<
  *         memo[id(self)] = result
  *         return result
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nbits); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nbits); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 549, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->pulsetype); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->pulsetype); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 549, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->nsamples); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->nsamples); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 549, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __pyx_t_4 = PyTuple_New(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 549, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_v_self->name);
   __Pyx_GIVEREF(__pyx_v_self->name);
@@ -5578,31 +9483,31 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_4__deep
   __pyx_t_1 = 0;
   __pyx_t_2 = 0;
   __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_3src_3urh_9cythonext_15signalFunctions_Symbol), __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_3src_3urh_9cythonext_15signalFunctions_Symbol), __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 549, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_v_result = ((struct __pyx_obj_3src_3urh_9cythonext_15signalFunctions_Symbol *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":298
+  /* "src/urh/cythonext/signalFunctions.pyx":550
  *     def __deepcopy__(self, memo):
  *         result = Symbol(self.name, self.nbits, self.pulsetype, self.nsamples)
  *         memo[id(self)] = result             # <<<<<<<<<<<<<<
  *         return result
  * 
  */
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 550, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(((PyObject *)__pyx_v_self));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
   PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_self));
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_id, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_id, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 550, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(PyObject_SetItem(__pyx_v_memo, __pyx_t_4, ((PyObject *)__pyx_v_result)) < 0)) __PYX_ERR(0, 298, __pyx_L1_error)
+  if (unlikely(PyObject_SetItem(__pyx_v_memo, __pyx_t_4, ((PyObject *)__pyx_v_result)) < 0)) __PYX_ERR(0, 550, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":299
+  /* "src/urh/cythonext/signalFunctions.pyx":551
  *         result = Symbol(self.name, self.nbits, self.pulsetype, self.nsamples)
  *         memo[id(self)] = result
  *         return result             # <<<<<<<<<<<<<<
@@ -5614,7 +9519,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_4__deep
   __pyx_r = ((PyObject *)__pyx_v_result);
   goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":296
+  /* "src/urh/cythonext/signalFunctions.pyx":548
  *         return "{0} ({1}:{2})".format(self.name, self.pulsetype, self.name)
  * 
  *     def __deepcopy__(self, memo):             # <<<<<<<<<<<<<<
@@ -5637,7 +9542,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_4__deep
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":277
+/* "src/urh/cythonext/signalFunctions.pyx":529
  * 
  * cdef class Symbol:
  *     cdef public str name             # <<<<<<<<<<<<<<
@@ -5692,7 +9597,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_4name_2__set_
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__set__", 0);
-  if (!(likely(PyUnicode_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(0, 277, __pyx_L1_error)
+  if (!(likely(PyUnicode_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "unicode", Py_TYPE(__pyx_v_value)->tp_name), 0))) __PYX_ERR(0, 529, __pyx_L1_error)
   __pyx_t_1 = __pyx_v_value;
   __Pyx_INCREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
@@ -5742,7 +9647,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_4name_4__del_
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":278
+/* "src/urh/cythonext/signalFunctions.pyx":530
  * cdef class Symbol:
  *     cdef public str name
  *     cdef public int nbits             # <<<<<<<<<<<<<<
@@ -5769,7 +9674,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_5nbits_
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nbits); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nbits); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 530, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5804,7 +9709,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_5nbits_2__set
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 278, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 530, __pyx_L1_error)
   __pyx_v_self->nbits = __pyx_t_1;
 
   /* function exit code */
@@ -5818,7 +9723,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_5nbits_2__set
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":279
+/* "src/urh/cythonext/signalFunctions.pyx":531
  *     cdef public str name
  *     cdef public int nbits
  *     cdef public int pulsetype             # <<<<<<<<<<<<<<
@@ -5845,7 +9750,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_9pulset
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->pulsetype); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->pulsetype); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 531, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5880,7 +9785,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_9pulsetype_2_
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 279, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 531, __pyx_L1_error)
   __pyx_v_self->pulsetype = __pyx_t_1;
 
   /* function exit code */
@@ -5894,7 +9799,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_9pulsetype_2_
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":280
+/* "src/urh/cythonext/signalFunctions.pyx":532
  *     cdef public int nbits
  *     cdef public int pulsetype
  *     cdef public unsigned long long nsamples # Num Samples for this Symbol. Needed in Modulator.             # <<<<<<<<<<<<<<
@@ -5921,7 +9826,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_8nsampl
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->nsamples); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_self->nsamples); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 532, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5956,7 +9861,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_8nsamples_2__
   __Pyx_RefNannyDeclarations
   unsigned PY_LONG_LONG __pyx_t_1;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 532, __pyx_L1_error)
   __pyx_v_self->nsamples = __pyx_t_1;
 
   /* function exit code */
@@ -5970,7 +9875,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_8nsamples_2__
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":303
+/* "src/urh/cythonext/signalFunctions.pyx":555
  * 
  * 
  * cpdef unsigned long long estimate_bit_len(float[::1] qad_samples, float qad_center, int tolerance, int mod_type):             # <<<<<<<<<<<<<<
@@ -5978,7 +9883,7 @@ static int __pyx_pf_3src_3urh_9cythonext_15signalFunctions_6Symbol_8nsamples_2__
  *     start = find_signal_start(qad_samples, mod_type)
  */
 
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11estimate_bit_len(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_17estimate_bit_len(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_bit_len(__Pyx_memviewslice __pyx_v_qad_samples, float __pyx_v_qad_center, int __pyx_v_tolerance, int __pyx_v_mod_type, CYTHON_UNUSED int __pyx_skip_dispatch) {
   unsigned PY_LONG_LONG __pyx_v_start;
   __Pyx_memviewslice __pyx_v_ppseq = { 0, 0, { 0 }, { 0 }, { 0 } };
@@ -6000,7 +9905,7 @@ static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_esti
   Py_ssize_t __pyx_t_12;
   __Pyx_RefNannySetupContext("estimate_bit_len", 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":305
+  /* "src/urh/cythonext/signalFunctions.pyx":557
  * cpdef unsigned long long estimate_bit_len(float[::1] qad_samples, float qad_center, int tolerance, int mod_type):
  * 
  *     start = find_signal_start(qad_samples, mod_type)             # <<<<<<<<<<<<<<
@@ -6009,7 +9914,7 @@ static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_esti
  */
   __pyx_v_start = __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_signal_start(__pyx_v_qad_samples, __pyx_v_mod_type, 0);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":306
+  /* "src/urh/cythonext/signalFunctions.pyx":558
  * 
  *     start = find_signal_start(qad_samples, mod_type)
  *     cdef unsigned long long[:, ::1] ppseq = grab_pulse_lens(qad_samples[start:], qad_center, tolerance, mod_type)             # <<<<<<<<<<<<<<
@@ -6034,10 +9939,10 @@ static unsigned PY_LONG_LONG __pyx_f_3src_3urh_9cythonext_15signalFunctions_esti
     0,
     1) < 0))
 {
-    __PYX_ERR(0, 306, __pyx_L1_error)
+    __PYX_ERR(0, 558, __pyx_L1_error)
 }
 
-__pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx_t_1, __pyx_v_qad_center, __pyx_v_tolerance, __pyx_v_mod_type, 0); if (unlikely(!__pyx_t_3.memview)) __PYX_ERR(0, 306, __pyx_L1_error)
+__pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx_t_1, __pyx_v_qad_center, __pyx_v_tolerance, __pyx_v_mod_type, 0); if (unlikely(!__pyx_t_3.memview)) __PYX_ERR(0, 558, __pyx_L1_error)
   __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
   __pyx_t_1.memview = NULL;
   __pyx_t_1.data = NULL;
@@ -6045,7 +9950,7 @@ __pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx
   __pyx_t_3.memview = NULL;
   __pyx_t_3.data = NULL;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":307
+  /* "src/urh/cythonext/signalFunctions.pyx":559
  *     start = find_signal_start(qad_samples, mod_type)
  *     cdef unsigned long long[:, ::1] ppseq = grab_pulse_lens(qad_samples[start:], qad_center, tolerance, mod_type)
  *     cdef unsigned long long i = 0             # <<<<<<<<<<<<<<
@@ -6054,20 +9959,20 @@ __pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx
  */
   __pyx_v_i = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":308
+  /* "src/urh/cythonext/signalFunctions.pyx":560
  *     cdef unsigned long long[:, ::1] ppseq = grab_pulse_lens(qad_samples[start:], qad_center, tolerance, mod_type)
  *     cdef unsigned long long i = 0
  *     cdef unsigned long long l = len(ppseq)             # <<<<<<<<<<<<<<
  *     for i in range(0, l):
  *         if ppseq[i, 0] == 1:
  */
-  __pyx_t_4 = __pyx_memoryview_fromslice(__pyx_v_ppseq, 2, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __pyx_t_4 = __pyx_memoryview_fromslice(__pyx_v_ppseq, 2, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 560, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyObject_Length(__pyx_t_4); if (unlikely(__pyx_t_5 == -1)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __pyx_t_5 = PyObject_Length(__pyx_t_4); if (unlikely(__pyx_t_5 == -1)) __PYX_ERR(0, 560, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_v_l = __pyx_t_5;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":309
+  /* "src/urh/cythonext/signalFunctions.pyx":561
  *     cdef unsigned long long i = 0
  *     cdef unsigned long long l = len(ppseq)
  *     for i in range(0, l):             # <<<<<<<<<<<<<<
@@ -6078,7 +9983,7 @@ __pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx
   for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
     __pyx_v_i = __pyx_t_7;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":310
+    /* "src/urh/cythonext/signalFunctions.pyx":562
  *     cdef unsigned long long l = len(ppseq)
  *     for i in range(0, l):
  *         if ppseq[i, 0] == 1:             # <<<<<<<<<<<<<<
@@ -6090,7 +9995,7 @@ __pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx
     __pyx_t_10 = (((*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_8 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_9)) ))) == 1) != 0);
     if (__pyx_t_10) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":311
+      /* "src/urh/cythonext/signalFunctions.pyx":563
  *     for i in range(0, l):
  *         if ppseq[i, 0] == 1:
  *             return ppseq[i, 1] # first pulse after pause             # <<<<<<<<<<<<<<
@@ -6102,7 +10007,7 @@ __pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx
       __pyx_r = (*((unsigned PY_LONG_LONG *) ( /* dim=1 */ ((char *) (((unsigned PY_LONG_LONG *) ( /* dim=0 */ (__pyx_v_ppseq.data + __pyx_t_11 * __pyx_v_ppseq.strides[0]) )) + __pyx_t_12)) )));
       goto __pyx_L0;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":310
+      /* "src/urh/cythonext/signalFunctions.pyx":562
  *     cdef unsigned long long l = len(ppseq)
  *     for i in range(0, l):
  *         if ppseq[i, 0] == 1:             # <<<<<<<<<<<<<<
@@ -6112,7 +10017,7 @@ __pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx
     }
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":313
+  /* "src/urh/cythonext/signalFunctions.pyx":565
  *             return ppseq[i, 1] # first pulse after pause
  * 
  *     return 100             # <<<<<<<<<<<<<<
@@ -6122,7 +10027,7 @@ __pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx
   __pyx_r = 0x64;
   goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":303
+  /* "src/urh/cythonext/signalFunctions.pyx":555
  * 
  * 
  * cpdef unsigned long long estimate_bit_len(float[::1] qad_samples, float qad_center, int tolerance, int mod_type):             # <<<<<<<<<<<<<<
@@ -6144,8 +10049,8 @@ __pyx_t_3 = __pyx_f_3src_3urh_9cythonext_15signalFunctions_grab_pulse_lens(__pyx
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11estimate_bit_len(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11estimate_bit_len(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_17estimate_bit_len(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_17estimate_bit_len(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   __Pyx_memviewslice __pyx_v_qad_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
   float __pyx_v_qad_center;
   int __pyx_v_tolerance;
@@ -6175,21 +10080,21 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11estimate_bit_
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_qad_center)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("estimate_bit_len", 1, 4, 4, 1); __PYX_ERR(0, 303, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("estimate_bit_len", 1, 4, 4, 1); __PYX_ERR(0, 555, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_tolerance)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("estimate_bit_len", 1, 4, 4, 2); __PYX_ERR(0, 303, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("estimate_bit_len", 1, 4, 4, 2); __PYX_ERR(0, 555, __pyx_L3_error)
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_mod_type)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("estimate_bit_len", 1, 4, 4, 3); __PYX_ERR(0, 303, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("estimate_bit_len", 1, 4, 4, 3); __PYX_ERR(0, 555, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "estimate_bit_len") < 0)) __PYX_ERR(0, 303, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "estimate_bit_len") < 0)) __PYX_ERR(0, 555, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -6199,33 +10104,33 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11estimate_bit_
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_qad_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_qad_samples.memview)) __PYX_ERR(0, 303, __pyx_L3_error)
-    __pyx_v_qad_center = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_qad_center == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 303, __pyx_L3_error)
-    __pyx_v_tolerance = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_tolerance == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 303, __pyx_L3_error)
-    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 303, __pyx_L3_error)
+    __pyx_v_qad_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_qad_samples.memview)) __PYX_ERR(0, 555, __pyx_L3_error)
+    __pyx_v_qad_center = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_qad_center == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 555, __pyx_L3_error)
+    __pyx_v_tolerance = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_tolerance == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 555, __pyx_L3_error)
+    __pyx_v_mod_type = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_mod_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 555, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("estimate_bit_len", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 303, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("estimate_bit_len", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 555, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.estimate_bit_len", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_10estimate_bit_len(__pyx_self, __pyx_v_qad_samples, __pyx_v_qad_center, __pyx_v_tolerance, __pyx_v_mod_type);
+  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_16estimate_bit_len(__pyx_self, __pyx_v_qad_samples, __pyx_v_qad_center, __pyx_v_tolerance, __pyx_v_mod_type);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_10estimate_bit_len(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_qad_samples, float __pyx_v_qad_center, int __pyx_v_tolerance, int __pyx_v_mod_type) {
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_16estimate_bit_len(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_qad_samples, float __pyx_v_qad_center, int __pyx_v_tolerance, int __pyx_v_mod_type) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("estimate_bit_len", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_bit_len(__pyx_v_qad_samples, __pyx_v_qad_center, __pyx_v_tolerance, __pyx_v_mod_type, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_bit_len(__pyx_v_qad_samples, __pyx_v_qad_center, __pyx_v_tolerance, __pyx_v_mod_type, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 555, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6243,7 +10148,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_10estimate_bit_
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":315
+/* "src/urh/cythonext/signalFunctions.pyx":567
  *     return 100
  * 
  * cpdef int find_nearest_center(float sample, float[::1] centers, int num_centers) nogil:             # <<<<<<<<<<<<<<
@@ -6251,7 +10156,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_10estimate_bit_
  *     cdef float center
  */
 
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13find_nearest_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_19find_nearest_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(float __pyx_v_sample, __Pyx_memviewslice __pyx_v_centers, int __pyx_v_num_centers, CYTHON_UNUSED int __pyx_skip_dispatch) {
   int __pyx_v_i;
   float __pyx_v_center;
@@ -6264,7 +10169,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
   Py_ssize_t __pyx_t_3;
   int __pyx_t_4;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":318
+  /* "src/urh/cythonext/signalFunctions.pyx":570
  *     cdef int i
  *     cdef float center
  *     cdef int result = 0             # <<<<<<<<<<<<<<
@@ -6273,7 +10178,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
  */
   __pyx_v_result = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":319
+  /* "src/urh/cythonext/signalFunctions.pyx":571
  *     cdef float center
  *     cdef int result = 0
  *     cdef float min_diff = 99999             # <<<<<<<<<<<<<<
@@ -6282,7 +10187,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
  */
   __pyx_v_min_diff = 99999.0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":320
+  /* "src/urh/cythonext/signalFunctions.pyx":572
  *     cdef int result = 0
  *     cdef float min_diff = 99999
  *     cdef float cur_diff = 0             # <<<<<<<<<<<<<<
@@ -6291,7 +10196,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
  */
   __pyx_v_cur_diff = 0.0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":322
+  /* "src/urh/cythonext/signalFunctions.pyx":574
  *     cdef float cur_diff = 0
  * 
  *     for i in range(0, num_centers):             # <<<<<<<<<<<<<<
@@ -6302,7 +10207,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
   for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
     __pyx_v_i = __pyx_t_2;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":323
+    /* "src/urh/cythonext/signalFunctions.pyx":575
  * 
  *     for i in range(0, num_centers):
  *         center = centers[i]             # <<<<<<<<<<<<<<
@@ -6312,7 +10217,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
     __pyx_t_3 = __pyx_v_i;
     __pyx_v_center = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_centers.data) + __pyx_t_3)) )));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":324
+    /* "src/urh/cythonext/signalFunctions.pyx":576
  *     for i in range(0, num_centers):
  *         center = centers[i]
  *         cur_diff = (sample - center) * (sample - center)             # <<<<<<<<<<<<<<
@@ -6321,7 +10226,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
  */
     __pyx_v_cur_diff = ((__pyx_v_sample - __pyx_v_center) * (__pyx_v_sample - __pyx_v_center));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":325
+    /* "src/urh/cythonext/signalFunctions.pyx":577
  *         center = centers[i]
  *         cur_diff = (sample - center) * (sample - center)
  *         if cur_diff < min_diff:             # <<<<<<<<<<<<<<
@@ -6331,7 +10236,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
     __pyx_t_4 = ((__pyx_v_cur_diff < __pyx_v_min_diff) != 0);
     if (__pyx_t_4) {
 
-      /* "src/urh/cythonext/signalFunctions.pyx":326
+      /* "src/urh/cythonext/signalFunctions.pyx":578
  *         cur_diff = (sample - center) * (sample - center)
  *         if cur_diff < min_diff:
  *             min_diff = cur_diff             # <<<<<<<<<<<<<<
@@ -6340,7 +10245,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
  */
       __pyx_v_min_diff = __pyx_v_cur_diff;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":327
+      /* "src/urh/cythonext/signalFunctions.pyx":579
  *         if cur_diff < min_diff:
  *             min_diff = cur_diff
  *             result = i             # <<<<<<<<<<<<<<
@@ -6349,7 +10254,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
  */
       __pyx_v_result = __pyx_v_i;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":325
+      /* "src/urh/cythonext/signalFunctions.pyx":577
  *         center = centers[i]
  *         cur_diff = (sample - center) * (sample - center)
  *         if cur_diff < min_diff:             # <<<<<<<<<<<<<<
@@ -6359,7 +10264,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
     }
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":329
+  /* "src/urh/cythonext/signalFunctions.pyx":581
  *             result = i
  * 
  *     return result             # <<<<<<<<<<<<<<
@@ -6369,7 +10274,7 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
   __pyx_r = __pyx_v_result;
   goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":315
+  /* "src/urh/cythonext/signalFunctions.pyx":567
  *     return 100
  * 
  * cpdef int find_nearest_center(float sample, float[::1] centers, int num_centers) nogil:             # <<<<<<<<<<<<<<
@@ -6383,8 +10288,8 @@ static int __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(fl
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13find_nearest_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13find_nearest_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_19find_nearest_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_19find_nearest_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   float __pyx_v_sample;
   __Pyx_memviewslice __pyx_v_centers = { 0, 0, { 0 }, { 0 }, { 0 } };
   int __pyx_v_num_centers;
@@ -6412,16 +10317,16 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13find_nearest_
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_centers)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("find_nearest_center", 1, 3, 3, 1); __PYX_ERR(0, 315, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("find_nearest_center", 1, 3, 3, 1); __PYX_ERR(0, 567, __pyx_L3_error)
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_centers)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("find_nearest_center", 1, 3, 3, 2); __PYX_ERR(0, 315, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("find_nearest_center", 1, 3, 3, 2); __PYX_ERR(0, 567, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_nearest_center") < 0)) __PYX_ERR(0, 315, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_nearest_center") < 0)) __PYX_ERR(0, 567, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -6430,32 +10335,32 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13find_nearest_
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
     }
-    __pyx_v_sample = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_sample == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L3_error)
-    __pyx_v_centers = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[1]); if (unlikely(!__pyx_v_centers.memview)) __PYX_ERR(0, 315, __pyx_L3_error)
-    __pyx_v_num_centers = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_num_centers == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L3_error)
+    __pyx_v_sample = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_sample == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 567, __pyx_L3_error)
+    __pyx_v_centers = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[1]); if (unlikely(!__pyx_v_centers.memview)) __PYX_ERR(0, 567, __pyx_L3_error)
+    __pyx_v_num_centers = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_num_centers == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 567, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("find_nearest_center", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 315, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("find_nearest_center", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 567, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.find_nearest_center", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_12find_nearest_center(__pyx_self, __pyx_v_sample, __pyx_v_centers, __pyx_v_num_centers);
+  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_18find_nearest_center(__pyx_self, __pyx_v_sample, __pyx_v_centers, __pyx_v_num_centers);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_12find_nearest_center(CYTHON_UNUSED PyObject *__pyx_self, float __pyx_v_sample, __Pyx_memviewslice __pyx_v_centers, int __pyx_v_num_centers) {
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_18find_nearest_center(CYTHON_UNUSED PyObject *__pyx_self, float __pyx_v_sample, __Pyx_memviewslice __pyx_v_centers, int __pyx_v_num_centers) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("find_nearest_center", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(__pyx_v_sample, __pyx_v_centers, __pyx_v_num_centers, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(__pyx_v_sample, __pyx_v_centers, __pyx_v_num_centers, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 567, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6473,7 +10378,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_12find_nearest_
   return __pyx_r;
 }
 
-/* "src/urh/cythonext/signalFunctions.pyx":339
+/* "src/urh/cythonext/signalFunctions.pyx":591
  *         unsigned long long int nitems
  * 
  * cpdef float estimate_qad_center(float[::1] samples, unsigned int num_centers):             # <<<<<<<<<<<<<<
@@ -6481,7 +10386,7 @@ static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_12find_nearest_
  *     Estimate the centers using Lloyds algorithm
  */
 
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15estimate_qad_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_21estimate_qad_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(__Pyx_memviewslice __pyx_v_samples, unsigned int __pyx_v_num_centers, CYTHON_UNUSED int __pyx_skip_dispatch) {
   unsigned PY_LONG_LONG __pyx_v_nsamples;
   struct __pyx_t_3src_3urh_9cythonext_15signalFunctions_Cluster *__pyx_v_clusters;
@@ -6526,20 +10431,20 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
   __pyx_pybuffernd_sorted_indexes.data = NULL;
   __pyx_pybuffernd_sorted_indexes.rcbuffer = &__pyx_pybuffer_sorted_indexes;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":348
+  /* "src/urh/cythonext/signalFunctions.pyx":600
  *     :return:
  *     """
  *     cdef unsigned long long nsamples = len(samples)             # <<<<<<<<<<<<<<
  *     if nsamples == 0:
  *         return 0
  */
-  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 348, __pyx_L1_error)
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 600, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 348, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 600, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_nsamples = __pyx_t_2;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":349
+  /* "src/urh/cythonext/signalFunctions.pyx":601
  *     """
  *     cdef unsigned long long nsamples = len(samples)
  *     if nsamples == 0:             # <<<<<<<<<<<<<<
@@ -6549,7 +10454,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
   __pyx_t_3 = ((__pyx_v_nsamples == 0) != 0);
   if (__pyx_t_3) {
 
-    /* "src/urh/cythonext/signalFunctions.pyx":350
+    /* "src/urh/cythonext/signalFunctions.pyx":602
  *     cdef unsigned long long nsamples = len(samples)
  *     if nsamples == 0:
  *         return 0             # <<<<<<<<<<<<<<
@@ -6559,7 +10464,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
     __pyx_r = 0.0;
     goto __pyx_L0;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":349
+    /* "src/urh/cythonext/signalFunctions.pyx":601
  *     """
  *     cdef unsigned long long nsamples = len(samples)
  *     if nsamples == 0:             # <<<<<<<<<<<<<<
@@ -6568,7 +10473,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
  */
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":352
+  /* "src/urh/cythonext/signalFunctions.pyx":604
  *         return 0
  * 
  *     cdef Cluster *clusters = <Cluster *>malloc(num_centers * sizeof(Cluster))             # <<<<<<<<<<<<<<
@@ -6577,7 +10482,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
  */
   __pyx_v_clusters = ((struct __pyx_t_3src_3urh_9cythonext_15signalFunctions_Cluster *)malloc((__pyx_v_num_centers * (sizeof(struct __pyx_t_3src_3urh_9cythonext_15signalFunctions_Cluster)))));
 
-  /* "src/urh/cythonext/signalFunctions.pyx":356
+  /* "src/urh/cythonext/signalFunctions.pyx":608
  *     cdef unsigned long long i
  * 
  *     for i in range(0, num_centers):             # <<<<<<<<<<<<<<
@@ -6588,7 +10493,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
   for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
     __pyx_v_i = __pyx_t_5;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":357
+    /* "src/urh/cythonext/signalFunctions.pyx":609
  * 
  *     for i in range(0, num_centers):
  *         clusters[i].nitems = 0             # <<<<<<<<<<<<<<
@@ -6597,7 +10502,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
  */
     (__pyx_v_clusters[__pyx_v_i]).nitems = 0;
 
-    /* "src/urh/cythonext/signalFunctions.pyx":358
+    /* "src/urh/cythonext/signalFunctions.pyx":610
  *     for i in range(0, num_centers):
  *         clusters[i].nitems = 0
  *         clusters[i].sum = 0             # <<<<<<<<<<<<<<
@@ -6607,19 +10512,19 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
     (__pyx_v_clusters[__pyx_v_i]).sum = 0.0;
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":361
+  /* "src/urh/cythonext/signalFunctions.pyx":613
  * 
  *     cdef:
  *         tuple tmp = util.minmax(samples)             # <<<<<<<<<<<<<<
  *         float first_center = tmp[0]
  *         float last_center = tmp[1]
  */
-  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_util); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_util); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 613, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_minmax); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_minmax); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 613, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __pyx_t_6 = __pyx_memoryview_fromslice(__pyx_v_samples, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 613, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __pyx_t_8 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
@@ -6632,14 +10537,14 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
     }
   }
   if (!__pyx_t_8) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 361, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 613, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_7)) {
       PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 361, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 613, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -6648,30 +10553,30 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
       PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 361, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 613, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     } else
     #endif
     {
-      __pyx_t_9 = PyTuple_New(1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 361, __pyx_L1_error)
+      __pyx_t_9 = PyTuple_New(1+1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 613, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
       __Pyx_GIVEREF(__pyx_t_6);
       PyTuple_SET_ITEM(__pyx_t_9, 0+1, __pyx_t_6);
       __pyx_t_6 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 361, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 613, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     }
   }
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (!(likely(PyTuple_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 361, __pyx_L1_error)
+  if (!(likely(PyTuple_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 613, __pyx_L1_error)
   __pyx_v_tmp = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":362
+  /* "src/urh/cythonext/signalFunctions.pyx":614
  *     cdef:
  *         tuple tmp = util.minmax(samples)
  *         float first_center = tmp[0]             # <<<<<<<<<<<<<<
@@ -6680,12 +10585,12 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
  */
   if (unlikely(__pyx_v_tmp == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 362, __pyx_L1_error)
+    __PYX_ERR(0, 614, __pyx_L1_error)
   }
-  __pyx_t_10 = __pyx_PyFloat_AsFloat(PyTuple_GET_ITEM(__pyx_v_tmp, 0)); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 362, __pyx_L1_error)
+  __pyx_t_10 = __pyx_PyFloat_AsFloat(PyTuple_GET_ITEM(__pyx_v_tmp, 0)); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 614, __pyx_L1_error)
   __pyx_v_first_center = __pyx_t_10;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":363
+  /* "src/urh/cythonext/signalFunctions.pyx":615
  *         tuple tmp = util.minmax(samples)
  *         float first_center = tmp[0]
  *         float last_center = tmp[1]             # <<<<<<<<<<<<<<
@@ -6694,29 +10599,29 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
  */
   if (unlikely(__pyx_v_tmp == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 363, __pyx_L1_error)
+    __PYX_ERR(0, 615, __pyx_L1_error)
   }
-  __pyx_t_10 = __pyx_PyFloat_AsFloat(PyTuple_GET_ITEM(__pyx_v_tmp, 1)); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 363, __pyx_L1_error)
+  __pyx_t_10 = __pyx_PyFloat_AsFloat(PyTuple_GET_ITEM(__pyx_v_tmp, 1)); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 615, __pyx_L1_error)
   __pyx_v_last_center = __pyx_t_10;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":365
+  /* "src/urh/cythonext/signalFunctions.pyx":617
  *         float last_center = tmp[1]
  * 
  *         float[::1] centers = np.array([ first_center+i*(last_center-first_center)/(num_centers-1)             # <<<<<<<<<<<<<<
  *                                        for i in range(0, num_centers) ], dtype=np.float32)
  *         float sample
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 617, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_array); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_array); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 617, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   { /* enter inner scope */
     unsigned PY_LONG_LONG __pyx_7genexpr__pyx_v_i;
-    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 365, __pyx_L1_error)
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 617, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":366
+    /* "src/urh/cythonext/signalFunctions.pyx":618
  * 
  *         float[::1] centers = np.array([ first_center+i*(last_center-first_center)/(num_centers-1)
  *                                        for i in range(0, num_centers) ], dtype=np.float32)             # <<<<<<<<<<<<<<
@@ -6727,62 +10632,62 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
     for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
       __pyx_7genexpr__pyx_v_i = __pyx_t_5;
 
-      /* "src/urh/cythonext/signalFunctions.pyx":365
+      /* "src/urh/cythonext/signalFunctions.pyx":617
  *         float last_center = tmp[1]
  * 
  *         float[::1] centers = np.array([ first_center+i*(last_center-first_center)/(num_centers-1)             # <<<<<<<<<<<<<<
  *                                        for i in range(0, num_centers) ], dtype=np.float32)
  *         float sample
  */
-      __pyx_t_9 = PyFloat_FromDouble((__pyx_v_first_center + ((__pyx_7genexpr__pyx_v_i * (__pyx_v_last_center - __pyx_v_first_center)) / ((float)(__pyx_v_num_centers - 1))))); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 365, __pyx_L1_error)
+      __pyx_t_9 = PyFloat_FromDouble((__pyx_v_first_center + ((__pyx_7genexpr__pyx_v_i * (__pyx_v_last_center - __pyx_v_first_center)) / ((float)(__pyx_v_num_centers - 1))))); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 617, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
-      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_9))) __PYX_ERR(0, 365, __pyx_L1_error)
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_9))) __PYX_ERR(0, 617, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     }
   } /* exit inner scope */
-  __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 617, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":366
+  /* "src/urh/cythonext/signalFunctions.pyx":618
  * 
  *         float[::1] centers = np.array([ first_center+i*(last_center-first_center)/(num_centers-1)
  *                                        for i in range(0, num_centers) ], dtype=np.float32)             # <<<<<<<<<<<<<<
  *         float sample
  *         int center_index = 0
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 618, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 618, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float32); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_float32); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 618, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_8) < 0) __PYX_ERR(0, 366, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_8) < 0) __PYX_ERR(0, 618, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":365
+  /* "src/urh/cythonext/signalFunctions.pyx":617
  *         float last_center = tmp[1]
  * 
  *         float[::1] centers = np.array([ first_center+i*(last_center-first_center)/(num_centers-1)             # <<<<<<<<<<<<<<
  *                                        for i in range(0, num_centers) ], dtype=np.float32)
  *         float sample
  */
-  __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, __pyx_t_1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, __pyx_t_1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 617, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_dc_float(__pyx_t_8);
-  if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 365, __pyx_L1_error)
+  if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 617, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
   __pyx_v_centers = __pyx_t_11;
   __pyx_t_11.memview = NULL;
   __pyx_t_11.data = NULL;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":368
+  /* "src/urh/cythonext/signalFunctions.pyx":620
  *                                        for i in range(0, num_centers) ], dtype=np.float32)
  *         float sample
  *         int center_index = 0             # <<<<<<<<<<<<<<
@@ -6791,121 +10696,154 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
  */
   __pyx_v_center_index = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":372
+  /* "src/urh/cythonext/signalFunctions.pyx":624
  * 
  * 
- *     for i in range(0, nsamples):             # <<<<<<<<<<<<<<
- *         sample = samples[i]
- *         center_index = find_nearest_center(sample, centers, num_centers)
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(0, nsamples):
+ *             sample = samples[i]
  */
-  __pyx_t_5 = __pyx_v_nsamples;
-  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_5; __pyx_t_12+=1) {
-    __pyx_v_i = __pyx_t_12;
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
 
-    /* "src/urh/cythonext/signalFunctions.pyx":373
+        /* "src/urh/cythonext/signalFunctions.pyx":625
  * 
- *     for i in range(0, nsamples):
- *         sample = samples[i]             # <<<<<<<<<<<<<<
- *         center_index = find_nearest_center(sample, centers, num_centers)
- *         clusters[center_index].sum += sample
+ *     with nogil:
+ *         for i in range(0, nsamples):             # <<<<<<<<<<<<<<
+ *             sample = samples[i]
+ *             center_index = find_nearest_center(sample, centers, num_centers)
+ */
+        __pyx_t_5 = __pyx_v_nsamples;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_5; __pyx_t_12+=1) {
+          __pyx_v_i = __pyx_t_12;
+
+          /* "src/urh/cythonext/signalFunctions.pyx":626
+ *     with nogil:
+ *         for i in range(0, nsamples):
+ *             sample = samples[i]             # <<<<<<<<<<<<<<
+ *             center_index = find_nearest_center(sample, centers, num_centers)
+ *             clusters[center_index].sum += sample
  */
-    __pyx_t_13 = __pyx_v_i;
-    __pyx_v_sample = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_samples.data) + __pyx_t_13)) )));
+          __pyx_t_13 = __pyx_v_i;
+          __pyx_v_sample = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_samples.data) + __pyx_t_13)) )));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":374
- *     for i in range(0, nsamples):
- *         sample = samples[i]
- *         center_index = find_nearest_center(sample, centers, num_centers)             # <<<<<<<<<<<<<<
- *         clusters[center_index].sum += sample
- *         clusters[center_index].nitems += 1
+          /* "src/urh/cythonext/signalFunctions.pyx":627
+ *         for i in range(0, nsamples):
+ *             sample = samples[i]
+ *             center_index = find_nearest_center(sample, centers, num_centers)             # <<<<<<<<<<<<<<
+ *             clusters[center_index].sum += sample
+ *             clusters[center_index].nitems += 1
  */
-    __pyx_v_center_index = __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(__pyx_v_sample, __pyx_v_centers, __pyx_v_num_centers, 0);
+          __pyx_v_center_index = __pyx_f_3src_3urh_9cythonext_15signalFunctions_find_nearest_center(__pyx_v_sample, __pyx_v_centers, __pyx_v_num_centers, 0);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":375
- *         sample = samples[i]
- *         center_index = find_nearest_center(sample, centers, num_centers)
- *         clusters[center_index].sum += sample             # <<<<<<<<<<<<<<
- *         clusters[center_index].nitems += 1
+          /* "src/urh/cythonext/signalFunctions.pyx":628
+ *             sample = samples[i]
+ *             center_index = find_nearest_center(sample, centers, num_centers)
+ *             clusters[center_index].sum += sample             # <<<<<<<<<<<<<<
+ *             clusters[center_index].nitems += 1
  * 
  */
-    __pyx_t_14 = __pyx_v_center_index;
-    (__pyx_v_clusters[__pyx_t_14]).sum = ((__pyx_v_clusters[__pyx_t_14]).sum + __pyx_v_sample);
+          __pyx_t_14 = __pyx_v_center_index;
+          (__pyx_v_clusters[__pyx_t_14]).sum = ((__pyx_v_clusters[__pyx_t_14]).sum + __pyx_v_sample);
 
-    /* "src/urh/cythonext/signalFunctions.pyx":376
- *         center_index = find_nearest_center(sample, centers, num_centers)
- *         clusters[center_index].sum += sample
- *         clusters[center_index].nitems += 1             # <<<<<<<<<<<<<<
+          /* "src/urh/cythonext/signalFunctions.pyx":629
+ *             center_index = find_nearest_center(sample, centers, num_centers)
+ *             clusters[center_index].sum += sample
+ *             clusters[center_index].nitems += 1             # <<<<<<<<<<<<<<
  * 
  *     cdef unsigned long long[::1] cluster_lens = np.array([clusters[i].nitems for i in range(num_centers)], dtype=np.uint64)
  */
-    __pyx_t_14 = __pyx_v_center_index;
-    (__pyx_v_clusters[__pyx_t_14]).nitems = ((__pyx_v_clusters[__pyx_t_14]).nitems + 1);
+          __pyx_t_14 = __pyx_v_center_index;
+          (__pyx_v_clusters[__pyx_t_14]).nitems = ((__pyx_v_clusters[__pyx_t_14]).nitems + 1);
+        }
+      }
+
+      /* "src/urh/cythonext/signalFunctions.pyx":624
+ * 
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(0, nsamples):
+ *             sample = samples[i]
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L10;
+        }
+        __pyx_L10:;
+      }
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":378
- *         clusters[center_index].nitems += 1
+  /* "src/urh/cythonext/signalFunctions.pyx":631
+ *             clusters[center_index].nitems += 1
  * 
  *     cdef unsigned long long[::1] cluster_lens = np.array([clusters[i].nitems for i in range(num_centers)], dtype=np.uint64)             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[np.int64_t, ndim=1] sorted_indexes = np.argsort(cluster_lens)
  *     cdef float center1, center2
  */
-  __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_array); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_array); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
   { /* enter inner scope */
     unsigned PY_LONG_LONG __pyx_8genexpr1__pyx_v_i;
-    __pyx_t_8 = PyList_New(0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 378, __pyx_L1_error)
+    __pyx_t_8 = PyList_New(0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 631, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __pyx_t_4 = __pyx_v_num_centers;
     for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
       __pyx_8genexpr1__pyx_v_i = __pyx_t_5;
-      __pyx_t_9 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG((__pyx_v_clusters[__pyx_8genexpr1__pyx_v_i]).nitems); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG((__pyx_v_clusters[__pyx_8genexpr1__pyx_v_i]).nitems); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 631, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
-      if (unlikely(__Pyx_ListComp_Append(__pyx_t_8, (PyObject*)__pyx_t_9))) __PYX_ERR(0, 378, __pyx_L1_error)
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_8, (PyObject*)__pyx_t_9))) __PYX_ERR(0, 631, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     }
   } /* exit inner scope */
-  __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_GIVEREF(__pyx_t_8);
   PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8);
   __pyx_t_8 = 0;
-  __pyx_t_8 = PyDict_New(); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_t_8 = PyDict_New(); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_uint64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_uint64); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_t_8, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 378, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_8, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
   __pyx_t_15 = __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_PY_LONG_LONG(__pyx_t_6);
-  if (unlikely(!__pyx_t_15.memview)) __PYX_ERR(0, 378, __pyx_L1_error)
+  if (unlikely(!__pyx_t_15.memview)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_v_cluster_lens = __pyx_t_15;
   __pyx_t_15.memview = NULL;
   __pyx_t_15.data = NULL;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":379
+  /* "src/urh/cythonext/signalFunctions.pyx":632
  * 
  *     cdef unsigned long long[::1] cluster_lens = np.array([clusters[i].nitems for i in range(num_centers)], dtype=np.uint64)
  *     cdef np.ndarray[np.int64_t, ndim=1] sorted_indexes = np.argsort(cluster_lens)             # <<<<<<<<<<<<<<
  *     cdef float center1, center2
  *     cdef int index1 = sorted_indexes[len(sorted_indexes)-1]
  */
-  __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 379, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 632, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_argsort); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 379, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_argsort); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 632, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __pyx_memoryview_fromslice(__pyx_v_cluster_lens, 1, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 379, __pyx_L1_error)
+  __pyx_t_8 = __pyx_memoryview_fromslice(__pyx_v_cluster_lens, 1, (PyObject *(*)(char *)) __pyx_memview_get_unsigned_PY_LONG_LONG, (int (*)(char *, PyObject *)) __pyx_memview_set_unsigned_PY_LONG_LONG, 0);; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 632, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __pyx_t_1 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
@@ -6918,14 +10856,14 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
     }
   }
   if (!__pyx_t_1) {
-    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 379, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 632, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     __Pyx_GOTREF(__pyx_t_6);
   } else {
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_9)) {
       PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_8};
-      __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 379, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 632, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -6934,32 +10872,32 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_9)) {
       PyObject *__pyx_temp[2] = {__pyx_t_1, __pyx_t_8};
-      __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 379, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_9, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 632, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     } else
     #endif
     {
-      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 379, __pyx_L1_error)
+      __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 632, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
       __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_1); __pyx_t_1 = NULL;
       __Pyx_GIVEREF(__pyx_t_8);
       PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_t_8);
       __pyx_t_8 = 0;
-      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_7, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 379, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_9, __pyx_t_7, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 632, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
   }
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 379, __pyx_L1_error)
+  if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 632, __pyx_L1_error)
   __pyx_t_16 = ((PyArrayObject *)__pyx_t_6);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sorted_indexes.rcbuffer->pybuffer, (PyObject*)__pyx_t_16, &__Pyx_TypeInfo_nn___pyx_t_5numpy_int64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_sorted_indexes = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sorted_indexes.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 379, __pyx_L1_error)
+      __PYX_ERR(0, 632, __pyx_L1_error)
     } else {__pyx_pybuffernd_sorted_indexes.diminfo[0].strides = __pyx_pybuffernd_sorted_indexes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sorted_indexes.diminfo[0].shape = __pyx_pybuffernd_sorted_indexes.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -6967,29 +10905,29 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
   __pyx_v_sorted_indexes = ((PyArrayObject *)__pyx_t_6);
   __pyx_t_6 = 0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":381
+  /* "src/urh/cythonext/signalFunctions.pyx":634
  *     cdef np.ndarray[np.int64_t, ndim=1] sorted_indexes = np.argsort(cluster_lens)
  *     cdef float center1, center2
  *     cdef int index1 = sorted_indexes[len(sorted_indexes)-1]             # <<<<<<<<<<<<<<
  *     cdef int index2 = sorted_indexes[len(sorted_indexes)-2]
  * 
  */
-  __pyx_t_2 = PyObject_Length(((PyObject *)__pyx_v_sorted_indexes)); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 381, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(((PyObject *)__pyx_v_sorted_indexes)); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 634, __pyx_L1_error)
   __pyx_t_17 = (__pyx_t_2 - 1);
   __pyx_v_index1 = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int64_t *, __pyx_pybuffernd_sorted_indexes.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_sorted_indexes.diminfo[0].strides));
 
-  /* "src/urh/cythonext/signalFunctions.pyx":382
+  /* "src/urh/cythonext/signalFunctions.pyx":635
  *     cdef float center1, center2
  *     cdef int index1 = sorted_indexes[len(sorted_indexes)-1]
  *     cdef int index2 = sorted_indexes[len(sorted_indexes)-2]             # <<<<<<<<<<<<<<
  * 
  *     if clusters[index1].nitems > 0:
  */
-  __pyx_t_2 = PyObject_Length(((PyObject *)__pyx_v_sorted_indexes)); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 382, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(((PyObject *)__pyx_v_sorted_indexes)); if (unlikely(__pyx_t_2 == -1)) __PYX_ERR(0, 635, __pyx_L1_error)
   __pyx_t_18 = (__pyx_t_2 - 2);
   __pyx_v_index2 = (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int64_t *, __pyx_pybuffernd_sorted_indexes.rcbuffer->pybuffer.buf, __pyx_t_18, __pyx_pybuffernd_sorted_indexes.diminfo[0].strides));
 
-  /* "src/urh/cythonext/signalFunctions.pyx":384
+  /* "src/urh/cythonext/signalFunctions.pyx":637
  *     cdef int index2 = sorted_indexes[len(sorted_indexes)-2]
  * 
  *     if clusters[index1].nitems > 0:             # <<<<<<<<<<<<<<
@@ -6999,7 +10937,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
   __pyx_t_3 = (((__pyx_v_clusters[__pyx_v_index1]).nitems > 0) != 0);
   if (__pyx_t_3) {
 
-    /* "src/urh/cythonext/signalFunctions.pyx":385
+    /* "src/urh/cythonext/signalFunctions.pyx":638
  * 
  *     if clusters[index1].nitems > 0:
  *         center1 = clusters[index1].sum / clusters[index1].nitems # Cluster mit den meisten Eintrgen             # <<<<<<<<<<<<<<
@@ -7008,17 +10946,17 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
  */
     __pyx_v_center1 = ((__pyx_v_clusters[__pyx_v_index1]).sum / ((double)(__pyx_v_clusters[__pyx_v_index1]).nitems));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":384
+    /* "src/urh/cythonext/signalFunctions.pyx":637
  *     cdef int index2 = sorted_indexes[len(sorted_indexes)-2]
  * 
  *     if clusters[index1].nitems > 0:             # <<<<<<<<<<<<<<
  *         center1 = clusters[index1].sum / clusters[index1].nitems # Cluster mit den meisten Eintrgen
  *     else:
  */
-    goto __pyx_L12;
+    goto __pyx_L15;
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":387
+  /* "src/urh/cythonext/signalFunctions.pyx":640
  *         center1 = clusters[index1].sum / clusters[index1].nitems # Cluster mit den meisten Eintrgen
  *     else:
  *         center1 = 0             # <<<<<<<<<<<<<<
@@ -7028,9 +10966,9 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
   /*else*/ {
     __pyx_v_center1 = 0.0;
   }
-  __pyx_L12:;
+  __pyx_L15:;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":389
+  /* "src/urh/cythonext/signalFunctions.pyx":642
  *         center1 = 0
  * 
  *     if clusters[index2].nitems > 0:             # <<<<<<<<<<<<<<
@@ -7040,7 +10978,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
   __pyx_t_3 = (((__pyx_v_clusters[__pyx_v_index2]).nitems > 0) != 0);
   if (__pyx_t_3) {
 
-    /* "src/urh/cythonext/signalFunctions.pyx":390
+    /* "src/urh/cythonext/signalFunctions.pyx":643
  * 
  *     if clusters[index2].nitems > 0:
  *         center2 = clusters[index2].sum / clusters[index2].nitems # Cluster mit zweitmeisten Eintrgen             # <<<<<<<<<<<<<<
@@ -7049,17 +10987,17 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
  */
     __pyx_v_center2 = ((__pyx_v_clusters[__pyx_v_index2]).sum / ((double)(__pyx_v_clusters[__pyx_v_index2]).nitems));
 
-    /* "src/urh/cythonext/signalFunctions.pyx":389
+    /* "src/urh/cythonext/signalFunctions.pyx":642
  *         center1 = 0
  * 
  *     if clusters[index2].nitems > 0:             # <<<<<<<<<<<<<<
  *         center2 = clusters[index2].sum / clusters[index2].nitems # Cluster mit zweitmeisten Eintrgen
  *     else:
  */
-    goto __pyx_L13;
+    goto __pyx_L16;
   }
 
-  /* "src/urh/cythonext/signalFunctions.pyx":392
+  /* "src/urh/cythonext/signalFunctions.pyx":645
  *         center2 = clusters[index2].sum / clusters[index2].nitems # Cluster mit zweitmeisten Eintrgen
  *     else:
  *         center2 = 0             # <<<<<<<<<<<<<<
@@ -7069,9 +11007,9 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
   /*else*/ {
     __pyx_v_center2 = 0.0;
   }
-  __pyx_L13:;
+  __pyx_L16:;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":394
+  /* "src/urh/cythonext/signalFunctions.pyx":647
  *         center2 = 0
  * 
  *     free(clusters)             # <<<<<<<<<<<<<<
@@ -7079,7 +11017,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
  */
   free(__pyx_v_clusters);
 
-  /* "src/urh/cythonext/signalFunctions.pyx":395
+  /* "src/urh/cythonext/signalFunctions.pyx":648
  * 
  *     free(clusters)
  *     return (center1 + center2)/2             # <<<<<<<<<<<<<<
@@ -7087,7 +11025,7 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
   __pyx_r = ((__pyx_v_center1 + __pyx_v_center2) / 2.0);
   goto __pyx_L0;
 
-  /* "src/urh/cythonext/signalFunctions.pyx":339
+  /* "src/urh/cythonext/signalFunctions.pyx":591
  *         unsigned long long int nitems
  * 
  * cpdef float estimate_qad_center(float[::1] samples, unsigned int num_centers):             # <<<<<<<<<<<<<<
@@ -7125,9 +11063,9 @@ static float __pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15estimate_qad_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_3src_3urh_9cythonext_15signalFunctions_14estimate_qad_center[] = "\n    Estimate the centers using Lloyds algorithm\n    Use more centers for ks clipping\n\n    :param samples:\n    :param num_centers:\n    :return:\n    ";
-static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15estimate_qad_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_21estimate_qad_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_3src_3urh_9cythonext_15signalFunctions_20estimate_qad_center[] = "\n    Estimate the centers using Lloyds algorithm\n    Use more centers for ks clipping\n\n    :param samples:\n    :param num_centers:\n    :return:\n    ";
+static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_21estimate_qad_center(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   __Pyx_memviewslice __pyx_v_samples = { 0, 0, { 0 }, { 0 }, { 0 } };
   unsigned int __pyx_v_num_centers;
   PyObject *__pyx_r = 0;
@@ -7153,11 +11091,11 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15estimate_qad_
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_centers)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("estimate_qad_center", 1, 2, 2, 1); __PYX_ERR(0, 339, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("estimate_qad_center", 1, 2, 2, 1); __PYX_ERR(0, 591, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "estimate_qad_center") < 0)) __PYX_ERR(0, 339, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "estimate_qad_center") < 0)) __PYX_ERR(0, 591, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -7165,31 +11103,31 @@ static PyObject *__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15estimate_qad_
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
-    __pyx_v_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_samples.memview)) __PYX_ERR(0, 339, __pyx_L3_error)
-    __pyx_v_num_centers = __Pyx_PyInt_As_unsigned_int(values[1]); if (unlikely((__pyx_v_num_centers == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 339, __pyx_L3_error)
+    __pyx_v_samples = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_samples.memview)) __PYX_ERR(0, 591, __pyx_L3_error)
+    __pyx_v_num_centers = __Pyx_PyInt_As_unsigned_int(values[1]); if (unlikely((__pyx_v_num_centers == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 591, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("estimate_qad_center", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 339, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("estimate_qad_center", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 591, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("src.urh.cythonext.signalFunctions.estimate_qad_center", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_14estimate_qad_center(__pyx_self, __pyx_v_samples, __pyx_v_num_centers);
+  __pyx_r = __pyx_pf_3src_3urh_9cythonext_15signalFunctions_20estimate_qad_center(__pyx_self, __pyx_v_samples, __pyx_v_num_centers);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_14estimate_qad_center(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, unsigned int __pyx_v_num_centers) {
+static PyObject *__pyx_pf_3src_3urh_9cythonext_15signalFunctions_20estimate_qad_center(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_samples, unsigned int __pyx_v_num_centers) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("estimate_qad_center", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(__pyx_v_samples, __pyx_v_num_centers, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_3src_3urh_9cythonext_15signalFunctions_estimate_qad_center(__pyx_v_samples, __pyx_v_num_centers, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 591, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7376,7 +11314,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 218, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 218, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -7432,7 +11370,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  * 
  *             info.buf = PyArray_DATA(self)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 222, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 222, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -7741,7 +11679,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 259, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 259, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8556,7 +12494,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 799, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 799, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8624,7 +12562,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 803, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 803, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8733,7 +12671,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 823, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 823, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -9414,7 +13352,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 989, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 989, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -9545,7 +13483,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 995, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 995, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -9673,7 +13611,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1001, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1001, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -9906,7 +13844,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *         if itemsize <= 0:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 131, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 131, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -9938,7 +13876,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *         if not isinstance(format, bytes):
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 134, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 134, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -9973,7 +13911,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  */
     __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_format, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 137, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 137, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 137, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF_SET(__pyx_v_format, __pyx_t_5);
@@ -10049,7 +13987,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  * 
  */
-    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 146, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 146, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_Raise(__pyx_t_5, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -10333,7 +14271,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __
  * 
  *             if self.dtype_is_object:
  */
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 174, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 174, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_Raise(__pyx_t_5, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -10571,7 +14509,7 @@ static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array_2__getbuffer__(stru
  *         info.buf = self.data
  *         info.len = self.len
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 190, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 190, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -13537,7 +17475,7 @@ static PyObject *__pyx_memoryview_convert_item_to_object(struct __pyx_memoryview
  *         else:
  *             if len(self.view.format) == 1:
  */
-      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 484, __pyx_L5_except_error)
+      __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(2, 484, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_Raise(__pyx_t_6, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -14378,7 +18316,7 @@ static PyObject *__pyx_pf_15View_dot_MemoryView_10memoryview_7strides___get__(st
  * 
  *         return tuple([stride for stride in self.view.strides[:self.view.ndim]])
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 556, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 556, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -14492,7 +18430,7 @@ static PyObject *__pyx_pf_15View_dot_MemoryView_10memoryview_10suboffsets___get_
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->view.ndim); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 563, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Multiply(__pyx_tuple__20, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 563, __pyx_L1_error)
+    __pyx_t_3 = PyNumber_Multiply(__pyx_tuple__23, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(2, 563, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = __pyx_t_3;
@@ -15796,9 +19734,9 @@ static PyObject *_unellipsify(PyObject *__pyx_v_index, int __pyx_v_ndim) {
         __Pyx_GOTREF(__pyx_t_7);
         { Py_ssize_t __pyx_temp;
           for (__pyx_temp=0; __pyx_temp < ((__pyx_v_ndim - __pyx_t_8) + 1); __pyx_temp++) {
-            __Pyx_INCREF(__pyx_slice__21);
-            __Pyx_GIVEREF(__pyx_slice__21);
-            PyList_SET_ITEM(__pyx_t_7, __pyx_temp, __pyx_slice__21);
+            __Pyx_INCREF(__pyx_slice__24);
+            __Pyx_GIVEREF(__pyx_slice__24);
+            PyList_SET_ITEM(__pyx_t_7, __pyx_temp, __pyx_slice__24);
           }
         }
         __pyx_t_9 = __Pyx_PyList_Extend(__pyx_v_result, __pyx_t_7); if (unlikely(__pyx_t_9 == -1)) __PYX_ERR(2, 668, __pyx_L1_error)
@@ -15831,7 +19769,7 @@ static PyObject *_unellipsify(PyObject *__pyx_v_index, int __pyx_v_ndim) {
  *         else:
  */
       /*else*/ {
-        __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_result, __pyx_slice__22); if (unlikely(__pyx_t_9 == -1)) __PYX_ERR(2, 671, __pyx_L1_error)
+        __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_result, __pyx_slice__25); if (unlikely(__pyx_t_9 == -1)) __PYX_ERR(2, 671, __pyx_L1_error)
       }
       __pyx_L7:;
 
@@ -15976,9 +19914,9 @@ static PyObject *_unellipsify(PyObject *__pyx_v_index, int __pyx_v_ndim) {
     __Pyx_GOTREF(__pyx_t_3);
     { Py_ssize_t __pyx_temp;
       for (__pyx_temp=0; __pyx_temp < __pyx_v_nslices; __pyx_temp++) {
-        __Pyx_INCREF(__pyx_slice__23);
-        __Pyx_GIVEREF(__pyx_slice__23);
-        PyList_SET_ITEM(__pyx_t_3, __pyx_temp, __pyx_slice__23);
+        __Pyx_INCREF(__pyx_slice__26);
+        __Pyx_GIVEREF(__pyx_slice__26);
+        PyList_SET_ITEM(__pyx_t_3, __pyx_temp, __pyx_slice__26);
       }
     }
     __pyx_t_9 = __Pyx_PyList_Extend(__pyx_v_result, __pyx_t_3); if (unlikely(__pyx_t_9 == -1)) __PYX_ERR(2, 682, __pyx_L1_error)
@@ -16102,7 +20040,7 @@ static PyObject *assert_direct_dimensions(Py_ssize_t *__pyx_v_suboffsets, int __
  * 
  * 
  */
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 689, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(2, 689, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_Raise(__pyx_t_5, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -22194,12 +26132,15 @@ static PyTypeObject __pyx_type___pyx_memoryviewslice = {
 static PyMethodDef __pyx_methods[] = {
   {"get_noise_for_mod_type", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_1get_noise_for_mod_type, METH_O, 0},
   {"afp_demod", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_3afp_demod, METH_VARARGS|METH_KEYWORDS, 0},
-  {"find_signal_start", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_5find_signal_start, METH_VARARGS|METH_KEYWORDS, 0},
-  {"find_signal_end", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_7find_signal_end, METH_VARARGS|METH_KEYWORDS, 0},
-  {"grab_pulse_lens", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_9grab_pulse_lens, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3src_3urh_9cythonext_15signalFunctions_8grab_pulse_lens},
-  {"estimate_bit_len", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11estimate_bit_len, METH_VARARGS|METH_KEYWORDS, 0},
-  {"find_nearest_center", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13find_nearest_center, METH_VARARGS|METH_KEYWORDS, 0},
-  {"estimate_qad_center", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15estimate_qad_center, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3src_3urh_9cythonext_15signalFunctions_14estimate_qad_center},
+  {"afp_demod_block", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_5afp_demod_block, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3src_3urh_9cythonext_15signalFunctions_4afp_demod_block},
+  {"find_signal_start", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_7find_signal_start, METH_VARARGS|METH_KEYWORDS, 0},
+  {"find_signal_end", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_9find_signal_end, METH_VARARGS|METH_KEYWORDS, 0},
+  {"grab_pulse_lens", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_11grab_pulse_lens, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3src_3urh_9cythonext_15signalFunctions_10grab_pulse_lens},
+  {"grab_pulse_lens_stream", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_13grab_pulse_lens_stream, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3src_3urh_9cythonext_15signalFunctions_12grab_pulse_lens_stream},
+  {"pulses_to_bits", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_15pulses_to_bits, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3src_3urh_9cythonext_15signalFunctions_14pulses_to_bits},
+  {"estimate_bit_len", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_17estimate_bit_len, METH_VARARGS|METH_KEYWORDS, 0},
+  {"find_nearest_center", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_19find_nearest_center, METH_VARARGS|METH_KEYWORDS, 0},
+  {"estimate_qad_center", (PyCFunction)__pyx_pw_3src_3urh_9cythonext_15signalFunctions_21estimate_qad_center, METH_VARARGS|METH_KEYWORDS, __pyx_doc_3src_3urh_9cythonext_15signalFunctions_20estimate_qad_center},
   {0, 0, 0, 0}
 };
 
@@ -22224,6 +26165,7 @@ static struct PyModuleDef __pyx_moduledef = {
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_u_0_1_2, __pyx_k_0_1_2, sizeof(__pyx_k_0_1_2), 0, 1, 0, 0},
   {&__pyx_n_s_ASCII, __pyx_k_ASCII, sizeof(__pyx_k_ASCII), 0, 0, 1, 1},
+  {&__pyx_kp_u_Bit_length_must_be_greater_than, __pyx_k_Bit_length_must_be_greater_than, sizeof(__pyx_k_Bit_length_must_be_greater_than), 0, 1, 0, 0},
   {&__pyx_kp_s_Buffer_view_does_not_expose_stri, __pyx_k_Buffer_view_does_not_expose_stri, sizeof(__pyx_k_Buffer_view_does_not_expose_stri), 0, 0, 1, 0},
   {&__pyx_n_u_C, __pyx_k_C, sizeof(__pyx_k_C), 0, 1, 0, 1},
   {&__pyx_kp_s_Can_only_create_a_buffer_that_is, __pyx_k_Can_only_create_a_buffer_that_is, sizeof(__pyx_k_Can_only_create_a_buffer_that_is), 0, 0, 1, 0},
@@ -22252,12 +26194,14 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
   {&__pyx_n_s_asarray, __pyx_k_asarray, sizeof(__pyx_k_asarray), 0, 0, 1, 1},
   {&__pyx_n_s_base, __pyx_k_base, sizeof(__pyx_k_base), 0, 0, 1, 1},
+  {&__pyx_n_s_bit_len, __pyx_k_bit_len, sizeof(__pyx_k_bit_len), 0, 0, 1, 1},
   {&__pyx_n_s_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 0, 1, 1},
   {&__pyx_n_u_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 1, 0, 1},
   {&__pyx_n_s_centers, __pyx_k_centers, sizeof(__pyx_k_centers), 0, 0, 1, 1},
   {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
   {&__pyx_kp_s_contiguous_and_direct, __pyx_k_contiguous_and_direct, sizeof(__pyx_k_contiguous_and_direct), 0, 0, 1, 0},
   {&__pyx_kp_s_contiguous_and_indirect, __pyx_k_contiguous_and_indirect, sizeof(__pyx_k_contiguous_and_indirect), 0, 0, 1, 0},
+  {&__pyx_n_s_costa_state, __pyx_k_costa_state, sizeof(__pyx_k_costa_state), 0, 0, 1, 1},
   {&__pyx_n_s_demod_samples, __pyx_k_demod_samples, sizeof(__pyx_k_demod_samples), 0, 0, 1, 1},
   {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
   {&__pyx_n_s_dtype_is_object, __pyx_k_dtype_is_object, sizeof(__pyx_k_dtype_is_object), 0, 0, 1, 1},
@@ -22271,8 +26215,11 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 0, 1, 1},
   {&__pyx_n_u_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 1, 0, 1},
   {&__pyx_kp_s_got_differing_extents_in_dimensi, __pyx_k_got_differing_extents_in_dimensi, sizeof(__pyx_k_got_differing_extents_in_dimensi), 0, 0, 1, 0},
+  {&__pyx_n_s_has_predecessor, __pyx_k_has_predecessor, sizeof(__pyx_k_has_predecessor), 0, 0, 1, 1},
   {&__pyx_n_s_id, __pyx_k_id, sizeof(__pyx_k_id), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_int64, __pyx_k_int64, sizeof(__pyx_k_int64), 0, 0, 1, 1},
+  {&__pyx_n_s_int8, __pyx_k_int8, sizeof(__pyx_k_int8), 0, 0, 1, 1},
   {&__pyx_n_s_itemsize, __pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 0, 1, 1},
   {&__pyx_kp_s_itemsize_0_for_cython_array, __pyx_k_itemsize_0_for_cython_array, sizeof(__pyx_k_itemsize_0_for_cython_array), 0, 0, 1, 0},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
@@ -22296,17 +26243,21 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
   {&__pyx_n_s_order, __pyx_k_order, sizeof(__pyx_k_order), 0, 0, 1, 1},
   {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
+  {&__pyx_n_s_ppseq, __pyx_k_ppseq, sizeof(__pyx_k_ppseq), 0, 0, 1, 1},
+  {&__pyx_n_s_predecessor, __pyx_k_predecessor, sizeof(__pyx_k_predecessor), 0, 0, 1, 1},
   {&__pyx_n_s_pulsetype, __pyx_k_pulsetype, sizeof(__pyx_k_pulsetype), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_getbuffer, __pyx_k_pyx_getbuffer, sizeof(__pyx_k_pyx_getbuffer), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
   {&__pyx_n_s_qad_center, __pyx_k_qad_center, sizeof(__pyx_k_qad_center), 0, 0, 1, 1},
   {&__pyx_n_s_qad_samples, __pyx_k_qad_samples, sizeof(__pyx_k_qad_samples), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_rel_symbol_len, __pyx_k_rel_symbol_len, sizeof(__pyx_k_rel_symbol_len), 0, 0, 1, 1},
   {&__pyx_n_s_sample, __pyx_k_sample, sizeof(__pyx_k_sample), 0, 0, 1, 1},
   {&__pyx_n_s_samples, __pyx_k_samples, sizeof(__pyx_k_samples), 0, 0, 1, 1},
   {&__pyx_n_s_shape, __pyx_k_shape, sizeof(__pyx_k_shape), 0, 0, 1, 1},
   {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
   {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
+  {&__pyx_n_s_state, __pyx_k_state, sizeof(__pyx_k_state), 0, 0, 1, 1},
   {&__pyx_n_s_step, __pyx_k_step, sizeof(__pyx_k_step), 0, 0, 1, 1},
   {&__pyx_n_s_stop, __pyx_k_stop, sizeof(__pyx_k_stop), 0, 0, 1, 1},
   {&__pyx_kp_s_strided_and_direct, __pyx_k_strided_and_direct, sizeof(__pyx_k_strided_and_direct), 0, 0, 1, 0},
@@ -22323,12 +26274,13 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
   {&__pyx_n_s_urh_cythonext, __pyx_k_urh_cythonext, sizeof(__pyx_k_urh_cythonext), 0, 0, 1, 1},
   {&__pyx_n_s_util, __pyx_k_util, sizeof(__pyx_k_util), 0, 0, 1, 1},
+  {&__pyx_n_s_zeros, __pyx_k_zeros, sizeof(__pyx_k_zeros), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 55, __pyx_L1_error)
-  __pyx_builtin_id = __Pyx_GetBuiltinName(__pyx_n_s_id); if (!__pyx_builtin_id) __PYX_ERR(0, 298, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 218, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 60, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 437, __pyx_L1_error)
+  __pyx_builtin_id = __Pyx_GetBuiltinName(__pyx_n_s_id); if (!__pyx_builtin_id) __PYX_ERR(0, 550, __pyx_L1_error)
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 799, __pyx_L1_error)
   __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 989, __pyx_L1_error)
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(2, 146, __pyx_L1_error)
@@ -22345,6 +26297,28 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
+  /* "src/urh/cythonext/signalFunctions.pyx":119
+ *         costa_alpha = calc_costa_alpha(<float>(2 * M_PI / 100))
+ *         costa_beta = calc_costa_beta(<float>(2 * M_PI / 100))
+ *         costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns, np.zeros(2, dtype=np.float32))             # <<<<<<<<<<<<<<
+ * 
+ *     else:
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_int_2); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 119, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":437
+ * 
+ *     if n > 0 and bit_len == 0:
+ *         raise ValueError("Bit length must be greater than zero")             # <<<<<<<<<<<<<<
+ * 
+ *     # Obere Schranke fr die Anzahl Bits, lange Pausen erzeugen keine Bits
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Bit_length_must_be_greater_than); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 437, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
   /* "../../../../usr/lib/python3.6/site-packages/Cython/Includes/numpy/__init__.pxd":218
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
@@ -22352,9 +26326,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 218, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__3);
-  __Pyx_GIVEREF(__pyx_tuple__3);
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
 
   /* "../../../../usr/lib/python3.6/site-packages/Cython/Includes/numpy/__init__.pxd":222
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
@@ -22363,9 +26337,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             info.buf = PyArray_DATA(self)
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 222, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
 
   /* "../../../../usr/lib/python3.6/site-packages/Cython/Includes/numpy/__init__.pxd":259
  *                 if ((descr.byteorder == c'>' and little_endian) or
@@ -22374,9 +26348,9 @@ static int __Pyx_InitCachedConstants(void) {
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 259, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 259, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
 
   /* "../../../../usr/lib/python3.6/site-packages/Cython/Includes/numpy/__init__.pxd":799
  * 
@@ -22385,9 +26359,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 799, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 799, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
 
   /* "../../../../usr/lib/python3.6/site-packages/Cython/Includes/numpy/__init__.pxd":803
  *         if ((child.byteorder == c'>' and little_endian) or
@@ -22396,9 +26370,9 @@ static int __Pyx_InitCachedConstants(void) {
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 803, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 803, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
 
   /* "../../../../usr/lib/python3.6/site-packages/Cython/Includes/numpy/__init__.pxd":823
  *             t = child.type_num
@@ -22407,9 +26381,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 823, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 823, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
 
   /* "../../../../usr/lib/python3.6/site-packages/Cython/Includes/numpy/__init__.pxd":989
  *         _import_array()
@@ -22418,9 +26392,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 989, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 989, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
 
   /* "../../../../usr/lib/python3.6/site-packages/Cython/Includes/numpy/__init__.pxd":995
  *         _import_umath()
@@ -22429,18 +26403,18 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 995, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 995, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
 
   /* "../../../../usr/lib/python3.6/site-packages/Cython/Includes/numpy/__init__.pxd":1001
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 1001, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 1001, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
 
   /* "View.MemoryView":131
  * 
@@ -22449,9 +26423,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *         if itemsize <= 0:
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_Empty_shape_tuple_for_cython_arr); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(2, 131, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_Empty_shape_tuple_for_cython_arr); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(2, 131, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
 
   /* "View.MemoryView":134
  * 
@@ -22460,9 +26434,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *         if not isinstance(format, bytes):
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_itemsize_0_for_cython_array); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(2, 134, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_itemsize_0_for_cython_array); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(2, 134, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
 
   /* "View.MemoryView":137
  * 
@@ -22471,9 +26445,9 @@ static int __Pyx_InitCachedConstants(void) {
  *         self._format = format  # keep a reference to the byte string
  *         self.format = self._format
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_n_s_ASCII); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(2, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_n_s_ASCII); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(2, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
 
   /* "View.MemoryView":146
  * 
@@ -22482,9 +26456,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_shape_and_str); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(2, 146, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_shape_and_str); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(2, 146, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
 
   /* "View.MemoryView":174
  *             self.data = <char *>malloc(self.len)
@@ -22493,9 +26467,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             if self.dtype_is_object:
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_array_data); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(2, 174, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_unable_to_allocate_array_data); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(2, 174, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
 
   /* "View.MemoryView":190
  *             bufmode = PyBUF_F_CONTIGUOUS | PyBUF_ANY_CONTIGUOUS
@@ -22504,9 +26478,9 @@ static int __Pyx_InitCachedConstants(void) {
  *         info.buf = self.data
  *         info.len = self.len
  */
-  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_Can_only_create_a_buffer_that_is); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(2, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_Can_only_create_a_buffer_that_is); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(2, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
 
   /* "View.MemoryView":484
  *             result = struct.unpack(self.view.format, bytesitem)
@@ -22515,9 +26489,9 @@ static int __Pyx_InitCachedConstants(void) {
  *         else:
  *             if len(self.view.format) == 1:
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_convert_item_to_object); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(2, 484, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_convert_item_to_object); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(2, 484, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
 
   /* "View.MemoryView":556
  *         if self.view.strides == NULL:
@@ -22526,9 +26500,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *         return tuple([stride for stride in self.view.strides[:self.view.ndim]])
  */
-  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_Buffer_view_does_not_expose_stri); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(2, 556, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_kp_s_Buffer_view_does_not_expose_stri); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(2, 556, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
 
   /* "View.MemoryView":563
  *     def suboffsets(self):
@@ -22537,12 +26511,12 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *         return tuple([suboffset for suboffset in self.view.suboffsets[:self.view.ndim]])
  */
-  __pyx_tuple__20 = PyTuple_New(1); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(2, 563, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
+  __pyx_tuple__23 = PyTuple_New(1); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(2, 563, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
   __Pyx_INCREF(__pyx_int_neg_1);
   __Pyx_GIVEREF(__pyx_int_neg_1);
-  PyTuple_SET_ITEM(__pyx_tuple__20, 0, __pyx_int_neg_1);
-  __Pyx_GIVEREF(__pyx_tuple__20);
+  PyTuple_SET_ITEM(__pyx_tuple__23, 0, __pyx_int_neg_1);
+  __Pyx_GIVEREF(__pyx_tuple__23);
 
   /* "View.MemoryView":668
  *         if item is Ellipsis:
@@ -22551,9 +26525,9 @@ static int __Pyx_InitCachedConstants(void) {
  *                 seen_ellipsis = True
  *             else:
  */
-  __pyx_slice__21 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__21)) __PYX_ERR(2, 668, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__21);
-  __Pyx_GIVEREF(__pyx_slice__21);
+  __pyx_slice__24 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__24)) __PYX_ERR(2, 668, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__24);
+  __Pyx_GIVEREF(__pyx_slice__24);
 
   /* "View.MemoryView":671
  *                 seen_ellipsis = True
@@ -22562,9 +26536,9 @@ static int __Pyx_InitCachedConstants(void) {
  *             have_slices = True
  *         else:
  */
-  __pyx_slice__22 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__22)) __PYX_ERR(2, 671, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__22);
-  __Pyx_GIVEREF(__pyx_slice__22);
+  __pyx_slice__25 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__25)) __PYX_ERR(2, 671, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__25);
+  __Pyx_GIVEREF(__pyx_slice__25);
 
   /* "View.MemoryView":682
  *     nslices = ndim - len(result)
@@ -22573,9 +26547,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *     return have_slices or nslices, tuple(result)
  */
-  __pyx_slice__23 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__23)) __PYX_ERR(2, 682, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_slice__23);
-  __Pyx_GIVEREF(__pyx_slice__23);
+  __pyx_slice__26 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__26)) __PYX_ERR(2, 682, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__26);
+  __Pyx_GIVEREF(__pyx_slice__26);
 
   /* "View.MemoryView":689
  *     for suboffset in suboffsets[:ndim]:
@@ -22584,9 +26558,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_kp_s_Indirect_dimensions_not_supporte); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(2, 689, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_s_Indirect_dimensions_not_supporte); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(2, 689, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
 
   /* "View.MemoryView":282
  *         return self.name
@@ -22595,9 +26569,9 @@ static int __Pyx_InitCachedConstants(void) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_tuple__25 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(2, 282, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__25);
-  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(2, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
 
   /* "View.MemoryView":283
  * 
@@ -22606,9 +26580,9 @@ static int __Pyx_InitCachedConstants(void) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_tuple__26 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(2, 283, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__26);
-  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(2, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
 
   /* "View.MemoryView":284
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -22617,9 +26591,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(2, 284, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_tuple__30 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(2, 284, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
 
   /* "View.MemoryView":287
  * 
@@ -22628,9 +26602,9 @@ static int __Pyx_InitCachedConstants(void) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(2, 287, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__28);
-  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_tuple__31 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(2, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
 
   /* "View.MemoryView":288
  * 
@@ -22639,9 +26613,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(2, 288, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_tuple__32 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(2, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -22661,6 +26635,7 @@ if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
@@ -22759,11 +26734,11 @@ PyMODINIT_FUNC PyInit_signalFunctions(void)
   /*--- Variable export code ---*/
   /*--- Function export code ---*/
   /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_3src_3urh_9cythonext_15signalFunctions_Symbol) < 0) __PYX_ERR(0, 276, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_3src_3urh_9cythonext_15signalFunctions_Symbol) < 0) __PYX_ERR(0, 528, __pyx_L1_error)
   __pyx_type_3src_3urh_9cythonext_15signalFunctions_Symbol.tp_print = 0;
   #if CYTHON_COMPILING_IN_CPYTHON
   {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_3src_3urh_9cythonext_15signalFunctions_Symbol, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 276, __pyx_L1_error)
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_3src_3urh_9cythonext_15signalFunctions_Symbol, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 528, __pyx_L1_error)
     if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
       __pyx_wrapperbase_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
       __pyx_wrapperbase_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__.doc = __pyx_doc_3src_3urh_9cythonext_15signalFunctions_6Symbol___init__;
@@ -22771,7 +26746,7 @@ PyMODINIT_FUNC PyInit_signalFunctions(void)
     }
   }
   #endif
-  if (PyObject_SetAttrString(__pyx_m, "Symbol", (PyObject *)&__pyx_type_3src_3urh_9cythonext_15signalFunctions_Symbol) < 0) __PYX_ERR(0, 276, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "Symbol", (PyObject *)&__pyx_type_3src_3urh_9cythonext_15signalFunctions_Symbol) < 0) __PYX_ERR(0, 528, __pyx_L1_error)
   __pyx_ptype_3src_3urh_9cythonext_15signalFunctions_Symbol = &__pyx_type_3src_3urh_9cythonext_15signalFunctions_Symbol;
   __pyx_vtabptr_array = &__pyx_vtable_array;
   __pyx_vtable_array.get_memview = (PyObject *(*)(struct __pyx_array_obj *))__pyx_array_get_memview;
@@ -22902,6 +26877,24 @@ PyMODINIT_FUNC PyInit_signalFunctions(void)
  */
   __pyx_k__2 = (1.0 / sqrt(2.0));
 
+  /* "src/urh/cythonext/signalFunctions.pyx":140
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,
+ *                                                         float[::1] costa_state, bool has_predecessor=False,
+ *                                                         float complex predecessor=0):             # <<<<<<<<<<<<<<
+ *     """
+ *     Demodulate one block of a longer signal, so the signal can be demodulated block by block
+ */
+  __pyx_k__4 = __pyx_t_float_complex_from_parts(0, 0);
+
+  /* "src/urh/cythonext/signalFunctions.pyx":138
+ *     return np.asarray(result)
+ * 
+ * cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,             # <<<<<<<<<<<<<<
+ *                                                         float[::1] costa_state, bool has_predecessor=False,
+ *                                                         float complex predecessor=0):
+ */
+  __pyx_k__4 = __pyx_t_float_complex_from_parts(0, 0);
+
   /* "src/urh/cythonext/signalFunctions.pyx":1
  * # noinspection PyUnresolvedReferences             # <<<<<<<<<<<<<<
  * from libcpp cimport bool
@@ -22932,7 +26925,7 @@ PyMODINIT_FUNC PyInit_signalFunctions(void)
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__25, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 282, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 282, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(generic);
   __Pyx_DECREF_SET(generic, __pyx_t_2);
@@ -22946,7 +26939,7 @@ PyMODINIT_FUNC PyInit_signalFunctions(void)
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__26, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 283, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__29, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 283, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(strided);
   __Pyx_DECREF_SET(strided, __pyx_t_2);
@@ -22960,7 +26953,7 @@ PyMODINIT_FUNC PyInit_signalFunctions(void)
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 284, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__30, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 284, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(indirect);
   __Pyx_DECREF_SET(indirect, __pyx_t_2);
@@ -22974,7 +26967,7 @@ PyMODINIT_FUNC PyInit_signalFunctions(void)
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 287, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__31, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 287, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(contiguous);
   __Pyx_DECREF_SET(contiguous, __pyx_t_2);
@@ -22988,7 +26981,7 @@ PyMODINIT_FUNC PyInit_signalFunctions(void)
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__29, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 288, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__32, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 288, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_XGOTREF(indirect_contiguous);
   __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_2);
@@ -23128,187 +27121,16 @@ static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
     return result;
 }
 
-/* PyObjectCall */
-  #if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
-    if (unlikely(!call))
-        return PyObject_Call(func, arg, kw);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = (*call)(func, arg, kw);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
-/* ExtTypeTest */
-  static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (likely(PyObject_TypeCheck(obj, type)))
-        return 1;
-    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
-                 Py_TYPE(obj)->tp_name, type->tp_name);
-    return 0;
-}
-
-/* PyCFunctionFastCall */
-  #if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
-    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
-    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
-    PyObject *self = PyCFunction_GET_SELF(func);
-    assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST)));
-    assert(nargs >= 0);
-    assert(nargs == 0 || args != NULL);
-    /* _PyCFunction_FastCallDict() must not be called with an exception set,
-       because it may clear it (directly or indirectly) and so the
-       caller loses its exception */
-    assert(!PyErr_Occurred());
-    return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs, NULL);
-}
-#endif  // CYTHON_FAST_PYCCALL
-
-/* PyFunctionFastCall */
-  #if CYTHON_FAST_PYCALL
-#include "frameobject.h"
-static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
-                                               PyObject *globals) {
-    PyFrameObject *f;
-    PyThreadState *tstate = PyThreadState_GET();
-    PyObject **fastlocals;
-    Py_ssize_t i;
-    PyObject *result;
-    assert(globals != NULL);
-    /* XXX Perhaps we should create a specialized
-       PyFrame_New() that doesn't take locals, but does
-       take builtins without sanity checking them.
-       */
-    assert(tstate != NULL);
-    f = PyFrame_New(tstate, co, globals, NULL);
-    if (f == NULL) {
-        return NULL;
-    }
-    fastlocals = f->f_localsplus;
-    for (i = 0; i < na; i++) {
-        Py_INCREF(*args);
-        fastlocals[i] = *args++;
-    }
-    result = PyEval_EvalFrameEx(f,0);
-    ++tstate->recursion_depth;
-    Py_DECREF(f);
-    --tstate->recursion_depth;
-    return result;
-}
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
-    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
-    PyObject *globals = PyFunction_GET_GLOBALS(func);
-    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
-    PyObject *closure;
-#if PY_MAJOR_VERSION >= 3
-    PyObject *kwdefs;
-#endif
-    PyObject *kwtuple, **k;
-    PyObject **d;
-    Py_ssize_t nd;
-    Py_ssize_t nk;
-    PyObject *result;
-    assert(kwargs == NULL || PyDict_Check(kwargs));
-    nk = kwargs ? PyDict_Size(kwargs) : 0;
-    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
-        return NULL;
-    }
-    if (
-#if PY_MAJOR_VERSION >= 3
-            co->co_kwonlyargcount == 0 &&
-#endif
-            likely(kwargs == NULL || nk == 0) &&
-            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
-        if (argdefs == NULL && co->co_argcount == nargs) {
-            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
-            goto done;
-        }
-        else if (nargs == 0 && argdefs != NULL
-                 && co->co_argcount == Py_SIZE(argdefs)) {
-            /* function called with no arguments, but all parameters have
-               a default value: use default values as arguments .*/
-            args = &PyTuple_GET_ITEM(argdefs, 0);
-            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
-            goto done;
-        }
-    }
-    if (kwargs != NULL) {
-        Py_ssize_t pos, i;
-        kwtuple = PyTuple_New(2 * nk);
-        if (kwtuple == NULL) {
-            result = NULL;
-            goto done;
-        }
-        k = &PyTuple_GET_ITEM(kwtuple, 0);
-        pos = i = 0;
-        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
-            Py_INCREF(k[i]);
-            Py_INCREF(k[i+1]);
-            i += 2;
-        }
-        nk = i / 2;
-    }
-    else {
-        kwtuple = NULL;
-        k = NULL;
-    }
-    closure = PyFunction_GET_CLOSURE(func);
-#if PY_MAJOR_VERSION >= 3
-    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
-#endif
-    if (argdefs != NULL) {
-        d = &PyTuple_GET_ITEM(argdefs, 0);
-        nd = Py_SIZE(argdefs);
-    }
-    else {
-        d = NULL;
-        nd = 0;
-    }
-#if PY_MAJOR_VERSION >= 3
-    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, kwdefs, closure);
-#else
-    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, closure);
-#endif
-    Py_XDECREF(kwtuple);
-done:
-    Py_LeaveRecursiveCall();
-    return result;
-}
-#endif  // CPython < 3.6
-#endif  // CYTHON_FAST_PYCALL
-
-/* PyObjectCallMethO */
+/* PyObjectCall */
   #if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
-    PyObject *self, *result;
-    PyCFunction cfunc;
-    cfunc = PyCFunction_GET_FUNCTION(func);
-    self = PyCFunction_GET_SELF(func);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = func->ob_type->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
     if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
         return NULL;
-    result = cfunc(self, arg);
+    result = (*call)(func, arg, kw);
     Py_LeaveRecursiveCall();
     if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
         PyErr_SetString(
@@ -23319,52 +27141,21 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 }
 #endif
 
-/* PyObjectCallOneArg */
-  #if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_New(1);
-    if (unlikely(!args)) return NULL;
-    Py_INCREF(arg);
-    PyTuple_SET_ITEM(args, 0, arg);
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
-    return result;
-}
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-#if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCall(func, &arg, 1);
-    }
-#endif
-#ifdef __Pyx_CyFunction_USED
-    if (likely(PyCFunction_Check(func) || PyObject_TypeCheck(func, __pyx_CyFunctionType))) {
-#else
-    if (likely(PyCFunction_Check(func))) {
-#endif
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
-            return __Pyx_PyObject_CallMethO(func, arg);
-#if CYTHON_FAST_PYCCALL
-        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
-            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
-#endif
-        }
+/* ExtTypeTest */
+  static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
     }
-    return __Pyx__PyObject_CallOneArg(func, arg);
-}
-#else
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_Pack(1, arg);
-    if (unlikely(!args)) return NULL;
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
-    return result;
+    if (likely(PyObject_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
 }
-#endif
 
 /* BufferFormatCheck */
-    static CYTHON_INLINE int __Pyx_IsLittleEndian(void) {
+  static CYTHON_INLINE int __Pyx_IsLittleEndian(void) {
   unsigned int n = 1;
   return *(unsigned char*)(&n) != 0;
 }
@@ -23914,7 +27705,7 @@ static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info) {
 }
 
 /* MemviewSliceInit */
-      static int
+    static int
 __Pyx_init_memviewslice(struct __pyx_memoryview_obj *memview,
                         int ndim,
                         __Pyx_memviewslice *memviewslice,
@@ -23944,109 +27735,311 @@ __Pyx_init_memviewslice(struct __pyx_memoryview_obj *memview,
             stride *= buf->shape[i];
         }
     }
-    for (i = 0; i < ndim; i++) {
-        memviewslice->shape[i]   = buf->shape[i];
-        if (buf->suboffsets) {
-            memviewslice->suboffsets[i] = buf->suboffsets[i];
-        } else {
-            memviewslice->suboffsets[i] = -1;
+    for (i = 0; i < ndim; i++) {
+        memviewslice->shape[i]   = buf->shape[i];
+        if (buf->suboffsets) {
+            memviewslice->suboffsets[i] = buf->suboffsets[i];
+        } else {
+            memviewslice->suboffsets[i] = -1;
+        }
+    }
+    memviewslice->memview = memview;
+    memviewslice->data = (char *)buf->buf;
+    if (__pyx_add_acquisition_count(memview) == 0 && !memview_is_new_reference) {
+        Py_INCREF(memview);
+    }
+    retval = 0;
+    goto no_fail;
+fail:
+    memviewslice->memview = 0;
+    memviewslice->data = 0;
+    retval = -1;
+no_fail:
+    __Pyx_RefNannyFinishContext();
+    return retval;
+}
+static CYTHON_INLINE void __pyx_fatalerror(const char *fmt, ...) {
+    va_list vargs;
+    char msg[200];
+#ifdef HAVE_STDARG_PROTOTYPES
+    va_start(vargs, fmt);
+#else
+    va_start(vargs);
+#endif
+    vsnprintf(msg, 200, fmt, vargs);
+    Py_FatalError(msg);
+    va_end(vargs);
+}
+static CYTHON_INLINE int
+__pyx_add_acquisition_count_locked(__pyx_atomic_int *acquisition_count,
+                                   PyThread_type_lock lock)
+{
+    int result;
+    PyThread_acquire_lock(lock, 1);
+    result = (*acquisition_count)++;
+    PyThread_release_lock(lock);
+    return result;
+}
+static CYTHON_INLINE int
+__pyx_sub_acquisition_count_locked(__pyx_atomic_int *acquisition_count,
+                                   PyThread_type_lock lock)
+{
+    int result;
+    PyThread_acquire_lock(lock, 1);
+    result = (*acquisition_count)--;
+    PyThread_release_lock(lock);
+    return result;
+}
+static CYTHON_INLINE void
+__Pyx_INC_MEMVIEW(__Pyx_memviewslice *memslice, int have_gil, int lineno)
+{
+    int first_time;
+    struct __pyx_memoryview_obj *memview = memslice->memview;
+    if (!memview || (PyObject *) memview == Py_None)
+        return;
+    if (__pyx_get_slice_count(memview) < 0)
+        __pyx_fatalerror("Acquisition count is %d (line %d)",
+                         __pyx_get_slice_count(memview), lineno);
+    first_time = __pyx_add_acquisition_count(memview) == 0;
+    if (first_time) {
+        if (have_gil) {
+            Py_INCREF((PyObject *) memview);
+        } else {
+            PyGILState_STATE _gilstate = PyGILState_Ensure();
+            Py_INCREF((PyObject *) memview);
+            PyGILState_Release(_gilstate);
+        }
+    }
+}
+static CYTHON_INLINE void __Pyx_XDEC_MEMVIEW(__Pyx_memviewslice *memslice,
+                                             int have_gil, int lineno) {
+    int last_time;
+    struct __pyx_memoryview_obj *memview = memslice->memview;
+    if (!memview ) {
+        return;
+    } else if ((PyObject *) memview == Py_None) {
+        memslice->memview = NULL;
+        return;
+    }
+    if (__pyx_get_slice_count(memview) <= 0)
+        __pyx_fatalerror("Acquisition count is %d (line %d)",
+                         __pyx_get_slice_count(memview), lineno);
+    last_time = __pyx_sub_acquisition_count(memview) == 1;
+    memslice->data = NULL;
+    if (last_time) {
+        if (have_gil) {
+            Py_CLEAR(memslice->memview);
+        } else {
+            PyGILState_STATE _gilstate = PyGILState_Ensure();
+            Py_CLEAR(memslice->memview);
+            PyGILState_Release(_gilstate);
+        }
+    } else {
+        memslice->memview = NULL;
+    }
+}
+
+/* PyCFunctionFastCall */
+    #if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs, NULL);
+}
+#endif  // CYTHON_FAST_PYCCALL
+
+/* PyFunctionFastCall */
+    #if CYTHON_FAST_PYCALL
+#include "frameobject.h"
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = PyThreadState_GET();
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = f->f_localsplus;
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
         }
+        nk = i / 2;
     }
-    memviewslice->memview = memview;
-    memviewslice->data = (char *)buf->buf;
-    if (__pyx_add_acquisition_count(memview) == 0 && !memview_is_new_reference) {
-        Py_INCREF(memview);
+    else {
+        kwtuple = NULL;
+        k = NULL;
     }
-    retval = 0;
-    goto no_fail;
-fail:
-    memviewslice->memview = 0;
-    memviewslice->data = 0;
-    retval = -1;
-no_fail:
-    __Pyx_RefNannyFinishContext();
-    return retval;
-}
-static CYTHON_INLINE void __pyx_fatalerror(const char *fmt, ...) {
-    va_list vargs;
-    char msg[200];
-#ifdef HAVE_STDARG_PROTOTYPES
-    va_start(vargs, fmt);
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
 #else
-    va_start(vargs);
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
 #endif
-    vsnprintf(msg, 200, fmt, vargs);
-    Py_FatalError(msg);
-    va_end(vargs);
-}
-static CYTHON_INLINE int
-__pyx_add_acquisition_count_locked(__pyx_atomic_int *acquisition_count,
-                                   PyThread_type_lock lock)
-{
-    int result;
-    PyThread_acquire_lock(lock, 1);
-    result = (*acquisition_count)++;
-    PyThread_release_lock(lock);
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
     return result;
 }
-static CYTHON_INLINE int
-__pyx_sub_acquisition_count_locked(__pyx_atomic_int *acquisition_count,
-                                   PyThread_type_lock lock)
-{
-    int result;
-    PyThread_acquire_lock(lock, 1);
-    result = (*acquisition_count)--;
-    PyThread_release_lock(lock);
+#endif  // CPython < 3.6
+#endif  // CYTHON_FAST_PYCALL
+
+/* PyObjectCallMethO */
+    #if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
     return result;
 }
-static CYTHON_INLINE void
-__Pyx_INC_MEMVIEW(__Pyx_memviewslice *memslice, int have_gil, int lineno)
-{
-    int first_time;
-    struct __pyx_memoryview_obj *memview = memslice->memview;
-    if (!memview || (PyObject *) memview == Py_None)
-        return;
-    if (__pyx_get_slice_count(memview) < 0)
-        __pyx_fatalerror("Acquisition count is %d (line %d)",
-                         __pyx_get_slice_count(memview), lineno);
-    first_time = __pyx_add_acquisition_count(memview) == 0;
-    if (first_time) {
-        if (have_gil) {
-            Py_INCREF((PyObject *) memview);
-        } else {
-            PyGILState_STATE _gilstate = PyGILState_Ensure();
-            Py_INCREF((PyObject *) memview);
-            PyGILState_Release(_gilstate);
-        }
-    }
+#endif
+
+/* PyObjectCallOneArg */
+    #if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
 }
-static CYTHON_INLINE void __Pyx_XDEC_MEMVIEW(__Pyx_memviewslice *memslice,
-                                             int have_gil, int lineno) {
-    int last_time;
-    struct __pyx_memoryview_obj *memview = memslice->memview;
-    if (!memview ) {
-        return;
-    } else if ((PyObject *) memview == Py_None) {
-        memslice->memview = NULL;
-        return;
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
     }
-    if (__pyx_get_slice_count(memview) <= 0)
-        __pyx_fatalerror("Acquisition count is %d (line %d)",
-                         __pyx_get_slice_count(memview), lineno);
-    last_time = __pyx_sub_acquisition_count(memview) == 1;
-    memslice->data = NULL;
-    if (last_time) {
-        if (have_gil) {
-            Py_CLEAR(memslice->memview);
-        } else {
-            PyGILState_STATE _gilstate = PyGILState_Ensure();
-            Py_CLEAR(memslice->memview);
-            PyGILState_Release(_gilstate);
+#endif
+#ifdef __Pyx_CyFunction_USED
+    if (likely(PyCFunction_Check(func) || PyObject_TypeCheck(func, __pyx_CyFunctionType))) {
+#else
+    if (likely(PyCFunction_Check(func))) {
+#endif
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
         }
-    } else {
-        memslice->memview = NULL;
     }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
 }
+#endif
 
 /* RaiseArgTupleInvalid */
       static void __Pyx_RaiseArgtupleInvalid(
@@ -24256,33 +28249,6 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 #endif
 }
 
-/* ArgTypeTest */
-      static void __Pyx_RaiseArgumentTypeInvalid(const char* name, PyObject *obj, PyTypeObject *type) {
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-}
-static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact)
-{
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (none_allowed && obj == Py_None) return 1;
-    else if (exact) {
-        if (likely(Py_TYPE(obj) == type)) return 1;
-        #if PY_MAJOR_VERSION == 2
-        else if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
-        #endif
-    }
-    else {
-        if (likely(PyObject_TypeCheck(obj, type))) return 1;
-    }
-    __Pyx_RaiseArgumentTypeInvalid(name, obj, type);
-    return 0;
-}
-
 /* RaiseException */
       #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
@@ -24446,6 +28412,33 @@ bad:
 }
 #endif
 
+/* ArgTypeTest */
+        static void __Pyx_RaiseArgumentTypeInvalid(const char* name, PyObject *obj, PyTypeObject *type) {
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+}
+static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
+    const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (none_allowed && obj == Py_None) return 1;
+    else if (exact) {
+        if (likely(Py_TYPE(obj) == type)) return 1;
+        #if PY_MAJOR_VERSION == 2
+        else if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(PyObject_TypeCheck(obj, type))) return 1;
+    }
+    __Pyx_RaiseArgumentTypeInvalid(name, obj, type);
+    return 0;
+}
+
 /* RaiseTooManyValuesToUnpack */
         static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
     PyErr_Format(PyExc_ValueError,
@@ -25872,7 +29865,30 @@ no_fail:
 }
 
 /* ObjectToMemviewSlice */
-          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc___pyx_t_float_complex(PyObject *obj) {
+          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc___pyx_t_float_complex(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 1,
+                                                 &__Pyx_TypeInfo___pyx_t_float_complex, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_float(PyObject *obj) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
     int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
@@ -25883,7 +29899,7 @@ no_fail:
     }
     retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
                                                  (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 1,
-                                                 &__Pyx_TypeInfo___pyx_t_float_complex, stack,
+                                                 &__Pyx_TypeInfo_float, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
         goto __pyx_fail;
@@ -25894,8 +29910,22 @@ __pyx_fail:
     return result;
 }
 
+/* FromPy */
+          static __pyx_t_float_complex __Pyx_PyComplex_As___pyx_t_float_complex(PyObject* o) {
+    Py_complex cval;
+#if !CYTHON_COMPILING_IN_PYPY
+    if (PyComplex_CheckExact(o))
+        cval = ((PyComplexObject *)o)->cval;
+    else
+#endif
+        cval = PyComplex_AsCComplex(o);
+    return __pyx_t_float_complex_from_parts(
+               (float)cval.real,
+               (float)cval.imag);
+}
+
 /* ObjectToMemviewSlice */
-          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_float(PyObject *obj) {
+          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_PY_LONG_LONG(PyObject *obj) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
     int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
@@ -25906,7 +29936,30 @@ __pyx_fail:
     }
     retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
                                                  (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 1,
-                                                 &__Pyx_TypeInfo_float, stack,
+                                                 &__Pyx_TypeInfo_unsigned_PY_LONG_LONG, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_PY_LONG_LONG(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 2,
+                                                 &__Pyx_TypeInfo_unsigned_PY_LONG_LONG, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
         goto __pyx_fail;
@@ -25948,20 +30001,6 @@ __pyx_fail:
     }
 }
 
-/* FromPy */
-          static __pyx_t_float_complex __Pyx_PyComplex_As___pyx_t_float_complex(PyObject* o) {
-    Py_complex cval;
-#if !CYTHON_COMPILING_IN_PYPY
-    if (PyComplex_CheckExact(o))
-        cval = ((PyComplexObject *)o)->cval;
-    else
-#endif
-        cval = PyComplex_AsCComplex(o);
-    return __pyx_t_float_complex_from_parts(
-               (float)cval.real,
-               (float)cval.imag);
-}
-
 /* MemviewDtypeToObject */
           static CYTHON_INLINE PyObject *__pyx_memview_get___pyx_t_float_complex(const char *itemp) {
     return (PyObject *) __pyx_PyComplex_FromComplex(*(__pyx_t_float_complex *) itemp);
@@ -26060,6 +30099,61 @@ static CYTHON_INLINE int __pyx_memview_set_unsigned_PY_LONG_LONG(const char *ite
     return 1;
 }
 
+/* CIntToPy */
+          static CYTHON_INLINE PyObject* __Pyx_PyInt_From_npy_int8(npy_int8 value) {
+    const npy_int8 neg_one = (npy_int8) -1, const_zero = (npy_int8) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(npy_int8) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(npy_int8) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(npy_int8) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(npy_int8) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(npy_int8) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(npy_int8),
+                                     little, !is_unsigned);
+    }
+}
+
+/* MemviewDtypeToObject */
+          static CYTHON_INLINE PyObject *__pyx_memview_get_nn___pyx_t_5numpy_int8_t(const char *itemp) {
+    return (PyObject *) __Pyx_PyInt_From_npy_int8(*(__pyx_t_5numpy_int8_t *) itemp);
+}
+static CYTHON_INLINE int __pyx_memview_set_nn___pyx_t_5numpy_int8_t(const char *itemp, PyObject *obj) {
+    __pyx_t_5numpy_int8_t value = __Pyx_PyInt_As_npy_int8(obj);
+    if ((value == ((npy_int8)-1)) && PyErr_Occurred())
+        return 0;
+    *(__pyx_t_5numpy_int8_t *) itemp = value;
+    return 1;
+}
+
+/* MemviewDtypeToObject */
+          static CYTHON_INLINE PyObject *__pyx_memview_get_PY_LONG_LONG(const char *itemp) {
+    return (PyObject *) __Pyx_PyInt_From_PY_LONG_LONG(*(PY_LONG_LONG *) itemp);
+}
+static CYTHON_INLINE int __pyx_memview_set_PY_LONG_LONG(const char *itemp, PyObject *obj) {
+    PY_LONG_LONG value = __Pyx_PyInt_As_PY_LONG_LONG(obj);
+    if ((value == (PY_LONG_LONG)-1) && PyErr_Occurred())
+        return 0;
+    *(PY_LONG_LONG *) itemp = value;
+    return 1;
+}
+
 /* CIntToPy */
           static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_int(unsigned int value) {
     const unsigned int neg_one = (unsigned int) -1, const_zero = (unsigned int) 0;
@@ -26976,6 +31070,195 @@ raise_neg_overflow:
     return (PY_LONG_LONG) -1;
 }
 
+/* CIntFromPy */
+          static CYTHON_INLINE npy_int8 __Pyx_PyInt_As_npy_int8(PyObject *x) {
+    const npy_int8 neg_one = (npy_int8) -1, const_zero = (npy_int8) 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(npy_int8) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(npy_int8, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (npy_int8) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (npy_int8) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(npy_int8, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(npy_int8) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(npy_int8, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(npy_int8) >= 2 * PyLong_SHIFT) {
+                            return (npy_int8) (((((npy_int8)digits[1]) << PyLong_SHIFT) | (npy_int8)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(npy_int8) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(npy_int8, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(npy_int8) >= 3 * PyLong_SHIFT) {
+                            return (npy_int8) (((((((npy_int8)digits[2]) << PyLong_SHIFT) | (npy_int8)digits[1]) << PyLong_SHIFT) | (npy_int8)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(npy_int8) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(npy_int8, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(npy_int8) >= 4 * PyLong_SHIFT) {
+                            return (npy_int8) (((((((((npy_int8)digits[3]) << PyLong_SHIFT) | (npy_int8)digits[2]) << PyLong_SHIFT) | (npy_int8)digits[1]) << PyLong_SHIFT) | (npy_int8)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (npy_int8) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(npy_int8) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(npy_int8, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(npy_int8) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(npy_int8, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (npy_int8) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(npy_int8, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(npy_int8,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(npy_int8) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(npy_int8, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(npy_int8) - 1 > 2 * PyLong_SHIFT) {
+                            return (npy_int8) (((npy_int8)-1)*(((((npy_int8)digits[1]) << PyLong_SHIFT) | (npy_int8)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(npy_int8) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(npy_int8, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(npy_int8) - 1 > 2 * PyLong_SHIFT) {
+                            return (npy_int8) ((((((npy_int8)digits[1]) << PyLong_SHIFT) | (npy_int8)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(npy_int8) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(npy_int8, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(npy_int8) - 1 > 3 * PyLong_SHIFT) {
+                            return (npy_int8) (((npy_int8)-1)*(((((((npy_int8)digits[2]) << PyLong_SHIFT) | (npy_int8)digits[1]) << PyLong_SHIFT) | (npy_int8)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(npy_int8) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(npy_int8, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(npy_int8) - 1 > 3 * PyLong_SHIFT) {
+                            return (npy_int8) ((((((((npy_int8)digits[2]) << PyLong_SHIFT) | (npy_int8)digits[1]) << PyLong_SHIFT) | (npy_int8)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(npy_int8) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(npy_int8, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(npy_int8) - 1 > 4 * PyLong_SHIFT) {
+                            return (npy_int8) (((npy_int8)-1)*(((((((((npy_int8)digits[3]) << PyLong_SHIFT) | (npy_int8)digits[2]) << PyLong_SHIFT) | (npy_int8)digits[1]) << PyLong_SHIFT) | (npy_int8)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(npy_int8) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(npy_int8, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(npy_int8) - 1 > 4 * PyLong_SHIFT) {
+                            return (npy_int8) ((((((((((npy_int8)digits[3]) << PyLong_SHIFT) | (npy_int8)digits[2]) << PyLong_SHIFT) | (npy_int8)digits[1]) << PyLong_SHIFT) | (npy_int8)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(npy_int8) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(npy_int8, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(npy_int8) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(npy_int8, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            npy_int8 val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (npy_int8) -1;
+        }
+    } else {
+        npy_int8 val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (npy_int8) -1;
+        val = __Pyx_PyInt_As_npy_int8(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to npy_int8");
+    return (npy_int8) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to npy_int8");
+    return (npy_int8) -1;
+}
+
 /* CIntFromPy */
           static CYTHON_INLINE char __Pyx_PyInt_As_char(PyObject *x) {
     const char neg_one = (char) -1, const_zero = (char) 0;
@@ -27355,18 +31638,18 @@ raise_neg_overflow:
 }
 
 /* ObjectToMemviewSlice */
-          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_PY_LONG_LONG(PyObject *obj) {
+          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_nn___pyx_t_5numpy_int8_t(PyObject *obj) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
     int retcode;
     if (obj == Py_None) {
         result.memview = (struct __pyx_memoryview_obj *) Py_None;
         return result;
     }
     retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
-                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 2,
-                                                 &__Pyx_TypeInfo_unsigned_PY_LONG_LONG, stack,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 1,
+                                                 &__Pyx_TypeInfo_nn___pyx_t_5numpy_int8_t, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
         goto __pyx_fail;
@@ -27378,7 +31661,7 @@ __pyx_fail:
 }
 
 /* ObjectToMemviewSlice */
-          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_unsigned_PY_LONG_LONG(PyObject *obj) {
+          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_PY_LONG_LONG(PyObject *obj) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
     int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
@@ -27389,7 +31672,30 @@ __pyx_fail:
     }
     retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
                                                  (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 1,
-                                                 &__Pyx_TypeInfo_unsigned_PY_LONG_LONG, stack,
+                                                 &__Pyx_TypeInfo_PY_LONG_LONG, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+          static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_PY_LONG_LONG(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 2,
+                                                 &__Pyx_TypeInfo_PY_LONG_LONG, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
         goto __pyx_fail;
@@ -42,11 +42,16 @@ cpdef float get_noise_for_mod_type(int mod_type):
 
 
 cdef void costa_demod(float complex[::1] samples, float[::1] result, float noise_sqrd,
-                          float costa_alpha, float costa_beta, bool qam, long long num_samples):
+                          float costa_alpha, float costa_beta, bool qam, long long num_samples,
+                          float[::1] costa_state):
+    """
+    :param costa_state: frequency and phase of the costas loop.
+                        Used as start values and updated in place, so a following block can continue.
+    """
     cdef float phase_error
     cdef long long i
-    cdef float costa_freq = 0
-    cdef float costa_phase = 0
+    cdef float costa_freq = costa_state[0]
+    cdef float costa_phase = costa_state[1]
     cdef float complex nco_out
     cdef float complex nco_times_sample, c
     cdef float real, imag
@@ -73,6 +78,9 @@ cdef void costa_demod(float complex[::1] samples, float[::1] result, float noise
         else:
             result[i] = nco_times_sample.real
 
+    costa_state[0] = costa_freq
+    costa_state[1] = costa_phase
+
 cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, float noise_mag, int mod_type):
     if len(samples) <= 2:
         return np.empty(len(samples), dtype=np.float32)
@@ -108,7 +116,7 @@ cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, flo
 
         costa_alpha = calc_costa_alpha(<float>(2 * M_PI / 100))
         costa_beta = calc_costa_beta(<float>(2 * M_PI / 100))
-        costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns)
+        costa_demod(samples, result, noise_sqrd, costa_alpha, costa_beta, qam, ns, np.zeros(2, dtype=np.float32))
 
     else:
         for i in prange(1, ns, nogil=True, schedule='static'):
@@ -127,6 +135,64 @@ cpdef np.ndarray[np.float32_t, ndim=1] afp_demod(float complex[::1] samples, flo
 
     return np.asarray(result)
 
+cpdef np.ndarray[np.float32_t, ndim=1] afp_demod_block(float complex[::1] samples, float noise_mag, int mod_type,
+                                                        float[::1] costa_state, bool has_predecessor=False,
+                                                        float complex predecessor=0):
+    """
+    Demodulate one block of a longer signal, so the signal can be demodulated block by block
+    with the same result as demodulating it at once with afp_demod.
+
+    :param costa_state: frequency and phase of the costas loop (PSK/QAM) at the start of this block,
+                        it is updated in place to the state at the end of this block
+    :param has_predecessor: False for the first block of a signal
+    :param predecessor: last sample of the previous block, needed for FSK
+    """
+    cdef long long i, ns = len(samples)
+    cdef float complex tmp, c
+    cdef float noise_sqrd = noise_mag * noise_mag
+    cdef float NOISE = get_noise_for_mod_type(mod_type)
+    cdef float real, imag, magnitude
+    cdef bool qam = mod_type == 3
+
+    cdef float[::1] result = np.empty(ns, dtype=np.float32, order="C")
+    if ns == 0:
+        return np.asarray(result)
+
+    if mod_type == 2 or mod_type == 3: # PSK or QAM
+        costa_demod(samples, result, noise_sqrd, calc_costa_alpha(<float>(2 * M_PI / 100)),
+                    calc_costa_beta(<float>(2 * M_PI / 100)), qam, ns, costa_state)
+        return np.asarray(result)
+
+    c = samples[0]
+    magnitude = c.real * c.real + c.imag * c.imag
+    if not has_predecessor or magnitude <= noise_sqrd:
+        result[0] = NOISE
+    elif mod_type == 0:
+        result[0] = magnitude
+    elif mod_type == 1:
+        tmp = predecessor.conjugate() * c
+        result[0] = atan2(tmp.imag, tmp.real)
+    else:
+        result[0] = NOISE
+
+    for i in prange(1, ns, nogil=True, schedule='static'):
+        c = samples[i]
+        real, imag = c.real, c.imag
+        magnitude = real * real + imag * imag
+        if magnitude <= noise_sqrd:
+            result[i] = NOISE
+            continue
+
+        if mod_type == 0:  # ASK
+            result[i] = magnitude
+        elif mod_type == 1:  # FSK
+            tmp = samples[i - 1].conjugate() * c
+            result[i] = atan2(tmp.imag, tmp.real)
+        else:
+            result[i] = NOISE
+
+    return np.asarray(result)
+
 cpdef unsigned long long find_signal_start(float[::1] demod_samples, int mod_type):
 
     cdef unsigned long long i, ns, l
@@ -221,45 +287,46 @@ cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples,
     else:
         cur_state = 0
 
-    for i in range(ns-1):
-        pulselen += 1
-        s = samples[i]
-        if s == NOISE:
-            conseq_pause += 1
-            conseq_ones = 0
-            conseq_zeros = 0
-            if cur_state == 42: continue
-        elif s > treshold:
-            conseq_ones += 1
-            conseq_zeros = 0
-            conseq_pause = 0
-            if cur_state == 1: continue
-        else:
-            conseq_zeros += 1
-            conseq_ones = 0
-            conseq_pause = 0
-            if cur_state == 0: continue
-
-        if conseq_ones > tolerance:
-            result[cur_index, 0] = cur_state
-            result[cur_index, 1] = pulselen - tolerance
-            cur_index += 1
-            pulselen = tolerance
-            cur_state = 1
-
-        elif conseq_zeros > tolerance:
-            result[cur_index, 0] = cur_state
-            result[cur_index, 1] = pulselen - tolerance
-            cur_index += 1
-            pulselen = tolerance
-            cur_state = 0
-
-        elif conseq_pause > tolerance:
-            result[cur_index, 0] = cur_state
-            result[cur_index, 1] = pulselen - tolerance
-            cur_index += 1
-            pulselen = tolerance
-            cur_state = 42
+    with nogil:
+        for i in range(ns-1):
+            pulselen += 1
+            s = samples[i]
+            if s == NOISE:
+                conseq_pause += 1
+                conseq_ones = 0
+                conseq_zeros = 0
+                if cur_state == 42: continue
+            elif s > treshold:
+                conseq_ones += 1
+                conseq_zeros = 0
+                conseq_pause = 0
+                if cur_state == 1: continue
+            else:
+                conseq_zeros += 1
+                conseq_ones = 0
+                conseq_pause = 0
+                if cur_state == 0: continue
+
+            if conseq_ones > tolerance:
+                result[cur_index, 0] = cur_state
+                result[cur_index, 1] = pulselen - tolerance
+                cur_index += 1
+                pulselen = tolerance
+                cur_state = 1
+
+            elif conseq_zeros > tolerance:
+                result[cur_index, 0] = cur_state
+                result[cur_index, 1] = pulselen - tolerance
+                cur_index += 1
+                pulselen = tolerance
+                cur_state = 0
+
+            elif conseq_pause > tolerance:
+                result[cur_index, 0] = cur_state
+                result[cur_index, 1] = pulselen - tolerance
+                cur_index += 1
+                pulselen = tolerance
+                cur_state = 42
 
     # Letzen anfügen
     cdef unsigned long long len_result = len(result)
@@ -273,6 +340,191 @@ cpdef unsigned long long[:, ::1] grab_pulse_lens(float[::1] samples,
 
     return result[:cur_index]
 
+cpdef unsigned long long[:, ::1] grab_pulse_lens_stream(float[::1] samples, float treshold, unsigned int tolerance,
+                                                        int mod_type, unsigned long long[::1] state):
+    """
+    Grab the pulse lengths of a stream block by block with the same state machine as grab_pulse_lens.
+    Only completed pulses are returned, the pulse at the end of the block is continued in the next block.
+
+    @param state: (initialized, current pulse type, pulse length, consecutive ones, consecutive zeros,
+                   consecutive pause samples), updated in place. Use zeros for the start of a stream.
+    @return: Array of completed pulses (pulse type, length) like grab_pulse_lens
+    """
+    cdef unsigned long long i, ns = len(samples), cur_index = 0
+    cdef float s
+    cdef float NOISE = get_noise_for_mod_type(mod_type)
+    cdef unsigned long long pulselen = state[2], conseq_ones = state[3], conseq_zeros = state[4]
+    cdef unsigned long long conseq_pause = state[5]
+    cdef unsigned long long cur_state = state[1]
+
+    cdef unsigned long long[:, ::1] result = np.empty((ns, 2), dtype=np.uint64, order="C")
+    if ns == 0:
+        return result
+
+    if state[0] == 0:
+        s = samples[0]
+        if s == NOISE:
+            cur_state = 42
+        elif s > treshold:
+            cur_state = 1
+        else:
+            cur_state = 0
+
+    with nogil:
+        for i in range(ns):
+            pulselen += 1
+            s = samples[i]
+            if s == NOISE:
+                conseq_pause += 1
+                conseq_ones = 0
+                conseq_zeros = 0
+                if cur_state == 42: continue
+            elif s > treshold:
+                conseq_ones += 1
+                conseq_zeros = 0
+                conseq_pause = 0
+                if cur_state == 1: continue
+            else:
+                conseq_zeros += 1
+                conseq_ones = 0
+                conseq_pause = 0
+                if cur_state == 0: continue
+
+            if conseq_ones > tolerance or conseq_zeros > tolerance or conseq_pause > tolerance:
+                result[cur_index, 0] = cur_state
+                result[cur_index, 1] = pulselen - tolerance
+                cur_index += 1
+                pulselen = tolerance
+                if conseq_ones > tolerance:
+                    cur_state = 1
+                elif conseq_zeros > tolerance:
+                    cur_state = 0
+                else:
+                    cur_state = 42
+
+    state[0] = 1
+    state[1] = cur_state
+    state[2] = pulselen
+    state[3] = conseq_ones
+    state[4] = conseq_zeros
+    state[5] = conseq_pause
+    return result[:cur_index]
+
+cpdef tuple pulses_to_bits(unsigned long long[:, ::1] ppseq, unsigned long long bit_len, double rel_symbol_len):
+    """
+    Wandelt die Pulslängen aus grab_pulse_lens in Bits um.
+    Die Nachrichten werden hintereinander in flache Arrays geschrieben, Nachricht i liegt in
+    bits[bit_offsets[i]:bit_offsets[i+1]] und positions[pos_offsets[i]:pos_offsets[i+1]].
+
+    @return: Tupel (bits, bit_offsets, positions, pos_offsets, pauses, symbols).
+    bits: int8 Array mit 0, 1 oder 2 für ein Symbol.
+    positions: Sampleposition jedes Bits, gefolgt von den Positionen der Pause.
+    symbols: int64 Array mit einer Zeile (nbits, pulsetype, nsamples, index in bits) je Symbol
+    in der Reihenfolge ihres Auftretens. Der Index ist -1 für Symbole in verworfenen Daten.
+    """
+    cdef long long n = len(ppseq)
+    cdef long long i, k, num_bits, capacity = 0
+    cdef long long start = 0, total_samples = 0, num_samples
+    cdef long long n_bits = 0, n_pos = 0, num_messages = 0, num_symbols = 0, msg_symbols = 0
+    cdef unsigned long long pulse_type
+    cdef int ptype
+    cdef double num_bits_floated, decimal_place
+    cdef double lower_bit_bound = 0.5 - rel_symbol_len
+    cdef double upper_bit_bound = 0.5 + rel_symbol_len
+    cdef bool there_was_data = False
+
+    if n > 0 and bit_len == 0:
+        raise ValueError("Bit length must be greater than zero")
+
+    # Obere Schranke für die Anzahl Bits, lange Pausen erzeugen keine Bits
+    for i in range(n):
+        num_bits = ppseq[i, 1] // bit_len + 1
+        if ppseq[i, 0] != 42 or num_bits <= 10:
+            capacity += num_bits
+
+    cdef np.int8_t[::1] bits = np.empty(capacity, dtype=np.int8)
+    cdef long long[::1] positions = np.empty(capacity + 2 * n + 1, dtype=np.int64)
+    cdef long long[::1] bit_offsets = np.zeros(n + 2, dtype=np.int64)
+    cdef long long[::1] pos_offsets = np.zeros(n + 2, dtype=np.int64)
+    cdef long long[::1] pauses = np.empty(n + 1, dtype=np.int64)
+    cdef long long[:, ::1] symbols = np.empty((n, 4), dtype=np.int64)
+
+    if n > 0 and ppseq[0, 0] == 42:
+        start = 1  # Beginnt mit Pause
+        total_samples = ppseq[0, 1]
+
+    for i in range(start, n):
+        pulse_type = ppseq[i, 0]
+        num_samples = ppseq[i, 1]
+        num_bits_floated = <double>num_samples / bit_len
+        num_bits = <long long>num_bits_floated
+        decimal_place = num_bits_floated - num_bits
+
+        if decimal_place > upper_bit_bound:
+            num_bits += 1
+        elif lower_bit_bound < decimal_place < upper_bit_bound and (pulse_type != 42 or num_bits < 9):
+            ptype = 1 if pulse_type == 1 else 0
+            if not there_was_data:
+                there_was_data = ptype == 1
+
+            symbols[num_symbols, 0] = num_bits
+            symbols[num_symbols, 1] = ptype
+            symbols[num_symbols, 2] = num_samples
+            symbols[num_symbols, 3] = n_bits
+            num_symbols += 1
+
+            bits[n_bits] = 2
+            positions[n_pos] = total_samples
+            n_bits += 1
+            n_pos += 1
+            total_samples += num_samples
+            continue
+
+        if pulse_type == 42 and num_bits >= 9:
+            if not there_was_data:
+                # Pause ignorieren, wenn vorher keine Informationen übertragen wurden
+                n_bits = bit_offsets[num_messages]
+                n_pos = pos_offsets[num_messages]
+                for k in range(msg_symbols, num_symbols):
+                    symbols[k, 3] = -1
+                msg_symbols = num_symbols
+            else:
+                positions[n_pos] = total_samples
+                positions[n_pos + 1] = total_samples + num_samples
+                n_pos += 2
+                pauses[num_messages] = num_samples
+                num_messages += 1
+                bit_offsets[num_messages] = n_bits
+                pos_offsets[num_messages] = n_pos
+                msg_symbols = num_symbols
+                there_was_data = False
+        else:
+            if pulse_type == 1 and not there_was_data:
+                there_was_data = num_bits > 0
+
+            for k in range(num_bits):
+                bits[n_bits] = 1 if pulse_type == 1 else 0
+                positions[n_pos] = total_samples + k * bit_len
+                n_bits += 1
+                n_pos += 1
+
+        total_samples += num_samples
+
+    if there_was_data:
+        positions[n_pos] = total_samples
+        n_pos += 1
+        pauses[num_messages] = ppseq[n - 1, 1] if ppseq[n - 1, 0] == 42 else 0
+        num_messages += 1
+        bit_offsets[num_messages] = n_bits
+        pos_offsets[num_messages] = n_pos
+    else:
+        for k in range(msg_symbols, num_symbols):
+            symbols[k, 3] = -1
+
+    return (np.asarray(bits[:bit_offsets[num_messages]]), np.asarray(bit_offsets[:num_messages + 1]),
+            np.asarray(positions[:pos_offsets[num_messages]]), np.asarray(pos_offsets[:num_messages + 1]),
+            np.asarray(pauses[:num_messages]), np.asarray(symbols[:num_symbols]))
+
 cdef class Symbol:
     cdef public str name
     cdef public int nbits
@@ -369,11 +621,12 @@ cpdef float estimate_qad_center(float[::1] samples, unsigned int num_centers):
 
 
 
-    for i in range(0, nsamples):
-        sample = samples[i]
-        center_index = find_nearest_center(sample, centers, num_centers)
-        clusters[center_index].sum += sample
-        clusters[center_index].nitems += 1
+    with nogil:
+        for i in range(0, nsamples):
+            sample = samples[i]
+            center_index = find_nearest_center(sample, centers, num_centers)
+            clusters[center_index].sum += sample
+            clusters[center_index].nitems += 1
 
     cdef unsigned long long[::1] cluster_lens = np.array([clusters[i].nitems for i in range(num_centers)], dtype=np.uint64)
     cdef np.ndarray[np.int64_t, ndim=1] sorted_indexes = np.argsort(cluster_lens)
@@ -62,3 +62,76 @@ cpdef str longest_common_substring(str s1, str s2):
             else:
                 m[x, y] = 0
     return s1[x_longest - longest: x_longest]
+
+
+cpdef tuple decode_edge(np.uint8_t[::1] inpt):
+    """
+    Edge decoding: every bit is given by the second bit of an edge,
+    equal neighbours are skipped and counted as errors
+
+    :return: decoded bits, number of errors
+    """
+    cdef long long i = 1, k = 0, errors = 0, n = len(inpt)
+    cdef np.uint8_t[::1] output = np.empty(n // 2 + 1, dtype=np.uint8)
+
+    while i < n:
+        if inpt[i] == inpt[i - 1]:
+            errors += 1
+            i += 1
+            continue
+        output[k] = inpt[i]
+        k += 1
+        i += 2
+
+    return np.asarray(output[:k]), errors
+
+
+cpdef tuple substitute(np.uint8_t[::1] inpt, np.uint8_t[::1] src, long long[::1] src_offsets,
+                       np.uint8_t[::1] dst, long long[::1] dst_offsets):
+    """
+    Replace the bit sequences of src with the corresponding sequences of dst.
+    Item j of src is src[src_offsets[j]:src_offsets[j+1]], the same holds for dst.
+    The input is scanned in steps of the size of the first src item, positions without a
+    matching src item are skipped bitwise and counted as errors.
+
+    :return: substituted bits, number of errors
+    """
+    cdef long long n = len(inpt), num_items = len(src_offsets) - 1
+    cdef long long item_size = src_offsets[1] - src_offsets[0]
+    cdef long long i = 0, j, k, pos = 0, errors = 0, max_dst = 0
+    cdef long long window, start, count, match = 0
+    cdef bool equal
+
+    for j in range(num_items):
+        max_dst = max(max_dst, dst_offsets[j + 1] - dst_offsets[j])
+
+    cdef np.uint8_t[::1] output = np.empty((n // item_size + 1) * max_dst, dtype=np.uint8)
+
+    while i < n:
+        window = min(item_size, n - i)
+        count = 0
+        for j in range(num_items):
+            start = src_offsets[j]
+            if src_offsets[j + 1] - start != window:
+                continue
+            equal = True
+            for k in range(window):
+                if inpt[i + k] != src[start + k]:
+                    equal = False
+                    break
+            if equal:
+                if count == 0:
+                    match = j
+                count += 1
+
+        if count == 1:
+            for k in range(dst_offsets[match], dst_offsets[match + 1]):
+                output[pos] = dst[k]
+                pos += 1
+        elif count < 1:
+            i += 1
+            errors += 1
+            continue
+        i += item_size
+
+    return np.asarray(output[:pos]), errors
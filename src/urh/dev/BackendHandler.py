@@ -76,15 +76,20 @@ class BackendHandler(object):
     """
     DEVICE_NAMES = ("Bladerf", "HackRF", "USRP", "RTL-SDR", "FUNcube-Dongle")
 
-    def __init__(self, testing_mode=False):
+    def __init__(self, testing_mode=False, gnuradio_probed=None):
+        """
+
+        :param gnuradio_probed: result of :meth:`probe_gnuradio` if it already ran, otherwise the probe runs here
+        :type gnuradio_probed: bool or None
+        """
         self.testing_mode = testing_mode  # Ensure we get some device backends for unit tests
 
-        self.python2_exe = constants.SETTINGS.value('python2_exe', self.__get_python2_interpreter())
+        self.python2_exe = self.read_python2_exe()
         self.gnuradio_install_dir = constants.SETTINGS.value('gnuradio_install_dir', "")
         self.use_gnuradio_install_dir = constants.SETTINGS.value('use_gnuradio_install_dir', os.name == "nt", bool)
 
         self.gnuradio_installed = False
-        self.set_gnuradio_installed_status()
+        self.set_gnuradio_installed_status(gnuradio_probed)
 
         if self.testing_mode:
             self.gnuradio_installed = True
@@ -115,7 +120,24 @@ class BackendHandler(object):
         except ImportError:
             return False
 
-    def set_gnuradio_installed_status(self):
+    @staticmethod
+    def read_python2_exe() -> str:
+        return constants.SETTINGS.value('python2_exe', BackendHandler.__get_python2_interpreter())
+
+    @staticmethod
+    def probe_gnuradio(python2_exe: str) -> bool:
+        """
+        Check in a subprocess if gnuradio can be imported with the given python2 interpreter.
+        This does not touch the settings, so it may run outside the GUI thread.
+
+        :rtype: bool
+        """
+        if os.path.isfile(python2_exe) and os.access(python2_exe, os.X_OK):
+            return call([python2_exe, "-c", "import gnuradio"], stderr=DEVNULL) == 0
+        else:
+            return False
+
+    def set_gnuradio_installed_status(self, gnuradio_probed=None):
         if self.use_gnuradio_install_dir:
             # We are probably on windows with a bundled gnuradio installation
             bin_dir = os.path.join(self.gnuradio_install_dir, "bin")
@@ -130,7 +152,9 @@ class BackendHandler(object):
         else:
             # we are on a nice unix with gnuradio installed to default python path
             if os.path.isfile(self.python2_exe) and os.access(self.python2_exe, os.X_OK):
-                self.gnuradio_installed = call([self.python2_exe, "-c", "import gnuradio"], stderr=DEVNULL) == 0
+                if gnuradio_probed is None:
+                    gnuradio_probed = self.probe_gnuradio(self.python2_exe)
+                self.gnuradio_installed = gnuradio_probed
                 constants.SETTINGS.setValue("python2_exe", self.python2_exe)
             else:
                 self.gnuradio_installed = False
@@ -172,7 +196,8 @@ class BackendHandler(object):
                 container.is_enabled = True
             self.device_backends[device_name.lower()] = container
 
-    def __get_python2_interpreter(self):
+    @staticmethod
+    def __get_python2_interpreter():
         paths = os.get_exec_path()
 
         for p in paths:
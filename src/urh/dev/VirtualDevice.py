@@ -10,6 +10,7 @@ from urh.dev.gr.SenderThread import SenderThread
 from urh.dev.gr.SpectrumThread import SpectrumThread
 from urh.plugins.NetworkSDRInterface.NetworkSDRInterfacePlugin import NetworkSDRInterfacePlugin
 from urh.util.Logger import logger
+from urh.util.RingBuffer import RingBuffer
 
 
 class Mode(Enum):
@@ -73,6 +74,10 @@ class VirtualDevice(QObject):
                     self.__dev = HackRF(bw, freq, gain, samp_rate, is_ringbuffer=is_ringbuffer)
                 else:
                     raise NotImplementedError("Native Backend for {0} not yet implemented".format(name))
+
+                if self.mode == Mode.receive and is_ringbuffer:
+                    # Live sniffing reads from the ring while receiving, so give it some slack
+                    self.__dev.receive_buffer_size = RingBuffer.DEFAULT_SIZE
             else:
                 raise ValueError("Unknown device name {0}".format(name))
             self.__dev.device_ip = device_ip
@@ -220,10 +225,18 @@ class VirtualDevice(QObject):
 
     def free_data(self):
         if self.backend == Backends.grc:
-            del self.__dev.data
+            if isinstance(self.__dev.data, RingBuffer):
+                self.__dev.data.close()
+                self.__dev.data = None
+            else:
+                del self.__dev.data
         elif self.backend == Backends.native:
+            # The worker of the send buffer references the samples
+            self.__dev.close_send_buffer()
             del self.__dev.samples_to_send
-            del self.__dev.receive_buffer
+            if self.__dev.receive_buffer is not None:
+                self.__dev.receive_buffer.close()
+            self.__dev.receive_buffer = None
         elif self.backend == Backends.network:
             self.__dev.free_data()
         elif self.backend == Backends.none:
@@ -322,7 +335,7 @@ class VirtualDevice(QObject):
             if self.backend == Backends.grc:
                 return self.__dev.x, self.__dev.y
             elif self.backend == Backends.native:
-                w = np.abs(np.fft.fft(self.__dev.receive_buffer))
+                w = np.abs(np.fft.fft(self.__dev.receive_buffer.data))  # magnitude does not depend on ring order
                 freqs = np.fft.fftfreq(len(w), 1 / self.sample_rate)
                 idx = np.argsort(freqs)
                 return freqs[idx].astype(np.float32), w[idx].astype(np.float32)
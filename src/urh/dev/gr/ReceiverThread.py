@@ -1,12 +1,12 @@
 import socket
 
 import numpy as np
-import psutil
 import time
 from PyQt5.QtCore import pyqtSignal
 
 from urh.dev.gr.AbstractBaseThread import AbstractBaseThread
 from urh.util.Logger import logger
+from urh.util.RingBuffer import RingBuffer
 
 
 class ReceiverThread(AbstractBaseThread):
@@ -18,12 +18,26 @@ class ReceiverThread(AbstractBaseThread):
         super().__init__(sample_rate, freq, gain, bandwidth, True, ip, parent)
 
         self.is_ringbuffer = is_ringbuffer  # Ringbuffer for Live Sniffing
-        self.data = None
+        self.spill_filename = ""  # File for recorded samples, empty = temporary file
+        self.data = None  # type: RingBuffer
 
     def init_recv_buffer(self):
-        # Take 60% of free memory
-        nsamples = int(0.6 * (psutil.virtual_memory().free / 8))
-        self.data = np.zeros(nsamples, dtype=np.complex64)
+        if self.is_ringbuffer:
+            self.data = RingBuffer(RingBuffer.DEFAULT_SIZE)
+        else:
+            # Recorded samples are streamed to disk, the ring only holds the latest samples
+            self.data = RingBuffer(RingBuffer.DEFAULT_SIZE, spill_filename=self.spill_filename)
+
+    @property
+    def current_index(self) -> int:
+        data = getattr(self, "data", None)  # base class sets the index before the buffer exists
+        return len(data) if data is not None else 0
+
+    @current_index.setter
+    def current_index(self, value: int):
+        data = getattr(self, "data", None)
+        if value == 0 and data is not None:
+            data.clear()
 
     def run(self):
         if self.data is None:
@@ -55,20 +69,12 @@ class ReceiverThread(AbstractBaseThread):
             try:
                 tmp = np.fromstring(rcvd, dtype=np.complex64)
 
-                len_tmp = len(tmp)
-                if self.current_index + len_tmp >= len(self.data):
-                    if self.is_ringbuffer:
-                        self.current_index = 0
-                        if len_tmp >= len(self.data):
-                            self.stop("Receiving buffer too small.")
-                    else:
-                        self.stop("Receiving Buffer is full.")
-                        return
-                self.data[self.current_index:self.current_index + len_tmp] = tmp
-                self.current_index += len_tmp
-                self.index_changed.emit(self.current_index - len_tmp,
-                                        self.current_index)
+                old_index, new_index = self.data.push(tmp)
+                self.index_changed.emit(old_index, new_index)
 
                 rcvd = b""
             except ValueError:
                 self.stop("Could not receive data. Is your Hardware ok?")
+            except OSError as e:
+                self.stop("Could not write received samples: {0}".format(e))
+                return
@@ -5,6 +5,7 @@ import numpy
 import numpy as np
 
 from urh.dev.gr.AbstractBaseThread import AbstractBaseThread
+from urh.util.SendBuffer import SendBuffer
 
 
 class SenderThread(AbstractBaseThread):
@@ -49,36 +50,38 @@ class SenderThread(AbstractBaseThread):
         self.initalize_process()
         len_data = len(self.data)
         self.current_iteration = self.current_iteration if self.current_iteration is not None else 0
+        first_iteration = self.current_iteration
+        repeats = -1 if self.repeat_endless else max(0, self.max_repeats - first_iteration)
+
+        # Samples are copied chunkwise into reusable buffers while sending
+        send_buffer = SendBuffer(self.data, repeats=repeats, start=self.current_index,
+                                 num_samples=self.samples_per_transmission)
+        num_bytes = self.samples_per_transmission * send_buffer.bytes_per_sample
         self.connection, addr = self.socket.accept()
-        while self.current_index < len_data and not self.isInterruptionRequested():
+        while not send_buffer.finished and not self.isInterruptionRequested():
             try:
                 _, outputready, _ = select.select([], [self.connection], [])
             except select.error:
+                send_buffer.stop()
                 self.current_index = 0
                 self.stop("There was an error in select.")
                 break
 
             if self.connection in outputready:
                 try:
-                    # tostring() is a compatibility (numpy < 1.9) alias for tobytes().
-                    # Despite its name it returns bytes not strings.
-                    self.connection.send(
-                        self.data[self.current_index:self.current_index + self.samples_per_transmission].tostring())
+                    self.connection.sendall(send_buffer.read(num_bytes))
                 except OSError:
+                    send_buffer.stop()
                     self.current_index = 0
                     # Pipe is broken, restart Thread with new Port
                     self.sender_needs_restart.emit()
                     # self.stop("Could not send data: " + str(e))
                     return
 
-                self.current_index += self.samples_per_transmission
-
-            if self.current_index >= len_data:
-                self.current_iteration += 1
-
-                if self.repeat_endless or self.current_iteration < self.max_repeats:
-                    self.current_index = 0
+                self.current_index = send_buffer.current_sample
+                self.current_iteration = first_iteration + send_buffer.current_repeat
 
+        send_buffer.stop()
         self.current_index = len_data - 1
         self.current_iteration = None
         self.stop("FIN - All data was sent successfully")
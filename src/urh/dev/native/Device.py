@@ -1,20 +1,21 @@
-import io
 import threading
-from multiprocessing import Queue
+from collections import deque
 
 import numpy as np
 from abc import abstractmethod
 
 import time
 
-import psutil
 from PyQt5.QtCore import QObject, pyqtSignal
 
 from urh.util.Formatter import Formatter
 from urh.util.Logger import logger
+from urh.util.RingBuffer import RingBuffer
+from urh.util.SendBuffer import SendBuffer
 
 class Device(QObject):
     BYTES_PER_SAMPLE = None
+    MAX_QUEUED_BUFFERS = 256  # received buffers waiting for conversion, older buffers are dropped
     rcv_index_changed = pyqtSignal(int, int)
 
     def __init__(self, bw, freq, gain, srate, is_ringbuffer=False):
@@ -36,23 +37,26 @@ class Device(QObject):
         self.error_codes = {}
         self.errors = set()
 
-        self.queue = Queue()
-        self.send_buffer = None
-        self.send_buffer_reader = None
+        # Handoff of received buffers from the device callback to the conversion thread
+        self.receive_queue = deque()
+        self.receive_condition = threading.Condition()
+        self.skipped_samples = 0
+        self.send_buffer = None  # type: SendBuffer
 
         self.samples_to_send = np.array([], dtype=np.complex64)
         self.sending_repeats = 1 # How often shall the sending sequence be repeated? -1 = forever
         self.current_sending_repeat = 0
 
         self.is_ringbuffer = is_ringbuffer  # Ringbuffer for Spectrum Analyzer or Protocol Sniffing
-        self.current_recv_index = 0
+        self.receive_buffer_size = None  # None = default size
+        self.spill_filename = ""  # File for recorded samples, empty = temporary file
         self.current_sent_sample = 0
         self.is_receiving = False
         self.is_transmitting = False
 
         self.device_ip = "192.168.10.2" # For USRP
 
-        self.receive_buffer = None
+        self.receive_buffer = None  # type: RingBuffer
 
         self.spectrum_x = None
         self.spectrum_y = None
@@ -70,12 +74,22 @@ class Device(QObject):
     def init_recv_buffer(self):
         if self.receive_buffer is None:
             if self.is_ringbuffer:
-                nsamples = 10**5
+                nsamples = 10**5 if self.receive_buffer_size is None else self.receive_buffer_size
+                self.receive_buffer = RingBuffer(nsamples)
             else:
-                # Take 60% of avail memory
-                nsamples = 0.6*(psutil.virtual_memory().free / 8)
-            self.receive_buffer = np.zeros(int(nsamples), dtype=np.complex64, order='C')
-            logger.info("Initialized receiving buffer with size {0:.2f}MB".format(self.receive_buffer.nbytes / (1024 * 1024)))
+                # Recorded samples are streamed to disk, the ring only holds the latest samples
+                nsamples = RingBuffer.DEFAULT_SIZE if self.receive_buffer_size is None else self.receive_buffer_size
+                self.receive_buffer = RingBuffer(nsamples, spill_filename=self.spill_filename)
+            logger.info("Initialized receiving buffer with size {0:.2f}MB".format(self.receive_buffer.data.nbytes / (1024 * 1024)))
+
+    @property
+    def current_recv_index(self) -> int:
+        return len(self.receive_buffer) if self.receive_buffer is not None else 0
+
+    @current_recv_index.setter
+    def current_recv_index(self, value: int):
+        if value == 0 and self.receive_buffer is not None:
+            self.receive_buffer.clear()
 
     def log_retcode(self, retcode: int, action: str, msg=""):
         msg = str(msg)
@@ -95,7 +109,7 @@ class Device(QObject):
 
     @property
     def received_data(self):
-        return self.receive_buffer[:self.current_recv_index]
+        return self.receive_buffer[:]
 
     @property
     def sent_data(self):
@@ -221,7 +235,12 @@ class Device(QObject):
         pass
 
     @staticmethod
-    def unpack_complex(buffer, nvalues):
+    def unpack_complex(buffer, nvalues: int, out: np.ndarray = None):
+        """
+        Convert raw IQ data of the device to complex64
+
+        :param out: Contiguous complex64 array with nvalues elements to write the result to
+        """
         pass
 
     @staticmethod
@@ -236,35 +255,41 @@ class Device(QObject):
 
     def read_receiving_queue(self):
         while self.is_receiving:
-            try:
-                while not self.queue.empty():
-                    byte_buffer = self.queue.get()
-
-                    nsamples = len(byte_buffer) // self.BYTES_PER_SAMPLE
-                    if nsamples > 0:
-                        if self.current_recv_index + nsamples >= len(self.receive_buffer):
-                            if self.is_ringbuffer:
-                                self.current_recv_index = 0
-                                if nsamples >= len(self.receive_buffer):
-                                    logger.warning("Receive buffer too small, skipping {0:d} samples".format(nsamples-len(self.receive_buffer)))
-                                    nsamples = len(self.receive_buffer) - 1
-
-                            else:
-                                self.stop_rx_mode("Receiving buffer is full {0}/{1}".format(self.current_recv_index + nsamples, len(self.receive_buffer)))
-                                return
-
-                        end = nsamples*self.BYTES_PER_SAMPLE
-                        self.receive_buffer[self.current_recv_index:self.current_recv_index + nsamples] = \
-                            self.unpack_complex(byte_buffer[:end], nsamples)
-
-                        old_index = self.current_recv_index
-                        self.current_recv_index += nsamples
-
-                        self.rcv_index_changed.emit(old_index, self.current_recv_index)
-            except BrokenPipeError:
-                pass
+            with self.receive_condition:
+                if not self.receive_queue:
+                    self.receive_condition.wait(0.1)
+                byte_buffers = list(self.receive_queue)
+                self.receive_queue.clear()
 
-            time.sleep(0.01)
+            for byte_buffer in byte_buffers:
+                try:
+                    old_index, new_index = self.__convert_to_receive_buffer(byte_buffer)
+                except OSError as e:
+                    self.stop_rx_mode("Could not write received samples: {0}".format(e))
+                    return
+
+                if new_index > old_index:
+                    self.rcv_index_changed.emit(old_index, new_index)
+
+    def __convert_to_receive_buffer(self, byte_buffer):
+        """
+        Convert the raw IQ data of the device directly into the receive buffer
+
+        :return: positions (old, new) of the received samples in the stream
+        """
+        nsamples = len(byte_buffer) // self.BYTES_PER_SAMPLE
+        if nsamples == 0:
+            return self.current_recv_index, self.current_recv_index
+
+        if nsamples > self.receive_buffer.size:
+            return self.receive_buffer.push(self.unpack_complex(byte_buffer, nsamples))
+
+        pos = 0
+        for view in self.receive_buffer.write_views(nsamples):
+            end = pos + len(view)
+            self.unpack_complex(byte_buffer[pos * self.BYTES_PER_SAMPLE:end * self.BYTES_PER_SAMPLE], len(view), view)
+            pos = end
+        return self.receive_buffer.commit(nsamples)
 
     def init_send_parameters(self, samples_to_send: np.ndarray = None, repeats: int = None,
                              skip_device_parameters=False, resume=False):
@@ -272,70 +297,66 @@ class Device(QObject):
             self.set_device_parameters()
 
         if samples_to_send is not None:
-            try:
-                self.send_buffer_reader.close()
-                self.send_buffer.close()
-            except AttributeError:
-                pass
-
             self.samples_to_send = samples_to_send
 
-        if self.send_buffer is None or self.send_buffer.closed:
-            self.send_buffer = io.BytesIO(self.pack_complex(self.samples_to_send))
-            self.send_buffer_reader = io.BufferedReader(self.send_buffer)
-        elif not resume:
-            self.reset_send_buffer()
+        if not resume:
+            self.current_sent_sample = 0
             self.current_sending_repeat = 0
 
         if repeats is not None:
             self.sending_repeats = repeats
 
-    def reset_send_buffer(self):
-        try:
-            self.send_buffer_reader.seek(0)
-            self.current_sent_sample = 0
-        except ValueError:
-            logger.info("Send buffer was already closed. Cant reset it.")
+        # A buffer of old parameters is outdated, the next start_tx_mode opens a new one
+        self.close_send_buffer()
 
-    def check_send_buffer(self):
-        def sending_iteration_remaining(current_sending_repeat: int, sending_repeats: int):
-            return current_sending_repeat < sending_repeats or sending_repeats == -1 # sending_repeats -1 = forever
+    def open_send_buffer(self):
+        """
+        Start packing the samples to send on the fly, called when transmission starts.
+        The buffer runs a worker thread, so it must be closed with close_send_buffer, when sending is over.
 
-        assert len(self.samples_to_send) == len(self.send_buffer_reader.read()) // self.BYTES_PER_SAMPLE
-        self.send_buffer.seek(self.current_sent_sample * self.BYTES_PER_SAMPLE)
+        """
+        self.close_send_buffer()
+        remaining_repeats = -1 if self.sending_repeats == -1 else max(0, self.sending_repeats - self.current_sending_repeat)
+        self.send_buffer = SendBuffer(self.samples_to_send, self.pack_complex, self.BYTES_PER_SAMPLE,
+                                      repeats=remaining_repeats, start=self.current_sent_sample)
 
-        while sending_iteration_remaining(self.current_sending_repeat, self.sending_repeats) and self.is_transmitting:
-            while self.is_transmitting and self.send_buffer_reader.peek():
-                try:
-                    self.current_sent_sample = self.send_buffer_reader.tell() // self.BYTES_PER_SAMPLE
-                except ValueError:
-                    # I/O operation on closed file. --> Buffer was closed
-                    break
-                time.sleep(0.01)
+    def close_send_buffer(self):
+        if self.send_buffer is not None:
+            self.send_buffer.stop()
+            self.send_buffer = None
 
-            self.current_sending_repeat += 1
+    def check_send_buffer(self):
+        send_buffer = self.send_buffer
+        first_repeat = self.current_sending_repeat
 
-            if sending_iteration_remaining(self.current_sending_repeat, self.sending_repeats):
-                self.reset_send_buffer()
+        while self.is_transmitting and not send_buffer.finished:
+            self.current_sent_sample = send_buffer.current_sample
+            self.current_sending_repeat = first_repeat + send_buffer.current_repeat
+            time.sleep(0.01)
+
+        self.current_sent_sample = send_buffer.current_sample
+        self.current_sending_repeat = first_repeat + send_buffer.current_repeat
 
         if self.current_sent_sample >= len(self.samples_to_send) - 1:
             self.current_sent_sample = len(self.samples_to_send)  # Mark transmission as finished
+            self.current_sending_repeat += 1
         else:
             logger.info("Skipped {0:d} samples in sending".format(len(self.samples_to_send) - self.current_sent_sample))
 
-
     def callback_recv(self, buffer):
-        try:
-            self.queue.put(buffer)
-        except BrokenPipeError:
-            pass
+        with self.receive_condition:
+            if len(self.receive_queue) >= self.MAX_QUEUED_BUFFERS:
+                # Conversion can not keep up, drop the oldest buffer instead of growing without bound
+                skipped = self.receive_queue.popleft()
+                self.skipped_samples += len(skipped) // self.BYTES_PER_SAMPLE
+                logger.warning("Receive queue full, skipped {0:d} samples".format(self.skipped_samples))
+            self.receive_queue.append(buffer)
+            self.receive_condition.notify()
         return 0
 
     def callback_send(self, buffer_length):
-        try:
-            return self.send_buffer_reader.read(buffer_length)
-        except BrokenPipeError:
-            return b""
-        except ValueError:
-            logger.info("Receiving Thread was closed. Callback cant read queue.")
+        send_buffer = self.send_buffer
+        if send_buffer is None:
+            logger.info("Send buffer was closed. Callback cant read from it.")
             return b""
+        return send_buffer.read(buffer_length)
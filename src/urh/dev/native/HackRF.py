@@ -109,6 +109,7 @@ class HackRF(Device):
     def start_tx_mode(self, samples_to_send: np.ndarray = None, repeats=None, resume=False):
         if self.is_open:
             self.init_send_parameters(samples_to_send, repeats, resume=resume)
+            self.open_send_buffer()
             retcode = hackrf.start_tx_mode(self.callback_send)
 
             if retcode == self.success:
@@ -116,17 +117,14 @@ class HackRF(Device):
                 self._start_sendbuffer_thread()
             else:
                 self.is_transmitting = False
+                self.close_send_buffer()
         else:
             retcode = self.error_not_open
         self.log_retcode(retcode, "start_tx_mode")
 
     def stop_tx_mode(self, msg):
         self.is_transmitting = False
-        try:
-            self.send_buffer_reader.close()
-            self.send_buffer.close()
-        except AttributeError:
-            logger.warning("HackRF: Could not close send buffer, because it was not open yet")
+        self.close_send_buffer()
 
         if self.is_open:
             logger.info("stopping HackRF tx mode ({0})".format(msg))
@@ -162,11 +160,14 @@ class HackRF(Device):
         self.log_retcode(retcode, "set_sample_rate", sample_rate)
 
     @staticmethod
-    def unpack_complex(buffer, nvalues: int):
-        result = np.empty(nvalues, dtype=np.complex64)
-        unpacked = np.frombuffer(buffer, dtype=[('r', np.int8), ('i', np.int8)])
-        result.real = (unpacked['r'] + 0.5) / 127.5
-        result.imag = (unpacked['i'] + 0.5) / 127.5
+    def unpack_complex(buffer, nvalues: int, out: np.ndarray = None):
+        result = np.empty(nvalues, dtype=np.complex64) if out is None else out
+        # Interleaved I and Q map directly to the interleaved float32 view of the complex result,
+        # converting in place avoids temporary arrays
+        values = result.view(np.float32)
+        values[:] = np.frombuffer(buffer, dtype=np.int8, count=2 * nvalues)
+        values += np.float32(0.5)
+        values /= np.float32(127.5)
         return result
 
     @staticmethod
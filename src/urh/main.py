@@ -25,9 +25,8 @@ def main():
 
             import generate_ui
 
-            generate_ui.gen()
-
-            print("Time for generating UI: %.2f seconds" % (time.time() - t), file=sys.stderr)
+            if generate_ui.gen() > 0:
+                print("Time for generating UI: %.2f seconds" % (time.time() - t), file=sys.stderr)
         except (ImportError, FileNotFoundError):
             print("Will not regenerate UI, because script cant be found. This is okay in "
                   "release.", file=sys.stderr)
@@ -77,6 +76,8 @@ def main():
         QApplication.setStyle(QStyleFactory.create("Fusion"))
 
     main_window = MainController()
+    main_window.first_painted.connect(
+        lambda: print("Time to first window: %.2f seconds" % (time.time() - t), file=sys.stderr))
 
     if sys.platform == "darwin":
         menu_bar = main_window.menuBar()
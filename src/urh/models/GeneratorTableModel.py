@@ -4,7 +4,8 @@ from PyQt5.QtGui import QColor, QFont
 from urh import constants
 from urh.models.ProtocolTreeItem import ProtocolTreeItem
 from urh.models.TableModel import TableModel
-from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer
+from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer, FuzzedMessages, \
+    FuzzedMessageStrings
 from urh.signalprocessing.encoder import Encoder
 from urh.ui.actions.Clear import Clear
 from urh.ui.actions.DeleteBitsAndPauses import DeleteBitsAndPauses
@@ -27,21 +28,30 @@ class GeneratorTableModel(TableModel):
         self.decode = False
         self.is_generator = True
 
-    def refresh_fonts(self):
-        self.bold_fonts.clear()
-        self.text_colors.clear()
-        pac = self.protocol
-        assert isinstance(pac, ProtocolAnalyzerContainer)
-        for i, message in enumerate(pac.messages):
-            if message.fuzz_created:
-                for lbl in (lbl for lbl in message.message_type if lbl.fuzz_created):
-                    for j in range(*message.get_label_range(lbl=lbl, view=self.proto_view, decode=False)):
-                        self.bold_fonts[i, j] = True
-
-            for lbl in message.active_fuzzing_labels:
-                for j in range(*message.get_label_range(lbl=lbl, view=self.proto_view, decode=False)):
-                    self.bold_fonts[i, j] = True
-                    self.text_colors[i, j] = QColor("orange")
+    def message(self, row: int):
+        # Fuzzed messages are only created for the displayed rows, without keeping them
+        if isinstance(self.protocol.messages, FuzzedMessages):
+            return self.protocol.messages.peek(row)
+        return super().message(row)
+
+    def max_row_length(self) -> int:
+        if isinstance(self.display_data, FuzzedMessageStrings):
+            return self.display_data.max_length()
+        return super().max_row_length()
+
+    def is_bold(self, row: int, column: int) -> bool:
+        try:
+            fuzz_created = self.message(row).fuzz_created
+        except IndexError:
+            return False
+
+        return any(start <= column < end for start, end, lbl in self.label_ranges(row)
+                   if lbl.active_fuzzing or (fuzz_created and lbl.fuzz_created))
+
+    def text_color(self, row: int, column: int):
+        if any(start <= column < end for start, end, lbl in self.label_ranges(row) if lbl.active_fuzzing):
+            return QColor("orange")
+        return None
 
     def delete_range(self, msg_start: int, msg_end: int, index_start: int, index_end: int):
         if msg_start > msg_end:
@@ -38,25 +38,22 @@ class ProtocolTableModel(TableModel):
     def addProtoLabel(self, start, end, messagenr):
         self.controller.add_protocol_label(start=start, end=end, messagenr=messagenr, proto_view=self.proto_view)
 
-    def refresh_fonts(self):
-        self.bold_fonts.clear()
-        self.text_colors.clear()
-        for i in self._diffs.keys():
-            for j in self._diffs[i]:
-                self.bold_fonts[i, j] = True
-                self.text_colors[i, j] = constants.DIFFERENCE_CELL_COLOR
-
-        if self._refindex >= 0:
-            for j in range(self.col_count):
-                self.text_colors[self._refindex, j] = constants.SELECTED_ROW_COLOR
+    def is_bold(self, row: int, column: int) -> bool:
+        return column in self._diffs.get(row, ())
+
+    def text_color(self, row: int, column: int):
+        if row == self._refindex and column < self.col_count:
+            return constants.SELECTED_ROW_COLOR
+        elif column in self._diffs.get(row, ()):
+            return constants.DIFFERENCE_CELL_COLOR
+        return None
 
     def delete_range(self, min_row: int, max_row: int, start: int, end: int):
         if not self.is_writeable:
             return
 
         del_action = DeleteBitsAndPauses(proto_analyzer=self.protocol, start_message=min_row, end_message=max_row,
-                                         start=start, end=end, view=self.proto_view, decoded=True,
-                                         subprotos=self.controller.protocol_list)
+                                         start=start, end=end, view=self.proto_view, decoded=True)
         self.undo_stack.push(del_action)
 
     def flags(self, index: QModelIndex):
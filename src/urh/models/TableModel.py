@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 import numpy
 from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
@@ -7,9 +7,12 @@ from PyQt5.QtWidgets import QUndoStack, QMessageBox
 
 from urh import constants
 from urh.cythonext.signalFunctions import Symbol
+from urh.util.SearchIndex import SearchIndex
 
 
 class TableModel(QAbstractTableModel):
+    MAX_CACHED_ROWS = 1024  # rows with cached label ranges
+
     def __init__(self, participants, parent=None):
         super().__init__(parent)
         self.controller = None
@@ -24,6 +27,8 @@ class TableModel(QAbstractTableModel):
 
         self.search_results = []
         self.search_value = ""
+        self.search_indices = defaultdict(SearchIndex)
+        """:type: dict[int, SearchIndex] """
         self._proto_view = 0
         self._refindex = -1
 
@@ -37,12 +42,8 @@ class TableModel(QAbstractTableModel):
         self.symbols = {}
         """:type: dict[str, Symbol] """
 
-        self.background_colors = defaultdict(lambda: None)
-        self.bold_fonts = defaultdict(lambda: False)
-        self.text_colors = defaultdict(lambda: None)
-        self.tooltips = defaultdict(lambda: None)
-        self.vertical_header_text = defaultdict(lambda: None)
-        self.vertical_header_colors = defaultdict(lambda: None)
+        self.__label_ranges = OrderedDict()
+        """:type: dict[int, list[(int, int, ProtocolLabel)]] """
 
         self._diffs = defaultdict(set)
         """:type: dict[int, set[int]] """
@@ -58,7 +59,7 @@ class TableModel(QAbstractTableModel):
     @participants.setter
     def participants(self, value):
         self.__participants = value
-        for msg in self.protocol.messages:
+        for msg in self.protocol.stored_messages:
             if msg.participant not in self.__participants:
                 msg.participant = None
 
@@ -77,11 +78,11 @@ class TableModel(QAbstractTableModel):
     def headerData(self, section: int, orientation, role=Qt.DisplayRole):
         if orientation == Qt.Vertical:
             if role == Qt.DisplayRole:
-                return self.vertical_header_text[section]
+                return self.vertical_header(section)[0]
             elif role == Qt.BackgroundColorRole:
-                return self.vertical_header_colors[section]
+                return self.vertical_header(section)[1]
             elif role == Qt.TextColorRole:
-                color = self.vertical_header_colors[section]
+                color = self.vertical_header(section)[1]
                 if color:
                     red, green, blue  = color.red(), color.green(), color.blue()
                     return QColor("black") if (red * 0.299 + green * 0.587 + blue * 0.114) > 186 else QColor("white")
@@ -114,14 +115,11 @@ class TableModel(QAbstractTableModel):
                 else:
                     self.display_data = self.protocol.plain_ascii_str
 
-            visible_messages = [msg for i, msg in enumerate(self.display_data) if i not in self.hidden_rows]
-            if len(visible_messages) == 0:
-                self.col_count = 0
-            else:
-                self.col_count = numpy.max([len(msg) for msg in visible_messages])
+            self.col_count = self.max_row_length()
 
             if self._refindex >= 0:
-                self._diffs = self.protocol.find_differences(self._refindex, self.proto_view)
+                self._diffs = self.protocol.find_differences(self._refindex, self.proto_view,
+                                                             self.display_data if self.decode else None)
             else:
                 self._diffs.clear()
 
@@ -132,55 +130,114 @@ class TableModel(QAbstractTableModel):
             self.row_count = 0
             self.display_data = None
 
-        # Cache background colors for performance
-        self.refresh_bgcolors_and_tooltips()
-        self.refresh_fonts()  # Will be overriden
+        # Label ranges are resolved lazily in data() for the displayed rows
+        self.__label_ranges.clear()
         self.refresh_vertical_header()
 
         self.beginResetModel()
         self.endResetModel()
         self.locked = False
 
+    def max_row_length(self) -> int:
+        """
+        Length of the longest row of display_data, which is not hidden
+
+        """
+        visible_messages = [msg for i, msg in enumerate(self.display_data) if i not in self.hidden_rows]
+        if len(visible_messages) == 0:
+            return 0
+        return numpy.max([len(msg) for msg in visible_messages])
+
+    def message(self, row: int):
+        """
+        Message displayed in a row
+
+        :rtype: urh.signalprocessing.Message.Message
+        """
+        return self.protocol.messages[row]
+
     def columnCount(self, QModelIndex_parent=None, *args, **kwargs):
         return self.col_count
 
     def rowCount(self, QModelIndex_parent=None, *args, **kwargs):
         return self.row_count
 
-    def refresh_bgcolors_and_tooltips(self):
-        self.background_colors.clear()
-        self.tooltips.clear()
-        label_colors = constants.LABEL_COLORS
+    def label_ranges(self, row: int) -> list:
+        """
+        Column ranges of the labels of a message in the current view.
+        Ranges are calculated on demand and only cached for the recently displayed rows.
 
-        for i, message in enumerate(self.protocol.messages):
-            for lbl in message.message_type:
-                bg_color = label_colors[lbl.color_index]
-                start, end = message.get_label_range(lbl, self.proto_view, self.decode)
-                for j in range(start, end):
-                    self.background_colors[i, j] = bg_color
-                    self.tooltips[i, j] = lbl.name
+        :rtype: list of (int, int, ProtocolLabel)
+        """
+        try:
+            self.__label_ranges.move_to_end(row)
+            return self.__label_ranges[row]
+        except KeyError:
+            pass
+
+        try:
+            message = self.message(row)
+        except IndexError:
+            return []
+
+        if self.proto_view == 0:
+            ranges = [(lbl.start, lbl.end, lbl) for lbl in message.message_type]
+        else:
+            ranges = [message.get_label_range(lbl, self.proto_view, self.decode) + (lbl,)
+                      for lbl in message.message_type]
+
+        self.__label_ranges[row] = ranges
+        if len(self.__label_ranges) > self.MAX_CACHED_ROWS:
+            self.__label_ranges.popitem(last=False)
+
+        return ranges
+
+    def label_at(self, row: int, column: int):
+        """
+        Label covering a cell, the last label wins if labels overlap
 
-    def refresh_fonts(self):
+        :rtype: ProtocolLabel or None
+        """
+        for start, end, lbl in reversed(self.label_ranges(row)):
+            if start <= column < end:
+                return lbl
+        return None
+
+    def is_bold(self, row: int, column: int) -> bool:
         """
         Will be overriden
 
-        :return:
         """
-        pass
+        return False
+
+    def text_color(self, row: int, column: int):
+        """
+        Will be overriden
+
+        :rtype: QColor or None
+        """
+        return None
+
+    def vertical_header(self, row: int) -> tuple:
+        """
+        Text and color of a row header, resolved on demand, so only headers of displayed rows are created
+
+        :rtype: (str, QColor or None)
+        """
+        try:
+            participant = self.message(row).participant
+        except IndexError:
+            participant = None
+
+        if participant:
+            return "{0} ({1})".format(row + 1, participant.shortname), \
+                   constants.PARTICIPANT_COLORS[participant.color_index]
+        else:
+            return str(row + 1), None
 
     def refresh_vertical_header(self):
-        self.vertical_header_colors.clear()
-        self.vertical_header_text.clear()
-        for i in range(self.row_count):
-            try:
-                participant = self.protocol.messages[i].participant
-            except IndexError:
-                participant = None
-            if participant:
-                self.vertical_header_text[i] = "{0} ({1})".format(i + 1, participant.shortname)
-                self.vertical_header_colors[i] = constants.PARTICIPANT_COLORS[participant.color_index]
-            else:
-                self.vertical_header_text[i] = str(i+1)
+        if self.row_count > 0:
+            self.headerDataChanged.emit(Qt.Vertical, 0, self.row_count - 1)
 
 
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
@@ -202,18 +259,20 @@ class TableModel(QAbstractTableModel):
                 return Qt.AlignCenter
 
         elif role == Qt.BackgroundColorRole:
-            return self.background_colors[i, j]
+            lbl = self.label_at(i, j)
+            return constants.LABEL_COLORS[lbl.color_index] if lbl is not None else None
 
         elif role == Qt.FontRole:
             font = QFont()
-            font.setBold(self.bold_fonts[i, j])
+            font.setBold(self.is_bold(i, j))
             return font
 
         elif role == Qt.TextColorRole:
-            return self.text_colors[i, j]
+            return self.text_color(i, j)
 
         elif role == Qt.ToolTipRole:
-            return self.tooltips[i, j]
+            lbl = self.label_at(i, j)
+            return lbl.name if lbl is not None else None
 
         else:
             return None
@@ -273,16 +332,14 @@ class TableModel(QAbstractTableModel):
         self.search_results[:] = []
         self.search_value = value
 
-        if len(value) == 0:
+        if len(value) == 0 or not self.display_data:
             return 0
 
-        for i, message in enumerate(self.display_data):
-            if i in self.hidden_rows:
-                continue
-
-            j = message.find(value)
-            while j != -1:
-                self.search_results.append((i, j))
-                j = message.find(value, j + 1)
+        search_index = self.search_indices[self.proto_view]
+        search_index.update(self.display_data)
+        if self.hidden_rows:
+            self.search_results[:] = [res for res in search_index.find(value) if res[0] not in self.hidden_rows]
+        else:
+            self.search_results[:] = search_index.find(value)
 
-        return len(self.search_results)
\ No newline at end of file
+        return len(self.search_results)
@@ -1,8 +1,7 @@
-import copy
-
 from PyQt5.QtWidgets import QUndoCommand
 
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.ProtocolDelta import ProtocolDelta
 from urh.signalprocessing.Message import Message
 
 
@@ -12,12 +11,12 @@ class MessageBreakAction(QUndoCommand):
         self.proto_analyzer = proto_analyzer
         self.msg_nr = msg_nr
         self.pos = pos
-        self.orig_messages = copy.deepcopy(proto_analyzer.messages)
+        self.delta = ProtocolDelta()
 
         self.setText("Break message behind selection")
 
     def redo(self):
-        message = copy.deepcopy(self.proto_analyzer.messages[self.msg_nr])
+        message = self.delta.save_messages(self.proto_analyzer, self.msg_nr, self.msg_nr + 1)[0]
         message1 = Message(plain_bits=message.plain_bits[:self.pos], pause=0,
                            rssi=0, decoder=message.decoder, message_type=message.message_type,
                            bit_len=message.bit_len)
@@ -28,7 +27,7 @@ class MessageBreakAction(QUndoCommand):
         self.proto_analyzer.messages.insert(self.msg_nr + 1, message2)
 
     def undo(self):
-        self.proto_analyzer.messages = self.orig_messages
+        self.delta.restore()
 
     def __get_zero_seq_indexes(self, message: str, following_zeros: int):
         """
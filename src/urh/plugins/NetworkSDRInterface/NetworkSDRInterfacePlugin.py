@@ -4,7 +4,6 @@ import threading
 import time
 
 import numpy as np
-import psutil
 from PyQt5.QtCore import pyqtSlot
 from PyQt5.QtCore import QTimer
 from PyQt5.QtCore import pyqtSignal
@@ -14,6 +13,7 @@ from urh.plugins.Plugin import SDRPlugin
 from urh.signalprocessing.Message import Message
 from urh.util.Errors import Errors
 from urh.util.Logger import logger
+from urh.util.RingBuffer import RingBuffer
 
 
 class NetworkSDRInterfacePlugin(SDRPlugin):
@@ -37,8 +37,7 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
                 self.server.received_bits.append(NetworkSDRInterfacePlugin.bytearray_to_bit_str(self.data))
             else:
                 received = np.frombuffer(self.data, dtype=np.complex64)
-                self.server.receive_buffer[self.server.current_receive_index:self.server.current_receive_index+len(received)] = received
-                self.server.current_receive_index += len(received)
+                self.server.receive_buffer.push(received)
 
     def __init__(self, raw_mode=False):
         """
@@ -66,9 +65,8 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
 
         self.raw_mode = raw_mode
         if self.raw_mode:
-            # Take 60% of avail memory
-            num_samples = 0.6*(psutil.virtual_memory().free / 8)
-            self.receive_buffer = np.zeros(int(num_samples), dtype=np.complex64, order='C')
+            # Received samples are streamed to a temporary file, the ring only holds the latest samples
+            self.receive_buffer = RingBuffer(RingBuffer.DEFAULT_SIZE, spill_filename="")
         else:
             self.received_bits = []
 
@@ -85,27 +83,26 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
     @property
     def received_data(self):
         if self.raw_mode:
-            return self.receive_buffer[:self.current_receive_index]
+            return self.receive_buffer[:]
         else:
             return self.received_bits
 
     @property
     def current_receive_index(self):
-        if hasattr(self.server, "current_receive_index"):
-            return self.server.current_receive_index
+        if hasattr(self.server, "receive_buffer"):
+            return len(self.server.receive_buffer)
         else:
             return 0
 
     @current_receive_index.setter
     def current_receive_index(self, value):
-        if hasattr(self.server, "current_receive_index"):
-            self.server.current_receive_index = value
-        else:
-            pass
+        if hasattr(self.server, "receive_buffer") and value == 0:
+            self.server.receive_buffer.clear()
 
     def free_data(self):
         if self.raw_mode:
-            self.receive_buffer = np.empty(0)
+            self.receive_buffer.close()
+            self.receive_buffer = RingBuffer(RingBuffer.DEFAULT_SIZE, spill_filename="")
         else:
             self.received_bits[:] = []
 
@@ -126,7 +123,6 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
                                              bind_and_activate=False)
         if self.raw_mode:
             self.server.receive_buffer = self.receive_buffer
-            self.server.current_receive_index = 0
         else:
             self.server.received_bits = self.received_bits
 
@@ -148,18 +144,34 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
         self.receive_check_timer.stop()
 
     def send_data(self, data) -> str:
+        """
+
+        :param data: bytes or an iterable of bytes, which are sent over one connection
+        """
+        if isinstance(data, (bytes, bytearray)):
+            data = (data,)
+
         # Create a socket (SOCK_STREAM means a TCP socket)
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                 # Connect to server and send data
                 sock.connect((self.client_ip, self.client_port))
-                sock.sendall(data)
+                for part in data:
+                    sock.sendall(part)
                 return ""
         except Exception as e:
             return str(e)
 
-    def send_raw_data(self, data: np.ndarray, num_repeats: int):
-        byte_data = data.tostring()
+    def send_raw_data(self, data, num_repeats: int):
+        """
+
+        :type data: np.ndarray | ModulatedStream
+        """
+        if callable(data):
+            # Streams are modulated chunk by chunk while sending
+            byte_data = None
+        else:
+            byte_data = data.tostring()
 
         if num_repeats == -1:
             # forever
@@ -168,7 +180,7 @@ class NetworkSDRInterfacePlugin(SDRPlugin):
             rng = range(0, num_repeats)
 
         for _ in rng:
-            self.send_data(byte_data)
+            self.send_data(byte_data if byte_data is not None else (chunk.tostring() for chunk in data()))
             self.current_sent_sample = len(data)
             self.current_sending_repeat += 1
 
@@ -17,7 +17,7 @@ class Plugin(QObject):
         self.name = name
         self.plugin_path = ""
         self.description = ""
-        self.settings_frame = None
+        self.__settings_frame = None
         self.qsettings = QSettings(QSettings.IniFormat, QSettings.UserScope, "urh", self.name + "-plugin")
 
     @property
@@ -30,6 +30,16 @@ class Plugin(QObject):
             self.__enabled = Qt.Checked if value else Qt.Unchecked
             self.enabled_changed.emit()
 
+    @property
+    def settings_frame(self):
+        """
+        The settings frame is loaded from its ui file on first access to keep the startup fast
+
+        """
+        if self.__settings_frame is None:
+            self.load_settings_frame()
+        return self.__settings_frame
+
     def load_description(self):
         descr_file = os.path.join(self.plugin_path, "descr.txt")
         try:
@@ -42,7 +52,7 @@ class Plugin(QObject):
         pass
 
     def load_settings_frame(self):
-        self.settings_frame = uic.loadUi(os.path.join(self.plugin_path, "settings.ui"))
+        self.__settings_frame = uic.loadUi(os.path.join(self.plugin_path, "settings.ui"))
         self.create_connects()
 
 
@@ -42,7 +42,6 @@ class PluginManager(object):
                 plugin = class_module()
                 plugin.plugin_path = os.path.join(self.plugin_path, plugin.name)
                 plugin.load_description()
-                plugin.load_settings_frame()
                 plugin.enabled = settings.value(plugin.name, type=bool) if plugin.name in settings.allKeys() else False
                 result.append(plugin)
             except ImportError as e:
@@ -0,0 +1,247 @@
+import os
+import struct
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from urh.cythonext.signalFunctions import Symbol
+from urh.signalprocessing.BitArray import BitArray
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
+from urh.signalprocessing.Modulator import Modulator
+from urh.signalprocessing.Participant import Participant
+from urh.signalprocessing.encoder import Encoder
+from urh.util.Logger import logger
+
+
+class BinaryProtocolFile(object):
+    """
+    Compact binary container for the messages of a protocol, the XML .proto files stay for interchange.
+
+    The file consists of segments, each one holding
+      - the decoders, participants, message types, symbols and modulators first used in this segment (XML),
+      - a fixed size record per message with indices into these interned tables,
+      - the packed bits of all messages and a sparse table of symbol positions.
+    Appending messages writes a new segment, so existing data is never rewritten.
+    Loading maps the file and reads records and packed bits as arrays, so only the tables are parsed.
+    Every message is still created as :class:`Message`, because protocols keep all messages in a list.
+    """
+
+    MAGIC = b"URHPROTO"
+    VERSION = 1
+    SEGMENT_HEADER = struct.Struct("<4sIQQQQ")  # tag, reserved, table bytes, messages, bit bytes, symbols
+    SEGMENT_TAG = b"SEGM"
+
+    RECORD_DTYPE = np.dtype([("bit_offset", "<u8"), ("num_bits", "<u8"), ("pause", "<i8"), ("rssi", "<f8"),
+                             ("bit_len", "<u4"), ("modulator_index", "<i4"), ("decoder", "<i4"),
+                             ("participant", "<i4"), ("message_type", "<i4"), ("reserved", "<u4")])
+    SYMBOL_DTYPE = np.dtype([("message", "<u8"), ("position", "<u8"), ("symbol", "<i8")])
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.__reset()
+
+    def __reset(self):
+        # Interned tables, messages refer to them by index
+        self.decoders = []  # type: list[Encoder]
+        self.participants = []  # type: list[Participant]
+        self.message_types = []  # type: list[MessageType]
+        self.symbols = []  # type: list[Symbol]
+        self.modulators = []  # type: list[Modulator]
+        self.num_messages = 0
+
+        self.__keys = {"decoding": dict(), "participant": dict(), "message_type": dict(), "symbol": dict()}
+        self.__new_entries = {name: [] for name in self.__keys}
+        self.__num_written_modulators = 0
+
+    @staticmethod
+    def is_binary_file(filename: str) -> bool:
+        try:
+            with open(filename, "rb") as f:
+                return f.read(len(BinaryProtocolFile.MAGIC)) == BinaryProtocolFile.MAGIC
+        except OSError:
+            return False
+
+    def write(self, messages, modulators=None):
+        """
+        Create the file with the given messages, an existing file is overwritten
+
+        :type messages: list of Message
+        :type modulators: list of Modulator
+        """
+        self.__reset()
+        with open(self.filename, "wb") as f:
+            f.write(self.MAGIC + struct.pack("<I", self.VERSION))
+        self.append(messages, modulators)
+
+    def append(self, messages, modulators=None):
+        """
+        Append messages as a new segment. Tables already in the file are only referenced.
+        Call load or write before appending, so the tables of the file are known.
+
+        :type messages: list of Message
+        :param modulators: modulators, which are not stored in the file yet are appended
+        """
+        if not os.path.isfile(self.filename):
+            self.write(messages, modulators)
+            return
+
+        records = np.zeros(len(messages), dtype=self.RECORD_DTYPE)
+        bit_chunks, symbol_entries = [], []
+        bit_offset = 0
+        for i, message in enumerate(messages):
+            plain_bits = message.plain_bits
+            packed = plain_bits.tobytes()
+            record = records[i]
+            record["bit_offset"] = bit_offset
+            record["num_bits"] = len(plain_bits)
+            record["pause"] = message.pause
+            record["rssi"] = message.rssi
+            record["bit_len"] = message.bit_len
+            record["modulator_index"] = message.modulator_indx
+            record["decoder"] = self.__intern("decoding", message.decoder)
+            record["participant"] = self.__intern("participant", message.participant)
+            record["message_type"] = self.__intern("message_type", message.message_type)
+            for position, symbol in plain_bits.symbols.items():
+                symbol_entries.append((self.num_messages + i, position, self.__intern("symbol", symbol)))
+
+            bit_chunks.append(packed)
+            bit_offset += len(packed)
+
+        new_modulators = list(modulators[self.__num_written_modulators:]) if modulators else []
+        tables = self.__tables_to_bytes(new_modulators)
+        symbols = np.array(symbol_entries, dtype=self.SYMBOL_DTYPE)
+        bits = b"".join(bit_chunks)
+
+        with open(self.filename, "ab") as f:
+            f.write(self.SEGMENT_HEADER.pack(self.SEGMENT_TAG, 0, len(tables), len(records), len(bits), len(symbols)))
+            for data in (tables, records.tobytes(), bits, symbols.tobytes()):
+                f.write(data)
+                f.write(b"\x00" * self.__padding(len(data)))
+
+        for name in self.__new_entries:
+            self.__new_entries[name] = []
+        self.modulators.extend(new_modulators)
+        self.__num_written_modulators += len(new_modulators)
+        self.num_messages += len(messages)
+
+    def load(self) -> list:
+        """
+        Read all messages from the file, a :class:`Message` is created for each of them
+
+        :rtype: list of Message
+        """
+        self.__reset()
+        data = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        header_len = len(self.MAGIC) + 4
+        if data[:len(self.MAGIC)].tobytes() != self.MAGIC:
+            raise ValueError("{0} is no binary protocol file".format(self.filename))
+        version = struct.unpack("<I", data[len(self.MAGIC):header_len].tobytes())[0]
+        if version > self.VERSION:
+            raise ValueError("Binary protocol file version {0} is not supported".format(version))
+
+        messages = []
+        pos = header_len
+        while pos + self.SEGMENT_HEADER.size <= len(data):
+            tag, _, table_len, num_messages, bits_len, num_symbols = \
+                self.SEGMENT_HEADER.unpack(data[pos:pos + self.SEGMENT_HEADER.size].tobytes())
+            if tag != self.SEGMENT_TAG:
+                logger.error("Corrupt segment in {0} at byte {1}".format(self.filename, pos))
+                break
+            pos += self.SEGMENT_HEADER.size
+
+            parts = []
+            for length in (table_len, num_messages * self.RECORD_DTYPE.itemsize, bits_len,
+                           num_symbols * self.SYMBOL_DTYPE.itemsize):
+                parts.append(data[pos:pos + length])
+                pos += length + self.__padding(length)
+
+            self.__read_tables(parts[0].tobytes())
+            records = parts[1].view(self.RECORD_DTYPE)
+            messages.extend(self.__create_messages(records, parts[2], parts[3].view(self.SYMBOL_DTYPE)))
+
+        self.num_messages = len(messages)
+        return messages
+
+    def __create_messages(self, records: np.ndarray, bits: np.ndarray, symbols: np.ndarray) -> list:
+        symbols_per_message = dict()
+        for message_index, position, symbol_index in symbols.tolist():
+            symbols_per_message.setdefault(message_index, dict())[position] = self.symbols[symbol_index]
+
+        result = []
+        for i, record in enumerate(records.tolist()):
+            bit_offset, num_bits, pause, rssi, bit_len, modulator_index, decoder, participant, message_type, _ = record
+            packed = bits[bit_offset:bit_offset + (num_bits + 7) // 8]
+            plain_bits = BitArray.from_packed(packed, num_bits, symbols_per_message.get(self.num_messages + i))
+            result.append(Message(plain_bits=plain_bits, pause=pause, rssi=rssi, bit_len=bit_len,
+                                  modulator_indx=modulator_index,
+                                  message_type=self.message_types[message_type],
+                                  decoder=self.decoders[decoder] if decoder >= 0 else None,
+                                  participant=self.participants[participant] if participant >= 0 else None))
+        self.num_messages += len(result)
+        return result
+
+    def __intern(self, name: str, item) -> int:
+        if item is None:
+            return -1
+
+        if name == "decoding":
+            key = tuple(item.get_chain())
+        elif name == "symbol":
+            key = item.name
+        else:
+            key = item.id
+
+        try:
+            return self.__keys[name][key]
+        except KeyError:
+            index = len(self.__keys[name])
+            self.__keys[name][key] = index
+            self.__new_entries[name].append(item)
+            self.__table(name).append(item)
+            return index
+
+    def __table(self, name: str) -> list:
+        return {"decoding": self.decoders, "participant": self.participants,
+                "message_type": self.message_types, "symbol": self.symbols}[name]
+
+    def __tables_to_bytes(self, modulators) -> bytes:
+        root = ET.Element("tables")
+        for decoder in self.__new_entries["decoding"]:
+            ET.SubElement(root, "decoding").text = ", ".join(map(repr, decoder.get_chain()))
+        for participant in self.__new_entries["participant"]:
+            root.append(participant.to_xml())
+        for message_type in self.__new_entries["message_type"]:
+            root.append(message_type.to_xml())
+        for symbol in self.__new_entries["symbol"]:
+            ET.SubElement(root, "symbol", attrib={"name": symbol.name, "pulsetype": str(symbol.pulsetype),
+                                                  "nbits": str(symbol.nbits), "nsamples": str(symbol.nsamples)})
+        for i, modulator in enumerate(modulators, start=self.__num_written_modulators):
+            root.append(modulator.to_xml(i))
+        return ET.tostring(root)
+
+    def __read_tables(self, xml: bytes):
+        if not xml:
+            return
+
+        for tag in ET.fromstring(xml):
+            if tag.tag == "decoding":
+                conf = [d.strip().replace("'", "") for d in tag.text.split(",") if d.strip().replace("'", "")]
+                self.__intern("decoding", Encoder(conf))
+            elif tag.tag == "participant":
+                self.__intern("participant", Participant.from_xml(tag))
+            elif tag.tag == "message_type":
+                self.__intern("message_type", MessageType.from_xml(tag))
+            elif tag.tag == "symbol":
+                self.__intern("symbol", Symbol(tag.get("name"), int(tag.get("nbits")),
+                                               int(tag.get("pulsetype")), int(tag.get("nsamples"))))
+            elif tag.tag == "modulator":
+                self.modulators.append(Modulator.from_xml(tag))
+                self.__num_written_modulators += 1
+
+        for name in self.__new_entries:
+            self.__new_entries[name] = []
+
+    @staticmethod
+    def __padding(length: int) -> int:
+        return -length % 8
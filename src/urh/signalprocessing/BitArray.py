@@ -0,0 +1,266 @@
+import copy
+from collections.abc import MutableSequence
+
+import numpy as np
+
+from urh.cythonext.signalFunctions import Symbol
+
+
+class BitArray(MutableSequence):
+    """
+    Compact storage for the bits of a message.
+
+    Bits are stored packed in a numpy uint8 buffer (one bit per bit instead of one Python object),
+    Symbols are kept in a sparse table {index: Symbol}. At the position of a symbol the buffer holds the
+    pulsetype of the symbol, so the packed buffer can be used directly e.g. for decoded_bits_buffer.
+    It behaves like a list of bool/Symbol, so existing code working on lists keeps working.
+    """
+
+    __slots__ = ["__data", "__length", "__symbols"]
+
+    def __init__(self, bits=None):
+        """
+
+        :type bits: list[bool|Symbol] | BitArray | np.ndarray
+        """
+        if isinstance(bits, BitArray):
+            self.__data, self.__length, self.__symbols = bits.__data.copy(), len(bits), dict(bits.__symbols)
+        else:
+            unpacked, symbols = self.__unpack_sequence(bits)
+            self.__set_unpacked(unpacked, symbols)
+
+    @classmethod
+    def from_numpy(cls, bits: np.ndarray, symbols: dict = None):
+        """
+        Create a BitArray from an unpacked array of 0/1 values and a symbol table {index: Symbol}
+
+        :rtype: BitArray
+        """
+        result = cls()
+        unpacked = np.asarray(bits, dtype=np.uint8)
+        symbols = dict(symbols) if symbols else dict()
+        if symbols:
+            unpacked = unpacked.copy()
+            for index, symbol in symbols.items():
+                unpacked[index] = symbol.pulsetype == 1
+        result.__set_unpacked(unpacked != 0, symbols)
+        return result
+
+    @classmethod
+    def from_packed(cls, packed, length: int, symbols: dict = None):
+        """
+        Create a BitArray from bits packed with np.packbits, e.g. read from a binary protocol file
+
+        :rtype: BitArray
+        """
+        result = cls()
+        result.__data = np.array(packed, dtype=np.uint8)
+        result.__length = int(length)
+        result.__symbols = dict(symbols) if symbols else dict()
+        return result
+
+    @property
+    def symbols(self) -> dict:
+        """
+        Sparse table of symbols {index: Symbol}
+
+        """
+        return self.__symbols
+
+    @property
+    def symbol_positions(self) -> list:
+        return sorted(self.__symbols)
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Unpacked bits as uint8 array, symbols are represented by their pulsetype
+
+        """
+        return np.unpackbits(self.__data)[:self.__length]
+
+    def tobytes(self) -> bytes:
+        return self.__data.tobytes()
+
+    def tolist(self) -> list:
+        result = self.to_numpy().astype(bool).tolist()
+        for index, symbol in self.__symbols.items():
+            result[index] = symbol
+        return result
+
+    def to_string(self) -> str:
+        """
+        Bits as string of 0 and 1, symbols are represented by their name
+
+        """
+        result = (self.to_numpy() + ord("0")).tobytes().decode("ascii")
+        if not self.__symbols:
+            return result
+
+        result = list(result)
+        for index, symbol in self.__symbols.items():
+            result[index] = symbol.name
+        return "".join(result)
+
+    def copy(self):
+        return BitArray(self)
+
+    def __copy__(self):
+        return BitArray(self)
+
+    def __deepcopy__(self, memo):
+        result = BitArray(self)
+        result.__symbols = copy.deepcopy(self.__symbols, memo)
+        memo[id(self)] = result
+        return result
+
+    def __array__(self, dtype=None):
+        result = self.to_numpy()
+        return result if dtype is None else result.astype(dtype)
+
+    def __len__(self):
+        return self.__length
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__length)
+            if step != 1:
+                return BitArray(self.tolist()[index])
+            stop = max(start, stop)
+            symbols = {i - start: s for i, s in self.__symbols.items() if start <= i < stop}
+            result = BitArray()
+            result.__set_unpacked(self.to_numpy()[start:stop], symbols)
+            return result
+
+        index = self.__normalize_index(index)
+        try:
+            return self.__symbols[index]
+        except KeyError:
+            return bool((self.__data[index >> 3] >> (7 - (index & 7))) & 1)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__length)
+            if step != 1:
+                bits = self.tolist()
+                bits[index] = value
+                self.__init__(bits)
+            else:
+                self.__splice(start, max(start, stop), value)
+            return
+
+        index = self.__normalize_index(index)
+        if type(value) == Symbol:
+            self.__symbols[index] = value
+            bit = value.pulsetype == 1
+        else:
+            self.__symbols.pop(index, None)
+            bit = bool(value)
+
+        mask = 1 << (7 - (index & 7))
+        if bit:
+            self.__data[index >> 3] |= mask
+        else:
+            self.__data[index >> 3] &= ~mask & 0xff
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__length)
+            if step != 1:
+                bits = self.tolist()
+                del bits[index]
+                self.__init__(bits)
+            else:
+                self.__splice(start, max(start, stop), [])
+        else:
+            index = self.__normalize_index(index)
+            self.__splice(index, index + 1, [])
+
+    def insert(self, index: int, value):
+        index = min(max(0, index + self.__length if index < 0 else index), self.__length)
+        self.__splice(index, index, [value])
+
+    def extend(self, values):
+        self.__splice(self.__length, self.__length, values)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __add__(self, other):
+        result = BitArray(self)
+        result.extend(other)
+        return result
+
+    def __radd__(self, other):
+        result = BitArray(other)
+        result.extend(self)
+        return result
+
+    def __eq__(self, other):
+        if isinstance(other, BitArray):
+            return self.__length == other.__length and np.array_equal(self.__data, other.__data) \
+                   and self.__symbols == other.__symbols
+        try:
+            return len(self) == len(other) and self.tolist() == list(other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "BitArray({0})".format(self.to_string())
+
+    def __normalize_index(self, index: int) -> int:
+        index = int(index)
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError("BitArray index out of range")
+        return index
+
+    def __set_unpacked(self, unpacked: np.ndarray, symbols: dict):
+        self.__length = len(unpacked)
+        self.__data = np.packbits(unpacked.astype(bool))
+        self.__symbols = symbols
+
+    def __splice(self, start: int, stop: int, values):
+        """
+        Replace the bits from start to stop with values
+
+        """
+        new_bits, new_symbols = self.__unpack_sequence(values)
+        shift = len(new_bits) - (stop - start)
+        symbols = {i if i < start else i + shift: s for i, s in self.__symbols.items() if not start <= i < stop}
+        symbols.update((i + start, s) for i, s in new_symbols.items())
+
+        unpacked = self.to_numpy()
+        self.__set_unpacked(np.concatenate((unpacked[:start], new_bits, unpacked[stop:])), symbols)
+
+    @staticmethod
+    def __unpack_sequence(bits):
+        """
+        Convert a sequence of bool/Symbol into an unpacked bool array and a symbol table
+
+        :rtype: (np.ndarray, dict)
+        """
+        if bits is None:
+            return np.zeros(0, dtype=bool), dict()
+        if isinstance(bits, BitArray):
+            return bits.to_numpy().astype(bool), dict(bits.symbols)
+        if isinstance(bits, np.ndarray):
+            return bits.astype(bool), dict()
+
+        bits = list(bits)
+        symbols = {i: b for i, b in enumerate(bits) if type(b) == Symbol}
+        for i, symbol in symbols.items():
+            bits[i] = symbol.pulsetype == 1
+
+        try:
+            unpacked = np.array(bits, dtype=bool)
+        except (TypeError, ValueError):
+            unpacked = np.array([bool(b) for b in bits], dtype=bool)
+
+        return unpacked.reshape(len(bits)), symbols
@@ -0,0 +1,176 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from urh.cythonext import signalFunctions
+
+
+class BlockDemodulator(object):
+    """
+    Block wise quadrature demodulation of IQ data.
+
+    The samples are demodulated in blocks of BLOCK_SIZE samples. The state at block borders
+    (previous sample for FSK, frequency and phase of the costas loop for PSK/QAM) is carried over,
+    so the result is the same as demodulating all samples at once.
+    Demodulated blocks are cached per (noise, modulation type) with LRU eviction, so scrolling and
+    switching parameters back and forth only demodulates the blocks, which are not cached yet.
+    """
+
+    BLOCK_SIZE = 2 ** 20
+    MAX_CACHED_SAMPLES = 2 ** 26  # 256 MB of float32
+
+    def __init__(self, data):
+        """
+
+        :type data: np.ndarray | MemmapIQ
+        """
+        self.data = data
+        self.__cache = OrderedDict()  # (noise, mod_type, block index) -> demodulated block
+        self.__costa_states = dict()  # (noise, mod_type, block index) -> costas loop state at block start
+        self.__cached_samples = 0
+
+    @property
+    def num_blocks(self) -> int:
+        return int(np.ceil(len(self.data) / self.BLOCK_SIZE))
+
+    @property
+    def cached_samples(self) -> int:
+        return self.__cached_samples
+
+    def is_cached(self, index: int, noise: float, mod_type: int) -> bool:
+        return (noise, mod_type, index) in self.__cache
+
+    def block(self, index: int, noise: float, mod_type: int, cache=True) -> np.ndarray:
+        """
+
+        :param cache: keep the demodulated block in the cache
+        """
+        key = (noise, mod_type, index)
+        try:
+            self.__cache.move_to_end(key)
+            return self.__cache[key]
+        except KeyError:
+            pass
+
+        first = index
+        if self.__needs_costa_state(mod_type):
+            # The costas loop needs the state from the end of the previous block,
+            # so continue from the last block with a known state
+            while first > 0 and (noise, mod_type, first) not in self.__costa_states:
+                first -= 1
+
+        result = None
+        for i in range(first, index + 1):
+            result = self.__demodulate_block(i, noise, mod_type, cache)
+        return result
+
+    def iter_blocks(self, noise: float, mod_type: int, start=0, end=None, cache=True):
+        """
+        Iterate over the demodulated blocks, which overlap the range from start to end
+
+        :return: generator of (sample position of block, demodulated block)
+        """
+        end = len(self.data) if end is None else min(len(self.data), end)
+        for index in range(int(start) // self.BLOCK_SIZE, int(np.ceil(end / self.BLOCK_SIZE))):
+            yield index * self.BLOCK_SIZE, self.block(index, noise, mod_type, cache)
+
+    def demodulate(self, noise: float, mod_type: int, start=0, end=None, cache=True) -> np.ndarray:
+        """
+        Demodulate the samples from start to end using cached blocks where possible
+
+        :param cache: cache the newly demodulated blocks. Disable it, when the caller keeps the result anyway,
+                      so the demodulated samples are not held twice.
+        """
+        end = len(self.data) if end is None else min(len(self.data), int(end))
+        start = min(int(start), end)
+        result = np.empty(end - start, dtype=np.float32)
+        for pos, block in self.iter_blocks(noise, mod_type, start, end, cache):
+            block_start, block_end = max(start, pos), min(end, pos + len(block))
+            result[block_start - start:block_end - start] = block[block_start - pos:block_end - pos]
+        return result
+
+    def view(self, noise: float, mod_type: int):
+        """
+        Lazy view on the demodulated samples, only the sliced blocks get demodulated
+
+        :rtype: DemodulatedView
+        """
+        return DemodulatedView(self, noise, mod_type)
+
+    def invalidate(self, start=0, end=None):
+        """
+        Remove the cached blocks, which are affected by a change of the samples from start to end
+
+        """
+        end = len(self.data) if end is None else end
+        first = max(0, int(start) - 1) // self.BLOCK_SIZE
+        last = int(end) // self.BLOCK_SIZE  # next block depends on last changed sample for FSK
+
+        for key in list(self.__cache.keys()):
+            noise, mod_type, index = key
+            if first <= index <= last or (index > last and self.__needs_costa_state(mod_type)):
+                self.__cached_samples -= len(self.__cache.pop(key))
+
+        for key in list(self.__costa_states.keys()):
+            if key[2] > first:
+                del self.__costa_states[key]
+
+    def clear(self):
+        self.__cache.clear()
+        self.__costa_states.clear()
+        self.__cached_samples = 0
+
+    def __demodulate_block(self, index: int, noise: float, mod_type: int, cache=True) -> np.ndarray:
+        start = index * self.BLOCK_SIZE
+        end = min(start + self.BLOCK_SIZE, len(self.data))
+        samples = np.ascontiguousarray(self.data[start:end], dtype=np.complex64)
+
+        state = np.array(self.__costa_states.get((noise, mod_type, index), (0, 0)), dtype=np.float32)
+        predecessor = self.data[start - 1] if index > 0 else 0
+        result = signalFunctions.afp_demod_block(samples, noise, mod_type, state, index > 0, predecessor)
+
+        if self.__needs_costa_state(mod_type):
+            self.__costa_states[(noise, mod_type, index + 1)] = state
+
+        if not cache:
+            return result
+
+        self.__cache[(noise, mod_type, index)] = result
+        self.__cached_samples += len(result)
+        while self.__cached_samples > self.MAX_CACHED_SAMPLES and len(self.__cache) > 1:
+            self.__cached_samples -= len(self.__cache.popitem(last=False)[1])
+
+        return result
+
+    @staticmethod
+    def __needs_costa_state(mod_type: int) -> bool:
+        return mod_type == 2 or mod_type == 3
+
+
+class DemodulatedView(object):
+    """
+    Sliceable, lazy view on the demodulated samples of a :class:`BlockDemodulator`
+    """
+
+    def __init__(self, demodulator: BlockDemodulator, noise: float, mod_type: int):
+        self.demodulator = demodulator
+        self.noise = noise
+        self.mod_type = mod_type
+
+    def __len__(self):
+        return len(self.demodulator.data)
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            raise TypeError("DemodulatedView only supports slices")
+        start, stop, step = item.indices(len(self))
+        return self.demodulator.demodulate(self.noise, self.mod_type, start, max(start, stop))[::step]
+
+    def minmax(self) -> tuple:
+        minimum, maximum = float("inf"), float("-inf")
+        for _, block in self.demodulator.iter_blocks(self.noise, self.mod_type):
+            if len(block) > 0:
+                minimum = min(minimum, float(np.min(block)))
+                maximum = max(maximum, float(np.max(block)))
+
+        return (0, 0) if minimum > maximum else (minimum, maximum)
@@ -0,0 +1,156 @@
+import numpy as np
+
+from urh import constants
+from urh.cythonext import signalFunctions
+from urh.cythonext.signalFunctions import Symbol
+from urh.signalprocessing.BitArray import BitArray
+from urh.signalprocessing.BlockDemodulator import BlockDemodulator
+from urh.signalprocessing.Message import Message
+
+
+class Demodulator(object):
+    """
+    Demodulation of samples to messages without Qt.
+
+    Runs the steps a protocol performs for its signal: quadrature demodulation, grabbing the pulse lengths,
+    converting the pulses to bits and symbols and creating the messages.
+    The ProtocolAnalyzer uses it for its signal, urh-cli for batch processing of capture files.
+    """
+
+    MODULATION_TYPES = ["ASK", "FSK", "PSK", "QAM"]
+
+    def __init__(self, modulation_type=1, bit_len=100, qad_center=0.0, tolerance=5, noise_threshold=0.0,
+                 rel_symbol_len=0.1, used_symbols=None):
+        """
+
+        :param modulation_type: index in MODULATION_TYPES
+        :param used_symbols: set of symbols to fill when converting pulses to bits, e.g. of a protocol
+        :type used_symbols: set of Symbol
+        """
+        self.modulation_type = modulation_type
+        self.bit_len = bit_len
+        self.qad_center = qad_center
+        self.tolerance = tolerance
+        self.noise_threshold = noise_threshold
+        self.rel_symbol_len = rel_symbol_len
+        self.used_symbols = set() if used_symbols is None else used_symbols
+
+    @staticmethod
+    def calc_noise_threshold(samples) -> float:
+        """
+        Noise threshold from samples containing only noise, rounded up to four digits
+
+        """
+        return np.ceil(np.max(np.absolute(samples)) * 10 ** 4) / 10 ** 4
+
+    @staticmethod
+    def estimate_qad_center(qad: np.ndarray, modulation_type: int) -> float:
+        noise_value = signalFunctions.get_noise_for_mod_type(modulation_type)
+        qad = qad[np.where(qad > noise_value)] if noise_value < 0 else qad
+        return signalFunctions.estimate_qad_center(qad, constants.NUM_CENTERS)
+
+    @staticmethod
+    def read_rel_symbol_len() -> float:
+        """
+        Relative symbol length from the settings
+
+        """
+        settings = constants.SETTINGS
+        if 'rel_symbol_length' in settings.allKeys():
+            return settings.value('rel_symbol_length', type=int) / 200
+        return 0.1
+
+    def demodulate(self, samples) -> np.ndarray:
+        """
+        Quadrature demodulation of the samples, block wise so memory mapped samples are never read at once
+
+        :type samples: np.ndarray | MemmapIQ | PieceTable
+        """
+        return BlockDemodulator(samples).demodulate(self.noise_threshold, self.modulation_type)
+
+    def auto_detect(self, qad: np.ndarray, detect_center=True, detect_bit_len=True):
+        """
+        Estimate center and bit length from the demodulated samples like a signal does after loading
+
+        """
+        if detect_center:
+            self.qad_center = self.estimate_qad_center(qad, self.modulation_type)
+        if detect_bit_len:
+            self.bit_len = signalFunctions.estimate_bit_len(qad, self.qad_center, self.tolerance,
+                                                            self.modulation_type)
+
+    def grab_pulse_lens(self, qad: np.ndarray):
+        return signalFunctions.grab_pulse_lens(qad, self.qad_center, self.tolerance, self.modulation_type)
+
+    def pulses_to_bits(self, ppseq, write_bit_sample_pos=True) -> tuple:
+        """
+        Convert pulse lengths to the bits of the messages, the used symbols are collected in used_symbols
+
+        :return: bits, pauses and sample positions of the bits for each message
+        """
+        self.used_symbols.clear()
+        bits, bit_offsets, positions, pos_offsets, pauses, symbols = \
+            signalFunctions.pulses_to_bits(ppseq, self.bit_len, self.rel_symbol_len)
+
+        # Symbols are created in order of appearance, so they get the same names as before
+        avail_symbol_names = constants.SYMBOL_NAMES
+        message_symbols = [dict() for _ in range(len(pauses))]
+        for num_bits, ptype, num_samples, index in symbols:
+            symbol = self.__find_matching_symbol(num_bits, ptype)
+            if symbol is None:
+                symbol = self.__create_symbol(int(num_bits), int(ptype), int(num_samples), avail_symbol_names)
+            if index >= 0:
+                msg_index = int(np.searchsorted(bit_offsets, index, side="right")) - 1
+                message_symbols[msg_index][int(index - bit_offsets[msg_index])] = symbol
+
+        resulting_data_bits = [BitArray.from_numpy(bits[bit_offsets[i]:bit_offsets[i + 1]], message_symbols[i])
+                               for i in range(len(pauses))]
+
+        if write_bit_sample_pos:
+            bit_sample_positions = [positions[pos_offsets[i]:pos_offsets[i + 1]] for i in range(len(pauses))]
+        else:
+            bit_sample_positions = []
+
+        return resulting_data_bits, pauses.tolist(), bit_sample_positions
+
+    def create_messages(self, samples, ppseq, message_type, decoder) -> list:
+        """
+        Messages for the pulse lengths, the RSSI of a message is measured at its middle bit
+
+        :param samples: samples the pulses were grabbed from
+        :type message_type: MessageType
+        :type decoder: Encoder
+        :rtype: list of Message
+        """
+        bit_len = self.bit_len
+        bit_data, pauses, bit_sample_pos = self.pulses_to_bits(ppseq)
+
+        messages = []
+        for bits, pause, sample_pos in zip(bit_data, pauses, bit_sample_pos):
+            middle_bit_pos = sample_pos[int(len(bits) / 2)]
+            rssi = np.mean(np.abs(samples[middle_bit_pos:middle_bit_pos + bit_len]))
+            messages.append(Message(bits, pause, message_type=message_type, bit_len=bit_len, rssi=rssi,
+                                    decoder=decoder, bit_sample_pos=sample_pos))
+        return messages
+
+    def __find_matching_symbol(self, num_bits: int, pulsetype: int):
+        for s in self.used_symbols:
+            if s.nbits == num_bits and s.pulsetype == pulsetype:
+                return s
+        return None
+
+    def __create_symbol(self, num_bits, ptype, num_samples, avail_symbol_names):
+        name_index = len(self.used_symbols)
+        if name_index > len(avail_symbol_names) - 1:
+            name_index = len(avail_symbol_names) - 1
+            print(
+                "WARNING:"
+                "Needed more symbols than names were available."
+                "Symbols may be wrong labeled,"
+                "consider extending the symbol alphabet.")
+
+        symbol = Symbol(avail_symbol_names[name_index],
+                        num_bits, ptype, num_samples)
+
+        self.used_symbols.add(symbol)
+        return symbol
@@ -0,0 +1,156 @@
+import os
+
+import numpy as np
+
+
+class MemmapIQ(object):
+    """
+    Lazy, memory mapped access to the samples of an IQ file.
+
+    Nothing is read on construction. Samples are paged in from disk when they are sliced and
+    8 bit formats (.complex16u, .complex16s) are converted to complex64 per requested window,
+    so multi GB captures never have to be held in RAM completely.
+    Slicing returns a numpy array, so windows can be passed directly to the cython functions.
+    """
+
+    CHUNK_SIZE = 2 ** 22  # samples per chunk for chunk wise processing
+
+    FORMATS = {
+        ".complex16u": np.dtype([('r', np.uint8), ('i', np.uint8)]),
+        ".complex16s": np.dtype([('r', np.int8), ('i', np.int8)]),
+    }
+
+    def __init__(self, filename: str, start=0, end=None, component: str = None, raw=None):
+        """
+
+        :param filename: IQ file to map
+        :param start: first sample of this view
+        :param end: end of this view (exclusive), None for end of file
+        :param component: None for complex samples, "real" or "imag" for float32 parts only
+        :param raw: already mapped file, used to share the memory map between views
+        """
+        self.filename = filename
+        self.file_format = os.path.splitext(filename)[1]
+        if raw is None:
+            dtype = self.FORMATS.get(self.file_format, np.dtype(np.complex64))
+            # Copy on write: views are writable for cython memoryviews, but the file is never modified
+            raw = np.memmap(filename, dtype=dtype, mode="c") if os.path.getsize(filename) > 0 \
+                else np.zeros(0, dtype=dtype)
+
+        self.__raw = raw
+        self.component = component
+        self.start = max(0, int(start))
+        self.end = len(raw) if end is None else min(len(raw), max(self.start, int(end)))
+
+    @staticmethod
+    def supports(filename: str) -> bool:
+        return not filename.endswith(".coco") and not filename.endswith(".wav")
+
+    @property
+    def dtype(self):
+        return np.dtype(np.complex64) if self.component is None else np.dtype(np.float32)
+
+    @property
+    def shape(self):
+        return (len(self),)
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def real(self):
+        return MemmapIQ(self.filename, self.start, self.end, component="real", raw=self.__raw)
+
+    @property
+    def imag(self):
+        return MemmapIQ(self.filename, self.start, self.end, component="imag", raw=self.__raw)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step != 1:
+                return self.__convert(self.__raw[self.start + start:self.start + stop:step])
+            return self.__convert(self.__raw[self.start + start:self.start + max(start, stop)])
+
+        try:
+            index = int(item)
+        except TypeError:
+            raise TypeError("MemmapIQ only supports integer and slice indices")
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index {0} is out of bounds for {1} samples".format(item, len(self)))
+
+        return self.__convert(self.__raw[self.start + index:self.start + index + 1])[0]
+
+    def __array__(self, dtype=None):
+        """
+        Materialize the whole view. For complex64 files this is only a view on the memory map.
+
+        """
+        result = self[:]
+        return result if dtype is None else result.astype(dtype)
+
+    def __convert(self, raw: np.ndarray) -> np.ndarray:
+        if self.file_format == ".complex16u":
+            if self.component is None:
+                result = np.empty(len(raw), dtype=np.complex64)
+                result.real = (raw['r'] / 127.5) - 1.0
+                result.imag = (raw['i'] / 127.5) - 1.0
+            else:
+                part = raw['r'] if self.component == "real" else raw['i']
+                result = ((part / 127.5) - 1.0).astype(np.float32)
+        elif self.file_format == ".complex16s":
+            if self.component is None:
+                result = np.empty(len(raw), dtype=np.complex64)
+                result.real = (raw['r'] + 0.5) / 127.5
+                result.imag = (raw['i'] + 0.5) / 127.5
+            else:
+                part = raw['r'] if self.component == "real" else raw['i']
+                result = ((part + 0.5) / 127.5).astype(np.float32)
+        else:
+            if self.component is None:
+                result = raw
+            else:
+                result = raw.real if self.component == "real" else raw.imag
+
+        return np.asarray(result)
+
+    def window(self, start: int, end: int):
+        """
+        Create a view on a part of this data without reading any samples
+
+        :rtype: MemmapIQ
+        """
+        start, end, _ = slice(start, end).indices(len(self))
+        return MemmapIQ(self.filename, self.start + start, self.start + max(start, end),
+                        component=self.component, raw=self.__raw)
+
+    def iter_chunks(self, chunk_size: int = None, start: int = 0, end: int = None):
+        """
+        Iterate over the samples chunk by chunk, so only one chunk needs to be in RAM
+
+        :return: generator of (position of chunk, samples of chunk)
+        """
+        chunk_size = self.CHUNK_SIZE if chunk_size is None else int(chunk_size)
+        end = len(self) if end is None else min(len(self), end)
+        for pos in range(int(start), end, chunk_size):
+            yield pos, self[pos:min(pos + chunk_size, end)]
+
+    def minmax(self) -> tuple:
+        """
+        Minimum and maximum of a real valued view, calculated chunk wise
+
+        """
+        minimum, maximum = float("inf"), float("-inf")
+        for _, chunk in self.iter_chunks():
+            if len(chunk) > 0:
+                minimum = min(minimum, float(np.min(chunk)))
+                maximum = max(maximum, float(np.max(chunk)))
+
+        return (0, 0) if minimum > maximum else (minimum, maximum)
@@ -1,3 +1,4 @@
+import bisect
 import copy
 import math
 import xml.etree.ElementTree as ET
@@ -7,6 +8,7 @@ import numpy as np
 from urh.cythonext.signalFunctions import Symbol
 
 from urh import constants
+from urh.signalprocessing.BitArray import BitArray
 from urh.signalprocessing.ProtocoLabel import ProtocolLabel
 
 from urh.signalprocessing.MessageType import MessageType
@@ -14,6 +16,9 @@ from urh.signalprocessing.encoder import Encoder
 from urh.util.Formatter import Formatter
 from urh.util.Logger import logger
 
+HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+HEX_BYTES = ["{0:x}".format(i) for i in range(256)]
+
 
 class Message(object):
     """
@@ -22,14 +27,15 @@ class Message(object):
 
     __slots__ = ["__plain_bits", "__bit_alignments", "pause", "modulator_indx", "rssi", "participant", "message_type",
                  "absolute_time", "relative_time", "__decoder", "align_labels", "decoding_state",
-                 "fuzz_created", "__decoded_bits", "__encoded_bits", "decoding_errors", "bit_len", "bit_sample_pos"]
+                 "fuzz_created", "__decoded_bits", "__encoded_bits", "decoding_errors", "bit_len", "bit_sample_pos",
+                 "__index_tables"]
 
     def __init__(self, plain_bits, pause: int, message_type: MessageType, rssi=0, modulator_indx=0, decoder=None,
                  fuzz_created=False, bit_sample_pos=None, bit_len=100, participant=None):
         """
 
         :param pause: pause AFTER the message in samples
-        :type plain_bits: list[bool|Symbol]
+        :type plain_bits: list[bool|Symbol] | BitArray
         :type decoder: Encoder
         :type bit_alignment_positions: list of int
         :param bit_alignment_positions: Für Ausrichtung der Hex Darstellung (Leere Liste für Standardverhalten)
@@ -37,7 +43,7 @@ class Message(object):
         :param fuzz_created: message was created through fuzzing
         :return:
         """
-        self.__plain_bits = plain_bits
+        self.__plain_bits = plain_bits if isinstance(plain_bits, BitArray) else BitArray(plain_bits)
         self.pause = pause
         self.modulator_indx = modulator_indx
         self.rssi = rssi
@@ -59,6 +65,7 @@ class Message(object):
         self.__decoded_bits = None
         self.__encoded_bits = None
         self.__bit_alignments = []
+        self.__index_tables = dict()  # (decoded, bits per view index) -> (key, lookup table)
         self.decoding_errors = 0
         self.decoding_state = Encoder.ErrorState.SUCCESS
 
@@ -77,13 +84,13 @@ class Message(object):
     def plain_bits(self):
         """
 
-        :rtype: list[bool|Symbol]
+        :rtype: BitArray
         """
         return self.__plain_bits
 
     @plain_bits.setter
     def plain_bits(self, value):
-        self.__plain_bits = value
+        self.__plain_bits = value if isinstance(value, BitArray) else BitArray(value)
         self.clear_decoded_bits()
         self.clear_encoded_bits()
 
@@ -169,8 +176,10 @@ class Message(object):
     def bits2string(self, bits) -> str:
         """
 
-        :type bits: list[bool|Symbol]
+        :type bits: list[bool|Symbol] | BitArray
         """
+        if isinstance(bits, BitArray):
+            return bits.to_string()
         return "".join(bit.name if type(bit) == Symbol else "1" if bit else "0" for bit in bits)
 
     def string2bits(self, string: str):
@@ -209,14 +218,14 @@ class Message(object):
     def encoded_bits(self):
         """
 
-        :rtype: list[bool|Symbol]
+        :rtype: BitArray
         """
         if self.__encoded_bits is None:
             self.__encoded_bits = []
             start = 0
             encode = self.decoder.encode
             bits = self.plain_bits
-            symbol_indexes = [i for i, b in enumerate(self.plain_bits) if type(b) == Symbol]
+            symbol_indexes = bits.symbol_positions
             for plabel in self.exclude_from_decoding_labels:
                 symindxs = [i for i in symbol_indexes if i in range(start, plabel.start)]
                 tmp = start
@@ -235,6 +244,7 @@ class Message(object):
                 self.__encoded_bits.extend(encode(bits[tmp:si]) + [bits[si]])
                 tmp = si + 1
             self.__encoded_bits.extend(encode(bits[tmp:]))
+            self.__encoded_bits = BitArray(self.__encoded_bits)
         return self.__encoded_bits
 
     @property
@@ -245,70 +255,70 @@ class Message(object):
     def decoded_bits(self):
         """
 
-        :rtype: list[bool|Symbol]
+        :rtype: BitArray
         """
         if self.__decoded_bits is None:
-            self.__decoded_bits = []
-            start = 0
-            code = self.decoder.code  # 0 = decoded, 1 = analyzed
-            # decode = self.decoder.decode
-            # analyze = self.decoder.analyze
-            bits = self.plain_bits
+            decoded_bits = []
             self.decoding_errors = 0
             states = set()
-            self.decoding_state = self.decoder.ErrorState.SUCCESS
-            symbol_indexes = [i for i, b in enumerate(self.plain_bits) if type(b) == Symbol]
-            for plabel in self.exclude_from_decoding_labels:
-                symindxs = [i for i in symbol_indexes if i in range(start, plabel.start)]
-                tmp = start
-                for si in symindxs:
-                    decoded, errors, state = code(True, bits[tmp:si])
+            for bits, decode in self.__decoding_segments():
+                if decode and len(bits):
+                    decoded, errors, state = self.decoder.code(True, bits)
                     states.add(state)
-                    self.__decoded_bits.extend(decoded + [bits[si]])
+                    decoded_bits.extend(decoded)
                     self.decoding_errors += errors
-                    tmp = si + 1
-
+                elif not decode:
+                    decoded_bits.extend(bits)
 
-                decoded, errors, state = code(True, bits[tmp:plabel.start])
-                states.add(state)
-                self.__decoded_bits.extend(decoded)
-                self.decoding_errors += errors
+            states.discard(self.decoder.ErrorState.SUCCESS)
+            self.decoding_state = sorted(states)[0] if states else self.decoder.ErrorState.SUCCESS
+            self.__decoded_bits = BitArray(decoded_bits)
 
-                if plabel.start == -1 or plabel.end == -1:
-                    plabel.start = len(self.__decoded_bits)
-                    plabel.end = plabel.start + (plabel.end - plabel.start)
+        return self.__decoded_bits
 
-                start = plabel.start if plabel.start > start else start  # Überlappende Labels -.-
-                self.__decoded_bits.extend(bits[start:plabel.end])
-                start = plabel.end if plabel.end > start else start  # Überlappende Labels FFS >.<
+    def __decoding_segments(self) -> list:
+        """
+        Split the plain bits in parts, which get decoded, and parts, which are taken over unchanged
+        (symbols and labels excluded from decoding)
 
-            symindxs = [i for i in symbol_indexes if i >= start]
+        :rtype: list of (BitArray, bool)
+        """
+        segments = []
+        start = 0
+        bits = self.plain_bits
+        symbol_indexes = bits.symbol_positions
+        for plabel in self.exclude_from_decoding_labels:
             tmp = start
-            for si in symindxs:
-                decoded, errors, state = code(True, bits[tmp:si])
-                states.add(state)
-                self.__decoded_bits.extend(decoded + [bits[si]])
-                self.decoding_errors += errors
+            for si in (i for i in symbol_indexes if i in range(start, plabel.start)):
+                segments.append((bits[tmp:si], True))
+                segments.append((bits[si:si + 1], False))
                 tmp = si + 1
 
-            decoded, errors, state = code(True, bits[tmp:])
-            states.add(state)
-            self.__decoded_bits.extend(decoded)
-            self.decoding_errors += errors
+            segments.append((bits[tmp:plabel.start], True))
 
-            states.discard(self.decoder.ErrorState.SUCCESS)
-            if len(states) > 0:
-                self.decoding_state = sorted(states)[0]
+            if plabel.start == -1 or plabel.end == -1:
+                # Label is placed at the current position of the decoded bits
+                plabel.start = sum(len(self.decoder.code(True, b)[0]) if decode else len(b) for b, decode in segments)
 
+            start = plabel.start if plabel.start > start else start  # Überlappende Labels -.-
+            segments.append((bits[start:plabel.end], False))
+            start = plabel.end if plabel.end > start else start  # Überlappende Labels FFS >.<
 
-        return self.__decoded_bits
+        tmp = start
+        for si in (i for i in symbol_indexes if i >= start):
+            segments.append((bits[tmp:si], True))
+            segments.append((bits[si:si + 1], False))
+            tmp = si + 1
+
+        segments.append((bits[tmp:], True))
+        return segments
 
     @decoded_bits.setter
     def decoded_bits(self, val):
         """
-        :type val: list[bool|Symbol]
+        :type val: list[bool|Symbol] | BitArray
         """
-        self.__decoded_bits = val
+        self.__decoded_bits = val if val is None or isinstance(val, BitArray) else BitArray(val)
 
     @property
     def decoded_bits_str(self) -> str:
@@ -320,9 +330,8 @@ class Message(object):
 
     @property
     def decoded_bits_buffer(self) -> bytes:
-        bits = [int(b) if isinstance(b, bool) else 1 if b.pulsetype == 1 else 0 for b in self.decoded_bits]
-        # tostring() is a compatibility (numpy<1.9) alias for tobytes(). Despite its name it returns bytes not strings.
-        return np.packbits(bits).tostring()
+        # Symbols are stored with their pulsetype in the packed buffer
+        return self.decoded_bits.tobytes()
 
     @property
     def plain_hex_str(self) -> str:
@@ -347,31 +356,65 @@ class Message(object):
     def __get_bit_range_from_hex_or_ascii_index(self, from_index: int, decoded: bool, is_hex: bool) -> tuple:
         bits = self.decoded_bits if decoded else self.plain_bits
         factor = 4 if is_hex else 8
-        for i in range(len(bits)):
-            if self.__get_hex_ascii_index_from_bit_index(i, decoded, to_hex=is_hex)[0] == from_index:
-                return i, i + factor - 1
+        view_indices = self.__get_index_table(bits, decoded, factor)[0]
+
+        # View indices are sorted, so the first bit belonging to a view index can be looked up directly
+        i = int(np.searchsorted(view_indices, from_index, side="left"))
+        if i < len(view_indices) and view_indices[i] == from_index:
+            return i, i + factor - 1
 
         return len(bits), len(bits)
 
     def __get_hex_ascii_index_from_bit_index(self, bit_index: int, decoded: bool, to_hex: bool) -> tuple:
         bits = self.decoded_bits if decoded else self.plain_bits
         factor = 4 if to_hex else 8
-        result = 0
+        view_indices, alignments, aligned_indices, symbol_positions = self.__get_index_table(bits, decoded, factor)
 
-        last_alignment = 0
-        for ba in self.__bit_alignments:
-            if ba <= bit_index:
-                result += math.ceil((ba - last_alignment) / factor)
-                last_alignment = ba
-            else:
-                break
+        if isinstance(bit_index, (int, np.integer)) and 0 <= bit_index < len(view_indices):
+            result = int(view_indices[bit_index])
+            return result, result
 
-        result += math.floor((bit_index - last_alignment) / factor)
-        nsymbols = len([b for b in bits[:bit_index] if type(b) == Symbol])
-        result += nsymbols
+        k = bisect.bisect_right(alignments, bit_index)
+        last_alignment = alignments[k - 1] if k > 0 else 0
+        result = aligned_indices[k] + math.floor((bit_index - last_alignment) / factor)
+        result += bisect.bisect_left(symbol_positions, bit_index)
 
         return result, result
 
+    def __get_index_table(self, bits: BitArray, decoded: bool, factor: int) -> tuple:
+        """
+        Lookup table from bit index to hex/ascii index, which only depends on the length of the bits,
+        the positions of symbols and the bit alignments. Tables are cached until one of these changes.
+
+        :return: view index for every bit, sorted bit alignments,
+                 view index at each alignment, sorted symbol positions
+        """
+        symbol_positions = bits.symbol_positions
+        key = (len(bits), tuple(symbol_positions), tuple(self.__bit_alignments))
+        try:
+            cached_key, table = self.__index_tables[decoded, factor]
+            if cached_key == key:
+                return table
+        except KeyError:
+            pass
+
+        alignments = list(self.__bit_alignments)
+        aligned_indices = [0]
+        last_alignment = 0
+        for ba in alignments:
+            aligned_indices.append(aligned_indices[-1] + math.ceil((ba - last_alignment) / factor))
+            last_alignment = ba
+
+        bit_indices = np.arange(len(bits), dtype=np.int64)
+        k = np.searchsorted(np.array(alignments, dtype=np.int64), bit_indices, side="right")
+        last_alignments = np.array([0] + alignments, dtype=np.int64)[k]
+        view_indices = np.array(aligned_indices, dtype=np.int64)[k] + (bit_indices - last_alignments) // factor
+        view_indices += np.searchsorted(np.array(symbol_positions, dtype=np.int64), bit_indices, side="left")
+
+        table = (view_indices, alignments, aligned_indices, symbol_positions)
+        self.__index_tables[decoded, factor] = (key, table)
+        return table
+
     def convert_index(self, index: int, from_view: int, to_view: int, decoded: bool):
         if to_view == from_view:
             return index, index
@@ -421,7 +464,7 @@ class Message(object):
                 # Symbol
                 result.append(bitchain)
             else:
-                result.append("".join("{0:x}".format(int(bitchain[i:i + 4], 2)) for i in range(0, len(bitchain), 4)))
+                result.append(HEX_DIGITS[Message.__bitchain_to_values(bitchain, 4)].tobytes().decode("ascii"))
         return "".join(result)
 
     @staticmethod
@@ -437,11 +480,27 @@ class Message(object):
                 # Symbol
                 result.append(bitchain)
             else:
-                byte_proto = "".join("{0:x}".format(int(bitchain[i:i + 8], 2)) for i in range(0, len(bitchain), 8))
-                result.append("".join(chr(int(byte_proto[i:i + 2], 16)) for i in range(0, len(byte_proto) - 1, 2)))
+                # Bytes < 0x10 have only one hex digit here, this is the existing behaviour for ASCII view
+                byte_proto = "".join(map(HEX_BYTES.__getitem__, Message.__bitchain_to_values(bitchain, 8).tolist()))
+                result.append(bytes.fromhex(byte_proto[:len(byte_proto) - len(byte_proto) % 2]).decode("latin-1"))
 
         return "".join(result)
 
+    @staticmethod
+    def __bitchain_to_values(bitchain: str, group_size: int) -> np.ndarray:
+        """
+        Values of the groups of group_size bits of a bitchain, the last group may be shorter
+
+        :type bitchain: str
+        """
+        bits = np.frombuffer(bitchain.encode("ascii"), dtype=np.uint8) - ord("0")
+        full = len(bits) - len(bits) % group_size
+        weights = 1 << np.arange(group_size - 1, -1, -1)
+        values = bits[:full].reshape(-1, group_size).dot(weights)
+        if full < len(bits):
+            values = np.append(values, bits[full:].dot(weights[full - len(bits):]))
+        return values
+
 
     def split(self, decode=True):
         """
@@ -451,8 +510,9 @@ class Message(object):
         """
         start = 0
         result = []
-        message = self.decoded_bits_str if decode else str(self)
-        symbol_indexes = [i for i, b in enumerate(message) if b not in ("0", "1")]
+        bits = self.decoded_bits if decode else self.plain_bits
+        message = bits.to_string()
+        symbol_indexes = bits.symbol_positions
         self.__bit_alignments = set()
         if self.align_labels:
             for l in self.message_type:
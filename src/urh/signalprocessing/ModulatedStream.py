@@ -0,0 +1,61 @@
+import copy
+
+import numpy as np
+
+from urh.signalprocessing.Modulator import Modulator
+from urh.signalprocessing.ProtocolAnalyzerContainer import FuzzedMessages
+
+
+class ModulatedStream(object):
+    """
+    Samples of messages, which are modulated message by message while sending instead of upfront.
+
+    Devices use it in place of the array of samples to send: it has the number of samples as length
+    and returns a new iterator of sample chunks, when called. This is the source format of SendBuffer.
+    """
+
+    def __init__(self, modulators, messages):
+        """
+
+        :type modulators: list of Modulator
+        :param messages: fuzzed messages are created one after another while modulating
+        :type messages: list of urh.signalprocessing.Message.Message | FuzzedMessages
+        """
+        # The worker modulates in its own thread, so it gets its own modulators
+        self.modulators = [copy.copy(modulator) for modulator in modulators]
+        for modulator in self.modulators:
+            modulator.modulated_samples = None
+
+        # Copies keep the stream independent of later edits, fuzzed messages are copied without creating them
+        self.messages = copy.copy(messages)
+        if isinstance(self.messages, FuzzedMessages):
+            representatives = self.messages.representatives()
+        else:
+            representatives = [(msg, 1) for msg in self.messages]
+
+        self.__num_samples = sum(n * self.modulators[msg.modulator_indx].get_num_samples(msg.encoded_bits, msg.pause)
+                                 for msg, n in representatives)
+
+    def __len__(self):
+        return self.__num_samples
+
+    def __call__(self):
+        return Modulator.iter_modulated_messages(self.modulators, self.messages)
+
+    def modulate(self, max_samples=None) -> np.ndarray:
+        """
+        Modulate the stream into an array, e.g. for a preview
+
+        :param max_samples: only modulate the messages needed for the first max_samples samples
+        """
+        if max_samples is None or max_samples >= len(self):
+            return Modulator.modulate_messages(self.modulators, self.messages)
+
+        chunks, num_samples = [], 0
+        for chunk in self():
+            chunks.append(chunk)
+            num_samples += len(chunk)
+            if num_samples >= max_samples:
+                break
+
+        return np.concatenate(chunks)[:max_samples] if chunks else np.empty(0, dtype=np.complex64)
@@ -1,14 +1,10 @@
 import locale
 
 import numpy as np
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPen
-from PyQt5.QtWidgets import QGraphicsScene
 
 from urh import constants
-from urh.cythonext import path_creator
 from urh.cythonext.signalFunctions import Symbol
-from urh.ui.ZoomableScene import ZoomableScene
+from urh.signalprocessing.BitArray import BitArray
 from urh.util.Formatter import Formatter
 
 import xml.etree.ElementTree as ET
@@ -120,7 +116,17 @@ class Modulator(object):
         return y.astype(np.float32)
 
     @property
-    def data_scene(self) -> QGraphicsScene:
+    def data_scene(self):
+        """
+
+        :rtype: QGraphicsScene
+        """
+        # Qt is only imported for drawing, so modulators can be used without Qt, e.g. in urh-cli
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtGui import QPen
+        from urh.cythonext import path_creator
+        from urh.ui.ZoomableScene import ZoomableScene
+
         ones = np.ones(self.samples_per_bit, dtype=np.float32) * 1
         zeros = np.ones(self.samples_per_bit, dtype=np.float32) * -1
         n = self.samples_per_bit * len(self.display_bits)
@@ -140,7 +146,34 @@ class Modulator(object):
         scene.addPath(path, QPen(constants.LINECOLOR, Qt.FlatCap))
         return scene
 
-    def modulate(self, data=None, pause=0, start=0):
+    def get_bit_lengths(self, data) -> tuple:
+        """
+        Logical value and number of samples for each bit, symbols are modulated with their pulse type
+
+        :type data: BitArray | list of bool | list of Symbol
+        :rtype: (np.ndarray, np.ndarray)
+        """
+        if isinstance(data, BitArray):
+            bits, symbols = data.to_numpy().astype(bool), data.symbols
+        else:
+            symbols = {i: bit for i, bit in enumerate(data) if type(bit) == Symbol}
+            bits = np.fromiter((bit.pulsetype == 1 if type(bit) == Symbol else bit for bit in data),
+                               dtype=bool, count=len(data))
+
+        lengths = np.full(len(bits), int(self.samples_per_bit), dtype=np.int64)
+        for i, symbol in symbols.items():
+            lengths[i] = int(symbol.nsamples)
+        return bits, lengths
+
+    def get_num_samples(self, data, pause=0) -> int:
+        return int(self.get_bit_lengths(data)[1].sum()) + int(pause)
+
+    def modulate(self, data=None, pause=0, start=0, out=None):
+        """
+
+        :param start: Sample position of the message, the time of the carrier continues from there
+        :param out: Array with get_num_samples(data, pause) elements to write the modulated samples to
+        """
         assert pause >= 0
         if data is None:
             data = self.data
@@ -148,30 +181,24 @@ class Modulator(object):
             self.data = data
 
         mod_type = self.MODULATION_TYPES[self.modulation_type]
-        total_samples = int(sum(bit.nsamples if type(bit) == Symbol else self.samples_per_bit for bit in data) + pause)
-
-        self.modulated_samples = np.zeros(total_samples, dtype=np.complex64)
+        bits, lengths = self.get_bit_lengths(data)
+        num_data_samples = int(lengths.sum())
+        total_samples = num_data_samples + int(pause)
 
-        # Lets build a param_vector
-        param_vector = np.empty(total_samples - pause, dtype=np.float64)
-        sample_pos = 0
-
-        for i, bit in enumerate(data):
-            if type(bit) == Symbol:
-                samples_per_bit = int(bit.nsamples)
-                log_bit = True if bit.pulsetype == 1 else False
-            else:
-                log_bit = bit
-                samples_per_bit = int(self.samples_per_bit)
+        if out is None:
+            self.modulated_samples = np.zeros(total_samples, dtype=np.complex64)
+        else:
+            assert len(out) == total_samples
+            self.modulated_samples = out
+            out[num_data_samples:] = 0
 
-            if mod_type == "FSK" or mod_type == "GFSK":
-                param = 1 if log_bit else -1
-            else:
-                param = self.param_for_one if log_bit else self.param_for_zero
-            param_vector[sample_pos:sample_pos + samples_per_bit] = np.full(samples_per_bit, param, dtype=np.float64)
-            sample_pos += samples_per_bit
+        if mod_type == "FSK" or mod_type == "GFSK":
+            params = np.where(bits, 1.0, -1.0)
+        else:
+            params = np.where(bits, float(self.param_for_one), float(self.param_for_zero))
+        param_vector = np.repeat(params, lengths)
 
-        t = np.arange(start, start + total_samples - pause) / self.sample_rate
+        t = np.arange(start, start + num_data_samples) / self.sample_rate
         a = param_vector / 100 if mod_type == "ASK" else self.carrier_amplitude
         phi = param_vector * (np.pi / 180) if mod_type == "PSK" else self.carrier_phase_deg * (np.pi / 180)
 
@@ -189,15 +216,59 @@ class Modulator(object):
             f = fmid + dist * param_vector
 
             # sin(2*pi*f_1*t_1 + phi_1) = sin(2*pi*f_2*t_1 + phi_2) <=> phi_2 = 2*pi*t_1*(f_1 - f_2) + phi_1
+            # Correct the phase to prevent spiky jumps, the phase corrections accumulate over the message
             phi = np.empty(len(f))
-            phi[0] = self.carrier_phase_deg
-            for i in range(0, len(phi) - 1):
-                phi[i + 1] = 2 * np.pi * t[i] * (f[i] - f[i + 1]) + phi[i]  # Correct the phase to prevent spiky jumps
+            if len(phi) > 0:
+                phi[0] = self.carrier_phase_deg
+                phi[1:] = 2 * np.pi * t[:-1] * (f[:-1] - f[1:])
+                np.cumsum(phi, out=phi)
         else:
             f = self.carrier_freq_hz
 
         arg = ((2 * np.pi * f * t + phi) * 1j).astype(np.complex64)
-        self.modulated_samples[:total_samples - pause] = a * np.exp(arg)
+        self.modulated_samples[:num_data_samples] = a * np.exp(arg)
+
+    @staticmethod
+    def modulate_messages(modulators, messages, progress_callback=None) -> np.ndarray:
+        """
+        Modulate messages one after another into one preallocated array
+
+        :type modulators: list of Modulator
+        :type messages: list of urh.signalprocessing.Message.Message
+        :param progress_callback: called with the number of modulated messages
+        """
+        encoded_bits = [msg.encoded_bits for msg in messages]
+        lengths = [modulators[msg.modulator_indx].get_num_samples(bits, msg.pause)
+                   for msg, bits in zip(messages, encoded_bits)]
+        offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+        result = np.empty(int(offsets[-1]), dtype=np.complex64)
+
+        for i, msg in enumerate(messages):
+            pos = int(offsets[i])
+            modulators[msg.modulator_indx].modulate(start=pos, data=encoded_bits[i], pause=msg.pause,
+                                                    out=result[pos:pos + lengths[i]])
+            if progress_callback is not None:
+                progress_callback(i + 1)
+
+        return result
+
+    @staticmethod
+    def iter_modulated_messages(modulators, messages):
+        """
+        Modulate messages on demand, e.g. for streaming fuzzed messages to a device
+
+        :type modulators: list of Modulator
+        :param messages: iterable of Message, may be a generator
+        :return: generator of the modulated samples per message
+        """
+        pos = 0
+        for msg in messages:
+            modulator = modulators[msg.modulator_indx]
+            encoded_bits = msg.encoded_bits
+            samples = np.empty(modulator.get_num_samples(encoded_bits, msg.pause), dtype=np.complex64)
+            modulator.modulate(start=pos, data=encoded_bits, pause=msg.pause, out=samples)
+            pos += len(samples)
+            yield samples
 
     def gauss_fir(self, bt=0.5, filter_width=1):
         """
@@ -0,0 +1,197 @@
+import numpy as np
+
+from urh.signalprocessing.MemmapIQ import MemmapIQ
+
+
+class PieceTable(object):
+    """
+    Sample storage for editing signals.
+
+    The samples are a sequence of pieces, each one referencing a range of an unchanged source
+    (numpy array or :class:`MemmapIQ`) or standing for a run of zeros, e.g. a muted range.
+    Inserting, deleting, muting and cropping only rearrange pieces into a new table, so editing and undoing
+    costs O(number of pieces) no matter how many samples the signal has.
+    Samples are only copied, when they are sliced or the table is materialized with np.asarray.
+    """
+
+    CHUNK_SIZE = MemmapIQ.CHUNK_SIZE  # samples per chunk for chunk wise processing
+
+    def __init__(self, pieces=(), dtype=np.complex64):
+        """
+
+        :param pieces: list of (source, start, end), a source of None stands for zeros
+        """
+        merged = []
+        for source, start, end in pieces:
+            start, end = int(start), int(end)
+            if end <= start:
+                continue
+            if merged and merged[-1][0] is source and merged[-1][2] == start:
+                # Join adjacent ranges of the same source, e.g. when a deletion is undone
+                merged[-1] = (source, merged[-1][1], end)
+            else:
+                merged.append((source, start, end))
+
+        self.pieces = tuple(merged)
+        self.dtype = np.dtype(dtype)
+        self.__offsets = np.cumsum([0] + [end - start for _, start, end in self.pieces])
+
+    @classmethod
+    def from_data(cls, data):
+        """
+        Create a table with a single piece for the data, a table is returned as it is
+
+        :type data: np.ndarray | MemmapIQ | PieceTable
+        :rtype: PieceTable
+        """
+        if isinstance(data, PieceTable):
+            return data
+        return cls([(data, 0, len(data))], dtype=data.dtype)
+
+    @classmethod
+    def zeros(cls, length: int, dtype=np.complex64):
+        return cls([(None, 0, length)], dtype=dtype)
+
+    @property
+    def shape(self):
+        return (len(self),)
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def num_pieces(self) -> int:
+        return len(self.pieces)
+
+    @property
+    def memory_mapped(self) -> bool:
+        return any(isinstance(source, MemmapIQ) for source, _, _ in self.pieces)
+
+    @property
+    def real(self):
+        return self.__component("real")
+
+    @property
+    def imag(self):
+        return self.__component("imag")
+
+    def __len__(self):
+        return int(self.__offsets[-1])
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step != 1:
+                return self.__read(0, len(self))[item]
+            return self.__read(start, max(start, stop))
+
+        try:
+            index = int(item)
+        except TypeError:
+            raise TypeError("PieceTable only supports integer and slice indices")
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index {0} is out of bounds for {1} samples".format(item, len(self)))
+
+        i = int(np.searchsorted(self.__offsets, index, side="right")) - 1
+        source, start, _ = self.pieces[i]
+        if source is None:
+            return self.dtype.type(0)
+        return source[start + index - int(self.__offsets[i])]
+
+    def __array__(self, dtype=None):
+        """
+        Materialize all samples. A table with a single piece of an array returns a view without copying.
+
+        """
+        result = self[:]
+        return result if dtype is None else result.astype(dtype)
+
+    def window(self, start: int, end: int):
+        """
+        Table for the samples from start to end without reading any samples
+
+        :rtype: PieceTable
+        """
+        start, end, _ = slice(start, end).indices(len(self))
+        end = max(start, end)
+
+        pieces = []
+        first = int(np.searchsorted(self.__offsets, start, side="right")) - 1
+        for i in range(max(first, 0), len(self.pieces)):
+            offset = int(self.__offsets[i])
+            if offset >= end:
+                break
+            source, piece_start, piece_end = self.pieces[i]
+            pieces.append((source, piece_start + max(start - offset, 0), min(piece_end, piece_start + end - offset)))
+
+        return PieceTable(pieces, dtype=self.dtype)
+
+    def splice(self, start: int, end: int, data=None):
+        """
+        Table with the samples from start to end replaced by data
+
+        :param data: samples to insert, None to delete the range
+        :type data: np.ndarray | MemmapIQ | PieceTable
+        :rtype: PieceTable
+        """
+        inserted = () if data is None or len(data) == 0 else PieceTable.from_data(data).pieces
+        return PieceTable(self.window(0, start).pieces + inserted + self.window(end, len(self)).pieces,
+                          dtype=self.dtype)
+
+    def insert(self, index: int, data):
+        return self.splice(index, index, data)
+
+    def delete(self, start: int, end: int):
+        return self.splice(start, end)
+
+    def mute(self, start: int, end: int):
+        return self.splice(start, end, PieceTable.zeros(len(self.window(start, end)), dtype=self.dtype))
+
+    def iter_chunks(self, chunk_size: int = None, start: int = 0, end: int = None):
+        """
+        Iterate over the samples chunk by chunk, so only one chunk needs to be in RAM
+
+        :return: generator of (position of chunk, samples of chunk)
+        """
+        chunk_size = self.CHUNK_SIZE if chunk_size is None else int(chunk_size)
+        end = len(self) if end is None else min(len(self), end)
+        for pos in range(int(start), end, chunk_size):
+            yield pos, self[pos:min(pos + chunk_size, end)]
+
+    def minmax(self) -> tuple:
+        """
+        Minimum and maximum of a real valued table, calculated chunk wise
+
+        """
+        minimum, maximum = float("inf"), float("-inf")
+        for _, chunk in self.iter_chunks():
+            if len(chunk) > 0:
+                minimum = min(minimum, float(np.min(chunk)))
+                maximum = max(maximum, float(np.max(chunk)))
+
+        return (0, 0) if minimum > maximum else (minimum, maximum)
+
+    def __read(self, start: int, end: int) -> np.ndarray:
+        pieces = self.window(start, end).pieces
+        if len(pieces) == 1 and pieces[0][0] is not None:
+            source, piece_start, piece_end = pieces[0]
+            return np.asarray(source[piece_start:piece_end])
+
+        result = np.empty(end - start, dtype=self.dtype)
+        pos = 0
+        for source, piece_start, piece_end in pieces:
+            length = piece_end - piece_start
+            if source is None:
+                result[pos:pos + length] = 0
+            else:
+                result[pos:pos + length] = source[piece_start:piece_end]
+            pos += length
+        return result
+
+    def __component(self, name: str):
+        pieces = [(None if source is None else getattr(source, name), start, end) for source, start, end in self.pieces]
+        return PieceTable(pieces, dtype=np.zeros(0, dtype=self.dtype).real.dtype)
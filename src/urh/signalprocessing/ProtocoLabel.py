@@ -1,8 +1,8 @@
 from enum import Enum
 
-from PyQt5.QtCore import Qt
 import xml.etree.ElementTree as ET
 
+from urh import constants
 from urh.signalprocessing.FieldType import FieldType
 from urh.signalprocessing.Interval import Interval
 from urh.util.Formatter import Formatter
@@ -26,9 +26,9 @@ class ProtocolLabel(object):
 
         self.apply_decoding = True
         self.color_index = color_index
-        self.show = Qt.Checked
+        self.show = constants.CHECKED
 
-        self.fuzz_me = Qt.Checked
+        self.fuzz_me = constants.CHECKED
         self.fuzz_values = []
 
         self.fuzz_created = fuzz_created
@@ -134,8 +134,8 @@ class ProtocolLabel(object):
 
         result = ProtocolLabel(name=name, start=start, end=end, color_index=color_index)
         result.apply_decoding = True if tag.get("apply_decoding", 'True') == "True" else False
-        result.show = Qt.Checked if Formatter.str2val(tag.get("show", 0), int) else Qt.Unchecked
-        result.fuzz_me = Qt.Checked if Formatter.str2val(tag.get("fuzz_me", 0), int) else Qt.Unchecked
+        result.show = constants.CHECKED if Formatter.str2val(tag.get("show", 0), int) else constants.UNCHECKED
+        result.fuzz_me = constants.CHECKED if Formatter.str2val(tag.get("fuzz_me", 0), int) else constants.UNCHECKED
         result.fuzz_values = tag.get("fuzz_values", "").split(",")
         result.display_format_index = int(tag.get("display_format_index", 0))
         result.auto_created =  True if tag.get("auto_created", 'False') == "True" else False
@@ -1,7 +1,7 @@
 import copy
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal, Qt
@@ -11,9 +11,13 @@ from urh.awre.FormatFinder import FormatFinder
 from urh.cythonext import signalFunctions
 from urh.cythonext.signalFunctions import Symbol
 
+from urh.signalprocessing.Demodulator import Demodulator
 from urh.signalprocessing.MessageType import MessageType
 from urh.signalprocessing.Modulator import Modulator
 from urh.signalprocessing.Participant import Participant
+from urh.signalprocessing.ProtocolDelta import ProtocolDelta
+from urh.signalprocessing.Ruleset import Ruleset
+from urh.signalprocessing.BinaryProtocolFile import BinaryProtocolFile
 from urh.signalprocessing.Message import Message
 from urh.signalprocessing.Signal import Signal
 from urh.signalprocessing.encoder import Encoder
@@ -39,6 +43,8 @@ class ProtocolAnalyzer(object):
     This class offers several methods for protocol analysis.
     """
 
+    MAX_CACHED_DIFFS = 8
+
     def __init__(self, signal: Signal):
         self.messages = []
         """:type: list of Message """
@@ -58,6 +64,9 @@ class ProtocolAnalyzer(object):
 
         self.message_types = [MessageType("default")]
 
+        self.__diff_cache = OrderedDict()  # (refindex, view) -> (reference, messages, differences)
+        self.__pulse_cache = None  # (demodulated samples, signal parameters, pulse lengths)
+
     @property
     def default_message_type(self) -> MessageType:
         if len(self.message_types) == 0:
@@ -147,6 +156,15 @@ class ProtocolAnalyzer(object):
     def num_messages(self):
         return len([msg for msg in self.messages if msg])
 
+    @property
+    def stored_messages(self):
+        """
+        Messages which exist as objects, subclasses may create further messages on demand
+
+        :rtype: list of Message
+        """
+        return self.messages
+
     def clear_decoded_bits(self):
         [msg.clear_decoded_bits() for msg in self.messages]
 
@@ -219,159 +237,40 @@ class ProtocolAnalyzer(object):
         else:
             self.messages = []
 
-        bit_len = signal.bit_len
-
-        rel_symbol_len = self._read_symbol_len()
-        self.used_symbols.clear()
+        demodulator = Demodulator(bit_len=signal.bit_len, rel_symbol_len=self._read_symbol_len(),
+                                  used_symbols=self.used_symbols)
 
-        ppseq = signalFunctions.grab_pulse_lens(signal.qad,
-                                                signal.qad_center,
-                                                signal.tolerance,
-                                                signal.modulation_type)
+        ppseq = self.grab_pulse_lens()
+        self.__pulse_cache = None  # Samples may be edited in place later, e.g. when muting
 
-        bit_data, pauses, bit_sample_pos = self._ppseq_to_bits(ppseq, bit_len, rel_symbol_len)
-
-        i = 0
-        for bits, pause in zip(bit_data, pauses):
-            middle_bit_pos = bit_sample_pos[i][int(len(bits) / 2)]
-            start, end = middle_bit_pos, middle_bit_pos + bit_len
-            rssi = np.mean(np.abs(signal._fulldata[start:end]))
-            message = Message(bits, pause, message_type=self.default_message_type,
-                              bit_len=bit_len, rssi=rssi, decoder=self.decoder, bit_sample_pos=bit_sample_pos[i])
-            self.messages.append(message)
-            i += 1
+        self.messages.extend(demodulator.create_messages(signal._fulldata, ppseq,
+                                                         self.default_message_type, self.decoder))
 
         self.qt_signals.protocol_updated.emit()
 
-    def _read_symbol_len(self):
-        settings = constants.SETTINGS
-        if 'rel_symbol_length' in settings.allKeys():
-            rel_symbol_len = settings.value('rel_symbol_length', type=int) / 200
-        else:
-            rel_symbol_len = 0.1
-        return rel_symbol_len
+    def grab_pulse_lens(self):
+        """
+        Demodulate the signal and grab the pulse lengths.
+        The result is kept for the next call of get_protocol_from_signal as long as the demodulation
+        and parameters of the signal do not change, so this can run in a background thread beforehand.
 
-    def _ppseq_to_bits(self, ppseq, bit_len: int, rel_symbol_len: float, write_bit_sample_pos=True):
-        self.used_symbols.clear()
-        bit_sampl_pos = []
-        bit_sample_positions = []
-
-        data_bits = []
-        resulting_data_bits = []
-        pauses = []
-        start = 0
-        total_samples = 0
-
-        pause_type = 42
-        zero_pulse_type = 0
-        one_pulse_type = 1
-
-        there_was_data = False
-        lower_bit_bound = 0.5 - rel_symbol_len
-        upper_bit_bound = 0.5 + rel_symbol_len
-        avail_symbol_names = constants.SYMBOL_NAMES
-
-        if len(ppseq) > 0 and ppseq[0, 0] == pause_type:
-            start = 1  # Starts with Pause
-            total_samples = ppseq[0, 1]
-
-        for i in range(start, len(ppseq)):
-            cur_pulse_type = ppseq[i, 0]
-            num_samples = ppseq[i, 1]
-            num_bits_floated = num_samples / bit_len
-            num_bits = int(num_bits_floated)
-            decimal_place = num_bits_floated - num_bits
-
-            if decimal_place > upper_bit_bound:
-                num_bits += 1
-            elif lower_bit_bound < decimal_place < upper_bit_bound and \
-                    (not cur_pulse_type == pause_type or num_bits < 9):
-                ptype = 1 if cur_pulse_type == one_pulse_type else 0
-                if not there_was_data:
-                    there_was_data = bool(ptype)
-
-                symbol = self.__find_matching_symbol(num_bits, ptype)
-                if symbol is None:
-                    symbol = self.__create_symbol(num_bits, ptype,
-                                                  num_samples,
-                                                  avail_symbol_names)
-
-                data_bits.append(symbol)
-                if write_bit_sample_pos:
-                    bit_sampl_pos.append(total_samples)
-
-                total_samples += num_samples
-                continue
+        """
+        signal = self.signal
+        qad = signal.qad
+        parameters = (signal.qad_center, signal.tolerance, signal.modulation_type)
+        if self.__pulse_cache is not None and self.__pulse_cache[0] is qad and self.__pulse_cache[1] == parameters:
+            return self.__pulse_cache[2]
 
-            if cur_pulse_type == pause_type:
-                # OOK abdecken
-                if num_bits < 9:
-                    data_bits.extend([False] * num_bits)
-                    if write_bit_sample_pos:
-                        bit_sampl_pos.extend([total_samples + k * bit_len for k in range(num_bits)])
+        ppseq = signalFunctions.grab_pulse_lens(qad, *parameters)
+        self.__pulse_cache = (qad, parameters, ppseq)
+        return ppseq
 
-                elif not there_was_data:
-                    # Ignore this pause, if there were no informations
-                    # transmittted previously
-                    data_bits[:] = []
-                    bit_sampl_pos[:] = []
+    def _read_symbol_len(self):
+        return Demodulator.read_rel_symbol_len()
 
-                else:
-                    if write_bit_sample_pos:
-                        bit_sampl_pos.append(total_samples)
-                        bit_sampl_pos.append(total_samples + num_samples)
-                        bit_sample_positions.append(bit_sampl_pos[:])
-                        bit_sampl_pos[:] = []
-
-                    resulting_data_bits.append(data_bits[:])
-                    data_bits[:] = []
-                    pauses.append(num_samples)
-                    there_was_data = False
-
-            elif cur_pulse_type == zero_pulse_type:
-                data_bits.extend([False] * num_bits)
-                if write_bit_sample_pos:
-                    bit_sampl_pos.extend([total_samples + k * bit_len for k in range(num_bits)])
-
-            elif cur_pulse_type == one_pulse_type:
-                if not there_was_data:
-                    there_was_data = num_bits > 0
-                data_bits.extend([True] * num_bits)
-                if write_bit_sample_pos:
-                    bit_sampl_pos.extend([total_samples + k * bit_len for k in range(num_bits)])
-
-            total_samples += num_samples
-
-        if there_was_data:
-            resulting_data_bits.append(data_bits[:])
-            if write_bit_sample_pos:
-                bit_sample_positions.append(bit_sampl_pos[:] + [total_samples])
-            pause = ppseq[-1, 1] if ppseq[-1, 0] == pause_type else 0
-            pauses.append(pause)
-
-        return resulting_data_bits, pauses, bit_sample_positions
-
-    def __find_matching_symbol(self, num_bits: int, pulsetype: int):
-        for s in self.used_symbols:
-            if s.nbits == num_bits and s.pulsetype == pulsetype:
-                return s
-        return None
-
-    def __create_symbol(self, num_bits, ptype, num_samples, avail_symbol_names):
-        name_index = len(self.used_symbols)
-        if name_index > len(avail_symbol_names) - 1:
-            name_index = len(avail_symbol_names) - 1
-            print(
-                "WARNING:"
-                "Needed more symbols than names were available."
-                "Symbols may be wrong labeled,"
-                "consider extending the symbol alphabet.")
-
-        symbol = Symbol(avail_symbol_names[name_index],
-                        num_bits, ptype, num_samples)
-
-        self.used_symbols.add(symbol)
-        return symbol
+    def _ppseq_to_bits(self, ppseq, bit_len: int, rel_symbol_len: float, write_bit_sample_pos=True):
+        demodulator = Demodulator(bit_len=bit_len, rel_symbol_len=rel_symbol_len, used_symbols=self.used_symbols)
+        return demodulator.pulses_to_bits(ppseq, write_bit_sample_pos)
 
     def get_samplepos_of_bitseq(self, startmessage: int, startindex: int,
                                 endmessage: int, endindex: int,
@@ -451,13 +350,23 @@ class ProtocolAnalyzer(object):
         last_index = len(lookup[last_message]) - 1
         return start_message, start_index, last_message, last_index
 
-    def delete_messages(self, msg_start: int, msg_end: int, start: int, end: int, view: int, decoded: bool):
+    def delete_messages(self, msg_start: int, msg_end: int, start: int, end: int, view: int, decoded: bool,
+                        delta: ProtocolDelta = None):
+        """
+
+        :param delta: if given, the changes are recorded in this delta, so they can be undone
+        """
         removable_msg_indices = []
+        if delta is not None:
+            delta.save_messages(self, msg_start, msg_end + 1)
 
         for i in range(msg_start, msg_end + 1):
             try:
                 self.messages[i].clear_decoded_bits()
                 bs, be = self.convert_range(start, end, view, 0, decoded, message_indx=i)
+                if delta is not None:
+                    delta.save_labels(self.messages[i].message_type)
+                    delta.save_bits(self.messages[i], bs, be + 1)
                 del self.messages[i][bs:be + 1]
                 if len(self.messages[i]) == 0:
                     removable_msg_indices.append(i)
@@ -499,56 +408,90 @@ class ProtocolAnalyzer(object):
 
         return self.messages[message_indx].convert_range(index1, index2, from_view, to_view, decoded)
 
-    def find_differences(self, refindex: int, view: int):
+    def find_differences(self, refindex: int, view: int, proto=None):
         """
-        Search all differences between protocol messages regarding a reference message
+        Search all differences between protocol messages regarding a reference message.
+        Results are cached per (refindex, view), so only rows whose content changed are compared again.
 
         :param refindex: index of reference message
-        :rtype: dict[int, set[int]]
+        :param proto: strings of the decoded messages in this view, if already calculated
+        :rtype: dict[int, frozenset[int]]
         """
         differences = defaultdict(set)
 
         if refindex >= len(self.messages):
             return differences
 
-        if view == 0:
-            proto = self.decoded_proto_bits_str
-        elif view == 1:
-            proto = self.decoded_hex_str
-        elif view == 2:
-            proto = self.decoded_ascii_str
-        else:
-            return differences
+        if proto is None:
+            if view == 0:
+                proto = self.decoded_proto_bits_str
+            elif view == 1:
+                proto = self.decoded_hex_str
+            elif view == 2:
+                proto = self.decoded_ascii_str
+            else:
+                return differences
 
         refmessage = proto[refindex]
-        len_refmessage = len(refmessage)
+        cached_ref, cached_rows, cached_diffs = self.__diff_cache.pop((refindex, view), (None, [], dict()))
+        if cached_ref != refmessage:
+            cached_rows, cached_diffs = [], dict()
 
+        changed = []
         for i, message in enumerate(proto):
             if i == refindex:
                 continue
+            if i < len(cached_rows) and cached_rows[i] == message:
+                differences[i] = cached_diffs[i]
+            else:
+                changed.append(i)
 
-            diff_cols = set()
+        for i, diff_cols in zip(changed, self.__compare_rows(refmessage, [proto[i] for i in changed])):
+            differences[i] = diff_cols
 
-            for j, value in enumerate(message):
-                if j >= len_refmessage:
-                    break
+        self.__diff_cache[(refindex, view)] = (refmessage, list(proto), dict(differences))
+        while len(self.__diff_cache) > self.MAX_CACHED_DIFFS:
+            self.__diff_cache.popitem(last=False)
 
-                if value != refmessage[j]:
-                    diff_cols.add(j)
+        return differences
 
-            len_message = len(message)
-            if len_message != len_refmessage:
-                len_diff = abs(len_refmessage - len_message)
-                start = len_refmessage
-                if len_refmessage > len_message:
-                    start = len_message
-                end = start + len_diff
-                for k in range(start, end):
-                    diff_cols.add(k)
+    @staticmethod
+    def __compare_rows(refmessage: str, messages: list, max_cells=2 ** 24) -> list:
+        """
+        Compare messages against the reference message as padded arrays of character codes.
+        Columns beyond the end of the shorter message count as difference.
 
-            differences[i] = diff_cols
+        :type messages: list of str
+        :rtype: list of frozenset[int]
+        """
+        if len(messages) == 0:
+            return []
 
-        return differences
+        width = max(len(refmessage), max(len(message) for message in messages))
+        reference = np.zeros(width, dtype=np.uint32)
+        reference[:len(refmessage)] = np.frombuffer(refmessage.encode("utf-32-le"), dtype=np.uint32)
+        columns = np.arange(width)
+
+        result = []
+        rows_per_chunk = max(1, max_cells // max(1, width))
+        for chunk_start in range(0, len(messages), rows_per_chunk):
+            chunk = messages[chunk_start:chunk_start + rows_per_chunk]
+            lengths = np.fromiter(map(len, chunk), dtype=np.int64, count=len(chunk))
+            row_indices = np.repeat(np.arange(len(chunk)), lengths)
+            col_indices = np.arange(len(row_indices)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+            codes = np.zeros((len(chunk), width), dtype=np.uint32)
+            codes[row_indices, col_indices] = np.frombuffer("".join(chunk).encode("utf-32-le"), dtype=np.uint32)
+
+            common = np.minimum(lengths, len(refmessage))[:, np.newaxis]
+            longest = np.maximum(lengths, len(refmessage))[:, np.newaxis]
+            diff = ((codes != reference) & (columns < common)) | ((columns >= common) & (columns < longest))
+
+            diff_rows, diff_cols = np.nonzero(diff)
+            bounds = np.cumsum(np.bincount(diff_rows, minlength=len(chunk)))[:-1]
+            result.extend(frozenset(cols.tolist()) for cols in np.split(diff_cols, bounds))
+
+        return result
 
     def estimate_frequency_for_one(self, sample_rate: float, nbits=42) -> float:
         """
@@ -767,6 +710,37 @@ class ProtocolAnalyzer(object):
         root = tree.getroot()
         self.from_xml_tag(root, read_bits=read_bits)
 
+    def to_binary_file(self, filename: str):
+        """
+        Save the messages in the binary protocol format, which is much faster to read and write than XML
+
+        """
+        BinaryProtocolFile(filename).write(self.messages, modulators=getattr(self, "modulators", None))
+
+    def from_binary_file(self, filename: str):
+        binary_file = BinaryProtocolFile(filename)
+        try:
+            messages = binary_file.load()
+        except (OSError, ValueError) as e:
+            logger.error("Could not read binary protocol file {0}: {1}".format(filename, e))
+            return
+
+        if binary_file.modulators and hasattr(self, "modulators"):
+            self.modulators[:] = binary_file.modulators
+
+        self.used_symbols.clear()
+        self.used_symbols.update(binary_file.symbols)
+
+        message_types = {message_type.id: message_type for message_type in self.message_types}
+        for message_type in binary_file.message_types:
+            if message_type.id not in message_types:
+                self.message_types.append(message_type)
+                message_types[message_type.id] = message_type
+
+        for message in messages:
+            message.message_type = message_types[message.message_type.id]
+        self.messages[:] = messages
+
     def destroy(self):
         try:
             for message_type in self.message_types:
@@ -776,12 +750,21 @@ class ProtocolAnalyzer(object):
         self.message_types = []
         self.messages = None
 
-    def update_auto_message_types(self):
-        for message in self.messages:
-            for message_type in (msg_type for msg_type in self.message_types if msg_type.assigned_by_ruleset):
-                if message_type.ruleset.applies_for_message(message):
-                    message.message_type = message_type
-                    break
+    def update_auto_message_types(self, start=0):
+        """
+        Assign the message types with rulesets to the messages, all messages are evaluated in one batch
+
+        :param start: index of the first message to classify, e.g. to classify only newly sniffed messages
+        """
+        message_types = [msg_type for msg_type in self.message_types if msg_type.assigned_by_ruleset]
+        if len(message_types) == 0 or self.messages is None:
+            return
+
+        messages = self.messages[start:]
+        assignments = Ruleset.classify(messages, [msg_type.ruleset for msg_type in message_types])
+        for message, i in zip(messages, assignments.tolist()):
+            if i != -1:
+                message.message_type = message_types[i]
 
     def auto_assign_participants(self, participants):
         """
@@ -1,11 +1,12 @@
+import bisect
 import copy
 import itertools
 import xml
+from collections import OrderedDict
+from collections.abc import MutableSequence, Sequence
 from xml.dom import minidom
 import xml.etree.ElementTree as ET
 
-import numpy
-
 from urh.cythonext.signalFunctions import Symbol
 from urh.models.ProtocolTreeItem import ProtocolTreeItem
 from urh.signalprocessing.Modulator import Modulator
@@ -44,13 +45,67 @@ class ProtocolAnalyzerContainer(ProtocolAnalyzer):
 
     @property
     def protocol_labels(self):
-        result = list(set(lbl for msg in self.messages for lbl in msg.message_type))
+        result = list(set(lbl for message_type in self.used_message_types for lbl in message_type))
         result.sort()
         return result
 
     @property
     def multiple_fuzz_labels_per_message(self):
-        return any(len(msg.active_fuzzing_labels) > 1 for msg in self.messages)
+        return any(sum(1 for lbl in message_type if lbl.active_fuzzing) > 1
+                   for message_type in self.used_message_types)
+
+    @property
+    def used_message_types(self):
+        """
+        Message types of the messages, each once. Fuzzed messages are not created for this.
+
+        :rtype: list of MessageType
+        """
+        if isinstance(self.messages, FuzzedMessages):
+            return self.messages.message_types
+
+        return list({id(msg.message_type): msg.message_type for msg in self.messages}.values())
+
+    @property
+    def stored_messages(self):
+        if isinstance(self.messages, FuzzedMessages):
+            return self.messages.stored_messages
+        return self.messages
+
+    @property
+    def num_messages(self):
+        if isinstance(self.messages, FuzzedMessages):
+            # Fuzzed messages have the length of their templates, which are not empty
+            return len(self.messages)
+        return super().num_messages
+
+    @property
+    def plain_bits_str(self):
+        if isinstance(self.messages, FuzzedMessages):
+            return FuzzedMessageStrings(self.messages, str)
+        return super().plain_bits_str
+
+    @property
+    def plain_hex_str(self):
+        if isinstance(self.messages, FuzzedMessages):
+            return FuzzedMessageStrings(self.messages, lambda msg: msg.plain_hex_str)
+        return super().plain_hex_str
+
+    @property
+    def plain_ascii_str(self):
+        if isinstance(self.messages, FuzzedMessages):
+            return FuzzedMessageStrings(self.messages, lambda msg: msg.plain_ascii_str)
+        return super().plain_ascii_str
+
+    def representative_messages(self) -> list:
+        """
+        Messages with the number of messages they stand for, to estimate sums over fuzzed messages
+
+        :rtype: list of (Message, int)
+        """
+        if isinstance(self.messages, FuzzedMessages):
+            return self.messages.representatives()
+        return [(msg, 1) for msg in self.messages]
 
     def insert_protocol_analyzer(self, index: int, proto_analyzer: ProtocolAnalyzer):
 
@@ -72,40 +127,124 @@ class ProtocolAnalyzerContainer(ProtocolAnalyzer):
         except Exception as e:
             logger.error("Duplicating line ", str(e))
 
+    @staticmethod
+    def fuzz_labels(msg: Message) -> list:
+        """
+        Copy the ranges and fuzz values of the active fuzzing labels of a message
+
+        :rtype: list of (int, int, list of str)
+        """
+        return [(lbl.start, lbl.end, lbl.fuzz_values[:]) for lbl in msg.active_fuzzing_labels]
+
+    @staticmethod
+    def fuzz_combinations(labels: list, mode: FuzzMode):
+        """
+        Lazily iterate over the substitutions for fuzz labels
+
+        :param labels: fuzz labels of a message, see fuzz_labels
+        :return: iterator of tuples of (start, end, fuzz value)
+        """
+        if mode == FuzzMode.successive:
+            return (((start, end, fuzz_val),) for start, end, values in labels for fuzz_val in values[1:])
+        elif mode == FuzzMode.concurrent:
+            nval = max(len(values) for _, _, values in labels) if labels else 0
+            f = lambda index, values: values[index] if index < len(values) else values[0]
+            return (tuple((start, end, f(j, values)) for start, end, values in labels) for j in range(1, nval))
+        elif mode == FuzzMode.exhaustive:
+            pool = [[(start, end, fv) for fv in values[1:]] for start, end, values in labels]
+            return itertools.product(*pool) if labels else iter(())
+        else:
+            raise ValueError("Unknown fuzz mode")
+
+    @staticmethod
+    def fuzz_combination(labels: list, mode: FuzzMode, index: int) -> tuple:
+        """
+        The substitution at an index of fuzz_combinations, computed without iterating over the ones before
+
+        """
+        if mode == FuzzMode.successive:
+            for start, end, values in labels:
+                if index < len(values) - 1:
+                    return (start, end, values[index + 1]),
+                index -= len(values) - 1
+            raise IndexError("Fuzz combination out of range")
+        elif mode == FuzzMode.concurrent:
+            j = index + 1
+            return tuple((start, end, values[j] if j < len(values) else values[0]) for start, end, values in labels)
+        elif mode == FuzzMode.exhaustive:
+            # The last label changes fastest like in itertools.product
+            result = []
+            for start, end, values in reversed(labels):
+                index, i = divmod(index, len(values) - 1)
+                result.append((start, end, values[i + 1]))
+            return tuple(reversed(result))
+        else:
+            raise ValueError("Unknown fuzz mode")
+
+    @staticmethod
+    def num_fuzz_combinations(labels: list, mode: FuzzMode) -> int:
+        if not labels:
+            return 0
+
+        if mode == FuzzMode.successive:
+            return sum(len(values) - 1 for _, _, values in labels)
+        elif mode == FuzzMode.concurrent:
+            return max(len(values) for _, _, values in labels) - 1
+        elif mode == FuzzMode.exhaustive:
+            result = 1
+            for _, _, values in labels:
+                result *= len(values) - 1
+            return result
+        else:
+            raise ValueError("Unknown fuzz mode")
+
+    def num_fuzzed_messages(self, mode: FuzzMode) -> int:
+        """
+        Number of messages after fuzzing, computed without creating them
+
+        """
+        return sum(1 + self.num_fuzz_combinations(self.fuzz_labels(msg), mode) for msg in self.messages)
+
+    def iter_fuzz(self, mode: FuzzMode):
+        """
+        Iterate over the messages fuzzing would create without creating them.
+        Each original message is followed by its fuzzed variants.
+
+        :return: iterator of (template message, substitution), the substitution is empty for the original message
+        """
+        for msg in self.messages:
+            yield msg, ()
+            yield from ((msg, combination) for combination in self.fuzz_combinations(self.fuzz_labels(msg), mode))
+
+    @staticmethod
+    def create_fuzzed_message(msg: Message, substitution, default_pause=None, message_type=None,
+                              plain_bits=None) -> Message:
+        """
+        Create a message from a template and a substitution of iter_fuzz
+
+        :param message_type: Message type for the fuzzed message, a fuzzing copy of the template's type if None
+        :param plain_bits: bits to substitute in, the bits of the template if None
+        """
+        if not substitution:
+            return msg
+
+        cpy_bits = (msg.plain_bits if plain_bits is None else plain_bits)[:]
+        for start, end, fuz_val in substitution:
+            cpy_bits[start:end] = [True if bit == "1" else False for bit in fuz_val]
+
+        pause = default_pause if default_pause is not None else msg.pause
+        if message_type is None:
+            message_type = msg.message_type.copy_for_fuzzing()
+        return Message(plain_bits=cpy_bits, pause=pause, rssi=msg.rssi, message_type=message_type,
+                       modulator_indx=msg.modulator_indx, decoder=msg.decoder, fuzz_created=True)
+
     def fuzz(self, mode: FuzzMode, default_pause=None):
-        result = []
-        appd_result = result.append
-
-        for i, msg in enumerate(self.messages):
-            labels = msg.active_fuzzing_labels
-            appd_result(msg)
-
-            if mode == FuzzMode.successive:
-                combinations = [[(l.start, l.end, fuzz_val)] for l in labels for fuzz_val in l.fuzz_values[1:]]
-            elif mode == FuzzMode.concurrent:
-                nval = numpy.max([len(l.fuzz_values) for l in labels]) if labels else 0
-                f = lambda index, label: index if index < len(label.fuzz_values) else 0
-                combinations = [[(l.start, l.end, l.fuzz_values[f(j, l)]) for l in labels] for j in range(1, nval)]
-            elif mode == FuzzMode.exhaustive:
-                pool = [[(l.start, l.end, fv) for fv in l.fuzz_values[1:]] for l in labels]
-                combinations = itertools.product(*pool) if labels else []
-            else:
-                raise ValueError("Unknown fuzz mode")
-
-            for combination in combinations:
-                cpy_bits = msg.plain_bits[:]
-                for start, end, fuz_val in combination:
-                    cpy_bits[start:end] = [True if bit == "1" else False for bit in fuz_val]
-
-                pause = default_pause if default_pause is not None else msg.pause
-                fuz_msg = Message(plain_bits=cpy_bits, pause=pause,
-                                  rssi=msg.rssi, message_type=msg.message_type.copy_for_fuzzing(),
-                                  modulator_indx=msg.modulator_indx,
-                                  decoder=msg.decoder, fuzz_created=True)
-                appd_result(fuz_msg)
-
-        self.messages = result
-        """:type: list of Message """
+        """
+        Replace the messages with the messages of a fuzzing run, which are created on access
+
+        """
+        self.messages = FuzzedMessages(self.messages, mode, default_pause)
+        """:type: FuzzedMessages """
 
     def fuzz_successive(self, default_pause=None):
         """
@@ -144,4 +283,241 @@ class ProtocolAnalyzerContainer(ProtocolAnalyzer):
         super().from_xml_file(filename=filename, read_bits=read_bits)
 
     def clear(self):
-        self.messages[:] = []
\ No newline at end of file
+        # Replace instead of emptying the list, so messages created on demand are not created for this
+        self.messages = []
+
+
+class FuzzedMessages(MutableSequence):
+    """
+    Messages of a fuzzing run, which are created on access from their templates instead of being stored,
+    so a run of millions of messages needs the memory of its templates only.
+
+    The fuzzed messages of a template share one fuzzing copy of its message type. Messages returned by indexing
+    are kept with their own copy of the message type, so changes to them persist and do not affect other messages,
+    while peek and iteration create messages only temporarily.
+    Inserting or removing messages turns the sequence into a list of all messages.
+    """
+
+    MAX_PEEKED_MESSAGES = 1024  # e.g. for the rows displayed in the table
+
+    def __init__(self, templates, mode: FuzzMode, default_pause=None):
+        """
+
+        :type templates: list of Message
+        """
+        self.__templates = list(templates)
+        self.__mode = mode
+        self.__default_pause = default_pause
+
+        # Bits and fuzz values are copied, so changing a template afterwards does not change its fuzzed messages
+        self.__bits = [msg.plain_bits[:] for msg in self.__templates]
+        self.__labels = [ProtocolAnalyzerContainer.fuzz_labels(msg) for msg in self.__templates]
+        self.__message_types = [msg.message_type.copy_for_fuzzing() if labels else None
+                                for msg, labels in zip(self.__templates, self.__labels)]
+        self.__ends = list(itertools.accumulate(1 + ProtocolAnalyzerContainer.num_fuzz_combinations(labels, mode)
+                                                for labels in self.__labels))
+
+        self.__kept = dict()  # index -> message returned by indexing
+        self.__peeked = OrderedDict()
+        self.__list = None  # all messages, once the sequence was changed
+
+    def __copy__(self):
+        result = FuzzedMessages.__new__(FuzzedMessages)
+        result.__dict__.update(self.__dict__)
+        result.__kept = dict(self.__kept)
+        result.__peeked = OrderedDict()
+        result.__list = list(self.__list) if self.__list is not None else None
+        return result
+
+    def __len__(self):
+        if self.__list is not None:
+            return len(self.__list)
+        return self.__ends[-1] if self.__ends else 0
+
+    def __normalize_index(self, index: int) -> int:
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("Fuzzed message index out of range")
+        return index
+
+    def __locate(self, index: int) -> tuple:
+        """
+        Index of the template of a message and the number of the message among the messages of the template
+
+        :rtype: (int, int)
+        """
+        i = bisect.bisect_right(self.__ends, index)
+        return i, index - (self.__ends[i - 1] if i > 0 else 0)
+
+    def __create(self, index: int) -> Message:
+        i, k = self.__locate(index)
+        template = self.__templates[i]
+        if k == 0:
+            return template
+
+        substitution = ProtocolAnalyzerContainer.fuzz_combination(self.__labels[i], self.__mode, k - 1)
+        return ProtocolAnalyzerContainer.create_fuzzed_message(template, substitution, self.__default_pause,
+                                                               message_type=self.__message_types[i],
+                                                               plain_bits=self.__bits[i])
+
+    def __getitem__(self, index):
+        if self.__list is not None:
+            return self.__list[index]
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        index = self.__normalize_index(index)
+        try:
+            return self.__kept[index]
+        except KeyError:
+            pass
+
+        msg = self.__peeked.pop(index, None)
+        if msg is None:
+            msg = self.__create(index)
+        if msg.message_type is self.__message_types[self.__locate(index)[0]]:
+            msg.message_type = copy.deepcopy(msg.message_type)
+        self.__kept[index] = msg
+        return msg
+
+    def peek(self, index: int) -> Message:
+        """
+        Message at an index without keeping it, only the recently peeked messages are cached
+
+        """
+        if self.__list is not None:
+            return self.__list[index]
+
+        index = self.__normalize_index(index)
+        try:
+            return self.__kept[index]
+        except KeyError:
+            pass
+
+        try:
+            self.__peeked.move_to_end(index)
+            return self.__peeked[index]
+        except KeyError:
+            pass
+
+        msg = self.__create(index)
+        self.__peeked[index] = msg
+        if len(self.__peeked) > self.MAX_PEEKED_MESSAGES:
+            self.__peeked.popitem(last=False)
+        return msg
+
+    def __iter__(self):
+        if self.__list is not None:
+            yield from self.__list
+            return
+
+        for index in range(len(self)):
+            msg = self.__kept.get(index)
+            yield msg if msg is not None else self.__create(index)
+
+    def __materialize(self) -> list:
+        if self.__list is None:
+            # Indexing gives every message its own message type like a list of messages
+            self.__list = [self[i] for i in range(len(self))]
+            self.__kept.clear()
+            self.__peeked.clear()
+        return self.__list
+
+    def __setitem__(self, index, value):
+        self.__materialize()[index] = value
+
+    def __delitem__(self, index):
+        del self.__materialize()[index]
+
+    def insert(self, index: int, value: Message):
+        self.__materialize().insert(index, value)
+
+    @property
+    def stored_messages(self) -> list:
+        """
+        Templates and kept messages. Changing their attributes, e.g. the decoder,
+        changes them for all messages created from them afterwards.
+
+        :rtype: list of Message
+        """
+        if self.__list is not None:
+            return self.__list
+
+        # Templates are kept as well, if they were indexed
+        return list({id(msg): msg for msg in itertools.chain(self.__templates, self.__kept.values())}.values())
+
+    @property
+    def message_types(self) -> list:
+        """
+        :rtype: list of MessageType
+        """
+        message_types = [msg.message_type for msg in self.stored_messages]
+        if self.__list is None:
+            message_types.extend(mt for mt in self.__message_types if mt is not None)
+        return list({id(mt): mt for mt in message_types}.values())
+
+    def representatives(self) -> list:
+        """
+        Each template and its first fuzzed message, which stands for all fuzzed messages of the template,
+        because fuzz values have the length of their label. Changes to kept messages are not considered.
+
+        :rtype: list of (Message, int)
+        """
+        if self.__list is not None:
+            return [(msg, 1) for msg in self.__list]
+
+        result = []
+        start = 0
+        for end in self.__ends:
+            result.append((self.peek(start), 1))
+            if end - start > 1:
+                result.append((self.peek(start + 1), end - start - 1))
+            start = end
+        return result
+
+
+class FuzzedMessageStrings(Sequence):
+    """
+    Strings of fuzzed messages in a view, which are created for the requested rows only, e.g. the displayed rows
+    """
+
+    MAX_CACHED_ROWS = 1024
+
+    def __init__(self, messages: FuzzedMessages, to_str):
+        """
+
+        :param to_str: function returning the string of a message in the view
+        """
+        self.messages = messages
+        self.to_str = to_str
+        self.__cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.messages)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        try:
+            self.__cache.move_to_end(index)
+            return self.__cache[index]
+        except KeyError:
+            pass
+
+        result = self.to_str(self.messages.peek(index))
+        self.__cache[index] = result
+        if len(self.__cache) > self.MAX_CACHED_ROWS:
+            self.__cache.popitem(last=False)
+        return result
+
+    def max_length(self) -> int:
+        """
+        Length of the longest string, computed from the representative and kept messages
+
+        """
+        messages = [msg for msg, _ in self.messages.representatives()] + self.messages.stored_messages
+        return max((len(self.to_str(msg)) for msg in messages), default=0)
\ No newline at end of file
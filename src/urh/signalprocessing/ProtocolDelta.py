@@ -0,0 +1,96 @@
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
+
+
+class ProtocolDelta(object):
+    """
+    Record of changes to the messages of a protocol for undo.
+
+    Instead of copying all messages, only the changed parts are recorded:
+    spans of the message list, bit ranges of single messages and labels of message types.
+    Unchanged messages and bits are shared with the protocol, so a delta grows with the size of an edit,
+    not with the size of the protocol. Changes must be recorded before they are made.
+    """
+
+    def __init__(self):
+        self.__changes = []  # functions restoring the recorded changes
+        self.__saved_message_types = set()
+
+    def __len__(self):
+        return len(self.__changes)
+
+    def save_messages(self, protocol, start=0, end=None) -> list:
+        """
+        Record a span of the message list of a protocol, which will be replaced, e.g. by removing
+        or inserting messages. The messages themselves are stored by reference.
+
+        :param protocol: protocol whose messages attribute is changed, the list may also be replaced
+        :type protocol: urh.signalprocessing.ProtocolAnalyzer.ProtocolAnalyzer
+        :param end: end of the span, None for the end of the list
+        :return: the recorded messages of the span
+        """
+        num_messages = len(protocol.messages)
+        end = num_messages if end is None else min(end, num_messages)
+        saved = protocol.messages[start:end]
+
+        def restore():
+            # Everything the list grew or shrank happened inside the span
+            protocol.messages[start:end + len(protocol.messages) - num_messages] = saved
+
+        self.__changes.append(restore)
+        return saved
+
+    def save_message_list(self, protocol):
+        """
+        Record the message list of a protocol, which will be replaced by another list as a whole, e.g. by fuzzing.
+        The list is restored instead of its messages, so it is not copied.
+
+        :type protocol: urh.signalprocessing.ProtocolAnalyzer.ProtocolAnalyzer
+        """
+        messages = protocol.messages
+
+        def restore():
+            protocol.messages = messages
+
+        self.__changes.append(restore)
+
+    def save_bits(self, message: Message, start: int, end: int, num_inserted=0):
+        """
+        Record that the bits from start to end of a message will be replaced with num_inserted bits
+
+        """
+        removed = message.plain_bits[start:end]
+        start = min(start, len(message))
+
+        def restore():
+            message.plain_bits[start:start + num_inserted] = removed
+            message.clear_decoded_bits()
+            message.clear_encoded_bits()
+
+        self.__changes.append(restore)
+
+    def save_labels(self, message_type: MessageType):
+        """
+        Record the labels of a message type, which will be changed
+
+        """
+        if id(message_type) in self.__saved_message_types:
+            return
+
+        self.__saved_message_types.add(id(message_type))
+        labels = list(message_type)
+
+        def restore():
+            message_type[:] = labels
+
+        self.__changes.append(restore)
+
+    def restore(self):
+        """
+        Undo all recorded changes in reverse order
+
+        """
+        for restore in reversed(self.__changes):
+            restore()
+        self.__changes.clear()
+        self.__saved_message_types.clear()
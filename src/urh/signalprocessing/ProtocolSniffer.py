@@ -5,12 +5,13 @@ import numpy as np
 from PyQt5.QtCore import pyqtSlot, pyqtSignal, QObject
 from PyQt5.QtWidgets import QApplication
 
-from urh.cythonext.signalFunctions import grab_pulse_lens
 from urh.dev.BackendHandler import BackendHandler, Backends
 from urh.dev.VirtualDevice import VirtualDevice, Mode
 from urh.signalprocessing.Message import Message
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
+from urh.signalprocessing.StreamingDemodulator import StreamingDemodulator
+from urh.util.Logger import logger
 
 
 class ProtocolSniffer(ProtocolAnalyzer, QObject):
@@ -35,17 +36,14 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
 
         self.backend_handler = BackendHandler(testing_mode=testing_mode)
         self.rcv_device = VirtualDevice(self.backend_handler, device, Mode.receive, bandwidth, freq, gain,
-                                        sample_rate, device_ip=usrp_ip, is_ringbuffer=False, raw_mode=False)
+                                        sample_rate, device_ip=usrp_ip, is_ringbuffer=True, raw_mode=False)
 
         self.rcv_device.index_changed.connect(self.on_rcv_thread_index_changed)
         self.rcv_device.started.connect(self.__emit_started)
         self.rcv_device.stopped.connect(self.__emit_stopped)
 
         self.rel_symbol_len = self._read_symbol_len()
-
-        self.data_cache = []
-        self.conseq_non_data = 0
-        self.reading_data = False
+        self.demodulator = StreamingDemodulator(signal, self.rel_symbol_len)
 
         self.store_messages = True
 
@@ -82,7 +80,7 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
             self.rcv_device.free_data()
             self.rcv_device = VirtualDevice(self.backend_handler, value, Mode.receive, bw=1e6,
                                             freq=433.92e6, gain=20, samp_rate=1e6,
-                                            device_ip="192.168.10.2", is_ringbuffer=False, raw_mode=False)
+                                            device_ip="192.168.10.2", is_ringbuffer=True, raw_mode=False)
             self.rcv_device.index_changed.connect(self.on_rcv_thread_index_changed)
             self.rcv_device.started.connect(self.__emit_started)
             self.rcv_device.stopped.connect(self.__emit_stopped)
@@ -94,9 +92,15 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
     def on_rcv_thread_index_changed(self, old_index, new_index):
         old_nmsgs = len(self.messages)
         if self.rcv_device.backend in (Backends.native, Backends.grc):
-            if old_index == new_index:
+            ring = self.rcv_device.data
+            first_available = ring.first_available
+            if old_index < first_available:
+                # The demodulation could not keep up, so the oldest samples were overwritten
+                logger.warning("Sniffer skipped {0} overwritten samples".format(first_available - old_index))
+                old_index = first_available
+            if old_index >= new_index:
                 return
-            self.__demodulate_data(self.rcv_device.data[old_index:new_index])
+            self.__demodulate_data(ring[old_index:new_index])
         elif self.rcv_device.backend == Backends.network:
             # We receive the bits here
             for bit_str in self.rcv_device.data:
@@ -104,6 +108,10 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
 
             self.rcv_device.free_data()  # do not store received bits twice
 
+        self.__emit_data_sniffed(old_nmsgs)
+
+    def __emit_data_sniffed(self, old_nmsgs: int):
+        self.update_auto_message_types(start=old_nmsgs)  # only the new messages
         self.qt_signals.data_sniffed.emit(old_nmsgs)
 
         if self.sniff_file and not os.path.isdir(self.sniff_file):
@@ -119,65 +127,22 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
         :param data:
         :return:
         """
-        signal = self.signal
-
-        if self.__are_bits_in_data(data):
-            self.reading_data = True
-        elif self.conseq_non_data == 5:
-            self.reading_data = False
-            self.conseq_non_data = 0
-        else:
-            self.conseq_non_data += 1
-
-        if self.reading_data:
-            self.data_cache.append(data)
-            return
-        elif len(self.data_cache) == 0:
-            return
-
-        signal._fulldata = np.concatenate(self.data_cache)
-        del self.data_cache[:]
-        signal._qad = None
-
-        bit_len = signal.bit_len
-        ppseq = grab_pulse_lens(signal.qad, signal.qad_center,
-                                signal.tolerance, signal.modulation_type)
-
-        bit_data, pauses, bit_sample_pos = self._ppseq_to_bits(ppseq, bit_len, self.rel_symbol_len)
-
-        i = 0
-        first_msg = True
-
-        for bits, pause in zip(bit_data, pauses):
-            if first_msg or self.messages[-1].pause > 8 * bit_len:
-                # Create new Message
-                middle_bit_pos = bit_sample_pos[i][int(len(bits) / 2)]
-                start, end = middle_bit_pos, middle_bit_pos + bit_len
-                rssi = np.mean(np.abs(signal._fulldata[start:end]))
-                message = Message(bits, pause, bit_len=bit_len, rssi=rssi, message_type=self.default_message_type)
-                self.messages.append(message)
-                first_msg = False
-            else:
-                # Append to last message
-                message = self.messages[-1]
-                nzeros = int(np.round(message.pause / bit_len))
-                message.plain_bits.extend([False] * nzeros)
-                message.plain_bits.extend(bits)
-                message.pause = pause
-            i += 1
-
-    def __are_bits_in_data(self, data):
-        signal = self.signal
-        signal._fulldata = data
-        signal._qad = None
-
-        bit_len = signal.bit_len
-        ppseq = grab_pulse_lens(signal.qad, signal.qad_center,
-                                signal.tolerance, signal.modulation_type)
+        self.__add_messages(self.demodulator.feed(data))
 
-        bit_data, pauses, _ = self._ppseq_to_bits(ppseq, bit_len, self.rel_symbol_len)
+    def __add_messages(self, pulse_sequences):
+        """
+        Create messages from the pulse sequences completed by the streaming demodulator
 
-        return bool(bit_data)
+        :type pulse_sequences: list of (np.ndarray, int)
+        """
+        bit_len = self.signal.bit_len
+        for ppseq, offset in pulse_sequences:
+            bit_data, pauses, bit_sample_pos = self._ppseq_to_bits(ppseq, bit_len, self.rel_symbol_len)
+            for bits, pause, sample_pos in zip(bit_data, pauses, bit_sample_pos):
+                middle_bit_pos = offset + int(sample_pos[int(len(bits) / 2)])
+                rssi = np.mean(np.abs(self.demodulator.samples(middle_bit_pos, middle_bit_pos + bit_len)))
+                message = Message(bits, pause, bit_len=bit_len, rssi=rssi, message_type=self.default_message_type)
+                self.messages.append(message)
 
     def stop(self):
         self.rcv_device.stop("Stopping receiving due to user interaction")
@@ -185,11 +150,18 @@ class ProtocolSniffer(ProtocolAnalyzer, QObject):
         time.sleep(0.1)
 
     def clear(self):
-        del self.data_cache[:]
+        self.demodulator.reset()
         del self.messages[:]
 
     def __emit_started(self):
         self.started.emit()
 
     def __emit_stopped(self):
+        # Messages without a trailing pause are completed when receiving stops
+        old_nmsgs = len(self.messages)
+        self.__add_messages(self.demodulator.flush())
+        self.demodulator.reset()
+        if len(self.messages) > old_nmsgs:
+            self.__emit_data_sniffed(old_nmsgs)
+
         self.stopped.emit()
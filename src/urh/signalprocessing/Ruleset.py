@@ -2,6 +2,8 @@ import operator
 from enum import Enum
 import xml.etree.ElementTree as ET
 
+import numpy as np
+
 from urh.util.Logger import logger
 
 OPERATIONS = {
@@ -67,6 +69,21 @@ class Rule(object):
         data = message.decoded_bits_str if self.value_type == 0 else message.decoded_hex_str if self.value_type == 1 else message.decoded_ascii_str
         return OPERATIONS[self.operator](data[self.start:self.end], self.target_value)
 
+    def applies_for_messages(self, matrix) -> np.ndarray:
+        """
+        Evaluate the rule for all messages of a protocol matrix at once
+
+        :type matrix: ProtocolMatrix
+        :return: bool array with one entry per message
+        """
+        if self.start < 0 or self.end < self.start:
+            # Python slicing semantics for negative or empty ranges, rules from the UI do not have them
+            return np.fromiter((self.applies_for_message(msg) for msg in matrix.messages),
+                               dtype=bool, count=len(matrix.messages))
+
+        return OPERATIONS[self.operator](matrix.column_range(self.value_type, self.start, self.end),
+                                         matrix.encode(self.target_value))
+
     @property
     def operator_description(self):
         return OPERATION_DESCRIPTION[self.operator]
@@ -113,6 +130,46 @@ class Ruleset(list):
         else:
             raise ValueError("Unknown behavior " + str(self.mode))
 
+    def applies_for_messages(self, matrix) -> np.ndarray:
+        """
+
+        :type matrix: ProtocolMatrix
+        :return: bool array with one entry per message
+        """
+        napplied_rules = np.zeros(len(matrix.messages), dtype=np.int64)
+        for rule in self:
+            napplied_rules += rule.applies_for_messages(matrix)
+
+        if self.mode == Mode.all_apply:
+            return napplied_rules == len(self)
+        elif self.mode == Mode.atleast_one_applies:
+            return napplied_rules > 0
+        elif self.mode == Mode.none_applies:
+            return napplied_rules == 0
+        else:
+            raise ValueError("Unknown behavior " + str(self.mode))
+
+    @staticmethod
+    def classify(messages, rulesets) -> np.ndarray:
+        """
+        Evaluate rulesets for a batch of messages
+
+        :type messages: list of urh.signalprocessing.Message.Message
+        :type rulesets: list of Ruleset
+        :return: index of the first applying ruleset for every message, -1 if none applies
+        """
+        result = np.full(len(messages), -1, dtype=np.int64)
+        if len(messages) == 0:
+            return result
+
+        matrix = ProtocolMatrix(messages)
+        for i, ruleset in enumerate(rulesets):
+            unassigned = result == -1
+            if not unassigned.any():
+                break
+            result[unassigned & ruleset.applies_for_messages(matrix)] = i
+        return result
+
     def to_xml(self) -> ET.Element:
         root = ET.Element("ruleset")
         root.set("mode", str(self.mode.value))
@@ -131,3 +188,125 @@ class Ruleset(list):
             return result
         else:
             return Ruleset(mode=Mode.all_apply)
+
+
+class ProtocolMatrix(object):
+    """
+    Decoded bits of messages as a matrix (one row per message) for evaluating rules on all messages at once.
+
+    Column ranges of the bit and hex view are extracted directly from the matrix, only messages with symbols or
+    label alignments and the ASCII view need the rendered strings. Every column range is extracted only once,
+    no matter how many rules refer to it. Characters are stored as code points shifted by one in zero padded
+    unicode arrays, so NUL characters of the ASCII view can not be mistaken for padding when comparing.
+    """
+
+    HEX_CODES = np.frombuffer(b"0123456789abcdef", dtype=np.uint8).astype(np.uint32) + 1
+
+    def __init__(self, messages):
+        """
+
+        :type messages: list of urh.signalprocessing.Message.Message
+        """
+        self.messages = messages
+        decoded_bits = [msg.decoded_bits for msg in messages]
+        self.lengths = np.fromiter(map(len, decoded_bits), dtype=np.int64, count=len(messages))
+        self.bits = np.zeros((len(messages), int(self.lengths.max(initial=0))), dtype=np.uint8)
+        for row, bits in zip(self.bits, decoded_bits):
+            row[:len(bits)] = bits.to_numpy()
+
+        self.__has_symbols = np.fromiter((len(bits.symbols) > 0 for bits in decoded_bits),
+                                         dtype=bool, count=len(messages))
+        self.__is_aligned = np.fromiter((msg.align_labels and len(msg.message_type) > 0 for msg in messages),
+                                        dtype=bool, count=len(messages))
+        self.__strings = dict()
+        self.__column_ranges = dict()
+
+    @staticmethod
+    def encode(value: str) -> str:
+        """
+        Shift the code points of a value like the column ranges for comparing it with them
+
+        """
+        return "".join(chr(ord(c) + 1) for c in value)
+
+    def column_range(self, value_type: int, start: int, end: int) -> np.ndarray:
+        """
+        Same as message.decoded_*_str[start:end] for all messages, encoded like in encode
+
+        :param value_type: 0 = Bit, 1 = Hex, 2 = ASCII
+        :rtype: np.ndarray of str
+        """
+        key = (value_type, start, end)
+        try:
+            return self.__column_ranges[key]
+        except KeyError:
+            pass
+
+        if value_type == 0:
+            string_rows = self.__has_symbols
+            width = self.bits.shape[1]
+        elif value_type == 1:
+            string_rows = self.__has_symbols | self.__is_aligned
+            width = (self.bits.shape[1] + 3) // 4
+        else:
+            string_rows = np.ones(len(self.messages), dtype=bool)
+            width = 0
+
+        string_rows = np.flatnonzero(string_rows)
+        strings = [self.__string(value_type, i) for i in string_rows.tolist()]
+        width = max([width] + list(map(len, strings)))
+        num_columns = max(0, min(end, width) - start)
+
+        if num_columns == 0:
+            result = np.full(len(self.messages), "", dtype="U1")
+        else:
+            if value_type == 0:
+                codes = self.__bit_codes(start, num_columns)
+            elif value_type == 1:
+                codes = self.__hex_codes(start, num_columns)
+            else:
+                codes = np.zeros((len(self.messages), num_columns), dtype=np.uint32)
+
+            for i, string in zip(string_rows, strings):
+                values = string[start:end]
+                codes[i] = 0
+                codes[i, :len(values)] = np.frombuffer(values.encode("utf-32-le"), dtype=np.uint32) + 1
+
+            result = codes.view("U{0}".format(num_columns)).ravel()
+
+        self.__column_ranges[key] = result
+        return result
+
+    def __bit_codes(self, start: int, num_columns: int) -> np.ndarray:
+        columns = start + np.arange(num_columns)
+        bits = np.zeros((len(self.messages), num_columns), dtype=np.uint32)
+        available = self.bits[:, start:start + num_columns]
+        bits[:, :available.shape[1]] = available
+        return np.where(columns < self.lengths[:, np.newaxis], bits + ord("0") + 1, 0).astype(np.uint32)
+
+    def __hex_codes(self, start: int, num_columns: int) -> np.ndarray:
+        bits = np.zeros((len(self.messages), 4 * num_columns), dtype=np.uint8)
+        available = self.bits[:, 4 * start:4 * (start + num_columns)]
+        bits[:, :available.shape[1]] = available
+        values = bits.reshape(len(self.messages), num_columns, 4).dot(np.array([8, 4, 2, 1], dtype=np.uint8))
+
+        # Like in the hex view, a shorter last group is taken as value of its bits
+        num_bits = np.clip(self.lengths[:, np.newaxis] - 4 * (start + np.arange(num_columns)), 0, 4)
+        values >>= (4 - num_bits).astype(np.uint8)
+        return np.where(num_bits > 0, self.HEX_CODES[values], 0).astype(np.uint32)
+
+    def __string(self, value_type: int, index: int) -> str:
+        try:
+            return self.__strings[value_type, index]
+        except KeyError:
+            pass
+
+        message = self.messages[index]
+        if value_type == 0:
+            result = message.decoded_bits_str
+        elif value_type == 1:
+            result = message.decoded_hex_str
+        else:
+            result = message.decoded_ascii_str
+        self.__strings[value_type, index] = result
+        return result
@@ -0,0 +1,70 @@
+import os
+import struct
+import tarfile
+import tempfile
+import wave
+
+import numpy as np
+
+from urh.signalprocessing.MemmapIQ import MemmapIQ
+
+
+class SampleFile(object):
+    """
+    Reading samples from the supported capture formats without Qt.
+    """
+
+    @staticmethod
+    def read(filename: str, wav_is_qad_demod=False, memory_mapped=False):
+        """
+        Samples of a capture file, a WAV file is either real valued IQ data or already demodulated data
+
+        :param memory_mapped: Map the file instead of reading it, if the format supports this
+        :rtype: np.ndarray | MemmapIQ
+        """
+        if memory_mapped and MemmapIQ.supports(filename):
+            return MemmapIQ(filename)
+
+        if filename.endswith(".wav"):
+            return SampleFile.read_wav(filename, wav_is_qad_demod)
+
+        if filename.endswith(".coco"):
+            obj = tarfile.open(filename, "r")
+            members = obj.getmembers()
+            obj.extract(members[0], tempfile.gettempdir())
+            extracted_filename = os.path.join(tempfile.gettempdir(), obj.getnames()[0])
+            data = np.fromfile(extracted_filename, dtype=np.complex64)
+            os.remove(extracted_filename)
+        elif filename.endswith(".complex16u"):
+            # two 8 bit unsigned integers
+            raw = np.fromfile(filename, dtype=[('r', np.uint8), ('i', np.uint8)])
+            data = np.empty(raw.shape[0], dtype=np.complex64)
+            data.real = (raw['r'] / 127.5) - 1.0
+            data.imag = (raw['i'] / 127.5) - 1.0
+        elif filename.endswith(".complex16s"):
+            # two 8 bit signed integers
+            raw = np.fromfile(filename, dtype=[('r', np.int8), ('i', np.int8)])
+            data = np.empty(raw.shape[0], dtype=np.complex64)
+            data.real = (raw['r'] + 0.5) / 127.5
+            data.imag = (raw['i'] + 0.5) / 127.5
+        else:
+            data = np.fromfile(filename, dtype=np.complex64)  # Uncompressed
+
+        return np.ascontiguousarray(data, dtype=np.complex64)
+
+    @staticmethod
+    def read_wav(filename: str, is_qad_demod: bool) -> np.ndarray:
+        f = wave.open(filename, "r")
+        n = f.getnframes()
+        unsigned_bytes = struct.unpack('<{0:d}B'.format(n), f.readframes(n))
+        f.close()
+
+        if not is_qad_demod:
+            # Complex To Real WAV File load
+            data = np.empty(n, dtype=np.complex64, order="C")
+            data.real = np.multiply(1 / 256, np.subtract(unsigned_bytes, 128))
+            data.imag = [-1 / 128] * n
+            return data
+
+        data = np.multiply(1 / 256, np.subtract(unsigned_bytes, 128).astype(np.int8)).astype(np.float32)
+        return np.ascontiguousarray(data, dtype=np.float32)
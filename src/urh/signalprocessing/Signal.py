@@ -1,14 +1,15 @@
 import os
-import struct
-import tarfile
-import wave
 
 import numpy as np
-from PyQt5.QtCore import pyqtSignal, QObject, QDir, Qt
+from PyQt5.QtCore import pyqtSignal, QObject, Qt
 from PyQt5.QtWidgets import QApplication
 
 import urh.cythonext.signalFunctions as signal_functions
-from urh import constants
+from urh.signalprocessing.BlockDemodulator import BlockDemodulator
+from urh.signalprocessing.Demodulator import Demodulator
+from urh.signalprocessing.MemmapIQ import MemmapIQ
+from urh.signalprocessing.PieceTable import PieceTable
+from urh.signalprocessing.SampleFile import SampleFile
 from urh.util import FileOperator
 from urh.util.Logger import logger
 
@@ -19,7 +20,7 @@ class Signal(QObject):
     """
 
 
-    MODULATION_TYPES = ["ASK", "FSK", "PSK", "QAM"]
+    MODULATION_TYPES = Demodulator.MODULATION_TYPES
 
     bit_len_changed = pyqtSignal(int)
     tolerance_changed = pyqtSignal(int)
@@ -34,12 +35,19 @@ class Signal(QObject):
     data_edited = pyqtSignal()  # On Crop/Mute/Delete etc.
 
     def __init__(self, filename: str, name: str, wav_is_qad_demod=False,
-                 modulation: str = None, sample_rate: float = 1e6, parent=None):
+                 modulation: str = None, sample_rate: float = 1e6, memory_mapped=False, parent=None):
+        """
+
+        :param memory_mapped: Do not read the file into RAM, but map it and convert samples on demand.
+                              Meant for huge captures, see :class:`MemmapIQ`.
+        """
         super().__init__(parent)
         self.__name = name
         self.__tolerance = 5
         self.__bit_len = 100
         self._qad = None
+        self.__flat_qad = None  # (edited _qad, its samples as array) for algorithms that need an array
+        self.__block_demodulator = None
         self.__qad_center = 0
         self._noise_threshold = 0
         self.__sample_rate = sample_rate
@@ -58,46 +66,7 @@ class Signal(QObject):
 
         if len(filename) > 0:
             # Daten auslesen
-            if not self.wav_mode:
-                if not filename.endswith(".coco"):
-                    if filename.endswith(".complex16u"):
-                        # two 8 bit unsigned integers
-                        raw = np.fromfile(filename, dtype=[('r', np.uint8), ('i', np.uint8)])
-                        self._fulldata = np.empty(raw.shape[0], dtype=np.complex64)
-                        self._fulldata.real = (raw['r'] / 127.5) - 1.0
-                        self._fulldata.imag = (raw['i'] / 127.5) - 1.0
-                    elif filename.endswith(".complex16s"):
-                        # two 8 bit signed integers
-                        raw = np.fromfile(filename, dtype=[('r', np.int8), ('i', np.int8)])
-                        self._fulldata = np.empty(raw.shape[0], dtype=np.complex64)
-                        self._fulldata.real = (raw['r'] + 0.5) / 127.5
-                        self._fulldata.imag = (raw['i'] + 0.5) / 127.5
-                    else:
-                        self._fulldata = np.fromfile(filename, dtype=np.complex64)  # Uncompressed
-                else:
-                    obj = tarfile.open(filename, "r")
-                    members = obj.getmembers()
-                    obj.extract(members[0], QDir.tempPath())
-                    extracted_filename = os.path.join(QDir.tempPath(), obj.getnames()[0])
-                    self._fulldata = np.fromfile(extracted_filename, dtype=np.complex64)
-                    os.remove(extracted_filename)
-
-                self._fulldata = np.ascontiguousarray(self._fulldata, dtype=np.complex64)  # type: np.ndarray
-            else:
-                f = wave.open(filename, "r")
-                n = f.getnframes()
-                unsigned_bytes = struct.unpack('<{0:d}B'.format(n), f.readframes(n))
-                if not self.qad_demod_file_loaded:
-                    # Complex To Real WAV File load
-                    self._fulldata = np.empty(n, dtype=np.complex64, order="C")
-                    self._fulldata.real = np.multiply(1/256, np.subtract(unsigned_bytes, 128))
-                    self._fulldata.imag = [-1/128] * n
-                else:
-                    self._fulldata = np.multiply(1 / 256, np.subtract(unsigned_bytes, 128).astype(np.int8)).astype(
-                        np.float32)
-                    self._fulldata = np.ascontiguousarray(self._fulldata, dtype=np.float32)
-
-                f.close()
+            self._fulldata = SampleFile.read(filename, wav_is_qad_demod, memory_mapped)
 
             self.filename = filename
 
@@ -207,7 +176,7 @@ class Signal(QObject):
 
     @property
     def num_samples(self):
-        return len(self.data)
+        return len(self._fulldata)
 
     @property
     def noise_threshold(self):
@@ -226,23 +195,46 @@ class Signal(QObject):
                 self.protocol_needs_update.emit()
 
     @property
-    def qad(self):
+    def qad(self) -> np.ndarray:
+        """
+        Quad demodulated samples as array, e.g. for grabbing pulse lengths.
+        After editing, the array is built from the pieces and only kept until the next edit,
+        so the undo stack never references it. Use :attr:`qad_view` for plotting.
+
+        """
         if self._qad is None:
             self._qad = self.data if self.qad_demod_file_loaded else self.quad_demod()
 
+        if isinstance(self._qad, PieceTable):
+            if self.__flat_qad is None or self.__flat_qad[0] is not self._qad:
+                self.__flat_qad = (self._qad, np.asarray(self._qad))
+            return self.__flat_qad[1]
+
         return self._qad
 
     @property
-    def data(self) -> np.ndarray:
+    def data(self):
+        """
+        Samples of the signal. For memory mapped signals this is a :class:`MemmapIQ` and after editing
+        a :class:`PieceTable`, both return numpy arrays when sliced.
+        Use np.asarray for a flat array of all samples.
+
+        :rtype: np.ndarray | MemmapIQ | PieceTable
+        """
         return self._fulldata
 
+    @property
+    def memory_mapped(self) -> bool:
+        return isinstance(self._fulldata, MemmapIQ) or \
+               (isinstance(self._fulldata, PieceTable) and self._fulldata.memory_mapped)
+
     @property
     def real_plot_data(self):
         return self.data.real
 
     @property
     def wave_data(self):
-        return bytearray(np.multiply(-1, (np.round(self.data.real * 127)).astype(np.int8)))
+        return bytearray(np.multiply(-1, (np.round(np.asarray(self.data.real) * 127)).astype(np.int8)))
 
     @property
     def changed(self) -> bool:
@@ -271,6 +263,23 @@ class Signal(QObject):
         self.changed = False
         QApplication.restoreOverrideCursor()
 
+    def replace_mapped_file(self, new_filename: str):
+        """
+        Move new_filename over the file of this memory mapped signal and map it afterwards, e.g. after saving.
+        The signal releases its map before, as a mapped file can not be replaced on all platforms.
+        If the file can not be replaced, the signal maps new_filename instead and the error is raised.
+
+        """
+        self._fulldata = None
+        self.__block_demodulator = None
+        try:
+            os.replace(new_filename, self.filename)
+        except OSError:
+            self._fulldata = MemmapIQ(new_filename)
+            raise
+
+        self._fulldata = MemmapIQ(self.filename)
+
     def get_signal_start(self) -> int:
         """
         Index ab dem das Signal losgeht (Nach Übersteuern + Pause am Anfang)
@@ -281,13 +290,38 @@ class Signal(QObject):
     def get_signal_end(self):
         return signal_functions.find_signal_end(self.qad, self.modulation_type)
 
+    @property
+    def block_demodulator(self) -> BlockDemodulator:
+        """
+        Block wise demodulation with cached blocks, recreated whenever the samples are replaced
+
+        """
+        if self.__block_demodulator is None or self.__block_demodulator.data is not self._fulldata:
+            self.__block_demodulator = BlockDemodulator(self._fulldata)
+        return self.__block_demodulator
+
+    @property
+    def qad_view(self):
+        """
+        Lazy view on the quad demodulated data for plotting.
+        Edited demodulations stay a :class:`PieceTable` and memory mapped signals are only demodulated
+        for the blocks that are accessed.
+
+        """
+        if self._qad is not None:
+            return self._qad
+        if self.qad_demod_file_loaded or not self.memory_mapped:
+            return self.qad
+        return self.block_demodulator.view(self.noise_threshold, self.modulation_type)
+
     def quad_demod(self):
-        return signal_functions.afp_demod(self.data, self.noise_threshold, self.modulation_type)
+        # Signals in RAM keep the result as _qad, so caching the blocks as well would double the memory
+        return self.block_demodulator.demodulate(self.noise_threshold, self.modulation_type,
+                                                 cache=self.memory_mapped)
 
     def calc_noise_threshold(self, noise_start: int, noise_end: int):
-        NDIGITS = 4
         try:
-            return np.ceil(np.max(np.absolute(self.data[int(noise_start):int(noise_end)])) * 10 ** NDIGITS) / 10 ** NDIGITS
+            return Demodulator.calc_noise_threshold(self.data[int(noise_start):int(noise_end)])
         except ValueError:
             logger.warning("Could not caluclate noise treshold for range {}-{}".format(int(noise_start),int(noise_end)))
             return self.noise_threshold
@@ -302,15 +336,16 @@ class Signal(QObject):
     def estimate_qad_center(self) -> float:
         center = self.__parameter_cache[self.modulation_type_str]["qad_center"]
         if center is None:
-            noise_value = signal_functions.get_noise_for_mod_type(self.modulation_type)
-            qad = self.qad[np.where(self.qad > noise_value)] if noise_value < 0 else self.qad
-            center = signal_functions.estimate_qad_center(qad, constants.NUM_CENTERS)
+            center = Demodulator.estimate_qad_center(self.qad, self.modulation_type)
             self.__parameter_cache[self.modulation_type_str]["qad_center"] = center
         return center
 
     def create_new(self, start:int, end:int):
         new_signal = Signal("", "New " + self.name)
-        new_signal._fulldata = self.data[start:end]
+        if self.memory_mapped:
+            new_signal._fulldata = self.data.window(start, end)
+        else:
+            new_signal._fulldata = self.data[start:end]
         new_signal._noise_threshold = self.noise_threshold
         new_signal.noise_min_plot = self.noise_min_plot
         new_signal.noise_max_plot = self.noise_max_plot
@@ -364,41 +399,74 @@ class Signal(QObject):
     def destroy(self):
         self._fulldata = None
         self._qad = None
+        self.__flat_qad = None
+        self.__block_demodulator = None
 
     def silent_set_modulation_type(self, mod_type: int):
         self.__modulation_type = mod_type
 
     def insert_data(self, index: int, data: np.ndarray):
-        self._fulldata = np.insert(self._fulldata, index, data)
-        self._qad = None
-
+        self.__splice(index, index, PieceTable.from_data(np.asarray(data, dtype=self._fulldata.dtype)))
         self.__invalidate_after_edit()
 
     def delete_range(self, start: int, end: int):
-        mask = np.ones(self.num_samples, dtype=bool)
-        mask[start:end] = False
-
-        try:
-            self._fulldata = self._fulldata[mask]
-            self._qad = self._qad[mask] if self._qad is not None else None
-        except IndexError as e:
-            logger.warning("Could not delete data: " + str(e))
-
+        self.__splice(start, end, None)
         self.__invalidate_after_edit()
 
     def mute_range(self, start: int, end: int):
-        self._fulldata[start:end] = 0
-        if self._qad is not None:
-            self._qad[start:end] = 0
-
+        num_samples = len(self.get_pieces(start, end)[0])
+        self.__splice(start, end, PieceTable.zeros(num_samples, dtype=self._fulldata.dtype),
+                      PieceTable.zeros(num_samples, dtype=np.float32))
         self.__invalidate_after_edit()
 
     def crop_to_range(self, start: int, end: int):
-        self._fulldata = self._fulldata[start:end]
-        self._qad = self._qad[start:end] if self._qad is not None else None
+        self._fulldata = PieceTable.from_data(self._fulldata).window(start, end)
+        self._qad = PieceTable.from_data(self._qad).window(start, end) if self._qad is not None else None
+        self.__flat_qad = None
 
         self.__invalidate_after_edit()
 
+    def get_pieces(self, start: int, end: int) -> tuple:
+        """
+        Samples and demodulated samples from start to end without copying them, e.g. to restore them later
+
+        :return: samples and demodulated samples (None if not demodulated yet) as :class:`PieceTable`
+        """
+        data = PieceTable.from_data(self._fulldata).window(start, end)
+        qad = PieceTable.from_data(self._qad).window(start, end) if self._qad is not None else None
+        return data, qad
+
+    def restore_pieces(self, start: int, end: int, pieces: tuple):
+        """
+        Replace the samples from start to end with pieces from get_pieces, e.g. to undo an edit.
+        Unlike the editing methods, this emits no signals.
+
+        """
+        data, qad = pieces
+        self.__splice(start, end, data, qad)
+
+    def __splice(self, start: int, end: int, data, qad=None):
+        """
+        Replace the samples from start to end with data, only the demodulation of the new samples is calculated
+
+        :type data: PieceTable | None
+        :param qad: demodulated samples for data, calculated if None
+        """
+        num_samples = self.num_samples
+        self._fulldata = PieceTable.from_data(self._fulldata).splice(start, end, data)
+
+        if self._qad is not None:
+            if qad is None and data is not None:
+                qad = data if self.qad_demod_file_loaded else \
+                    BlockDemodulator(data).demodulate(self.noise_threshold, self.modulation_type)
+            self._qad = PieceTable.from_data(self._qad).splice(start, end, qad)
+            self.__flat_qad = None
+
+        if self.__block_demodulator is not None and self.num_samples == num_samples:
+            # Samples did not move, so cached blocks outside the range stay valid
+            self.__block_demodulator.data = self._fulldata
+            self.__block_demodulator.invalidate(start, end)
+
     def __invalidate_after_edit(self):
         self.clear_parameter_cache()
         self.changed = True
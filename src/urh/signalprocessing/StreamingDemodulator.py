@@ -0,0 +1,151 @@
+import numpy as np
+
+from urh.cythonext import signalFunctions
+
+
+class StreamingDemodulator(object):
+    """
+    Single pass demodulation of a sample stream, e.g. for live sniffing.
+
+    Every received block is demodulated exactly once. The state at block borders (previous sample,
+    costas loop, unfinished pulse) is carried over, so the pulses are the same as for the whole stream at once.
+    Pulses are collected until a pause long enough to end a message arrives (same rule as pulses_to_bits),
+    the completed messages are returned as pulse sequences together with their position in the stream.
+    """
+
+    MAX_PENDING_PULSES = 2 ** 20
+
+    def __init__(self, signal, rel_symbol_len: float):
+        """
+
+        :param signal: Signal providing the current demodulation parameters
+        :type signal: urh.signalprocessing.Signal.Signal
+        """
+        self.signal = signal
+        self.rel_symbol_len = rel_symbol_len
+        self.reset()
+
+    def reset(self):
+        self.__pulse_state = np.zeros(6, dtype=np.uint64)
+        self.__costa_state = np.zeros(2, dtype=np.float32)
+        self.__demod_params = None
+        self.__predecessor = None
+
+        self.__pending = []  # arrays of completed pulses, which do not belong to a finished message yet
+        self.__num_pending = 0
+        self.__pending_start = 0  # stream position of first pending pulse
+        self.__pending_end = 0  # stream position after last pending pulse
+
+        self.__blocks = []  # list of (stream position, samples) for reading samples of pending messages
+        self.__num_samples = 0
+
+    @property
+    def num_samples(self) -> int:
+        return self.__num_samples
+
+    def samples(self, start: int, end: int) -> np.ndarray:
+        """
+        Received samples from start to end, only available for the messages returned by the last feed
+
+        """
+        parts = [block[max(start - pos, 0):end - pos] for pos, block in self.__blocks
+                 if pos < end and pos + len(block) > start]
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.complex64)
+
+    def feed(self, samples: np.ndarray) -> list:
+        """
+        Demodulate the next samples of the stream
+
+        :return: list of (pulse sequence, stream position) of the messages completed by these samples
+        """
+        signal = self.signal
+        self.__drop_blocks(self.__pending_start)
+
+        samples = np.ascontiguousarray(samples, dtype=np.complex64)
+        if len(samples) == 0:
+            return []
+
+        params = (signal.noise_threshold, signal.modulation_type)
+        if params != self.__demod_params:
+            self.__costa_state[:] = 0
+            self.__demod_params = params
+
+        has_predecessor = self.__predecessor is not None
+        qad = signalFunctions.afp_demod_block(samples, signal.noise_threshold, signal.modulation_type,
+                                              self.__costa_state, has_predecessor,
+                                              self.__predecessor if has_predecessor else 0)
+        self.__predecessor = samples[-1]
+        self.__blocks.append((self.__num_samples, samples))
+        self.__num_samples += len(samples)
+
+        pulses = np.asarray(signalFunctions.grab_pulse_lens_stream(qad, signal.qad_center, signal.tolerance,
+                                                                   signal.modulation_type, self.__pulse_state))
+        return self.__add_pulses(pulses, signal.bit_len)
+
+    def flush(self) -> list:
+        """
+        End the stream and return the pending message including the unfinished pulse
+
+        :return: list of (pulse sequence, stream position)
+        """
+        self.__drop_blocks(self.__pending_start)
+        if self.__pulse_state[0] and self.__pulse_state[2] > 0:
+            self.__pending.append(np.array([[self.__pulse_state[1], self.__pulse_state[2]]], dtype=np.uint64))
+            self.__num_pending += 1
+            self.__pulse_state[:] = 0
+
+        result = self.__take_pending(len(self.__pending))
+        self.__pending_start = self.__pending_end = self.__num_samples
+        return result
+
+    def __add_pulses(self, pulses: np.ndarray, bit_len: int) -> list:
+        result = []
+        if len(pulses) == 0:
+            return result
+
+        offsets = np.cumsum(pulses[:, 1].astype(np.int64))
+        ends = np.flatnonzero((pulses[:, 0] == 42) & (self.__num_bits(pulses[:, 1], bit_len) >= 9))
+
+        first = 0
+        for end in ends:
+            self.__pending.append(pulses[first:end + 1])
+            self.__pending_end += int(offsets[end] - (offsets[first - 1] if first > 0 else 0))
+            result.extend(self.__take_pending(len(self.__pending)))
+            self.__pending_start = self.__pending_end
+            first = end + 1
+
+        if first < len(pulses):
+            self.__pending.append(pulses[first:])
+            self.__num_pending += len(pulses) - first
+            self.__pending_end += int(offsets[-1] - (offsets[first - 1] if first > 0 else 0))
+
+        if self.__num_pending > self.MAX_PENDING_PULSES:
+            # No pause for a long time, do not let the pending message grow unbounded
+            result.extend(self.__take_pending(len(self.__pending)))
+            self.__pending_start = self.__pending_end
+
+        return result
+
+    def __take_pending(self, count: int) -> list:
+        if count == 0:
+            return []
+
+        ppseq = np.ascontiguousarray(np.concatenate(self.__pending[:count]), dtype=np.uint64)
+        del self.__pending[:count]
+        self.__num_pending = sum(map(len, self.__pending))
+        return [(ppseq, self.__pending_start)]
+
+    def __drop_blocks(self, start: int):
+        while self.__blocks and self.__blocks[0][0] + len(self.__blocks[0][1]) <= start:
+            self.__blocks.pop(0)
+
+    def __num_bits(self, num_samples: np.ndarray, bit_len: int) -> np.ndarray:
+        """
+        Number of bits of pulses rounded like in pulses_to_bits
+
+        """
+        num_bits_floated = num_samples.astype(np.float64) / max(bit_len, 1)
+        num_bits = np.floor(num_bits_floated)
+        return num_bits + (num_bits_floated - num_bits > 0.5 + self.rel_symbol_len)
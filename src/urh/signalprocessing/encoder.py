@@ -1,6 +1,10 @@
 import subprocess
 
+import numpy as np
+
 from urh import constants
+from urh.cythonext import util
+from urh.signalprocessing.BitArray import BitArray
 from urh.util.crc import crc_generic
 
 
@@ -48,6 +52,7 @@ class Encoder(object):
         self.data_whitening_crc = [False] * 16  # CRC is 16 Bit long
         self.data_whitening_preamble = [True, False] * 16  # 010101...
         self.lfsr_state = []
+        self.__keystream_cache = None  # (polynomial, keystream, number of chunks, lfsr state after them)
 
         self.data_whitening_apply_crc = True  # Apply CRC with XOR
         self.data_whitening_preamble_rm = True  # Remove Preamble
@@ -59,8 +64,23 @@ class Encoder(object):
 
         # Set Chain
         self.chain = []
+        self.__plan = None
+        self.__plan_chain = None
         self.set_chain(chain)
 
+    @staticmethod
+    def default_decodings() -> list:
+        """
+        Decodings available without a decodings file
+
+        :rtype: list of Encoder
+        """
+        return [Encoder(["Non Return To Zero (NRZ)"]),
+                Encoder(["Non Return To Zero Inverted (NRZ-I)", constants.DECODING_INVERT]),
+                Encoder(["Manchester I", constants.DECODING_EDGE]),
+                Encoder(["Manchester II", constants.DECODING_EDGE, constants.DECODING_INVERT]),
+                Encoder(["Differential Manchester", constants.DECODING_EDGE, constants.DECODING_DIFFERENTIAL])]
+
     @property
     def symbol_len(self):
         return int(self.__symbol_len)
@@ -209,93 +229,194 @@ class Encoder(object):
 
         return output
 
-    def code(self, decoding, inputbits):
-        temp = inputbits.copy()
-        output = temp
-        errors = 0
-        error_states = []
+    @property
+    def plan(self) -> tuple:
+        """
+        The chain compiled to a tuple of steps (operation, kernel, kernel_args, settings).
+        It is compiled once and only recompiled when the chain changes.
 
-        # operation order
-        if decoding:
-            i = 0
-            ops = len(self.chain)
-            step = 1
-        else:
-            i = len(self.chain) - 1
-            ops = -1
-            step = -1
+        :rtype: tuple of (callable, callable|None, tuple, tuple)
+        """
+        if self.__plan is None or self.__plan_chain != self.chain:
+            self.__plan = self.__compile_chain()
+            self.__plan_chain = list(self.chain)
+        return self.__plan
 
-        # do operations
-        while i != ops:
-            operation = self.chain[i]
-            while not callable(operation) and i + step != ops:
-                i += step
-                operation = self.chain[i]
+    def __compile_chain(self) -> tuple:
+        """
+        Parse the parameters of the chain once. For every operation a step is created with
+        kernel: vectorized implementation working on numpy bool arrays (None for list based operations),
+        kernel_args: parameters passed to the kernel,
+        settings: (attribute, value) pairs, which are set before the operation is executed.
+
+        """
+        plan = []
+        for i, operation in enumerate(self.chain):
+            if not callable(operation):
+                continue
+
+            kernel, kernel_args, settings = None, (), ()
 
-            # Ops with parameters
             if self.code_redundancy == operation:
-                self.multiple = int(self.chain[i + 1])
+                multiple = int(self.chain[i + 1])
+                kernel, kernel_args, settings = self.__redundancy, (multiple,), (("multiple", multiple),)
             elif self.code_carrier == operation:
-                self.carrier = self.chain[i + 1]
+                settings = (("carrier", self.chain[i + 1]),)
             elif self.code_substitution == operation:
-                self.src = self.chain[i + 1][0]
-                self.dst = self.chain[i + 1][1]
+                src, dst = self.chain[i + 1][0], self.chain[i + 1][1]
+                settings = (("src", src), ("dst", dst))
+                if len(src) > 0 and len(src) == len(dst) and len(src[0]) > 0:
+                    kernel = self.__substitution
+                    kernel_args = (self.__substitution_table(src, dst), self.__substitution_table(dst, src))
             elif self.code_externalprogram == operation:
                 if self.chain[i + 1] != "":
                     try:
-                        self.external_decoder, self.external_encoder = self.chain[i + 1].split(";")
+                        decoder, encoder = self.chain[i + 1].split(";")
+                        settings = (("external_decoder", decoder), ("external_encoder", encoder))
                     except ValueError:
                         pass
                 else:
-                    self.external_decoder, self.external_encoder = "", ""
+                    settings = (("external_decoder", ""), ("external_encoder", ""))
             elif self.code_data_whitening == operation:
+                kernel = self.__data_whitening
                 if self.chain[i + 1].count(';') == 2:
-                    self.data_whitening_sync, self.data_whitening_polynomial, opt = self.chain[i + 1].split(";")
-                    if (len(self.data_whitening_sync) > 0 and len(self.data_whitening_polynomial) > 0) and len(opt) > 0:
-                        self.data_whitening_sync = self.hex2bit(self.data_whitening_sync)
-                        self.data_whitening_polynomial = self.hex2bit(self.data_whitening_polynomial)
-                        opt = self.hex2bit(opt)
+                    sync, polynomial, opt = self.chain[i + 1].split(";")
+                    if len(sync) > 0 and len(polynomial) > 0 and len(opt) > 0:
+                        sync, polynomial, opt = self.hex2bit(sync), self.hex2bit(polynomial), self.hex2bit(opt)
                         if len(opt) >= 4:
-                            self.data_whitening_apply_crc = opt[0]
-                            self.data_whitening_preamble_rm = opt[1]
-                            self.data_whitening_sync_rm = opt[2]
-                            self.data_whitening_crc_rm = opt[3]
+                            settings = (("data_whitening_apply_crc", opt[0]), ("data_whitening_preamble_rm", opt[1]),
+                                        ("data_whitening_sync_rm", opt[2]), ("data_whitening_crc_rm", opt[3]))
+                    settings = (("data_whitening_sync", sync), ("data_whitening_polynomial", polynomial)) + settings
             elif self.code_cut == operation:
+                kernel = self.__cut
                 if self.chain[i + 1] != "" and self.chain[i + 1].count(';') == 1:
-                    self.cutmode, tmp = self.chain[i + 1].split(";")
-                    self.cutmode = int(self.cutmode)
-                    if self.cutmode < 0 or self.cutmode > 3:
-                        self.cutmode = 0
-                    if self.cutmode == 0 or self.cutmode == 1:
-                        self.cutmark = self.str2bit(tmp)
-
-                        if len(self.cutmark) == 0: self.cutmark = [True, False, True, False]
+                    cutmode, tmp = self.chain[i + 1].split(";")
+                    cutmode = int(cutmode)
+                    if cutmode < 0 or cutmode > 3:
+                        cutmode = 0
+                    if cutmode == 0 or cutmode == 1:
+                        cutmark = self.str2bit(tmp)
+                        if len(cutmark) == 0:
+                            cutmark = [True, False, True, False]
                     else:
                         try:
-                            self.cutmark = int(tmp)
+                            cutmark = int(tmp)
                         except ValueError:
-                            self.cutmark = 1
+                            cutmark = 1
+                    settings = (("cutmode", cutmode), ("cutmark", cutmark))
+            elif self.code_invert == operation:
+                kernel = self.__invert
+            elif self.code_differential == operation:
+                kernel = self.__differential
+            elif self.code_edge == operation:
+                kernel = self.__edge
+            elif self.code_lsb_first == operation:
+                kernel = self.__lsb_first
+
+            plan.append((operation, kernel, kernel_args, settings))
+
+        return tuple(plan)
+
+    def code(self, decoding, inputbits):
+        temp = self.__to_array(inputbits)
+        errors = 0
+        error_states = []
+
+        # operation order
+        plan = self.plan if decoding else reversed(self.plan)
+
+        # do operations
+        for operation, kernel, kernel_args, settings in plan:
+            for attribute, value in settings:
+                setattr(self, attribute, value)
+
+            if len(temp) > 0:
+                if kernel is not None:
+                    temp, temp_errors, state = kernel(decoding, temp, *kernel_args)
+                else:
+                    output, temp_errors, state = operation(decoding, temp.tolist())
+                    temp = self.__to_array(output)
 
-            # Execute Ops
-            if callable(operation) and len(temp) > 0:
-                output, temp_errors, state = operation(decoding, temp)
                 errors += temp_errors
                 if state != self.ErrorState.SUCCESS and state not in error_states:
                     error_states.append(state)
 
-            # Loop Footer
-            i += step
-            temp = output
-
         if len(inputbits):
-            self.__symbol_len = len(output) / len(inputbits)
+            self.__symbol_len = len(temp) / len(inputbits)
 
         if error_states:
             error_state = error_states[0]
         else:
             error_state = self.ErrorState.SUCCESS
 
-        return output, errors, error_state
+        return temp.tolist(), errors, error_state
+
+    @staticmethod
+    def __to_array(bits) -> np.ndarray:
+        if isinstance(bits, np.ndarray):
+            return bits.astype(bool, copy=False)
+        if isinstance(bits, BitArray):
+            result = bits.to_numpy().astype(bool)
+            result[list(bits.symbols)] = True  # Symbols are truthy like in lists
+            return result
+        try:
+            return np.array(bits, dtype=bool).reshape(len(bits))
+        except (TypeError, ValueError):
+            return np.array([bool(b) for b in bits], dtype=bool)
+
+    def __run_kernel(self, kernel, decoding, inpt, *kernel_args):
+        """
+        Run a vectorized kernel for list input and output
+
+        """
+        output, errors, state = kernel(decoding, self.__to_array(inpt), *kernel_args)
+        return output.tolist(), errors, state
+
+    @staticmethod
+    def __find(bits: np.ndarray, pattern) -> int:
+        """
+        Position of the first occurrence of pattern in bits or -1
+
+        """
+        return bits.astype(np.uint8).tobytes().find(np.array(pattern, dtype=np.uint8).tobytes())
+
+    @staticmethod
+    def __substitution_table(src, dst) -> tuple:
+        """
+        Flatten the items of src and dst for the substitution kernel
+
+        """
+        def flatten(items):
+            offsets = np.zeros(len(items) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum([len(item) for item in items])
+            flat = np.array([bit for item in items for bit in item], dtype=np.uint8).reshape(offsets[-1])
+            return flat, offsets
+
+        return flatten(src) + flatten(dst)
+
+    def __keystream(self, num_chunks: int) -> np.ndarray:
+        """
+        Keystream of the data whitening LFSR for num_chunks clocks of 8 bit.
+        The LFSR always starts with the same state, so the keystream of the current polynomial is cached
+        and only extended for longer messages.
+
+        """
+        key = tuple(self.data_whitening_polynomial)
+        if self.__keystream_cache is not None and self.__keystream_cache[0] == key:
+            _, keystream, chunks, state = self.__keystream_cache
+        else:
+            self.lfsr_state = []
+            keystream, chunks, state = np.array(self.lfsr(0), dtype=bool), 0, None
+
+        if num_chunks > chunks:
+            if state is not None:
+                self.lfsr_state = list(state)
+            new_chunks = [self.lfsr(8) for _ in range(chunks, max(num_chunks, 2 * chunks))]
+            keystream = np.append(keystream, np.array(new_chunks, dtype=bool).ravel())
+            chunks += len(new_chunks)
+            self.__keystream_cache = (key, keystream, chunks, list(self.lfsr_state))
+
+        return keystream[:len(key) * (num_chunks + 1)]
 
     def lfsr(self, clock):
         poly = [False]
@@ -322,6 +443,9 @@ class Encoder(object):
         return self.lfsr_state[1:len_pol]
 
     def apply_data_whitening(self, decoding, inpt):
+        return self.__run_kernel(self.__data_whitening, decoding, inpt)
+
+    def __data_whitening(self, decoding, inpt):
         len_sync = len(self.data_whitening_sync)
         len_polynomial = len(self.data_whitening_polynomial)
         inpt_from = 0
@@ -336,49 +460,38 @@ class Encoder(object):
         if inpt_to < 1 or len_polynomial < 1 or len_sync < 1:
             return inpt[inpt_from:inpt_to], 0, self.ErrorState.MISC  # Misc Error
 
-        # Force inpt to contain bool values; overwrite everything else with True
-        for i in range(0, inpt_to):
-            if not isinstance(inpt[i], bool):
-                inpt[i] = True
+        # Sync bytes or polynomial could not be parsed from hex, so sync can not be found
+        if not isinstance(self.data_whitening_sync, list) or not isinstance(self.data_whitening_polynomial, list):
+            state = self.ErrorState.SYNC_NOT_FOUND if decoding else self.ErrorState.MISC
+            return inpt[inpt_from:inpt_to], 0, state
+
+        inpt = inpt.copy()
 
         # Search for whitening start position (after sync bytes)
-        whitening_start_pos = inpt_from
-        i = inpt_from
-        while i < (inpt_to - len_sync):
-            equalbits = 0
-            for j in range(0, len_sync):
-                if inpt[i + j] == self.data_whitening_sync[j]:
-                    equalbits += 1
-                else:
-                    continue
-            if len_sync == equalbits:
-                whitening_start_pos = i + j + 1
-                break
-            else:
-                i += 1
+        sync_pos = self.__find(inpt[:inpt_to - 1], self.data_whitening_sync)
+        whitening_start_pos = sync_pos + len_sync if sync_pos >= 0 else inpt_from
+
         # Sync not found
         if decoding and whitening_start_pos == inpt_from:
             return inpt[inpt_from:inpt_to], 0, self.ErrorState.SYNC_NOT_FOUND
 
         # If encoding and crc_rm is active, extend inpt with 0s
         if not decoding and self.data_whitening_crc_rm:
-            inpt = inpt + self.data_whitening_crc
+            inpt = np.append(inpt, np.array(self.data_whitening_crc, dtype=bool))
             inpt_to += len(self.data_whitening_crc)
 
         # Prepare keystream
-        self.lfsr_state = []
-        keystream = self.lfsr(0)
-        for i in range(whitening_start_pos, inpt_to, 8):
-            keystream.extend(self.lfsr(8))
+        keystream = self.__keystream(len(range(whitening_start_pos, inpt_to, 8)))
 
         # If data whitening polynomial is wrong, keystream can be less than needed. Check and exit.
         if len(keystream) < inpt_to - whitening_start_pos:
             return inpt[inpt_from:inpt_to], 0, self.ErrorState.MISC  # Error 31338
 
+        keystream = keystream[:inpt_to - whitening_start_pos]
+
         # Apply keystream (xor) - Decoding
         if decoding:
-            for i in range(whitening_start_pos, inpt_to):
-                inpt[i] ^= keystream[i - whitening_start_pos]
+            inpt[whitening_start_pos:inpt_to] ^= keystream
 
         # Apply CRC-16
         if self.data_whitening_apply_crc:
@@ -391,10 +504,9 @@ class Encoder(object):
             for i in range(0, 16):
                 inpt[inpt_to - len(self.data_whitening_crc) + i] ^= crc[i]
 
-        # Apply keystream (xor) - Decoding
+        # Apply keystream (xor) - Encoding
         if not decoding:
-            for i in range(whitening_start_pos, inpt_to):
-                inpt[i] ^= keystream[i - whitening_start_pos]
+            inpt[whitening_start_pos:inpt_to] ^= keystream
 
         # Remove preamble/sync bytes/crc
         if decoding:
@@ -406,13 +518,13 @@ class Encoder(object):
                 inpt_to -= len(self.data_whitening_crc)
         else:
             if self.data_whitening_sync_rm:
-                inpt = self.data_whitening_sync + inpt
+                inpt = np.append(np.array(self.data_whitening_sync, dtype=bool), inpt)
                 inpt_to += len(self.data_whitening_sync)
             if self.data_whitening_preamble_rm:
-                inpt = self.data_whitening_preamble + inpt
+                inpt = np.append(np.array(self.data_whitening_preamble, dtype=bool), inpt)
                 inpt_to += len(self.data_whitening_preamble)
             # Duplicate last bit when encoding
-            inpt += [inpt[-1]]
+            inpt = np.append(inpt, inpt[-1])
             inpt_to += 1
 
         return inpt[inpt_from:inpt_to], 0, self.ErrorState.SUCCESS
@@ -473,111 +585,77 @@ class Encoder(object):
         return self.apply_data_whitening(decoding, inpt)
 
     def code_lsb_first(self, decoding, inpt):
+        return self.__run_kernel(self.__lsb_first, decoding, inpt)
+
+    @staticmethod
+    def __lsb_first(decoding, inpt):
         output = inpt.copy()
         errors = len(inpt) % 8
 
         # Change Byteorder to LSB first <-> LSB last
-        i = 0
-        while i < len(output) - 7:
-            output[i + 0], output[i + 1], output[i + 2], output[i + 3], output[i + 4], output[i + 5], output[i + 6], \
-            output[i + 7] = \
-                output[i + 7], output[i + 6], output[i + 5], output[i + 4], output[i + 3], output[i + 2], output[i + 1], \
-                output[i + 0]
-            i += 8
-        return output, errors, self.ErrorState.SUCCESS
+        full_bytes = len(output) - errors
+        output[:full_bytes] = output[:full_bytes].reshape(-1, 8)[:, ::-1].ravel()
+        return output, errors, Encoder.ErrorState.SUCCESS
 
     def code_redundancy(self, decoding, inpt):
-        output = []
+        return self.__run_kernel(self.__redundancy, decoding, inpt, self.multiple)
+
+    @staticmethod
+    def __redundancy(decoding, inpt, multiple):
+        output = np.zeros(0, dtype=bool)
         errors = 0
 
-        if len(inpt) and self.multiple > 1:
+        if len(inpt) and multiple > 1:
             if decoding:
-                # Remove multiple
-                count = 0
-                what = -1
-                for i in inpt:
-                    if i:
-                        if not what:
-                            if count > 0:
-                                errors += 1
-                            count = 0
-                        what = True
-                        count += 1
-                        if count >= self.multiple:
-                            output.append(True)
-                            count = 0
-                    else:
-                        if what:
-                            if count > 0:
-                                errors += 1
-                            count = 0
-                        what = False
-                        count += 1
-                        if count >= self.multiple:
-                            output.append(False)
-                            count = 0
+                # Remove multiple: every run of equal bits gives run_length // multiple bits,
+                # a remainder is an error unless it is the last run
+                run_starts = np.concatenate(([0], np.flatnonzero(inpt[1:] != inpt[:-1]) + 1))
+                run_lengths = np.diff(np.append(run_starts, len(inpt)))
+                output = np.repeat(inpt[run_starts], run_lengths // multiple)
+                errors = int(np.count_nonzero(run_lengths[:-1] % multiple))
             else:
                 # Add multiple
-                for i in inpt:
-                    output.extend([i] * self.multiple)
-        return output, errors, self.ErrorState.SUCCESS
+                output = np.repeat(inpt, multiple)
+        return output, errors, Encoder.ErrorState.SUCCESS
 
     def code_invert(self, decoding, inpt):
+        return self.__run_kernel(self.__invert, decoding, inpt)
+
+    @staticmethod
+    def __invert(decoding, inpt):
         errors = 0
-        return [True if not x else False for x in inpt], errors, self.ErrorState.SUCCESS
+        return ~inpt, errors, Encoder.ErrorState.SUCCESS
 
     def code_differential(self, decoding, inpt):
-        output = [inpt[0]]
+        return self.__run_kernel(self.__differential, decoding, inpt)
+
+    @staticmethod
+    def __differential(decoding, inpt):
         errors = 0
 
         if decoding:
             # Remove differential from inpt stream
-            i = 1
-            while i < len(inpt):
-                if inpt[i] != inpt[i - 1]:
-                    output.append(True)
-                else:
-                    output.append(False)
-                i += 1
+            output = np.concatenate((inpt[:1], inpt[1:] != inpt[:-1]))
         else:
             # Add differential encoding to output stream
-            i = 1
-            while i < len(inpt):
-                if not inpt[i]:
-                    output.append(output[i - 1])
-                else:
-                    if not output[i - 1]:
-                        output.append(True)
-                    else:
-                        output.append(False)
-                i += 1
-        return output, errors, self.ErrorState.SUCCESS
+            output = np.logical_xor.accumulate(inpt)
+        return output, errors, Encoder.ErrorState.SUCCESS
 
     def code_edge(self, decoding, inpt):
+        return self.__run_kernel(self.__edge, decoding, inpt)
+
+    @staticmethod
+    def __edge(decoding, inpt):
         errors = 0
-        output = []
 
         if decoding:
-            i = 1
-            while i < len(inpt):
-                if inpt[i] == inpt[i - 1]:
-                    errors += 1
-                    i += 1
-                    continue
-                output.append(inpt[i])
-                i += 2
+            output, errors = util.decode_edge(np.ascontiguousarray(inpt).view(np.uint8))
+            output = output.view(bool)
         else:
-            for i in inpt:
-                if not i:
-                    output.extend([True, False])
-                else:
-                    output.extend([False, True])
-        return output, errors, self.ErrorState.SUCCESS
+            output = np.column_stack((~inpt, inpt)).ravel()
+        return output, errors, Encoder.ErrorState.SUCCESS
 
     def code_substitution(self, decoding, inpt):
-        errors = 0
-        output = []
-
         # Every element in src has to have the same size
         src = self.src
         dst = self.dst
@@ -585,6 +663,13 @@ class Encoder(object):
         if len(src) < 1 or len(dst) < 1:
             return [], 1, self.ErrorState.WRONG_INPUT
 
+        if len(src) == len(dst) and len(src[0]) > 0:
+            return self.__run_kernel(self.__substitution, decoding, inpt,
+                                     self.__substitution_table(src, dst), self.__substitution_table(dst, src))
+
+        errors = 0
+        output = []
+
         if not decoding:
             src, dst = dst, src
 
@@ -602,6 +687,12 @@ class Encoder(object):
 
         return output, errors, self.ErrorState.SUCCESS
 
+    @staticmethod
+    def __substitution(decoding, inpt, decoding_table, encoding_table):
+        src, src_offsets, dst, dst_offsets = decoding_table if decoding else encoding_table
+        output, errors = util.substitute(np.ascontiguousarray(inpt).view(np.uint8), src, src_offsets, dst, dst_offsets)
+        return output.view(bool), errors, Encoder.ErrorState.SUCCESS
+
     def code_externalprogram(self, decoding, inpt):
         errors = 0
 
@@ -615,9 +706,11 @@ class Encoder(object):
         return output, errors, self.ErrorState.SUCCESS
 
     def code_cut(self, decoding, inpt):
+        return self.__run_kernel(self.__cut, decoding, inpt)
+
+    def __cut(self, decoding, inpt):
         errors = 0
         state = self.ErrorState.SUCCESS
-        output = []
 
         # cutmark -> [True, False]
         # cutmode -> 0 = before, 1 = after, 2 = before_pos, 3 = after_pos
@@ -631,31 +724,28 @@ class Encoder(object):
                     # Cutmark is not valid
                     return inpt, 0, self.ErrorState.INVALID_CUTMARK
 
-                for i in range(0, len(inpt) - len_cutmark):
-                    if all(inpt[i + j] == self.cutmark[j] for j in range(len_cutmark)):
-                        pos = i
-                        break
+                pos = self.__find(inpt[:len(inpt) - 1], self.cutmark)
             else:
                 pos = int(self.cutmark)
 
             if 0 <= pos < len(inpt):
                 # Delete before
                 if self.cutmode == 0 or self.cutmode == 2:
-                    output.extend(inpt[pos:])
+                    output = inpt[pos:]
                 else:
                     # Delete after
                     if self.cutmode == 1:
                         pos += len(self.cutmark)
                     else:
                         pos += 1
-                    output.extend(inpt[:pos])
+                    output = inpt[:pos]
             else:
                 # Position not found or not in range, do nothing!
                 state = self.ErrorState.PREAMBLE_NOT_FOUND
-                output.extend(inpt)
+                output = inpt
         else:
             # Can't undo removing information :-(
-            output.extend(inpt)
+            output = inpt
         return output, errors, state
 
     def enocean_hash(self, msg):
@@ -1,9 +1,8 @@
-import copy
-
 import numpy as np
 from PyQt5.QtWidgets import QUndoCommand
 
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.ProtocolDelta import ProtocolDelta
 from urh.signalprocessing.Signal import Signal
 
 
@@ -20,10 +19,12 @@ class ChangeSignalParameter(QUndoCommand):
         self.setText("Change {0} of {1} from {2} to {3}".format(parameter_name, signal.name, self.orig_value, parameter_value))
 
         self.protocol = protocol
-        self.orig_messages = copy.deepcopy(self.protocol.messages)
+        self.delta = ProtocolDelta()
 
     def redo(self):
         msg_data = [(msg.decoder, msg.participant, msg.message_type) for msg in self.protocol.messages]
+        # The protocol is demodulated again, so the current messages are kept by reference
+        self.delta.save_messages(self.protocol)
         setattr(self.signal, self.parameter_name, self.parameter_value)
         # Restore msg parameters
         if len(msg_data) == self.protocol.num_messages:
@@ -40,5 +41,5 @@ class ChangeSignalParameter(QUndoCommand):
         setattr(self.signal, self.parameter_name, self.orig_value)
         self.signal.block_protocol_update = block_proto_update
 
-        self.protocol.messages = self.orig_messages
+        self.delta.restore()
         self.protocol.qt_signals.protocol_updated.emit()
\ No newline at end of file
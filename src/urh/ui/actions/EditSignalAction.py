@@ -4,6 +4,7 @@ import numpy as np
 from PyQt5.QtWidgets import QUndoCommand
 
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.ProtocolDelta import ProtocolDelta
 from urh.signalprocessing.Signal import Signal
 
 from enum import Enum
@@ -47,23 +48,17 @@ class EditSignalAction(QUndoCommand):
         self.protocol = protocol
         self.cache_qad = cache_qad
 
+        # Only references to the pieces of the samples are kept, no samples are copied
         if self.mode == EditAction.crop:
             self.setText("Crop Signal")
-            self.pre_crop_data = self.signal._fulldata[0:self.start]
-            self.post_crop_data = self.signal._fulldata[self.end:]
-            if self.cache_qad:
-                self.pre_crop_qad = self.signal._qad[0:self.start]
-                self.post_crop_qad = self.signal._qad[self.end:]
+            self.pre_crop_pieces = self.__get_pieces(0, self.start)
+            self.post_crop_pieces = self.__get_pieces(self.end, self.signal.num_samples)
         elif self.mode == EditAction.mute:
             self.setText("Mute Signal")
-            self.orig_data_part = copy.copy(self.signal._fulldata[self.start:self.end])
-            if self.cache_qad:
-                self.orig_qad_part = copy.copy(self.signal._qad[self.start:self.end])
+            self.orig_pieces = self.__get_pieces(self.start, self.end)
         elif self.mode == EditAction.delete:
             self.setText("Delete Range")
-            self.orig_data_part = self.signal._fulldata[self.start:self.end]
-            if self.cache_qad:
-                self.orig_qad_part = self.signal._qad[self.start:self.end]
+            self.orig_pieces = self.__get_pieces(self.start, self.end)
         elif self.mode == EditAction.paste:
             self.setText("Paste")
         elif self.mode == EditAction.insert:
@@ -72,12 +67,16 @@ class EditSignalAction(QUndoCommand):
         self.orig_parameter_cache = copy.deepcopy(self.signal.parameter_cache)
         self.signal_was_changed = self.signal.changed
 
-        if self.protocol:
-            self.orig_messages = copy.deepcopy(self.protocol.messages)
+        self.delta = ProtocolDelta()
+        self.orig_messages = []
 
     def redo(self):
         keep_msg_indices = {}
 
+        if self.protocol:
+            # The edited signal is demodulated again, so the current messages are kept by reference
+            self.orig_messages = self.delta.save_messages(self.protocol)
+
         if self.mode in (EditAction.delete, EditAction.mute) and self.protocol:
             removed_msg_indices = self.__find_message_indices_in_sample_range(self.start, self.end)
             if removed_msg_indices:
@@ -126,19 +125,15 @@ class EditSignalAction(QUndoCommand):
 
     def undo(self):
         if self.mode == EditAction.delete:
-            self.signal._fulldata = np.insert(self.signal._fulldata, self.start, self.orig_data_part)
-            if self.cache_qad:
-                self.signal._qad = np.insert(self.signal._qad, self.start, self.orig_qad_part)
+            self.signal.restore_pieces(self.start, self.start, self.orig_pieces)
 
         elif self.mode == EditAction.mute:
-            self.signal._fulldata[self.start:self.end] = self.orig_data_part
-            if self.cache_qad:
-                self.signal._qad[self.start:self.end] = self.orig_qad_part
+            self.signal.restore_pieces(self.start, self.end, self.orig_pieces)
 
         elif self.mode == EditAction.crop:
-            self.signal._fulldata = np.concatenate((self.pre_crop_data, self.signal._fulldata, self.post_crop_data))
-            if self.cache_qad:
-                self.signal._qad = np.concatenate((self.pre_crop_qad, self.signal._qad, self.post_crop_qad))
+            num_samples = self.signal.num_samples
+            self.signal.restore_pieces(num_samples, num_samples, self.post_crop_pieces)
+            self.signal.restore_pieces(0, 0, self.pre_crop_pieces)
 
         elif self.mode == EditAction.paste or self.mode == EditAction.insert:
             self.signal.delete_range(self.position, self.position+len(self.data_to_insert))
@@ -146,12 +141,16 @@ class EditSignalAction(QUndoCommand):
         self.signal.parameter_cache = self.orig_parameter_cache
 
         if self.protocol:
-            self.protocol.messages = self.orig_messages
+            self.delta.restore()
             self.protocol.qt_signals.protocol_updated.emit()
 
         self.signal.changed = self.signal_was_changed
         self.signal.data_edited.emit()
 
+    def __get_pieces(self, start: int, end: int) -> tuple:
+        data, qad = self.signal.get_pieces(start, end)
+        return data, qad if self.cache_qad else None
+
     def __find_message_indices_in_sample_range(self, start: int, end: int):
         result = []
         for i, message in enumerate(self.protocol.messages):
@@ -1,9 +1,8 @@
-import copy
-
 from PyQt5.QtWidgets import QUndoCommand
 
 from urh import constants
 from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer
+from urh.signalprocessing.ProtocolDelta import ProtocolDelta
 
 
 class Fuzz(QUndoCommand):
@@ -11,15 +10,18 @@ class Fuzz(QUndoCommand):
         super().__init__()
         self.proto_analyzer_container = proto_analyzer_container
         self.fuz_mode = fuz_mode
+        self.delta = ProtocolDelta()
 
         self.setText("{0} Fuzzing".format(self.fuz_mode))
-        self.orig_messages = copy.deepcopy(self.proto_analyzer_container.messages)
 
     def redo(self):
         if constants.SETTINGS.value('use_default_fuzzing_pause', True, bool):
             default_pause = constants.SETTINGS.value("default_fuzzing_pause", 10**6, int)
         else:
             default_pause = None
+
+        # Fuzzing replaces the list of messages and keeps the original one
+        self.delta.save_message_list(self.proto_analyzer_container)
         if self.fuz_mode == "Successive":
             self.proto_analyzer_container.fuzz_successive(default_pause=default_pause)
         elif self.fuz_mode == "Concurrent":
@@ -28,4 +30,4 @@ class Fuzz(QUndoCommand):
             self.proto_analyzer_container.fuzz_exhaustive(default_pause=default_pause)
 
     def undo(self):
-        self.proto_analyzer_container.messages = self.orig_messages
+        self.delta.restore()
@@ -1,9 +1,8 @@
-import copy
-
 from PyQt5.QtWidgets import QUndoCommand
 
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer
+from urh.signalprocessing.ProtocolDelta import ProtocolDelta
 
 
 class InsertBitsAndPauses(QUndoCommand):
@@ -16,10 +15,11 @@ class InsertBitsAndPauses(QUndoCommand):
             self.index = len(self.proto_analyzer_container.messages)
 
         self.setText("Insert Bits at index {0:d}".format(self.index))
-        self.orig_messages = copy.deepcopy(self.proto_analyzer_container.messages)
+        self.delta = ProtocolDelta()
 
     def redo(self):
+        self.delta.save_messages(self.proto_analyzer_container, self.index, self.index)
         self.proto_analyzer_container.insert_protocol_analyzer(self.index, self.proto_analyzer)
 
     def undo(self):
-        self.proto_analyzer_container.messages = self.orig_messages
+        self.delta.restore()
@@ -1,8 +1,7 @@
-import copy
-
 from PyQt5.QtWidgets import QUndoCommand
 
 from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer
+from urh.signalprocessing.ProtocolDelta import ProtocolDelta
 
 
 class InsertColumn(QUndoCommand):
@@ -13,15 +12,16 @@ class InsertColumn(QUndoCommand):
         self.nbits = 1 if view == 0 else 4 if view == 1 else 8
         self.rows = rows
 
-        self.orig_messages = copy.deepcopy(self.proto_analyzer_container.messages)
+        self.delta = ProtocolDelta()
 
         self.setText("Insert column at {0:d}".format(index))
 
     def redo(self):
         for i in self.rows:
             msg = self.proto_analyzer_container.messages[i]
+            self.delta.save_bits(msg, self.index, self.index, num_inserted=self.nbits)
             for j in range(self.nbits):
                 msg.insert(self.index + j, False)
 
     def undo(self):
-        self.proto_analyzer_container.messages = self.orig_messages
\ No newline at end of file
+        self.delta.restore()
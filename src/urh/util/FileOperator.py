@@ -10,6 +10,7 @@ from PyQt5.QtCore import QDir
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 
 from urh.util.Errors import Errors
+from urh.util.RingBuffer import RingBuffer
 
 VIEW_TYPES = ["Bits", "Hex", "ASCII"]
 
@@ -63,7 +64,7 @@ def get_save_file_name(initial_name: str, wav_only=False, parent=None, caption="
     elif caption == "Save fuzz profile":
         filter = "Fuzzfiles (*.fuzz);;All files (*)"
     else:
-        filter = "Protocols (*.proto);;All files (*)"
+        filter = "Protocols (*.proto);;Binary protocols (*.bproto);;All files (*)"
 
     filename = None
     dialog = QFileDialog()
@@ -105,7 +106,7 @@ def save_data(data, filename: str):
         f.setnchannels(1)
         f.setsampwidth(1)
         f.setframerate(1000000)
-        f.writeframes(data)
+        f.writeframes(data[:] if isinstance(data, RingBuffer) else data)
         f.my_close()
     elif filename.endswith(".coco"):
         with tarfile.open(filename, 'w:bz2') as tarwrite:
@@ -127,19 +128,69 @@ def save_data(data, filename: str):
             rewrite_tar(archive)
 
 
+def convert_data_to_format(data: np.ndarray, filename: str):
+    if filename.endswith(".complex16u"):
+        return (127.5 * (data.view(np.float32) + 1.0)).astype(np.uint8)
+    elif filename.endswith(".complex16s"):
+        return (127.5 * ((data.view(np.float32)) - 0.5/127.5)).astype(np.int8)
+    else:
+        return data
+
+
 def save_signal(signal):
     filename = signal.filename
+    if signal.memory_mapped and not filename.endswith(".wav") and not filename.endswith(".coco"):
+        save_memory_mapped_signal(signal)
+        return
+
+    if signal.memory_mapped:
+        signal._fulldata = np.array(signal.data, dtype=np.complex64)
+
     if filename.endswith(".wav"):
         data = signal.wave_data
-    elif filename.endswith(".complex16u"):
-        data = (127.5 * (signal.data.view(np.float32) + 1.0)).astype(np.uint8)
-    elif filename.endswith(".complex16s"):
-        data = (127.5 * ((signal.data.view(np.float32)) - 0.5/127.5)).astype(np.int8)
     else:
-        data = signal.data
+        # Edited samples are only materialized for writing
+        data = convert_data_to_format(np.asarray(signal.data), filename)
 
     save_data(data, filename)
 
+
+def save_memory_mapped_signal(signal):
+    """
+    Write a memory mapped signal chunk by chunk, so it never needs to be loaded into RAM.
+    The data is written to a temporary file first, because the target may be the mapped file itself.
+    Afterwards the signal maps the saved file.
+
+    """
+    filename = signal.filename
+    name, ext = os.path.splitext(filename)
+    tmp_filename = name + ".tmp" + ext  # keep the extension, it determines the sample format
+    try:
+        write_chunks(signal.data, tmp_filename, data_format=filename)
+        signal.replace_mapped_file(tmp_filename)
+    except Exception as e:
+        Errors.write_error(e)
+        return
+
+    if filename in archives.keys():
+        archive = archives[filename]
+        if archive.endswith("zip"):
+            rewrite_zip(archive)
+        elif archive.endswith("tar") or archive.endswith("bz2") or archive.endswith("gz"):
+            rewrite_tar(archive)
+
+def write_chunks(data, filename: str, data_format: str = None):
+    """
+    Write lazy data (MemmapIQ or PieceTable) chunk by chunk.
+    No chunk outlives this function, so afterwards nothing references the memory map of the data.
+
+    :param data_format: filename whose extension determines the format, filename if None
+    """
+    with open(filename, "wb") as f:
+        for _, chunk in data.iter_chunks():
+            convert_data_to_format(chunk, filename if data_format is None else data_format).tofile(f)
+
+
 def rewrite_zip(zipfname):
     tempdir = tempfile.mkdtemp()
     try:
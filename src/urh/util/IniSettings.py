@@ -0,0 +1,62 @@
+import configparser
+import os
+import sys
+
+
+class IniSettings(object):
+    """
+    Read only access to the settings file written by QSettings with IniFormat and UserScope.
+    Used instead of QSettings, when Qt is not available, e.g. for batch processing on headless machines.
+    """
+
+    TRUE_VALUES = ("true", "1", "yes", "on")
+
+    def __init__(self, organization: str, application: str):
+        if sys.platform == "win32":
+            config_dir = os.environ.get("APPDATA", os.path.expanduser("~"))
+        else:
+            config_dir = os.environ.get("XDG_CONFIG_HOME", os.path.join(os.path.expanduser("~"), ".config"))
+
+        self.__filename = os.path.join(config_dir, organization, application + ".ini")
+        self.__values = dict()
+
+        parser = configparser.RawConfigParser(strict=False)
+        parser.optionxform = str  # keys are case sensitive
+        try:
+            parser.read(self.__filename, encoding="utf-8")
+        except configparser.Error:
+            return
+
+        for section in parser.sections():
+            # QSettings stores keys without a group in section General
+            prefix = "" if section == "General" else section + "/"
+            for key, value in parser.items(section):
+                self.__values[prefix + key] = value.strip('"')
+
+    def fileName(self) -> str:
+        return self.__filename
+
+    def allKeys(self) -> list:
+        return list(self.__values.keys())
+
+    def contains(self, key: str) -> bool:
+        return key in self.__values
+
+    def value(self, key: str, defaultValue=None, type=None):
+        """
+        Value of a key converted to type like QSettings.value
+
+        """
+        try:
+            value = self.__values[key]
+        except KeyError:
+            return type() if defaultValue is None and type is not None else defaultValue
+
+        if type is bool:
+            return value.lower() in self.TRUE_VALUES
+        if type is not None:
+            try:
+                return type(value)
+            except ValueError:
+                return defaultValue
+        return value
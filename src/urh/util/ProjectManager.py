@@ -34,6 +34,7 @@ class ProjectManager(QObject):
         self.project_path = ""
         self.broadcast_address_hex = "ffff"
         self.__project_file = None
+        self.__project_file_cache = None  # (file state, root, signal tags by filename)
         self.participants = []
 
     @property
@@ -66,6 +67,33 @@ class ProjectManager(QObject):
         self.gain = int(gain)
         self.device = device
 
+    def __read_project_file(self):
+        """
+        Parse the project file only once for all signals and parse it again only if it changed on disk.
+        The returned tree must not be modified.
+
+        :return: root and dict of signal tags by relative filename
+        """
+        stat = os.stat(self.project_file)
+        state = (self.project_file, stat.st_mtime_ns, stat.st_size)
+        if self.__project_file_cache is None or self.__project_file_cache[0] != state:
+            root = ET.parse(self.project_file).getroot()
+            signal_tags = dict()
+            for signal_tag in root.iter("signal"):
+                signal_tags.setdefault(signal_tag.attrib["filename"], signal_tag)
+            self.__project_file_cache = (state, root, signal_tags)
+
+        return self.__project_file_cache[1], self.__project_file_cache[2]
+
+    def __write_project_file(self, tree: ET.ElementTree):
+        """
+        Write the project file and drop the parsed tree, so the next read does not rely on the
+        modification time, which may not change for writes within the timestamp resolution
+
+        """
+        tree.write(self.project_file)
+        self.__project_file_cache = None
+
     def read_parameters(self, root):
         self.frequency = float(root.get("frequency", 433.92e6))
         self.sample_rate = float(root.get("sample_rate", 1e6))
@@ -78,8 +106,7 @@ class ProjectManager(QObject):
         if self.project_file is None:
             return None
 
-        tree = ET.parse(self.project_file)
-        root = tree.getroot()
+        root = self.__read_project_file()[0]
         try:
             return [MessageType.from_xml(msg_type_tag) for msg_type_tag in root.find("protocol").find("message_types").findall("message_type")]
         except AttributeError:
@@ -106,10 +133,9 @@ class ProjectManager(QObject):
             if self.project_file is not None:
                 root = ET.Element("UniversalRadioHackerProject")
                 tree = ET.ElementTree(root)
-                tree.write(self.project_file)
+                self.__write_project_file(tree)
         else:
-            tree = ET.parse(self.project_file)
-            root = tree.getroot()
+            root = self.__read_project_file()[0]
 
             collapse_project_tabs = bool(int(root.get("collapse_project_tabs", 0)))
             cfc = self.maincontroller.compare_frame_controller
@@ -159,9 +185,15 @@ class ProjectManager(QObject):
         self.maincontroller.show_project_settings()
 
     def write_signal_information_to_project_file(self, signal: Signal, messages, tree=None):
+        """
+
+        :param tree: parsed project file, if given the caller writes it to the file
+        """
         if self.project_file is None or signal is None or len(signal.filename) == 0:
             return
 
+        # The caller passing the tree writes it once for all signals
+        write_file = tree is None
         if tree is None:
             tree = ET.parse(self.project_file)
 
@@ -194,7 +226,8 @@ class ProjectManager(QObject):
         for message in messages:
             messages.append(message.to_xml())
 
-        tree.write(self.project_file)
+        if write_file:
+            self.__write_project_file(tree)
 
     def write_modulators_to_project_file(self, modulators, tree=None):
         """
@@ -215,7 +248,7 @@ class ProjectManager(QObject):
         for i, mod in enumerate(modulators):
             root.append(mod.to_xml(i))
 
-        tree.write(self.project_file)
+        self.__write_project_file(tree)
 
     def read_modulators_from_project_file(self):
         """
@@ -224,8 +257,7 @@ class ProjectManager(QObject):
         if not self.project_file:
             return []
 
-        tree = ET.parse(self.project_file)
-        root = tree.getroot()
+        root = self.__read_project_file()[0]
 
         result = []
         for mod_tag in root.iter("modulator"):
@@ -241,7 +273,7 @@ class ProjectManager(QObject):
         open(self.project_file, 'w').close()
         root = ET.Element("UniversalRadioHackerProject")
         tree = ET.ElementTree(root)
-        tree.write(self.project_file)
+        self.__write_project_file(tree)
 
         #self.write_labels(self.maincontroller.compare_frame_controller.proto_analyzer)
         self.write_modulators_to_project_file(self.maincontroller.generator_tab_controller.modulators, tree=tree)
@@ -307,52 +339,58 @@ class ProjectManager(QObject):
         if self.project_file is None or len(signal.filename) == 0:
             return False
 
-        tree = ET.parse(self.project_file)
-        root = tree.getroot()
-
-        for sig_tag in root.iter("signal"):
-            if sig_tag.attrib["filename"] == os.path.relpath(signal.filename, self.project_path):
-                messages_tag = sig_tag.find("messages")
-
-                try:
-                    if messages_tag:
-                        for i, message_tag in enumerate(messages_tag.iter("message")):
-                            messages[i].from_xml(message_tag, self.participants)
-                except IndexError:
-                    return False
+        sig_tag = self.__read_project_file()[1].get(os.path.relpath(signal.filename, self.project_path))
+        if sig_tag is None:
+            return False
 
-                return True
+        messages_tag = sig_tag.find("messages")
+        try:
+            if messages_tag:
+                for i, message_tag in enumerate(messages_tag.iter("message")):
+                    messages[i].from_xml(message_tag, self.participants)
+        except IndexError:
+            return False
 
-        return False
+        return True
 
     def read_project_file_for_signal(self, signal: Signal):
         if self.project_file is None or len(signal.filename) == 0:
             return False
 
-        tree = ET.parse(self.project_file)
-        root = tree.getroot()
-        for sig_tag in root.iter("signal"):
-            if sig_tag.attrib["filename"] == os.path.relpath(signal.filename,
-                                                             self.project_path):
-                signal.name = sig_tag.attrib["name"]
-                signal.qad_center = float(sig_tag.get("qad_center", 0))
-                signal.tolerance = int(sig_tag.get("tolerance", 5))
-                signal.auto_detect_on_modulation_changed = False if \
-                sig_tag.attrib[
-                                                                        "auto_detect_on_modulation_changed"] == 'False' else True
-
-                signal.noise_threshold = float(sig_tag.get("noise_threshold", 0.1))
-                signal.sample_rate = float(sig_tag.get("sample_rate", 1e6))
-                signal.bit_len = int(sig_tag.get("bit_length", 100))
-                signal.modulation_type = int(sig_tag.get("modulation_type", 0))
-                break
-
+        self.apply_signal_tag(signal, self.read_signal_tag(signal.filename))
         return True
 
+    def read_signal_tag(self, filename: str):
+        """
+        Entry of a signal in the project file, so it can be applied later with apply_signal_tag,
+        e.g. in a worker thread, which must not read the project file itself
+
+        :return: None if there is no project file or no entry for the signal
+        :rtype: xml.etree.ElementTree.Element
+        """
+        if self.project_file is None or len(filename) == 0:
+            return None
+        return self.__read_project_file()[1].get(os.path.relpath(filename, self.project_path))
+
+    @staticmethod
+    def apply_signal_tag(signal: Signal, sig_tag):
+        if sig_tag is None:
+            return
+
+        signal.name = sig_tag.attrib["name"]
+        signal.qad_center = float(sig_tag.get("qad_center", 0))
+        signal.tolerance = int(sig_tag.get("tolerance", 5))
+        signal.auto_detect_on_modulation_changed = False if \
+            sig_tag.attrib["auto_detect_on_modulation_changed"] == 'False' else True
+
+        signal.noise_threshold = float(sig_tag.get("noise_threshold", 0.1))
+        signal.sample_rate = float(sig_tag.get("sample_rate", 1e6))
+        signal.bit_len = int(sig_tag.get("bit_length", 100))
+        signal.modulation_type = int(sig_tag.get("modulation_type", 0))
+
     def read_opened_filenames(self):
         if self.project_file is not None:
-            tree = ET.parse(self.project_file)
-            root = tree.getroot()
+            root = self.__read_project_file()[0]
             fileNames = []
 
             for ftag in root.findall("open_file"):
@@ -0,0 +1,320 @@
+import os
+import tempfile
+import weakref
+
+import numpy as np
+
+from urh.util.Logger import logger
+
+
+class RingBuffer(object):
+    """
+    Fixed size ring buffer for received samples with one writer and any number of readers.
+
+    Samples are addressed by their absolute position in the stream, so index pairs emitted
+    by the receiving threads stay valid when the buffer wraps around. The writer publishes the new
+    number of written samples only after the samples are stored, so readers do not need a lock.
+    Before storing, the writer reserves the positions, so readers treat the samples being overwritten as gone.
+    Reading a range, which does not wrap, returns a view on the buffer without copying.
+
+    If a spill file is given, all samples are additionally streamed to this file and ranges, which are
+    already overwritten in the ring, are read from there. So recordings are bounded by disk space, not by RAM.
+    """
+
+    DEFAULT_SIZE = 2 ** 23  # 64 MB of complex64
+
+    def __init__(self, size: int, spill_filename: str = None):
+        """
+
+        :param spill_filename: "" to spill to a temporary file, which is deleted with the buffer
+        """
+        self.__data = np.zeros(int(size), dtype=np.complex64, order="C")
+        self.__num_written = 0
+        self.__num_reserved = 0  # written samples plus samples, which are being written
+
+        self.spill_writer = None  # type: SpillWriter
+        if spill_filename is not None:
+            chunk_size = min(SpillWriter.CHUNK_SIZE, len(self.__data))
+            self.spill_writer = SpillWriter(spill_filename, chunk_size=chunk_size)
+
+    @property
+    def size(self) -> int:
+        return len(self.__data)
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        The ring itself, samples are not in stream order after wrapping around.
+        Order independent evaluations such as the magnitude of the spectrum can use it directly.
+
+        """
+        return self.__data
+
+    @property
+    def num_written(self) -> int:
+        return self.__num_written
+
+    @property
+    def first_available(self) -> int:
+        """
+        Position of the oldest sample, which can still be read
+
+        """
+        if self.spill_writer is not None:
+            return 0
+        return self.__oldest_in_ring
+
+    @property
+    def __oldest_in_ring(self) -> int:
+        return max(0, self.__num_reserved - len(self.__data))
+
+    @property
+    def real(self):
+        """
+        Lazy view on the real part for plotting with a SceneManager
+
+        :rtype: RingBufferRealView
+        """
+        return RingBufferRealView(self)
+
+    def __len__(self):
+        return self.__num_written
+
+    def push(self, values: np.ndarray):
+        """
+        Append samples, the oldest samples get overwritten if the ring is full
+
+        :return: positions (old, new) of the pushed samples in the stream
+        """
+        values = np.asarray(values, dtype=np.complex64)
+        old = self.__num_written
+        if len(values) == 0:
+            return old, old
+
+        if self.spill_writer is not None:
+            self.spill_writer.write(values)
+
+        self.__num_reserved = old + len(values)
+        size = len(self.__data)
+        stored = values[-size:]
+        start = (old + len(values) - len(stored)) % size
+        first_part = min(len(stored), size - start)
+        self.__data[start:start + first_part] = stored[:first_part]
+        self.__data[:len(stored) - first_part] = stored[first_part:]
+
+        self.__num_written = old + len(values)
+        return old, self.__num_written
+
+    def write_views(self, nsamples: int) -> list:
+        """
+        Views on the ring, where the next nsamples go, so producers can convert directly into the ring.
+        The positions are reserved until commit, which makes the samples visible to readers.
+
+        :return: list of up to two arrays
+        """
+        size = len(self.__data)
+        if nsamples > size:
+            raise ValueError("Can not write {0} samples into a ring of size {1}".format(nsamples, size))
+
+        self.__num_reserved = self.__num_written + nsamples
+        i = self.__num_written % size
+        j = i + nsamples
+        if j <= size:
+            return [self.__data[i:j]]
+        return [self.__data[i:], self.__data[:j - size]]
+
+    def commit(self, nsamples: int):
+        """
+        Publish the samples written into the views of write_views
+
+        :return: positions (old, new) of the committed samples in the stream
+        """
+        old = self.__num_written
+        if self.spill_writer is not None:
+            for view in self.write_views(nsamples):
+                self.spill_writer.write(view)
+
+        self.__num_written = old + nsamples
+        return old, self.__num_written
+
+    def views(self, start: int, end: int) -> list:
+        """
+        Zero copy access to the samples from start to end
+
+        :return: list of up to two arrays, which are views on the ring
+        """
+        end = min(int(end), self.__num_written)
+        start = min(int(start), end)
+        size = len(self.__data)
+        if start == end:
+            return []
+        if start < self.__oldest_in_ring:
+            raise IndexError("Samples {0}-{1} are already overwritten".format(start, self.__oldest_in_ring))
+
+        i, j = start % size, end % size
+        if i < j or j == 0:
+            return [self.__data[i:j if j > 0 else size]]
+        return [self.__data[i:], self.__data[:j]]
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            raise TypeError("RingBuffer only supports slices")
+
+        start, end, step = item.indices(self.__num_written)
+        end = max(start, end)
+        parts = []
+        oldest_in_ring = self.__oldest_in_ring
+        if start < oldest_in_ring:
+            if self.spill_writer is None:
+                raise IndexError("Samples {0}-{1} are already overwritten".format(start, oldest_in_ring))
+            parts.append(self.spill_writer.read(start, min(end, oldest_in_ring)))
+            start = min(end, oldest_in_ring)
+
+        parts.extend(self.views(start, end))
+        if len(parts) == 0:
+            result = np.zeros(0, dtype=np.complex64)
+        elif len(parts) == 1:
+            result = parts[0]
+        else:
+            result = np.concatenate(parts)
+        return result if step == 1 else result[::step]
+
+    def tofile(self, filename: str):
+        """
+        Write all samples to a .complex file like numpy's tofile.
+        Spilled samples are copied from the spill file, so the recording is never loaded into RAM.
+
+        """
+        end = self.__num_written
+        with open(filename, "wb") as f:
+            start = self.spill_writer.copy_to(f, end) if self.spill_writer is not None else 0
+            for view in self.views(start, end):
+                f.write(memoryview(view).cast("B"))
+
+    def clear(self):
+        self.__num_written = 0
+        self.__num_reserved = 0
+        if self.spill_writer is not None:
+            self.spill_writer.truncate()
+
+    def close(self):
+        if self.spill_writer is not None:
+            self.spill_writer.close()
+
+
+class RingBufferRealView(object):
+    def __init__(self, ring_buffer: RingBuffer):
+        self.ring_buffer = ring_buffer
+
+    def __len__(self):
+        return len(self.ring_buffer)
+
+    def __getitem__(self, item):
+        return self.ring_buffer[item].real
+
+    def minmax(self):
+        data = self.ring_buffer.data[:len(self.ring_buffer)].real
+        return (float(np.min(data)), float(np.max(data))) if len(data) > 0 else (0, 0)
+
+
+class SpillWriter(object):
+    """
+    Stream samples to a .complex file in large, page aligned writes.
+    Samples are collected in a chunk, which is written once it is full.
+    """
+
+    CHUNK_SIZE = 2 ** 17  # 1 MB of complex64, multiple of the page size
+
+    def __init__(self, filename: str, chunk_size=CHUNK_SIZE):
+        """
+
+        :param filename: "" to use a temporary file, which is deleted when the writer is closed
+        """
+        self.is_temporary = not filename
+        if self.is_temporary:
+            fd, filename = tempfile.mkstemp(prefix="urh_recording_", suffix=".complex")
+            os.close(fd)
+            self.__finalizer = weakref.finalize(self, SpillWriter.__remove, filename)
+        self.filename = filename
+
+        self.__file = open(filename, "wb")
+        self.__chunk = np.empty(int(chunk_size), dtype=np.complex64)
+        self.__chunk_len = 0
+        self.__num_flushed = 0
+
+    @property
+    def num_flushed(self) -> int:
+        """
+        Number of samples, which are written to the file
+
+        """
+        return self.__num_flushed
+
+    def write(self, values: np.ndarray):
+        chunk = self.__chunk
+        while len(values) > 0:
+            n = min(len(values), len(chunk) - self.__chunk_len)
+            chunk[self.__chunk_len:self.__chunk_len + n] = values[:n]
+            self.__chunk_len += n
+            values = values[n:]
+            if self.__chunk_len == len(chunk):
+                self.flush()
+
+    def flush(self):
+        if self.__chunk_len == 0 or self.__file.closed:
+            return
+        try:
+            self.__file.write(memoryview(self.__chunk[:self.__chunk_len]).cast("B"))
+            self.__file.flush()
+        except OSError as e:
+            logger.error("Could not write received samples to {0}: {1}".format(self.filename, e))
+            raise
+        self.__num_flushed += self.__chunk_len
+        self.__chunk_len = 0
+
+    def read(self, start: int, end: int) -> np.ndarray:
+        """
+        Read flushed samples from the file without loading them into RAM
+
+        """
+        end = min(end, self.__num_flushed)
+        if end <= start:
+            return np.zeros(0, dtype=np.complex64)
+        return np.memmap(self.filename, dtype=np.complex64, mode="r", shape=(self.__num_flushed,))[start:end]
+
+    def copy_to(self, f, end: int) -> int:
+        """
+        Copy the flushed samples up to end into the open binary file f block by block
+
+        :return: number of copied samples
+        """
+        num_samples = min(int(end), self.__num_flushed)
+        remaining = num_samples * self.__chunk.itemsize
+        with open(self.filename, "rb") as spill_file:
+            while remaining > 0:
+                block = spill_file.read(min(remaining, self.__chunk.nbytes))
+                if not block:
+                    break
+                f.write(block)
+                remaining -= len(block)
+        return num_samples
+
+    def truncate(self):
+        self.__chunk_len = 0
+        self.__num_flushed = 0
+        if not self.__file.closed:
+            self.__file.seek(0)
+            self.__file.truncate()
+
+    def close(self):
+        self.flush()
+        self.__file.close()
+        if self.is_temporary:
+            self.__finalizer()
+
+    @staticmethod
+    def __remove(filename: str):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
@@ -0,0 +1,84 @@
+import numpy as np
+
+
+class SearchIndex(object):
+    """
+    Search index over the strings of a protocol view (bits, hex or ascii).
+
+    Rows are grouped into blocks of BLOCK_SIZE messages. Each block holds its rows concatenated into
+    one buffer together with the offsets of the rows, so a search is a single str.find scan per block.
+    Updating the index only rebuilds blocks whose rows changed and appends new blocks for new messages,
+    the result of the last search is cached per block, so repeated searches only scan changed blocks.
+    """
+
+    BLOCK_SIZE = 1024
+
+    def __init__(self):
+        self.__blocks = []
+        """:type: list of SearchBlock """
+
+    @property
+    def num_rows(self) -> int:
+        return sum(len(block.rows) for block in self.__blocks)
+
+    def update(self, rows: list):
+        """
+        Synchronize the index with the current strings of the view
+
+        :type rows: list of str
+        """
+        num_blocks = (len(rows) + self.BLOCK_SIZE - 1) // self.BLOCK_SIZE
+        del self.__blocks[num_blocks:]
+
+        for i in range(num_blocks):
+            block_rows = rows[i * self.BLOCK_SIZE:(i + 1) * self.BLOCK_SIZE]
+            if i == len(self.__blocks):
+                self.__blocks.append(SearchBlock(block_rows))
+            elif self.__blocks[i].rows != block_rows:
+                self.__blocks[i] = SearchBlock(block_rows)
+
+    def find(self, value: str) -> list:
+        """
+        Find all (also overlapping) occurrences of value
+
+        :return: list of (row, column)
+        """
+        result = []
+        if len(value) == 0:
+            return result
+
+        for i, block in enumerate(self.__blocks):
+            result.extend((row + i * self.BLOCK_SIZE, col) for row, col in block.find(value))
+        return result
+
+
+class SearchBlock(object):
+    def __init__(self, rows: list):
+        self.rows = list(rows)
+        self.buffer = "".join(self.rows)
+
+        lengths = np.fromiter(map(len, self.rows), dtype=np.int64, count=len(self.rows))
+        self.offsets = np.cumsum(lengths) - lengths
+        self.ends = self.offsets + lengths
+
+        self.__last_value = None
+        self.__last_result = []
+
+    def find(self, value: str) -> list:
+        if value == self.__last_value:
+            return self.__last_result
+
+        positions = []
+        pos = self.buffer.find(value)
+        while pos != -1:
+            positions.append(pos)
+            pos = self.buffer.find(value, pos + 1)
+
+        positions = np.array(positions, dtype=np.int64)
+        rows = np.searchsorted(self.offsets, positions, side="right") - 1
+        # Drop matches spanning over the end of a message
+        inside = positions + len(value) <= self.ends[rows]
+
+        self.__last_value = value
+        self.__last_result = list(zip(rows[inside].tolist(), (positions - self.offsets[rows])[inside].tolist()))
+        return self.__last_result
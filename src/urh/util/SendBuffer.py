@@ -0,0 +1,201 @@
+import threading
+from collections import deque
+
+import numpy as np
+
+from urh.util.Logger import logger
+
+
+class SendBuffer(object):
+    """
+    Producer/consumer pipeline between the samples to send and the sending device.
+
+    A worker thread takes the samples chunk by chunk from the source, packs them into the format of the device
+    and writes them into one of two reusable byte buffers. While the device reads one buffer, the worker fills
+    the other one. So sending starts as soon as the first buffer is filled and memory stays constant
+    no matter how many samples are sent. The source can be an array or a generator of sample chunks,
+    which e.g. modulates messages on the fly.
+    """
+
+    NUM_SAMPLES = 2 ** 16  # Samples per buffer
+
+    def __init__(self, source, pack=None, bytes_per_sample=8, repeats=1, start=0, num_samples=NUM_SAMPLES):
+        """
+
+        :param source: complex64 array or callable returning a new iterable of sample chunks for every repetition
+        :param pack: function converting complex64 samples to the format of the device, None = raw complex64
+        :param repeats: how often the samples are sent, -1 = forever
+        :param start: sample, where the first repetition starts, e.g. for resuming
+        :param num_samples: number of samples per buffer
+        """
+        if callable(source):
+            self.__source = source
+        else:
+            self.__source = lambda: (source[i:i + num_samples] for i in range(0, len(source), num_samples))
+
+        self.__pack = pack
+        self.bytes_per_sample = bytes_per_sample
+        self.repeats = repeats
+        self.start = start
+
+        self.__buffers = [bytearray(int(num_samples) * bytes_per_sample) for _ in range(2)]
+        self.__free = deque(range(len(self.__buffers)))
+        self.__filled = deque()  # (buffer index, number of bytes, repetition, position of first sample)
+        self.__read_pos = 0  # Bytes already read from the first filled buffer
+        self.__fill = None  # [buffer index, number of bytes, repetition, position of first sample]
+        self.__condition = threading.Condition()
+
+        self.__producer_finished = False
+        self.__stopped = False
+        self.error = None
+
+        self.__current_repeat = 0
+        self.__current_sample = start
+
+        self.__worker = threading.Thread(target=self.__produce)
+        self.__worker.daemon = True
+        self.__worker.start()
+
+    @property
+    def current_repeat(self) -> int:
+        """
+        Repetition of the last sample read by the device
+
+        """
+        return self.__current_repeat
+
+    @property
+    def current_sample(self) -> int:
+        """
+        Position in the current repetition after the last sample read by the device
+
+        """
+        return self.__current_sample
+
+    @property
+    def finished(self) -> bool:
+        """
+        True, if all samples were read by the device or the buffer was stopped
+
+        """
+        with self.__condition:
+            return self.__stopped or (self.__producer_finished and not self.__filled)
+
+    def read(self, num_bytes: int) -> bytes:
+        """
+        Read the next num_bytes for the device. Waits for the worker, if the next buffer is not filled yet.
+
+        :return: num_bytes bytes or less at the end of the transmission
+        """
+        parts = []
+        remaining = int(num_bytes)
+        with self.__condition:
+            while remaining > 0:
+                while not self.__filled and not self.__producer_finished and not self.__stopped:
+                    self.__condition.wait()
+                if not self.__filled or self.__stopped:
+                    break
+
+                index, length, repeat, position = self.__filled[0]
+                start = self.__read_pos
+                end = min(length, start + remaining)
+                parts.append(memoryview(self.__buffers[index])[start:end])
+                remaining -= end - start
+
+                self.__read_pos = end
+                self.__current_repeat = repeat
+                self.__current_sample = position + end // self.bytes_per_sample
+                if end == length:
+                    # Copy before releasing the buffer, as the worker refills it
+                    parts = [b"".join(parts)]
+                    self.__filled.popleft()
+                    self.__read_pos = 0
+                    self.__free.append(index)
+                    self.__condition.notify_all()
+
+            return b"".join(parts)
+
+    def stop(self):
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify_all()
+        if self.__worker is not threading.current_thread():
+            self.__worker.join()
+
+    def __produce(self):
+        try:
+            repeat = 0
+            while (self.repeats == -1 or repeat < self.repeats) and not self.__stopped:
+                skip = self.start if repeat == 0 else 0
+                position = 0
+                for chunk in self.__source():
+                    if skip >= len(chunk):
+                        skip -= len(chunk)
+                        position += len(chunk)
+                        continue
+                    if skip > 0:
+                        chunk, position, skip = chunk[skip:], position + skip, 0
+
+                    if not self.__write(self.__pack_samples(chunk), repeat, position):
+                        return
+                    position += len(chunk)
+
+                # Every buffer belongs to a single repetition
+                if not self.__hand_off() or position == 0:
+                    return
+                repeat += 1
+        except Exception as e:
+            logger.exception(e)
+            self.error = e
+        finally:
+            with self.__condition:
+                self.__producer_finished = True
+                self.__condition.notify_all()
+
+    def __pack_samples(self, samples) -> memoryview:
+        if self.__pack is None:
+            packed = np.ascontiguousarray(samples, dtype=np.complex64)
+        else:
+            packed = self.__pack(samples)
+        return memoryview(packed).cast("B")
+
+    def __write(self, data: memoryview, repeat: int, position: int) -> bool:
+        """
+        Copy packed samples into the buffers, position is the position of the first sample in data
+
+        :return: False, if the buffer was stopped
+        """
+        offset = 0
+        while offset < len(data):
+            if self.__fill is None:
+                with self.__condition:
+                    while not self.__free and not self.__stopped:
+                        self.__condition.wait()
+                    if self.__stopped:
+                        return False
+                    index = self.__free.popleft()
+                self.__fill = [index, 0, repeat, position + offset // self.bytes_per_sample]
+
+            buffer = self.__buffers[self.__fill[0]]
+            filled = self.__fill[1]
+            n = min(len(data) - offset, len(buffer) - filled)
+            buffer[filled:filled + n] = data[offset:offset + n]
+            self.__fill[1] += n
+            offset += n
+
+            if self.__fill[1] == len(buffer) and not self.__hand_off():
+                return False
+        return True
+
+    def __hand_off(self) -> bool:
+        with self.__condition:
+            if self.__stopped:
+                return False
+            if self.__fill is not None:
+                if self.__fill[1] > 0:
+                    self.__filled.append(tuple(self.__fill))
+                else:
+                    self.__free.append(self.__fill[0])
+                self.__fill = None
+                self.__condition.notify_all()
+        return True
@@ -0,0 +1,131 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal, QCoreApplication, QEventLoop
+
+from urh import constants
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.Signal import Signal
+from urh.util.ProjectManager import ProjectManager
+
+
+class SignalLoader(QObject):
+    """
+    Load signals in a thread pool.
+
+    File I/O, parameter detection, demodulation and grabbing of pulse lengths run in worker threads,
+    the cython kernels release the GIL, so multiple signals are processed in parallel.
+    Results are handed out in the order of the filenames as soon as they are finished, so callers
+    can add frames while the remaining signals are still loading.
+    The project file is read in the GUI thread before the workers start.
+    """
+
+    progress_changed = pyqtSignal(int)  # number of finished signals
+    loaded = pyqtSignal(str)  # filename of a finished, failed or canceled signal
+
+    def __init__(self, filenames, project_manager, max_workers: int = None, parent=None):
+        """
+
+        :type filenames: list of str
+        :type project_manager: urh.util.ProjectManager.ProjectManager
+        """
+        super().__init__(parent)
+        self.filenames = list(filenames)
+        self.project_manager = project_manager
+        self.sample_rate = project_manager.sample_rate
+        self.has_project = project_manager.project_file is not None
+        self.signal_tags = {filename: project_manager.read_signal_tag(filename) for filename in self.filenames}
+        self.__canceled = False
+        self.__num_finished = 0
+        self.__lock = threading.Lock()
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(self.filenames)))
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.__futures = dict()
+        for filename in self.filenames:
+            future = self.__executor.submit(self.__load, filename)
+            # Emitted from the worker thread, so it is queued into the GUI thread
+            future.add_done_callback(lambda _, f=filename: self.loaded.emit(f))
+            self.__futures[filename] = future
+        self.__executor.shutdown(wait=False)
+
+    @property
+    def canceled(self) -> bool:
+        return self.__canceled
+
+    @property
+    def num_finished(self) -> int:
+        return self.__num_finished
+
+    @staticmethod
+    def supports(filename: str) -> bool:
+        """
+        WAV files need a dialog and COCO archives are extracted to a shared temp file,
+        so they are loaded in the GUI thread
+
+        """
+        return os.path.isfile(filename) and not filename.endswith(".wav") and not filename.endswith(".coco") \
+               and not filename.endswith((".proto", ".bproto")) and not filename.endswith(".fuzz")
+
+    def __contains__(self, filename: str):
+        return filename in self.__futures
+
+    def cancel(self):
+        """
+        Cancel all signals, which are not being loaded yet
+
+        """
+        self.__canceled = True
+        for future in self.__futures.values():
+            future.cancel()
+
+    def result(self, filename: str):
+        """
+        Wait for a signal in a local event loop, so frames of finished signals get drawn meanwhile.
+        Exceptions of the worker are raised here.
+
+        :return: (Signal, ProtocolAnalyzer) or None if loading was canceled
+        """
+        future = self.__futures[filename]
+        if not future.done():
+            event_loop = QEventLoop()
+            self.loaded.connect(event_loop.quit)
+            while not future.done():
+                event_loop.exec_()
+            self.loaded.disconnect(event_loop.quit)
+
+        if future.cancelled():
+            return None
+        return future.result()
+
+    def __load(self, filename: str):
+        if self.__canceled:
+            return None
+
+        sig_name = os.path.splitext(os.path.basename(filename))[0]
+        signal = Signal(filename, sig_name, sample_rate=self.sample_rate,
+                        memory_mapped=os.path.getsize(filename) > constants.MEMORY_MAP_THRESHOLD)
+
+        signal.blockSignals(True)
+        if self.has_project:
+            ProjectManager.apply_signal_tag(signal, self.signal_tags[filename])
+        else:
+            signal.auto_detect()
+        signal.blockSignals(False)
+
+        pa = ProtocolAnalyzer(signal)
+        if not self.__canceled:
+            pa.grab_pulse_lens()
+
+        # Objects created in a worker thread must live in the GUI thread to receive queued signals
+        main_thread = QCoreApplication.instance().thread()
+        signal.moveToThread(main_thread)
+        pa.qt_signals.moveToThread(main_thread)
+
+        with self.__lock:
+            self.__num_finished += 1
+            self.progress_changed.emit(self.__num_finished)
+        return signal, pa
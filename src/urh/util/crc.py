@@ -1,4 +1,11 @@
+from collections import defaultdict
+
+import numpy as np
+
+
 class crc_generic:
+    __tables = dict()  # (polynomial, reverse_polynomial) -> (lookup table, register width, register mask)
+
     def __init__(self, polynomial="16_standard", start_value=False, final_xor=False, reverse_polynomial=False,
                  reverse_all=False, little_endian=False, lsb_first=False):
         self.polynomial = self.choose_polynomial(polynomial)
@@ -39,32 +46,103 @@ class crc_generic:
         return polynomial
 
     def crc(self, inpt):
-        data = inpt.copy()
-        if not len(data) % 8 == 0:
-            data.extend([False] * int(8 - (len(data) % 8)))  # Padding with 0 to multiple of crc-order
-        len_data = len(data)
-
-        crc = self.start_value.copy()
-
-        for i in range(0, len_data, 8):
-            for j in range(0, 8):
-
-                if self.lsb_first:
-                    idx = i + (7 - j)
-                else:
-                    idx = i + j
-
-                if crc[0] != data[idx]:
-                    crc[0:self.poly_order - 2] = crc[1:self.poly_order - 1]  # crc = crc << 1
-                    crc[self.poly_order - 2] = False
-                    for x in range(0, self.poly_order - 1):
-                        if self.reverse_polynomial:
-                            crc[x] ^= self.polynomial[self.poly_order - 1 - x]
-                        else:
-                            crc[x] ^= self.polynomial[x + 1]
-                else:
-                    crc[0:self.poly_order - 2] = crc[1:self.poly_order - 1]  # crc = crc << 1
-                    crc[self.poly_order - 2] = False
+        data = np.packbits(self.__to_bool_array(inpt), bitorder="little" if self.lsb_first else "big")
+        register = self.__read_register(self.start_value)
+        table, shift, mask = self.__get_table()
+
+        for byte in data.tolist():
+            register = ((register << 8) & mask) ^ table[((register >> (shift - 8)) ^ byte) & 0xff]
+
+        return self.__finalize(register)
+
+    def crc_batch(self, inputs) -> list:
+        """
+        Calculate the CRCs of many bit sequences at once.
+        Sequences with the same number of bytes are processed together with vectorized table lookups.
+
+        :type inputs: list of list[bool]
+        :rtype: list of list[bool]
+        """
+        table, shift, mask = self.__get_table()
+        if shift > 64:
+            return [self.crc(inpt) for inpt in inputs]
+
+        bitorder = "little" if self.lsb_first else "big"
+        packed = [np.packbits(self.__to_bool_array(inpt), bitorder=bitorder) for inpt in inputs]
+        np_table = np.array(table, dtype=np.uint64)
+        start = self.__read_register(self.start_value)
+
+        result = [None] * len(inputs)
+        indices_by_len = defaultdict(list)
+        for i, data in enumerate(packed):
+            indices_by_len[len(data)].append(i)
+
+        for num_bytes, indices in indices_by_len.items():
+            data = np.array([packed[i] for i in indices], dtype=np.uint64).reshape(len(indices), num_bytes)
+            registers = np.full(len(indices), start, dtype=np.uint64)
+            for column in range(num_bytes):
+                lookup = ((registers >> np.uint64(shift - 8)) ^ data[:, column]) & np.uint64(0xff)
+                registers = ((registers << np.uint64(8)) & np.uint64(mask)) ^ np_table[lookup.astype(np.intp)]
+
+            for i, register in zip(indices, registers.tolist()):
+                result[i] = self.__finalize(register)
+
+        return result
+
+    @staticmethod
+    def __to_bool_array(inpt) -> np.ndarray:
+        try:
+            return np.array(inpt, dtype=bool).reshape(len(inpt))
+        except (TypeError, ValueError):
+            return np.array([bool(bit) for bit in inpt], dtype=bool)
+
+    def __get_table(self) -> tuple:
+        """
+        Lookup table for byte wise calculation. Tables are cached per polynomial and reverse flag.
+        CRCs with less than 8 bit are calculated in a register of 8 bit, which is shifted back in the end.
+
+        :return: table, width of the register, mask of the register
+        """
+        key = (tuple(bool(bit) for bit in self.polynomial), self.reverse_polynomial)
+        try:
+            return self.__tables[key]
+        except KeyError:
+            pass
+
+        order = self.poly_order - 1
+        if self.reverse_polynomial:
+            poly_bits = [self.polynomial[self.poly_order - 1 - x] for x in range(0, order)]
+        else:
+            poly_bits = [self.polynomial[x + 1] for x in range(0, order)]
+
+        width = max(order, 8)
+        mask = (1 << width) - 1
+        top_bit = 1 << (width - 1)
+        poly = sum(1 << (order - 1 - x) for x, bit in enumerate(poly_bits) if bit) << (width - order)
+
+        table = []
+        for byte in range(256):
+            register = byte << (width - 8)
+            for _ in range(8):
+                register = ((register << 1) & mask) ^ poly if register & top_bit else (register << 1) & mask
+            table.append(register)
+
+        self.__tables[key] = (table, width, mask)
+        return self.__tables[key]
+
+    def __read_register(self, bits) -> int:
+        """
+        Convert a list of bits of the CRC order to the (widened) register value
+
+        """
+        order = self.poly_order - 1
+        value = sum(1 << (order - 1 - x) for x in range(0, order) if bits[x])
+        return value << (max(order, 8) - order)
+
+    def __finalize(self, register: int) -> list:
+        order = self.poly_order - 1
+        register >>= max(order, 8) - order
+        crc = [bool((register >> (order - 1 - x)) & 1) for x in range(0, order)]
 
         for i in range(0, self.poly_order - 1):
             if self.final_xor[i]:
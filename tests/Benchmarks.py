@@ -0,0 +1,301 @@
+"""
+Benchmarks of the hot paths on synthetic captures, which are modulated on the fly, so no capture files are needed.
+
+Run from the repository root:
+
+    python -m tests.Benchmarks --output benchmark_results.json
+
+Each benchmark is compared against tests/data/benchmark_baseline.json and the exit code is 1,
+if one of them takes longer than tolerance times its baseline and longer than its baseline plus the floor.
+Baselines depend on the machine, so refresh them with --update-baseline after intended changes or on new build machines.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import unittest
+
+import numpy as np
+
+import tests.utils_testing
+from urh import constants
+from urh.awre.FormatFinder import FormatFinder
+from urh.cythonext import path_creator, signalFunctions
+from urh.models.ProtocolTableModel import ProtocolTableModel
+from urh.signalprocessing.Demodulator import Demodulator
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.Modulator import Modulator
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.encoder import Encoder
+from urh.util.crc import crc_generic
+
+app = tests.utils_testing.app
+
+BASELINE_FILE = tests.utils_testing.get_path_for_data_file("benchmark_baseline.json")
+
+
+class Benchmark(object):
+    """
+    An operation timed several times, the setup runs before each call and is not part of the measured time.
+    Short operations are called several times per repetition, so a repetition takes at least MIN_TIME seconds.
+    """
+
+    MIN_TIME = 0.1
+
+    def __init__(self, name: str, run, setup=None):
+        """
+
+        :param run: called with the result of setup, if there is a setup
+        :param setup: returns a tuple of arguments for run, e.g. fresh objects, because run changes them or fills caches
+        """
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+    def time_calls(self, number: int) -> float:
+        """
+        Time number calls and return the time per call
+
+        :rtype: float
+        """
+        args = [self.setup() if self.setup is not None else () for _ in range(number)]
+        t = time.perf_counter()
+        for arg in args:
+            self.run(*arg)
+        return (time.perf_counter() - t) / number
+
+    def measure(self, repeats: int) -> dict:
+        # The first call also fills lazy caches, e.g. imports, so it only determines the number of calls
+        number = max(1, int(np.ceil(self.MIN_TIME / max(self.time_calls(1), 1e-9))))
+        times = [self.time_calls(number) for _ in range(repeats)]
+
+        return {"min": min(times), "median": float(np.median(times)), "repeats": repeats, "number": number}
+
+
+class SyntheticCapture(object):
+    """
+    Messages with preamble, sync, length, random payload and CRC, modulated with all modulation types.
+    """
+
+    MESSAGES_PER_SIZE = 100
+    PAYLOAD_BYTES = 16
+    SAMPLES_PER_BIT = 100
+    PAUSE = 10000
+
+    PREAMBLE = [True, False] * 16
+    SYNC = [bool(int(b)) for b in "1001101001111101"]
+
+    # modulation type of Modulator, modulation type of demodulation, parameter for zero, parameter for one, center
+    MODULATIONS = {
+        "ASK": (0, 0, 30, 100, 0.5),
+        "FSK": (1, 1, 20e3, 60e3, 0.25),
+        "GFSK": (3, 1, 20e3, 60e3, 0.25),
+        "PSK": (2, 2, 0, 180, 0),
+    }
+
+    def __init__(self, size=1, seed=42):
+        self.num_messages = self.MESSAGES_PER_SIZE * size
+        self.crc = crc_generic(polynomial="16_standard")
+
+        rng = np.random.RandomState(seed)
+        length = [bool(int(b)) for b in "{0:08b}".format(self.PAYLOAD_BYTES)]
+        self.payloads = [rng.randint(0, 2, 8 * self.PAYLOAD_BYTES).astype(bool).tolist()
+                         for _ in range(self.num_messages)]
+        self.bits = [self.PREAMBLE + self.SYNC + length + payload + self.crc.crc(payload)
+                     for payload in self.payloads]
+
+        self.__demodulated = dict()
+
+    def create_protocol(self) -> ProtocolAnalyzer:
+        protocol = ProtocolAnalyzer(None)
+        for bits in self.bits:
+            protocol.messages.append(Message(bits, self.PAUSE, protocol.default_message_type))
+        return protocol
+
+    def create_modulator(self, modulation: str) -> Modulator:
+        modulation_type, _, param_for_zero, param_for_one, _ = self.MODULATIONS[modulation]
+        modulator = Modulator(modulation)
+        modulator.modulation_type = modulation_type
+        modulator.samples_per_bit = self.SAMPLES_PER_BIT
+        modulator.param_for_zero = param_for_zero
+        modulator.param_for_one = param_for_one
+        return modulator
+
+    def modulate(self, modulation: str) -> np.ndarray:
+        return Modulator.modulate_messages([self.create_modulator(modulation)], self.create_protocol().messages)
+
+    def demodulate(self, modulation: str) -> tuple:
+        """
+        Demodulated samples and a demodulator for them, cached per modulation.
+        The center is fixed, so the benchmarks do not depend on the center estimation.
+
+        :rtype: (np.ndarray, Demodulator)
+        """
+        if modulation not in self.__demodulated:
+            _, demod_type, _, _, qad_center = self.MODULATIONS[modulation]
+            demodulator = Demodulator(modulation_type=demod_type, bit_len=self.SAMPLES_PER_BIT, qad_center=qad_center,
+                                      rel_symbol_len=0)
+            qad = signalFunctions.afp_demod(self.modulate(modulation), 0, demod_type)
+            self.__demodulated[modulation] = (qad, demodulator)
+        return self.__demodulated[modulation]
+
+
+def create_benchmarks(capture: SyntheticCapture) -> list:
+    """
+    Benchmarks for the hot paths from modulation over demodulation to analysis and display
+
+    :rtype: list of Benchmark
+    """
+    benchmarks = []
+
+    for modulation in sorted(SyntheticCapture.MODULATIONS):
+        demod_type = SyntheticCapture.MODULATIONS[modulation][1]
+        samples = capture.modulate(modulation)
+        qad, demodulator = capture.demodulate(modulation)
+        ppseq = demodulator.grab_pulse_lens(qad)
+
+        benchmarks.append(Benchmark("modulate_data[{}]".format(modulation),
+                                    Modulator.modulate_messages,
+                                    lambda m=modulation: ([capture.create_modulator(m)],
+                                                          capture.create_protocol().messages)))
+        benchmarks.append(Benchmark("afp_demod[{}]".format(modulation),
+                                    lambda s=samples, t=demod_type: signalFunctions.afp_demod(s, 0, t)))
+        benchmarks.append(Benchmark("grab_pulse_lens[{}]".format(modulation),
+                                    lambda d=demodulator, q=qad: d.grab_pulse_lens(q)))
+        benchmarks.append(Benchmark("ppseq_to_bits[{}]".format(modulation),
+                                    lambda p, pp=ppseq: p._ppseq_to_bits(pp, SyntheticCapture.SAMPLES_PER_BIT, 0),
+                                    lambda: (ProtocolAnalyzer(None),)))
+
+    encoder = Encoder(["Manchester II", constants.DECODING_EDGE, constants.DECODING_INVERT])
+    benchmarks.append(Benchmark("encoder_code", lambda: [encoder.code(True, encoder.code(False, bits)[0])
+                                                         for bits in capture.bits]))
+
+    benchmarks.append(Benchmark("crc", lambda: [capture.crc.crc(payload) for payload in capture.payloads]))
+    benchmarks.append(Benchmark("crc_batch", lambda: capture.crc.crc_batch(capture.payloads)))
+
+    benchmarks.append(Benchmark("format_finder", lambda p: FormatFinder(p).perform_iteration(),
+                                lambda: (capture.create_protocol(),)))
+
+    # Fresh protocols, because differences are cached per protocol
+    benchmarks.append(Benchmark("find_differences", lambda p: p.find_differences(0, 0),
+                                lambda: (capture.create_protocol(),)))
+
+    def create_table_model():
+        model = ProtocolTableModel(capture.create_protocol(), participants=[], controller=None)
+        model._refindex = 0
+        return model,
+
+    benchmarks.append(Benchmark("table_model_update", lambda model: model.update(), create_table_model))
+
+    qad = capture.demodulate("FSK")[0]
+    benchmarks.append(Benchmark("create_path", lambda: path_creator.create_path(qad, 0, len(qad))))
+
+    return benchmarks
+
+
+def run_benchmarks(size=2, repeats=5, names=None) -> dict:
+    """
+    Run the benchmarks and return the results in the format of the JSON output
+
+    :param names: only run benchmarks with these names, if given
+    """
+    capture = SyntheticCapture(size)
+    results = dict()
+    for benchmark in create_benchmarks(capture):
+        if names is None or benchmark.name in names:
+            results[benchmark.name] = benchmark.measure(repeats)
+
+    return {"size": size, "python": platform.python_version(), "machine": platform.machine(),
+            "benchmarks": results}
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float, floor: float) -> list:
+    """
+    Benchmarks whose best time exceeds tolerance times their baseline and their baseline plus floor.
+    The floor keeps fast benchmarks from failing due to noise of a few milliseconds.
+    Benchmarks without baseline are skipped, the baseline must have been measured with the same size.
+
+    :rtype: list of str
+    """
+    if results["size"] != baseline["size"]:
+        raise ValueError("Baseline was measured with size {0}, not {1}".format(baseline["size"], results["size"]))
+
+    regressions = []
+    for name, result in sorted(results["benchmarks"].items()):
+        try:
+            base = baseline["benchmarks"][name]["min"]
+        except KeyError:
+            continue
+        limit = max(tolerance * base, base + floor)
+
+        if result["min"] > limit:
+            regressions.append("{0}: {1:.4f}s (limit {2:.4f}s)".format(name, result["min"], limit))
+
+    return regressions
+
+
+def read_baseline(filename=BASELINE_FILE) -> dict:
+    with open(filename, "r") as f:
+        return json.load(f)
+
+
+def write_json(results: dict, filename: str):
+    with open(filename, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+class TestBenchmarks(unittest.TestCase):
+    TOLERANCE = 1.5
+    FLOOR = 0.005
+
+    def test_no_regressions(self):
+        baseline = read_baseline()
+        results = run_benchmarks(size=baseline["size"])
+        regressions = find_regressions(results, baseline, self.TOLERANCE, self.FLOOR)
+        self.assertEqual(regressions, [], msg="\n".join(regressions))
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks of URH on synthetic captures")
+    parser.add_argument("--size", type=int, default=2,
+                        help="Scale of the synthetic captures ({0} messages per size)".format(
+                            SyntheticCapture.MESSAGES_PER_SIZE))
+    parser.add_argument("--repeats", type=int, default=5, help="Repetitions per benchmark, the best one counts")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="JSON file with the baseline")
+    parser.add_argument("--tolerance", type=float, default=TestBenchmarks.TOLERANCE,
+                        help="Allowed factor over the baseline before a benchmark counts as regression")
+    parser.add_argument("--floor", type=float, default=TestBenchmarks.FLOOR,
+                        help="Allowed seconds over the baseline before a benchmark counts as regression")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as new baseline")
+    parser.add_argument("names", nargs="*", help="Only run these benchmarks")
+    args = parser.parse_args(args)
+
+    results = run_benchmarks(args.size, args.repeats, args.names or None)
+    for name, result in sorted(results["benchmarks"].items()):
+        print("{0:<24} {1:10.4f}s {2:10.4f}s".format(name, result["min"], result["median"]))
+
+    if args.output:
+        write_json(results, args.output)
+
+    if args.update_baseline:
+        write_json(results, args.baseline)
+        return 0
+
+    if not os.path.isfile(args.baseline):
+        print("No baseline at {0}, use --update-baseline to create it".format(args.baseline), file=sys.stderr)
+        return 0
+
+    regressions = find_regressions(results, read_baseline(args.baseline), args.tolerance, args.floor)
+    for regression in regressions:
+        print("Regression " + regression, file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
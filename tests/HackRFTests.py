@@ -166,3 +166,15 @@ class TestHackRF(unittest.TestCase):
 
         packed = HackRF.pack_complex(unpacked)
         self.assertEqual(received, packed)
+
+    def test_unpack_complex_into_buffer(self):
+        received = bytes(range(256))
+        unpacked = np.frombuffer(received, dtype=[('r', np.int8), ('i', np.int8)])
+        expected = ((unpacked['r'] + 0.5) / 127.5 + 1j * (unpacked['i'] + 0.5) / 127.5).astype(np.complex64)
+
+        buffer = np.zeros(200, dtype=np.complex64)
+        result = HackRF.unpack_complex(received, 128, buffer[10:138])
+        self.assertTrue(np.shares_memory(result, buffer))
+        self.assertTrue(np.array_equal(buffer[10:138], expected))
+        self.assertEqual(buffer[9], 0)
+        self.assertEqual(buffer[138], 0)
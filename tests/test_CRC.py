@@ -52,3 +52,22 @@ class TestCRC(unittest.TestCase):
         if polynomial:
             self.assertEqual(c.bit2str(polynomial), "1000000000000101")
             self.assertEqual(c.bit2hex(polynomial), "0x8005")
+
+    def test_check_values(self):
+        # CRC of ASCII "123456789" for CRC-16/ARC and CRC-16/CCITT-FALSE
+        c = crc_generic(polynomial="16_standard", lsb_first=True, reverse_all=True)
+        bits = c.str2bit("".join("{0:08b}".format(byte) for byte in b"123456789"))
+        self.assertEqual(c.bit2hex(c.crc(bits)), "0xbb3d")
+
+        c = crc_generic(polynomial="16_ccitt", start_value=True)
+        self.assertEqual(c.bit2hex(c.crc(bits)), "0x29b1")
+
+    def test_crc_batch(self):
+        bitstrings = ["", "1", "10110", "1011011100001111", "10110111000011110101", "1" * 37, "0" * 64,
+                      "1011011100001111"]
+        for polynomial in ("16_standard", "16_dnp", "8_en", [True] + [False] * 25 + [True] * 7, [True, False, True, True]):
+            for flags in range(16):
+                c = crc_generic(polynomial=polynomial, start_value=bool(flags & 1), final_xor=bool(flags & 2),
+                                reverse_polynomial=bool(flags & 4), lsb_first=bool(flags & 8), little_endian=True)
+                inputs = [c.str2bit(bits) for bits in bitstrings]
+                self.assertEqual(c.crc_batch(inputs), [c.crc(bits) for bits in inputs])
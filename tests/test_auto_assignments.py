@@ -57,6 +57,35 @@ class TestAutoAssignments(unittest.TestCase):
             else:
                 self.assertEqual(message.message_type, self.protocol.default_message_type, msg=str(i))
 
+    def test_message_type_assign_in_batch(self):
+        aligned_type = MessageType("aligned")
+        aligned_type.add_protocol_label(3, 9)
+        for message in self.protocol.messages[::4]:
+            message.message_type = aligned_type
+
+        rulesets = [Ruleset(Mode.all_apply, [Rule(8, 15, "=", "9a7d9a7d", 1), Rule(0, 3, "!=", "1010", 0)]),
+                    Ruleset(Mode.atleast_one_applies, [Rule(2, 5, ">", "a", 1), Rule(1, 3, "<", "\x00", 2)]),
+                    Ruleset(Mode.none_applies, [Rule(30, 400, ">=", "1", 0)])]
+
+        expected = []
+        for message in self.protocol.messages:
+            applying = [i for i, ruleset in enumerate(rulesets) if ruleset.applies_for_message(message)]
+            expected.append(applying[0] if applying else -1)
+
+        self.assertEqual(Ruleset.classify(self.protocol.messages, rulesets).tolist(), expected)
+        self.assertIn(1, expected)
+
+    def test_message_type_assign_incremental(self):
+        msg_type = MessageType("autotest")
+        msg_type.ruleset = Ruleset(Mode.all_apply, [Rule(8, 15, "=", "9a7d9a7d", 1)])
+        msg_type.assigned_by_ruleset = True
+        self.protocol.message_types.append(msg_type)
+
+        self.protocol.update_auto_message_types(start=3)
+        self.assertEqual(self.protocol.messages[0].message_type, self.protocol.default_message_type)
+        self.assertEqual(self.protocol.messages[2].message_type, self.protocol.default_message_type)
+        self.assertEqual(self.protocol.messages[3].message_type, msg_type)
+
     def test_two_assign_participants_by_rssi(self):
         rssis = [[0.65389872, 0.13733707, 0.1226876, 0.73320961, 0.64940965, 0.12463234, 0.12296994,
                  0.68053716, 0.66020358, 0.12428901, 0.12312815, 0.69160986, 0.65582329, 0.12536003,
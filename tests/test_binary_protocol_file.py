@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+from urh.cythonext.signalFunctions import Symbol
+from urh.signalprocessing.BinaryProtocolFile import BinaryProtocolFile
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
+from urh.signalprocessing.Modulator import Modulator
+from urh.signalprocessing.Participant import Participant
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer
+from urh.signalprocessing.encoder import Encoder
+
+
+class TestBinaryProtocolFile(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".bproto")
+        os.close(fd)
+
+        self.alice = Participant("Alice", "A", address_hex="1234")
+        self.message_type = MessageType("data")
+        self.message_type.add_protocol_label(4, 11, name="address")
+        self.decoder = Encoder(["Manchester I", "Edge Trigger"])
+        self.symbol = Symbol("A", 1, 1, 150)
+
+        self.protocol = ProtocolAnalyzer(None)
+        self.protocol.message_types.append(self.message_type)
+        for i in range(10):
+            message = Message.from_plain_bits_str("1010" * (i + 1) + "A11", {"A": self.symbol})
+            message.pause = 1000 * i
+            message.message_type = self.message_type if i % 2 else self.protocol.default_message_type
+            message.participant = self.alice if i % 3 else None
+            if i == 5:
+                message.decoder = self.decoder
+            self.protocol.messages.append(message)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def assert_messages_equal(self, messages, expected):
+        self.assertEqual(len(messages), len(expected))
+        for message, exp in zip(messages, expected):
+            self.assertEqual(message.plain_bits_str, exp.plain_bits_str)
+            self.assertEqual(message.pause, exp.pause)
+            self.assertEqual(message.message_type.id, exp.message_type.id)
+            self.assertEqual(message.decoder.get_chain(), exp.decoder.get_chain())
+            self.assertEqual(message.participant is None, exp.participant is None)
+            if message.participant is not None:
+                self.assertEqual(message.participant.id, exp.participant.id)
+
+    def test_write_and_read(self):
+        self.protocol.to_binary_file(self.filename)
+        self.assertTrue(BinaryProtocolFile.is_binary_file(self.filename))
+
+        protocol = ProtocolAnalyzer(None)
+        protocol.from_binary_file(self.filename)
+        self.assert_messages_equal(protocol.messages, self.protocol.messages)
+
+        self.assertEqual(protocol.messages[1].message_type.name, "data")
+        self.assertEqual(protocol.messages[1].message_type[0].name, "address")
+        self.assertEqual(protocol.messages[0].plain_bits[4].name, "A")
+        self.assertEqual(protocol.messages[0].plain_bits[4].nsamples, 150)
+        self.assertIn("A", {symbol.name for symbol in protocol.used_symbols})
+        self.assertIs(protocol.messages[1].participant, protocol.messages[2].participant)
+
+    def test_append(self):
+        BinaryProtocolFile(self.filename).write(self.protocol.messages[:4])
+
+        # Appending in a later session only adds the new tables
+        binary_file = BinaryProtocolFile(self.filename)
+        binary_file.load()
+        binary_file.append(self.protocol.messages[4:7])
+        binary_file.append(self.protocol.messages[7:])
+        self.assertEqual(binary_file.num_messages, 10)
+
+        binary_file = BinaryProtocolFile(self.filename)
+        self.assert_messages_equal(binary_file.load(), self.protocol.messages)
+        self.assertEqual(len(binary_file.decoders), 2)
+        self.assertEqual(len(binary_file.participants), 1)
+        self.assertEqual(len(binary_file.message_types), 2)
+
+    def test_modulators(self):
+        container = ProtocolAnalyzerContainer([Modulator("first"), Modulator("second")])
+        container.messages.extend(self.protocol.messages)
+        container.modulators[1].samples_per_bit = 42
+        container.to_binary_file(self.filename)
+
+        container = ProtocolAnalyzerContainer([Modulator("default")])
+        container.from_binary_file(self.filename)
+        self.assertEqual([modulator.name for modulator in container.modulators], ["first", "second"])
+        self.assertEqual(container.modulators[1].samples_per_bit, 42)
+        self.assert_messages_equal(container.messages, self.protocol.messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import copy
+import unittest
+
+from urh.cythonext.signalFunctions import Symbol
+from urh.signalprocessing.BitArray import BitArray
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
+
+
+class TestBitArray(unittest.TestCase):
+    def setUp(self):
+        self.symbol = Symbol("A", 1, 1, 150)
+        self.bits = [True, False, True, True, False, False, self.symbol, True, False, True, True]
+
+    def test_list_behaviour(self):
+        bit_array = BitArray(self.bits)
+        self.assertEqual(len(bit_array), len(self.bits))
+        self.assertEqual(bit_array, self.bits)
+        self.assertEqual(list(bit_array), self.bits)
+        self.assertIs(bit_array[6], self.symbol)
+        self.assertEqual(bit_array[-1], True)
+        self.assertEqual(bit_array[2:8], self.bits[2:8])
+        self.assertEqual(bit_array[::2], self.bits[::2])
+        self.assertEqual(bit_array.to_string(), "101100A1011")
+        self.assertEqual(bit_array.symbol_positions, [6])
+
+        bits = self.bits[:]
+        for operation in (lambda b: b.__setitem__(1, True), lambda b: b.__setitem__(6, False),
+                          lambda b: b.__setitem__(0, self.symbol), lambda b: b.__setitem__(slice(2, 4), [False] * 5),
+                          lambda b: b.__delitem__(slice(1, 3)), lambda b: b.__delitem__(-1),
+                          lambda b: b.insert(3, self.symbol), lambda b: b.extend([True, False])):
+            operation(bits)
+            operation(bit_array)
+            self.assertEqual(bit_array, bits)
+            self.assertEqual(bit_array.symbol_positions, [i for i, b in enumerate(bits) if type(b) == Symbol])
+
+        self.assertEqual(bit_array + [True], bits + [True])
+        self.assertEqual([True] + bit_array, [True] + bits)
+
+    def test_copy(self):
+        bit_array = BitArray(self.bits)
+        cpy = copy.copy(bit_array)
+        cpy[0] = False
+        self.assertTrue(bit_array[0])
+        self.assertIs(cpy[6], self.symbol)
+
+        deep_cpy = copy.deepcopy(bit_array)
+        self.assertIsNot(deep_cpy[6], self.symbol)
+        self.assertEqual(deep_cpy[6].name, "A")
+
+    def test_message_views(self):
+        message = Message([True, False, True, False] * 4 + [True, True, True], 0, MessageType("test"))
+        self.assertIsInstance(message.plain_bits, BitArray)
+        self.assertEqual(message.plain_bits_str, "1010101010101010111")
+        self.assertEqual(message.plain_hex_str, "aaaa7")
+        self.assertEqual(message.plain_ascii_str, "\xaa\xaa")
+        self.assertEqual(message.decoded_bits_buffer, bytes([0xaa, 0xaa, 0xe0]))
+
+        message.plain_bits[4] = self.symbol
+        self.assertEqual(message.plain_bits_str, "1010A01010101010111")
+        self.assertEqual(message.plain_hex_str, "aA5553")
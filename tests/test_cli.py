@@ -0,0 +1,59 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from tests.utils_testing import get_path_for_data_file
+from urh.signalprocessing.BinaryProtocolFile import BinaryProtocolFile
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.Signal import Signal
+
+
+class TestCLI(unittest.TestCase):
+    FILES = ["esaver.complex", "enocean.complex", "steckdose_anlernen.complex"]
+
+    def run_cli(self, *args) -> str:
+        # PyQt5 is blocked, so this also checks the pipeline does not need Qt
+        code = "import sys; sys.modules['PyQt5'] = None; from urh.cli import main; sys.exit(main(sys.argv[1:]))"
+        env = dict(os.environ, PYTHONPATH=os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "src")))
+        result = subprocess.run([sys.executable, "-c", code] + list(args), env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        return result.stdout
+
+    def test_same_messages_as_protocol_analyzer(self):
+        filenames = [get_path_for_data_file(f) for f in self.FILES]
+        output = self.run_cli("--view", "bits", "--jobs", "2", "--label", "start:0-7", *filenames)
+        records = [json.loads(line) for line in output.splitlines()]
+
+        for filename in filenames:
+            signal = Signal(filename, "test")
+            signal.auto_detect()
+            proto_analyzer = ProtocolAnalyzer(signal)
+            proto_analyzer.get_protocol_from_signal()
+
+            messages = [record for record in records if record["file"] == filename]
+            self.assertEqual([record["data"] for record in messages], proto_analyzer.plain_bits_str)
+            self.assertEqual([record["pause"] for record in messages], proto_analyzer.pauses)
+            self.assertEqual([record["labels"]["start"] for record in messages],
+                             [bits[:8] for bits in proto_analyzer.plain_bits_str])
+
+    def test_project_and_binary_export(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "URHProject.xml"), "w") as f:
+                f.write('<UniversalRadioHackerProject><signal name="esaver" filename="{0}" bit_length="100" '
+                        'qad_center="0.0" modulation_type="1" tolerance="5" /></UniversalRadioHackerProject>'
+                        .format(get_path_for_data_file("esaver.complex")))
+
+            self.run_cli("--project", directory, "--decoding", "Manchester I", "--format", "bproto",
+                         "--output-dir", directory)
+
+            messages = BinaryProtocolFile(os.path.join(directory, "esaver.bproto")).load()
+            self.assertEqual(len(messages), 3)
+            self.assertEqual(messages[0].decoder.name, "Manchester I")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,10 @@
 import unittest
 
+import numpy as np
 from PyQt5.QtTest import QTest
 
+from urh.cythonext.signalFunctions import afp_demod
+from urh.signalprocessing.BlockDemodulator import BlockDemodulator
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
 from tests.utils_testing import get_path_for_data_file
@@ -43,3 +46,42 @@ class TestDemodulations(unittest.TestCase):
         proto_analyzer = ProtocolAnalyzer(signal)
         proto_analyzer.get_protocol_from_signal()
         self.assertEqual(proto_analyzer.plain_bits_str[0], "101100")
+
+    def test_block_demodulation(self):
+        for filename, mod_type, noise in [("ask.complex", 0, 0.1), ("fsk.complex", 1, 0.01),
+                                          ("psk_gen_noisy.complex", 2, 0), ("psk_gen_noisy.complex", 3, 0.01)]:
+            signal = Signal(get_path_for_data_file(filename), "Block-Test")
+            expected = afp_demod(signal.data, noise, mod_type)
+
+            demodulator = BlockDemodulator(signal.data)
+            demodulator.BLOCK_SIZE = 1000
+            np.testing.assert_array_equal(demodulator.demodulate(noise, mod_type)[1:], expected[1:], err_msg=filename)
+            np.testing.assert_array_equal(demodulator.demodulate(noise, mod_type, 2500, 4321), expected[2500:4321])
+
+            # blocks in the middle need the state of their predecessors for PSK/QAM
+            demodulator.clear()
+            np.testing.assert_array_equal(demodulator.view(noise, mod_type)[7777:9999], expected[7777:9999])
+
+    def test_block_demodulation_cache(self):
+        signal = Signal(get_path_for_data_file("fsk.complex"), "FSK-Test")
+        noise, mod_type = signal.noise_threshold, signal.modulation_type
+        demodulator = BlockDemodulator(signal.data)
+        demodulator.BLOCK_SIZE = 1000
+
+        qad = demodulator.demodulate(noise, mod_type)
+        self.assertTrue(demodulator.is_cached(0, noise, mod_type))
+        self.assertEqual(demodulator.cached_samples, signal.num_samples)
+
+        demodulator.invalidate(2500, 2600)
+        self.assertTrue(demodulator.is_cached(1, noise, mod_type))
+        self.assertFalse(demodulator.is_cached(2, noise, mod_type))
+        self.assertTrue(demodulator.is_cached(3, noise, mod_type))
+        np.testing.assert_array_equal(demodulator.demodulate(noise, mod_type), qad)
+
+        demodulator.MAX_CACHED_SAMPLES = 5000
+        self.assertEqual(len(demodulator.demodulate(0.5, mod_type)), signal.num_samples)
+        self.assertLessEqual(demodulator.cached_samples, 5000)
+
+        # Signals in RAM keep their demodulation as qad, so no blocks are cached for them
+        np.testing.assert_array_equal(signal.qad, qad)
+        self.assertEqual(signal.block_demodulator.cached_samples, 0)
@@ -1,5 +1,6 @@
 import unittest
 
+from urh import constants
 from urh.signalprocessing.encoder import Encoder
 from urh.util.crc import crc_generic
 
@@ -123,4 +124,48 @@ class TestDecoding(unittest.TestCase):
         calc_crc1 = e.enocean_hash(msg1)
         calc_crc2 = e.enocean_hash(msg2)
         self.assertTrue(calc_crc1 == crc1)
-        self.assertTrue(calc_crc2 == crc2)
\ No newline at end of file
+        self.assertTrue(calc_crc2 == crc2)
+
+    def test_compiled_chain(self):
+        e = Encoder(["Test", constants.DECODING_DIFFERENTIAL, constants.DECODING_SUBSTITUTION, "01:0;10:1;",
+                     constants.DECODING_REDUNDANCY, "2"])
+        plan = e.plan
+        self.assertIs(plan, e.plan)  # compiled only once
+        self.assertEqual(len(plan), 3)
+
+        inpt = e.str2bit("1100110000111100")
+        encoded = e.encode(inpt)
+        self.assertEqual(e.bit2str(encoded), "1100110001100110110011000110011001100110110011001100110001100110")
+        self.assertEqual(e.multiple, 2)
+        self.assertEqual(e.decode(encoded), inpt)
+
+        e.set_chain(["Test", constants.DECODING_INVERT])
+        self.assertIsNot(plan, e.plan)
+        self.assertEqual(e.decode(inpt), [not bit for bit in inpt])
+
+    def test_data_whitening_keystream(self):
+        e = Encoder(["Test", constants.DECODING_DATAWHITENING, "0xe9cae9ca;0x21;0x0"])
+        other = Encoder(["Test", constants.DECODING_DATAWHITENING, "0xe9cae9ca;0x3d;0x0"])
+        inpt = e.str2bit("1010" * 8 + "11101001110010101110100111001010" + "0110" * 40)
+
+        encoded = e.encode(inpt)
+        self.assertEqual(e.decode(encoded), inpt)
+        self.assertNotEqual(other.encode(inpt), encoded)
+
+        # The cached keystream belongs to the polynomial
+        e.set_chain(["Test", constants.DECODING_DATAWHITENING, "0xe9cae9ca;0x3d;0x0"])
+        self.assertEqual(e.encode(inpt), other.encode(inpt))
+        e.set_chain(["Test", constants.DECODING_DATAWHITENING, "0xe9cae9ca;0x21;0x0"])
+        self.assertEqual(e.encode(inpt), encoded)
+
+    def test_redundancy_and_edge(self):
+        e = Encoder()
+        e.multiple = 3
+        decoded, errors, _ = e.code_redundancy(True, e.str2bit("1110001100000111"))
+        self.assertEqual(decoded, e.str2bit("1001"))
+        self.assertEqual(errors, 2)
+
+        decoded, errors, _ = e.code_edge(True, e.str2bit("0110100101"))
+        self.assertEqual(decoded, e.str2bit("10011"))
+        self.assertEqual(errors, 0)
+        self.assertEqual(e.code_edge(False, decoded)[0], e.str2bit("0110100101"))
@@ -0,0 +1,132 @@
+import copy
+import tracemalloc
+import unittest
+
+import numpy as np
+from PyQt5.QtCore import Qt
+
+import tests.utils_testing
+from urh.models.GeneratorTableModel import GeneratorTableModel
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
+from urh.signalprocessing.ModulatedStream import ModulatedStream
+from urh.signalprocessing.Modulator import Modulator
+from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer, FuzzMode, FuzzedMessages
+from urh.ui.actions.Fuzz import Fuzz
+
+app = tests.utils_testing.app
+
+
+class TestFuzzIterator(unittest.TestCase):
+    def setUp(self):
+        self.modulators = [Modulator("test")]
+        self.container = ProtocolAnalyzerContainer(self.modulators)
+
+        message_type = MessageType("test")
+        lbl1 = message_type.add_protocol_label(0, 2)
+        lbl1.fuzz_values = ["00", "01", "10", "11"]
+        lbl2 = message_type.add_protocol_label(4, 7)
+        lbl2.fuzz_values = ["000", "111", "101"]
+
+        self.container.messages.append(Message([True] * 8, 100, message_type))
+        self.container.messages.append(Message([False] * 4, 200, MessageType("no labels")))
+
+    def test_lazy_fuzzing_equals_fuzzing(self):
+        for mode in FuzzMode:
+            num_messages = self.container.num_fuzzed_messages(mode)
+            pairs = list(self.container.iter_fuzz(mode))
+            lazy = [ProtocolAnalyzerContainer.create_fuzzed_message(msg, substitution, default_pause=50).plain_bits_str
+                    for msg, substitution in pairs]
+
+            container = ProtocolAnalyzerContainer(self.modulators)
+            container.messages[:] = self.container.messages
+            container.fuzz(mode, default_pause=50)
+
+            self.assertEqual(num_messages, len(container.messages), msg=mode)
+            self.assertEqual(len(pairs), num_messages, msg=mode)
+            self.assertEqual(lazy, [msg.plain_bits_str for msg in container.messages], msg=mode)
+
+        self.assertEqual(self.container.num_fuzzed_messages(FuzzMode.exhaustive), 1 + 3 * 2 + 1)
+        self.assertEqual(self.container.messages[0].plain_bits_str, "11111111")
+
+    def test_fuzzed_messages(self):
+        for mode in FuzzMode:
+            expected = [ProtocolAnalyzerContainer.create_fuzzed_message(msg, substitution).plain_bits_str
+                        for msg, substitution in self.container.iter_fuzz(mode)]
+            messages = FuzzedMessages(self.container.messages, mode)
+            self.assertEqual([messages.peek(i).plain_bits_str for i in reversed(range(len(messages)))],
+                             expected[::-1], msg=mode)
+            self.assertEqual(messages[-1].plain_bits_str, expected[-1])
+
+        messages = FuzzedMessages(self.container.messages, FuzzMode.exhaustive)
+        self.assertIs(messages[0], self.container.messages[0])
+        self.assertIs(messages.peek(1).message_type, messages.peek(2).message_type)
+
+        # Indexed messages are kept with their own message type, so they can be edited
+        messages[1].plain_bits[-1] = False
+        messages[1].message_type.clear()
+        self.assertEqual(messages[1].plain_bits_str[-1], "0")
+        self.assertEqual(messages.peek(2).plain_bits_str[-1], "1")
+        self.assertEqual(len(messages.peek(2).message_type), 2)
+
+        # Changing templates does not change their fuzzed messages
+        fuzzed = [msg.plain_bits_str for msg in messages]
+        self.container.messages[0].plain_bits[:] = [False] * 8
+        self.assertEqual([msg.plain_bits_str for msg in messages][1:], fuzzed[1:])
+
+        # Removing messages creates all of them
+        del messages[0]
+        self.assertEqual(len(messages), 7)
+        self.assertEqual(messages[0].plain_bits_str, fuzzed[1])
+        self.assertIsNot(messages[1].message_type, messages[2].message_type)
+
+    def test_fuzz_undo(self):
+        templates = self.container.messages
+        fuzz = Fuzz(self.container, "Exhaustive")
+        fuzz.redo()
+        self.assertIsInstance(self.container.messages, FuzzedMessages)
+        self.assertEqual(self.container.num_messages, 8)
+        fuzz.undo()
+        self.assertIs(self.container.messages, templates)
+
+    def test_large_exhaustive_fuzzing(self):
+        # Three labels with 100 fuzz values each create a million messages
+        message_type = MessageType("large")
+        for start in (0, 8, 16):
+            lbl = message_type.add_protocol_label(start, start + 7)
+            lbl.fuzz_values = ["{0:08b}".format(i) for i in range(101)]
+
+        container = ProtocolAnalyzerContainer(self.modulators)
+        container.messages.append(Message([True] * 32, 100, message_type))
+        model = GeneratorTableModel(None, self.modulators, [])
+        model.protocol = container
+
+        tracemalloc.start()
+        try:
+            container.fuzz(FuzzMode.exhaustive, default_pause=10)
+            model.update()
+            self.assertEqual(model.row_count, 1 + 100 ** 3)
+            self.assertEqual(model.col_count, 32)
+            self.assertEqual(model.data(model.index(10 ** 6, 23), Qt.DisplayRole), "0")
+            self.assertEqual(model.data(model.index(10 ** 6, 31), Qt.DisplayRole), "1")
+
+            stream = ModulatedStream(self.modulators, container.messages)
+            chunks = stream()
+            for _ in range(10 ** 3):
+                next(chunks)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # A list of the fuzzed messages alone would need hundreds of megabytes
+        self.assertLess(peak, 10 * 1024 ** 2)
+
+    def test_streaming_modulation(self):
+        messages = [ProtocolAnalyzerContainer.create_fuzzed_message(msg, substitution)
+                    for msg, substitution in self.container.iter_fuzz(FuzzMode.concurrent)]
+        streamed = np.concatenate(list(Modulator.iter_modulated_messages(self.modulators, iter(messages))))
+        self.assertTrue(np.array_equal(streamed, Modulator.modulate_messages(self.modulators, messages)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from urh.cythonext.signalFunctions import Symbol
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
+
+
+class TestMessage(unittest.TestCase):
+    def setUp(self):
+        message_type = MessageType("test")
+        message_type.add_protocol_label(0, 5)
+        self.message = Message.from_plain_bits_str("1010101011A110011", {"A": Symbol("A", 1, 1, 150)})
+        self.message.message_type = message_type
+
+    def test_convert_index(self):
+        self.assertEqual(self.message.plain_hex_str, "a2bAc3")
+        self.assertEqual([self.message.convert_index(i, 0, 1, False)[0] for i in range(len(self.message))],
+                         [0, 0, 0, 0, 1, 1, 2, 2, 2, 2, 3, 4, 4, 4, 5, 5, 5])
+        self.assertEqual([self.message.convert_index(i, 1, 0, False) for i in range(7)],
+                         [(0, 3), (4, 7), (6, 9), (10, 13), (11, 14), (14, 17), (17, 17)])
+        self.assertEqual(self.message.convert_index(100, 0, 1, False), (26, 26))
+        self.assertEqual(self.message.convert_range(0, 5, 0, 1, False), (0, 1))
+
+    def test_convert_index_after_change(self):
+        self.message.plain_hex_str  # calculate bit alignments
+        self.assertEqual(self.message.convert_index(10, 0, 1, False), (3, 3))
+        self.message.plain_bits[2] = Symbol("B", 0, 1, 150)
+        self.assertEqual(self.message.convert_index(10, 0, 1, False), (4, 4))
+        del self.message.plain_bits[0:4]
+        self.assertEqual(self.message.convert_index(10, 0, 1, False), (4, 4))
+        self.assertEqual(self.message.convert_index(3, 1, 0, False), (7, 10))
@@ -3,9 +3,13 @@ import unittest
 
 import time
 
+import numpy as np
+
 from PyQt5.QtCore import QDir
 
 from urh import constants
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
 from urh.signalprocessing.Modulator import Modulator
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
@@ -71,3 +75,36 @@ class TestModulator(unittest.TestCase):
         modulator.modulate([True]*1000, pause=10000000)
         elapsed = time.time() - t
         self.assertLess(elapsed, 0.5)
+
+    def test_modulate_messages(self):
+        modulators = [Modulator("ASK"), Modulator("GFSK")]
+        modulators[1].modulation_type = 3
+        modulators[1].param_for_zero, modulators[1].param_for_one = 1000, 2500
+        messages = []
+        for i in range(10):
+            msg = Message(self.modulation_data[i % 3:], 100 * i, MessageType("test"))
+            msg.modulator_indx = i % 2
+            messages.append(msg)
+
+        result = Modulator.modulate_messages(modulators, messages)
+
+        pos = 0
+        for msg in messages:
+            modulator = modulators[msg.modulator_indx]
+            modulator.modulate(start=pos, data=msg.encoded_bits, pause=msg.pause)
+            n = len(modulator.modulated_samples)
+            self.assertEqual(n, modulator.get_num_samples(msg.encoded_bits, msg.pause))
+            self.assertTrue((result[pos:pos + n] == modulator.modulated_samples).all())
+            pos += n
+        self.assertEqual(pos, len(result))
+
+    def test_fsk_phase_continuity(self):
+        modulator = Modulator("FSK")
+        modulator.modulation_type = 1
+        modulator.param_for_zero, modulator.param_for_one = 1000, 2500
+        modulator.modulate(self.modulation_data, pause=0)
+
+        # No spiky jumps at bit borders: the phase step never exceeds the step of the higher frequency
+        phase_steps = np.abs(np.angle(modulator.modulated_samples[1:] / modulator.modulated_samples[:-1]))
+        max_step = 2 * np.pi * modulator.param_for_one / modulator.sample_rate
+        self.assertLessEqual(np.max(phase_steps), max_step + 1e-3)
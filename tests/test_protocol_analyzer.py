@@ -1,8 +1,11 @@
 import unittest
 
+import numpy as np
 from PyQt5.QtTest import QTest
 
 from urh import constants
+from urh.cythonext import signalFunctions
+from urh.signalprocessing.Message import Message
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
 from tests.utils_testing import get_path_for_data_file
@@ -19,6 +22,39 @@ class TestProtocolAnalyzer(unittest.TestCase):
         for i, pos in enumerate(proto_analyzer.messages[0].bit_sample_pos):
             self.assertLess(pos, signal.num_samples, msg = i)
 
+    def test_pulses_to_bits(self):
+        # pause, 1, 0, 1.5 bit symbol, long pause, 1, end pause
+        ppseq = np.array([[42, 500], [1, 200], [0, 100], [1, 150], [42, 1000], [1, 100], [42, 300]], dtype=np.uint64)
+        bits, bit_offsets, positions, pos_offsets, pauses, symbols = signalFunctions.pulses_to_bits(ppseq, 100, 0.1)
+
+        self.assertEqual(bits.tolist(), [1, 1, 0, 2, 1, 0, 0, 0])
+        self.assertEqual(bit_offsets.tolist(), [0, 4, 8])
+        self.assertEqual(positions[pos_offsets[0]:pos_offsets[1]].tolist(), [500, 600, 700, 800, 950, 1950])
+        self.assertEqual(positions[pos_offsets[1]:pos_offsets[2]].tolist(), [1950, 2050, 2150, 2250, 2350])
+        self.assertEqual(pauses.tolist(), [1000, 300])
+        self.assertEqual(symbols.tolist(), [[1, 1, 150, 3]])
+
+        proto_analyzer = ProtocolAnalyzer(None)
+        bit_data, pauses, bit_sample_pos = proto_analyzer._ppseq_to_bits(ppseq, 100, 0.1)
+        self.assertEqual(bit_data[0][:3], [True, True, False])
+        self.assertEqual(bit_data[0][3].name, constants.SYMBOL_NAMES[0])
+        self.assertEqual(pauses, [1000, 300])
+        self.assertEqual(len(bit_sample_pos), 2)
+
+    def test_find_differences(self):
+        pa = ProtocolAnalyzer(None)
+        pa.messages = [Message.from_plain_bits_str(bits, dict())
+                       for bits in ("10101010", "10111010", "1010", "101010101111")]
+
+        diffs = pa.find_differences(0, 0)
+        self.assertEqual(dict(diffs), {1: {3}, 2: {4, 5, 6, 7}, 3: {8, 9, 10, 11}})
+        self.assertEqual(dict(pa.find_differences(1, 1)), {0: {0}, 2: {0, 1}, 3: {0, 2}})
+
+        pa.messages[2][1] = True
+        diffs = pa.find_differences(0, 0)
+        self.assertEqual(diffs[1], {3})
+        self.assertEqual(diffs[2], {1, 4, 5, 6, 7})
+
     def test_fsk_freq_detection(self):
         s = Signal(get_path_for_data_file("steckdose_anlernen.complex"), "RWE")
         s.noise_threshold = 0.06
@@ -0,0 +1,66 @@
+import unittest
+
+from PyQt5.QtWidgets import QUndoStack
+
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
+from urh.signalprocessing.Modulator import Modulator
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.ProtocolAnalyzerContainer import ProtocolAnalyzerContainer
+from urh.ui.actions.Clear import Clear
+from urh.ui.actions.DeleteBitsAndPauses import DeleteBitsAndPauses
+from urh.ui.actions.InsertBitsAndPauses import InsertBitsAndPauses
+from urh.ui.actions.InsertColumn import InsertColumn
+
+
+class TestProtocolDelta(unittest.TestCase):
+    def setUp(self):
+        self.container = ProtocolAnalyzerContainer([Modulator("test")])
+        self.message_type = MessageType("test")
+        self.message_type.add_protocol_label(8, 15, name="address")
+        self.message_type.add_protocol_label(24, 31, name="data")
+        for i in range(10):
+            bits = "{0:08b}".format(i) * (i + 4)
+            self.container.messages.append(Message.from_plain_bits_str(bits, {}))
+            self.container.messages[-1].message_type = self.message_type
+
+        self.undo_stack = QUndoStack()
+
+    def state(self):
+        return [msg.plain_bits_str for msg in self.container.messages], \
+               [(lbl.name, lbl.start, lbl.end) for lbl in self.message_type]
+
+    def assert_undo_redo(self, command):
+        orig_messages = list(self.container.messages)
+        orig_state = self.state()
+        self.undo_stack.push(command)
+        changed_state = self.state()
+        self.assertNotEqual(changed_state, orig_state)
+
+        for _ in range(2):
+            self.undo_stack.undo()
+            self.assertEqual(self.state(), orig_state)
+            self.assertEqual(list(map(id, self.container.messages)), list(map(id, orig_messages)))
+            self.undo_stack.redo()
+            self.assertEqual(self.state(), changed_state)
+
+        self.undo_stack.undo()
+
+    def test_delete_bits(self):
+        # Deletes all bits of message 0 and 1, so they are removed
+        self.assert_undo_redo(DeleteBitsAndPauses(self.container, 0, 5, 0, 55, view=0, decoded=False))
+        self.assert_undo_redo(DeleteBitsAndPauses(self.container, 3, 12, 2, 20, view=0, decoded=False))
+
+    def test_insert(self):
+        self.assert_undo_redo(InsertColumn(self.container, 10, [0, 4, 9], view=1))
+
+        protocol = ProtocolAnalyzer(None)
+        protocol.messages.append(Message.from_plain_bits_str("1111", {}))
+        self.assert_undo_redo(InsertBitsAndPauses(self.container, 3, protocol))
+
+    def test_clear(self):
+        self.assert_undo_redo(Clear(self.container))
+
+
+if __name__ == '__main__':
+    unittest.main()
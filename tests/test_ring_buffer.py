@@ -0,0 +1,88 @@
+import os
+import unittest
+
+import numpy as np
+
+from urh.util.RingBuffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_wrap_around(self):
+        ring_buffer = RingBuffer(10)
+        data = np.arange(25, dtype=np.complex64)
+
+        self.assertEqual(ring_buffer.push(data[:7]), (0, 7))
+        self.assertTrue(np.shares_memory(ring_buffer[2:5], ring_buffer.data))
+        self.assertEqual(ring_buffer.push(data[7:16]), (7, 16))
+        self.assertEqual(len(ring_buffer), 16)
+        self.assertEqual(ring_buffer.first_available, 6)
+        np.testing.assert_equal(ring_buffer[6:16], data[6:16])
+        np.testing.assert_equal(ring_buffer[12:], data[12:16])
+        self.assertEqual(len(ring_buffer.views(8, 12)), 2)
+
+        with self.assertRaises(IndexError):
+            ring_buffer[5:8]
+
+        # More samples than fit into the ring
+        ring_buffer.push(data[16:])
+        np.testing.assert_equal(ring_buffer[15:], data[15:])
+
+        ring_buffer.clear()
+        self.assertEqual(len(ring_buffer), 0)
+        self.assertEqual(ring_buffer.push(data[:3]), (0, 3))
+
+        # Samples, which a producer is overwriting, can not be read anymore
+        ring_buffer.write_views(9)
+        self.assertEqual(ring_buffer.first_available, 2)
+        with self.assertRaises(IndexError):
+            ring_buffer[1:3]
+        np.testing.assert_equal(ring_buffer[2:3], data[2:3])
+        self.assertEqual(ring_buffer.commit(9), (3, 12))
+
+    def test_write_views(self):
+        ring_buffer = RingBuffer(10, spill_filename="")
+        data = np.arange(16, dtype=np.complex64)
+        ring_buffer.push(data[:7])
+
+        views = ring_buffer.write_views(6)
+        self.assertEqual([len(view) for view in views], [3, 3])
+        views[0][:] = data[7:10]
+        views[1][:] = data[10:13]
+        self.assertEqual(len(ring_buffer), 7)
+        self.assertEqual(ring_buffer.commit(6), (7, 13))
+        np.testing.assert_equal(ring_buffer[:], data[:13])
+
+        with self.assertRaises(ValueError):
+            ring_buffer.write_views(11)
+        ring_buffer.close()
+
+    def test_spill_to_disk(self):
+        ring_buffer = RingBuffer(16, spill_filename="")
+        filename = ring_buffer.spill_writer.filename
+        self.assertTrue(os.path.isfile(filename))
+
+        data = (np.arange(1000) + 1j * np.arange(1000)).astype(np.complex64)
+        for i in range(0, len(data), 7):
+            ring_buffer.push(data[i:i + 7])
+
+        self.assertEqual(ring_buffer.first_available, 0)
+        np.testing.assert_equal(ring_buffer[:], data)
+        np.testing.assert_equal(ring_buffer[100:990], data[100:990])
+        np.testing.assert_equal(ring_buffer.real[3:500], data.real[3:500])
+
+        # Saving copies the spilled samples and takes the not yet flushed ones from the ring
+        saved_filename = filename + ".saved"
+        ring_buffer.tofile(saved_filename)
+        np.testing.assert_equal(np.fromfile(saved_filename, dtype=np.complex64), data)
+        os.remove(saved_filename)
+
+        ring_buffer.spill_writer.flush()
+        np.testing.assert_equal(np.fromfile(filename, dtype=np.complex64), data)
+
+        # Temporary spill files are removed on close
+        ring_buffer.close()
+        self.assertFalse(os.path.isfile(filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from urh.util.SearchIndex import SearchIndex
+
+
+class TestSearchIndex(unittest.TestCase):
+    def test_find(self):
+        index = SearchIndex()
+        index.update(["10101", "", "0101", "111"])
+        self.assertEqual(index.find("101"), [(0, 0), (0, 2), (2, 1)])
+        self.assertEqual(index.find("11"), [(3, 0), (3, 1)])
+        self.assertEqual(index.find("0110"), [])  # must not match across messages
+        self.assertEqual(index.find(""), [])
+
+    def test_incremental_update(self):
+        SearchIndex.BLOCK_SIZE, block_size = 2, SearchIndex.BLOCK_SIZE
+        try:
+            index = SearchIndex()
+            rows = ["aab", "cab", "ab"]
+            index.update(rows)
+            self.assertEqual(index.find("ab"), [(0, 1), (1, 1), (2, 0)])
+
+            rows[1] = "ccc"
+            rows.append("abab")
+            index.update(rows)
+            self.assertEqual(index.num_rows, 4)
+            self.assertEqual(index.find("ab"), [(0, 1), (2, 0), (3, 0), (3, 2)])
+
+            index.update(rows[:1])
+            self.assertEqual(index.find("ab"), [(0, 1)])
+        finally:
+            SearchIndex.BLOCK_SIZE = block_size
@@ -0,0 +1,101 @@
+import threading
+import unittest
+
+import numpy as np
+
+from urh.dev.native.Device import Device
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
+from urh.signalprocessing.ModulatedStream import ModulatedStream
+from urh.signalprocessing.Modulator import Modulator
+from urh.util.SendBuffer import SendBuffer
+
+
+class TestSendBuffer(unittest.TestCase):
+    def read_all(self, send_buffer: SendBuffer, num_bytes: int) -> bytes:
+        result = []
+        while True:
+            data = send_buffer.read(num_bytes)
+            if not data:
+                return b"".join(result)
+            if not send_buffer.finished:
+                self.assertEqual(len(data), num_bytes)
+            result.append(data)
+
+    def test_repeats_and_resume(self):
+        data = (np.arange(1000) + 1j * np.arange(1000)).astype(np.complex64)
+
+        send_buffer = SendBuffer(data, repeats=3, num_samples=64)
+        self.assertEqual(self.read_all(send_buffer, 1000), np.tile(data, 3).tobytes())
+        self.assertTrue(send_buffer.finished)
+        self.assertEqual(send_buffer.current_repeat, 2)
+        self.assertEqual(send_buffer.current_sample, len(data))
+
+        send_buffer = SendBuffer(data, repeats=2, start=900, num_samples=64)
+        self.assertEqual(self.read_all(send_buffer, 800), np.concatenate((data[900:], data)).tobytes())
+
+        # Packing to the device format happens chunkwise
+        pack = lambda samples: (127 * samples.view(np.float32)).astype(np.int8)
+        send_buffer = SendBuffer(data[:100] / 1000, pack=pack, bytes_per_sample=2, num_samples=16)
+        self.assertEqual(self.read_all(send_buffer, 30), pack(data[:100] / 1000).tobytes())
+
+    def test_modulate_while_sending(self):
+        modulators = [Modulator("test")]
+        message_type = MessageType("test")
+        messages = [Message([True, False] * (i + 4), 100 * i, message_type) for i in range(20)]
+
+        # Modulators are not thread safe, so modulate the reference before the worker starts
+        expected = Modulator.modulate_messages(modulators, messages)
+        send_buffer = SendBuffer(lambda: Modulator.iter_modulated_messages(modulators, messages), num_samples=1000)
+        self.assertEqual(self.read_all(send_buffer, 4096), expected.tobytes())
+
+    def test_stop_forever(self):
+        send_buffer = SendBuffer(np.ones(100, dtype=np.complex64), repeats=-1, num_samples=16)
+        for _ in range(50):
+            self.assertEqual(len(send_buffer.read(1000)), 1000)
+        self.assertFalse(send_buffer.finished)
+
+        send_buffer.stop()
+        self.assertTrue(send_buffer.finished)
+        self.assertEqual(send_buffer.read(1000), b"")
+
+        send_buffer = SendBuffer(np.zeros(0, dtype=np.complex64), repeats=-1)
+        self.assertEqual(send_buffer.read(1000), b"")
+
+    def test_modulated_stream(self):
+        modulators = [Modulator("test")]
+        message_type = MessageType("test")
+        messages = [Message([True, False] * (i + 4), 100 * i, message_type) for i in range(20)]
+
+        expected = Modulator.modulate_messages(modulators, messages)
+        stream = ModulatedStream(modulators, messages)
+        self.assertEqual(len(stream), len(expected))
+        self.assertTrue(np.array_equal(stream.modulate(), expected))
+        self.assertTrue(np.array_equal(stream.modulate(1234), expected[:1234]))
+
+        send_buffer = SendBuffer(stream, repeats=2, num_samples=1000)
+        self.assertEqual(self.read_all(send_buffer, 4096), np.tile(expected, 2).tobytes())
+
+    def test_device_send_buffer_lifetime(self):
+        class RawDevice(Device):
+            BYTES_PER_SAMPLE = 8
+            pack_complex = staticmethod(lambda samples: samples)
+
+        device = RawDevice(1e6, 433.92e6, 20, 1e6)
+        # Compare sets, threads of other tests, e.g. the backend probe, may end meanwhile
+        threads = set(threading.enumerate())
+
+        # Setting the samples must not start a worker, that holds them until sending
+        device.init_send_parameters(np.ones(100000, dtype=np.complex64), 1, skip_device_parameters=True)
+        self.assertIsNone(device.send_buffer)
+        self.assertLessEqual(set(threading.enumerate()), threads)
+
+        device.open_send_buffer()
+        self.assertEqual(len(device.callback_send(800)), 800)
+        device.close_send_buffer()
+        self.assertIsNone(device.send_buffer)
+        self.assertLessEqual(set(threading.enumerate()), threads)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,16 @@
+import os
+import shutil
+import tempfile
 import unittest
 
+import numpy as np
+
 from urh import constants
+from urh.signalprocessing.MemmapIQ import MemmapIQ
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.PieceTable import PieceTable
 from urh.signalprocessing.Signal import Signal
+from urh.ui.actions.EditSignalAction import EditSignalAction, EditAction
 
 from tests.utils_testing import get_path_for_data_file
 
@@ -29,5 +37,106 @@ class TestSignal(unittest.TestCase):
         freq = s.estimate_frequency(start, start + nsamples, 1e6)
         self.assertEqual(freq, 10000)  # Freq for 1 is 10K
 
+    def test_memory_mapped_signal(self):
+        filename = get_path_for_data_file("esaver.complex")
+        loaded = Signal(filename, "loaded")
+        mapped = Signal(filename, "mapped", memory_mapped=True)
+        self.assertTrue(mapped.memory_mapped)
+        self.assertFalse(loaded.memory_mapped)
+        self.assertEqual(loaded.num_samples, mapped.num_samples)
+        self.assertEqual(loaded.noise_threshold, mapped.noise_threshold)
+        np.testing.assert_array_equal(loaded.data[100:200], mapped.data[100:200])
+
+        mapped.data.CHUNK_SIZE = 1000  # demodulate in many chunks
+        for mod_type in (0, 1):
+            loaded.modulation_type = mapped.modulation_type = mod_type
+            np.testing.assert_array_equal(loaded.qad, mapped.qad)
+
+        new_signal = mapped.create_new(1000, 2000)
+        self.assertTrue(new_signal.memory_mapped)
+        np.testing.assert_array_equal(new_signal.data[:], loaded.data[1000:2000])
+
+    def test_memory_mapped_complex16s(self):
+        filename = os.path.join(tempfile.gettempdir(), "test_memory_mapped.complex16s")
+        raw = np.random.randint(-128, 127, 2 * 5000, dtype=np.int8)
+        raw.tofile(filename)
+
+        loaded = Signal(filename, "loaded")
+        mapped = Signal(filename, "mapped", memory_mapped=True)
+        self.assertEqual(loaded.num_samples, 5000)
+        self.assertEqual(mapped.num_samples, 5000)
+        np.testing.assert_array_equal(loaded.data, mapped.data[:])
+        np.testing.assert_array_equal(loaded.real_plot_data[42:1337], mapped.real_plot_data[42:1337])
+        self.assertEqual(loaded.data[-1], mapped.data[-1])
+
+        mapped.crop_to_range(10, 20)
+        self.assertEqual(mapped.num_samples, 10)
+        np.testing.assert_array_equal(mapped.data[:], loaded.data[10:20])
+        os.remove(filename)
+
+    def test_edit_and_undo(self):
+        signal = Signal(get_path_for_data_file("esaver.complex"), "test")
+        orig_data, orig_qad = np.array(signal.data), np.array(signal.qad)
+        n = signal.num_samples
+        insert_data = np.ones(500, dtype=np.complex64)
+
+        edits = [dict(mode=EditAction.mute, start=100, end=2000),
+                 dict(mode=EditAction.delete, start=5000, end=7000),
+                 dict(mode=EditAction.paste, position=300, data_to_insert=insert_data),
+                 dict(mode=EditAction.crop, start=50, end=n - 3000)]
+        expected = orig_data.copy()
+        expected[100:2000] = 0
+        expected = np.insert(np.delete(expected, np.arange(5000, 7000)), 300, insert_data)[50:n - 3000]
+
+        actions = []
+        for edit in edits:
+            actions.append(EditSignalAction(signal, **edit))
+            actions[-1].redo()
+            # Edits only rearrange pieces of the samples
+            self.assertIsInstance(signal._fulldata, PieceTable)
+        self.assertEqual(signal.num_samples, len(expected))
+        np.testing.assert_array_equal(signal.data, expected)
+        # Reading the samples for plotting does not flatten them, so the undo stack only references pieces
+        self.assertIsInstance(signal.data, PieceTable)
+        self.assertIsInstance(signal.real_plot_data, PieceTable)
+        self.assertIsInstance(signal.qad_view, PieceTable)
+        self.assertEqual(len(signal.qad), len(expected))
+        self.assertIsInstance(signal._qad, PieceTable)
+        np.testing.assert_array_equal(signal.qad[1700:2000], 0)
+
+        for action in reversed(actions):
+            action.undo()
+        np.testing.assert_array_equal(signal.data, orig_data)
+        np.testing.assert_array_equal(signal.qad, orig_qad)
+
+    def test_edit_memory_mapped_signal(self):
+        filename = get_path_for_data_file("esaver.complex")
+        loaded = Signal(filename, "loaded")
+        mapped = Signal(filename, "mapped", memory_mapped=True)
+
+        for signal in (loaded, mapped):
+            signal.delete_range(1000, 2000)
+            signal.mute_range(10, 20)
+            signal.insert_data(50, np.ones(10, dtype=np.complex64))
+        self.assertTrue(mapped.memory_mapped)
+        np.testing.assert_array_equal(loaded.data, mapped.data[:])
+        np.testing.assert_array_equal(loaded.real_plot_data[0:3000], mapped.real_plot_data[0:3000])
+
+    def test_save_memory_mapped_signal(self):
+        filename = os.path.join(tempfile.gettempdir(), "test_save_memory_mapped.complex")
+        shutil.copy(get_path_for_data_file("esaver.complex"), filename)
+        signal = Signal(filename, "mapped", memory_mapped=True)
+        signal.mute_range(10, 20)
+        expected = np.array(signal.data)
+
+        signal.save()
+        # The saved file replaced the mapped one and is mapped now
+        self.assertIsInstance(signal.data, MemmapIQ)
+        self.assertFalse(signal.changed)
+        np.testing.assert_array_equal(signal.data[:], expected)
+        np.testing.assert_array_equal(np.fromfile(filename, dtype=np.complex64), expected)
+        self.assertFalse(os.path.isfile(os.path.join(tempfile.gettempdir(), "test_save_memory_mapped.tmp.complex")))
+        os.remove(filename)
+
     def tearDown(self):
         constants.SETTINGS.setValue('rel_symbol_length', self.old_sym_len)  # Restore Symbol Length
@@ -0,0 +1,56 @@
+import unittest
+
+import tests.utils_testing
+from urh.controller.MainController import MainController
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.Signal import Signal
+from urh.util.SignalLoader import SignalLoader
+from tests.utils_testing import get_path_for_data_file
+
+app = tests.utils_testing.app
+
+
+class TestSignalLoader(unittest.TestCase):
+    def setUp(self):
+        self.form = MainController()
+        self.filenames = [get_path_for_data_file(f) for f in ("ask.complex", "fsk.complex", "esaver.complex")]
+
+    def test_load_in_background(self):
+        loader = SignalLoader(self.filenames, self.form.project_manager, max_workers=2)
+        for filename in self.filenames:
+            signal, pa = loader.result(filename)
+            self.assertEqual(signal.filename, filename)
+            self.assertIs(pa.signal, signal)
+
+            reference = Signal(filename, "reference")
+            reference.auto_detect()
+            self.assertEqual(signal.bit_len, reference.bit_len)
+            self.assertEqual(signal.qad_center, reference.qad_center)
+
+            pa.get_protocol_from_signal()
+            reference_pa = ProtocolAnalyzer(reference)
+            reference_pa.get_protocol_from_signal()
+            self.assertEqual(pa.plain_bits_str, reference_pa.plain_bits_str)
+
+        self.assertEqual(loader.num_finished, len(self.filenames))
+
+    def test_add_files(self):
+        self.form.add_files(self.filenames)
+        self.assertEqual(len(self.form.signal_tab_controller.signal_frames), len(self.filenames))
+        signal_frames = self.form.signal_tab_controller.signal_frames
+        num_messages = sum(len(sframe.proto_analyzer.messages) for sframe in signal_frames)
+        self.assertGreater(num_messages, 0)
+        self.assertEqual(self.form.compare_frame_controller.protocol_model.row_count, num_messages)
+
+    def test_failed_signal(self):
+        filenames = [self.filenames[0], get_path_for_data_file("does_not_exist.complex")]
+        loader = SignalLoader(filenames, self.form.project_manager, max_workers=2)
+        with self.assertRaises(OSError):
+            loader.result(filenames[1])
+        self.assertIsNotNone(loader.result(filenames[0]))
+
+    def test_cancel(self):
+        loader = SignalLoader(self.filenames, self.form.project_manager, max_workers=1)
+        loader.cancel()
+        self.assertTrue(loader.canceled)
+        self.assertIsNone(loader.result(self.filenames[-1]))
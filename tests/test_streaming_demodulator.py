@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from tests.utils_testing import get_path_for_data_file
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+from urh.signalprocessing.Signal import Signal
+from urh.signalprocessing.StreamingDemodulator import StreamingDemodulator
+
+
+class TestStreamingDemodulator(unittest.TestCase):
+    def test_same_messages_as_full_signal(self):
+        for filename in ("esaver.complex", "enocean.complex"):
+            signal = Signal(get_path_for_data_file(filename), filename)
+            signal.auto_detect()
+            proto_analyzer = ProtocolAnalyzer(signal)
+            proto_analyzer.get_protocol_from_signal()
+
+            for chunk_size in (1000, 65536):
+                demodulator = StreamingDemodulator(signal, 0.1)
+                messages, rssis = [], []
+
+                def add(pulse_sequences):
+                    for ppseq, offset in pulse_sequences:
+                        bits, _, positions = proto_analyzer._ppseq_to_bits(ppseq, signal.bit_len, 0.1)
+                        for b, pos in zip(bits, positions):
+                            middle = offset + int(pos[len(b) // 2])
+                            messages.append(b.to_string())
+                            rssis.append(np.mean(np.abs(demodulator.samples(middle, middle + signal.bit_len))))
+
+                for i in range(0, signal.num_samples, chunk_size):
+                    add(demodulator.feed(signal.data[i:i + chunk_size]))
+                add(demodulator.flush())
+
+                self.assertEqual(messages, [msg.plain_bits_str for msg in proto_analyzer.messages], msg=filename)
+                np.testing.assert_allclose(rssis, [msg.rssi for msg in proto_analyzer.messages], rtol=1e-5)
+
+    def test_message_ends_at_long_pause(self):
+        signal = Signal("", "Stream")
+        signal.bit_len = 10
+        signal.qad_center = 0
+        signal.tolerance = 0
+        signal.noise_threshold = 0.1
+        signal.silent_set_modulation_type(0)
+
+        demodulator = StreamingDemodulator(signal, 0.1)
+        burst = np.ones(50, dtype=np.complex64)
+        pause = np.zeros(200, dtype=np.complex64)
+
+        self.assertEqual(demodulator.feed(burst), [])
+        self.assertEqual(demodulator.feed(pause[:50]), [])
+        result = demodulator.feed(pause[50:])
+        self.assertEqual(result, [])  # pause is not finished before the next pulse starts
+
+        result = demodulator.feed(burst)
+        self.assertEqual(len(result), 1)
+        ppseq, start = result[0]
+        self.assertEqual(start, 0)
+        self.assertEqual(ppseq[-1, 0], 42)
+        self.assertEqual(demodulator.num_samples, 300)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+import tests.utils_testing
+from urh import constants
+from urh.models.GeneratorTableModel import GeneratorTableModel
+from urh.models.ProtocolTableModel import ProtocolTableModel
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.Modulator import Modulator
+from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
+
+app = tests.utils_testing.app
+
+
+class TestTableModel(unittest.TestCase):
+    BITS = ["1010101011110000", "1010101011110011", "1010101000000000"]
+
+    def setUp(self):
+        self.protocol = ProtocolAnalyzer(None)
+        for bits in self.BITS:
+            self.protocol.messages.append(Message.from_plain_bits_str(bits, {}))
+            self.protocol.messages[-1].message_type = self.protocol.default_message_type
+
+        message_type = self.protocol.default_message_type
+        self.preamble = message_type.add_protocol_label(0, 7, name="preamble")
+        self.data = message_type.add_protocol_label(8, 15, name="data")
+        self.overlap = message_type.add_protocol_label(10, 11, name="overlap")
+
+        self.model = ProtocolTableModel(self.protocol, participants=[], controller=None)
+        self.model.refindex = 0
+
+    def cell(self, row: int, column: int, role: int):
+        return self.model.data(self.model.index(row, column), role)
+
+    def test_label_roles(self):
+        for column, lbl in [(0, self.preamble), (7, self.preamble), (8, self.data),
+                            (10, self.overlap), (11, self.overlap), (12, self.data), (15, self.data)]:
+            self.assertEqual(self.cell(1, column, Qt.BackgroundColorRole), constants.LABEL_COLORS[lbl.color_index])
+            self.assertEqual(self.cell(1, column, Qt.ToolTipRole), lbl.name)
+
+        self.model.protocol.default_message_type.remove(self.data)
+        self.model.update()
+        self.assertIsNone(self.cell(1, 13, Qt.BackgroundColorRole))
+        self.assertIsNone(self.cell(1, 13, Qt.ToolTipRole))
+
+    def test_diff_roles(self):
+        self.assertEqual(self.cell(0, 3, Qt.TextColorRole), constants.SELECTED_ROW_COLOR)
+        self.assertFalse(self.cell(0, 14, Qt.FontRole).bold())
+
+        self.assertEqual(self.cell(1, 14, Qt.TextColorRole), constants.DIFFERENCE_CELL_COLOR)
+        self.assertTrue(self.cell(1, 14, Qt.FontRole).bold())
+        self.assertIsNone(self.cell(1, 13, Qt.TextColorRole))
+        self.assertFalse(self.cell(1, 13, Qt.FontRole).bold())
+
+        self.assertTrue(all(self.cell(2, column, Qt.FontRole).bold() for column in range(8, 12)))
+        self.assertFalse(self.cell(2, 12, Qt.FontRole).bold())
+
+    def test_hex_view(self):
+        self.model.proto_view = 1
+        # Hex digits are aligned to the label borders, so the overlapping label gets its own column
+        self.assertEqual(self.model.display_data[1], "aa333")
+        self.assertEqual(self.model.col_count, 5)
+
+        for column, lbl in [(0, self.preamble), (1, self.preamble), (2, self.data), (3, self.overlap), (4, self.data)]:
+            self.assertEqual(self.cell(1, column, Qt.BackgroundColorRole), constants.LABEL_COLORS[lbl.color_index])
+            self.assertEqual(self.cell(1, column, Qt.ToolTipRole), lbl.name)
+
+        self.assertTrue(self.cell(1, 4, Qt.FontRole).bold())
+        self.assertEqual(self.cell(1, 4, Qt.TextColorRole), constants.DIFFERENCE_CELL_COLOR)
+        self.assertFalse(self.cell(1, 3, Qt.FontRole).bold())
+        self.assertEqual([self.cell(2, column, Qt.FontRole).bold() for column in range(5)],
+                         [False, False, True, True, False])
+
+    def test_label_range_eviction(self):
+        self.model.MAX_CACHED_ROWS = 2
+        expected = [self.cell(row, 9, Qt.ToolTipRole) for row in range(3)]
+        self.assertLessEqual(len(self.model._TableModel__label_ranges), 2)
+        self.assertNotIn(0, self.model._TableModel__label_ranges)
+
+        # Evicted rows are resolved again
+        self.assertEqual([self.cell(row, 9, Qt.ToolTipRole) for row in range(3)], expected)
+        self.assertEqual(expected, ["data"] * 3)
+        self.assertLessEqual(len(self.model._TableModel__label_ranges), 2)
+
+    def test_generator_fuzzing_roles(self):
+        model = GeneratorTableModel(None, [Modulator("test")], [])
+        model.protocol.messages.append(Message.from_plain_bits_str(self.BITS[0], {}))
+        lbl = model.protocol.messages[0].message_type.add_protocol_label(4, 7, name="fuzz")
+        model.update()
+
+        index = model.index(0, 5)
+        self.assertIsNone(model.data(index, Qt.TextColorRole))
+        self.assertFalse(model.data(index, Qt.FontRole).bold())
+
+        lbl.fuzz_values.extend(["0000", "1111"])
+        self.assertEqual(model.data(index, Qt.TextColorRole), QColor("orange"))
+        self.assertTrue(model.data(index, Qt.FontRole).bold())
+        self.assertIsNone(model.data(model.index(0, 8), Qt.TextColorRole))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from urh.awre.XorMatrix import XorMatrix
+from urh.cythonext import util
+
+
+class TestXorMatrix(unittest.TestCase):
+    def test_xor_matches_full_matrix(self):
+        np.random.seed(42)
+        base = np.random.randint(0, 2, 200).astype(np.int8)
+        bitvectors = []
+        for length in (200, 130, 64, 0, 199, 71):
+            bits = base[:length].copy()
+            bits[np.random.randint(0, length or 1, 5)[:length]] ^= 1
+            bitvectors.append(bits)
+
+        full_matrix = util.build_xor_matrix(bitvectors)
+        xor_matrix = XorMatrix(bitvectors)
+        self.assertEqual(len(xor_matrix), len(bitvectors))
+
+        for i in range(len(bitvectors)):
+            others = list(range(i + 1, len(bitvectors)))
+            for j, (differences, length) in zip(others, xor_matrix.differences(i, others)):
+                expected = full_matrix[i, j][full_matrix[i, j] != -1]
+                self.assertTrue(np.array_equal(xor_matrix[i, j], expected))
+                self.assertEqual(length, len(expected))
+                self.assertTrue(np.array_equal(differences, np.flatnonzero(expected)))
+
+        self.assertEqual(xor_matrix.differences(0, []), [])
+        self.assertEqual(XorMatrix([np.zeros(0, dtype=np.int8)] * 2).differences(0, [1])[0][1], 0)
+
+    def test_equal_ranges(self):
+        differences = np.array([3, 20, 25, 60])
+        self.assertEqual(XorMatrix.equal_ranges(differences, 80, 0, None, 8, 8), [(11, 20), (33, 60), (68, 80)])
+        self.assertEqual(XorMatrix.equal_ranges(differences, 80, 10, 50, 8, 8), [(10, 20), (33, 50)])
+        self.assertEqual(XorMatrix.equal_ranges(differences, 80, 10, 200, 8, 1), [(10, 20), (26, 60), (61, 80)])
+        self.assertEqual(XorMatrix.equal_ranges(differences, 40, 50, None, 8, 8), [])